@@ -1,49 +1,102 @@
 from PySide6.QtWidgets import QFrame
-from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QPainter, QConicalGradient, QColor, QPen, QBrush
+from PySide6.QtCore import Qt, QPointF, Property
+from PySide6.QtGui import QPainter, QConicalGradient, QColor, QPen, QBrush, QRegion, QTransform
+
+from gui.animation_clock import AnimationClock
+from gui.render_governor import timed_paint
+
+DEGREES_PER_SECOND = 60  # eine Umdrehung in 6 Sekunden
+
+
+def _gradient_brush():
+    """Verlaufs-Pinsel um den Ursprung; wird pro Bild nur verschoben und gedreht."""
+    gradient = QConicalGradient(QPointF(0, 0), 0)
+    gradient.setColorAt(0.0, QColor(0, 191, 255, 200))
+    gradient.setColorAt(0.25, QColor(186, 85, 211, 200))
+    gradient.setColorAt(0.5, QColor(255, 69, 0, 200))
+    gradient.setColorAt(0.75, QColor(255, 165, 0, 200))
+    gradient.setColorAt(1.0, QColor(0, 191, 255, 200))
+    return QBrush(gradient)
+
 
 class GlowingAnimatedFrame(QFrame):
+    _brush = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._angle = 0
         self._enabled = True  # Glow aktiv
         self._thickness = 2.5
         self._radius = 12
+        self._inset = 5
+        self._ring = QRegion()
+        self._fill_color = QColor()  # ungültig = keine Füllung
 
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.update_animation)
-        self._timer.start(16)
+        if GlowingAnimatedFrame._brush is None:
+            GlowingAnimatedFrame._brush = _gradient_brush()
 
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setContentsMargins(10, 10, 10, 10)
 
+        AnimationClock.instance().subscribe(self, self.update_animation)
+
     def setLowPowerMode(self, enabled: bool):
         self._enabled = not enabled
+        clock = AnimationClock.instance()
+        if self._enabled:
+            clock.subscribe(self, self.update_animation)
+        else:
+            clock.unsubscribe(self, self.update_animation)
         self.update()
 
-    def update_animation(self):
-        if self._enabled:
-            self._angle = (self._angle + 1) % 360
+    def getFillColor(self):
+        return self._fill_color
+
+    def setFillColor(self, color):
+        # Gleiche Farbe nach Rundung auf 8 Bit → kein Neuzeichnen
+        if color.rgba() != self._fill_color.rgba() or color.isValid() != self._fill_color.isValid():
+            self._fill_color = QColor(color)
             self.update()
 
+    fillColor = Property(QColor, getFillColor, setFillColor)
+
+    def update_animation(self, elapsed_ms):
+        angle = (elapsed_ms * DEGREES_PER_SECOND // 1000) % 360
+        if self._enabled and angle != self._angle:
+            self._angle = angle
+            # Nur den Rahmenring neu zeichnen, nicht die Kind-Widgets im Inneren
+            self.update(self._ring)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        outer = self.rect().adjusted(self._inset - 3, self._inset - 3, 3 - self._inset, 3 - self._inset)
+        inner = self.rect().adjusted(self._inset + 4, self._inset + 4, -self._inset - 4, -self._inset - 4)
+        # In den Ecken ragt die Rundung ins innere Rechteck, diese Ecken bleiben im Ring
+        corner = self._radius // 2
+        inner_region = QRegion(inner.adjusted(corner, 0, -corner, 0)) + QRegion(inner.adjusted(0, corner, 0, -corner))
+        self._ring = QRegion(outer) - inner_region
+
+    @timed_paint
     def paintEvent(self, event):
         super().paintEvent(event)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        rect = self.rect().adjusted(5, 5, -5, -5)
+        rect = self.rect().adjusted(self._inset, self._inset, -self._inset, -self._inset)
         center = rect.center()
 
+        if self._fill_color.isValid():
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._fill_color)
+            painter.drawRoundedRect(rect, self._radius, self._radius)
+            painter.setBrush(Qt.NoBrush)
+
         if self._enabled:
-            # Apple-like gradient border
-            gradient = QConicalGradient(center, -self._angle)
-            gradient.setColorAt(0.0, QColor(0, 191, 255, 200))
-            gradient.setColorAt(0.25, QColor(186, 85, 211, 200))
-            gradient.setColorAt(0.5, QColor(255, 69, 0, 200))
-            gradient.setColorAt(0.75, QColor(255, 165, 0, 200))
-            gradient.setColorAt(1.0, QColor(0, 191, 255, 200))
-
-            pen = QPen(QBrush(gradient), self._thickness)
+            # Apple-like gradient border: gecachter Verlauf, nur die Transformation ändert sich
+            brush = QBrush(self._brush)
+            brush.setTransform(QTransform().translate(center.x(), center.y()).rotate(self._angle))
+            pen = QPen(brush, self._thickness)
+            AnimationClock.instance().wake()
         else:
             # Statischer Rahmen wie logFrame
             pen = QPen(QColor(138, 43, 226, 100), 2)  # lila, halbtransparent
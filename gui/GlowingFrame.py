@@ -1,18 +1,16 @@
-from PySide6.QtWidgets import QFrame, QGraphicsDropShadowEffect
+from PySide6.QtWidgets import QFrame
 from PySide6.QtCore import QTimer, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QColor
 
+from gui.glow_halo import GlowHalo
+
 class GlowingFrame(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setContentsMargins(10, 10, 10, 10)
 
-        # setup shadow
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(40)
-        self.shadow.setOffset(0, 0)
-        self.shadow.setColor(QColor(255, 0, 0, 160))  # startfarbe
-        self.setGraphicsEffect(self.shadow)
+        # setup glow (vorberechneter Halo statt QGraphicsDropShadowEffect)
+        self.shadow = GlowHalo(self, blur=40, color=QColor(255, 0, 0, 160))  # startfarbe
 
         # rainbow-farbverlauf
         self.colors = [
@@ -32,12 +30,12 @@ class GlowingFrame(QFrame):
         self.animation.setLoopCount(1)
 
         # timer für rotation
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.rotateGlow)
         self.timer.start(1200)
 
     def rotateGlow(self):
-        current_color = self.shadow.color()
+        current_color = self.shadow.color
         next_color = self.colors[self.color_index]
         self.animation.stop()
         self.animation.setStartValue(current_color)
@@ -0,0 +1,113 @@
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer, Qt, Signal
+from PySide6.QtGui import QGuiApplication
+
+
+class AnimationClock(QObject):
+    """Gemeinsamer Animationstakt für alle Glow-Rahmen.
+
+    Ein einziger Timer im Takt der Bildwiederholrate des Bildschirms ersetzt die
+    16-ms-Timer der einzelnen Widgets. `tick` liefert die seit dem Start
+    vergangenen Millisekunden, damit die Animationsgeschwindigkeit nicht von der
+    Bildrate abhängt. Ist keins der angemeldeten Widgets sichtbar (versteckt,
+    minimiert oder verdeckt), hält der Timer an; das nächste paintEvent eines
+    Widgets weckt ihn über wake() wieder.
+    """
+
+    tick = Signal(int)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(QGuiApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._widgets = {}  # Widget → angemeldete Callbacks
+        self._paused = False
+        self._last_tick = None
+        self._frame_time = 0.0
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 60.0
+        self.setFrameRate(refresh_rate if refresh_rate > 0 else 60.0)
+
+    def setFrameRate(self, fps):
+        self.frame_rate = fps
+        self._timer.setInterval(max(1, round(1000 / fps)))
+
+    def elapsed(self):
+        return self._elapsed.elapsed()
+
+    def frame_time(self):
+        """Geglätteter tatsächlicher Abstand zwischen zwei Takten in ms."""
+        return self._frame_time
+
+    def setPaused(self, paused):
+        """Hält den Takt vollständig an (Low Power Mode), unabhängig von der Sichtbarkeit."""
+        self._paused = paused
+        if paused:
+            self._timer.stop()
+        else:
+            self.wake()
+
+    def subscribe(self, widget, callback):
+        """Meldet ein Widget an; `callback(elapsed_ms)` wird bei jedem Takt aufgerufen.
+
+        Ein Widget kann mehrere Callbacks anmelden (z.B. Rahmen und Farbverlauf);
+        der Takt läuft, solange eins der Widgets sichtbar ist.
+        """
+        callbacks = self._widgets.get(widget)
+        if callbacks is None:
+            callbacks = self._widgets[widget] = []
+            widget.destroyed.connect(lambda: self._widgets.pop(widget, None))
+        elif callback in callbacks:
+            return
+        callbacks.append(callback)
+        self.tick.connect(callback)
+        self.wake()
+
+    def unsubscribe(self, widget, callback):
+        callbacks = self._widgets.get(widget)
+        if callbacks is None or callback not in callbacks:
+            return
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._widgets[widget]
+        self.tick.disconnect(callback)
+
+    def wake(self):
+        if self._widgets and not self._paused and not self._timer.isActive():
+            self._last_tick = None
+            self._timer.start()
+
+    @staticmethod
+    def _is_showing(widget):
+        if not widget.isVisible():
+            return False
+        window = widget.window()
+        if window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def _on_timeout(self):
+        if not any(self._is_showing(widget) for widget in self._widgets):
+            self._timer.stop()
+            return
+
+        now = self._elapsed.elapsed()
+        if self._last_tick is not None:
+            self._frame_time += 0.1 * ((now - self._last_tick) - self._frame_time)
+        else:
+            self._frame_time = self._timer.interval()
+        self._last_tick = now
+        self.tick.emit(now)
@@ -0,0 +1,47 @@
+import os
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from obd_export import SampleExport, ExportCancelled
+
+
+class ExportWorker(QObject):
+    """Führt einen SampleExport in einem Hintergrund-Thread aus und meldet den Stand als Signale."""
+
+    progress = Signal(int, int)  # geschriebene Zeilen, Gesamtzahl
+    finished = Signal(str, int)  # Datei, Zeilen
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, store, path, **options):
+        super().__init__()
+        self.export = SampleExport(store, path, progress=self.progress.emit, **options)
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="obd-export", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self.export.cancel()
+
+    def wait(self, timeout):
+        """Wartet auf das Ende des Exports; läuft er noch, wird die .part-Datei entfernt."""
+        if self._thread is None:
+            return
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            try:
+                os.remove(self.export.part_file)
+            except OSError:
+                pass
+
+    def _run(self):
+        try:
+            rows = self.export.run()
+            self.finished.emit(self.export.path, rows)
+        except ExportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(f"Export fehlgeschlagen: {e}")
@@ -0,0 +1,128 @@
+from collections import OrderedDict
+
+from PySide6.QtWidgets import QWidget, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+from PySide6.QtCore import Qt, QEvent, QRectF, Property
+from PySide6.QtGui import QPainter, QImage, QPixmap, QColor
+
+_MASK_CACHE_SIZE = 16
+_mask_cache = OrderedDict()
+
+
+def halo_mask(width, height, radius, blur):
+    """Weichgezeichnete Maske eines abgerundeten Rechtecks, einmal pro Größe berechnet.
+
+    Die Maske ist um `blur` Pixel auf jeder Seite größer als das Rechteck.
+    """
+    key = (width, height, radius, blur)
+    mask = _mask_cache.get(key)
+    if mask is not None:
+        _mask_cache.move_to_end(key)
+        return mask
+
+    size = (width + 2 * blur, height + 2 * blur)
+    shape = QImage(*size, QImage.Format_ARGB32_Premultiplied)
+    shape.fill(Qt.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(Qt.white)
+    painter.drawRoundedRect(QRectF(blur, blur, width, height), radius, radius)
+    painter.end()
+
+    # Der Weichzeichner läuft nur hier, nicht bei jedem Neuzeichnen
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    mask = QImage(*size, QImage.Format_ARGB32_Premultiplied)
+    mask.fill(Qt.transparent)
+    painter = QPainter(mask)
+    scene.render(painter, QRectF(mask.rect()), QRectF(0, 0, *size))
+    painter.end()
+
+    _mask_cache[key] = mask
+    if len(_mask_cache) > _MASK_CACHE_SIZE:
+        _mask_cache.popitem(last=False)
+    return mask
+
+
+class GlowHalo(QWidget):
+    """Glow hinter einem Widget als Ersatz für QGraphicsDropShadowEffect.
+
+    Der Halo ist ein Geschwister-Widget unter dem Ziel, das um `blur` Pixel größer
+    ist und dessen Position und Sichtbarkeit folgt. Die weichgezeichnete Maske wird
+    einmal pro Größe erzeugt; ein Farbwechsel färbt nur die Maske neu ein.
+    Das Ziel selbst wird weiterhin direkt gezeichnet, seine Kind-Widgets können
+    also einzeln aktualisiert werden.
+    """
+
+    def __init__(self, target, blur=20, color=QColor(138, 43, 226, 120), radius=12):
+        super().__init__(target.parentWidget())
+        self._target = target
+        self._blur = blur
+        self._radius = radius
+        self._color = QColor(color)
+        self._tinted = None
+        self._tinted_key = None
+
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        target.installEventFilter(self)
+        self._sync()
+
+    def blurRadius(self):
+        return self._blur
+
+    def setBlurRadius(self, blur):
+        self._blur = blur
+        self._sync()
+
+    def getColor(self):
+        return self._color
+
+    def setColor(self, color):
+        if color.rgba() != self._color.rgba():
+            self._color = QColor(color)
+            self.update()
+
+    color = Property(QColor, getColor, setColor)
+
+    def eventFilter(self, watched, event):
+        if watched is self._target and event.type() in (
+                QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide, QEvent.ParentChange, QEvent.ZOrderChange):
+            self._sync()
+        return False
+
+    def _sync(self):
+        """Übernimmt Eltern-Widget, Geometrie, Sichtbarkeit und Stapelreihenfolge des Ziels."""
+        target = self._target
+        parent = target.parentWidget()
+        if parent is None:
+            self.hide()
+            return
+        if self.parentWidget() is not parent:
+            self.setParent(parent)
+
+        self.setGeometry(target.geometry().adjusted(-self._blur, -self._blur, self._blur, self._blur))
+        self.stackUnder(target)
+        self.setVisible(target.isVisible())
+
+    def paintEvent(self, event):
+        target_size = self._target.size()
+        key = (target_size.width(), target_size.height(), self._blur, self._color.rgba())
+        if key != self._tinted_key:
+            mask = halo_mask(target_size.width(), target_size.height(), self._radius, self._blur)
+            tinted = QImage(mask)
+            painter = QPainter(tinted)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+            painter.fillRect(tinted.rect(), self._color)
+            painter.end()
+            self._tinted = QPixmap.fromImage(tinted)
+            self._tinted_key = key
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._tinted)
@@ -1,7 +1,9 @@
 from PySide6.QtWidgets import QFrame
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter, QConicalGradient, QColor, QPen, QBrush
 
+from gui.animation_clock import AnimationClock
+
 class GlowingWindowFrame(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -9,23 +11,24 @@ class GlowingWindowFrame(QFrame):
 
         self._enabled = True
 
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.updateGlow)
-        self._timer.start(16)
+        AnimationClock.instance().subscribe(self, self.updateGlow)
 
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setStyleSheet("background: transparent;")
         self.lower()
 
-    def updateGlow(self):
-        self._angle = (self._angle + 1) % 360
-        self.update()
+    def updateGlow(self, elapsed_ms):
+        angle = (elapsed_ms * 60 // 1000) % 360
+        if self._enabled and angle != self._angle:
+            self._angle = angle
+            self.update()
 
     def paintEvent(self, event):
         if not self._enabled:
             return super().paintEvent(event)
 
+        AnimationClock.instance().wake()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
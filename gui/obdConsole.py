@@ -1,10 +1,14 @@
 import os
 import sys
+import threading
+import time
 from datetime import datetime
 
-from PySide6.QtGui import QAction, QIcon, QPixmap
-from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QGridLayout, QMenuBar, QMenu
-from PySide6.QtCore import QTimer, Qt
+_PROCESS_START = time.perf_counter()
+
+from PySide6.QtGui import QAction, QActionGroup, QIcon, QPixmap
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QGridLayout, QMenuBar, QMenu, QScrollArea
+from PySide6.QtCore import QTimer
 
 from gui.GlowingAnimatedFrame import GlowingAnimatedFrame
 from gui.GlowingFrame import GlowingFrame
@@ -12,76 +16,163 @@ from gui.glow_window_border import GlowingWindowFrame
 from gui.obd_ui import create_status_frame, create_buttons_frame, create_log_console
 from gui.obd_styles import STYLE_MAIN
 from gui.obd_animations import *
+from gui.obd_resources import register_icon_resources
+from gui.obd_startup import StartupTimer, BackendLoader, save_last_values
+from gui.value_dashboard import ValueDashboard
 
-import icons.resources_rc
-
-from obd_manager import ObdManager
-from ObdReaderThreaded import ObdReaderThreaded
 from obd_logger import ObdLogger
 
+# PIDs mit Verlaufsanzeige unter den Wert-Kacheln
+CHART_PIDS = ("RPM", "SPEED")
+# WebSocket-Port des Telemetrie-Servers für Tablets / zweite Bildschirme
+STREAM_PORT = 8765
+# Port des Prometheus-Endpunkts /metrics
+METRICS_PORT = 9108
+
 
 class ObdConsole(QWidget):
+    """Hauptfenster mit gestaffeltem Start.
+
+    1. Fensterhülle (Menü, Statuszeile) sofort anzeigen
+    2. nach dem ersten Bild die übrigen Bereiche aufbauen
+    3. python-obd, Befehlsdateien und letzte Werte im Hintergrund laden
+    4. danach die Verbindung aufbauen
+    """
+
     def __init__(self):
+        from gui.render_governor import RenderGovernor
+
         super().__init__()
         self.setWindowTitle("OBD2 Terminal")
         self.resize(1280, 800)
         self.setStyleSheet(STYLE_MAIN)
 
+        # Bis die Log-Konsole existiert, wird nur in die Datei geloggt
+        self.logger = ObdLogger()
+        self.startup = StartupTimer(_PROCESS_START, self.logger)
+
         ### Hintergrundrahmen mit animiertem Glow (wie Apple Intelligence)
         # self.glowFrame = GlowingWindowFrame(self)
         # self.glowFrame.setGeometry(self.rect())
         # self.glowFrame.lower()
 
-        # Setze das Fenster-Icon
-        app.setWindowIcon(QIcon(":/icons/mainIcon.png"))
-
         self.layoutMain = QVBoxLayout(self)
         self.layoutMain.setSpacing(5)
 
-        self.create_menu()
+        # Regelt Bildrate und Low Power Mode (Zeichenzeit, Akkubetrieb)
+        self.governor = RenderGovernor.instance()
+        self.governor.lowPowerChanged.connect(self.applyLowPowerMode)
 
-        self.obdReader = ObdReaderThreaded("commands.txt", "commandsImportant.txt", "commandsMIL.txt")
-        self.valueLabels = {}
+        self.create_menu()
 
-        self.obdManager = ObdManager(self.obdReader)
+        self.obdReader = None
+        self.obdManager = None
+        self.streamServer = None
+        self.metricsServer = None
+        self.timeSeries = None
+        self.exportWorker = None
+        self.obdWorker = None
+        self.lastValues = {}
+        self.panelsBuilt = False
 
         self.status_frame, self.label_connection, self.label_time = create_status_frame(self)
         self.status_frame.setObjectName("frameStatus")
+        self.layoutMain.addWidget(self.status_frame, 1)
+
+        self.timer_time_update = QTimer()
+        self.timer_time_update.timeout.connect(self.updateTime)
+        self.timer_time_update.start(1000)
+
+        self.startup.mark("Fensterhülle")
+
+    def build_panels(self):
+        """Baut Werte-, Button- und Log-Bereich nach dem ersten Bild auf und startet das Laden des Readers."""
+        from gui.strip_chart import StripChart
+
+        self.startup.mark("Erstes Bild")
 
         self.values_frame = GlowingAnimatedFrame(self)
         self.values_frame.setObjectName("frameValues")
         self.values_layout = QGridLayout(self.values_frame)
         self.values_layout.setSpacing(10)
-        animate_hue_shift(self.values_frame)
+        self.hue_animation = animate_hue_shift(self.values_frame)
+
+        # Alle Wert-Kacheln in einem selbst gezeichneten Widget, scrollbar bei vielen PIDs
+        self.dashboard = ValueDashboard()
+        self.values_scroll = QScrollArea(self.values_frame)
+        self.values_scroll.setWidget(self.dashboard)
+        self.values_scroll.setWidgetResizable(True)
+        self.values_scroll.setFrameShape(QScrollArea.NoFrame)
+        self.values_scroll.setStyleSheet("background: transparent;")
+        self.values_layout.addWidget(self.values_scroll, 0, 0)
 
-        self.buttons_frame = create_buttons_frame(self, self.obdManager.start_worker, self.obdManager.start_worker)
+        self.chart = StripChart(CHART_PIDS, self.values_frame)
+        self.values_layout.addWidget(self.chart, 1, 0)
+
+        self.buttons_frame = create_buttons_frame(self, self.start_worker, self.start_worker)
         self.buttons_frame.setObjectName("frameButtons")
 
-        self.layoutMain.addWidget(self.status_frame, 1)
         self.layoutMain.addWidget(self.values_frame, 6)
         self.layoutMain.addWidget(self.buttons_frame, 1)
 
-        self.obdWorker = None
-        self.valueLabels = {}
-
-        # Signale verbinden
-        self.obdReader.connectionEstablished.connect(self.updateConnection)
-        self.obdReader.dataReceived.connect(self.updateDisplayedValues)
-        self.obdReader.errorOccurred.connect(self.logError)
-        self.obdReader.dtcReceived.connect(self.logWarning)
-
         # LOG CONSOLE widget / label etc
         self.logFrame = create_log_console(self)
         self.logFrame.setObjectName("logFrame")
         self.layoutMain.addWidget(self.logFrame, 2)
 
         self.logger = ObdLogger(log_console=self.logFrame.log_console)
+        self.startup.logger = self.logger
 
         self.logger.log_info("Programm gestartet")  # Start-Log
+        self.startup.mark("Oberfläche")
 
-        self.timer_time_update = QTimer()
-        self.timer_time_update.timeout.connect(self.updateTime)
-        self.timer_time_update.start(1000)
+        # Falls der Governor schon vor dem Aufbau der Bereiche umgeschaltet hat (z.B. Akkubetrieb)
+        if self.governor.low_power:
+            self.applyLowPowerMode(True, "beim Start")
+
+        self.backendLoader = BackendLoader("commands.txt", "commandsImportant.txt", "commandsMIL.txt")
+        self.backendLoader.finished.connect(self.onBackendReady)
+        self.backendLoader.failed.connect(self.logError)
+        self.backendLoader.start()
+
+    def onBackendReady(self, reader, last_values):
+        """Übernimmt den im Hintergrund erzeugten Reader und startet die Verbindung."""
+        from obd_manager import ObdManager
+
+        from obd_timeseries import TimeSeriesStore
+
+        self.obdReader = reader
+        self.obdManager = ObdManager(self.obdReader)
+
+        # Alle echten Messwerte dauerhaft als Zeitreihen speichern (eigener Schreib-Thread)
+        self.timeSeries = TimeSeriesStore()
+        self.obdReader.recording_sinks.append(self.timeSeries.add)
+
+        # Signale verbinden
+        self.obdReader.connectionEstablished.connect(self.updateConnection)
+        self.obdReader.dataReceived.connect(self.onDataReceived)
+        self.obdReader.sampleReceived.connect(self.chart.addSample)
+        self.obdReader.errorOccurred.connect(self.logError)
+        self.obdReader.dtcReceived.connect(self.logWarning)
+        if self.streamServer is not None:
+            self.obdReader.sample_sinks.append(self.streamServer.publish)
+
+        # Zuletzt bekannte Werte anzeigen, bis neue Daten kommen
+        for key, value in last_values.items():
+            self.updateDisplayedValues(f"{key}: {value}")
+        self.startup.mark("Reader geladen")
+
+        self.obdReader.startConnection()
+
+    def start_worker(self, mode):
+        if self.obdManager is None:
+            self.logger.log_warning("OBD-Reader wird noch geladen...")
+            return
+        self.obdManager.start_worker(mode)
+
+    def onDataReceived(self, message):
+        self.startup.mark("Erster Wert")
+        self.updateDisplayedValues(message)
 
     def create_menu(self):
         """Erstellt die Menüleiste mit Optionen für die Ansicht und das Speichern der Logs."""
@@ -100,6 +191,17 @@ class ObdConsole(QWidget):
         self.menu_log_to_file.triggered.connect(self.save_log_to_file)
         log_menu.addAction(self.menu_log_to_file)
 
+        # Messwerte der laufenden Sitzung exportieren (Hintergrund-Thread, blockweise)
+        log_menu.addSeparator()
+        for label, fmt in (("Messwerte als CSV exportieren", "csv"), ("Messwerte als Parquet exportieren", "parquet")):
+            action = QAction(label, self)
+            action.triggered.connect(lambda checked, f=fmt: self.export_samples(f))
+            log_menu.addAction(action)
+        self.menu_export_cancel = QAction("Export abbrechen", self)
+        self.menu_export_cancel.setEnabled(False)
+        self.menu_export_cancel.triggered.connect(self.cancel_export)
+        log_menu.addAction(self.menu_export_cancel)
+
         # Menüleiste zur GUI hinzufügen
         menu_bar.addMenu(view_menu)
         menu_bar.addMenu(log_menu)
@@ -112,8 +214,80 @@ class ObdConsole(QWidget):
         self.menu_low_power.triggered.connect(self.toggle_low_power_mode)
         view_menu.addAction(self.menu_low_power)
 
+        self.menu_low_power_auto = QAction("Low Power automatisch", self, checkable=True)
+        self.menu_low_power_auto.setChecked(True)
+        self.menu_low_power_auto.triggered.connect(self.governor.setAutomatic)
+        view_menu.addAction(self.menu_low_power_auto)
+
+        self.menu_stream = QAction(f"Live-Stream (Port {STREAM_PORT})", self, checkable=True)
+        self.menu_stream.triggered.connect(self.toggle_stream_server)
+        view_menu.addAction(self.menu_stream)
+
+        self.menu_metrics = QAction(f"Metriken (Port {METRICS_PORT})", self, checkable=True)
+        self.menu_metrics.triggered.connect(self.toggle_metrics_server)
+        view_menu.addAction(self.menu_metrics)
+
+        # Zeitspanne der Verlaufsanzeige
+        chart_menu = view_menu.addMenu("Verlauf")
+        chart_group = QActionGroup(self)
+        for label, seconds in (("1 Minute", 60), ("10 Minuten", 600), ("1 Stunde", 3600)):
+            action = QAction(label, self, checkable=True)
+            action.setChecked(seconds == 60)
+            action.triggered.connect(lambda checked, s=seconds: self.set_chart_span(s))
+            chart_group.addAction(action)
+            chart_menu.addAction(action)
+
+    def set_chart_span(self, seconds):
+        if hasattr(self, "chart"):
+            self.chart.setSpan(seconds)
+
+    def toggle_stream_server(self, enabled):
+        """Startet oder stoppt den Telemetrie-Server; die Werte kommen direkt aus dem Abfrage-Thread."""
+        if enabled:
+            from obd_stream_server import TelemetryServer
+
+            self.streamServer = TelemetryServer(websocket_port=STREAM_PORT)
+            if not self.streamServer.start():
+                self.logger.log_error(f"Live-Stream konnte Port {STREAM_PORT} nicht öffnen")
+                self.streamServer = None
+                self.menu_stream.setChecked(False)
+                return
+            if self.obdReader is not None:
+                self.obdReader.sample_sinks.append(self.streamServer.publish)
+            self.logger.log_ok(f"Live-Stream aktiv auf Port {STREAM_PORT}")
+        elif self.streamServer is not None:
+            if self.obdReader is not None and self.streamServer.publish in self.obdReader.sample_sinks:
+                self.obdReader.sample_sinks.remove(self.streamServer.publish)
+            self.streamServer.stop()
+            self.streamServer = None
+            self.logger.log_info("Live-Stream beendet")
+
+    def toggle_metrics_server(self, enabled):
+        """Startet oder stoppt den Prometheus-Endpunkt (Abfragen, Latenzen, Bildzeiten, Log)."""
+        if enabled:
+            from obd_metrics import MetricsServer
+
+            try:
+                self.metricsServer = MetricsServer(METRICS_PORT)
+            except OSError as e:
+                self.logger.log_error(f"Metriken konnten Port {METRICS_PORT} nicht öffnen: {e}")
+                self.menu_metrics.setChecked(False)
+                return
+            self.metricsServer.start()
+            self.logger.log_ok(f"Metriken unter http://localhost:{METRICS_PORT}/metrics")
+        elif self.metricsServer is not None:
+            self.metricsServer.stop()
+            self.metricsServer = None
+            self.logger.log_info("Metriken-Endpunkt beendet")
+
     def toggle_low_power_mode(self):
-        low_power = self.menu_low_power.isChecked()
+        """Manuelles Umschalten über das Menü; schaltet die Automatik ab."""
+        self.menu_low_power_auto.setChecked(False)
+        self.governor.setLowPower(self.menu_low_power.isChecked())
+
+    def applyLowPowerMode(self, low_power, reason):
+        """Setzt den vom RenderGovernor gewählten Modus in allen animierten Bereichen um."""
+        self.menu_low_power.setChecked(low_power)
 
         if hasattr(self, "values_frame"):
             self.values_frame.setLowPowerMode(low_power)
@@ -121,8 +295,13 @@ class ObdConsole(QWidget):
             self.status_frame.setLowPowerMode(low_power)
         if hasattr(self, "buttons_frame"):
             self.buttons_frame.setLowPowerMode(low_power)
+        if hasattr(self, "chart"):
+            self.chart.setLowPowerMode(low_power)
+        if hasattr(self, "hue_animation"):
+            self.hue_animation.setPaused(low_power)
 
-        self.logger.log_info("Low Power Mode aktiviert" if low_power else "Low Power Mode deaktiviert")
+        state = "aktiviert" if low_power else "deaktiviert"
+        self.logger.log_info(f"Low Power Mode {state} ({reason})")
 
     def updateConnection(self, message):
         """Aktualisiert das Status-Label mit der passenden Farbe."""
@@ -142,37 +321,14 @@ class ObdConsole(QWidget):
 
     def updateDisplayedValues(self, message):
         """Zeigt empfangene OBD-Werte in der GUI an."""
-        key, value = message.split(": ")
+        if ": " not in message:
+            self.logger.log_info(message)
+            return
+        key, value = message.split(": ", 1)
 
         is_dummy = "[🟡 Dummy]" in key
-        display_text = key.replace("[🟡 Dummy] ", "") + ":\n" + value
-
-        if key not in self.valueLabels:
-            label = QLabel(self)
-            label.setObjectName("valueLabel")
-            label.setAlignment(Qt.AlignCenter)
-            label.setWordWrap(True)
-
-            # Dummy-Werte Gelb machen
-            color = "yellow" if is_dummy else "white"
-            label.setStyleSheet(f"""
-                QLabel#valueLabel {{
-                    background: rgba(40, 40, 40, 0.6);
-                    border-radius: 12px;
-                    padding: 15px;
-                    border: 2px solid rgba(138, 43, 226, 0.4);
-                    font-size: 16px;
-                    font-weight: bold;
-                }}
-            """)
-
-            position = len(self.valueLabels)
-            row = position // 4
-            col = position % 4
-            self.values_layout.addWidget(label, row, col)
-            self.valueLabels[key] = label
-
-        self.valueLabels[key].setText(display_text)
+        self.dashboard.setValue(key, key.replace("[🟡 Dummy] ", ""), value, is_dummy)
+        self.lastValues[key] = value
 
     def logError(self, msg):
         self.logger.log_error(msg)
@@ -199,7 +355,7 @@ class ObdConsole(QWidget):
             self.menu_toggle_log.setText("Konsole ausblenden")
 
     def save_log_to_file(self):
-        """Speichert den Log-Text in eine Datei mit Zeitstempel."""
+        """Speichert den Log-Text in eine Datei mit Zeitstempel; geschrieben wird im Hintergrund."""
         if not hasattr(self.logFrame, "log_console"):
             self.log_message("Log-Konsole nicht gefunden!")
             return
@@ -215,21 +371,99 @@ class ObdConsole(QWidget):
         os.makedirs(log_dir, exist_ok=True)
         log_filename = os.path.join(log_dir, f"log_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt")
 
-        # Log in Datei schreiben
-        with open(log_filename, "w", encoding="utf-8") as log_file:
-            log_file.write(log_text)
+        def write_log():
+            with open(log_filename, "w", encoding="utf-8") as log_file:
+                log_file.write(log_text)
+
+        threading.Thread(target=write_log, name="obd-log-save", daemon=True).start()
 
         # Bestätigung in der GUI anzeigen
         self.log_message(f"Log gespeichert: {log_filename}")
 
+    def export_samples(self, fmt):
+        """Exportiert die Messwerte der laufenden Sitzung nach log_files/ als CSV oder Parquet."""
+        if self.timeSeries is None:
+            self.logger.log_warning("Zeitreihen-Datenbank wird noch geladen...")
+            return
+        if self.exportWorker is not None:
+            self.logger.log_warning("Es läuft bereits ein Export.")
+            return
+
+        from gui.export_worker import ExportWorker
+
+        export_dir = os.path.join(os.getcwd(), "log_files")
+        os.makedirs(export_dir, exist_ok=True)
+        path = os.path.join(export_dir, f"samples_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.{fmt}")
+
+        self.exportWorker = ExportWorker(self.timeSeries, path, session=self.timeSeries.session)
+        self.exportWorker.progress.connect(self.onExportProgress)
+        self.exportWorker.finished.connect(self.onExportFinished)
+        self.exportWorker.failed.connect(self.onExportFailed)
+        self.exportWorker.cancelled.connect(self.onExportCancelled)
+        self._export_step = 0
+        self.menu_export_cancel.setEnabled(True)
+        self.logger.log_info(f"Export nach {path} gestartet")
+        self.exportWorker.start()
+
+    def cancel_export(self):
+        if self.exportWorker is not None:
+            self.exportWorker.cancel()
+
+    def onExportProgress(self, done, total):
+        # Nur in 25-%-Schritten melden, damit die Konsole nicht überläuft
+        step = 4 * done // max(total, 1)
+        if step > self._export_step and step < 4:
+            self._export_step = step
+            self.logger.log_info(f"Export: {25 * step} % ({done}/{total} Zeilen)")
+
+    def onExportFinished(self, path, rows):
+        self._exportDone()
+        self.logger.log_ok(f"Export abgeschlossen: {rows} Zeilen in {path}")
+
+    def onExportFailed(self, message):
+        self._exportDone()
+        self.logError(message)
+
+    def onExportCancelled(self):
+        self._exportDone()
+        self.logger.log_warning("Export abgebrochen")
+
+    def _exportDone(self):
+        self.exportWorker = None
+        self.menu_export_cancel.setEnabled(False)
+
     def updateTime(self):
         self.label_time.setText(f"⏱ {datetime.now().strftime('%H:%M:%S')} UHR")
         font = self.label_time.font()
         self.label_time.setFont(font)
 
+    def showEvent(self, event):
+        """Registriert die Icon-Ressourcen erst beim ersten Anzeigen und setzt das Fenster-Icon."""
+        if register_icon_resources() and self.windowIcon().isNull():
+            QApplication.instance().setWindowIcon(QIcon(":/icons/mainIcon.png"))
+        super().showEvent(event)
+
+        if not self.panelsBuilt:
+            self.panelsBuilt = True
+            # Erst nach dem Zeichnen der Fensterhülle weiterbauen
+            QTimer.singleShot(0, self.build_panels)
+
     def closeEvent(self, event):
         """Sicherstellen, dass der Worker gestoppt wird, wenn das Fenster geschlossen wird."""
-        self.obdManager.stop_worker()
+        if self.obdManager is not None:
+            self.obdManager.stop_worker()
+        if self.streamServer is not None:
+            self.streamServer.stop()
+        if self.metricsServer is not None:
+            self.metricsServer.stop()
+        if self.exportWorker is not None:
+            # Abbruch greift nach dem laufenden Block; der Export löscht dann seine .part-Datei
+            self.exportWorker.cancel()
+            self.exportWorker.wait(5.0)
+        if self.timeSeries is not None:
+            self.timeSeries.close()
+        if self.lastValues:
+            save_last_values(self.lastValues)
         self.logger.log_info("Programm beendet")
         event.accept()
 
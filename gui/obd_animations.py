@@ -1,6 +1,8 @@
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QTimer
-from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QGraphicsDropShadowEffect
+from PySide6.QtCore import QObject, QPropertyAnimation, QEasingCurve, Property
+from PySide6.QtGui import QColor, QPalette
+
+from gui.animation_clock import AnimationClock
+from gui.glow_halo import GlowHalo
 
 # Farbkonstanten für den Glow-Effekt
 COLOR_PRIMARY = QColor(138, 43, 226, 120)  # Dunkel-Lila (leicht transparent)
@@ -9,13 +11,8 @@ COLOR_MAGENTA = QColor(255, 20, 147, 90)  # Magenta (leichte Deckkraft)
 COLOR_CYAN = QColor(0, 255, 255, 100)  # Türkis (dezenter Farbton)
 
 def create_glow_effect(widget):
-    """Erzeugt einen subtilen Rand-Glow."""
-    effect = QGraphicsDropShadowEffect(widget)
-    effect.setBlurRadius(20)  # Kleinerer Radius für schwächeren Glow
-    effect.setOffset(0, 0)  # Glow bleibt um das Element herum
-    effect.setColor(COLOR_PRIMARY)  # Startfarbe
-    widget.setGraphicsEffect(effect)
-    return effect
+    """Erzeugt einen subtilen Rand-Glow als vorberechneten Halo hinter dem Widget."""
+    return GlowHalo(widget, blur=20, color=COLOR_PRIMARY)  # Kleinerer Radius für schwächeren Glow
 
 def animate_glow_color(effect):
     """Farbwechsel für den Glow mit sanften Übergängen."""
@@ -34,34 +31,100 @@ def animate_glow_color(effect):
     animation.start()
     return animation
 
-def animate_hue_shift(widget):
-    """Erstellt eine sanfte Hintergrund-Farbanimation im HUE-Farbspektrum"""
-    animation = QPropertyAnimation(widget, b"styleSheet")
-    animation.setDuration(5000)  # Dauer eines Farbwechsels
-    animation.setLoopCount(-1)  # Endlos wiederholen
-    animation.setEasingCurve(QEasingCurve.InOutQuad)
-
-    colors = [
-        "background-color: rgb(255, 0, 0);",   # Rot
-        "background-color: rgb(255, 165, 0);", # Orange
-        "background-color: rgb(255, 255, 0);", # Gelb
-        "background-color: rgb(0, 255, 0);",   # Grün
-        "background-color: rgb(0, 255, 255);", # Türkis
-        "background-color: rgb(0, 0, 255);",   # Blau
-        "background-color: rgb(128, 0, 128);"  # Lila
-    ]
-
-    for i, color in enumerate(colors):
-        animation.setKeyValueAt(i / (len(colors) - 1), color)
+class PaletteColor(QObject):
+    """Animierbare Farbe, die direkt in die Palette eines Widgets geschrieben wird.
+
+    Für Widgets ohne eigene Farb-Property; das Widget darf dafür keinen
+    Hintergrund per Stylesheet setzen.
+    """
+
+    def __init__(self, widget, role=QPalette.Window):
+        super().__init__(widget)
+        self._widget = widget
+        self._role = role
+        widget.setAutoFillBackground(True)
+
+    def getColor(self):
+        return self._widget.palette().color(self._role)
+
+    def setColor(self, color):
+        palette = self._widget.palette()
+        if palette.color(self._role) != color:
+            palette.setColor(self._role, color)
+            self._widget.setPalette(palette)
+
+    color = Property(QColor, getColor, setColor)
 
-    animation.start()
 
-    # Timer erstellen, um das StyleSheet zu aktualisieren
-    def update_style():
-        widget.setStyleSheet(colors[0])  # Setzt den ersten Farbwert als Startfarbe
+# Farbfolge der Hintergrundanimation im HUE-Spektrum
+HUE_COLORS = [
+    QColor(255, 0, 0),      # Rot
+    QColor(255, 165, 0),    # Orange
+    QColor(255, 255, 0),    # Gelb
+    QColor(0, 255, 0),      # Grün
+    QColor(0, 255, 255),    # Türkis
+    QColor(0, 0, 255),      # Blau
+    QColor(128, 0, 128),    # Lila
+]
 
-    timer = QTimer()
-    timer.timeout.connect(update_style)
-    timer.start(5000)  # Aktualisiert alle 5 Sekunden
+class HueShift(QObject):
+    """Endloser Farbwechsel durch HUE_COLORS im Takt der gemeinsamen AnimationClock.
+
+    Hält zusammen mit den Glow-Rahmen an, statt als eigene QPropertyAnimation im
+    Qt-Takt zu laufen. Die Farbe wechselt nur alle `step_ms` (Standard 4 Hz): Eine
+    neue Füllfarbe zeichnet das Widget samt aller Kinder neu, bei einem Durchlauf
+    über 5 Sekunden reichen dafür wenige Schritte pro Sekunde.
+    """
+
+    def __init__(self, widget, setter, duration=5000, step_ms=250):
+        super().__init__(widget)
+        self._widget = widget
+        self._setter = setter
+        self._duration = duration
+        self._step_ms = step_ms
+        self._easing = QEasingCurve(QEasingCurve.InOutQuad)
+        self._color = QColor()
+        self._paused = False
+        AnimationClock.instance().subscribe(widget, self._onTick)
+
+    def setPaused(self, paused):
+        if paused == self._paused:
+            return
+        self._paused = paused
+        clock = AnimationClock.instance()
+        if paused:
+            clock.unsubscribe(self._widget, self._onTick)
+        else:
+            clock.subscribe(self._widget, self._onTick)
+
+    def colorAt(self, elapsed_ms):
+        """Farbe wie bei QPropertyAnimation: Easing über den ganzen Durchlauf, linear zwischen den Stützstellen."""
+        progress = self._easing.valueForProgress((elapsed_ms % self._duration) / self._duration)
+        position = progress * (len(HUE_COLORS) - 1)
+        index = min(int(position), len(HUE_COLORS) - 2)
+        fraction = position - index
+        start, end = HUE_COLORS[index], HUE_COLORS[index + 1]
+        return QColor(round(start.red() + (end.red() - start.red()) * fraction),
+                      round(start.green() + (end.green() - start.green()) * fraction),
+                      round(start.blue() + (end.blue() - start.blue()) * fraction))
+
+    def _onTick(self, elapsed_ms):
+        color = self.colorAt(elapsed_ms - elapsed_ms % self._step_ms)
+        if color != self._color:
+            self._color = color
+            self._setter(color)
+
+
+def animate_hue_shift(widget):
+    """Erstellt eine sanfte Hintergrund-Farbanimation im HUE-Farbspektrum.
 
-    return animation
\ No newline at end of file
+    Gesetzt wird eine QColor-Property statt des Stylesheets, damit Qt nicht bei
+    jedem Schritt die Stylesheets des ganzen Teilbaums neu auswertet. Widgets mit
+    eigener `fillColor`-Property (z.B. GlowingAnimatedFrame) zeichnen die Farbe im
+    paintEvent, alle anderen bekommen sie über die Palette.
+    """
+    if widget.metaObject().indexOfProperty("fillColor") >= 0:
+        setter = widget.setFillColor
+    else:
+        setter = PaletteColor(widget).setColor
+    return HueShift(widget, setter)
@@ -0,0 +1,20 @@
+import os
+
+from PySide6.QtCore import QResource
+
+# Erzeugt mit: pyside6-rcc --binary icons/resources.qrc -o icons/resources.rcc
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons", "resources.rcc")
+
+_registered = False
+
+
+def register_icon_resources():
+    """Registriert die Icons (:/icons/...) beim ersten Aufruf.
+
+    Qt blendet die .rcc-Datei per mmap ein, statt wie bei resources_rc.py die
+    PNG-Daten als Python-Bytes zu laden und zu kopieren.
+    """
+    global _registered
+    if not _registered:
+        _registered = QResource.registerResource(RESOURCE_FILE)
+    return _registered
@@ -0,0 +1,69 @@
+import json
+import os
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal, QCoreApplication
+
+LAST_VALUES_FILE = os.path.join("logs", "last_values.json")
+
+
+def load_last_values(filename=LAST_VALUES_FILE):
+    """Liest die zuletzt angezeigten Werte (Name -> Text) oder ein leeres Dict."""
+    try:
+        with open(filename, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_last_values(values, filename=LAST_VALUES_FILE):
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump(values, file, ensure_ascii=False)
+
+
+class StartupTimer:
+    """Misst die Startphasen relativ zum Programmstart und schreibt sie ins Log."""
+
+    def __init__(self, start, logger=None):
+        self.start = start
+        self.logger = logger
+        self.phases = {}
+
+    def mark(self, phase):
+        if phase in self.phases:
+            return
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self.phases[phase] = elapsed
+        if self.logger is not None:
+            self.logger.log_info(f"Startphase '{phase}': {elapsed:.0f} ms")
+
+
+class BackendLoader(QObject):
+    """Importiert python-obd und baut den OBD-Reader in einem Hintergrund-Thread.
+
+    Der fertige Reader wird in den GUI-Thread verschoben und mit den zuletzt
+    angezeigten Werten über `finished` übergeben.
+    """
+
+    finished = Signal(object, object)
+    failed = Signal(str)
+
+    def __init__(self, commands_file, commands_imp_file, commands_mil_file):
+        super().__init__()
+        self._files = (commands_file, commands_imp_file, commands_mil_file)
+
+    def start(self):
+        threading.Thread(target=self._run, name="obd-backend-loader", daemon=True).start()
+
+    def _run(self):
+        try:
+            last_values = load_last_values()
+            from ObdReaderThreaded import ObdReaderThreaded
+
+            reader = ObdReaderThreaded(*self._files)
+            reader.moveToThread(QCoreApplication.instance().thread())
+            self.finished.emit(reader, last_values)
+        except Exception as e:
+            self.failed.emit(f"Fehler beim Laden des OBD-Readers: {e}")
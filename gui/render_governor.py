@@ -0,0 +1,185 @@
+import glob
+import os
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
+
+from gui.animation_clock import AnimationClock
+from obd_metrics import MetricsRegistry
+
+POWER_SUPPLY_DIR = "/sys/class/power_supply"
+FRAME_RATE_STEPS = (60, 30, 15)
+
+_metrics = MetricsRegistry.instance()
+FRAME_TIME = _metrics.gauge("obd_gui_frame_time_ms", "Geglätteter Abstand zwischen zwei Animationstakten")
+FRAME_RATE = _metrics.gauge("obd_gui_frame_rate", "Aktuelle Obergrenze der Bildrate")
+PAINT_LOAD = _metrics.gauge("obd_gui_paint_load", "Anteil der Zeit, der mit Zeichnen verbracht wird")
+PAINTS = _metrics.counter("obd_gui_paints_total", "Gezeichnete Widgets")
+LOW_POWER = _metrics.gauge("obd_gui_low_power", "1 im Low Power Mode")
+
+
+def _read(path):
+    try:
+        with open(path, "r") as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def on_battery(power_supply_dir=POWER_SUPPLY_DIR):
+    """True, wenn ein Akku entlädt und kein Netzteil anliegt; ohne Akku (z.B. Pi am Netzteil) False."""
+    mains_online = False
+    discharging = False
+    for supply in glob.glob(os.path.join(power_supply_dir, "*")):
+        kind = _read(os.path.join(supply, "type"))
+        if kind == "Battery":
+            if _read(os.path.join(supply, "status")) == "Discharging":
+                discharging = True
+        elif kind in ("Mains", "USB") and _read(os.path.join(supply, "online")) == "1":
+            mains_online = True
+    return discharging and not mains_online
+
+
+def timed_paint(paint_event):
+    """Dekorator für paintEvent: meldet die Zeichenzeit an den RenderGovernor."""
+    def wrapper(self, event):
+        start = time.perf_counter()
+        paint_event(self, event)
+        RenderGovernor.instance().recordPaint((time.perf_counter() - start) * 1000)
+    return wrapper
+
+
+class RenderGovernor(QObject):
+    """Regelt die GUI-Bildrate anhand von Zeichen- und Bildzeit sowie der Stromversorgung.
+
+    Alle `period_ms` wird ausgewertet, welcher Anteil der Zeit mit Zeichnen
+    verbracht wurde und ob der Animationstakt seine Bildzeit hält. Bei Überlast
+    sinkt die Bildrate stufenweise (60 → 30 → 15 fps), danach wird der Low Power
+    Mode aktiviert; nach `recovery_periods` ruhigen Perioden wird er wieder
+    verlassen und mit der niedrigsten Bildrate fortgesetzt. Im Akkubetrieb wird
+    er sofort aktiviert und beim Anschließen des Netzteils wieder verlassen. Eine
+    manuelle Wahl hat Vorrang, bis der Automatikmodus wieder eingeschaltet wird.
+    """
+
+    lowPowerChanged = Signal(bool, str)  # aktiv, Grund
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(QGuiApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None, paint_budget=0.25, period_ms=2000, battery_poll_ms=30000,
+                 recovery_periods=15):
+        super().__init__(parent)
+        self.paint_budget = paint_budget
+        self.recovery_periods = recovery_periods
+        self.automatic = True
+        self.low_power = False
+        self.on_battery = False
+        self._overloaded = False
+        self._quiet_periods = 0
+        self._step = 0
+        self._paint_ms = 0.0
+        self._frames = 0
+        self._period_start = time.perf_counter()
+
+        self._clock = AnimationClock.instance()
+        self._native_rate = self._clock.frame_rate
+        self._applyFrameRate()
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._evaluate)
+        self._timer.start(period_ms)
+
+        self._battery_timer = QTimer(self)
+        self._battery_timer.timeout.connect(self._checkPowerSupply)
+        self._battery_timer.start(battery_poll_ms)
+        QTimer.singleShot(0, self._checkPowerSupply)
+
+    @property
+    def frame_rate(self):
+        return min(self._native_rate, FRAME_RATE_STEPS[self._step])
+
+    def recordPaint(self, ms):
+        self._paint_ms += ms
+        self._frames += 1
+
+    def setAutomatic(self, enabled):
+        self.automatic = enabled
+        if enabled:
+            self._overloaded = False
+            self._checkPowerSupply()
+
+    def setLowPower(self, enabled, reason="manuell"):
+        """Aktiviert oder beendet den Low Power Mode; `reason="manuell"` schaltet die Automatik ab."""
+        if reason == "manuell":
+            self.automatic = False
+        if enabled == self.low_power:
+            return
+        self.low_power = enabled
+        self._clock.setPaused(enabled)
+        LOW_POWER.set(value=int(enabled))
+        self.lowPowerChanged.emit(enabled, reason)
+
+    def _applyFrameRate(self):
+        self._clock.setFrameRate(self.frame_rate)
+        FRAME_RATE.set(value=self.frame_rate)
+
+    def _evaluate(self):
+        now = time.perf_counter()
+        elapsed_ms = (now - self._period_start) * 1000
+        load = self._paint_ms / elapsed_ms if elapsed_ms > 0 else 0.0
+        # Bildzeit: hält der Takt seine Rate, oder stauen sich die Bilder?
+        slow_frames = self._clock.frame_time() > 1.5 * 1000 / self.frame_rate
+        FRAME_TIME.set(value=self._clock.frame_time())
+        PAINT_LOAD.set(value=load)
+        PAINTS.inc(amount=self._frames)
+        self._paint_ms = 0.0
+        self._frames = 0
+        self._period_start = now
+
+        if self.low_power:
+            if self._overloaded and self.automatic:
+                self._recover(load)
+            return
+
+        if load > self.paint_budget or slow_frames:
+            if self._step + 1 < len(FRAME_RATE_STEPS):
+                self._step += 1
+                self._applyFrameRate()
+            elif self.automatic:
+                self._overloaded = True
+                self._quiet_periods = 0
+                self.setLowPower(True, "Zeichenzeit über Budget")
+        elif load < self.paint_budget / 3 and self._step > 0:
+            self._step -= 1
+            self._applyFrameRate()
+
+    def _recover(self, load):
+        """Verlässt den wegen Überlast aktivierten Low Power Mode nach genügend ruhigen Perioden."""
+        if load < self.paint_budget / 3:
+            self._quiet_periods += 1
+        else:
+            self._quiet_periods = 0
+        if self._quiet_periods < self.recovery_periods:
+            return
+        self._overloaded = False
+        self._quiet_periods = 0
+        if self.on_battery:
+            return  # bleibt wegen Akkubetrieb aktiv
+        self._step = len(FRAME_RATE_STEPS) - 1
+        self._applyFrameRate()
+        self.setLowPower(False, "Zeichenlast wieder niedrig")
+
+    def _checkPowerSupply(self):
+        self.on_battery = on_battery()
+        if not self.automatic:
+            return
+        if self.on_battery:
+            self.setLowPower(True, "Akkubetrieb")
+        elif not self._overloaded:
+            self.setLowPower(False, "Netzbetrieb")
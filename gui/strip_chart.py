@@ -0,0 +1,186 @@
+import time
+
+import numpy as np
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QTimer, QPointF, QRectF
+from PySide6.QtGui import QPainter, QColor, QPen, QPolygonF, QFont
+
+from obd_catalyst import SampleRing
+from gui.render_governor import timed_paint
+
+SERIES_COLORS = (QColor(0, 191, 255), QColor(255, 165, 0), QColor(186, 85, 211), QColor(0, 255, 127))
+
+
+class MinMaxBuckets:
+    """Min/Max je Zeitabschnitt (= ein Pixel) als Ring über die sichtbare Zeitspanne.
+
+    Neue Werte aktualisieren nur ihren Abschnitt; das Auslesen kostet
+    O(Anzahl Abschnitte), unabhängig von der Anzahl der Samples.
+    """
+
+    def __init__(self, bucket_seconds, count):
+        self.bucket_seconds = bucket_seconds
+        self.count = count
+        self._index = np.full(count, -1, dtype=np.int64)
+        self._min = np.zeros(count)
+        self._max = np.zeros(count)
+
+    def add(self, t, value):
+        index = int(t // self.bucket_seconds)
+        slot = index % self.count
+        if self._index[slot] != index:
+            self._index[slot] = index
+            self._min[slot] = self._max[slot] = value
+        else:
+            if value < self._min[slot]:
+                self._min[slot] = value
+            if value > self._max[slot]:
+                self._max[slot] = value
+
+    def add_many(self, t, values):
+        """Füllt die Abschnitte vektorisiert aus zeitlich sortierten Samples (beim Neuaufbau)."""
+        if len(t) == 0:
+            return
+        index = (t // self.bucket_seconds).astype(np.int64)
+        keep = index > index[-1] - self.count
+        index, values = index[keep], values[keep]
+
+        starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+        slots = index[starts] % self.count
+        self._index[slots] = index[starts]
+        self._min[slots] = np.minimum.reduceat(values, starts)
+        self._max[slots] = np.maximum.reduceat(values, starts)
+
+    def window(self, now):
+        """Min/Max der letzten `count` Abschnitte bis `now`, leere Abschnitte als NaN."""
+        newest = int(now // self.bucket_seconds)
+        expected = np.arange(newest - self.count + 1, newest + 1)
+        slots = expected % self.count
+        valid = self._index[slots] == expected
+        mins = np.where(valid, self._min[slots], np.nan)
+        maxs = np.where(valid, self._max[slots], np.nan)
+        return mins, maxs
+
+
+class _Series:
+    def __init__(self, name, color, capacity):
+        self.name = name
+        self.color = color
+        self.samples = SampleRing(capacity)
+        self.buckets = None
+        self.last_value = None
+
+
+class StripChart(QWidget):
+    """Live-Verlauf ausgewählter PIDs, eine Spur pro PID.
+
+    Alle Samples bleiben im Speicher (Ringpuffer, z.B. eine Stunde bei 10 Hz);
+    gezeichnet wird aber nur ein Min/Max-Paar pro Pixelspalte. Die Abschnitte
+    werden beim Eintreffen eines Samples aktualisiert und nur bei Änderung von
+    Breite oder Zeitspanne aus dem Puffer neu aufgebaut.
+    """
+
+    def __init__(self, names, parent=None, span=60.0, capacity=36000, refresh_ms=100):
+        super().__init__(parent)
+        self.span = span
+        self._series = {name: _Series(name, SERIES_COLORS[i % len(SERIES_COLORS)], capacity)
+                        for i, name in enumerate(names)}
+        self._dirty = False
+        self._refresh_ms = refresh_ms
+
+        self._font = QFont(self.font())
+        self._font.setPixelSize(12)
+        self.setMinimumHeight(60 * max(1, len(self._series)))
+
+        # Neuzeichnen gedrosselt, egal wie schnell Samples eintreffen
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._refresh)
+        self._timer.start(refresh_ms)
+
+    def names(self):
+        return list(self._series)
+
+    def setSpan(self, seconds):
+        self.span = seconds
+        self._rebuild()
+        self.update()
+
+    def setLowPowerMode(self, enabled):
+        """Im Low Power Mode nur noch einmal pro Sekunde neu zeichnen."""
+        self._timer.setInterval(max(1000, self._refresh_ms) if enabled else self._refresh_ms)
+
+    def addSample(self, name, value, t=None):
+        series = self._series.get(name)
+        if series is None:
+            return
+        t = time.monotonic() if t is None else t
+        series.samples.add(t, value)
+        series.last_value = value
+        if series.buckets is not None:
+            series.buckets.add(t, value)
+        self._dirty = True
+
+    def _rebuild(self):
+        """Baut die Pixel-Abschnitte aller Spuren aus den Rohdaten neu auf."""
+        width = max(1, self.width())
+        for series in self._series.values():
+            series.buckets = MinMaxBuckets(self.span / width, width)
+            t, v = series.samples.since(time.monotonic() - self.span)
+            series.buckets.add_many(t, v)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.oldSize().width() != event.size().width():
+            self._rebuild()
+
+    def _refresh(self):
+        if self._dirty and self.isVisible():
+            self._dirty = False
+            self.update()
+
+    @timed_paint
+    def paintEvent(self, event):
+        if not self._series:
+            return
+        if any(series.buckets is None for series in self._series.values()):
+            self._rebuild()
+
+        painter = QPainter(self)
+        painter.setFont(self._font)
+        now = time.monotonic()
+        lane_height = self.height() / len(self._series)
+
+        for lane, series in enumerate(self._series.values()):
+            top = lane * lane_height
+            mins, maxs = series.buckets.window(now)
+            lane_rect = QRectF(0, top + 16, self.width(), lane_height - 20)
+
+            painter.setPen(QPen(QColor(255, 255, 255, 30), 1))
+            painter.drawLine(QPointF(0, top + lane_height - 1), QPointF(self.width(), top + lane_height - 1))
+
+            if np.isfinite(mins).any():
+                low, high = np.nanmin(mins), np.nanmax(maxs)
+                if high - low < 1e-9:
+                    low, high = low - 1, high + 1
+                scale = lane_rect.height() / (high - low)
+
+                # Hüllkurve: pro Pixelspalte eine Linie von Min nach Max, Spalten verbunden
+                columns = np.flatnonzero(np.isfinite(mins))
+                y_min = lane_rect.bottom() - (mins[columns] - low) * scale
+                y_max = lane_rect.bottom() - (maxs[columns] - low) * scale
+                xs = np.repeat(columns.astype(float), 2)
+                ys = np.empty(len(columns) * 2)
+                ys[0::2] = y_min
+                ys[1::2] = y_max
+
+                # 1-px-Stift ohne Antialiasing: schnelle Linien statt Konturberechnung
+                painter.setPen(QPen(series.color, 1))
+                painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
+
+                painter.setPen(QColor(200, 200, 200))
+                painter.drawText(QRectF(0, top, self.width() - 4, 16), Qt.AlignRight,
+                                 f"{low:.0f} … {high:.0f}")
+
+            painter.setPen(series.color)
+            label = series.name if series.last_value is None else f"{series.name}: {series.last_value:.1f}"
+            painter.drawText(QRectF(4, top, self.width(), 16), Qt.AlignLeft, label)
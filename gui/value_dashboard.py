@@ -0,0 +1,155 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRect, QRectF, QPointF
+from PySide6.QtGui import QPainter, QPixmap, QColor, QPen, QFont, QFontMetrics, QStaticText, QTextOption
+
+from gui.render_governor import timed_paint
+
+# Gemeinsamer Kachel-Stil (entspricht dem früheren QLabel#valueLabel)
+TILE_BACKGROUND = QColor(40, 40, 40, 153)
+TILE_BORDER = QColor(138, 43, 226, 102)
+TILE_RADIUS = 12
+TILE_BORDER_WIDTH = 2
+TITLE_COLOR = QColor(200, 200, 200)
+VALUE_COLOR = QColor("white")
+DUMMY_COLOR = QColor("yellow")
+
+
+class _Tile:
+    __slots__ = ("title", "value", "dummy", "rect", "static_title", "shown", "shown_flags", "shown_key")
+
+    def __init__(self, title, value, dummy):
+        self.title = title
+        self.value = value
+        self.dummy = dummy
+        self.rect = QRect()
+        self.static_title = None
+        # Angezeigter Text (ggf. gekürzt) für (Wert, Breite), wird nur bei Änderung neu bestimmt
+        self.shown = ""
+        self.shown_flags = 0
+        self.shown_key = None
+
+
+class ValueDashboard(QWidget):
+    """Zeichnet alle Wert-Kacheln selbst statt eines QLabels pro PID.
+
+    Rahmen und Hintergrund einer Kachel werden einmal pro Kachelgröße als Pixmap
+    gerendert, die Titel als QStaticText mit fertigem Layout gehalten. Ändert sich
+    ein Wert, wird nur die Fläche dieser Kachel neu gezeichnet; ein Neulayout gibt
+    es nur, wenn Kacheln hinzukommen oder sich die Breite ändert.
+    """
+
+    def __init__(self, parent=None, columns=4, tile_height=80, spacing=10):
+        super().__init__(parent)
+        self.columns = columns
+        self.tile_height = tile_height
+        self.spacing = spacing
+        self._tiles = {}
+        self._order = []
+        self._frame_pixmap = None
+
+        self._title_font = QFont(self.font())
+        self._title_font.setPixelSize(13)
+        self._value_font = QFont(self.font())
+        self._value_font.setPixelSize(16)
+        self._value_font.setBold(True)
+        self._value_metrics = QFontMetrics(self._value_font)
+
+    def setValue(self, key, title, value, dummy=False):
+        tile = self._tiles.get(key)
+        if tile is None:
+            self._tiles[key] = _Tile(title, value, dummy)
+            self._order.append(key)
+            self._layoutTiles()
+            self.update()
+            return
+
+        if tile.value != value or tile.dummy != dummy:
+            tile.value = value
+            tile.dummy = dummy
+            self.update(tile.rect)
+
+    def clear(self):
+        self._tiles.clear()
+        self._order.clear()
+        self._layoutTiles()
+        self.update()
+
+    def _layoutTiles(self):
+        columns = max(1, self.columns)
+        width = max(1, (self.width() - self.spacing * (columns - 1)) // columns)
+        rows = (len(self._order) + columns - 1) // columns
+        self.setMinimumHeight(max(0, rows * (self.tile_height + self.spacing) - self.spacing))
+
+        for position, key in enumerate(self._order):
+            row, col = divmod(position, columns)
+            tile = self._tiles[key]
+            tile.rect = QRect(col * (width + self.spacing), row * (self.tile_height + self.spacing),
+                              width, self.tile_height)
+            if tile.static_title is None or tile.static_title.textWidth() != width - 20:
+                tile.static_title = QStaticText(tile.title)
+                tile.static_title.setTextWidth(width - 20)
+                tile.static_title.setTextOption(QTextOption(Qt.AlignHCenter))
+                tile.static_title.prepare(font=self._title_font)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._frame_pixmap = None
+        self._layoutTiles()
+
+    def _framePixmap(self, size):
+        """Hintergrund und Rahmen einer Kachel, gecacht für die aktuelle Kachelgröße."""
+        ratio = self.devicePixelRatioF()
+        if self._frame_pixmap is None or self._frame_pixmap.deviceIndependentSize().toSize() != size:
+            pixmap = QPixmap(size * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(TILE_BORDER, TILE_BORDER_WIDTH))
+            painter.setBrush(TILE_BACKGROUND)
+            half = TILE_BORDER_WIDTH / 2
+            painter.drawRoundedRect(QRectF(half, half, size.width() - TILE_BORDER_WIDTH,
+                                           size.height() - TILE_BORDER_WIDTH), TILE_RADIUS, TILE_RADIUS)
+            painter.end()
+            self._frame_pixmap = pixmap
+        return self._frame_pixmap
+
+    def _fitValue(self, value, rect):
+        """Einzeilig, wenn der Wert passt; sonst umbrochen in der Kachelhöhe oder am Ende gekürzt."""
+        metrics = self._value_metrics
+        if "\n" not in value and metrics.horizontalAdvance(value) <= rect.width():
+            return value, Qt.AlignCenter | Qt.TextSingleLine
+        wrapped = metrics.boundingRect(rect, Qt.AlignCenter | Qt.TextWordWrap, value)
+        if wrapped.height() <= rect.height() and wrapped.width() <= rect.width():
+            return value, Qt.AlignCenter | Qt.TextWordWrap
+        single_line = " ".join(value.split())
+        return metrics.elidedText(single_line, Qt.ElideRight, rect.width()), Qt.AlignCenter | Qt.TextSingleLine
+
+    @timed_paint
+    def paintEvent(self, event):
+        if not self._order:
+            return
+
+        painter = QPainter(self)
+        dirty = event.rect()
+        frame = self._framePixmap(self._tiles[self._order[0]].rect.size())
+
+        for key in self._order:
+            tile = self._tiles[key]
+            if not tile.rect.intersects(dirty):
+                continue
+
+            painter.drawPixmap(tile.rect.topLeft(), frame)
+
+            painter.setFont(self._title_font)
+            painter.setPen(TITLE_COLOR)
+            painter.drawStaticText(QPointF(tile.rect.left() + 10, tile.rect.top() + 10), tile.static_title)
+
+            painter.setFont(self._value_font)
+            painter.setPen(DUMMY_COLOR if tile.dummy else VALUE_COLOR)
+            value_rect = tile.rect.adjusted(10, self.tile_height // 3, -10, -8)
+            key = (tile.value, value_rect.width())
+            if tile.shown_key != key:
+                tile.shown, tile.shown_flags = self._fitValue(tile.value, value_rect)
+                tile.shown_key = key
+            painter.drawText(value_rect, tile.shown_flags, tile.shown)
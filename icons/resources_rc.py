@@ -1,12679 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.8.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00T\xa9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x02\x00\x00\x00\xd3\x10?1\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x06\xf7iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 6.0-c002 79\
-.164488, 2020/07\
-/10-22:06:53    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:xmpMM=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/mm/\x22 xm\
-lns:stEvt=\x22http:\
-//ns.adobe.com/x\
-ap/1.0/sType/Res\
-ourceEvent#\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:dc=\x22http\
-://purl.org/dc/e\
-lements/1.1/\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-2.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-025-01-31T15:10:\
-07+01:00\x22 xmp:Me\
-tadataDate=\x222025\
--01-31T15:10:07+\
-01:00\x22 xmp:Modif\
-yDate=\x222025-01-3\
-1T15:10:07+01:00\
-\x22 xmpMM:Instance\
-ID=\x22xmp.iid:c8b4\
-a822-3dbc-a943-b\
-85a-fc7e123a8ab2\
-\x22 xmpMM:Document\
-ID=\x22adobe:docid:\
-photoshop:80cbd8\
-b2-df72-da43-9e2\
-2-b9aad56cf0f3\x22 \
-xmpMM:OriginalDo\
-cumentID=\x22xmp.di\
-d:78f2be6b-7aad-\
-aa47-881e-030328\
-250faa\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 dc:form\
-at=\x22image/png\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:78f2be6b-7aad\
--aa47-881e-03032\
-8250faa\x22 stEvt:w\
-hen=\x222025-01-31T\
-15:10:07+01:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 22.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:c8\
-b4a822-3dbc-a943\
--b85a-fc7e123a8a\
-b2\x22 stEvt:when=\x22\
-2025-01-31T15:10\
-:07+01:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-22.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-<photoshop:TextL\
-ayers> <rdf:Bag>\
- <rdf:li photosh\
-op:LayerName=\x22OB\
-D\x22 photoshop:Lay\
-erText=\x22OBD\x22/> <\
-/rdf:Bag> </phot\
-oshop:TextLayers\
-> <photoshop:Doc\
-umentAncestors> \
-<rdf:Bag> <rdf:l\
-i>6AAD468F67CC16\
-1AFBF3EE6ED16E87\
-BE</rdf:li> </rd\
-f:Bag> </photosh\
-op:DocumentAnces\
-tors> </rdf:Desc\
-ription> </rdf:R\
-DF> </x:xmpmeta>\
- <?xpacket end=\x22\
-r\x22?>8\xc9\xf2\xf8\x00\x00MXIDAT\
-x\x9c\xed\xbd{\x98]U\x99'\xfc{\xdf\xb5\xf7>\
-\xe7\xd4\xa9k*\xd7\x82\x90@0\x04\x10\x0a\x8d\x18\x10\
-\x05#\xa2\x08\x8dtD\xe9\xa6m\x9d\xb4\x8e\xcft\x8f\
-L\x1a\x1f?\x9eO\x19f\x86\xaf?\x87q\xec\x8f\x91\
-\xce\xd0\xd3\xe38*=v\x8b\x8d\xd84\x8d\x1d\x11D\
- \x08\x18C\x80\x80\x81pI \x14\x84\xdc*IU\
-\xaa\xcee\xef\xb5\xde\xf7\xfbc\x9fs\xea\xd4-I\xed\
-\xba\x9c\xaa\xd4\xf9=\xe7I\xea\x9c\xb3\xd7\xde\xeb\xec\xbd\
-~k\xbd\xeb\xbd\xd2\xa9\xa7\x9e\x8a:\xea\x98\xad\xe0Z\
-w\xa0\x8e:j\x89:\x01\xea\x98\xd5\xa8\x13\xa0\x8eY\
-\x8d:\x01\xea\x98\xd5\xa8\x13\xa0\x8eY\x8d:\x01\xea\x98\
-\xd5\xa8\x13\xa0\x8eY\x8d:\x01\xea\x98\xd5\xa8\x13\xa0\x8e\
-Y\x8d:\x01\xea\x98\xd5\xf0j\xdd\x81\xe9\x02\x9a\xd8\x13\
-\xe9D\x9dn\x94Kh\xe9\xdfI\xbd\xcel@\x9d\x00\
-\x00`\x1d\x8a\x96D\x01(\x01NH\x14\xa0\x91\x07s\
-5Ut8st\xd0A#\x1cPu\xc2\xb1\xb2\xae\
-tn\x05\x08\xaaj\x18)\x0f\xbe\x07\x9e0\xfa\xce:\
-\xccj\x02\x10\xe0\x14\xc5\x08Mi>}\xbed\x02q\
-\xca\xa2hJ;\x8f)&\x03\x00-M\xb9\xa5F\x04\
-\xad\x0cr\x1d>\xe3W\x11\xa0|\x00\xc535\x0d>\
-\x04cY-\x06\xf5D\x15\x00\x13\xf7\x15\xbd\xb7\x0e\xea\
-\xfe#\x0a\xd2`V?\xc9\xe4\x98\xbd\xb7\x8d\x08\x91S\
-\xe7\xe8\xdc%\xde\xc7\xdfW<\xff\x94\xde\x16_#\x09\
-\x9c\xd3y-.\xf0\xe2\xa1&\x00@f\xd0\xa0UW\
-\xfe\x9bAZ\xa6C\x09\xf1;\xa2\xf2\xc1DP\x002\
-\xf8\xda\xe5\xadW\xa9\xe9\xe0o\x87\xf5t\xe0\x0f\x22@\
-U\x05\x0a2\xa6\xe7\x88\xbfu\x0f\x9ez-xb\x9b\
-\xbf\xafG=S\xb9n\x1d\xc7\x0b\x9a\x9d\xee\xd0D\xb0\
-\x0eQ\xa8+\x97{\xff\xee\x13\xb9\xb3\x97\xf5\x22*\xa2\
-H`\x02\xa44\x8a\xab'\xeac\xfe=\xf2e0\xe8\
-<\x09\xfb:\xd2\x87\xa5u\x86\x901\x12y\xff\xb4\xb9\
-\xed{\x0fz\x07\xfb\xc8xZ\xa7\xc0\x980{W\x80\
-\xfe\xbct\x9e\x92\xf9\xf2'\xf2gw\x1c\xc0>\x01<\
-e\x80\x94@\xf1$\x0e\x00\xaa \x0c\x1d\xf5\xa5\x0f\x87\
-\x1cS\x85\x01)h\x18\x03\x06\xef\x10\x8e\x86\x81#\xab\
-\x09DP\xaa\xfaP\xd1\xefqP\xb8j\xd5\xe1\x83\xb9\
-E\xdf{\xc0\x8a\xa8\xa9o\x08\xc6\x82\xd9H\x00\x22\x14\
-\x22m\xc8\xf8W\x9e/\xe7t\xf4\xa2(BL\x1c\xcf\
-\x9d\x0a\x10UF(U\x89\x1f\xd5\xed\x87\x9cn\xe8\x05\
-F\x7f\x7f\xfc\x83\xb3t\xa4\x0e%@\xe9r\xf1J\xe5\
-9C\x88\xc8\x87\xfb\xf0Y\xe1O\x9f\xd2C=\xc4<\
-q\x1a\xadY\x80Yj\x07(\x16u~[\xb0|A\
-\x1e6\x07\xc7\xc4#\x0d\xf4i\x01\x1a\xf6\xaa@\xa1\xbe\
-\x92%\xa38\xe27\xf1\xe1\x8e\xf9FAu\xcd\xe8\x98\
-0K\x09\xc0\x8c\xa2E\x7f1\x96m\xb4<\xb2\xc6?\
-vt\xf4\x93\xe8\xb1\x0e\x18\x0d\x5c\xf5\xaa:\x9bx \
-\x07\x12U\x0f\x1c\xb2\x08Y3\xa0\xbb\xad\xe3\xf80\x1b\
-\x09\xa0\x8at\x9a\xf6u\x176\xbf\x91q\xd4\x84@E\
-\xc5\x81\x14\x06\x02\x08%|)C=\x05)\xa4L\xab\
-\xf2\x15\x01\x05\x03\xaa0\x0eF\x95 \x0c\xe5r[\x1e\
-\xf6\x1a\xed\x12\x18\xa0\x90\x02\xe2D<\x15F\xa3\xee\xce\
-\xb5\xbe\xb5W\x18\xf5M\xf0\xd8`\xda\xda\xdaj\xdd\x87\
-\x1a\x80\x99\xac\xd3==\xd4\xd8\x1c\x9c1\x1f\x1cX!\
-\x12aU\xa7\xb1\xa6]U\xa1\x0a\x05\x95\xfe\x18\xe9%\
-\xd5o!DP\xb0S\x10\xe0\x13*\x9bcU\x22\xd2\
-\x14\xa9(\xf9\x0a\x22\x8a\x14\x12SE\xa1\xaaRz!\
-~\xa9\xd0@\x07\x94\x06]\xa5\xf4\x9f\x00F``\xfc\
-\x94I\xd9\xee\xbe\xcc\xdfml~\xe1M1\x5c\xd7\x84\
-\x8e\x0d\xb3q\x13\x0c\x00\x8aL\x8a\xba{\xed\xf7\x1f\xf4\
-\xd95~\xfc\xbd.\x9d)\x22-\xf0\x0cX\xe2\x03\x86\
-6\x88Q=\xbe\x86\x18\xb4D\x00\x10<*\x00yW\
-\xa5\x1c\xa2\x98D\x8e\x994\xf2\x02\xa0\x91\x01\x05I\xb9\
-aYp\xe7\xf2y\x89\x86\x9e<\x86\xab\x9a\xe2\x95 \
-\x0a/\xec\xda?\xe7\x9f\x1e\xcf<\xfa;\xc7\xac<\x1b\
-W\xf4qa\x96\xda\x01b\xa8\x22\xb2\xd4\x96\x95\x95\xcb\
-\xe8\x03\xcb\xb0d\x915\x9e\xa8\x1b\xec\x05Q2R\x95\
-\xc7#W\xeb4+#\x1c\x00\xc8\xa8\x00p\xe9v\xbf\
-0\xaf\xf1\x90\x81\x1b\x900\x05\x0e,\x86=\x0a\x0f\xe5\
-\x9b\xf7\xe5\xb2\x22\x02\x8e\x0dj<\x94l\x1c\x0b9\x95\
-\xb1\x5c}E\x8d/\xcaF\xf2y\xff\xe0a\xff\xc5\x03\
-\xc5\xcd;\x837\xf7\x9a0r\xc6L\xc0=\x99m\x98\
-\xd5\x04\x00\xa0\x80\xb5Pp\xc6\xa7 \x16\xe0u\xb0}\
-\xab\xf4\xe7\xa0\xb1>\x22\x98\xd4)\xc2\xd0|\xf8L\xfe\
-\xb7\x9f8\xb0\xa0\xa9\x17\x85\xb2JR\x8de\x81\x8a\xd7\
-\xccw\xfer\xde?<\x95\xb2Vh\xa8\x85\xa1\x82!\
-\xd6\x83\xea\xbdD\xb97\x04\x118\xe1\xa2U\xeb\xc40\
-\xbc\xfa\xe8O\x84\xd9*\x02\x95A\x80\xef\xc1\x89\xe4#\
-\xf4\x85\xb1\x19`D-\xcdq\xa8n\x14\xa2(D\xb2\
-\xbbO\xf3b\xc1U\xcb\x07\x19\x22\x90\x08\x88{\xfa]\
-w\x9f\xb3\x12{\xb0\x1d\xcf\xb5F:FA\x04\x22g\
-\x08\x81W\x97\xfb\x93c\xb6\x13 \x86a\x98\x89\xb0\x1f\
-\x89\x82\x88\xb2\xbe3\x22\x10T\x8d]!Q%\x03\x92\
-\xc6\xc0f\x83 r4~\x8bm]\xe3?~\xd4\x09\
-0\x80\x09\xb1\x02\x00JDDC\xf5\xf1\x15\x8f\xd0\xc4\
-\xe6\x80:&\x03u\x02L0\x08\xa4*:X\x8e\xa2\
-\x81\xb0\x00=\xba\xe7g\x1dS\x8c:\x01\xca\xc6\xa5\x09\
-:\x97\xaaZ!U\x1e\xf2yiw\xc1\x1c9\xb8\x92\
-\xe1`\x020\xe0qWG\x22\xccj\x028A\xd1\xc1\
-9\x82\x1b\xe6\xd1\x99\x08V\x11\x86J6\xf0%\x05\xed\
-\x1f\xf8\x82\x1d\x94I\x05\x9a\xf5\x90-\xe4\xa9\xe8t\xdc\
-;W\x8a\xb5BDJ\x04\xdfG\xe0\xd5\xb90f\xcc\
-F\x02\xc4\x81`\x05\xab-\x19\xf7\xfeE\xc1\xb2\x85\xd2\
-\xb1@\x1aR\xe4\xe00\xc2|zL\xaf\x7f\x94t\xf6\
-$\xc2*.}J\xb6\xbf\xad\xa1\x0fa\xf5\x01\xaa0\
-L\xd0\xde\xc2\xc7\xdfS<\xf5\xa4T(\x8eF\xd5\x02\
-\x1d\x07bm\xad\x1fy\x84=\x07\xd2\xbb\xf7\xfb/\xbd\
-)\xaf\xedS\x90\xd6\xf5\xa1c\xc2\xec\xb3\x03\x10\x8a\x91\
-6\x05\xf4\xe1w\x07\x1f;?Z1\xbf\xa7\xd9\xcfS\
-\xa0\xe0Q\x14\xa0\x95\x00\x81J\xfb\xaa\xef\x06>,E\
-\x8f)\xa9\x8fH5\x0c\xa12\xf8\xd0\x80\x84\x84BN\
-\x13\xd2^)\xbc\xb1\xe2\xd5\x93\xe0g\x80\xe0\x00\x12\x14\
-(\xd2`o!\xf5\xf0\xb6\x86\xfb\x9e\xe4w\x0e\xd59\
-0\x06\xcc.\x02\x10P\xb0\xda\x9a\xf5\xfe\xcd\xc7p\xcd\
-{\x0f\xc0\x16\x9c\xa7$B\xe1\x08\xa6\xafR\x0be@\
-\xca\xe3u\xd4\xd3*\xd8\x92aUO,\xc8(\x11\xe0\
-\x06\xbb&3\x5c\x00RP$\xb1Jh\x80\x00&\x81\
- O\x0a\x12\x80\x14\xc6\xc1\x03\x88\x11\x04;\x0e\xa5\xbf\
-\xf5\xd3\xcc\xf3\xaf{u\x0e\x1c'f\x973\x5ch\xd1\
-\x9c\xd1/~\xcc^{\xfe!D\xfd\xd6*\x22C\x16\
-\x0c\xa1\xd8\xb24\xd4\xfb\x9eIy\xa4\xcf\x87\xbc\xe2\xbd\
-\xa8\x12\x88\x09 %%\xaa\xe6\x8cz \x80\x1d(\x0e\
-$V\xd2\xaa\xe6\xa5\xbfuL/\x000\x0c\x86\x12T\
-\x15\xceP\xbf\x99\x93\x0dW\x9c\x9a\xfd\xdd\x9b8\xd8G\
-u\xeb\xd8\xf1`\x16\x11@\x14P\xfe\xd8J\xf9\x93K\
-\x0e\xf9.\xe7\xac!\x86\xa7\x00C\x99\x15\xa4\xc4Je\
-\x22\x8c\xfa\xe2a\xaf\xf8Cb%\x8e\xb9\xa0\x5c\xe5\x97\
-\x1f\x13$\x16\xb0\x04\x00\x11)\x86\x9c\xf0\x98\x17\x1d\xe1\
-ED$\x95\xf7 \x85x\x9e\x13o^S\xb1\xa5E\
-\x9fx1%uC\xc3q`\x16y\x0fFN;\xe6\
-\x98KN\xd3\x8c\x14\x11\xc2\xa83.\x0e\x02\x06k\x1c\
-oR\x1a\xb9U/\xc4n\xf84\xf4s\x1avX\x1c\
-J\x19\x0bKZ\xfac\x00\x0eP\x02\x13\x18Z\xbd\x9e\
-\x8c\xb8\xec\x1c\xd7\x0b\x10\xb0\x05\xb9\xb2\x1c\xc5\x80\xc0/\
-\xa0/<\xef\xe4\xfc\xe9\x1d\xc6\xd5-\x0e\xc7\x81YD\
-\x00'8iN\xd4\xb98\x07\x8a\x93\x9d\x0c\x0c\xdd\xa3\
-b\xc8\x01:\xecU\xfdU\xe5\x84CZ\xd1\xe0\xe6C\
-N\x98\x0c\x04\xf0\xc0\xe5X\x08\x05/\x02\x88\xe7p\xfe\
-\xe23#\xad/\x01\xc7\x81\xd9B\x00U\x10\xf1\xc2l\
-\xae9{\x04\xce\x8c\xec_\x06\x19\xc7p\x9c\x1a\xc4\x93\
-\xfd\x88V4%e(\xc4D0|\xfe\xc9\xfd\x95\x04\
-^u\x1c\x05\xb3\xc5\x0e\xa0\x80!4\xa6\x15\xcc\x1a\x12\
-\x91+\x7f\x5c\x01\x01\x0c\x13+C\xf58V\x86Z \
-\xce\x89BZ\x0a\xa7t2\xa8\x9b\xca\x00\x09[\xa2t\
-k\x8a<\x86L\xd7\xdf1}p\xe2\x10\xe0\x98N\x01\
-\x86\x94KI\xaf\x069\xa4)\xbc\xd8\x85'\xa2l.\
-4\xa0~\x82T\x05\x00\x10\x80Q&\xd3*\x8f\xb7\xea\
-\x03JM\x86\xf7o\xd8yh\x88\xeb\x7f\xd5\xd1#\x1c\
-\xa9$\xbe\x180\x22\x07?P\xcah\x81 %u\x8f\
-\x922\x08\xea\x89\x07A\x11\xae>\xf6\x8f\x07'\x02\x01\
-\xe2\xe8\x90\xd0\xc1\xea\x10_\xb3\xaaP\x12A\xe4\xb4/\
-\xf4ADd\x07'\xb3\x22\x00\xe4\x99\xe7^\xf77l\
-\xcd\x8aMy\xa6\xaa-\x95\x5c<G\xba\xf0H\xd1a\
-#6\xa9\x1c9\xe4<#\xc7\x1e\x8cv$\x91\xc2\x11\
-\x0c\xe1p?\xde\xbf\xcc^\xf5^\xd7`\x8ap\x03m\
-J\xdd&\x01\xa9\xea\xec\x91p\x93cz\x11\xa0\x12#\
-5&\xe15_T\xe7(\xedS&E)\x13K\x05\
-<xJ\x86(\xa9Pk\xd6\x80x\xa8Q\x8b\x1c1\
-`R\xdb\xde2?\xf9\x8d\x0b]0\x8d\x13\xcd*@\
-D\xe8\xeb\x96\xa2\x04\x97\xad\xb4\x0d&\x84\xd5\xe1\x111\
-u\xe9\xff81\x8d\x1e\xb5(\x22\x07'\xf0\x18\xfeq\
-\xe4y\x8d\xf3{\x16B4e\xfc3N\x09\xdf\xdb\xe1\
-\x96\xcc\xa5\x969!Y@MY\x94\x07\x005p\x86\
-\x0c\xbcS\xb2!B\x88\x04\xcc\xc5\x81\xf3\xb8\x00\x0a\xa4\
-\xa4\xb91\x9c\xd3\x14D\x91\x06\xfet\x1e?\xca\x84B\
-H\xad\xa9\xa2\xd1\x22TF\x10u\xb4\xb4\xeb\xafE\xf7\
-f\x18\xa6\x0b\x01\x8a\x11\x9c\xa3\xe6\xb4I\x07\xe8/\xa2\
-\xaf\xe0|_R>\x8d\xa6\xc8`\xa2\x5c\x88BA\xde\
-\xb3\x1cW\x9do/<+\x7fR6G\x9eC p\
-\x80\x0c\x8eG\x89E\x036\xc8\x8b\xf6c\xc8\x88\x11\x8a\
-\x00b\xa6\x00>T\xb5\xece9m\xa1@9\xdc\xcc\
-a\xf4\x0d{u\x12\xd3:FC\xed\x09\xa0\x8a\xd0b\
-N\x93\xbe\xeft\xbcoi\xb1%\x1bv\xe7\xcds\xbb\
-\xbc\xdf\xbch\x0e\xf7i:5\xf23,F\x926\xe6\
-\xaa\x8b3\x7f\xf8\xc1\xee\xe5\xf3sp\x0e\x91\xd3\xbc\xb8\
-\xb2@\x5c\xdd\xaa\x1c\x9dk\xc1\x04b\xe2\xaa\x8d\x82B\
-\xc9\x111\x84\xc5y8.\xdf\xcfZ\x83\x00\x90\x10\x14\
-\x82J&\xd3\xa1\xb7\x89\x08\x025u\x0a\x1c\x1d5&\
-\x80\x02\x91\xc3\xfcV\xef\x8fV\xe7\xaf\xec<\xd2\xd2\x10\
-A\x14\xc6|\xfc<\xef\xde\x85-?\xde\x18\x1c\xe8\xb5\
-\xc3\x83\xbeEP\xb4z\xed\xc5\xee\xcb\x9f\xecK\xb9^\
-\xf4\x89Z\x8e\xe7x3\xe8\xdce\x10\xc1TO\x95U\
-\xa3\xbc\xb4a\x18M\x1b3]Q\xb9!4l\x01(\
-i\xadT\x15\x18=S\xe80\xbe\x94|\xf3f\xce-\
-\x98\x18\xd4\x98\x00\xceQ\xda\xa3O\xbc\xa7p\xcd{\x8f\
-\xa4\x90\x93\x1c\xc3\xa6\xa1h\xf2\x0b\xd7^`\x0b\xb6\xed\
-\x07\x0f\xf9\xd6\xa9?\xb8\x9b\x91\xa3\xd3\xe7{\x9fZu\
-$U\xe8EQ\x22\x8f(p\x9eT?m\x1a\xa4E\
-\xa9\xe4z\x181\xdbT\xe9\xd3\x996U\xaa\x96]1\
-F\xf8N`\x0e\xe7\x0d\x111c\x84eMQ\xca\xbd\
-E\xe5s)\x88\xe0\xfb\x1ax\xe0\x994\x13\x8c\x17\xb5\
-$@\x9c\xe9oy\x87\xae9\xa7/\x15\x15\xad\x040\
-\x96Qt\x1e$4i\x13}\xe4\x8c\xdco^\x9e\xfb\
-\xfc\xeb\xd6\xc3\x80o\xbd\x02\xd6\xe1\xf2N=\xb9\xb1\x80\
-\xa2\x11&1\x91\x1fy\x00\xca\x91\xb8\xf1\xd8'\x05\x11\
-\x95u\xfdC\xb6\x04\x83`\xe2\xc3O\x10\xdf\x19\x85*\
-\xb2)\xb9\xf0\x0c\xca9\xca\x90\xd3\x91\xe4\xba\x81\xbc\x8d\
- \x059q=\xfd\xba\xef\xb0\xe9\xeb\x97t\x8a|\x7f\
-\xb6\x90\xa0\xa6\x04\x00\x14t\xd2\xdcB\xc7\xfc\x02\xf2 \
-\xe3\xd8*9\x02D\xd9 \xf2\x165\xd8\xd3\xdb\xa3\xe7\
-_'\x11\x98J\x925As\xda\xbd\xfb\xd4\xc8#\x0b\
-&R\xf5#\xc3\x8e\x01\x10\xdb8\xf6J\x09JJ\x03\
-\xa5\x87\x06'\x8d%\x94-\xa8\x04\x08K\x8a8\x84\xda\
-\x88Tf\xb2 0 \xdf\x89\xce\xcd\xe4\xfe\xfdg\xa5\
-@&\x80\xd5R\xfcX\xf5QZJ\xffE\x0a\x18\xb8\
-\x94\x98b\xaeW\xb6\xbf\xde\xf4\xf0\x0b\xe9g_G\x7f\
-\xc1fS4\x02oN8\xd4T\x04R\x00Hy\x82\
-\xb4\xa2`I\x0c\x11\x83\xc1\xc2P\x07\x16V2\x88\x80\
-\xa0\xbaQ\xe4p\xfa<\xb3\xb0\xe5pEtaWr\
-\xb5w$\xaa\x1e\xa9oD\x94\xac\xa2L\x81\xc1&!\
-\x1d\xf8\x88\xc8\xb1\xf3B\x03\xa1B\xb3\x8b\xd23\xff\x89\
-+\x00Rx\xa4\xa74\xf5\x97\xe8\x8c\xb2\x87v\x05$\
-U\xc73\x90\x87Z4\xe3\x9cS\xdc\xfb\xdf\xdd\xf2\x8f\
-O\x06?\xff\xad\xd7\x93w\x81\xaf'|\xb6\xf5\x1a\xaf\
-\x00\x00\x82\x80\x11@\x05`*\xe9 \xa9d\xce\xd4\x92\
-\xc3\xe3\xa0A)\x82\xe6\xaci\xf0\xa2\xd8\xaf\x80\xa0\xe0\
-\xf2\xc9\xd4\x17\x03OB\xa8c3\xf8JU\x04(\x8d\
-\x8ax\xbagp\xec\x1a\x17D\xe9\x94#\xf21\x82\x1f\
-\xc2LClP\xec-\xd1\x01(K\xfc\x03\xa8\xba\x1d\
-\xac\x80\x85\xf5\xc1L\xa9\xe2\xd2\xd6\xee\x7f\xfd\xd1T[\
-\xd0\xf6\xc3\xc7\xbd\xfe\xa2\x9b\xc66\xc1\x89A\xed\x7f_\
-\xc9%y\x04\xcf\x19\xd2\x11]\x05\x08 \xa8\xa3X\xd8\
-\xadx,@\xc8H\xc0\xc8\xc3\x07\xd2s@\x0e\x10\x0c\
-,\xe3\xc3\xbc\x9a\xb5To\x8b\x05\xf0\x22d\x95\x82X\
-u2\xe3W\x81\x12\xf8h\xfb\x9e\xc1\x1e\xda\x06\x9c\x81\
-*\x8a\x16!\x9a}\xfb\x99U\x87\xdf:\xd4\xfc\xb3-\
-\xc6\x0a\xbcQ\xfc)b\x96\xc53\xc9Q@tTw\
-\xaaZ\xa3\xf6\x04\x18pN\x1b\xf1\xdb\x11\x97`e\xb8\
-\xf2\xee\xb6\x0ck\xd4\xc0\x01\xd8up\xce\x0f\x9fh\xd9\
-{\xb0\x90\xf2\x10{\xb9\x01\xc3\x9dyt\xd0\x08 !\
-\x83\xb7\x0f\x11C=3S\x16}\x1a)\xba`4\x0c\
-9\x92\x86|\xa9T\x84\x11\x90@\x02\xe7\xa4\xb1\xa1\xf0\
-\xf9\x0f\xa4v\xed\xcb>\xdf\x05C#dp!Bh\
-\x11Z\x94L\x11#_\xb12\xb7)\x1b\xf8\x06\xbe\x99\
-v4\xa8=\x01\x8e\x02\x1a\xcd\x9b\x8b\x5c\xac\xb8\xa6\x81\
-\xaa\xd5`\x058$_\x0by\xde\xfc\x1av\xec\xa3l\
-\xaa\xaa\xde\xe3\x08\xe7\x1e|\x1d\x85\xc7\xf0\xcc\x8c\xad\xba\
->4{\xc5pf\xd0\x08\x7f\xc5\xef\x08DQ|\x12\
-%G\x0c\xed\xc7\x92\x93\xc23N1\xdb\xde\x0aDi\
-\xc8\x9c\xa0\x82\xbe\x225\xa4\xe8\xb4\x05\xda\xde\xc4\x81\xef\
-J\x16{-\x85}\x96/\xa1J*0}\xfdf\xef\
-!\xea\xee\xd7b$\x99`z\xdd\xe1iM\x80\x91\xa1\
-\x00\x1cLE\xbc-\x81\x15q\xa8y\xc06\xedK\xca\
-\xa7\xb4w\xa2\x083#\x83\x14\x06%\xcfm*'v\
-\x1f\xc0\x90w\x83\x19\xc1Ud\x19,i*\xc8A@\
-\x86r+\xe6y-\x99tO\x1e\xd5mEQ\x88\xf4\
-\x9c\xd3\xcc\xd5\xef\xce\x7f\xe0\xcc\xc8\x9b\x07\x96\x22\xa9\x85\
-\x1aU\xaa*\xfa\xcd\x04(\x87\xea\x05\xae\xbfa\xcf;\
-\xfc\xf0+\xfc\xf8\x8b\xde\xaew\x90\x0a\xe0\x9b\xe9\xf2h\
-f \x01\x08\xe5\x18\xdd\xc1n0\x15WR\xcc<\xa3\
-V2\x90\xc6e\xc2\x10\x13@uPL\xc4`\xc9|\
-\x10\x01\x08DJ\xd08X\xbf:\xac\xa1\xa2K\x15\x84\
-nA#\x9a2\xe8\xc9W_\x12\xb6\x88\xdf{\x7f\xfa\
-O.\xdbsrC\xd1+\x12\xc2\x08\xca \x85Z\x90\
-V\x898\x0c\x10T 9x\x85\x05\xa7\xe0\xf4S\xbc\
-+W\x06?|\xac\xe9\xc1\xa7=\xa8z\xd3c\xe8M\
-\x8f^\x8c\x11n\x0c\xb2\xef\x09\x0a\x15ecZRH\
-\x0bG\x0e\x04\xc4\x95\xf90 \x91W\xea-U\xbf\xab\
-:\x83\x82\x81\xbcH\x8eJ\x8eC\x95\xc1\xaf\xbe#\xcb\
-\x10f\x07\x96J[&\xf4\xf4\xeb\xc7\xdf\xe7\xdfp\xe9\
-\xc1\xb6T\x14\xd9\xc0\x222y\x0f\xe0R\x16\x18\x96A\
-;b\x22\xc0W\x88\x925\xd0,\xbb3\xe6G\xff\xf7\
-\xd5\xb2 \xdb\xf6\xa3\xc7\xd9\xbai\x91\xc0k\xe6\x11@\
-\x013\xda\xbekv@\x15\x99\x14v\x1f\xe6\x877e\
-\x9a<?\x12!\xd2*\x99\xa6|k\xe2\xb5pD\x0d\
-L\x1ct!X\xd0\x883\xe7GA\x90W\xadR\xf9\
-\x93\x02\x0cf\x81\xa8\x96\x04$\x02\xfa\x8a\xf8\xc02\xef\
-\xcb\x97\x1ei\xcb\xf4 \xd7\xc0A\x01d\xd5\x10\xc1U\
-\xcc\x8a:To\x17?+V\xa8(\xa8\x9f\x9b\xfc\xe2\
-\x17>\xdc\xbb\xaf\xbf\xf5\xc1-* \xae5\x07f\x1e\
-\x01\xa0HQI\xbdI3\xd3\x8bg\x9cPEK\x03\
-v\xed\xd3\xff\xf9s\xaf\xfc\x04\xc7\xbc\x1e\xaa\x22t\xf4\
-\xe13\xcc\x92\x8f\x1f\x0e|\xebBc\xca\xcag\x07\xcb\
-\xc2p\xcec\xe5\xb2P\xa9@\x14\xf1\xf9g\xe6Nn\
-\xec\x87\x05\x82~\x03\xa9\xb2\xafUV\x9f\xa1\xda\xb6\xb2\
-\x01\x82L\xec\xc6]\xa0l\xf6\xc8\x9f\xadFww\xf3\
-\xd3o\x90\x1f_\xa2v\x98\x81\x04\x98u\x03~\x04\xc4\
-\xc1@G\xec\xc0\x07c=\x83(BKyKr|\
-\x95\x85\x0b\x91[\xb2\xb0q\xe5\xe2\x1cq\x11\x12\xd3\xc2\
-\x1b\xf02<Z\x07\x061\x04\xac\xc8S\xc7<\xfb\x81\
-s\xe5\xc5\xb7\xbd\xa2s\xb5]\x04f`\xd0\xe8\x8c\xb7\
-\xd3N\x0c\x08`\x1a\xe7\x8b@\xa2%\x05\xe81.\x17\
-F\xfc\xae\x85vq[\x91\x9c\x00\x02\x18\xa8?\xacG\
-\xa50\xbc\xd8\xcb\xabdj\x1c\xca\x0d\x820\xf2\xb9+\
-\xce:\xf2\xee\xa5P\x1d5\xe6ij0\x03\x090i\
-P\x85\x138\x81\xc8\x08\x1cS\x94\xcaX\x8f\xd8P\xaa\
-\x1c\xe8*G\x8e\xf8\x1a~\x02\x8d\xcf \xa5\xab\x8fv\
-\xe9\xa3t)\xe9\x18R\x06\xe2\x90\x99\xa3\xef\xa9\x08\x08\
-\x85Oj\xe9mj\x0a\xa1\xa6r\xf1\xf2\x1f\x00\xa0\xea\
-\xb4\x5c\xfaC\xe3\x1dF\xa9\xd8\xb7\x0e6;\x02,j\
-\x839-\xe1\xf2\xf9\xbd\xa3\xc7\xfcM\x11f\xa4\x084\
-\xe1\x10@\x04\x22\x94\xf1\xd47\x1a9*X0\x81\xab\
-\x0a\xaf\xc7\x03\x94@\xa5\xdc\xcf\x00\xcajW\xe7\xa0\x80\
-a\x8d\x0b\xdf\x89@$V\xb2\xa0\xec\xb6_\x81z\x0c\
-\xae*\x0d,\x0a\x11@)\xf0\x84\x99\xd4Q\xc1)1\
-L\xd9\xd5\xbf4\xca\x1d\x080\x06\x5cUe\xcc\xb9\xd2\
-\xd0gR6I\xf4\x02\x04\x86\x8e\xaa\x93\xaf\x1e\x9b\x0c\
-\xb6\x1aAl\xd9;K@\xb16\x8e\x95\x00\x11\xc7\x06\
-M\x00K\xc9(!\x06\xe4SdM\x9f\x88\xa4\xe1E\
-\xac\xb6\x22\x0e\x09<\x03:\xab\xa3\xd8\xdc\x989\xd8\xc7\
-5\x94\x82\xea\x04\x80\x150p\xee\x12\xfex'\x9d\xb5\
-\xb8\x98i\xea\xa5\xd0{\xe1\xf5\xb6\xbb7G;w\x1b\
-\xd1\xd2.\xed\xbd\xcb\xe4s\x17k\xb1?\xf5?\x1eq\
-\xaf\xbc\xad\x8d%\xdf\x19\x9d\xd3\xc4_\xb8\xc4?}\x91\
-\xfc\xdd\x13\xd8\xf8\xa2\x85\xc8G\xcf\xc9|z\x95\xd7\x90\
-9\xe4\x5c\xc1([V#\x9e%\x80\xc2\x96\xc6\xa6\xdb\
-\xef\xf7\x7f\xf3\xb25L \x88\x22\xe3\xd3yK\xf4\x8a\
-\xf3\xb0\xec\x94<\x02\x0a{\xb1\xed\x8d\xe0\xde\xa7\xbdW\
-\xf6\xc0c\xb5\x02\xc3\xf8\xe0\x99\xf8\xd4\x85\xd1\xcew\xf8\
-\xff<\x12\xf4\xe4\x9cg`\x05\xd6\xe9\xc7\xce\xa3\xcbV\
-\xc8\x929\xfa\xc2\xc1\xd4\xff\xfcyt\xe8\x08\x8dM\xb1\
-HpZ\x14\x0dG\xfb~\x10/HH|\x10\x00[\
-N\xc9(\x00;2\x0cG\xcc\x87r\xcd\x8flM\xe5\
-B1&\xae\xb5\xc0E\xc1\xc2\xb6\xe2\x07N\x0a[\xd2\
-\x81U!D\xe5\xb03f\x84\xc8c\xe9\x82\x86\x96,\
-\x0e\xf6\x8f|\xf5\xa9\xc1l'\x80\xb5H\x07\xf8\xe3\x0f\
-y\x9f\xba\xa0\xa7\xad5\xd7\xa3p0\x01\xdc\x95\xf3v\
-_xF\xeb?<\x11\xfc\xdd\xafED\x98qZ[\
-\xb4\xea\xec\xee\x9ew\x1a\x9bSm\x91\x94B\x8f\x9dR\
-\xd6sg-\xeb9{Y\xb4\xf9\xc59\x8f8O\x15\
-'\xb7\xf7\xbd\xe7\xf4^\xf6\x0b\x05\xf2\x22Cl\x9d\xaa\
-G0@\x11K\xa9\xed\xc9fR\x8a/\xbdt>\xfe\
-\xec\x93\xf2\xc1\xb3\xf2\x1c\x15\x0e\x87\x9ez\x92\x9eSX\
-\xbe\x84.xw\xc3w\x1fh\xde\xf0,YU\x22:\
-\xa35\xba\xa0\xb3;\xc8\xfa\xa9\x8ds\x9c0\xa0\x85\x90\
-\x7f\x7fU\xf8\xef>\xd13g~x\xf0p\xebc\x8f\
-po?\x99$\xf2\xec(\x16\x15\x02\x08\xd5\x1e\x10\x0a\
-x\xe2\xc1\x1a\x0c\xe4!\x22\x90+\xe5j7\xe9\x9d\x87\
-\xd3\x7fy/\x8c\x9f\xf6\xb8\xa46\xcdGh\xccx7\
-^AWv\x1e\xf1\x22\x0b\xe2\xca\xb9\x01\x85s\x8b\xe6\
-\x06M\x0d\x1e\xb4\x96\x09\xecf5\x01bU\xe0\xbf\xfa\
- }\xe1\xb2\x03Q\xa4?y\xbc\xfd\x1f7\xd1\x81\x1e\
->c\x91\xf9\xdc%=\xabN;\xf0\xc5+mW_\
-\xdb/\xb7\x14SL\xf9\x08\xe8\x0d\x0e\x16\x0bE\x11\xaf\
-\xecdJ \x82\xb80/\x05\xc9Y\x01@L\xc5P\
-$\x0c{\x0ff~\xf0X\xdb\xf3\xbb)c@\xec\x08\
-`1~\x83{\xe5\x1d!\xc3\xd6\xa15k\xfe\xf4\xca\
-\xe2%g\xec\xeb\xdf\xdfr\xdfs\xf3~\xf2\x1b\x9b/\
-\xe8{Om\xffW\x1f)\x9e\xb1t\xdf\x9f~\x92\xf6\
-\xe5[7n\xb5~\x03\x9cu8\x0c\xdb\x07\x85ZA\
-\xbe\xa0k> _\xbd&\xdf\xd8\xa8\xbf\xde\xdaz\xdb\
-?\xa5\xba\xba)\x9d\xb0\x5c\xf6\xf0M\xea\x00X@\xe5\
-\xad\x0b\x04!\x11<B4\xa4y,\x0e\xb1*;8\
-\x8f\xb5b\x0a`\xa6\xfe\x90\xdf\xec\x85\x85\xf3\x8c\xc0U\
-G\xe8\x13\xac\xc9.\xb2\xf3\x1a\x8b\x04\x1f\xb5c\xc0\x0c\
-$\x80\x82'(L#W\xd4\xb3NN\xad>\xbb\x1b\
-Z\xfc\xc9\x13'\xad\x7f\x00a\x14eR\xfa\xf8\xcb\xee\
-\xad\x83-\xb7\xffI\xd0\xb0\xe8\xe0\xfc9\x9e\x8f\x8c\xa8\
-8\x12x\x1c\x11\xac\xa8(\xc5[OQX\x81\x82\x04\
-\x14\xc5\xeeh\x0a\x1b\xf9\x1c\xf8{\x0b\xfe\x93\xaf\xf9/\
-\xbe\xa3)\xdf\x11y\xa5\xe8\x055)\x0f\xc6 \x14\xbc\
-\xe7\xd4\xe2\x87O;l\x0b\xfe\xdd\x9b\x16\xad\xffE\xce\
-\xf3a\xc0\xf7?+{{\x1a\xfe\x9fk\xe76\xb5\x15\
-\xdfsF\xeaW\xcf8\xc4\xde\xda\x81\x032\xcez\xb9\
-\x22>r\xae\xff\xa5\x8fv76\xe6\x9e\x7f\xe9\xe4\xff\
-\xfe\xcf~\xd7\xfeB&\x98\x9c\x01$\xb0\x16\x91\x05\x81\
-B\x8b\xa8T\xd6\xa3\x1a\xa6\x5c\x1cJ\x99\xd5PI7\
-\x05\x80\x00C\xea@G\xf2\xe9|\xe85\xa5\x1c\x06\xe5\
-\xe2`\xf1=\x93\xcf\xcd\xc9\xb0o<w|\xaa\xd8\xc9\
-\xc0\x0c$\x00!\xd2R\xda\xd7\xf1L\x1c\x0a\x14\xad\xae\
-ZV<cn\xe1\xe0\xe1\x86\x7fy\xce\x15#m\xca\
-\x10\x80lZ\xbb\xfb\xdd\x7f\xffE\xf6H\xaf\xb7s?\
-\x93\xa7P@\x0c\xc4\xa6\xa2\x94ZS\xb4.mI\x95\
-\xc2\x08Q\x04\xa7\xe4)\xa7\xcb\xfdc\x02Q\xc4\xcc\x9e\
-\x81!2DL\x14k\xcc\xd9\xa81p\x0e\x8d\x0d\xb8\
-\xe4\xcc\x82\xc0\xbd\xbc\xbb\xe9\xae\xcd\x07\x8d\xf12\x1e\x01\
-0,\xdb\xde\x0e\xff\xf3\xcfZLT|\xb1+\xd7\xd8\
-\xa0\x00E6\x05\x97Q5\xb9\xa2;\xefT^wE\
-a\xf1\x9c\xe8\xc9\xa7\x9b\xff\xeb\x86\xe8\xcd\xbd6\x9b\x9a\
-\xd0\xb0\xadx\xf3N\x02Ec\x06g/\x96\xd6f\x18\
-\xa6B\x11\xa7\xcf\x1f\x16\x9fQ\x0a\xc80`+p\x0a\
-Su\x1a\xb0A1\xa4\x03\xdd~.\xf4\x9a2\xe1\xc0\
-\xd3\xd2rHZ\xa8K\xda\x91\xf2\x91\x1bu\x1b2\xe9\
-\x98y\x04 \xa0\x08RG\x00U\xbb\x00\x8fU\x9b\xe6\
-\x1ce\x02Z\x90\xe9A`\x0f\x1f\xca\xf4\x17$.\xf0\
-\xae\x0a\xc3P\xd5\x9f?S`6Mi\xf5L\x89l\
-@\xd8\x98\xf2:O\x09\xb3)i\xce\xd8\xbc\xe3\xc8\xf2\
-\xe2V\x9a\xd7@\xb6(b,`\x00v\xe0\xa8\xe0\xcf\
-\x09\xa2\x0b\xdeU\x98\xdb\x0a\x9fAF \xc8\xf8|\xa0\
-\xd7\xbc\xb2\x8f\xc3H\x9b\xd3x\xffR\x22\xcf\xfb\xe5\x16\
-\xddw\xd04eJ\xfd7LD\xd8\xf8B\x1f\xc84\
-\xa7\xc1%_\xe5\x22\xb4\x08\xf2\xcfY\x8a?\xfcP\xdf\
-\x8a\xa5\xbd\xb9\xfd\xa9\x7fx\xa2\xf1\xd5\xb7\xa8\xa5\xc1\xf1\
-\xe8\xb9O\x92\xdd_\x12\x80\xacF8i\xae~\xf9\x93\
-\xfd\x11\x1c\xa9\xc7\xa4\x8d\xc6\xb2\x8b\xaa\x5c-\xa8\xa4\xf7\
-W\x03r@\x04\xf5\xab)\x12\xe7l\xed\xee\xb5\xfd\x0e\
-\xf0\x19\x85\x92\xdcX\xcaY\x00\x0b\xa7K\xe7\xfa)\x9f\
-\xfb\xc3\x9a-\x013\x8f\x00\xa8\xf8}\x8e\x0f\xa2\xda\x90\
-\xe2\xc6\x0c\xc0\xc1\x81\xc3\xe2D\x0c{\x15\xcd\x1f\x11\xe6\
-53\xa0\x03\xb9\xf8\x15\x88\xb8=\x1d~\xf5\x9aC.\
-\xcd,\xa1U\x82\xf1}K\xde\x91\xe8H/\xdb\xf2\xfc\
-\xc6\x06Q\xce\xb47\x84\x7f\xfe\xfb\x07\xada\xa8\x07\xdf\
-\xc2:o\x0emyf\xce\xad?2=\xfd\xca\x8c\x86\
-\x94 B\xce\xa6\xab\xd36(@\x84\xb9M&~S\
-\xb4\x0a\x10$\xd0>\x9c\xb9 \xff\xef\xd7\x04\x0b\xe6\x17\
-!\x9a\xceD\xe7-\x93g\xdf\xf6\x8a\xc5\xa3\xe4\xd7M\
-\x06\x02\x0c\x14*.\xed\x87\xe9TX\xca\xc6\xce\x8a\xc8\
-i\x11#\xd9\x8e*whP\x0c1\x11D\xe5H\x84\
-\x82\x98\xb8\x92\x19\xca\xd2\x11\x00\x85\xc0\xd9\xf6&6<\
-\xd4N0\x95\x98\xd6\x04(\xa9\x0b\x86\x81\x11\xdb\x0fU\
-\x94\xc6i\xc9#\xa3\x10\x07\x19A\x88\x0e-\x000W\
-\x05p\x18\x97\x8b\xbc7\xf7\xa4\xfa\xd4\xf75\x03%%\
-NStJ\xa3\xe5\xc0rI=B\xac0\x81+0\
-\xbd\xb1\xd7\xeb+\x04\xac\x011i\xa4h\xb6o\xbc\xc9\
-\xd6*\x11\x98\x14\xa9R\xad0\x1e\xe5\xd2\xb1V\x87\x14\
-\x0c8\xe757G\xcd\xcd\xfd/\xefn>| \xdb\
-yj\xf7\x9a\x0b\xfa_\xdd\xd3\xfa\xcb\x17\xc8\x8ax\x13\
-\xe9O\xa3\xb1\xfc\xc3D\xea\x1c\xf5\x1aU&5`\x11\
-C\x5c\x95qu\x18xxAY\x82\xe6,\x876\x80\
-\xe60X\x06\x02\x18\xc2)c\x99j9\x08\xa7+\x01\
-\xb4\xe4\xe0\x1b\x09Y\x07\xaer\x7f\xb0\x0ea\x1c\x81D\
-\x18\xcf\xe2\xcfD\xf9\xa2\x1c)\x02\xb0s[a\x0cD\
-\x06\x02\x0aT\xc9x\x04\xa7\xce){@\xfc\xb1\xc1\xc1\
-#\xd9\xff|\xcf\x9c\xcd\xaf\x15\xdb\x1aI\x15a\xa8K\
-\xe6\xf9\xb7|>\xea\x5c\xa2^\x95)8H\xbb7\xf6\
-\xa5\xbfq\xf7\xbc\xe7\xde\xd4\x8c'L\x10%\x82\x1a#\
-\xc6\xa8\xc7\xb0B\xf9\x82\x97j*6\xa6\x0aL\x19\xa9\
-b\x99(2)\x13Y\x17Y\x8d\xc7a\xe0E\x9e'\
-P~eW\xfa?\xdc\xe3w\xedK\xdd\xfaY\xb7\xfa\
-\xfc\xfcu\x17\x15v\xbc\x93\xde\xb9\x7f\xe4\xa8\xc5\xe3\x86\
-b \x8a\x22\xfe\xdf\x02\x04%\x02\x89\xafP\x07\xb2\x00\
-H\xe9\xe8\x19wG\x9a\xc7I\x94\xd5\x99\xa1nrJ\
-\x0aO\x89\x1b\x02\xe7\x1b[\xc3q8]]!H\x00\
-\x152N}\x11VaU\x96\xf8%\x1c\x89\xef\xa8\x01\
-\xaa<\x0e\x02xFs\xa1\xd9}$P\xd5\xd6&j\
-\x08\xfc\xa2SU0#\xb2p\xc2\x9f\xfd\xa8\xf7o?\
-Y\x5c\xb5L\xe2pK\x22\x05\x8c\xa0\xc8l9 \x18\
-%\xa3j(\x84\x0b\xad(\xc8IE\xcfM\xacl\xad\
-\xb3\x22\xc6\xa8\xf1\x94\x8dz\xbe\x18O\xc1\x14\x07\x89\xf7\
-\x15\xf8w\xbb<\xb8\xe8\xc2\x15\x98\xdf\xee\xf5\x17K\x9f\
-\xe7#U\xf0g.1\xff\xf6\xea\xdc\xfb\xde\xe5\x17\xa3\
-x\x16\xf0`\xbc\xee\xbe\xe0\x7f?\x9cy\xb9K{r\
-\xf8\xd9\xf3\xcd\x07\x0f\xe1\x9cw\x1f\xba\xe6}6\xe3\xc1\
-\xb9\xa3\xff\xd6Q\x10\x07\xc4p\x5c\xc1\xb2\xbc\xdc\x8a\x96\
-\x16\x818'\x81\xc6\x12\x11\x93\x1a\x12\xa6\x91e\xf58\
-\xfb\x1c\x0d\xf7\xd2b\x12k\xa9\x90\xf3K5\xbd\xab\xae\
-M\x10\xa7\xae\xa5\xc5e\x02\xd4\x10\xd3l\x05\x88\x0d\x85\
-\xf1\xb3\x10\xca\xb0\xfb\xe0\xb2\x02\x9b \xa0\x88\xd8*\xd8\
-(\x15\x1d-n\xb7\x0d^\xec\x8a\x22\xd5\xe6\x951\xb1\
-\x81\x08\x01\xeb\xd6\xb7\x1a\xf7\xf6\xb8y\xcd\xf6\xf2s\xdd\
-\x9b\x07\xcc\xfe\x1eg\x0c\xa0t\xfer\xfb\xa5\x0b\xadw\
-J\x0f\x5c\xdb\xa6\x1d0\x06)\x16h\x1a\x1c\x19\x13\xf9\
-l\xe2\xf8n\xcfC\xc6\xd7\x14T\x22\xd8R\x8dIu\
-\x04\xf5\x15>\xc2H\xfas\xc6\x05\xc4q\x14\x1b\x01\xaa\
-\x9eACZ\xfbr\xfa\xd0\xef\xf8C\xcb\x83\x95\x8b\xe9\
-\xb2N\xfe\xf1F=\xd0\xa3\x02\xf8\x86>p\xba\xf9\x93\
-\x0bz\xd3K\x0a\x90y\x0f=\xd7\x9f\x09\xd4B\x915\
-\xdb\xdf2\xcf\xecB:E\x9e\x8d\x9e\xfc]\xea\xc9w\
-\xb7\x5c\xd9\xb0\xf7\x13\xef;\xb0}\xcf\xfc\x0d\xcf\x92\x8a\
-$\x12\x07KS?\x95\xdc\x81\xa4\xca\x01B\x10\xc7J\
-\x83\xe3\xad\xee\xd0\xd9\xb2\x12\x82\xa7&v{&\x1a\x9a\
-\x8e\x97\x0d\x22G\x87z\x15V\xc1\xa8\x0a\x18\x8e\xa3\x85\
-\x05*>\x8f\xb0pL\x19\xa6\x19\x01\x06@\x10\xf6(\
-\xff\x91wG\x17\x9c\x9bf\x17\x81\x04\xc6\xb0BA\x14\
-:?\xdeq\x8dc\x05SE6#[wz\x0f<\
-\xd3\xb6\xf6c\x07?{\xd9A2\x8d\x1b\x9fK\xe5B\
-\xd3\xd1n\xff\xf0\xe2\x1e\x8f\xb0\xff\xd5\xf4\xa3\xdb=Q\
-\xf1\x10{\xe4\x84\xc6\xea\xe0DEqb\x10G\xce\x19\
-X \x80\x92\x8a\x8b\x8a\xd2\xee\xd3\xaa\xd3lk\x93\x06\
-\xe4\xb1\x09\xc1\x11\x94}\x83\x03=\xbc\xfb\xb0\x17:y\
-zG\xea\xe9\xb7Z\xdf\xb7\xfc\xe0\xe7?\xe8\x1a\xd1\xf0\
-\xd4k,N\xde5\x9f\xfe\xe0\xa2\xfet\xf6\xd0\xf6\xe7\
-\xe6\xfd\xfc\xe9b\xcacf\x0d\xfc\x22\xb4\xdfh&\xc5\
-\xda\x0b4fx\x7f\xaf\xbb\xe7\xd7\xfe\xf2\xb9-\xcbO\
->\xf4\xaf?\x9a\xdby\xc0\x7f\xfe\x0dnH%(\x8e\
-Mecp\xd9\xb3\xad\xec\xaeP\xfe\xbeL\x8d\x11\xee\
- \x95\x5c9\xa94\xa2i\xe0\x84%0sh\xe5\xe0\
-\x91\xd0\x09\x0cW\xa5\xea\x03)\x13@pQ\xca\x1fv\
-\xe6)\xc4\xb4%@\x1c_\xcd\x0c\x9b5}`\x94j\
-^\xb0@\x15\x1e!\xf4An\x9cqa\xcc\x04uw\
-=N\x81\xd7p\xf5E}\x9f_\xd3\xfb\xa9\xcb\x1a\x8a\
-Em\xce:\xdf\x0f\xdf\xdc\x1d\xdc\xf9`\xcb\xb3/k\
-\xe0+\x08A\xda\xe0$]@\xe9Lj\xa0\x04\xaf\xaa\
-2S\xd3<\x9fO\xa5\xd6&\x8e\xd3\xf6\xb74yA\
-s\xa6\xbd=w\xe3\x17\x0e\xe7\xe1\x93\xf5\xc8s\xf0\xf2\
-\x88R\xa6\xd5nzl\xce\xb7\xfe\x81\x8bV\xf6\xf7\xe8\
-\x7f\xff\x85\xf7g~\xc3\xfb\x16\xb9?\xfdl\xcf\x1f\x14\
-E\x8b<'\xcb\x10\xd9\xfeZ\xe3\xdf\xfc\x22\xf5\xcc\xab\
-Q&e\x004\xa5<,\xc84\x1d\x22?P\xed\x87\
-\x82Z\x1a\xdc\x96W\xcc\xc3/6,?\xb9\xd0qv\
-\xee\xa6?N\xfd\xa7;\x1b\xdf\xd8\xa3\xc6\x1b\xcbdJ\
- (\x89\x83e\x16.\xa5\x93.)k\xaaO#\xa5\
-\xa3\x81jf@\xa1\xa4\xcab\x9c\x85Z\xa8U\xa4\x06\
-M\x0e\x0aC\x88\xac\xeb\xcd\xbbPM\x86\xb5\xbcKP\
-\xc4:l\x05\xac\xcd\xfa\xb5\xcc\x131M\x08P\xb9\x01\
-U\xae\xb3\xa4\xa4,E\x83\xd0\x093\x03p\xaa\xca0\
-\xca\x04B4\xfe\x85S\x15Mi\xec\xef\x93\xbfy\xd0\
-\x7fuw\xcb\xca\xce\xc2\x82\x05QC`_\xdb\xef\xed\
-\xe9jyh+o~U=#L\x04\xe0\xf5\x83\xfe\
-\x83\xbfm\xcd\xf5\xfa\x07\xfb9e\x5c,(x\xac}\
-E\xf3\xf0\xb6\xa6Sz\xf4\x95\xfd\x9eg\x04\xc0\xce\x03\
-\xfc\x8b\xadYf\x8f\x03eC$V`\xc0\x8d\xb0\x1e\
-7\x17^\xea\xf2#\x07&\xf8\x9e\xfcn'\xfe\xcb\xdf\
-7_xFt\xfey\xb9\x85m\xa1\xa1\xd4k\xbb\xb1\
-sW\xea\x97\x9bS\xcf\xbdi[\xb2$\x22\xaa\xfa\xfc\
-\xeeL\xfbS\x99\xd7\xf6\xb8\xbceC\xaa\x8a\xc0#b\
-y\xf4\x05\xbf\xbd\xad\xb1\xa5\x91\xb3\x1e\x9d\xd4f\xde\xd8\
-g\xc7P\x17F\xa1\x8a\x86\x8c\xdf\xb60\x8d48\xf4\
-@\xae\x14\xfdX]>\xb9R\xf1\xbbj\xe4\x97\xde\x12\
-\x97\xb4\xb6\xceC\xd6k>\x12\x98\x12y\x06\xf4\xc6\xcc\
-\x08C\x1c\xc9\xb3\xd5\xca\xca2\xf0\xac\xe3L\x80\xd9\x14\
-\x86|1\x95\x98&\x04\x88!\x83\xef\x03\x11\xc5j\xce\
-X\x82\x06q%\x0d\x93+\xed\xbb\xc6\x7fIE6M\
-\xc5H\xef\x7f\x96\x7f\xb5\xad\xa15kS>\x15\x8a|\
-8G\xb9\x08>\xab\xef\x95<\xd6\xb7\xbe\xce\xdb\xdf\xcc\
-8\xa8\xb5.~f\x00|\x0fG\x0a\xf4\xa3\x9f{L\
-\x08\x1dR>\xa0\xf8\xed\xcb\xee\x99\xd7\x0c$\xeb\x84b\
-\xc9X\x84\xe2\xf9\x96\xc9/\xaa\x83\x22v\xab!\x1fo\
-w\xeb?n2\x0f?\xd7\xd8\x96\x81oL_Q\x0e\
-\xe4\xa8h50d\x08l\x00\xf0\x13\xaf`\xf3\x0e8\
-\xa5\xc8Q\x9cLA\x14-Y\xbc\xb9\xdf\xfd\xcd\xfd)\
-\x03\xf6Yad\xb4\x14n#\x83\xe0\xb3\xee:\xe0\xdd\
-\xb3\xa91\xf0<gK\xd6j\x8cz_\x15\x83\xbe\x8b\
-gq\xa3$N\x89\x03\xff\xadn\x9f\xbdp\x08\xfd\x98\
-4\x12:\x5c\xf0#\xa9\x12\x8d\xe2r\x96p\xac@@\
-)\x7f\xcc\xfb\xb7\x09\xc4\xb4\x22@\x05\x95{\x1d\x87\xfd\
-\x12Wr\xe1s\xf5\xbd\x1ar\xd3\x92+E\xd3>\xac\
-h\xd1bO\x8fW\x92\x00H\xd3\xfeP\xf5k1\x02\
-\x81\xcc\xb0\xe4Y\xf9\x22\x040\x0c\xc3\x00\xa1hi\xb0\
-m\xdfTu\xd50\x95\xb2!\xc4\x13d&\xa5N\xd0\
-[\xa4\x9e\x02)\x94\x09\x0cM\x07Z\xfd;#\x87B\
-\x04\x06y\x83%\x1cf\xe4\x8b\x14[\xea\x0c\xcb\x98\xbc\
-A\x99\xc0\x06/\xbfmw\xecf \x13\xcf\xfcUs\
-w\x054\xe8\xff\x11\xee0)\x94\x88\xa1\xc2\xc6\xd0`\
-\xbb\x1c\x81D\x11\xb9\xe1\xc5;\xe3U\x85@\xea{#\
-\xe6o\x9f\x22LC\x02H\xf5*[\x9e\x93*6\xb1\
-\xea\xfb4\xec\x9e\x95\xf3\x17\x8cui\xd0\xca\xf0\x1d|\
-\xce\xea7\xe5\x03F\xc0\x90\x147UGj\xd5\xbf\xa3\
-\xf4\xb9\xea\xd2\xa3\x89\x01\xa3]\x9a\x09<\xbe\x07\xe8\x04\
-Q\x9cVh\x10\xc6t\xff\xe2_$\x00F\x8bFP\
-\x91A\xb5\xfcJ\xbf\x93\x88\x18\x88|\xcf\x11j\xb6\x11\
-\x9e\x86\x04\xc0H\xa3$\xa6\x81\x94\xc3\x91F\x9c.\xaa\
-\xd6\x8d\x99\x89\xa9\x17\x82\xb9$eM\x16\x88\xa0\xaa\x91\
-e\x91*{wi\x050\x10\x0f\x88\x02\xaf\x96\x95I\
-\xa6'\x01J\x100\x00\x8e#\x0e\x09p\x1e\xc4S.\
-\x92Gj\x18*e\x7f\xd0!\xe2i\xedt\x0au\x0c\
-\x85* \xca\xaa\xe5l\xde\xf1\xe8\x8fU\xa8\xe4H\x91\
-\xf6\x15T\xb5\xf0O-\xa6-\x01\x08`VA\xa3A\
-\xb6\x05dA\x02b8\xa5T\x03\x0e\x8b\xf6\x00(\x12\
-\xcf\xd4\xc9~\xf6@\x89*\xa9\x00\xca[\xe4\xf2S\xe3\
-\x08\xd6pM\x93\x9cM[\x02\x00,\xc5\xc8\xdf\xf8l\
-\xe3o\xbb\xd2\x0a\xf5YA\x8e!y\xe7\x9f7W?\
-\xba\xbc\xaf!\x93|\xf4\x8b\xc29\x88\x82\x06\xed\xdaJ\
-\x7f2\x10\x97\xe5\x13\x81\x15\x000\x043XT\x88\xac\
-(x\xb8t^J-\xa1(g\xeaT\xa2\xa1I\xa7\
-Ea\xab\x82\xdc\x01X\x818\x10a\xc8\x0e[\x04\xb1\
-+TE\xc1o-\x5cY?P\xad4\x8b7Iq\
-\xc4\xfd\xf4\x01\x01T\xce\x151R=?\x05\xe8\x8c\x85\
-\xca\xa4\xaeF\xeb\xf6t%\x80*\x08y\xe7?\xf5Z\
-\xe3?o!\x9f\xc5\x18@=\x10rE\xda\xbb\x8c/\
-8\xa3\xaf\xc1h\xb9P\xf4\xe0\xa6\xc7\xda\x04\xa8 \xf0\
-\x90m$CP\xb5T\xd9|\x96\x94\xe0\x1c\x09\xf5\x15\
-5\x124\x04\xd4\x94\x16\xa7|\xa8\x1f\x83\xeal\x11\xcd\
-k\x09@\xae\xbf\xc8\xc5\xd0\xc6s\x18\x01\x91C\xe8\xa8\
--\xc3K[\xec\x9cV+d\x0e\x1e1\xbb\x0f\xeb\xe1\
-\x9c: (g\xab\x0e\x0c\xcdkT\x01\xf7\xe6%&\
-XSF\x9aRZ\x88\xf8`\x1fQ\x953A\x10`\
-nZ\x15\xd4\x9b\xa7(Rf\xb4e5\xed\xb1\x85\x90\
-Z\xe8\x00\x07\x98T\x89z\x8a&\x8a\xa6]\xdeH)\
-KB%\xbb\xc1 \xd0\x9cF\xaa\x1b\xc2F\x86o\xc4\
-#'\xf0J\x1a\xce\xf2\xbd\x8b\x98\x04G\xd99\x1dm\
-\xfc+\x90\xcb\xcb\xca\xd3\xcd\xf5\x7f@\x0b\xdb\x8e0\xf2\
-&\x03(\x0f\xb4\xcb\xe0\xed\x1ds\xff\xc3\x0f\xe8\xd5w\
-\xe4\x03+\xe9\x86?(\xf8\xce\xfe\xec7m\xff\xeb\xe7\
-Q\x10\x10\x80\xc8jS\x83\xf7\xff~a\xee\x82\xb6\xdd\
-\x7f\xff\x8b\x96;\x1f>0\xa7\xc9#E!R\xcf\xe3\
-\xdf{\x0f}\xfa\x82\xfc\xe2e\xc5 \xe3`](&\
-\xbf/\xfd\xc0o3w=\xc9\x87\xfbm\xca#\xebp\
-\xd6i\xfc\xf5\xcf\xe6\x5c\x7f\xea\xd6\x7f\xf4^x=\x0a\
-<\xba\xea\x22\xfc\xc1\xea\xde\xde\x1e\xfa\xf6=\xf3\x1e}\
-!\x9c\xd7L\x91C$\xf4\xa1\xb3\xed\x9f\x7f\xae\xb8k\
-\x7f\xea[?\xf0\xb7\xed\xd4\x8e6\xfd\xd3\xab\x8e\x5c\xf0\
-nC\xa2\xa69\x0f1\x03\xa2\xb3\xe7\xe0\xe6\xfe\x7f?\
-L\xff\xf2\x99\xc2\xf0\xca\xca\xb5D\xec.4\xfa\xe3\xaa\
-mb\xa0iM\x00UE\xec\x82H\x03\x82\x011\x05\
-lK;\xe3A\x88\xf5\x9f\xc7\xd8L\x11\xc8\x91\x81\x86\
-\xed\xe8]\xd0\x90\xef\xdd\xd7\xf2\xf6\xfe\xc0JH,\xb1\
-\xffo\xe0G]\xefH$\x0c0Q\xb80\xcc{&\
-\xf7\xfb\xe7\xe1\x99W\xb2\xbf\xddI\x19\x1f\x0a&\xb8y\
-\xfe\xab\x8b\x5c>\xab,\xf0\x88\x90\x0fa\x0c\xbet\x99\
-~\xe6\xa3=\x19\xce\xbd\xb9\xa7e\xef\xa1f\xd5\xfc\xbc\
-\xb6\xc2\xb2\xd6\xfe\xcf~\xcc\xcdmN}\xfb~\xcaE\
-\x06\x80\x11\xbb\x08\x07\xfb\xc8#\xd7\xae0\x0a\x0d\x227\
-?\xef\xe6g\xe8\xaa\xf7\xf6=\xb7#\xdbW\x8c2>\
-\x01H\x89[\x10\xf6\xe6m\x8a\xd1\xea\xc88\x95F\xe1\
-\xf9Ao\xcf!\xef\xad\xde\xc09\x13WE Rb\
-\x22\xd1\xfe\xbcL\xab\xf2\x13@\x9c(\x8bA\xa3\x85\xbd\
-\xc8x\x5cz\xc7\x8fiM\x00Cd0\x5cK\xa7\xaa\
-\x0c\xc4\xd6\xc4\xea\xe2o\xe5\x5c|:\xb8J\xf6\xf0\xe6\
-\xe0($\xeb\x14\xa9\xe0\x1f\x7f\xeb\xff\xf0\xb1\xb4R\xca\
-\x98X\x08W\x1fj\xa1\x91\x13\xc3l\x05a\xa8\x9e\x87\
-9\x0d\xbd\x9f\xffx\xdb\xd6\xff%\xf1\xca\xa3\xd0H\x22\
-k]Q-Q\x10Ya\xa25\x17\xe8\x1f]\xdcm\
-\xf2\xfc\xf7\xbfY\xf4\xe3\xc7\x5cw/\xac\xa6\x17\xb4d\
-\xd6^b\xd7\x5c\xb2\xff\xf7\xae\x8evG\x0b\xee\xbc?\
-\x8aDT\xd5Z\x13\x11\x9c+\xf9\xf1\xab\x08$\x82d\
-.|W\xcf\xe5\x9d\xe9\xbb7q\xe0)\x01\xb9\x90\xa2\
-\x22T\x14BDPr\x1a\x12\x90~\xe2\xc5\x96\xf5\xbf\
-\xf0\xfa\x22\x97\xf6c\xd5J\x9c\xdd\x8a\x8a.\x0a\xa6]\
-Y\x10-\xe7\x11\xaa~(T\xfaWK\xa1\xf4\xb5\xc2\
-\xb4&\xc0\x18\x1fd\xec\xd9\xab\xa3\x15\xd7\x8b\x11k\xe1\
-\x1c\x1b!E\xde\x1c\xe8K\x1d,\xc270\x96K\xdf\
-+\x11\xab\xc7`H\x18\xa5\x8aj\x1a\xd4\x90\x87\xb3[\
-\x0f\x5c}a\xdb\x0f\x7f\xa5\xd9\x14\xa0\xb0Q\x06)K\
-b\x00\xc9\x17t\xe9\x22\xef\x93+5P\xbd\xfb\xc9\xf4\
-w\x1e\xe2\x5cA\xd3\x81\x06\xc0;=\xfa\x83\xc7LQ\
-\x16\xb5\xb6E;\xdf\x16\xe6\xd8\x994\xce\xe5?\xf0\xdc\
-U\x19\xe4\x94\x8b-\x9e\x5c\xb3*\xff\xf4\x1b\x8d\xaf\xef\
-\x8d2)nN\x8b\x97\x81=T:V\x94\x05\x11\x10\
-\x16D\x8fD\x94+\x92H%\x96\x85\x005<\x9e\xc8\
-\x98I\x01\x81\x88b\x85u\xad\xfc}\x8e\x86iM\x80\
-\xa3\x81h\xd8\xdd\x1c\xb9\xa0\xde(\xd0X\xeeO\xb33\
-L\x5c\xbd7#\xe5\xb8\xb8\x89\x82X\x0d\x04\x81y\xa7\
-\xbbmQ\xe3\xe1\xcf\xac\xecy\xfa\xd5\xf6\x97\xba\xc2\xa6\
-\x86R\xd9,C\x9eSG>\x96\xcd\x8b\x96\xb5\xf7\x1f\
-\xca\x99\xdf\xbc\x9e\xe9\xedw-\xd9\xf8\x1a\xc8\xa4p\xa8\
-\x1f?\xf8\x95qNBW4\x86Y\xc1C\xaa\xf6\xc6\
-^\xdd\xaa\xfd\x85\x06\x83\xb6\xe5'\xed\xfd\xfc\x87\xf5[\
-\xff\x9c\x09Cd\x02P\xa0\x15)\x99)\xf6)#\x9f\
-\xe2\xdc\x89Z\xe5\x00\xad\x95z\x8c\xd3\x0e\xa4`\x05\xf1\
-@\x08A\xd5w\xb5\xeaT\x8c\x19I\x80X\x0a\x19\x09\
-\xc7^3\x14\x04\xd2\x80#\x96\x00j?v^n\xd1\
-\x02O\x05\xcc\x1a{\x015g\x9a\xee~\x82^z\xc7\
-Yp&\xc8\xa5|\xe9\xe7\xc6\xff\xf2\xcf\xde\x97/\x0f\
-\x96\xcd\xd1\xab\xdf\x1fn\xebb\xa7J^\x01\xc4Pc\
-\xadKg\xcd\xb2\xf9y\xdf\xef\xd9\x7f(\xb3\xbf\x9f}\
-\xbf\xb4\xe33q\xbc\xaf\xa7\x91\xb3\x0c\xf6\xbcR\xa2X\
-)\xb9X\xf2\xa0~\x81_x]\xb7\xef\xb2\xff\xea\xf3\
-\xe9\x8b\x96\xf5\x9dw\x8a\xf9\xf5K)\x0b\x87\xb2\x17\x81\
-\x02\xacj4\x03-\x9c\xb3\xa4\xe7\xc6+\x9b\xadF\x86\
-\xe3\xa4UhL\x99gw\xa4~\xbe\x95B7\xbd4\
-\xa1G\x85\x02(\x16]\x0de\xb6\x99G\x00\x05\xd2P\
-\xf6\x14\xa3H\xfa\xc7\xf2\x05\x8a\xef\xb6\x01+\xa2\xdc\xa9\
-\x8b2\x8b\x97\xaaR\xa8%9\xd5\xa6\x9a\xbd'^I\
-\xbf\xbc\x1bP2\xc6\x81\xbc\x06\xc6\x9e#\xfa7\xbf\xc8\
-\xfe\xb7?\xee\xbb\xba3\xff\xf4k\x8b\x1e}\xf1`\xc1\
-\x05F\x8b\x86\x9c\x02\x9e\xa1l`\xe08\xea\xa7\xa8\xc0\
-Lb\x05\xacX\xfdn\xd7\xb9T\x8b*\x91\xd5l\x1a\
-o\xec5\xbf|\xcetG$\xca @]\xa5\xc3\x86\
-\x00\x9f{\x5c\xf0_\x1f\xd3\xf9Kq\xe5\xfb37\xfe\
-\x9e\xedz\xc3\xf6\x15\x0a%\x93\x04\x88\xa0\xa2\x5c$\x0b\
-\x91\x93\xe7\xe8\xbcE\xaa^\xa1T\xdaH%\xd5\xc4\xce\
-\xc3\x83\xcf\xa7\xc6\x9f(`b\xa1\x04&-\xb9Y\x95\
-\x9e\x18\x97\xdc{\xc5C\xcam\xd9\xedY\xa9\xd9:0\
-\xf3\x08\x80\xb8\xd3<&\x81g\x08\xb8\x94\x00\xbd\xa1a\
-\xd3\xe3\xd9_nc5\x19\x02DU \x9eI=\xbb\
-\x8b\x84\x94\x09N\x00\x14\x89#F\xf0|W\xf0\xe4\x8e\
-\xc6\x0f\x9e^\xf8\xc4\x8a\x9eW\xf7r.\x9fAS\xbf\
-\x22\x22\xb0\xa8:\xeb\x81}\x93\x81\x09\x00\xc0\x0a\xd2\xea\
-]\xfc\xeeh\xf5\xc7\x8f\xc0\xb2\xe9\x89\xd0\x1a\xbd\xf8B\
-\xcbo^j\xdcw\x04F\x09\x83\xd5\x7fL\x04R_\
-\xb4P\xf46ln\xbc\xe8\xf4\xbd\xa7/\xe5?\xfbd\
-\xfb\x8b/3\xb4\xb7\xe4\x00\x05\x22RC\x05x\xba\xed\
-\xf5\xe0'\x9bS\x05\xa5\x868\xed,40\xbc\xeb\x80\
-_t4\xad\xa6\xff\xd8}\xb1,\xaeV2\x99U\xd2\
-G0(\xca\xdbZ*\xaef$\x01J\x22P\xd2\x85\
-\x93\xa0D\x96\x9c \x95y\xfe\x80\xb9{\x0b\xb3\xf1c\
-OF\x02T5\x93\x12\xdf\x80\xa0N|Q\x01[&\
-\x1c\xee\x93\xf5\xff\xe2\x9f\xf9E{\xf1\xfb\xf7\x16\xdd\xbc\
-9~_\xa4\xe2@\x1eS\x18\xca\xab{5*zs\
-Z\xa4%k\xc3\x10\x8d\x19Xu\xff\xf4\xdb`\xc7\xae\
-\x16?\x92\x8f\x9c\x87\xa5\xef\xea\xee?\xa8\x91TE\xac\
-\x0cR\x8a(\xe2\xf0t\xe83\xaf\xe3\x9f\xb6\xb6}\xee\
-C\x87.>\xbbwY[+\xfa\xbb!\xa5\xb8q%\
-\xf5\xc8\x02\xdeK\x07\x1a\x1fx\x91\xfa\xf3^\xda\xf7\xb5\
-\xec;\xeb{\x9a\xf2\xa7]\x9a\x03\x82\xf2\x08\xb3Ul\
-\xcbv\xd0\xc1\xb1\xf2S\x8e\x19I\x80\xf1\x81\x14Pb\
-\x85\x05w\xfb\xe9\x96L\xa61 \xad\xf6t(3K\
-\xd4\xa5\xd5ea\x8b\x0a\xf6\x0d\xde:\x88\x1f\xfd6\xf8\
-\xb3+\x82\xdf;\xff0\xa4\x90\xeb\xf3\x04l\x8c\x16C\
-\xddy\xc8\xdf[l>\xb9\xb9\xfb\xbc\x05\xfd\x9b_i\
-\x14Q\xcf\xd7\xc7_\xc6\xcf\xb70\x14\xa7\x9e\xd9\xb4\xd4\
-?\x04\x8db\xdd\x0fW\x82\xd0\x87(\x06\x09\x9eQ\x11\
-\xdc\xf3X\xe6=\x8bR\x9d\x1d\x87[N\xdb\x0b\x1bg\
-[V\x10Yg\x22!\xa8k\x0d\x5cS\xcaSE\x83\
-?\xb0\x90\x94\xbc\xc5\xa7\xd5>X\x89\x08\xccB\xc3\x0c\
-\x97\x0aU%\x22\x84\x96Gu\x04\x9f|L\xb7\xf9b\
-\x8a\xa0\xc4\x8a\x14BN9\x0d\x88\x88\xc1\xac\x86\x95\x19\
-\xcc\xf0\x18P(\xc8\xc0rPp\xec\xc7\x8f\xca\xa9\xfc\
-\xe2\x19\xff\xe9\x97\x9a\x91.\x22\xf2U=Q\x03 \x9d\
-\xa2=\x07\xe5\xa1g}g\xcd\xa7/\xc8_~\x9eU\
-\xc0Z4\x07X\xd0N\xe7.\xf3;\x1a\xfa@.\x08\
-4\xd6\x1d9\x8d\xbd\x02L\xe5\xb1\xabP)\x0a\x9a(\
-\xf0u\xef\x11\xf7\x0fOi(@h\xcb\x1b`\x85\xc2\
-\x90\x18R\x18\x84\xe2@bX\xe3n\x1b\x82a\xf5i\
-\xcc\xc1\xb5\xb1W\xd2\xc4\xbcF\x9a\xc8\xe3\x81\x1d\x0c\xf1\
-PR \x0ek\x85B8\xb2uCX\x12\x94-)\
-\xa0\x92#C\xb9>\xd5\xb1\x84#%%\x9f\xd5K\x11\
-\x8a\xa9\xf3\x17#\xbf\xbaPT\x17\x9bc\x9cz\x041\
-\xecmx\xda;\xd8\xafN\x03'&\xcd\x04b\x82z\
-\x1e\xbdsH\xeeyZ\xcf\xebH\xa7}EA\xe2\x92\
-\x0f\xe9\x00\xbd9w\xeff\xff\xf4\x8e\xd6\x0fu\xee\xff\
-\x0f\x9f\xee?oi\xe33\xaf\x09q\xb4\xe2$\xf9\xd0\
-\xb9X\x92\xcd\x87\x91\xdf\x95k\x08-H\xe1<%#\
-~\xc1\xf7|\xabj4\x0e\xf1$%\x9fI\x85\x09\x06\
-\xbay\xa7\xf9\xd5+\xad\x97\x9f\x1b\xc2\x0b\x83\xb4\xf3\x8c\
-s\xce\xf7<\xf1}\x81\xf5O\xed\x08?u!Y\xa7\
-)\xdf\x91\x92B!\xc86\xa56m7\xcf\xbd\x06s\
-|O5\x8e\xab\xechS\x9f\x9d\x8cX\xfbi\xe0>\
-\xeb\x881IT2F\x12X\x0e\xe5\x83\xae}J\x83\
-\xd3\xdc)`H2\xbexqj\x95Rf-\x85\x18\
-1\xaa\x86}\x8bbTKg\x88\x99K\x80!(?\
-\xa7\xe3;T\x85-\x0c\xac\x9e\xb9<:s\xa5+%\
-> \x00\x1e\x8c\x85d\xb7\xbc\xc2;\xf6r\x8a\x95\x03\
-cM)\xd9\x01\x01\x81\xa7O\xbc\xe0\xfd\xf2\xf4\xa6\x8f\
-\xae:\xa8\xc5\xb4\xc7P\x15U\xce\xa6\xe9\xad\xee\xe8\xdb\
-?\x0b\x8e\x14N\xba`E\xf75\x1f9|\xcdU>\
-TPp\xe1a\xed:\xdc\xb4\xf1\xc9\xa6\x7fx\xca\x1e\
-\xec\x17c\xb4\x99M\x84\xb4\xf1\xe0{V5MP\xdf\
-\xf3\x9c\x1f\x84\xca>\xa9\x80|\x0f\x87\xfa\xdc\xddOz\
-\x9d\x8b[\x17-\xee\xd6\x94\xcf\xccPe\xa0\xa8))\
-\xd29K\xdd9\xe7\x86\xa5:E\xf1o\x8f\x14K(\
-\xfc\x81\xff\xcc+\x86\xf4\xd8\xeee\xa2(FX\xf5.\
-\xfd\xf7\x9f\xc9{\x99<\x8an\xe0\x06Vj3\x11J\
-i\x97*\x01]\x15%\xfe\x00a\x18\xe2!c\x9fz\
-i\xdeW\xee\x10\x0e\xb8\xda=V\x14\xc6 \x138S\
-m\x9a\xa4\x92\x06@\x89\x00-D\xa6\x86\x0c8\x01\x08\
-P\x19\xfa\xc7{\x17S)y\xe7\x08\xff\xf3\x93M\x8b\
-\xe7d\x8a\x91\x85s\x80#\x94\x5c\xa3=\xce\x1c\xccg\
-\xf6\xf4D\x99\x00\xbb\x0e\xc8O\x9fl\x84I\x1d\xc9)\
-\xb1\x00\x88\x93\x9b\xff\xed\xaf\x83\xae\x83s3~\xfa\xf9\
-.\xd3\x10\x84\xf1\x95\xb3i~s\x7f\xf4\x17?\xa6\xf7\
-\x9f:\xe7\xbd\xcb\xa3\xf66\xebA\xfbs\xfe\x1b{\xf9\
-\xe9W\xf5\x95=E?E\x81\x07\x12t\x1d\xf4\xef\xda\
-8\x1fDo\xed/\xfaF\x14\xfa\xcc\x9b^\xea\xb1\xb9\
-\x9bwy\x0d\xe90\xfeE)\x1f\xdb\xdf\xb6\xff\xe9n\
-\xff\xf2\xf7.\xda\x9b\xe3\x9e~i\xca\xb8\xd0\x99\x07^\
-h;\xd0\x0bF^D\x00\x05\xc5e\x8b\x94\x00?\x08\
-\x9e~\xc1\xb09\xdeL\xcbD$E)\x1e\x0c\xbdl\
-A\xa3An\xf9\x95\x11I\xe4\x06\xbf\xad\x1c\x01\x00`\
-+\xc4l\x1d\x04\xbe-:\x0c\x8d\xcbW\x013\xd2>\
-\x0c\xb9\xc1j\xaf\xd8S\xda\x81\xa9\x10\x19\xd4n\xe7r\
-\x02\x10\xa0\x1a\x83\x1d\x0cFA:\xa0CG\xf4;\x0f\
-E\x05\xc7\x8c\x00\x83\x1f\xaa\x02\x1e\xdb\xf6fj\xcc`\
-\xc7^\xdc\xf2\x93\x14\xe0\xe6\xb5\xa0\xa2&\xf2\x0d^\xdf\
-'\xdf~\xdd\x88\x16[2\xda\xd8\xc0RJ*\xa5\xd9\
-\x80\x22\xc1#\xaf\xb8_l\xe3\x14\x05\x86\x11\x0a\x094\
-\x93\xa6\x86\x86\xd2\xe8\xf1\x18o\x1c\x8a\xfe\xdb\xcf\x01\xa0\
-=K\xbe\x07\x05=\xbe-\xfa\xf9\x16jL\xd9\xd6&\
-\x8e\x93\x0e\xc5I\xcf7\xef\xd0_\xbe\xa0>\xcb\x9c&\
-\xb4f\x11\x09=\xf4\xbc\xbd\xef\xb7P\xa4\x86\xffPQ\
-\x99\x93E63\x86\xc2\x8b\x96%\x84\xcbF\xec,\xa8\
-\x5c\x11i \x80\xa5<\xd1\x13\x95\xdd9\x87l\xdc\x99\
-\x95\x18Jl\x9d\xc4\xa9U\xab\xbe\x8d7/\x86M&\
-\xc3\xa6\xe4\xbf;\xa0\x01#eb\x0b6\x85\x88k\x18\
-\xc8z\x02\x11@UA$\xc7\xbe\x91\x220\x86\xe6\xb5\
-\x82FY7\xe2\x9d\x84\x08R\xbev\xb4\x0f\x9a\x02\xe3\
-o\x1b|4\xb4\x95D\x04\xa9\xda\xfc\xc5\xb9!\xda\xb2\
-P\xc0\x09\xa0\xc8\x9a\x92\x0d\xa8ZW\x93\xf2hak\
-\xdc\xe5\xd2\xe7\xcdYj\xce\x02q\xab2\x88\xd0\xd4\x80\
-\xe6\x86R\x7f\xac\x80\x80\xd6,\xb5f\x81\x81\x0a\xec#\
-\xf4\xfc\xb8\xa0\x00\x81DY\x00O\x10\xbb@\xc5\xc3\xbd\
-*\x8b\x05\x97\x8f\xe5R\xa1\xf7j\x90\x12\x83=r\x00\
-\xe2j\x91C\x12\xa4\xc3\xa9\xfa>\xb75\xc0\x8f\xc5\x9e\
-r@d\xbcw\x88\xfb\x90+\x8aj\xcd\xc2\xc2f*\
-\x01\xb4T\x81\xb9,\x98\x02\xea\xc8y\xcc*\xa1:9\
-\x0e\xf5\x96\xeaq\xcd9#\x8e\xa7\xc1[\xc1\x91\x9b\x18\
-*\xbb\xc2\x1f\xc7iG\x1b\xb5\xc3;Y9r\xbc\x13\
-&\x01\x80\xb5\xc6YSR\xcb\x8cnB\xae\xdc\xe5\xa1\
-VvUu\x8eT i\xd2\x94\x92\x0c\xca\x01C\xb0\
-B\xcd\x9e\x9e\xdc\xa2\x9e\x0f\x84\xe5\x15&v}\x82@\
-\x0d\x18y{<\x8fk\xb20S\x09\x00\xa0\xeaq(\
-\x00eC\x10U\x97WSp\xa5\x10\xec\x89YV\xa9\
-l\x8a=\xf1@\x0a\xb6 \xa1A\xc9\x8bF?|\xe8\
-\x07J\xea\x00)\x19W\x86}\xed\x9c\x06>75\x05\
-048\xed\x8b\x02Bj\x8a\xd6+\xda\xa1\xb5\x94\xa7\
-\x123\x97\x00\xc3$`#\xac\x0e\xe2\xc1\xa6\xc2\xc8\xe4\
-\xc3\x88\xa8J\x1a>\x8a\x909\xa2\x02i\xb02\x8f\x8d\
-\x06cJ\xbb9\x930\xfcg\xe9\xd0\xcf\x87}0\xf0\
-\x0d\x11\xe9\x88w\xb0|v\x22x\x00k\xa5BL,\
-~\x11`\x0c\xed;\x92.\xd8\xda\x95\xc9\x9e\x0e\x04 \
-\xc2\xa0\x09\x96\x06\x7f5b\x938}\xe5`\xb3g)\
-\x0a@\xcd\xfc\xc6\xc2\x85\xa7\xf9\xbb\x9a\xd1\xe0Wer\
-&\x1d5F ^~c\xa7\xb2J\x89$\xaexn\
-i\xc1\x99\xd7\xf6po\xbfK\xa7\xc835\x0e\xe1\x9b\
-*h\xc9u'\xceBIT*\x944\x82\x86\xa9b\
-\x1f\xe0\xa1{\x84X\xa3@\xce3!X+\x99\xec\xcb\
-\x16k\x05qdgqHd|\xe7D\x08BD\x9e\
-\x10H]\xa9\xf4\x1a\x01\x04\x01\x0fKJ\x8fx\xa35\
-<\x8d\x9a\x895@\xea\x16\xb6\xf6\xfc\xe9\x95\xd2o\xd9\
-\x90\xabH\x9d\x90Q\x9d\xe7\x88b\x0f \x94*<T\
-\xf9\xa60\x0c@\x05\x92\x17^l\xb8\xfb\xc9\x86W\xde\
-v\xec\xa11\xadRS\xf7\x95\xc9\x86\xc2#5\x8a\x90\
-|\x87\xacW\xaa\xc3 \x01\x22Ah\x87\xc9\xeb\xa5\xdd\
-4\xe0\xe2\xa4\x9f\xd5 P6\x90t*B\xd5\xee\x98\
-@BP2P\xea-\x18\x91Z\x86\x84\xd5t\x05 \
-\x00\x94+\x00\x05)\xdfU\x82\x10L\xb9\xe0I\xa9D\
-\xdd\xd0\xdb\xe38V\xcb\x95\xb3\xb9\x96\x16h\x01\x14l\
-\x8d`Q\xe3\x11\x94*\x16U\xf6\x8c\xa3\xdf\xe5\xa1\xeb\
-{Y\x1bJ\x008\xae\x11\xb1\xfc\xfd\xee\xf4\xc5\xfe\x8f\
-7\xdaG\xb7\x06\x07\x8fPk\xa3\xd2Dm0\xa6\x1d\
-T\xc1\xd0\x00\xac\xfda\xba\xab\xbb\xe1\x9d}^\xa4a\
-\x14\xa6\xde\xb5 :}\xe1!rR\xaaMU\x0a\xce\
-\x89K\xe8YQ+\x92\xae\xd6M\x89\x82\x89\xdb\xb2\x9a\
-\xf6#D \xe5\x92\x13\xa8\x00,B\x01\x8cv\x1d4\
-EG#j\xb4\xa6\x065\x16\x81\x08\xb0\x8e\x10\x11\xc8\
-R<\x7f\x94\x06\x22\x03`R\xc3\x16\x83\x13G\x1a\x83\
-\xee#\xb0$ \x89\xe7\xfd\xf2\xed\xab\x1a\xeb\xbd2\xa4\
-`\xe1X,-\x03GJ\xfc\xc0l\x86\x1b\x8a\x9d\xa7\
-\xecY\xf4I\xff\xbc%s\xfenc\xb0c\x8fki\
-\xd0\xc0\xc3\xa8\x0e\x043\x19\x0c+,\x9c\xe2\xd7v6\
-\xfe\xf5/3\xaf\xee%\xe2\xa0\xb7\x8f\xae\xbb$\xb5\xae\
-\xa3\xdfw9\x0c\x0d\xd4\xa6\xb2\x5c3\xe8&\x8b\xc0x\
-\x98\xdbJY\x02l\xd5\x97\x04\x06\x8c84x\xaf\xef\
-\xd1b8\x8b}\x81\x14j\x90\x025\x80zTUI\
-\x99U\x89T\xd9@\x89<\xa5\xd4\x10m\xbdGxc\
-\xbf\xec/\xb4.l8T*\xbd9h\x83K\xa0X\
-\x07Y\x11\xed1F\x02\x0c\xf4\x8e\xd5\x00\x9eM\x87P\
-\xcb\x07\xbd\xf9~\xfa\xda\x0f\x1c>\xed\xa4\xe0\x9e'\xd2\
-\x0fn\xf1C\x8bl\xea\xe8\x1a\xd1\x19\x08%\x05\x84\x84\
-\xbd\xa8\xcf\x16\xde\xec\xf1\x0f\xf4S`\xa8;\xa7\xfdy\
-\x07u#\xddI\x05\xc51\x0d\xd5\x83\x1c*dX\xe7\
-6\x15\x1b=\x85\xf0@\xa06)\xc0\xc6*2\xbc\xff\
-\x08\x85\xb6\x96\x91\x9c\xb5\xf4\x06\x8d\xd3I\xed;\xc4\x07\
-\x0f\x19d\x8cJ\x10\xeb\xc6\x94\x94\x84\xc1\xf4v\x0f\xbd\
-\xbe\x8f\x00\xad\xf6l1\x8c\xfe\x906\xbf\xd2`\x95A\
-\xee8\x9c t\x8c\xaf\xaa\x87H\x0arF\x84U\xc5\
-\x18\x1b9\xca\xe7\xce?\xb9\xef\xc6\xab\xfao\xb8\x0a\x0b\
-[\xa8'G\xa1\x1db\x00\x9d\xe1PH\x9c\x95\xd5\xaa\
-a\xdb\x98\xd6\xc64\xc5\xff\xa6\xfc\x90\xe2\x02\x92CA\
-\xb1\xca\xffH\x9er!r!\xf2!\xf2!\xfa\x0a\x88\
-\xac\xb67\x87A\x0a\x90j\x11\xb3TG\xc3\xe5\xa8;\
-\xc72\x82\x90;u\xa8\xf1&\x98I_\xdc\xed\xfey\
-\x9b\xbf\xf6\xa3\xbe\x17z\xce\x85N\xd8\x97\x14584\
-\xfa\xcf?\x17l{\xdb\xc5I\x81\x06\xb4D\x04\xcf\xe8\
-\xbfl\xd6\x8b\xceH\x9f\xb1\xc0Q?\x94\x89\xa8\x14w\
-]6\x91V\x0c\xa5T\x16\x91\x86\xee\xceFDy\x9d\
-\x8e\x8d>\xf1\xea!\xa4\x06b\x94\x8a\xe4\x87j\x99\x9c\
-\x9d\xeb\xe7\xfe\xf8\x22w\xe6\x92\x96\xff\xf3\xa8\xbf\xe9e\
-\x849\xa4\x02\x0d|\x9c\x08\x9b\xe3\xb8\x0c\x83\x12\x00\x83\
-\xb8\x5cA\x9c\xdbG\xcb\xf9fbs1\xe2\xbbE \
-%\xa5\x10\xed^\xe1}\xa7\xfb9\xeb\x05\x9e*\x14\x8a\
-bH\xa7\xcc\xa7s\x97\x18\xc0\xc1\x0dT\x82%\x905\
-\xe2A\xfb\x0f\xf9\xfd\xc5\x1a;\xe4\xd7X\x042\x06\xfd\
-\x91\xde\xf3\xa4\xbf\xb0\xa5\xe5\xf2\xce~\xc3l\x98aE\
-}\xf3\xd4\xabMw\xfd:\xd5\x97\xd7\xc6\xf4\xd0\x19\xde\
-gtu\xeb\xdf=\xd1\xfao>\xdexr\xe3\x1e:\
-b\x1c\x02\xa2\x90@*\x0c\x12\x90(W\x16\xeb\xe1\xf3\
-\xf3Q\x8c\x02\x1aOU\x5c]\x13\x97\x1c@, *\
-\x87\xf7E\xceh\xee\xfdK\xc2\xc5\x9f\xcelyy\xce\
-\x8f\x7fM\xcf\xbca\x1bR\xc8\xa6f\xfe\xae\x80\xa0J\
-\xac\x0a\x8e\x93P\x0c\xcc\xcf\x01\x95m\xb8U\x06\xf8\xd2\
-\xfb\x10\xa7\xb6\xe6\xfe\xcb\x175\x84\xcf\xa54\x88\xac\x86\
-\xb2\x14\xcdak\x8bjh`\x12S\x80\x1c!\xe5\xba\
-v\xe3H\xce`$\xdd\xea\x94\xa1\xf6\x9b\xe0\xc0`\x7f\
-\x0f\xdd~\x7fj\xf3\xab|\xc1\xf2\xc6\xf9s\xdd\xee\x83\
-\xf2\xd4\x8b\xc1\xe6\xd7\xfc\xfd=\xc8\xa6F(?\xcb\x0c\
-\xcf\xa3_>\xc3\xbd\xf9\xf4\x9f}t\xce\x8aS{M\
-\x7f\x11\x05\x11\xab\x0a\x8e}\xaeLH\x83\x94D\x83n\
-ru\xd57\x0c\x22C\x1c\xbe\x0dCj\x00\x86'0\
-6>\xa6*\x01\x09\x81H\x1d4\xa7\x8b\xb8\xf8{+\
-\xf7\xbc\xeb\xf4\x86\x1f\xff*\xbb\xe1\xb7z\xb0\x0f\xad\xd9\
-\x99/\x0dQY\xb3P^Dc\x15q\x7fHQ\x88\
-\xe1\xf6@\x02@\x94\xf6qJ*\x0f\xce\x97\x9e\x96\x12\
-\xe0C\x9dZqL*\x95\x07\xa0\x042Q\x0a\x0d\xfa\
-\xec[\xe8>R\xcb\x0ay\xa89\x01\x00\x10\xc1\xf7p\
-\xa8_\x7f\xb6\xc5\xfb\xd5\xef(\xf0P\xb4\xc8\x15\x01\xd5\
-\xb4\x0f\xe6\x91\x0d%\x86a\xc5\xfd\xfaw\xae\xaf\xa7\xe9\
-\xaa\x0f\xf9\xab\x96\x1eY\xd4\xac\xdc*P[\x1a\xdf\x1a\
-k*\xaa\x1e\xe3\x00x\x90/Y\xf57\xb1US\x18\
-\xf0 E\xf4Z\x14\xb9\x14\xc31ph\xc9\x90\xa9\x8c\
-\xa2\x10\x87\xf6\x8c\xd6\xde\x1b.\x8f\xde\xb3\xa4\xe5\x07\x8f\
-\x04\xdb\xbb\xa2\xd6\xac\x06\x1e\xcd\xe4\xa5`\x84!\xe9\x19\
-}\xe7\x88\xdf\xd7\xe7e\x9a\x0b\x90\x8a\x16\xa8|+T\
-IY\xf3TQ[\x0b\xc1\x19\xcb\xaaF\xd5\xc4;\xeb\
-\xd2\x84D\x0a\x22\xaf\x88\xb0q\xfb\xfe\xa6\xfe\xe2\xd0\xb4\
-\xdbS\x8c\xda\x13\x00\xf1:\xe0\xc1\x09rE\xed\xcb\x83\
-\x18^9\xed\xf8Q\xcc\x84\x9e\x07&\xbc\xf0\xb6\xddu\
-_\xf0\xf3Em\xcb\x16\xb8\x93\x17R\xcasL\x96\xe3\
-\x81L\x18(\x7f;x\x98\x8fJ\x80\x92u\x8eU5\
-\xe3e\xce:YOi8\x08'\x80\x0f(`\xe3\xa2\
-\xd0 R0I`PD\xe4KN[R\xc5+\xde\
-{h\xf9I\xe9\x1f?\xd6\xf4\x8bg\xd0\xe7lc\x9a\
-f\xec\x96@\xab\xa8^\xfa\x87\xa19\x9b\xb6\xea\x95\xbf\
-\x17\xc5\x80\x1f\x7fyy\x1c\x88\xfde0\xa9\x81\x0a\xc7\
-\x1f\xf0\xc0\x0cB\x104\xe8\xa6W\x1a^~\xdb\x07E\
-\xb3}\x05\xa8\xe0(E\xb8F\x03\x1b\xf8\x8c\xbe\x82l\
-}\x9d^|\xd3\x04>{d\x80\xa0J\xc6?\xba\x03\
-\xd0Q\xa0\x00\x9d2_>w\xc9\x82\x8bW\x1cBA\
-\x11\xbb\xac(C\x8dx\xa1(\x1b\x15\x8f\x04\x12\xc2\xb0\
-\x88\x9a\xbc]\xd1\xd6\xfb\x7f\xad)\x9e\xb3l\xee\xff~\
-\xc8\xdf}\xc0f\xd3\xf0j\x9b\xfa51\x14\xd0\xd8u\
-\xa1\xb4\x84\xa6|\xeczG\x9f\xdb\x9d]\xd8T \xb1\
-j\xc8\x11\x99\x92\xf6\xbfd\x87\xa9\xb6g\x11\x00\xa7\x00\
-\x95\xeb\xcc\x13@\xc2P\x85a\x11i\xfc\xd5\xab\x99\xb7\
-\x0eX\x1e=\x89\xe5\xd4`\x1a\x11 \x19\xe2Bq\xaa\
-*@\xbex\xfcS\xee\xb1\xef\xbbB\x7f\xf7&\xfd\xd7\
-{\x837\xde?\xff\xda\xd5\x87\xd2A\x11\xf9TDE\
-!\xdfS\xcf\xa8-%\xa5b\xc43\x9f*\xa8\x90m\
-4\xf6\xea\xce\xfd\xe7\x9c\xd4\xfcw\x8f\xfa\x0fn\xd5\xfe\
-\x08\x0d\xa9c^j\x06\xc07\xb4\xbf/\xdc\xb97\xeb\
-\xce)\x10\x8eX\x9b\x0d\x5c\x9e\xe0\xaa\x1d|\x00\x0c\xda\
-Y\xb1-\x7fBB\x1e\xa0,\x0e\xe4\xd0\x10<\xf8\xdc\
-\x9cG\xb7\x8a\xaa\x8cVWo\xca`\xda\xda\xdaj\xdc\
-\x85\x89@\xa9\x86*O\xf0\x8b\x08\x85\x08\xcf\xed\xc2\xef\
-veZZ\xd2\x8b\xe7\xf7\x1ac\xe1\x14H\x99\xd2$\
-9\xa0\xda#!%\x12\x12v\x85\xb9\xd9\xc2\x05g\xa3\
-\xbd\x99w\xed\xa3\x03G\x88\xb9\xc6[\xbd\xe1P\xc0)\
-\x9d6O.zW!\x93\x8aT\x98\x06\xe4\x1e\x22%\
-\xf2\xdd;\x87\x82_\xbf\x9a\xee\xcd\x95\x92my\x1e^\
-\xdd\xed\xda\xe6\xa4\x97\xcf\xcf\xfb\xa1(\x13\xe8(\x1e&\
-\xa8\xb2?\xaa\xb0\xa3B\x86\x84\xd1\x22\x9b^\x9f\xf3?\
-~\xee\xef\xeb\x11\x7f\x1aL\xbf'\x08\x01&\x091\xaf\
-T\xf1V7\xb6\xbeF\x0dA\xd3\x82\x05~\x83\x9f\xa7\
-\x22;C\xc4\x96\x84K\xf62e\xa8\x81\x09\xc5\xb3\x82\
-\x94:/@n\xc5i\xb9\xb3\x16K_!\xd3\xb5\x8f\
-C'\x9e\x99F$(\x13\xc0]\xf4\xae|&eE\
-\x88\xcb5\x8c\x14D\xca\x14\xb8\xdd\x07\x83'\xaa\x08\xc0\
-\x84\xa2\xa5\xb7\xf7\xa3\xbd%}\xda\xa2\x1c\xb1CD\x04\
-)\x9b^P\xce\xc8QV<\x94\xddiU\x84\x1dS\
-\x03\xa3\x99\x1e{\xb5\xf1;\x1b\x1a^\xdf\x0b\xcfL\x8b\
-T\xbeu\x02\x1c\x1bD Fo\x9e\x9ex\x85^\xdf\
-\x9bY\xd8\xee-\xec\x88(\x0a\xc5\xa6\xc8\x88\x92\x94\xdc\
-\x00\xd8\x01d\xa2\x80T\xc9\x84$lr\xb4\xb0]>\
-p\xa6kj\xf4^{;8\xdc/\xfe\xb4\x09*\x88\
-\x09\xb0l>.ZV\xc8\xa4\xec\xe0\x15\x00\x04\x22\xdf\
-\xbd\xd3\x1d<\xf1Z\xa67\xcf\x95\xe5\xcbc\x1c<\x82\
-\xd7\xf6\x04y\x13\xbck\x81\x04\xf3\x0d\x02\x874\x90Q\
-d\x804#e\x90\x22\xa4\x18iBF\x91Rd\x88\
-Z\x0d\x82\xd4;G\xf8\xee\xdf\xb6|\xef\xc1\xcc\x9b\x07\
-\xd4\x9b65l\xa6\xc1\x224\x13@\x80\xef\xc1\x89>\
-\xba-zco\xe6\xda\x0f\xf2G\xcf\x8e\xe6\xa4\x8a\x1a\
-:e\x22\x88\xc0PI\xd9g\x99\x14\x8e\x00\xa8\xc7\x94\
-\xd7&\xaf\xe7\xb3\x1f\xca\x9f}\xda\x9c\x1f<\x90\xfe\xed\
-+RJ\xbf^k\xa8\xc29\xca\xb9l\xd1D0\x91\
-\x09\x19,@\xec\x87\xcb\x80\x94\x146\x83\xf7J\x0ax\
-\x1ev\xed\xb7\xdf\xdb`\xb6\xbe\xd4\xfe\xee\xd3\x5cGk\
-\x98NY*\x1d\x1e\xfbe\xc5i\x8a\xe0T}Rk\
-\xcd\xc1B\xea\xf5\xfd\xfc\xfcN\xbc\xfa\x0e)$\x98N\
-\x83n:\xf5e\xda\xc30\xd2>\xbd\xd9\xadw\xfcK\
-\xb0\xf5u\xfe\xd2'\xec\xc9\x8d\x9e\xd7[\xd4\x00\xc2L\
-\x02\x03;\x90\xf6\x15\xa08\x9a\xc4z|X\xdf;\xbf\
-\xfb\xb4\xcf5\xfdlS\xea\xa5\xd7}\xe74\xae\xefW\
-r\x87\x1aA\x13r\x5cJ\xaa\x04?!\x9ewI)\
-R\xb1V\xdf\xbb8\xdf\x1c\x14\xe0\x06_Q\xcbv\x92\
-8\xc8h\x98*\xda\xf7\x10\x09m|E~\xf3*5\
-\xa4\xd31\x9f\xa9\xd4\xab\x01so)\xef\x8f\xa2h9\
-\x17\xa9B\x03o\xda\xed\x85\xea\x04\x18\x1b\x88\x90\xf2a\
-\x05\xbf\xfa\x9dy\xe5\x9d\xd6O}\xd0|\xe4\xac\x9e\xb9\
-^\x8f\xe7BPE\xd7M\x15\xc5\x1fT\x95@\xf0q\
-DZ\x83\x9e?\xfe\x80g/\x0aT\xa5*\x15\xd7\xd4\
-\xba\x82QE4w\x0a\x8f\x8b\xa0|^\xc1\xa5t\x1a\
-q%/\x22(!6A\x8e\xa2W\x8bu\xd6\xa2\xe8\
-\x0fu 6i\x88\xcfU\xf9O\x86\x04\xfet\x91\xfd\
-\x86\xa0N\x80$0\x0c\x05u\x1d\xd0;\xees\x8f\xbe\
-\xd0\xf2\xa9U\x0d\x1f<\xb57\xeb\xe7(rZm\xf2\
-\xd1\xf2\x88\xe0P=!\x9bB\xaf\xf1\xa8\xa0\xc6U\xcf\
-\x84S\xefQ]\xf1qrj\xc4K\x93\x86\xa4\x0e\xc4\
-P*\x99\xbdI!\xb1\x8a\x97\x8e\xe2:5\xb0o\x98\
-\xb1\xa8\x13 !\xe2]\x81\xa8n~9\xda\xf1\x96y\
-\xed\xc2\xb6\xdf?\x9f\x164\xe4=\x11\x15\x8d\xd3\xde@\
-\x18\x80\xb2\x00D\xc2\xe0\x02X\x15\x1e\xc1\xa0\xaa*J\
-\xc5_ij\xbb\xcf`\xe7\xa1\x081\x8a\x81ZK\x0a\
-P\xbc\x831\xc8\x15\xa9h\x8f\xe9m>\xb3Q\xd7\x02\
-\x8d\x0bDH\xf9t\xa4\xa0[v\xba\x97\xdeih\xcc\
-\xa6OZ\x10\xfa\xc6\xa9#a\x16(Q\x89\x0de\x8b\
-0\xd1\xb0\x9d%PUFq\xea^\xe5\xb2\xd5T\xd2\
-\xf6\xc6\x9f\x13\xd4\xb1a\x09(\xcb\x0f<\xdf\xb0\xe9\xb5\
-\x94\xea\x0c\xaa\xb94f\xd4W\x80\xf1B\x15\xd9\x14B\
-\xcb[^\xd6=\x07\xcc\xae\xbd\xf3>zn\xf1\xe4\xe6\
-\x1e\xa3\xce\x1au\x04/\xf2 \x04S\x09%\x91\xe9\x22\
-6\x10\x86K0J\x0a\xa4\xc9\xf3r}\xf2\xca\xde\x86\
-\x82%\x9f\xeb+@\x1dG\x85\x02\xcc\x08\x02\x1c\xee\xc7\
-3;\xcc\xce}A{\x93Y4'\xf2\xc9r\x94\x16\
-\x108\x1a\xbc7\x9c>\xaf\xe1`\xa3\x112\xf2OO\
-7ox\xdaDV\x8d\x99.\x84\x9d\x0c\xd4\x090a\
-  \xf0\xa1*o\xec\x93g_\x0fL\xd0\xb4\xa0\x1d\
-\x8d&\x22\xcf9\x12\x92ib\xf9\x19\x01\x1a;\x81k\
-\xec\xda\xa0h\xa17\xf65\xfd\xaf_6\xee:\xa0\x81\
-?\xed\x14\x97\x13\x0b:\xf5\xd4Sk\xdd\x87\x13\x0a\xb1\
-\xc6\xa4\xbfH\x86\xe9\xc23\xddg/\xcc\xad\x5c\x9a\xf3\
-(\x84-\xab\x17\x81\x1a\x97\xc5\x1a\x0a\x02)\x84!\x84\
-@\x1c\xf1[=\xad\xdfy\xa0\xf1\xc1\xe7\x9doPs\
-g\xb5\xc9F\x9d\x00\x93\x02\x22D\x0e}y=m~\
-p\xed\xc5\xe1G\xce\xea\x99\xdbV \xd2R,\xce\xe8\
-\x8a\xc5)\xeb`\xb9\x0f\xa5 \x158\xab\x8c\xc3\xb9\xc6\
-'\xb6\xa7\xee{*\xf5\xfc.\x0d<\xf1M\xad\x9d\x95\
-'\x1fu\x02L\x22\x88\xd1\xdb\xaf\x81\xcf\x1f:\x9b\xce\
-9%\xf4\x10\xd7\xb4PB\x8dK\xf9\xca@\x07\xe2b\
-\x04P\xb6y\xcb/w5my\x09\x87\xf3Q6C\
-f\x94X\xbc\x13\x0cu\x02L.\x88Q\x0c\x11\x85d\
-\xc0\x95\x5c\xbdTsE\xd0@\x80b\xa9CD\x94\x0f\
-)r\xd2\xd8\x80L0+\x86~\x8c\xba\x1atr\xa1\
-\x82\x94\x07\xcfS\xe7\x5c\xd5\xc75\xcc\x05X\xba\xfe\xe0\
-,\x01\x0a\xa01\xab\xde\xb1\xc2PO<\xd4\x090\xe9\
-P\x801$\xf4{\x1a\x0e1\xd5Y6\xf4c\xd4\x09\
-0E\x98}Ckf\xe0\xc4\xb5q\xd7Q\xc7q\xa0\
-N\x80:f5\xea\x04\xa8cV\xa3N\x80:f5\
-\xea\x04\xa8cV\xa3N\x80:f5\xea\x04\xa8cV\
-\xa3N\x80:f5\xea\x04\xa8cV\xa3N\x80:f\
-5\xea\x04\xa8cV\xa3N\x80:f5\xea\x04\xa8c\
-V\xa3N\x80:f5\xea\x04\xa8cVcZ\xc7\x03\
-ttt\xacZ\xb5\xaa\xf2v\xd3\xa6M\xbbw\xef\xae\
-a\x7f\xea8\xf10-\x08\xd0\xd9\xd9y\xc9%\x97t\
-tt\x9c{\xee\xb9\x00V\xacXq\xf4\xe3\xf3\xf9\xfc\
-\xae]\xbb\xfa\xfb\xfbw\xec\xd8\xb1}\xfb\xf6g\x9f}\
-v\xeb\xd6\xadS\xd2\xd3:N4\xd4,(\xbe\xa3\xa3\
-\xe3\xd3\x9f\xfe\xf4\x87>\xf4\xa1\xb3\xce:+\x93\xc9\x8c\
-\xf3l\xdd\xdd\xdd\xdb\xb6m{\xe6\x99g\xee\xb9\xe7\x9e\
-\xfa*Q\xc7\xf1\xa3\x06\x04X\xbbv\xed\x95W^\xb9\
-r\xe5\xcaI:\xff\xc6\x8d\x1b\xef\xbb\xef\xbe{\xef\xbd\
-w\x92\xce_\xc1\x1dw\xdcq\xdai\xa7M\xf6UF\
-\xc4\xbe}\xfb\xf6\xec\xd9\xd3\xd7\xd7\xb7m\xdb\xb6\x9d;\
-wN\xc1\x02\xb8a\xc3\x86\xc9\xbeD5\xe2\x1f\x08`\
-\xfb\xf6\xed===\x93\xf74\xa7\x94\x00\xeb\xd6\xad\xfb\
-\xdc\xe7>\xd7\xde\xde>\x05\xd7\xea\xee\xee\xfe\xe1\x0f\x7f\
-\xb8~\xfd\xfa\xc9\xbb\xc4\x86\x0d\x1b\x8e)\xadM\x0d\xf2\
-\xf9\xfc\x8b/\xbe\xf8\xf8\xe3\x8fO\xde\x02\xb8s\xe7\xce\
-\xc98\xed\xf1\xa3\xab\xab\xeb\x85\x17^x\xfa\xe9\xa7\x1f\
-|\xf0\xc1\x09\xfc\x8dSD\x80\xb5k\xd7~\xf9\xcb_\
-\x9e\x9a\xa1_\x8d\xae\xae\xae\xdbo\xbf}\x92\xe6\x8f\xe9\
-C\x80jl\xd9\xb2\xe5G?\xfa\xd1\x84\xff\xe4\x9a\x13\
-\xa0\x82|>\xbfy\xf3\xe6\x89Z\xe4'\x9d\x00\x1d\x1d\
-\x1d\x7f\xf5W\x7f5y\x02\xcf\xf1`\xc3\x86\x0d\xb7\xde\
-z\xeb\x84O\x8d\xd3\x93\x001&\x9c\xf9\xd3\x87\x00\x15\
-l\xdf\xbe\xfd\xbb\xdf\xfd\xee8\x7f\xe3\xe4\xda\x01\xd6\xac\
-Y\xf3\xd0C\x0f\xd5v\xf4\x03\xb8\xe2\x8a+\xee\xba\xeb\
-\xae\xd5\xabW\xd7\xb6\x1bS\x89\xc5\x8b\x17\xdfv\xdbm\
-?\xf9\xc9O:::j\xdd\x97\xc9\xc2\x8a\x15+n\
-\xbb\xed\xb6\x0d\x1b6tvv&>\xc9$\x12`\xdd\
-\xbau\xb7\xddv\xdb\xf85<\x13\x82\xc5\x8b\x17\xdfq\
-\xc7\x1dk\xd7\xae\xaduG\xa6\x14+W\xae\xbc\xef\xbe\
-\xfbNl\xe6\xafX\xb1\xe2\xde{\xef\xbd\xf9\xe6\x9b\x93\
-5\x9f,\x02\xac[\xb7\xee\x86\x1bn\x98\xa4\x93'C\
-&\x93\xf9\x8f\xff\xf1?\xae[\xb7\xae\xd6\x1d\x99R\xb4\
-\xb7\xb7\xdfq\xc7\x1d'6\x07\x00|\xe1\x0b_H\xb6\
-\xdcM\x0a\x01n\xbe\xf9\xe6\xe96\xfa+\xb8\xe1\x86\x1b\
-f\x1b\x072\x99\xccl\xe0\xc0\xca\x95+\xef\xba\xeb\xae\
-\xb1r`\xe2\x09\xf0\xcdo~\xf3\x0b_\xf8\xc2\x84\x9f\
-v\x021;9p\xcb-\xb7\x9c\xc0\xfb\x81\x18\x8b\x17\
-/\x1e+\x07&\x98\x00\xeb\xd6\xad\xbb\xf6\xdak'\xf6\
-\x9c\x93\x81\x1bn\xb8a\xb6\xed\x07\x16/^|\xd3M\
-7\xd5\xba\x17\x93\x8e\xb1r`\x22\x09\xb0v\xed\xdai\
-+\xf9\x0c\xc7\x8d7\xdex\xc2K\x05Cp\xc5\x15W\
-\x8cGa2S\xb0x\xf1\xe2\xbf\xfa\xab\xbf:\xce\x83\
-'\x8c\x00\x9d\x9d\x9d7\xdex\xe3D\x9dm\x0a\x90\xc9\
-d\xbe\xf5\xado\x9d\xf0R\xc1\x10|\xe5+_\xa9u\
-\x17\xa6\x02+W\xae<N\xbd\xd0\x84\x19\xc2\x1e{\xec\
-\xb1\xc5\x8b\x17\x8f\xff<\xb1U\x7f\xc7\x8e\x1d\x9b6m\
-:|\xf8\xf0#\x8f<R\xf9j\xcd\x9a5\x00V\xad\
-Zu\xee\xb9\xe7N\x94\x05j\xe3\xc6\x8d\x89e\xa1\xe9\
-l\x08;\x0a\xd6\xacY\x93\xc0wh\x1a\x1a\xc2\x8e\x89\
-/~\xf1\x8b\xd5\xe3gDL\x8c;\xf47\xbf\xf9\xcd\
-\xf1\x8f\xfe\xed\xdb\xb7\xdf}\xf7\xddw\xdey\xe7h\x07\
-\xc46\xbf\xf8\xdf\xd8\x99\xf4\x9ak\xae\x19\xe7u/\xbe\
-\xf8\xe2\xb5k\xd7\x1e\xe5\xa2'\x1e\xae\xba\xea\xaaY\xe2\
-=~\xcb-\xb7\x1c\x93\x00\x13\xb0\x02tvv\xfe\xe8\
-G?\x1a\x8f\xc1k<6\xed5k\xd6\xdct\xd3M\
-\xe3\xf12\xea\xee\xee\xbe\xfa\xea\xab\x138J\x8cu\x05\
-\xf8\xfe\xf7\xbf\xbfm\xdb\xb6\xb1^\xa5\x82\xc5\x8b\x17w\
-tt,[\xb6l\xe9\xd2\xa5\xe3\xf9\xbd]]]\x97\
-\x5cr\xc9X[\x8du\x05H\xfccW\xadZ\xd5\xd8\
-\xd8x\xce9\xe7L\x88@\xf1\xfd\xef\x7f\xff\x1b\xdf\xf8\
-\xc6Q\x0e\x98\x00\x02\xdcy\xe7\x9d\x17_|q\xe2\xe6\
-\xc7\xec\xe2\xf1\xe0\x8e;\xee\xb8\xe2\x8a+\x127\xbf\xfb\
-\xee\xbb\xbf\xf6\xb5\xaf\x8d\xb5\xd5X\x09\xf0\xd5\xaf~u\
-\xa2\x9cs\xe2\x10\xa2\xc4\xae\xb5\x1f\xfc\xe0\x07\xc7J\xf8\
-\xb1\x12`\xfc?6^\xe4/\xbf\xfc\xf2\xf1\xc8\x99\xf9\
-|\xfe\xb2\xcb.;\xca\x8f\x1d\xef&\xb8\xb3\xb33\xf1\
-\xe8\xcf\xe7\xf3_\xfc\xe2\x17\xc7?\xfa\x01\x5c\x7f\xfd\xf5\
-\xb7\xdf~{\xe2\xe6W]u\xd5\xcc\xda\x0do\xdd\xba\
-u\xfd\xfa\xf5W_}\xf5\x96-[\x124\xaf\x0e4\
-\x9d\xb6\xd8\xbd{\xf7\xfa\xf5\xeb\xaf\xb8\xe2\x8a\xaf~\xf5\
-\xab]]]\xc9N\x92\xc9d\x8en\xf3\x19/\x01\x12\
-k\x15\xf2\xf9\xfc\xf5\xd7_\x7fL\x11\xed\xf8\xb1~\xfd\
-\xfa/~\xf1\x8b\xc9\xda\x1e\xf36MO\xec\xde\xbd\xfb\
-3\x9f\xf9L\x82\xc1q\xf6\xd9gOF\x7f&\x09\xf7\
-\xde{\xef%\x97\x5c\x928\x22\xe7\xe8\xb3\xdb\xb8\x08\x90\
-x\xfa\x9f\xf0\xd1\x1f\xe3\x91G\x1eI\xbc\x0e\x5cu\xd5\
-U\x13\xda\x97\xa9\xc3-\xb7\xdc2\xd6&\x8d\x8d\x8d\x93\
-\xd0\x91\xc9E\xe2E>\x93\xc9|\xfa\xd3\x9f\x1e\xed\xdb\
-q\x11\xe0K_\xfaR\xb2\x867\xdf|\xf3\x84\x8f\xfe\
-\x18\xeb\xd7\xaf\xbf\xfb\xee\xbb\x134\x9c\xa1\x8b\x00\x80G\
-\x1ey$\xb1\x840\xb3\xb0~\xfd\xfa\x8d\x1b7&h\
-\xf8\xb9\xcf}n\xb4\xaf\xc6E\x80d\x96\xd4\xbb\xef\xbe\
-{R\x03v\xbf\xf6\xb5\xafm\xdf\xbe=A\xc3\xcb/\
-\xbf|\xc2;35x\xea\xa9\xa7j\xdd\x85)\xc2M\
-7\xdd\xd4\xdd\xdd=\xd6V\xed\xed\xed\xa3\x8d\xd5\xe4\x04\
-X\xbbvm\x02\xd5gwww\x02}\xcbX\xf1\xf5\
-\xaf\x7f=A\xab\x15+V\xccPO\x81\xbe\xbe\xbeZ\
-wa\x8a\xb0{\xf7\xee\x1f\xfe\xf0\x87\x09\x1a^s\xcd\
-5#~\x9e\x9c\x00\x1f\xfe\xf0\x87\x13\xb4\xba\xf5\xd6[\
-\x13_\xf1\xf8\xb1u\xeb\xd6d{\xa6\x19\xba\x13\x18\x8f\
-ya\xc6a\xfd\xfa\xf5\x09\x16\x81\xd1\x14_\xc9\x09\x90\
-@\x93\xb0}\xfb\xf6)\xc8V\x12\xe3\xd6[o\xcd\xe7\
-\xf3cm5CW\x80\x99\xa5\xd5\x19?\xee\xbb\xef\xbe\
-\xb16ioo\x1f\xf1\xe1&$\xc0\xea\xd5\xab\x13\x98\
-`\x1ex\xe0\x81d\x97K\x80\xdd\xbbwo\xde\xbcy\
-\xac\xadj\x1e\xbe\x9c\x0cc\xd5\xea$\xdb#M\x1f\xdc\
-\x7f\xff\xfd\x09Z\x8dh\xffNH\x80\x8b.\xbah\xac\
-M\xba\xbb\xbb'5K\xcfp\xfc\xed\xdf\xfem\x82V\
-\xb1\xcb\xdd\xccB\x9cR\xf2\xf8\xb1k\xd7\xaeI\xea\xc9\
-\xd4`\xeb\xd6\xad\x098\xbc|\xf9\xf2\xe1\x1f&$@\
-\x02Qa\xd3\xa6M\xc9\xae\x95\x18\x8f<\xf2\xc8\x04\x0a\
-\x8b\xd3\x16\x9d\x9d\x9dcr\x16\xc8\xe7\xf3\x93\xa4\x83\x9e\
-J<\xff\xfc\xf3cm2b\x1a\xbf\x84\x04X\xbat\
-\xe9X\x9b<\xfc\xf0\xc3\xc9\xae5\x1e$`\xdd\xb2e\
-\xcb&\xa3'\x93\x87\xb1&DH \x19NC$x\
-\xb2#N\x13\x09\x090\xd6\x0d@>\x9f\x9f\xb2\xedo\
-5\x12\xb0.\x01\xb7k\x88o~\xf3\x9bc\xdd\xb7<\
-\xfa\xe8\xa3\x93\xd3\x97)E\xb2\xe14\x5crIB\x80\
-\x04R\xf2\x8b/\xbe\x98\xe0B\xe3G\x82\xdb4\xf5\xf9\
-\x1b\x93\xa1\xb3\xb3s\xc3\x86\x0dc\x8d\xc0\xee\xee\xee>\
-a\x82\x1f\x12\xd8\xbf\x87KAI\x08\xd0\xd2\xd22\xd6\
-&;v\xecHp\xa1\x09A\x82\xdd\xd2t\x8e\x15^\
-\xbdz\xf5\xcd7\xdf\xbca\xc3\x86{\xef\xbd7\x81\x9f\
-\xf0_\xff\xf5_OF\xafj\x82}\xfb\xf6\x8d\xb5\xc9\
-p}q\x92\x88\xb0\x04\xf7}\xeaw\xc0\x15\xec\xdc\xb9\
-s\xac\x1dnmm\x9d\x8c\x9e\xdcp\xc3\x0d\x89\xbd\xa7\
-\x00d\xb3\xd9q\xc6\x88l\xd9\xb2\xe5\x84\x99\xfe\x01\xec\
-\xd8\xb1c\xac\xe2\xdfp}q\x12\x02$\xf0%<|\
-\xf8p\x82\x0bM\x08\x12\xb8\x09\x9c}\xf6\xd9\x93\xb1c\
-\x99\x90\x10\xa7\xc4\xe8\xea\xea\xfa\xf3?\xff\xf3\x1av`\
-\xc2\x91\xe0\xc9.\x5c\xb8p\xc8'ID\xa0\x04U!\
-j\xa8wK\xb0\xf8\xccDo\xe1\xa3\xa3\xab\xab\xeb\xba\
-\xeb\xae;\xc1j\xe7$p\x00\x99?\x7f\xfe\x90O\xa6\
-\xa2Jd\x02\x97\x84:&\x10\xdb\xb7o?\xf1F\xff\
-Da*\x08P[\xbb\xe3l0\x05\x8c\x86|>\x7f\
-\xf7\xddw_q\xc5\x15\xf5\xd1?\x1a\x92\xec\x01\xe6\xcd\
-\x9b7\xe1\xfd\x98<$x\xf6\xd9lv2z2\xc5\
-\xd8\xbe}\xfb\xd7\xbf\xfe\xf5\x138\x03\xca\x84\xa4*J\
-\xb2\x02\xcc\x14M\xf9,\xc7\x8a\x15+\xbe\xf2\x95\xafL\
-g\x95\xee8\x91\x80\xdbK\x96,\x19\xf2I\xbdR\xfc\
-\x89\x8c\x8b/\xbe\xf8{\xdf\xfb\xde\x9dw\xde9\xb3r\
-^L\x1er\xb9\xdc\x90O\xea\x048\xf1q\xf1\xc5\x17\
-?\xf4\xd0C3\xd1\xcbu\xc2\xb1\x7f\xff\xfe!\x9f\xd4\
-\x090+\x90\xc9dn\xbb\xed\xb6\x19\x1a\xf5?\xa9\xa8\
-\x13`\x16\xe1\x04\xab\x0c2!kZ\x12\x02\xd4\xf5\xfa\
-3\x177\xdcpC]\x16\xaaF\x12\x02\xcc\xf4x\xa2\
-Y\x8e\x9bn\xba\xa9\xbe'\xae`b\xd2\xa3\x1f\x1d\xb5\
-\xb5\x1b$\x98\xf0\x12D\x1b\x1d\x0f6n\xdc\xb8g\xcf\
-\x9e\xc4\xcd\x17.\x5c8\x7f\xfe\xfc\xf1\xbb\xc4\xb5\xb7\xb7\
-\xdft\xd3M\xd7_\x7f\xfdxN2\x1d\x90\xe0>\x0c\
-\x7f\xb2SA\x80\xba\xdd \xc6}\xf7\xdd7Q>v\
-k\xd6\xac\xb9\xf4\xd2KW\xaf^\x9d,+}\x5c+\
-i\xa6\xdb\xc8&d\x1dK\x22\x02%\xb0\xc0\xd50\xdd\
-\xc8\x09\x992\xe4\xde{\xef\xbd\xfe\xfa\xeb/\xbb\xec\xb2\
-\xc4)c\xaf\xbb\xee\xba\x89\xed\xd2\xd4#\x81\xc7\xcap\
-\xb7\x80$\x04H\xe0\x86\x9a\xc0\x81t\xa2\x90\xc0\xb5\xb3\
-\x86\xd1\x0bc\xc2\xee\xdd\xbb\x13\xa7\x8c\xbd\xf4\xd2K'\
-\xba;S\x8d\xe1\xae\x9d\xc7\xc4\xf0 \xb2$\x04H\xe0\
-]S\xc3T\x0bcM\x192\xe3\xb0~\xfd\xfa\xef\x7f\
-\xff\xfbcmu\x94t\x993\x05\x09\xf6\x00\xc3\xa7\xb6\
-$\x04H\x10\x8bYC\xff\xca\xe1\xee\x1f\xc7DM\xe2\
-\xf7\xc7\x83o|\xe3\x1b\x09\x22??\xfe\xf1\x8fOF\
-g\xa6\x06\x09t\x1b\xf9|~bD\xa0\x04\xe3\xa3V\
-\xa9\x16\x12l\x13\x13\xa4\x12\x9a\x0eH\x90uoF{\
-}'\x90)FT\xdf'\xb4\x04\x8fu\x94\xd4j\xc1\
-M\x90\xc1\xee\x8d7\xde\x98\x84\x8eL:\xee\xb9\xe7\x9e\
-\xb16\x99Y\x09`\x86\xe0\xc2\x0b/\x1ck\x93\x11\xb5\
-\xdb\x09\x09\x90`\x94$\x18\x8b\xe3\xc7e\x97]6\xd6\
-&5L`1\x1e\xec\xde\xbd;\xc1\xac4I\x9d\x99\
-ltvvN\xc8\x06\x00\x89\x09\x90@\x85|\xf5\xd5\
-W'\xbbVbL\xe0m\x9a\x11\x18\xee\xeax\xa2\x22\
-\x99\x0ew\x22\x09\xf0\xc4\x13O\x8c\xb5I{{\xfb\x14\
-{\xa1$\xbbM3n\x07<\x0b\x91@\x87\xbb}\xfb\
-\xf6\x11\xb5\x97\x09\x09\x90,\xef\xec\x1f\xfd\xd1\x1f%\xbb\
-\x5c2$\xa8v\x91\xac\xeah\x1dS\x89u\xeb\xd6%\
-\x10\xde\x9e|\xf2\xc9\x11?O\xee\x0e\x9d )\xc5\xca\
-\x95+\xa7l+|\xf3\xcd7'p\x13\x98\xd1\xde\x01\
-\x09\x14\xbe3\x11G\xa9xw\x14\x8cVR 9\x01\
-\x92\xe5X\xbd\xf1\xc6\x1b\x13_\xf1\xf8\xd1\xd1\xd1\x91L\
-\xfeIVya:\xa0\xa3\xa3#\x99_\xd0\xcc\xc2\xcd\
-7\xdf\x9c`\xfa\xef\xea\xea\x1amjKN\x80;\xef\
-\xbc3A`\xc0\x8a\x15+\xc6\x9a\xce;\x01n\xba\xe9\
-\xa6\x04\xa3a\xfb\xf6\xed3w\x058J)\xdc\x13\x06\
-\xabW\xafN6\xaf=\xf4\xd0C\xa3}5\xae\x88\xb0\
-d\xf9\xde\xae\xbb\xee\xbaI\x15\x84\xd6\xae]{\xc5\x15\
-W$h8\x95\x15\x9c&\x1c\x09j\xbc\xce\xacBI\
-\x1d\x1d\x1d\xb7\xdcrK\x82y-\x9f\xcf\x1f\xc5Ud\
-\x5c\x04\xf8\xeew\xbf\x9b\xa0U&\x93\xb9\xe5\x96[&\
-)&c\xf5\xea\xd5\xc9\xa4\xac|>?\xc5\x15\x9c&\
-\x10k\xd6\xacI\x90\xb18Av\xe5Z\xa1\xa3\xa3\xe3\
-\xae\xbb\xeeJ\x16\x08\xb1y\xf3\xe6\xa3x\xaf\x8d\x8b\x00\
-[\xb7nMV\xb9{\xf1\xe2\xc5w\xddu\xd7\x84s\
-`\xf5\xea\xd5w\xdcqG2QxFK\xff7\xdd\
-tS\x82\x86\xcf<\xf3\xcc\x84wf20\x9e\xd1\x0f\
-\xe0\xdb\xdf\xfe\xf6Q\xbe\x1doP\xfc\xd1\xcf~\x14L\
-8\x07\xc63\xfag\xee\xf4\x1f\x0f\x8ed6\xdd\xc7\x1e\
-{l\xc2\xfb3\xe1X\xb3f\xcd}\xf7\xdd\x97x\xf4\
-o\xdc\xb8\xf1\xe8\xfb\xba\xf1\x12 \xf1\x22\x00`\xf1\xe2\
-\xc5\xf7\xddw\xdf\x84X\xc7\xd6\xae]\x9bx\xf4\x03\xb8\
-\xff\xfe\xfbgb\xf6\xccu\xeb\xd6=\xf4\xd0C\xc9\x06\
-\xc7Q\x14#\xd3\x04\x9d\x9d\x9dw\xdey\xe7m\xb7\xdd\
-6\x1e\x97\x8dcN\xd0\x13\x10\x12\xf9\xedo\x7f\xfb\xfc\
-\xf3\xcfO6\xf8\xda\xdb\xdbo\xbb\xed\xb6K/\xbd\xf4\
-\xd6[oM6\x04;;;o\xbe\xf9\xe6\xf1\xd4\xf7\
-\x9d\xfa\xfa\xad\xe3D\x1c\x0f\xb9j\xd5\xaa\xf1\x8c\x8c\x9f\
-\xfe\xf4\xa7\x13\xd8\xa5\x09\xc4\xea\xd5\xab/\xba\xe8\xa2\xcb\
-.\xbbl\xfc\xe5\x146l\xd8pL\x92\xd3\xa9\xa7\x9e\
-:\xce\xcb\x00\xf8\xe67\xbf9\xd6bUC\x90\xcf\xe7\
-\xef\xbf\xff\xfe\xbb\xee\xba\xeb\xf8\xa7\xa5\xce\xce\xce\xaf|\
-\xe5+\x17_|\xf1x\xae\x0b\xe0/\xfe\xe2/\x92\xd5\
-M\xd9\xb0a\xc3\x98\xb6\x9e]]]\xfd\xfd\xfd\x09.\
-T\xc1\x92%K&D\xd9\x9f\xcf\xe7\xc7\x1a):\xd6\
-8\xd8\x04?v\xfc\xf1\xfe\xd5\xc8\xe7\xf3\x97]v\xd9\
-1g\xd5\x89\x09\x8a\xff\xda\xd7\xbev\xe1\x85\x17\x8e\xa7\
-\xf7\x99L\xe6\xdak\xaf\xbd\xf6\xdak\xbb\xba\xba\x9ez\
-\xea\xa9M\x9b6m\xda\xb4ix\xef;::V\xad\
-Z\xb5j\xd5\xaaq^\xae\x82\xa9\xac\x1aT\xdb\x0a1\
-\xd5\x98\x82\x1d\x7f\xcd\x7f\xec_\xfe\xe5_\x1e\x8fL1\
-1+\x00\xc6\xb7\x07=\x0a*\x13\xc9\xbcy\xf3&\xdc\
-}\xf78'\x89\xd10\xd6\x15`\x9a\xa0\xbb\xbb\xfb\xfc\
-\xf3\xcf\x1fk\xab\x09\xc9E>e\xd8\xb8q\xe3\xda\xb5\
-k\x8f\xe7\xc8\x09K\x8d\xf8\xc8#\x8f|\xe7;\xdf\x99\
-\xa8\xb3U\xb0x\xf1\xe2\x15+V\xacX\xb1b2\x9c\
-\xd7\xaf\xbf\xfe\xfa\x99\xb8\xf7\x1d'n\xbd\xf5\xd6Zw\
-ar\xd1\xd5\xd5u\xfcz\xe1\x89\xcc\x0d\xba~\xfd\xfa\
-\xc4Y:\xa6\x1e\xb7\xdf~{\x0d+\x97\xd5\x0aq}\
-\xd5Z\xf7b\x12\x91\xcf\xe7\xd7\xad[w\xfc\xf3\xda\x04\
-'\xc7\xbd\xfe\xfa\xeb\x13kE\xa7\x12\x1b6l\x98Y\
-\x9a\x9f\x09AWW\xd7\x89=\xfd\xe7\xf3\xf9\xeb\xaf\xbf\
-~L\xea\xdd\x89\xcf\x0e\xbdv\xed\xdai\xce\x81\x8d\x1b\
-7\x9e\x00\x89\x01\xc7\x8a\x13\xb2Pd5\xe2\xd1?\xd6\
-U}R\xd2\xa3Og\x0e\x1c\xff\xf6\xe8D\xc2\x09?\
-\xfa\xbb\xbb\xbb\x13\x8c~L^}\x80\xe9\xc9\x81\xef\x7f\
-\xff\xfb\xf5\xd1\x7f\xe2a\xcb\x96-W_}u\xb2\x1d\
-\xdd$\x16\xc8X\xbbvm\x82\x8ce\x93\x84|>\x7f\
-\xfb\xed\xb7\x7f\xe3\x1b\xdf\xa8uG\xa6\x1a\x1b6l\xb8\
-\xe4\x92KN\xd4\xd1\x1f\xbb:\x7f\xe63\x9fI\xfc\x03\
-'7;\xf47\xbe\xf1\x8d'\x9ex\xe2[\xdf\xfaV\
-m3ptuu\xddr\xcb-\xb3M\xe7\xd3\xd5\xd5\
-u\xfb\xed\xb7\x9f\xc0:\x9f\x8d\x1b7\xdet\xd3M\xe3\
-\xe4\xf6\xa4\xa7G\x7f\xe4\x91G\xae\xbe\xfa\xeau\xeb\xd6\
-\x8d\xd3W\x22\x19\xf2\xf9\xfc]w\xdd5\xdb&\xfe\xed\
-\xdb\xb7?\xf0\xc0\x03'\xaa\x9a+\x9f\xcfo\xde\xbc\xf9\
-\xdb\xdf\xfe\xf6\x848\xf3M\x98%\xf8\x98\x98(\xd7\x9d\
-\xe3D\xec\x5c\xb4~\xfd\xfa\xc9[\xfd\xa7\x9b%8\xf6\
-\x22\x19\x93?\xd5\xf1c:X\x82\xb7l\xd9\xf2\xf8\xe3\
-\x8f\xdfs\xcf=\x13\xf8L\xa7\xa2@F\x8c\xad[\xb7\
-\xae]\xbb\xb6\xb3\xb3\xf3\xba\xeb\xae\xbb\xf4\xd2K'O\
-(\xea\xee\xee~\xf8\xe1\x87'u\xe8O\x07\xc4N\x22\
-;w\xee\xdc\xb3g\xcf\xb6m\xdbNHQ\xa7\xab\xab\
-k\xdf\xbe};v\xec\xd8\xb4i\xd3$\xfd\xc0\xa9[\
-\x01\x86`\xed\xda\xb5\x1f\xfe\xf0\x87\xcf>\xfb\xec\x89b\
-Bww\xf7\xa6M\x9b~\xfa\xd3\x9fN\x99\xac\xbfz\
-\xf5\xea\xd6\xd6\xd6\xa9\xb9V\x8c\xc3\x87\x0f\xd7j'3\
-\x95I\xcdF\xf4\x83\x9c$\xd4\x8c\x00\x15tvv^\
-r\xc9%\xcb\x97/?\xed\xb4\xd3\xc6\xe4\xf1\xd6\xdd\xdd\
-\xbd\x7f\xff\xfe\xe7\x9f\x7f~\xfb\xf6\xed\xcf>\xfb\xec4\
-\x0f\xef\xa8cz\xa2\xf6\x04\x18\x8e\xce\xce\xce\xa3W\x94\
-\x99\xca\x19\xa2\x8e\x13\x1b\xd3\x91\x00u\xd41e\xa8W\
-\x8a\xafcV\xa3N\x80:f5\xea\x04\xa8cV\xa3\
-N\x80:f5\xea\x04\xa8cV\xa3N\x80:f5\
-\xea\x04\xa8cV\xa3N\x80:f5\xea\x04\xa8cV\
-\xa3N\x80:f5\xea\x04\xa8cV\xa3N\x80:f\
-5\xea\x04\xa8cV\xa3N\x80:f5\xea\x04\xa8c\
-V\xa3N\x80:f5\xea\x04\xa8cV\xa3N\x80:\
-f5\xfe\x7f\xb0\xca#XH\xbc\xae\xdc\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x02\xc0\xc7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x06\x00\x00\x00\x03`\x08\x02\x00\x00\x00e@4\xc1\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x06\xc1iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 6.0-c002 79\
-.164488, 2020/07\
-/10-22:06:53    \
-    \x22> <rdf:RDF \
-xmlns:rdf=\x22http:\
-//www.w3.org/199\
-9/02/22-rdf-synt\
-ax-ns#\x22> <rdf:De\
-scription rdf:ab\
-out=\x22\x22 xmlns:xmp\
-=\x22http://ns.adob\
-e.com/xap/1.0/\x22 \
-xmlns:xmpMM=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/mm/\x22 xm\
-lns:stEvt=\x22http:\
-//ns.adobe.com/x\
-ap/1.0/sType/Res\
-ourceEvent#\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:dc=\x22http\
-://purl.org/dc/e\
-lements/1.1/\x22 xm\
-p:CreatorTool=\x22A\
-dobe Photoshop 2\
-2.0 (Windows)\x22 x\
-mp:CreateDate=\x222\
-025-01-31T15:05:\
-35+01:00\x22 xmp:Me\
-tadataDate=\x222025\
--01-31T15:05:35+\
-01:00\x22 xmp:Modif\
-yDate=\x222025-01-3\
-1T15:05:35+01:00\
-\x22 xmpMM:Instance\
-ID=\x22xmp.iid:878e\
-6cb4-a797-ea44-a\
-24f-87380ae207bd\
-\x22 xmpMM:Document\
-ID=\x22adobe:docid:\
-photoshop:cf1dd9\
-c9-64b9-8343-a0e\
-8-313263e9c005\x22 \
-xmpMM:OriginalDo\
-cumentID=\x22xmp.di\
-d:becd1bc1-b788-\
-c04b-b18c-3baa42\
-04a516\x22 photosho\
-p:ColorMode=\x223\x22 \
-photoshop:ICCPro\
-file=\x22sRGB IEC61\
-966-2.1\x22 dc:form\
-at=\x22image/png\x22> \
-<xmpMM:History> \
-<rdf:Seq> <rdf:l\
-i stEvt:action=\x22\
-created\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:becd1bc1-b788\
--c04b-b18c-3baa4\
-204a516\x22 stEvt:w\
-hen=\x222025-01-31T\
-15:05:35+01:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 22.0 (Windo\
-ws)\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:87\
-8e6cb4-a797-ea44\
--a24f-87380ae207\
-bd\x22 stEvt:when=\x22\
-2025-01-31T15:05\
-:35+01:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-22.0 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-<photoshop:Docum\
-entAncestors> <r\
-df:Bag> <rdf:li>\
-6AAD468F67CC161A\
-FBF3EE6ED16E87BE\
-</rdf:li> <rdf:l\
-i>adobe:docid:ph\
-otoshop:64a10be2\
--6404-b649-ae89-\
-1d39d812c008</rd\
-f:li> </rdf:Bag>\
- </photoshop:Doc\
-umentAncestors> \
-</rdf:Descriptio\
-n> </rdf:RDF> </\
-x:xmpmeta> <?xpa\
-cket end=\x22r\x22?>#\x08\
-\xc9\x0e\x00\x02\xb9\xacIDATx\x9c\xec\xfdy\x90\
-l\xe9y\x1e\xf8=\xef\xfb}\xe7dfU\xdd\xb5\xef\
-\xed\x05\x8dFw\x03\xdd\xd8\x01\x92\x00\x08\x82\x02I\x00\
-\xdc\xd7\x19n\x129\xc1\xb1E{\xacY\xec\xb1%[\
-c;\xc2\x7fxb\xec\x98\x88\x89\xb1\xfd\x87\x1d!\xc7\
-8\xc2\x0e;\xc2\xf2hFCIc\xc5H\x16\x87\x92\
-Hj\xb8\x8a\x8bH\x91 H\x0a@ci\xf4~\xd7\
-Z2\xf3\x9c\xf3\xbd\x8f\xff8\x99\xb5\xdd\xaa\xbc\xb7\xf2\
-.]7\xef\xf3C\xe1\xde\xaa\x5c\xce\x96Y\xd5\xf7{\
-\xea\xfd\xde\xcf\xbe\xfd\xdb\xbf}kk\x0b\x22\x22\x22\x22\
-\x22\x22\x22\x22\xb2\x8a666\xf2\xd5\xabW\x9b\xa6y\
-\xbb\x8fDDDDDDDDD\xee\x8b\xa6i\xbc\
-\xae\xeb\xb7\xfb0DDDDDDDD\xe4~\xa9\
-\xeb\xda\xdf\xeec\x10\x11\x11\x11\x11\x11\x11\x11\x91\xfbK\
-\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\
-\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\
-\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\
-\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\
-\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\
-\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\
-\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\
-\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac\
-8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\
-\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\
-\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\
-\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\
-\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\
-\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05\
-@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\
-\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\
-\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\
-\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\
-\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\
-\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\
-\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\
-\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\
-\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\
-\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\
-\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\
-\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\
-\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\
-\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\
-\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\
-\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\
-\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\
-\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\
-\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8a\
-S\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\
-\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\
-\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\
-\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\
-\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\
-\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00\
-$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\
-\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22\
-+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\
-\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\
-\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+\
-N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\
-\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\
-\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\
-\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\
-\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\
-\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\
-\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\
-\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\
-\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\
-\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\
-\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac\
-8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\
-\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\
-\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\
-\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\
-\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\
-\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05\
-@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\
-\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\
-\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\
-\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\
-\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\
-\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\
-\x22\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\
-\x88\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\
-\x14\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\
-\x22\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\
-\x88\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\
-\x00\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\
-\x22\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\
-\xc8\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\
-\x89\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\
-\x22\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\
-\x8aS\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\
-\x88\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\
-\x22\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8a\
-S\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\
-\x88\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\
-\x22\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\
-\x00$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\
-\x88\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\
-\x22+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00\
-$\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\
-\x88\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22\
-+N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\
-\x22\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\
-\x88\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+\
-N\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\
-\x22\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\
-\x88\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\
-\x01\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\
-\x22\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\x88\x88\x88\
-\x88\xac8\x05@\x22\x22\x22\x22\x22\x22\x22\x22+N\x01\
-\x90\x88\x88\x88\x88\x88\x88\x88\xc8\x8aS\x00$\x22\x22\x22\
-\x22\x22\x22\x22\xb2\xe2\x14\x00\x89\x88\x88\x88\xac\x223\xba\
-\x03\xf6v\x1f\x87\x88\x88\x88\x9c\x0a\xf9\xed>\x00\x11\x11\
-\x91S\xc1\x0c\x84\x91 @\x82\x9c\xdf>\xfb\x9b\xfd\xe7\
-\x84\xf1\x98-\x88\x9c\x1ef\x88\xb6\x8b\xae W9\xa7\
-\xec\x04H\xbdwEDD\x1ea\x0a\x80DD\xe4\x91\
-f\x063\x94\xc0\xf64\x22\xc8\x00@3\xb7>\xe7!\
-n\x1d2;\x0c8\xe2\xf6~{\x00\xf7\xd5\x5c\xf0\xc0\
-=\xb7\xb9\xe1\xc8\xa3\xdb;\x04;\xf4\xe0C\xbb:\x12\
-\x8f<\x94\xb7\xa9(d\xe9\x83Yt\x8d\x0e=\xf9\x8e\
-\x13\x8eSU\x16s\xbb\xa3\x9e\xbf\xf4\xd6\xc7\x8f\x87\xdf\
-\x09\xb7>\x9c\x08\xe3\x99\xf1\xb5\x8d\xf1\xe6\xce\xfa\xda\xf6\
-\xf0\xb1\xad\xc00\xfb\xb0v\xeb\xf3\xcd{u\xe4\x22\x22\
-\x22\xf2\xf0P\x00$\x22\x22\x8f.\xc2\x9a\x0em\x1b\xc1\
-r&\xc7\xb95n\x0c\xbas#^:\x93\x87\x83T\
-\x02A\xd0Q\xe0\x1d\x1d\xee\x04\xb2u#\x9f\x18pd\
-\x84\x10\x07\xbf\xf4\xd9-\xc4|\xc4\xbe\xfbD\xdf\xbbe\
-\xf6w\x006\xdfh\xec\xc6;\x06\x12>\xdf\x82\xc1v\
-wApq\x10`\xb3\xbd\xd8\xee\x97\xf3\xe7\x1e(\x04\
-92A9.\x1e!A\x869\x18\x06\xc0\x9c<\xf8\
-X;>YI\x07\x22\xa0\xdd#'\xe7A\xd6qY\
-\xce\xc2\xac\xe6\xc0\x9d\xbb3\xdb\xe3\xe0\x97\xb7*\xf7!\
-\x03\xb95W\xb1}\xb7p\x166\xde\xfa,\xa4\xdb\xc5\
-x\x84\xb1\xbfx\xd1\xbfx\xd1_4\xf7[/\x1b\x00\
-\x98\xc5\xf6d\xf4\xae\xf5\xc7\xdf9\x1a]\xdb\xba\xf6\x87\
-o\x5c\xfb\x97o\x9e\xdbnxc\x9b)\xe5A\x85*\
-\xa9\x1aHDD\xe4\x91\xa3\x00HDD\x1eQAt\
-]T\xd6\xa5\x84g/\x0e\x7f\xe6\xe3k\xef}&_\
->_\x1e_\xe7hTr\xc5\xa0\xd1\x083\xe6DT\
-\xf4\x0cO\x8e\xb1\xc7M\x80G&\x1d\xb32\x8d\xd9\xb0\
-\x9f\x06\xe3^\xf8\xb3\xcb\xfa\x98d\xff$3\x03\x0f\x15\
-\x0e\xed\xab\xfd\xf1}\xcf\xdc\xbf\xbd\xbeF\xe9\xf8q\xbc\
-\x19l7h\x82\xed=\x96\x0b#\xa0Ex\xe0\xb9G\
-\x04PvD\xc41\x7f\xb0\x1fs0}\xc2q\xe4\xde\
-vO\xe48v\xe8+\xdb\xff\xcc\x05'\xc6\x88\xe3\xef\
-\x5c\xd2m2\x15\xb3c\xd21\x9a\x1f\x1bU\xed\x0b\x90\
-\xfa+o\x9c}B\x00\xc7?\xb1+q\xd9\xe2\x9d\x93\
-i\xb3\xb5s\xed\x07\xa7\xe5\xfa8\xfd\xe3\x7f\xb9\xf3\x8f\
-~\x7fsk\xdaL[L\xa3\xaa\xf5o@\x11\x11\x91\
-G\x8c\xfe\xe3/\x22\x22\x8f\x1c7\xb4a\xdb\xe3\xf6\xb9\
-\x8d\xf1g^\xe4\x87>\xf8\xf4\x87_\xb8\xf0\xc2S\xb1\
-1\xdc\xae\x13\x81\x0e\xed\x18\xe8f!\x8f\x01\xee0\x07\
-\x1c\x96A\xa2\xc4\xf1\x93\xaf\xf6g\x22q\xb0\x04d\xd7\
-\xfe\xa2\x1c\xec\xa6EGm\xed\xd6\x1by\xf8f\x1e\x1f\
-d\x98\xef+\x18\xc2\x81\x0a\x95\x03\xcf:\xd1l(\xee\
-\xfb\xe4\xe88\xe3\xb8\xa39X\x90s\xb0\x5c\xe6\xe8\xe8\
-d7\x00:\xbe\x94\xe7pG\xa6;>\x97\xfb\x10\x00\
-\xdd\x81cNs\xf1\x9a\x1c}\x8a\xd7\x87>}\xfa\xb3\
-W\x10\xc6\xa3\xb6i\x80\xc1'\x88\xeb]\x1d\x17\xce\xf0\
-\xf9A\xca\xc3\xea\x9b?\xb4\xfe\xaf}G\xfb\xaf\xbet\
-\xe3\x97\xff\xb0\xfc\xea\x9fol\x8f\xf3\xa0\xf6*/\x8a\
-\x10EDDd\x95\xd8G>\xf2\x91\xad\xad\xad\xb7\xfb\
-0DDD\x1e\x04\x03`6my}\xbb|\xe02\
-\xfe\xcag\xd3\xa7>\xf1\xd4\xbb\x9e\xbd\xb0^]\x9f\x8c\
-\xbf\xca\xf6\xcd\xaa\x0b/\xccA7\x1aA\xc2\x8c40\
-P\xfa9<Q[\xa9\x8f\xdd~_\xabr\xa8}\xd0\
-\xad\xb5=\xb3\x83\xd9\x9bI\xb6\xa0xd\x7fM\xcd\xde\
-\xc3v\xe7\x8f-|\xa2\x99\xed;\x8ayxd}!\
-\xcfq\xcf\xbb_\xdc\xfd\xf0\xc1\xec\x1e\xcf\xc2\x10\xe2\xf8\
-\xaa\xa2\xe5\x9d\xaa\x19P\x0bN\xd0\x00\xf4e>}\xed\
-\x17y\xc7G\xee\xe6\xb5''\xa6\x0d\x0b\xebT\x9f\xa9\
-Q\xd5;\xcd\xe8\xe57\xea\xff\xf7/\xb5\xbf\xf0\xdfM\
-\xaf\x8d\x99\xaa\xbc60\xf6\xf5gt\x92\xe6oK4\
-&\x22\x22\x22\xf7\xd7\xc6\xc6\x86\x02 \x11\x11yD\xd0\
-\xcc:\xfadZ&\xe3\xc9'^\x18\xfdo~\xe6\x9d\
-\x1f~\xcf\xc0\x06\xc9\xb0\x1d\x93\xaf\xb1{m\x98\x9au\
-G\x02\xd0\xc1\xfa\xe5\xbe\x02\x80\x85\x01\x812\x9b\xb8\x95\
-\xbc\xa4\xe3\xf6\xd1\x8f\xe4\xf7\xa2\x96~\xc7\xd8_\xa6a\
-{3\x9af\xf9\x8f\xe1\xce\x02\xa0~\x19\xa7\xbd\xaa!\
-\xc6l\xf6\xd8qO\x84\x99\xd9\x81\xa8\xa5\xff\x9b<z\
-\x02\xdb\x9dY\x1c\xc7,8\x117?\xe2`\xc0\x83\x09\
-\xd9\xd1[=\xf6`nS<\xb3`\x8b\xf7>\x00Z\
-\xfa\xca\x1cY'6\xe7fn\x86\xe8\xe7|\x1d\x8c\xee\
-\x16l\xb3Dx\xa4\xaa\xce\xc8\xd1\x94v\xc2\xcer\xaa\
-\x06\xeb\xbe\xfeD\xa4\x8b\xaf]\xa9\xbe\xf8\xb5\x9d\xff\xe2\
-\x1f\xbf\xf1\xf7~\xa7\x1d\x0c\x06\xa3\x81\x93\x00\x9d\x80\x99\
-\x02 \x11\x11\x91\x15\xb4\xb1\xb1\xa1)`\x22\x22\xf2h\
-0c\x90ms\xc6\xcb\xf7\x7f\xeb\xf0\x7f\xf53\x17?\
-\xfc\xbe\x9d\x9b[_\xdf\xda\xd9\xce\xa9\x1d\x0c\x9a<,\
-(h\x0bhH5H\xb3b\x8c\x0c\xd4\xc5\x1cL@\
-\x0a\xc00\xc5`\xe7\xf8\x9d\x18\xe6\x1d\x88m>8\x0f\
-\xec\x9b\xe2d\xb6\xdb\xb6\x976\xeb\x06\x8d\xa5\x02\xa0\xfe\
-)\x8b\x8bGl\xdfh\xfe\xc0\xf1\x04\xcd\x97\x8c\x80l\
-\xc1\x84,\x80\x8b\xa6\xa4\x1ds0\xe4]\x84JK\x9e\
-\xc5\xfd\xa8\xff\xb9\xdd\x95)\xc7>q\xc1\xb3\xe0nf\
-\x86Y\xda\xc788s\xee\xd8\xf3Hdj\x0b\xa2!\
-\x91k\xac;\xd1u1\xdelv\xc6%\xbf\xfc\x8e\xb3\
-\x1b\xcf}\xfa\x99\xf7\xbc\xe3\xe2h\xf0\xc6\xdf\xfd\xad\xd2\
-\xb4Ve\x83\x85\xf1T\xad\x8e&\x22\x22\x22\xf7\x92\x02\
- \x11\x11Y}\x06t\x96\xbb\xed\x9b\xef\xab_\xff\x8b\
-?\xf2\x9e\x1f\xfa\xde\x0f\xbc\xf3\xd2\xd6\xd6\xe6K\xd1]\
-\x1d\xe6H\xd6\xa1k\xda \xc3\xb3\xd1\xfbd\x86\xec\x0b\
-38[~\x09\x04\x820\x07\x11\xc7\x05\x086\x9f\xd0\
-\x85\xfd+\x82\xed\xab\xd9\xb0~\xed\xae\xf9\xe7\x00\xca\xfe\
-\xa2\xa1\x05\xdb<\xbc\xa5\xdb\xf79\x9e=w\x7f\xd4\x82\
-\xf9\xd1\xf9]T\x00\xe1\xd8 \x03\x0b\x83\x15\x1eu0\
-\xfd)-Y\xffs\x7fr\x9c\xa5-}e\x16n\xf4\
-@w\xf0C\xe9\xdaqo\x9b~\x810\xcb(\xdb\xec\
-\xa6\xc8C\xa4\x1a \xd0\xc5 7%5\x93\xad\x9d\x8e\
-\xa3g\xde\xf9\xec\xbf\xff3\x17s\xfd\xe6\x7f\xf9\xcf\xae\
-v\xa5Z\x1b\xfai\x9a\x18'\x22\x22\x22\xf7\x98\x02 \
-\x11\x11y\x04\x18\xa6\xd3X\xf3\xf2\xdd\xdf\xba\xf1\x93\xdf\
-{\xe9\x89\xa7vn~\xed\xcbizec\xa3BU\
-q\xdc\x95)\xa3\xael\xb8\x96\xadK;;\x88\x04O\
-0\xc2\x0d\xd1\xd1\xa70\x84\x99;\x9c\xb4r\xec\xbaT\
-\xb3\xf2\x1c\xda\xfe/\xfa\xb9;\xf3\x87po\x12\x18\x81\
-\xbdO\x17v\x81\x99?\x95\xb3ih\xfb\xb6\xb9p\x0a\
-\x94\xed\x1e\xcc\xfc\x0b\x00\x08\xc0\x97\x9d\x03\xc6\x85\xeb\x8e\
-\x018\xbe\xb0\xe8\xe8\x83\xe9Od\xf1D\xae\x05s\x92\
-\x96\x9c\x01v\x7f\xc4\xf1W\xa6\x7f\xd1O\x1e\xaf\xcc_\
-\xa7\xfdS\x08w?=f\xf1\xb4\xd9\xbd\xd6!\xa1\xca\
-\x09\xc9\x014-\xba\xe2,\xe6\x9esF\x87\xcd+\xaf\
-mO\xf0\xcc\xd3/\xfc\xbb?uy\xdan\xff\x17\xbf\
-:\xa5\x0d\xd7\x07\xa7\xaa9\x92\x88\x88\x88\xdcK\x0a\x80\
-DDd\xf5M:\xaca\xfcc\x1f;\xfb\xe3?\xfa\
-\xb1\xcb\x97\x9a\xf1\xb5?\x1d6\xd7\xaaic\xe8\x90\x13\
-:\x00\x19\xc5\xd1t$\xad\xad\xc1\x04wX\x81\x13\x16\
-`\x0bG8\xe8\xf0\xd2\xf7\x04:\xc6\xfe`(\xf6\xd5\
-\xe8\xec\x9b\x02\xb6o,\xbf\x17\x03\xddf5\xf7]\xbc\
-e\x9b\x8b\xe7\xec\x1c>\x9e\xf9\x13\xfb\x8e\xd6\xcbY\x1c\
-\x10,\xb8\xf7\xc8\x83\xe9\x8fg\xf1Y,\xb88\xa7j\
-\xca\xd2\xe2+\xb3\x5cVu\xf8\xdc\xf7}i\xb6\xe0\xca\
-t@\xe7\x96\x06Ueu4\x05m\x18\xddrFi\
-1\xe9\x06\x9e\xa2*7\xdb\xd7w\xb6\x87O=\xf5\x9e\
-\xff\xfe\x8f?\xfb\xd6\xe6K\xff\xf4\x0f\x9b2\xa8\xfdt\
-\x95U\x89\x88\x88\xc8=\xa3\x00HDDV\x1cam\
-\xd3\xbd\xef2\x7f\xees\x97?\xfcB=\xde~i\xb2\
-\xf5\xe6\x85\x8d\x0a\x9e\xd1\xb5`\x87\xba\x82%\x94\x16\xe3\
-\xa9%GU\x01\x04\xdby#h\x10\xd6\x7fje\xd6\
-\x16\xfa\xce\xf6lG}z\xdcs\x97\xde\xe6\x9d' \
-\xfb\xaaon?\xef\xea\x8e\x0ea\x89\xbb\x8fx\x98\xdd\
-n6\xdb\xa2M\x9e\xa6\x00ha/\x9f\xbb\x98\xaff\
-K\xbcm\x0ctv\x1eS\xa2%\x0b\x9df\x03\xe4\x84\
-\xe2h\x1a\xabc\xb4\x96\xbb\x96\x9b7_\x05\xf3\xfb\xde\
-\xf5\xc4\xff\xf0{\xd6\xa6W\xdf\xf8\xadW\xd2\xfa\xe8T\
-UU\x89\x88\x88\xc8=\xa3\x00HDDV\x99\x99M\
-\x1b\x0e\xd1}\xf2\xb9\xfa\x9b\x9fi1\xfd|\x9a~u\
-\x98#\xacxm\xa8\x0c\x06X\x17\x11\xf0@\x0dO\x06\
-+`w`#p\xf4\xe9\xcf\xfc\xeb;\xdb\xf7\xb1_\
-\xdc\xee\xc1\xf7h\x9b\xc7>\xf7.C\x93{\x91\xb9\x1c\
-\xd8\xc6\xb1\xab\xaa\xdd\xcb=>\x08\x0b2,.\x19\x00\
-\x99-\xaa\x1d:~\x87\x09H\x08\xc4\x14\x06K\x88\x94\
-H\x80\x09V!\xd5\xb0\xedT\x9a!\x00\x9f\x96\xeeO\
-\x06e\xf3\xdb_|\xec\xf3\xef\xdd\xf8\xa3\x97\x9b\x88\xa1\
-\xddE\x8b(\x11\x11\x119\xb5\xf4K\x1e\x11\x11Ye\
-\x84\xb5m\xf7\xc1\xa7\xf0\x93\xdf\xf6X]%l\xdd4\
-\x86't]\x90\xdc]\x82\x0b$\xcc\xe0\xb6\xa0\x85\x8d\
-\xc8\xc3j\xaf\xedT\x00}\xe0\xc6\xae\xa5\x91\xc3!\xb2\
-\xb1\x9b\x8c\xab\xb5\xf5\xcf}\xf4\xf2\xe7\xde\x8d\xa6\xe9\xca\
-\x82I\x8e\x22\x22\x22\xf2\xd0R\x00$\x22\x22+\xcb\x0c\
-[\xd3\xb8\xbc\x11?\xf7\x9dg>\xf6\xc1\xcb\xf0n\xba\
-=f\x81'D_\x90qk\x7f\x15\xf5?\x91\xd5C\
-\x033\x00\xb3\xd6l\xc705\x04\x0a@d\x87\x17L\
-\xb7\xe9\xc9>\xfa\xcd\x17?\xfe\xc13\xceR\xe2.f\
-\x08\x8a\x88\x88\xc8i\xa5\x00HDDV\x96\xc3\xa6\xd3\
-\xf6\xfc\x99\xfac\x1fz6\x9f\x1d\xb1\xdd\x99N\xc7$\
-\x92{\x9a\xd5\xfe\xbc\xcdG(r\xdf\xed-BG\xa0\
-\x00\x05,\x00=\xc1\x0c\xd1\x82\xc5\xdb\xb6k\xa7\xdb\xf9\
-B\xfd\xe4S\xe7\xeb\xca\x22\x14\x85\x8a\x88\x88\xac \x05\
-@\x22\x22\xb2\xb2\x0a\x91\xad<q\xc1\x1f\xbbh(\xaf\
-\xa3\xbdR;-\x80\xce\x92%[\xd0ZWdE\x18\
-\x99-\xb2\x11}Ss\xb3b,\x16p\x07\x88v\xdb\
-\xac\x1d\x0c-\x95\xf15L^}\xc7\xa5\x1bO^,\
-],Z\xd1^DDD\x1eR\x0a\x80DDde\
-\xedL\xf9\xf89\xff\xc1\x8f\x0d\xcf\x8e\x1an\xbd\x0en\
-\x0eFn\xf4v\x12,\x0b\x96\x16\x17Y%>o\xb3\
-M\x18\xe1\x9d\xa1\xb0#\x08\x16t\x13f\x0e\xd7\xd7\xd6\
-Q\xa6\xcd\x8d7>\xf2\xc2\xe6w\x7f\x9cMg]Q\
-8*\x22\x22\xb2j\x14\x00\x89\x88\xc8\xcaj\xda8\xbf\
-^}\xe4\x853\xc3<-\xed&\xaabu\x0a\xa2k\
-\x18a\xa6\x11\xae<\x12\x1c\xf0y\xb5[\xec~JX\
-\x14\xf7\xa8\xb2\xe5:\xd7Ub\xe9\xb6\xd6/\x97\x17\x9f\
-\x1d\xb9[Q\x09\x90\x88\x88\xc8\xca\xd12\xf0\x22\x22\xb2\
-\xb2H\x8e\x86\xf9\xc2\x06\xdc\xaf\xbao\x81\x1diFT\
-\x9e\x93g\xb25S\xb3[y0\xeef\xc2\xe1R\xef\
-\xd2Y\x80\xe3`\x062\xd0\xc1ZZ\x18`\x0e\xaf\x01\
-Z*k\x9eF\xd6\xe5\xd8\x19'4f[p\xac\xaf\
-]\x1a\xd6g\xd8uj\x03$\x22\x22\xb2bT\x01$\
-\x22\x22\xab\x89\x80Y\xac\x0d\xd2\xfa0\x83-\x8c(\xb0\
-\x86\xc9<W\xb5\xe7\x04\x034\x0fLV\x9f\xedk\x02\
-\x0d\x10pX\x82\x81\x09\x9e\xf3 \x22\x9a\xc9\x0eK\xc7\
-\x12h\xdb\xba\xc6`P)\xfd\x11\x11\x11Y=\x0a\x80\
-DDde\x91\xc8\xc9\xeb*\x10;\xb4\x0e\x04:\xb8\
-W\x963\xa3\x18\x88\xf940\x9f\x03\xa9THV\x82\
-\x81\x06\xba\x01\x04i\x84\x05<\xf6-\x08\xe6\x08 \x8a\
-\x15Tn9\x81\x01\x04\xaa*U\x95\xe2\x1f\x11\x11\x91\
-\x15\xa4)`\x22\x22\xb2\xb2H\x00\xe6)`\x8d\xa1\x83\
-\x01n\x96\x13`\xec\x083M\xff\x92\x95v\xe8\xfd\xbd\
-/\xd5\x89\xfe\xfe\x8c\xe2\x06Z2$z!\xcc\xb2[\
-\xbf@\x98\x88\x88\x88\xac\x18\x05@\x22\x22\xb2\xb2\xcc\x10\
-@\xc7\x11\xb0^\xda\xab\xc9\x09\x07\xd01\x0aQ\xd4\x04\
-Z\x1e\xac\xe5\xdepw\xf16\xa5\x03\x80\x07AZ\x01\
-\x02\x04\x01\x06@\x9892\x81\x0e\xe8\xc0\x06\xa5$\x10\
-\xe1\x88\xac\x0aq\x11\x11\x91\x95\xa4\x00HDDV\x16\
-\x89RXJ\x06\x07Q\xcc\x12\xdd\x89h\x186k\x85\
-\x22\xf2\xe0<\xe0\xc4\xd1\xe6\xeb\x7f\x153\xc0\x82\xfb\xf7\
-_\x10FG\xc0\xda(\x0d\xd9\x12\x91*\x02Dy\xb0\
-\x87)\x22\x22\x22\x0f\x8a\x02 \x11\x11YM\xfdhw\
-\xda\xc4\xce\x14X\x1b\xd2*+S\x00Q\x18`\xce\xaa\
-\xff\x91\xd5f\x80\x81\x00\x02F\x80\x00\x8d\xa0y\x10\x00\
-=\x00td)\xd1\x16\x94\xe4f)\xc3\x86\xec\xea(\
-Z\x1cODDd\x05)\x00\x12\x11\x91\x95\xe5f\xe3\
-6\xaeo3\x1e;\xef\xd5\x194S\x14D\x80\xe9\xc0\
-\xb2H\x22+\x88@\x18\x8c@\x07\x9b\xbf\xd1\xe9,\x95\
-\x11f\x01s\xb0\xa1\x17\x1aI\xd0G\x96\xd6\xd0\x9d\x9f\
-\xdc\x5c\x9bN\xc7\xb0\xa5\xd6\x9e\x17\x11\x11\x91SL\xd5\
-\xef\x22\x22\xb2\xb2<\xfbx2}\xf5\xcd\xabm\xf1\x5c\
-\x8f,\x1b\x00w\xb8\x9a\x9c\xc8#a7\xc1\xe9+\x80\
-@\x03\xe0@r\xcb\xe6\x0e\xa7y\xa4\xcc\x94\xcd=!\
-\x8d0\xcd\xd7\xafN\xc6\x93\xc6]\xe9\x8f\x88\x88\xc8\xaa\
-\xd1\xbf\x7fEDde\xad\x0d\xfc\x95\xab\xe5\xbf\xfd\x9d\
-\xad\xe9\x94\xf0!X\xc3\xe1\x15R\xda\x1d\x11\xcbi\xb3\
-\xf8U\xa1^\xb9;C\x00`\x02\xbd\x9f\x0a\x06\x07\x0c\
-`&\xea\xb0Aa\x850$ !UH\x15\x01\xa0\
-K\xb8\x99\xaf^)M)n\xba\xc8\x22\x22\x22\xabF\
-\x01\x90\x88\x88\xac\xac*\xd9\xb8\xf1\xaf\xbe^&;\x0d\
-J\xa0\x9b\x8d\x84ID\x1c|\xe8\xd1\xa9\xc2\xa3\x1c7\
-\x10\x88}\x1f\x0f\xec:,\xb8\xe6q\x92W\xe4\x91}\
-\xe1\xf6\xb3[\xa6q9P\x91\xb9\x84E\x00\x08s\x98\
-\xc3\xc1(-\x18\xaf\xbc\xdc\xfd\xf6\x97\xba\xe4H\xaa\x00\
-\x12\x11\x11Y9\xea\x01$\x22\x22\xabl}\x98\xbe\xf4\
-Z\xfb\x0b\xbf[\xfeG\xdf\xf7,\xd0v\xe3\xaf\xd5\x0d\
-\xdca\x8e~Ul\x000\xa0\x02\x81\x08\x100:\xe8\
-\xa09\x1d\xe8\xdb\xa7\x10\x0c\xb0\x03\xfa)d~l{\
-\x14rQ\xec\xf0\x10\xfd\xda%\xf6\x9d\xa3\x03\x04\x8df\
-$\x0a9\x0b\xcf\xdc\x00\x18\xc2`@$\x00\xb0\xc0R\
-\x95#a\x11\x06g\xb6\xa8\xad\xef[\x8c\x02\x8fY\x88\
-c\x00=8\x849\x19$`\xc5s\xe340\xcd\x0f\
-`7\xee0\x10\xb0\xfe\xcfC\x07\xb3\xef\xcbC\x09\xe0\
-\x9d;\xf2E<\x107\x1d\xf9\xde0X,\xd3T\x87\
-\xa0\x91'\xbe\xaafF\xc4\xd4\x8c\x08\x98%x&\x0c\
-H\xf4\x16\x8c\xec\x8d\xa1\xb4\x85\x84\xc1\x87c\x8clx\
-\xb9Z;\xf3k\xaf\xdf\xf8\xbdW\xa6\x83T\xa9I\xba\
-\x88\x88\xc8\xeaQ\x00$\x22\x22+\x8b\xe4\xb0N\xaf\xdf\
-h~\xe9\x8f\xa7\xdf\xf7\x99\xa7\x1f?\xf3\x04\xda\xd7r\
-\xdbd\x00A\xf8<\x05\xa8\x80\x84\x00Z \x02\xc9\x01\
-\xbaE\x06\x93\x87\x81\x04;D\xdf@%\xe0@\xae\xfa\
-L\xe2\xc8].:\xa0\xa5C\x87\xe5-[\x05Sj\
-X\x9a\x05\x16}\xb6\x02\x06:\xa0\xa1\x97\xddM[\x10\
-pDB$\x10\xc8\xcb\x9c!\x81\xceY\x1c\xb9\xf3*\
-F \x80\x16\x98\xc0\xb8\x9b\xe0\xd0\xc1X+\x91\x02-\
-i\xf0\xa9\xa7\xa6\x02\xbdqD\x82q\x16\xbd\x99\x03\x06\
-3\xd0\x01\x22xp?\xfb\x03\xa0\xe3\xaf\x8c-\x0c?\
-\x8e|\xe2\x81%\xd6o\xad\xbb\xe9\xf7nK\xbc\x1a4\
-\x16\xebN\x9c\xc6\x18\xc0\xe2\xd1\xf5_\x183r\x1d\x96\
-a\xa5Xc\xd6%\xb6\x01\x14\xba\xfb\xc64\xd6\xaf\xc6\
-\xb9\xb3\xe7\x9e\x7f\x13\xf1\xbbo\xdc\xb8:\xb6\xd1\xc0\xcc\
-o\xf3^\x16\x11\x11\x91\x87\x8e\x02 \x11\x11Yef\
-H\x9e\xae\xbcy\xed\xcb_\xfa\xea\xe5\x0f\x8d\xea\xc1\x85\
-\xb07`\x8e\xc6\xc0~\x8d$\x92(-;0\x0a\xe0\
-\x80'\x83\xd1\x18N\x03f\x13\xc6R\xf4\xe9\x8e\x11\xf6\
-v\x049\xcbZ\xf6P\xad\xebO\x15\xd8M3v\xe7\
-\x82\x1d\xc2\xfdI\xcd2\xbb\x9a\xffi\xfd\xd6f78\
-\xe0@\xd9\xdb\x0b\xc2\xe0\xf3\x10\x85>\xab\xef\x09\x98\xef\
-+\xae\xe1|\x0b\x9c\x7f\xb9\xef8\x0f\xecu\xe9\x03>\
-\xea\x92\x9a\xef\xdb\xc3\x91\xebgq\xb9\xd7\xc2\x18)\xc8\
-\x93&@\x84\xc1\x98\xc8\xbe\x16\xc8\x9cH`20\x01\
- \xa3\x80@5\xf4\x94m\xba\xc3A\x1e&O_\xf9\
-\xf2\xeb/\x7f\xf5\x86\xa5\x0d\xf3\xdbE\x99\x22\x22\x22\xf2\
-\x10R\x00$\x22\x22\xab\x8d)\xfb\x8d\xcd\xf1\xe7\xbf\xf0\
-\xfa\xfb\xde\xf9\xc2\xe5\x8d'\xdb\xf6fBS\xe5\x0d6\
-u_\xb4B\x04\xd01Z\x80t\xa3;\xc9@\x04\x19\
-\x06\xa0\x98\xb5}\x1ab@\xea\xc2b\xba\xe4\x0a\xd9o\
-\xc3\xb4\x9ae\x87\xf1\xa9;|\xb46K!\xfa\xbf\x0c\
-\xfd\xec\xa4~\x17\xc5\xfc\xaeZ\xee8\xfb\xcc\x02\xf3\x94\
-\x84\xe8/\xf7n&D\x18\xc3\x10\xce\x00\x012\x11\x16\
-\x00:x\xd9\xb7\xa5;\xbe\xc4\x0b\x8ev\xf16\x8eN\
-\x8e\xf6?\xe7\x98\x05\xd4\x97\x8b\x9c\x08[*\x8b1\xb7\
-\x18!\x0c\xc1L\x0e\x89Q09\xbb\x1a\xad\xb1\x00\xb0\
-\x04kJ\xbbu#{\xfb\xc4\xa5\xf7\xbc\xfe\xe6\xf4w\
-\x7f\xe5\xab\xaf~y\xab\xae\xcf\xba-\xa8\x8f\x12\x11\x11\
-\x91\x87\x95\x02 \x11\x11Yi\xc4\xa0\xb6\x9b\xcd\xf0o\
-\xfe\xea\xe4f\xf7\xfa\xff\xfc\xa7\xcf\x8d\xd6.Ln^\
-I\xe6\xd1:\x01K\x9e\x18)\x19\xdd\xc8(V\x18$\
-\xfa\x9a\x0b\x06\x08\x0b7\xc2\xd1\x8f\xea\xc3\xfb)P\xab\
-<@>r\xb6\x12w\xfb%\xed\xfd5o\xd0s`\
-\xb9\xf1e\x1c5i\xea\xc8\x22\x9a}\xd3\xb8\xfa\xbf\xf7\
-\xd7\xaap\xfe\xf9]\x06m\xc7\x048\xb7{\xce\x82/\
-\xef\xd6\xb1\xd9\xd1\x82\xe34\xc2AC\xd0P\x12a\x80\
-\xf7E]\x0e \x03\x81\xb2\xc9\x08\x8c.\xad\x83\xdd/\
-\xfe\xfaW\xff\xb3_\xb5\xcdr\xb1\x1e\x86\xfa\xff\x88\x88\
-\x88\xac$\x05@\x22\x22\xb2\xca\x08dc\xb1\xfcg\xaf\
-W\xff\xbf\xdf\xba\xf1\xc3\x9f\xb8\xf4\x81\x17\xbfe+\xbd\
-\xd66W\xd7\xfd\xba\xa3)\x0c\x04r\xb0\xf2\x12\xc6\x14\
-(%\xcc\x0070\x91\x09\xd6\x8f\xa4A\x03\x89b\xa5\
-KK\xae0\xb5\xb8\xb7\xcc\xfdq\xb2\xe3\xec\x1f]\x85\
-y\x1cx\xa6\xd1\xfaYUf\xe8\xe7\xd5\xd9\xac6\xc5\
-H\x03\x92\xcdr\xa0\xa9\xcd\xd6Z;\x19\xa7Y!\x18\
-\xb3.K{\xfb\x9c\x1d\x15\x0df\xc5H\xa0\xc0\x08\x14\
-'\x00\x94\x94\x0a\xdd\x18\xb3\xb9|8\x18\x00\x1dy\xf6\
-\xec\xcfa\xc1\x84,[p\x06q \x8c9\xf8\xb8\xa3\
-gj\xd9lJ\x9a\x95\xa3\xee\xbd\x0d\xa3yT\xf3B\
-\xa8[\xee\xb5\xe3\x0e\xd5\xe9]\xa0\x00\x04;\xf8\x8ec\
-\x9a\xc2St\xc6\x06\xc9PP\xb6\x882\x1a\x5cz\x0e\
-\xf5S\xbf\xfd\xbb\xaf\xfc7\xbf\xf9\xea\x17\xc7\x17.\x9c\
-\xad3\x969N\x11\x11\x119\xfd\x14\x00\x89\x88\xc8\x8a\
-#\xe1\xc6K\xe7\xea\xaf_m\xfe/\x7f\xf7\xad\xbf\xfe\
-ol<\xf7\xf4\xb3\xd5$W\xcd\x8e\x95q\xc7\xaeD\
-\x87\x06\xa9\x82\x1b@$\x80\x84\x15\x0bXXBx\xf1\
-\xc4@X\xd0H\x80\xb9,Wd\xf2\xc0\xf3\x9f\x13\xa7\
-T}\xbb\xe7\x8c\x83\xb9\x02\xcd\xf6\xd5\xf9X`\xbe\x14\
-V\x02\x12\xe0@\x0a\x18\x10\x8ev\xb9s\x9c\xf5\xf09\
-\xd0C\xc7w\x0f\xa9\xafH2\x84\x03D\x01h\x0c\x04\
-hha\x9d\xbb\xd3\x08#\x03\x8bb\x9d\xd9\xae\xfa\x98\
-f\xe1\x82l\xc7\x9f\x84\xb1\x1c\x98\xecu\xa8t\xe9\xc8\
-\xf6\xcf\xfd\xb9\xdc\xc9\xb1\xdd\x8a\xc6\x94\xbb\xaa\xff\xfc\xa8\
-\x03=\xeeP=\x00\xa4\x0e\xd1G]\x0dh\x99\xe6(\
-\xb0@\x076\xf0\x9c\xec\xc9\xc7\xb1q\xe97\x7f}\xfb\
-?\xfa\xdb[\x7f\xf6\xe6\xfa\x85\x8d\xa4\xf4GDDd\
-\x85)\x00\x12\x11\x91GB\x95Pr\xf5\xdf\xfe\xc1\xcd\
-j\xf0\x95\xff\xd9_z\xf1\xfd\x8f\x9fw\xdf@\xdb9\
-\xbbh\xc7\xec\x1a\x14 \xcf\x86\xf0F h\x08\xb3\x02\
-\xa6~\x85s\x9a\x85\x19\x0d\xb1\xccH\x1e\xe8;\xdd,\
-c\xc9\x82#\x00'\x0d\x9d\xe6\xbb\xb1\xb0}\xcb\x9c\xcd\
-\xaa}\x008\x8c{+\xc4\x1b\x00\x9au\xe8+M@\
-\x9b/\x18v2\xbb\xe7G\xc2b^l\x04\x9a\x13N\
-\x04\x09\xa7\x19\x0afk}\x010\xd2\x0d0z?\xbb\
-\x89\xfb\x1a\xe5\x1c\xb3\xda\xd6\xbe\x96B\x80\xdb\xb1\x11\x10\
-q\xa2\xebM\xa0\xefI=\xff\xd2\x8e\x8c\x81\x8e\xab\x0f\
-\xba\x0dc\xbfB\xdd1\xcf\xe5qoEZ\x00\xd3\xaa\
-\xaf \x02hF:\x02\x11\xb0R\x069\x9dI\x97\x9f\
-\xc7\xda\x13\xbf\xfa\x1bo\xfe'\xbf\xf0\x8d\xdf\x7f\x0d\xb9\
-Z\x1b.\xfb\x06\x15\x11\x11\x91\x87\x82\x02 \x11\x11y\
-$\x041\xac=0\xf8\xfb\xbf;\xb96~\xe9\xaf\xfd\
-\xf0\xf0;_,i\x90R$\xb7\x00\x1b\xebC\x0c\x9f\
-\xaf\xd7\x140D\xea\x0b\x22\xc2`\x19\x96\x00+\xa9+\
-\xbe\xbb\xd4\xd4a\x8b\xe6\x0e\xdd\xa6\xead\x01\xbb\x8b\x05\
-\xe4O\x16:\xcc\xa2\x17'\x01\x90{IJ\x9f\xfe\x10\
-`\x9e_\xa3\xfed\x03laA\x94Y\x91\xd0R1\
-\xc7\xbe\xcb\x19\x06/f\x00\x82\x89\x1e\xc6\xb0\xd9\xbe\xbb\
-\xd9\xbf[H\x00f\x09f\xb9\x80\xb3\x00)\x80\xddy\
-c\xbc\xa53\xd1\xbe\xa3\xdaW\xc2t\xa4\x00\xed\xb8x\
-\xc8\xe0\x07\xce\x8f\xfb>9fw\x00P\xfa\xf7\xd3\xc9\
-\x99\x11\xd9\x16$\x80<j\xb9.\x83\x91\x9d\xa3\x19\xc0\
-;\xab'}\xb2\xd99\xc2\x11d\x1e\x5cN\xf5\x07\xcb\
-\xe4\xfc\xdf\xf9'W\xfe\x0f\xff\xe0\xca\x97\xae\xda\xd9\xb5\
-\xecw\xb1\x8e\x9b\x88\x88\x88<\x14\x14\x00\x89\x88\xc8\xa3\
-\x22\xc8\xd1\xc0\xdd\xf8O\xfe\xc5&&o\xac\xfd\xc8\xe6\
-{\x9fY\x1b\xac_\x1c\x0d\x1fC\xba\xd1\x8do\xb0-\
-@1\xa3\xd1`\xb4\x00\xe1\x80\xf53\xa2f\xd3\x8c\x08\
-\x94cJ<\x80\x05\x81\x8b-^\x06\xea~\xf5\x07:\
-Y\xf7\xe0>6\xe9Kz|\xdf\x83\x8cfpc\x02\
-\x1d\xec3\x10\x12f\x08\xb3\xbe`\x88\xe4\xb2\xe9\x8f\xcd\
-3\xae\xbe\xf2\x0a R_W\x03\xf6\x155\xf3\x06\xd4\
-\xfd\xff\xdcK\xa0\x9f\x8be\xb3+\xc7Y\xe4c4\x07\
-I;p\xad}\xdf)\xcfs\xa68>S3?\xf6\
-\xe58n\xc1\xfb\xfd'\xce\xdd\xf9k\xbb\x8f4`6\
-+\xeb\xb8]\x1e{O\xd8\xb1U>\x98\x07qG\xdc\
-Nc\x06\xd6\x11m)\xa5\xb0C\xce\x18TV%c\
-\x95\xaa\xc7\xff\xf8%\xfe\xcd_\xfc\xd3\x7f\xf4\xfbo\xbd\
-\xbc\x8ds\x1b\xb5\xba>\x8b\x88\x88<\x0a\x14\x00\x89\x88\
-\xc8#\x84\xc1a\x05;\x93\x7f\xe3\xa5\xc1\x7f\xf4\x0b\xd3\
-\x1fx??\xfa\xd1\x8b/\xbe\xf0\xf4\xa5s`\xba\xc2\
-\xe9\x8d\x14\xdb\xc6&J\xcb\xd2x\xeah\x04\xa3x\xd0\
-\x18\xde\x861\x87\x0f\x9b\x0a\xc7%+\xc7\x8f\xa4\xfd\xd8\
-\xe7\xdc\xee\x99F \xdd\xd9\xf9\xdd\xe2\xb8\x15\xc4\x8f\x0b\
-8\xfaP\xa7\xc2$1\xcd\x0f\xd7f\xc5>\xc9\x98=\
-\x92\xbbes \x82c\xe3\xc4<<\xc3\x1d\xec\x80\xb2\
-\xcc\x02Z\x00\x10\x8e\xe83\xa7\xa0Y\xec\xf6Kf6\
-\x98#\x90\x1c$Kgi\x00\x1f\x94\xb6\x9aD\x9d\x10\
-\xebl\x0c\x1dl\xd6\x01\xda<\x10\xc0\xe1f@>_\
-\xb2~\xaf\xbb\x10\x8f_[\xfd\xf8\xce\xca\xfd\xbde~\
-U\xe6\x97l\xf7\xb3Y\xc9\xd4\xee\xec\xb9\xddW\xcd\x80\
-X\xd4v\xfa\xf8\xf8\xcfx\xfc\x8b\x88c\xdeQ\x06 \
-\x10#\xf8S\xf0\x08\x5c\xeb|jk\xc3t\xe6\xcc\x04\
-\xf5[7G_\xfb\x12\xfe\xd6/~\xe5\x17~}\xd3\
-S:w\xa6\x02\x17\xbe1EDDdU(\x00\x12\
-\x11\x91GK\x10\x83Lb\xf0;\xdf\xb8\xf8\x8d\xeb\xcd\
-S_\xbc\xfa\xd8c\x93O\xbc8\xfa\xc9O\xad]>\
-{\xb1J\x1bfc\xb4\x13\xc4\x14\x1e\xf0\x02D\xe5\x01\
-\xef\xe0-\x11\xd6%\xb4\x15x|\x82\xb2\xc0\x82;\x17\
-\x0c\xf2\xeffn\xceI\x97\x0f'`\x18\x0e`)\x82\
-\x96\x0c\xc9@\xc0\xc2\xc0lL\xce\x04$XB\xd7\xa4\
-BD[\x22\xa2 \x19,\x11qL\xfb\x9de\x8ex\
-7~2\x98\xc3\x9c,\xa5Dtm\xaa\xebT\xaf\xad\
-\xd5\xe7\xab\xa1c|\x13\xed\x14n\x06\x821[i\xcb\
-\xca|\xd2\xdc\xeeZ\xf1v(\x00ZXqe\x0b^\
-\xaa\x05\x01\x90\xf5\xeb\xae\xef\xd9_D\x15\xcb\xad\x02\xb6\
-T\x07(\xc2\x0a\x9a\x0dt\xe70\xac\xaajX\xf9\xf4\
-&\xdb+\xd7\xb6~\xe5\x8f\xe3\xef\xff\xe6\xc6\xabo\x96\
-W\xdf\x9aT\xf5`X\xdb\x82\xf7\x9d\x88\x88\x88\xac\x18\
-\xfb\xc8G>\xb2\xb5\xb5\xf5v\x1f\x86\x88\x88\xc8\x03e\
-@\xd0&\x1dK\xdb\x95\xd2]\xdc\xe0\x87\x9f\x1b\x9d?\
-3x\xf6\x89\xea\xfb\xbey\xf4\xf8\x85\xf5\xcas2\x9a\
-G2\x96\x04Z\x17h\x02%u\xa9*\xd5=>\x1a\
-2\x16\xcd\x0e[~\x8c~\x5c\xa7\x9bckQ\xfa\x16\
-\xc6\x8eBv\xb4\xe4L\xd67\xd4I`\x06\x93\x13\x1e\
-\xce.\xd0n\x8e\xea\xe9\xb9\x8d\xcep=\x9a+\xe6c\
-\xcb}\x9b\x99\xa5\x0e\xb4\xefO\xe3\x1d*\x06\xac\x9b\xb5\
-\x13J\x80\xa5(\xce\xb0l0vM\xe9XG}a\
-R\xd6\xb7\x9a\x81\xe75\xf7s\x16\x99\x16f\x01\x16Z\
-\x0b\x90\xb3Z\x9b\xd8\x0b\x80\xe8\x07'\x82-\xdd\x8f\x09\
-\x98\xad\x93u\xd4\x06\xcc\x16n\xf8\xf8\x00\xe8\xf8W8\
-,\xe8\x0bf\xd6-\xe8\x0d4dsv\xdcp\xa7\xdd\
-\xfc\x8d?\xbd\xf6\xab\x7f\xb25\x9eN\xbe\xfa&\xbf\xf6\
-z\x05\xb3\xb5Q\xaa\xb3&~\x89\x88\x88<B66\
-6T\x01$\x22\x22\x8f\x22\x02f\x5c\xab\xc1\xba\x02\xea\
-\x9d\xa6\xfc\xd3?\xee\x88\xee\xcc\xc8\xff\xf1\x1fL\xcf\xae\
-\x8dSN\x0e\x98a\xd6M\xc6@\x04\x18}7\x9c{\
-{0\xa7j \x1e\x00\x02\xcf\x0d\xe3\xf9\x8d\xee\xcb;\
-\xe9k;);\x00\xeb\x17\xba*\x81g\x87x\xd6Z\
-p\xf2\xfc\xb3\xe5\x13\x1f]{\xc7\xe3\xe7\x9d\xdbh\xc7\
-,\x84qq\x1b\xec\xe39\xe00\x03K\xf4q\x0d\x1c\
-\x91\x13\xddK\xb1R\x18\xb0l9[\xaaG\xado\x5c\
-\xf9\xc6\xf4\x9f\xfc\xce\xd5_\xfe\xd2\xb9&u\xee\xd9\x10\
-\xfd\x5c\xa9\xe8'\x82\xed\x1d\xc2n\x13\xeb\x05m\x9bN\
-j\xde\x90h\xe1\xdd\xb7Zn\xf7\xb3\xf7\xdc\x12\xcf\xb4\
-\x09\xcb\xf5i\x13\xd3i\xfb\x8d+\xd3W\xae\x85\xd9\xda\
-\xda\xc0/\x9c\xa3\x19\xc9\x05s\xe0DDDd5)\
-\x00\x12\x11\x91G\x17g+~sX\xdb\xb0\xae@\xb6\
-\x85_\xf8\xea$bg6\x90\xb7\xdd\xbf\xfb\xc5\xa5\xee\
-W\xb3\xe6S\xd1\x02z\xfe\x94B\x5c\xc8\xf1\xd8 \xae\
-\xb4\xe9zc\xc9\xf7\x96F/\xc4\x85\x8a\x1b\x86\x8d\xed\
-\x1b\x9fyu\xfb\xa9\xa7_x\xc7;.!\x9f\xc3t\
-\x82h\x96:\x0dbw\x92\x97\xf9\xac\x91\xb4\x01\xa0#\
-\x9cf\xd9a\x09m)\x8564\xaf\xeb\x9cG\xd7o\
-\x8e\xff\xf9\xbf\xdc\xfc\xa5/\x8d\x22]\xf5~\xcd\xfa\xd9\
-\xc6v\xd7\xa7\xbf\xcd\x85x\x88\xd2\x8fY\x83\xeb\xa3-\
-\xc8\xa1\xd8\x17t\x99\xd9h\x90\x9e\xbc\x90\x01\x12\x85G\
-\xae\x1b&\x22\x22\x22\x8f\x00\x05@\x22\x22\x22\xbbI\x10\
-r\xb2s\x1b\x89H\x8f\xf4 \xd9P\x02\xdf\x08\xcb5\
-\xcf\x0f\x0e\xdf\xd5\x05_\x0d\x0f\xef\xde\x15\x1b\xf4g\x99\
-/Z7\x0d\xdb\xf4\xec\x88\x16\xe8\x96\x8a\xb3\x1c\xc8@\
-\x17\x86\xbe\x93\xb2\x81\x8e0\x02\xc9\xe0\x09]AA\xe9\
-P\x8a\x97\xe1\xc6\x18\x93\xed\x0e\xc3Q\xceu\xa5\xf5\xcb\
-\x8fe\xd8-|Z4\xc7PDDD\x1e\x0d\x0a\x80\
-DDD\x0e\xb3\xfbV\xe9\xf3\xb0pG\xe5Gg\x06\
-\xee\x96\xc0\x1b\xc3\xe1xm\x88\x9c'\xed\x84\xe3\x9b\x8e\
-\xed\xe1\x90p\xa2[n\x876[3\xcb0\x9fEf\
-\x00\x0d\x810\x90fH5\xe8\xd6\x94(\x91\xbd\x1e\xe6\
-\x81\xb9\xc3\x0d\xfeh\xbfR\x22\x22\x22\x22wH\x01\x90\
-\x88\x88\x88\x9c\x90!\xd3;\xdb\xbcQ\xbf2\x1eT\xe0\
-\xebu5\xe1\x00\xb6\xed\x88\xe5Z$9\xe0t\x0f\x03\
-\xd8\xf7\x00\xc2l\x01\xac\x8e\xe8\x08\x03\x06n\xb9*V\
-\x99W\xd7\xbb\x8d?\xbbq>h\xa6\xf2\x1f\x11\x11\x11\
-\x91;s\x8f\xdbX\x8a\x88\x88\xc8\xa3\x80\xb0\xd6J\x0c\
-\xba\xbc\x01_+mF\xd3\x22\xca\xd2\xdd\x8c\x0c0z\
-\xbf\xfa\x17\xe8\xa0\x13F\x90\xb3n=\x04\x02\xc1h\x83\
-ni'\x86o\x8cG<e\xfd\xb3EDDDN\
-3U\x00\x89\x88\x88\xc8\x89\x11\xcc1\x1c\x96\x9ccb\
-\x1db\x1b\x06[\xdc\xaf\xf8\xd8-\x01\xb0\x02\xef\x80\xa0\
-\xc3\xc2r\x03\x00\x1e\x84#\xccJ\x95\x8dH\xa5Xt\
-ky{P^9C\x1f\x18\x1b\xfd\x1eKDDD\
-\xe4\x8e)\x00\x12\x11\x11\x91%0q\x98Zcw\xb3\
-j\xbb\xdc\xc0R?u+\x96\xdaZ\x07\x00,\x00\x0c\
-\xa8Z\x80\x80\x03\x09\x91l\x9a\xaa\x0c\xa4I\xe4\x8e9\
-MP^\xddhkG\xa5Bf\x11\x11\x11\x91;\xa7\
-\x7f9\x89\x88\x88\xc8\x92\x02\x00f\xabv\xc1\xefC\xe7\
-\xec\xfd\x1d~\xfa\xad\x13\x80\x03\x06u\xff\x11\x11\x11\x11\
-9\x09U\x00\x89\x88\x88\xc82\xe6\xedy\xf6-6~\
-\xaf\x1c\xdc\x9a\x91\x80\xc1\xfb\xdf[\x19,\xd3\xf4\x1b,\
-\x11\x11\x11\x91\x93\xd1\xbf\x9fDDD\xe4\xe1\xa2\xda\x1f\
-\x11\x11\x11\x91\x13S\x00$\x22\x22\x22\x0f\x99P\x08$\
-\x22\x22\x22rB\x0a\x80DDD\xe4\xd4\xb3Y\xe4C\
-\x9b5\x1dR\x02$\x22\x22\x22r\x22\x0a\x80DDD\
-\xe4\xedF \xf6\xb5\x12\xe2^\xbe\xc3>\xf49\xf4h\
-\xb3%\x16\x9c\x17\x11\x11\x11y\x94)\x00\x12\x11\x11\x91\
-S\xc1p\xef\xdbI\x8b\x88\x88\x88HO\x01\x90\x88\x88\
-\x88\x9c\x0a<>\xfd\xe1nE\x90\xf2!\x11\x11\x11\x91\
-\xa5(\x00\x12\x11\x11\x91e\x90 i\x80\x9b\xc3\xb0?\
-\xa5Y\x8eq\xf6\xb1o\x1f0s3c\x90$\xdc\xcc\
-\x1d6\xdb\xaf\x88\x88\x88\x88\xdc9\x05@\x22\x22\x22r\
-\xd7\xee[\x1ecGm\xfcn\xa3&\x11\x11\x11\x91G\
-O~\xbb\x0f@DDD\x1er\x06\x98=\xc8\xc9Y\
-4S\x02$\x22\x22\x22r\x22\xaa\x00\x12\x11\x11\x91{\
-\xe5\x01\xc52\xd4*\xf0\x22\x22\x22\x22'\xa4\x00HD\
-DD\x96C\x92fff`_\x04\xb4l\x15\x10\x01\
-\xee\xeb\x01\xc4\xdbd<\x0a\x80DDDDNJS\
-\xc0DDD\xe4.\xf4I\xcc\xd2\xd1\xcfAZ\x06^\
-DDD\xe4>Q\x05\x90\x88\x88\x88\xdc5\xc56\x22\
-\x22\x22\x22\xa7\x9b\x02 \x11\x11\x11Y\x06\x01\x1a\xe1\x05\
-V`qw\xdb2,Z\xd8\xbdo\xf9L \x80\x00\
-\x8a\xa1\xdc\xd5\xeeDDDD\x1e=\x0a\x80DDD\
-d\x19\xf3\xe9Z\xf3\x05\xb9l\xe9\xc6<\xb7y\x9a\xed\
-{\x10-\x00\x06\xaceR\xdd\x91\x88\x88\x88\xc8\x9dS\
-\x0f \x11\x119=\x96\x8f\x10\xe4A\xa2{g\xc8\xb0\
-3\xbc\x98\xc7\x17\xcb\x96[\xd9\xb4z\x02\x8c\x97\xda\x9e\
-!\xb7`\x07/\xd6\xd7\xf7X\x82\x11\x16@X\x17\x95\
-5\xccl\xbb<)\xeb9.\x0e\xca\x93g\xb9\xf9\x81\
-\xea\xeb\x7f\xd2l\x04j\xd7{FDDD\xe4\x0e(\
-\x00\x12\x11\x91S\xc2\xc8{\xd5J\xf80\x12\x80\x99\x1d\
-H\x0ab\xdfW\x8a\x10\x8e\xb0\xef\xa2\xd8\xfe\xdbRj\
-ol\x0d\xaem\xad]:\x83\xf6\x9cO/\xb0%\xf8\
-\x1a\xca[\xf0\xe5\x02 \x22u\xb3O\x03\xa0\xc3\x1c0\
-x\x0b\x80%\x80p\xc3\xd4s\x17\xe7\xcd\xde\x15\xf1\xae\
-z\xf2\xe5g\xda?\xfe|7\xec8Hz\xf5\x8e\xc4\
-\x03\x95S\xbd\xdd\xef/\x03`G\x14PQUU\x22\
-\x22\x22\xabK\x01\x90\x88\x88<Z\xfa\xc5\xcaK`\xdc\
-F\x10F\x92\x04\x03\x98\xad.N\xd0\x1c\x0b\x06\xc2\x8f\
-\xc4\x08y\xdetg_b@\x00\x06v)\x9f\x99\xde\
-|\xdew\x9e\xaa\xc6m\xf9:1N\xc3\xeb\xed\xf4\xa6\
-\xb5\xd3\x9ci\xf9.\xe34\xdf\xdb'\x01\x03\x0d\x0c\xb0\
-\x00Q\xdcv\xdc7\x81\xab\xa9\xda\xb4\x01\xbb\x1b]\xbb\
-3\xf1\xa3\x82\x8cG\x1c1{3\x03f\xfd\xeba\xfd\
-Kh\x00\xcc\x8d\xe6u\xe5\x83\xf9?\x03\xa9\x0cMD\
-D\xe4\x11\xa0\x00HDDN\x09\xde\xa7\xf2\x1f\xcc\x0a\
-\x1f\x18\xb4\xaep<\x8d6x~\xc0O^\xf2a\x9d\
-<c0\xf4\xba\xb2\x94<\xb9\xa5\x0c\xc0\x22\x0a\x19\xb7\
-T\xc0\xccnx\xa8\xfa\xe7\xed\xbf\xa6w:\xca'P\
-\x008h \x106+\xa1\x02\x99\x01\x83m\x94\xcb\x17\
-\xb0\xf5\xec\x13\xdd\xf9\xf3oY\xbe\x09{\xab4[\x04\
-\xdd\x90\x96:\xcay\x00a\x06\x07\xe6\xcd}\x08\x18\x92\
-\xc1\x0d\xe1\xf0\xe8\xba\xeeZ\xd3x\xaa\xfd\xf2;\xf8\x99\
-O]8\xf7\xdap'\x0f\x99\xee\xf0\x159\xf4\xf6Z\
-\xdd\xcc\x83 \x18\x09m\xa6\xc1\x8c\x04\x8c\xc1\x08\xb4-\
-H\xb4\x0d\xb7w\xf8\xf5\xab\xf1\xb5ka\xb0\xba\xb2\xba\
-67\x87A\xf3\xe9DDDV\x98\x02 \x11\x11Y\
-Yf \xd1\x15\x04YJ\xecL\xe2\xf13\xf1]\x1f\
-\xb2\xe1`\xed]\x17\xd2g_\x18\x9c\xd9\x18X]\xad\
-\xad\xd5\xf50'K\x96\xac\xca0\xb3\xd2\xb5%\xba[\
-\x02\xa9\xf9\xd8\x98\xbeT\x19\x10o\x89c\x0c8\xb8x\
-\x96\x1d5\xfc^\xb4<\xd6r|\xf1\x5c\x9f~\xce\x95\
-y01\x0c\x9dG\xb0DIVRe\xb9\xb6\x5c\x1a\
-t\xcdx\x80kg\xd7v\xc0\xad\x88\xc6+z\x86\x13\
-\xe8\x96.\x91\xb2\x83\x9f\xefeB\x96\xe0\x194\xb4m\
-7\x19oz\xba~\xee\xe2\xf9\xef\xfd\xec{~\xd0F\
-m=\xe8\x80c\xd2\x9c\xdds\xbc\xbb\x15\xca\x1e:\x84\
-\x01]]\xa6\xa3\xd6\xcc\x9c\x06\x06;D\xe1dj]\
-\xf1\xb6\xc1\xceV\xbc\xf4z\xf9\xc27\xda\x9d\xad\xc9\x9f\
-~}\xeb\x8f\xbe\xde\x05\x1c\x96\xaa\xec\xa3\xca\xee_\x14\
-+\x22\x22\x22o#\x05@\x22\x22\xb2\xb2H\xb4\x1d\xb6\
-w\xa2D\xf7\xee\xc7\xdb\xcf};>\xf6\xee\xb3\x9f~\
-\xf1\xecF\xaeFy<Z\xdbL\xf5\x0eR\x86\x19\x02\
-\xe8\x0a\x18\xb3\x08f\xcd\x0e\xa43\x87\xd68\xe7r5\
-@\x07W:7\x1e\x15[\x1c\x19U\xd8\xd2\x99\xca\xc1\
-\x0d\xee;l\x1e\xb7M\x07\x00\x0b\x98\xc1\xfb%\xde\x11\
-V\x08F$\x96*c\xe8i\x04\x001i\xc67\xa7\
-\x93\x1b\xcdd\xecV\xc2PU\xb0\xee\xa8M\x9e\x80\xcf\
-?v\xbf,\x00H\x18PU6\x1c\x82\xe3q\xb4\xaf\
-\xe6j|\xfe\xe2\x99\xe1\xb0C\x5cE\xf4{\xbd\xf5b\
-\xf2`\xa0v\xe8E\x5c\xaeV\xe9aaL\xedd\xd8\
-\x9aY\xa2\x01\x01\xc2\xe1%,\x8a\x83\xa3\x94F\xdf\xf1\
-\xa1j:\x19m\x8fG\x7f\xfe\xf2\x99\xdf\xff\xd2\xf8\x8d\
-\xb7\xb6^{\xe5\xc6\x9f\xbe\xea_\xdeY\xcbu\xaa\xfc\
-~5\xe4\x12\x11\x11\x91\xb7\x8b}\xe4#\x1f\xd9\xda\xda\
-z\xbb\x0fCDD\xe4^r\xb7\xa6\xc3\xd5\xcdrn\
-\xd4|\xe6\x9b\xd7^|\xee\xb1\x8f<\x93>\xf3\xbe\xe9\
-\xe5:\xa1\x1b\x02\x8e\xb8\x86\xe6+\xb0\x16\x9e\x11\x81\xae\
-\xa0t`\x84\xd3\x00\xf3~\x0a\xd2<28\x14\xf8,\
-=K&\xf6m\xc8\x8f\xcaz\x8e\xdc\xf2\xfd\x18\x87\x13\
-{gu`\xa7}\xf7\xe5\x80\x93\xf3\xd8+\x0c\xe8\xcb\
-\x82Jr[KyH\x1a\xadD\xd7ve+\x8f\xc2\
-\x13Hx\xdf\xcay\xa9\x0a \x1a\x00\x07\x13\x90,v\
-\xe7!u\xf0f6\xf9\xac\x02\x0dA\x94@!\x88\xf5\
-.\x86\x99\xb1\x1e\xdb\xc6r\xf84f\x07\x10\x8b\x8e$\
-\x1e\xaa\x99|'b\x00\xd1xlg\xc0\x909\xbb\xd1\
-\x0dn0\x98q\x0d\xb6VX\x97X\xf7tv\xb8~\
-.Y\xfd\xd6\xd5\xf1\xb57\xae\xff\xca\x1fO\xfe\xc6\xaf\
-\xe1K\xaf5\xc3\x01\xcf\xae\x19\x00\xaa?\x90\x88\x88\xc8\
-J\xd8\xd8\xd8P\x00$\x22\x22+\xc5\x80.\xb0\xb93\
-\xbd4j>\xfe\xc2\xf0#/\xae\xff\xe0\xa7\x06\x1f~\
-\xcf\xc5\xba\xe2\xf8\xea\xb5\xf6\xfa[\xf5\xb4T6D\xd5\
-zu\xc3\xacc8\xfa\xc9B}\xdb\xe3>\x16`g\
-\xb3>\xba\xfdFgmt\xe7_\xd9\x92\x19\xd0\xe1\x0a\
-\xa0\xb7\xd7\xbe^\xcb\x07\x11 \x19\xd6\xf7\xff\xe9\xc3\x22\
-\x82Ff\xa06\xabQ\x08\x06\x12Rj\xad\x9a\xa2f\
-\xb4h&\xccDN\xcb\x04d\xecW\xa5B\x02\xfb\x00\
-\xa8\x7f\x19:x\xdb'e\xa5\xa0\x00\x96\xe1\x0e\x9a\xc1\
-\x87m\x97\xa2\xeb\x06,\xd9n\xd9\xa3\x1dsb\x87\x1f\
-\xf4\xb6\xbf\x04\xf7\x89\x01\xec\x1c\x8d9\x10\x16\xdc\xed\xe1\
-d\x80y\x06S\xd7\xa1 \x17\x1b\x19\x06nU`\xc4\
-4\x18\x0d\xd2\xf6\x04\xbf\xf9\x15\xfc\xf3\xafm\xfd\xe6\x1f\
-\x5c\xfb\xbd?e\xae\xea\xb5\xb5\xcaW\xf7J\x89\x88\x88\
-<:\x14\x00\x89\x88\xc8j!\xae\xef\x94\x81\x95o{\
-a\xfds\x1f\x7f\xecG>\xb9\xf1\xc4ecw=w\
-oY\xb9\x96\xbaqU\x1a\xeb\xa2\x9b\x80\x09\xd5\x1a\xe8\
-\x88\x00\x08s\x98c\xb6\x1a\x18a\x0e?\xd4\x91\x06\xfb\
-\x0a[\x8e\x9c\xbcug\x87wx\x9b\xa7\xc1\xad\xe7\xb2\
-[\xc8\xd3O\x93\x8a}ks\x95\xbe\x1a\xc7A\xa2v\
- JiP\x91\x19]\x03\x0f\xd4KM.\x9f'c\
-\x0ef\x8b\x04&\xc0\xfb\x0a x\x07\x03[\x94\x84T\
-\xc1\x80(\x80\x9bW\x88B\xeb`\xb7\x9e\xc2\xe9\xb9\xb6\
-o'CT\x08\xcc\xe7\xbeE?\x11l\x86\x80\x1br\
-\x05K(\xd6u\xde\xc1\xaa\x94\xd3p\x1d\x17G\x9b\x83\
-\xc1\xef|a\xf0\xab\xbfQ\xfd\xc6\x1f\xde\xf8\xed\x7fu\
-sm-\x0f\xab\xe4o\x7fd)\x22\x22\x22\xcb\xdb\xd8\
-\xd8P\x0f \x11\x11Y\x11$v\xc6\xcd\xe5\xf5\xf8\x89\
-\x8f\x8f~\xe2\xd3O|\xcb\x87\x9e\xca>\x9d\xee\xbc\xc1\
-v+\xdam\x96\xb1Y\x8bl\xc8\x9e\xea~Xl\x0c\
-\x84\xc1m>\xfd\x88\xb0~E\xaa\xdb.\x86t\x0f#\
-\x86\x03\x9bz0c\xec\xdb\x1c=\xdd-\x99\xd9\xbc\xf9\
-\x91\xef&^6\xbb@\xee0\x83\x19\x81\x08C\xf1T\
-\xb3\xaea\xdd]\xb6[\xe6\xbe\x8f\x00\x00\xa6>\x93\xb3\
-\x84\x9c\xd8\xf7e*\x0d\xe0\xbbM\x8c\x8c\xb7\x9e\xd0q\
-\xdd\xbb\x0f\xdcv7\x9d\x95N9\x02@\xc9\xd68\x08\
-$\x9b\xc5=}St\xce_M\x12]\x0b\x0fX\xca\
-\x15,`(\x9c\x94\x9d\xb7nL\xcf\x9e\xfd\xe4\xfb\x9f\
-\xff\xf6\xf7\x9c\xff\xed\x0f\x0f\xfe\xcf\xbf\xd0\xfc\xca\xe7\xb7\
-Y\xea\xb5QZ\xd5\xeb%\x22\x22\xf2\x88P\x00$\x22\
-\x22\x0f+\xc2v\xe7bY\xb2\xeb7\xbb\xa76\xec?\
-\xf8\xa9\xcb\x7f\xf1\xd3g\xd6m\xc76\xff\x00\xcd\xb8j\
-\x1bO-P`F\xf7@g\x06VFx)\x19\x00\
-\xc1Y]D\x9f]\x1c\x88\x05x\xa0s\xf0\xee\x84\xb0\
-%\x83\x83#\x13\x07>\xf05\xaa\xec\xe0\xec\xa7C+\
-\x9a\x11\x00\xbc\xceH\xc6\x80u@\x81\x15\x84!\xfa\xd0\
-$\xcdr\x048\xc2\x80\x9csb\x02:\x82\x1d\xd0,\
-\x99a\xcd'm\x19\x0b`0\x03\x0c\x04\x98\x11>;\
-\x8cB\x14\x90H}\x7f\xe2\x0e\x00:K<\xa2Y1\
-\xf7\xbd\x9c8\xea\x0a\x1b\x98o\xe9\xed\xb42Hc\xe2\
-0w#\x18\x80\x00\x0b\xa2\xc0\x0b\xac\x80\x05\xd6\xcdB\
-=\x12Q`\x01\xef\x92\x03$\x89\x9a\x11[;\xcd\xcd\
-\x1b\xb9Z\xfb\xce\x8f>{q\xe3\x9d\x7f\xf7\x97\xaf\xfe\
-\xea\x1fm\xfe\xe1+qv\xdd\x93CM\x81DDD\
-\x1eR\xe9\x89'\x9eh\x9a\xe6\xed>\x0c\x11\x11\x91%\
-\xcc\x86\xfe\x04nl6O]\xac\xfe\x97?\xfb\xae\xbf\
-\xf4\x9d\x17\x07\xbec\xd37\xb1s\xc5\xca\x8e[k\x08\
-C\x98\xd1\xac\xd0b\xde\xc0\xc7\x18\x09\xf3\x05\xafI\x03\
-g=R\x0c\x06\x18\xf7R\x12;\xf4\xb1\xec\xeaHv\
-\xf4\x82\xee\xb6\x7f\x17G\xb9W\xe3m\xdb\xfdk\xff\x87\
-\xcfkav\x0f\x80@e\xf3>\xd8}\x0c\xb3\x9b\xb3\
-\xcdC\x93\xd9\x83\xcd\xac\xaf\x14\x02@\x86Y\xb9\xcb%\
-\xe0\xe7\xfd\x95\xec\xe0\x1d\xb3u\xac@3\x83\xf5\xe5G\
-0\x83\x05\xd2\xad/\xd0\xbc\xbf\xd2\xfe9{\xb7\xf4\xba\
-\x9e\xcd2\xbb\xe5\xb9\xab\xf1apV\x1e\xf5\xfc\xed\xdc\
-\xbf\xa3\xe7\x1f R\xcc^\xcc\xfe\xa5\xeb/.hN\
-\x12\x16t4\x8c\xe9\xa4\xa9\x9ex\xec\xc2\xa7?\xfa\xe4\
-;\x1e\x1b\xbc\xf4\xea\xd6\x97^i\xab\xec\xe9\xc0\xf4H\
-\x11\x11\x11y8\xd4\xf5r3\xf5EDDN\x01\x03\
-\xcd0my\xfdf\xfb\xfc\xe3\xfc\xdf\xfd[\xcf\xfc\xc4\
-\xe7.\xb4\xdf\xf8\xb3\xe9\xb5W\x06uW\xe5@!\x10\
-`\x82e\xc0i\xb93\xeb\xbc0E.\xa8Y\xe6\xa1\
-\xc0\x89\x22\x16\xda\x92%\x10~t\x00t\xfb\x02\xa0{\
-\x94\x00q7\xdf\xe1^\xdc\xc3C\xbb'\x81\xc6K\xe7\
-\x06\x0f\x0fKp\xc0\x13:\xb30\x10\xec\x10\x80\xc5\xac\
-\x02\xc7\x80Y\x0egv\x17=b\xf6\x9e:K(\x02\
-\xf4Y\xf5\xca,8\xcb\xf3\xeb\xb0\x7f\x9a\x18\xf2\x91%\
-T\xb3\x1b\x0e\xf5j:\xb8$<\xf1\xc0k\xaf\x1e\xa0\
-\x02`\x82z:ooN\x80\xfb\xae\xed\xfc\xc5\x9f\xc5\
-k}\xdc\x09\x9a\x03\xc6\xb1e\xfap\xc3\x8a\xc7d\xfa\
-\xba\xe7\xed\xc1\x85\xf3\xdf\xffi\xdfX\xdf\xf9O\xffv\
-\xf7\xeb\x7f2<{\xa6\xca\xe9m<7\x11\x11\x11Y\
-\x92\x02 \x11\x11yX\x99a\xd2p\x98\xbb\xef\xfd\x96\
-\xb5\x9f\xfa\x9ew\xff\xc4w\x9d\xc7\xcd/u[_]\
-\xb3\xb1\x03(\xbb\x09\xc0n\x13c\x0b\xf3\xceK1\x18\
-h<2\x8f\xb9\x03\xf7v\x0a\xccm\xb7v\xaf\xea-\
-\xee\xec\xb0\x0d\xa0\xa1I`\xf4\xa1\xcb\xac\xe0\xc6\x81Y\
-\xed\xd4\xec\xe2\x1e:0\xbfG\x07z \xdf\xd9W\x01\
-\x94\xe7yM\x9f\xf8\xccr\x1f\xdb\xabN:\xb8\x8d#\
-O\xec\xc0cx\xef\xae\xec\xa9d\x05}\x8b\xecC\xd5\
-T8\xe2\xbc\x09b^K\x95=[[c\xa7\xa4j\
-k\xdd\xd9\xb6;;\xd7\xdfh\x1d\xdf\xfa\xd1K\xff\xdb\
-\xb3O\xfe\xc7\xff\xaf\xf6\x9f\xfd\xd1\xe4\xfc\x99\xe4\xe9\xa8\
-+/\x22\x22\x22\xa7\x98\xa6\x80\x89\x88\xc8C\xca\xcc0\
-\x1eO?\xf9|\xfb\x1f\xff[O|\xee\x13\x8f\xdf|\
-\xf3\xeb\x9b\xaf\x7fq\x98&U\xcdY'\x99\xd9\x90\xd6\
-\xe0\x06\x07\x8d\x00\x13\x99\x02U\xa0\xef)|rw9\
-\xea\xe5\xc1\xca\x94\x05U*s\xf7,\xa6\xb8\x93\x0d\x91\
-\xb0p\x9aEf\xc9(\x0e\xf8\xbe\x09r\xb3\xcd\xec\xc5\
-\x0av\xeb\xd7K\xf1\xc3\x1dy\x8c\xb0\x80\x11f{\xd5\
-+}1\xcb\xec\xf6\xdb\xbe\x10\x07\x1f`\x07\xbf\x98%\
-\x83\xab\xfb1\xbbb\x87^\x9f\x03\x97f~\x81\xfa\x06\
-\xd1n\xeck\x81*\xc3\x10\x00\xac#\xa3m1\x9d\x22\
-\x02\xc0\xf0]\xefx\xfc\xbdO\xe5\xaf|\xfd\xda\x17_\
-#<W\xaa\x03\x12\x11\x11yx\xd4u\xad\x00HD\
-D\x1eRvs\xab\xbc\xe7\xc9\xfc\xd7\x7f\xe6\xfc\xb7\x7f\
-\xb8\x8a\xcd\xd7\xb7\xaf\xbc4\xc4\x8d\xb5\x0d \x80)\xad\
-\x9aO\x1bJd?\xc2\x05\x8c\x96h\x99\x9e\x08\xef\x97\
-|?\xf1\xc7\xd2v\x17`:\xb4\xd6\xd5\xbe/\x1fh\
-I\xca|\xa7\x07\x8e\x0a\x06\xc2\x03V2#\x91\x0e\xf4\
-\xa5R\xfd\x9c!\xcc\x1b4\x1f\xca\x14l\x16\x12-\xdb\
- {\xd6\x91g\xb6\xad}\x1f\xb3&5\xfbn\x89\xbd\
-\x00\x88G^\xd2yNt\x87\xa7\xbf\xa2\x1ft\x22\x1d\
-l\xd9\xb4\xef\x83\x86\xb0y<\x0aw\xceRR\x83[\
-[\xa3\x1d!eZ[J\xeb\xc0p\x80\xd1\x10\xa5\x19\
-\x8fw\xb6\xdf\xf5\xd4\xd9\xe7\x9e<\xf3\xfa\xab\xe3+W\
-\x9b\x89\x0d\xb2\xdfe\x1e*\x22\x22\x22\x0f\x88\x02 \x11\
-\x11y(\x91\xd8\xda\xee._\xe8\xfe\xfa\xbf\xb9\xf1S\
-\x9fY\xc7\xf8\xe6\xce\xd6\x95l\xed0\x13]\x89&\xdc\
-\x1c\x95\x87\xd9n2\xd1\x17\x92\xf4\xb9\x81\xd3A\xf4\x0b\
-_\x038Q{\xddy\x87\xe1\xa5\x1b\xf4\xde\xdaxx\
-\xdf\xd6\xfa\xa0\xea\xa8J\x9b{\xe1@\x93\xe0~\x1d\xf7\
-#\x8e\xb0\x9f\xee\x05\xf8,\x811\xeb\xf3\xb3y\xdf\xe5\
-\xbdhe\xb6V\x97\xcf\xcf\xcb\x97\xcc\xb0\x080\xcd\xf6\
-\xca}!\xc5\xc1G\xec}n\xf3\x1cjv\xeb-\xa7\
-\xb0w\x19\x8f)\x809\xf2Y+\xf5\x01\xb3d\xc8\xc6\
-y\xac3+\x84\x9b\xbd\xea\xc4n\xfbn3Z\x1f\xde\
-\x99\xc1\x8c(F\x92^\xccZ#\xc0\xecp\xd0#\xd2\
-\xb4\xf3\xce6\xde\xf5\xcc\xd3\xefy\x82\xaf~\xe5\xe5\xaf\
-\xbc^8XO+\xdcJIDDd\x85\xa8\x09\xb4\
-\x88\x88<|\xcc\xb0\xb5\x8d\xb3g\xba\xbf\xfc\xd3\xed\x0f\
-\x7f\xe6\x1a\xb6_\x8f\xeb\xe3\x01\xba\x5c\xe7\xe8\xbc\x9b&\
-\xc2\xbb*\xc3=\xbc\xc0\x1b\x90\x8ep\xb2*\xb0bh\
-3\x98\x90\x10\x03\x83\x11a\x0b\x97\x03?|\x97\xcf\xa6\
-\xd8,\xc1\xe7mVz\xbb\xc5\x1a\xfd-\xfb\xb7y'\
-\xf3\x9b\xee\xd2\xfc\xac\x8f\x08Fh\x11y\xb7\xdf\x0e\x00\
-s\x83\xc1\xfbG\x07PfGK\x80\x86\xa8\x00\x879\
-h\xf0\xc9\xac9\xf4\x89\x0f&\x83\x15\xd0\x01\xdd^\xdc\
-c\x98\x17I\xed\xb7[\x16\x04$\xa0,\xe8=\x14\xc7\
-\xde\x03\xac\xee\x1a\xf0\x98\x17v\xd5\xe8\xd6\x81\x80\xcd\x1b\
-6Y7k\xde\x84\xce\xac\x9f\xd0\x17\x008+C\xc3\
-l\x81\xf7\xaac\xb5\x13a\x1eC\xe7\x05\xb6\x83\xb2\x03\
-zWo\xd4gr\xda\xd9\xda\xf4\xd17>\xf8\xd1\xfa\
-\xfb\xbf\xfb\xcck7\xae\xff\xab\x9b\x99\xc3\xf5\xbd,N\
-DDDN1\x05@\x22\x22\xf201\xb3I\x8bs\
-\xc3\xe9O~\xce\xbe\xff3\x1b\x93\xe6\xad\xe9\x8d\xad:\
-\x90\x0c\x9cvf\x83<\x18\x91\xa5\x8d\xe8\xabDb\xb7\
-Dd\xb7p\x87\x86\x02\xcc\xa6\xae\xcc+I\x8e\xd9\xdb\
-\xad\xe1\x02g\xb5%K\x0cw\x17\x94\xa2\xdcr\xcb\xfd\
-\x0e\x80\xf6\xf7\xbf>\xbc\x7f\x03m\xb6\xd2\x19w\x8f\xc7\
-\xf6}>\x7f\x0e\xf7-\x0f\xcf\xb4w\xfbI\xf5/\x0a\
-\xed\xf0\xcb1\xfb\xf4\x96Ka\xf3?\x0d\xb7y\xf9\xee\
-{\x8ev:\x19`\x08\x07\x0fuV\xea\xc3 \x02n\
-\xb3\xf9\x8f\xb6\xef\xad0_;\xcd\x09\xc0\xdd\xac\x18#\
-\xc1\x07\x9e3\xbcx u\xa5\xb2n\xb2}\xc5\xf2\xd9\
-O|\xea\xe9W\xdf\xe2\xe6/]\xf9Fld\x83?\
-\xa2\x97ZDD\xe4a\xa2\x00HDD\x1e\x1a\x06\x14\
-bs\x1b\xdf\xf9\xe1\x9d\x9f\xfbtu\x11\xeb\xc3\x1d\xf7\
-n\xaf\x1bL\xb2\x16\x06 \xcc\x88\x80\x81A\xa0_\xc4\
-\xaaO\x03\xdcP\x97\xfe\x01\xb3\x89`\x8bp^1q\
-\xe0\x18\x8e\xc9q\xee\xc4\xc12\x9f\x05\xbb\xa7\x1f|\xe4\
-=q\x87\xc7L\x98!\xedVu\x18P\xe69\xcb\xde\
-\xec/\x00\xf3(\xac\x9b\x95\x05Y\x7f\xb9\x96\xb82\x84\
-5\xb0\xbeuq\xbf\xee\xbb\x03\xc7\xa77\xf3\xec\x0e\x80\
--Z\xcc\xcb\x0e\xe4\x5c\x8fP\x89\x0a\x01\x87\xb7\xc0&\
-\xb0\xef:\xce^\xa0\xfdWl\xf7\x9d\xcc\xd9\x9fF\x94\
-\xa1\xc7\x1a\xbcc\x9av\xe9\x1am\xd3<y$\xb6\xd9\
-J\x19:\xbb\xa9O_\x7f\xeb\xd9\xf5\xe1\xbf\xf6\xe9\xf2\
-\xd5W\xfd+\xbfG\xd6>\xcc\xb3\xfa!\x11\x11\x119\
-\xb5\x14\x00\x89\x88\xc8C\xa3 \xa5\xe9\xce'\xcf]\xfd\
-\xb1o\xae_x\xf2\x0c\xd0\xa4\x12\x15\x01\xc2gS\x9a\
-\x02e\x0a \xf5E:a\xf3iN\xfb:\xca$\xc2\
-\xf9 fY\x1d\xb60\xf1Yd\xb9\xb0iiG\xd6\
-\xe0\x1c\x7f\xe4\x86\xf9\xbc\xb0\xa5/\xa8\xc1\x02h\xf6\xed\
-\xf2\x0eN\xf9\xc4{{\xc0\x97\xf1m\xd4\x9fi\x07o\
-\xf7}\xb9\xff\xae[\xaf\xdd\xde\xed\xc6\x01\xda\xf3\xf0\x9d\
-\xc8\xdb\xa8J\xf1)\x0c\xa9u+\xeb)\x80\xae\xc9\x81\
-\x8aM\xaa\xf9\x81\xe7\xd7?\xf9\x91\xb3\x7f\xfb\xb7\xa6\xb0\
-\x01\xf2req\x22\x22\x22\xf2\xe0\xac\xf0\x04x\x11\x11\
-Y5\x93\xb0s>\xfd\xe9\x8fN\xbe\xf7\x13\x1b^\xad\
-ED\xb0,N&\x8e\x16\x1a\xab\xdesKWE\xed\
-\x7f\xfa\xa3\x93\xd1<\x006\xef\xccm'\xb9\xbc\xf36\
-O6k\xf3\xd4\xaf\xba6k\xf5\xed\x0es\x94H\x95\
-\x87\x01X\xff\xd8\x07\x1f\xff\xce\x0f\x85E\xd7-\xf8F\
-\x14\x11\x11\x91\xd3A\x01\x90\x88\x88<\x1ch\x18O\x9a\
-\xc1\xfa\xe8C\xdf\xfc\xfe\xcbO>\xc1\xb6\x99\x8c\xb7\x9b\
-\xe9t\xd1\x1c \x119\x81~R$\xe1e\xb6F^\
-_(7\x9b\x09h0CU\xa3\xaaa\xd6\x15l\xed\
-\x94\x0f<\xbb\xf1\xa3\x7f\xe1RWb\xdai-0\x11\
-\x11\x91\xd3N\x01\x90\x88\x88<\x1c\xba\x82\xb3\xde}\xcb\
-\xd3g\xde\xf3\xeeg\xbd\xca\xd3\xc9V3\xdd.m(\
-\xfc\x11\xb9\x97fs\xfah\xe4\xacp\x880\xf6]\xd4\
-\x09wT\xb9+`\x8bn\xba5i\xda\x0f\xbe\xf0\xf4\
-'^X\x83J\x80DDDN=\x05@\x22\x22\xf2\
-p\x18O\xe3=\x17\xf2O}\xdb\xc5'\x1fC\xec\x5c\
-a{m\xe8\xd3aR\xf5\x8f\xc8=d@\x817H\
-\xcd-w8\x8a\xa1mX\x8a\x19r\x82\xc5t\xf3\xe6\
-[\xdf\xf2b\xfd\x17\xbf\xeb\x09#B5@\x22\x22\x22\
-\xa7\x9b\x02 \x11\x11y\x18\x18\xa6Mw\xf6\xfc\xc6\xfb\
-\xde\xfb\xb8c2\xbey%\xb1\x1d\xd5\x18\x0c\x94\x00\x89\
-\xdc[\x84w{+\xd6\xb1\xaf\x00\xc2l%\xb8\xb6X\
-\xdbxf\xaaP\x19\xd8\x8d#&\x1fz\xfe\xec7=\
-[u\x11Z\x08LDD\xe44S\x00$\x22\x22\x0f\
-\x81\xa6\xc3\xa53\xf1-\xcf\xf3\xc2\xb9.\x9a\xab\xddd\
-\xabrTn\xb3\xa5\xa75\xec\x14\xb9g\xe6=\x80@\
-\x10Nx\xc0\xc2f\xe1\x8e\x01\xec\xcc\x0b\x1c\x99Vs\
-\xb2u\xe3\xb5\x17.\xdf\xfc\xbe\x0f\x87G)4S\x22\
-+\x22\x22rZ)\x00\x12\x11\x91\xd3\xce\xcc\xc6\xd3x\
-\xdf\x93\xe9{\xbf\xa9\xce\xbe\x85\xe6\xda\xd0K\x9d\xe0`\
-\xe9BM\xa0E\xee\x1d\x83\x05\xd0\xc2\x0amV\xfbc\
-4\xa3\x19\x093$\x87\x1b\x0a\xd0\x02\xc1\x84i\x8e\xab\
-\x1b\xa3kO=\x96\x87\x19\x11\xd0<0\x11\x11\x91S\
-K\x01\x90\x88\x88\x9cv\x84\x91\xe5\xe2\x99\xf4\x8e\xcb\xc3\
-\xccM\x8b\xedA\x05\x03J\xdb7\xa6\x15\x91{\x88@\
-\x01\xc2\xc8Y\x004\x8bX\x09\x10\x0e\xb8\xb1\x03[\x00\
-\x18T>Le\x98\xdbw\x5c\x1e\x9c]\xcfdP\xd3\
-\xc0DDDN+\x05@\x22\x22r\xda\x19\x10\x81a\
-\xed\x8f\x9d\x99&{\xcdx\x03\x00\x0b@\xe6\x04\xd3\x7f\
-\xcaD\xee!\x0bX\x07\x94}\xe5?\xfd\xf7\x18\x81\x00\
-\x02N\x1a\x18H\xc4 1q\x1a\xcd\xb5\x17.\xef|\
-\xeb\xbb=\x88\xae\xa8 ODD\xe4\x94\xd2\xbf\x9aE\
-D\xe4\xb4k\x0b/\xac\xf3\xc5w\xa4\xd1\x10\xe0\x84%\
-\x00$\xb7\x9c\xcdL\x0d\x80D\xee\x9fy\xf5\xcf<\xfd\
-!\x03\x16\x9e\xe1\x0e\x00Q\x0aK\x13\xd1\xbd\xf3\x12?\
-\xf5B&\xd0\x86\xa6d\x8a\x88\x88\x9cR\x0a\x80DD\
-\xe4T3\xc3\xf6\x84\xcf>\x96>\xfb!\x0c\xea\x1b\xec\
-v\xa2\x00\x01\xa4\x0a\xd5\xb0\xc0\x15\x00\x89\xdc\x0fF\x9f\
-}\x84\x1b\x08+\xb4.\xbc\xa3\x03\xd9\x91-\x086a\
-m\x9bS`\xc8Q\xc5\xae#\xf5\x0d)\x22\x22rZ\
-)\x00\x12\x11\x91S\xceJ\xe9\xd6G\x83K\x17\xd7\x81\
-mv;\x00\x10\x86p\xd2\xa3\x98Z\x8e\x88\xdc7\xb6\
-\xaf\x9e'`e\xd6\x09\xc8\x8cn\x060\x80((-\
-R<\xfdX\xfd\x9e\xcb5\x0bC\x8d\xa0EDDN\
-%\x05@\x22\x22r\xea\x91\x83\xba\xaa\x07\x19\xdd\x94\x05\
-\xe6\x00\x89\x06]\xe3\xa4k\xbe\x89\xc8}`\x80\xef\xfd\
-C\x91\x04:x\x81\xf7}\x80H8<#%3G\
-W0i\xdeu\xb1\xfe\xe4\xf3\x1b \xbaP(+\x22\
-\x22r\x1a\xe5\xb7\xfb\x00DDDn\xafJ\xa9\xf2\x82\
-\x98\xb8\xc3\x0c((\x85\xa5K\x8e\x0a\xd6\xa9\x0f\x90\xc8\
-\xbdc\xb3\x0f&\x10{=\x80\xbc\xd0\x83\x06\x02\x08\x1a\
-\x00K\xee\xe6\xc5\xd06\xf0\xeda\xc6hPaV\x93\
-\xa7\x5cVDD\xe4\xd4Q\x05\x90\x88\x88\x9cj\x04\xcd\
-,\xa7\x94\xcc\x90`5\x90@C\xc0\x88d\x96\xde\xee\
-\x03\x14Y=\xd6\xcf\xf4\x02\x81>\xf21\xc0H\x03\x0c\
-\x01D0h\x80\xa7\xfe\x1b\x90D\xb0\xae\xd2\xa0\xaaH\
-j%x\x11\x11\x91\xd3I\x15@\x22\x22r\xda\x99\x01\
-A\x071\x22\x1ap\x02Db5\x08\x8c\x02\x00\xee\xed\
-J`\xfd\xa6\xe6\x83\xde\x99\x80\x11L\xf7~o\x8f\x96\
-\x05\x17\x8e\xaa\x199\x96\x15\xc0\xc0C\xbf\xb4\x9b\xbfQ\
-\x0f\xdc\xd27\xe8q\x00\xe0]^\xcf\x04\xa4}\x9b-\
-\xfd4\xb0\x02\x84\x01p\xb3\x8a\xa8\xac\xc0JAJH\
-)\xa5\x5c\xa5dz\x19EDDN+\x05@\x22\x22\
-\xf2\x100\x163C\x06\x0cl\xe73TH\xce\xea\x13\
-\xee\xe5\xae`\xd8\x8dyf\xb1\x04\xf3l\x18L%\x15\
-\x0b\xdc\xcdu\xd15=\x8e\x81\x15pk_e\x9b\xbd\
-KI\x9a\xf5U7fn\x80\xf1^\x85\x94\xbb\x0b\xc0\
-\x1f\xd8\x9a\xcd\xa6x\x99\xd1\xc0\x00\x013$\x87\xc3\xbd\
-\xd8\xe1\x87\x8b\x88\x88\xc8i\xa1\x00HDDN\x8d\xdd\
-\x86#\xb6o\x04I\x0b\xc2\xad\x0ca\x98\x00\x0d\xcc\x01\
-\x87Y\xe3\xd8L^\x18\xb7\x0d\x0f\x8e\x1a\x92\xce+*\
-\xf6ve\x8098\x82\x19lZ\xd0v\x01\x0bVL\
-\xd6\x9dA\x97\x907\xe1\x13DB\xcaK\x16\x02\x9d\x9e\
-\xea\x88\xdbN\xd2Y\xfaP\x17ly\xd1&\xef\xc3\xee\
-\xb0\xf8,\x96N)\xee\xc7\x959f\x9b\x16(\x15\xda\
-\x0dX\xc7\xd1MzK\x18\x01+)\x95!H`B\
-\x8b\xd6|j^\xba\x9c\xd3ze\xb9j&\x8e\x0eU\
-\x815wq\xc0\x056\xeb\xb8>\xbbVL\xa9`\xb6\
-\xf6\x17a\xde\x99E1\xd0\x19\x0ew\xa6\xbc\x95\xcc\xfb\
-hh\xa9=\x8a\x88\x88\xc8\xfd\xa5\x00HDDN/\
-\x02\x11<\x93\x9b'\x87S\x8f!\x1aG\x81e\x00f\
-,\xe64\xa3\x1d\x9d\xc5\xdc6\xe0\x00\x1d$\xcc\xe6\xe3\
-c\x87\x91\xc1\x0cX\x1b\x93pFBv\x18\x1d\x93!\
-\xa7\x15l\xdb\x12`D,=\xc4=\xfeY\xf7\xa9h\
-\xe2\xb8\x1d\xdevw\x0b&\x10->\xf5E\xd3\xbc\xee\
-\xc36o\xe3>\x5c\xf0\x05/\xfd\xbd?NC\xc9\x98\
-\x8e\x90J\x0c\xb7\x8a\xf7UoH\x06\x8fd$\xcc,\
-\x819\x15\xd4\x855\xfc\xac1yG/\x84\x07+\xcc\
-&3\x1e\xb7\x9b\xa3\x0e\x98\x06\x80\xf3\x87\x96\xf9\xb3\x0c\
-4\x03\x0cF\xd2IG\xc0\x19\xe6t\xd2\x09\x0b\xb7\x89\
-!\x83v\xd7\xb3\xcfDDD\xe4\xbeP\x00$\x22\x22\
-\xa7F?\xf2<\xa8\x09\x7fr\xd8<\x7f\xd6Z\xaea\
-\xde\x91\xd6\x01\xc0\x81\x04\xc4\x92\xc3n:\xba\x0a\x98\xd7\
-ex7\x9b\xccR\x08\x00\x89\xc9Pe\x98\x81\x1d\x98\
-s\x97\xac0\xb2!U\xb4h\xf7\xad\x8et\xd2\x13<\
-\xf6\x80\xeey\x04dX\xbe\x90\x87\xc7_U{\xe0\xdb\
-\x5c\xf4\xc4\xc5\xaf\xc2\x82;\xefKF\xb1\xe8E\x5ct\
-\xa8\xc7\xe6?\xb4\xd4\xa0\x1a\xc3\x826+u#@#\
-\xd0\xc0\x80\x140\xb8!Y\x87\x8c\xc4-#,\xed\xc0\
-\x1bx\x80\xb7\xb9<w\xed\xd0\xd6\xfbe\xe35IR\
-DD\xe4\x94R\x00$\x22\x22\xa7\xc7\x11CG3\x04\
-P@z\xc0f\xe5\x05}\x13\x12c\x9a\x95*\x9c<\
-;!\x9d1\x829\x18@\x00c\xf3\x00\x8d\xc5\x8cV\
-W\x86\x8cB\x94@\x01\xaaA6\xcb\xa53\x14$c\
-\xb0,wz\x8b\xe7#\xdd\xf3\x04\xc8\x8e\x1f\xfe\xdf\xbe\
-\x00\xe8\xf8G\xf8\xc2\xd1\xfd\xa2\x02\xa0\xa5\xb6I.3\
-wjv\xef\x92\xf7-t\xfc\xc1,~\x11\x17\x1c\xea\
-\xb1\xf7\x10\xc0\xd8f}}\xda\xfe\x86 \x9c\x05\x1c\xcf\
-\x9eID\xdbF\x82\xdb\xd4c\xc7i^\xc5\xbc^\xc7\
-\xd5\x8eGDDDv)\x00\x12\x11\x91\xd3\xe3\xe8\x81\
-0iA'\xd2\xac\xf4g\xaf7mYz\xd6\x0d\xc1\
-\x98u+1\xdbk\xa7\x0b\x06\x09Zai\xd0\x04\x0a\
-\x90\xd3\xa0\x1e\x5c\xac\xd6\xceD\x0b\xc6\x15$3vK\
-\x865\x0b\x13\xa0\xfbR5\xb1l\x02\xb4|tr\xaf\
-[\x00\x1dU\x16v\xc7\x16U\x00-\xbb\xd1\x05\xf3\x9b\
-\x96~\x11\x8fO\x80,*\xa4uX\xd8h\x13U\x8b\
-H\xa0Y\xc9\xe6\x19\x04\xea\x09,\x9c\xa8\xaa\x9c\xf2\xa0\
-L\xc9\xc9\x04\x9c\x80-\xcbl\xca\x96\x88\x88\x88HO\
-\x01\x90\x88\x88\x9cj\x04\x08\x0f\xe4@ETAs&\
-3\x18:G\xdcE\x85\x83\xcdF\xeb\x16\xbbE&F\
-8\x0d@\x14\x04a\x95E\xf6\x9b\x93\xe1\xd6t=\x0d\
-\xcfM=\x95\xea\xf2 E\xd5u\xcb\xe7N\xc7\x1d\xcd\
-\x82r\x9d\xa5\xf1\xf8\xc9S\xb7\x9b\xc6\xb5\xa8\xd1\xcd\xb2\
-}\x97\x97\xde\xa6\x1d_ t\xbb$n\xc1\xdd\xcb\x95\
-q\xf9\xc2\x13\x5c\xf4\x22.<\xd4\xe3\xee\xa3[\xae}\
-@/;v\xb3\xd8\xc4P\x07\xeb\xccz\x88\xda\x11\x11\
-\xdb\x1d\xa6S\xcbau\x9d\xaa&\x1a4\xd7/\x0d\xde\
-\xa8m\x8a\x02\xde\xff9`\x22\x22\x22\xf2\x10Q\x00$\
-\x22\x22\xa7\x9f\x01N\xe6\xbe\x02\x88\xf3\x99b\x86r7\
-\x15\x0ef\x84\xf5\xd1O\x01\xd9w/\xf1\xd9\x1a\xf0\x96\
-\x1c\xf5\xda\xb0-\xf9\xa5\xafo\xbf\xf4\xa5?\xd9n\x06\
-\xed\x80\x18\xb0\xf6\xf0i\xdc\xf3\xf9Z~?\x8a5\x88\
-X\xf60\xddO\xd16\x8f}\x22\x10\xb7.\x8f~\xa7\
-\xeey\x11\xd7m^\xc4\xe5\x0e\xd5\x02\x83\xd6\x99b{\
-PJ\x0e\x0fC\xa4T|\xd0x\x22\xac\xee\x22\x95m\
-Z\x0clXy\xb7\xcd\xb3i\xfa\xb1\xe7\x9b\xe7\x9e\xc8\
-U\xba]T'\x22\x22\x22\x8f\x18\x05@\x22\x22r\xea\
-Yfl\x04\x07\x81*\xe0\x09\x98M\xb6\xb1\x00l\xb9\
-,\xc6,<\xed\x10\x00\x89\x88\xf9\x06\x89D\xd0@/\
-\xc5\x13F\x93\x9d\xea\x8f?\xff\xe6/\xfe\xd3\xf1+7\
-1\xad\x81\x0a\x15\x80n\xb7\xd9\xed\x09-l\x11|_\
-\x1c\xb7\xc7\xbb\xd9\xdd\xe2\xf3^n\xcb\xf7c\x9b\xb7\xdd\
-\xec=w?\x8e\x93Vw9<&\xc3\xa6sxq\
-D]\x15\x1ft\x04\xe0U\x8b\xc4\xed`\x97\xbd\xca(\
-\xe3\xee\xd9s6\xfd\xdcs\xc3\x8d'\x9e:\xf7j\x8e\
-\x97\x19j\xc9,\x22\x22\x223\x0a\x80DD\xe4\x14\xe1\
-\xbc\xc1\x8a\xed\xb5h!\x22\x81\x83\xc0 P\x13N+\
-4\xc2aF[v\x88o\x16\xe6M\xbf\xf9\xf9M}\
-\x09G\x80\x0e\xd4AD\xc9]W]\xb9\x8e\xaf\xbc\x82\
-\x97[\xb0Bg`\x9b\xdd.\x99\xf5\x0b\x90\x9dL,\
-*\x02y\xa0\x09\x90\xdbmV\xb2\x8fE59\x8b\xae\
-\xb9\x1f_\xae\xb3\xf46\x17\x5c\x1c_\xd8\x92z\xe1\x05\
-\xbf\x1f\x16\xd7\x07\x1d;\x1fk\xc1q\x1aS\x85\x01Q\
-&\xd5\x8d.5\xa9\x8c\x10\xebU\xa9\x87p\x22\x0a\xb6\
-\x0cl\x92G=\xb4\xe0\xf6\xf4\xeb\xe3\x1b\xfe\xca\xf5\xe7\
-\xc6\xfe~\xd4\xc4\xf4k\x06\x12\xe9.\xcfJDDD\
-V\x83\x02 \x11\x11\xd9\xcfH\x02fK\xb7\xc8\xbd\xcb\
-\xdd\xdf\xb2\xdf0w\x8b\x81M\x07\xb9\xb8u]\x94\xdc\
-\xf7\xef-\xe1\x15\x8e\x9f\x1bt;\x9c7\x01\xeawh\
-\xb3nC\x88\x00i\xc9\xb3\xa5\x94RJU\x1aT\xb9\
-\x9e\x0e\xca\xc8\x1e\xab\x1b\xb0LS2\x83-UX\xb1\
-\xa0\x7f\xf0\x03.\xd3\xb8m\x7f\xe0\xe5{+-\xea\x91\
-\xbc\xf4F\x97\xd9\x1d\x16_\xf0\xfba\xf1\x9ad\x0b\xae\
-\xcc\xf1}\x85\x88\x14\x85\x86\xa8\xab\xe4\xf0\x92-\xbc\xea\
-8($\xd8\xc2PG\xaa\xaa\xa8\xeah\x9b\xee-K\
-\x83\xf0\xd1\xf5j\xfd\xcdTO06\x90}\x07%\x92\
-$\x0d\xa0\xdd\xae\xff\xd3\x9d#I\xf4\xff\xefw\xf0v\
-\xfd\xdc\x10\x11\x11\x91;\xa1\x00HDD\x0e9nr\
-\xd3\x03\x18\xdb\xed\x861\xfd\xe7F3\x9b\xb6\xd6\xdeD\
-W!\xce\xbb\xd1\x93!\xd7\xd1\x96(M\x95\xef\xe9T\
-&\x03\x18\x88@\x90\xa5\xf3\x0a\x86\xdca\xc0\xb4\xdey\
-\x99\xa6\xb3\x0d\x1eo\x92\xdbh+\xfb5X\xa7\xff\x86\
-\xca\x83@x8\x13\xdb\xd4\x16\xa7\x15\xe6(,-\x8b\
-\x01\xe8\xf2\xb4\xb56\xac\xb4\xa9\x04&>\x8c\xb2\xce\xc9\
-\xe0\xf5qe\x9d]\xaff\xdd\xb2\xfat\x13$K_\
-\x88t\xcf\xec\xe6\xa6\x0b;\x8e\x8b\x88\x88\xc8\xe9\xa0\x7f\
-\xbc\x8a\x88\xc8>}'\x1c\x03\x0c\xd3\x82\xa6\x03#\x22\
-\xe6=\x8f\x09\xf3\xdd\xe1\xde\x9eY\xdf\xe4\xf9\x16\xeeb\
-\xef{\xd1\x8f\x99\x01l-\xad\xdd\xbc\xf6\x18\xb7\x0a\x87\
-\xd3f\xd3P\x06\x83\x8a\xe1MSX\xc0\xce\xfa\xae\xd0\
-K\x8eh\xe9\xf3\xa3\xc7\xbe\xf9\x5c6K\x82@ \x80\
-\x80\x05\x0d\x01\x16FGO\x01\xda\x83\x08\xc3D\x80Y\
-\xcfs\x06h\x06\x1ab\xf7#\xfa\xf8\x85\x88B\x16\x18\
-\x8a\x19\xe1\x06g\xe7\xa5u.\xb7\xcc\x99\x88\x88\x88\xac\
-,\x05@\x22\x222gf\x06\x92m\x89\xed)\xcfx\
-yl\xc4\x9cS\x95\xad\xce\x963\xdd\xcc\x9d\xd8[[\
-z\x96\x82\xcc\xe7a\xd9\xbe\xf8\xe7d\x01I?\xb0-\
-{+%\xd1\x9d\x0e\x96\x0e\x97\xac\xfe\xe8\xb9\xc1\xbb\x9f\
-\xe3\xa0\xba\xce\xd8\x04[\xb6d[\x1c\xc9m\x00\x060\
-Y\xe6d\x99\xac\xac\x01N/\x0c\xc0\xa6H-\xe0f\
-\x15`DG+\xb0\x89\x19\x99v\x22w\x91\xa6]\xde\
-n\xab\x94\xa6\xcd\xa8\xcd\x8e\x14\xea\xad\xfbP\xe3r\xd3\
-\x07\xf9\x80\xc3?\x12\x80\xc3\xe0\xc5\x03\xc8\xac\xbdT\xb9\
-D\xc5\x0e\xde9\xcd-u\xa8\x93\x0dQR\xea6G\
-\xd3f\xbd\xc1\xd9\xa6\xa4\xae\x00Xj\xa6\xa2\x88\x88\x88\
-\xac&\x05@\x22\x22\x02\x00$\xc6Sv\x1d\xcdPe\
-\xbc\xffI|\xf7sx\xf1\x89\xd1\xfa\xc5s\x17\xce\x8f\
-\xce\xac\xe5\xaa\xa6[\x04Kr\xa6Y\x1b\x11\x9b\x95\x0c\
-\x85\x83>\xfb\xd2\x1b\xd8\x09;\xef\x06\x98\xd0\x0d\xa2\xb5\
-\xe8\xba\x04fX\x07\x1f;S\xddn\xa4&\xa3\xec\x9c\
-\xdbh\x07\xf5[\xd3\xc9\xd4:\xa6\xb0*gO\x15R\
-\xc52Y\xae\x1b\x0fh\x88\x0a0\xccZ\xe4v`;\
-\x9b/c}IS\x80-\xcc\x81\x02CX)\xd6\xd2\
-\xc2\xac$\x9a\xc3\x97\xee?-\xa7BY6\x00J\x0f\
-\xb8\xb1t_\x8af\xa9dw8S.\xe6a\xd9\xfa\
-\x16<\x11\xa0\xc33+F\xa4HU \x17\xd6\xec\xc0\
-\x07}\x9c\x22\x22\x22r\xca)\x00\x12\x11y\xa4\x99a\
-\xdar\xd2\x04Jy\xe6b\xfb\x8eKq\xf6|\xfd\xdc\
-\x93\xa3\x9f\xf8`\xf9\xc0\x13)r\x1e\xadE=\x98\xc2\
-\xa7@Ai\x11\x05\xbe\xbf\x00\xc8\x00\x80\xbb\x01P \
-u'^\x1e\x8b\x80\x03\xc3\xa0\xa1Dm\xa8a\xd3\xf0\
-M\xb2\xf2f\xc4\xa6bI\xd6\x8d\xbbv\xa7\x0bV\x8e\
-\x5c9\xf2\x1a\xac\x8a.Jg\xd9o\xd3\x08\xf8x\x01\
-\xa4\xbeF\x22\x90\x00\x07,\xed\x9e\x19\x00DB$C\
-\x222\x22\xa1\x03\x1c\xe8\x0c\xcd\xedZ(\xcb\xa9w\xfc\
-je\x0b\xf1\xa4\xd5mw\x8d\x80\x1b,9\x093\xd2\
-\xbdd\x14\xc3\x0e\xacC\xea\xc2K\xa0\x8e(\x88\xd6\xac\
-3\xa0\xc68a\x04\x8b\x83Ey\x22\x22\x22\xf2\xa8S\
-\x00$\x22\xf2\x88rC\xd0nns\xa3\x8a\xa7/\xe5\
-'.n\xfc\xd8\xa7\xe2\xe3\x1fn6.\xc4\x93\x83\xf6\
-\xecd\x82\xa6\x03nb\x12\xd8n\x10-P\x00\xc2\x0d\
-\x01\x94\x83}\x80\xf6\x0f\x8a\x97\xf8\x0fK\x00\x09M\x8d\
-\xa9\x03\x96\x13\x06fM\xe46\x988\xb9\xcevX\xa5\
-.y\x03n\xe5\x84\xaa\x02`l\x0da\xd19\x99\xd0\
-\xaf\xc9u\xd2q\xee\xec\x98\xcd`\x01\xd0|\xb7\xfcg\
-6\xc9\xc7\x00\x86\xb13\xd2\x08g\xeb\xe8`\x0e\xb4\x8e\
-I\xda\x9b\x07'\x0f'{8\x02 \xda\xfe\xd5\xea\x92\
-\x13\x99\x91\xacM\xd8\xa1\xb5\xb0\xbei{\x03+n\x9d\
-3\x12Qq\x929\x01\xc8Yw.e@\x22\x22\x22\
-\x02(\x00\x12\x11Yy\xee\x85\xb4\x88\x03\x8b\xff\x98\xd9\
-\xd6\xb8L'\xd3'/\xc4\xbf\xfe\x89\x8d\xef\xfd\xd6'\
-^x\xf7\xd9\xc7\xce\xb5\x8e\x9b\x93\xc9\x95\xc9\xf5\x9b\x83\
-62\x92\xf5-\x90\xc9\xbe\x07\xb4;fk\xa7\xcf'\
-\x80\xf5\x1dj\x0d\x987\x02\xb2Y\xbb\xe8\x131D\xb0\
-\x9b\x12\x80\xb9\xc1\x9c\xd9g3\xca\x08\x80(\x05\x88\x5c\
-\xb9WfF4m7\xd9\x8e\xa8-\x0d\xaa:\xdbr\
-;E\xc0Z\xa0\xc0\x09\x03\xbc\xa3\x07`\x11\x01\xee\x8e\
-\x99\xdd\x98\x8c\xb0\x80G\xf6\x18\xa4\xa8\x0c\xec\xfa\xb5\xe2\
-\x15\x00=\xdc\x1e\x92\x00\x08\xa0Y\xd0\xe6\xdf\x82\x15\x90\
-\x09\xc0\xaa0\xeb,Z+\x1d\xea\xb0\xda\x8c\xc0\xa0\xc5\
-\xb8\xc5\xa0\xc3`\xc9\xdeX\x22\x22\x22\xb2\xba\x14\x00\x89\
-\x88\xac0\x82i2\x19\xa5\xd4\xe6\xd4p\x9e\xd1\x94\x82\
-\xad)\xcfo\xf8\xc7\xde\xbf\xf63\x9f\xad\xbe\xf7c\x17\
-.\xaf\xa7\xdc\xbd\x5cn^\xb5\xe9\xce\x1a\xbaB\x8c-\
-O\xdcR\xca)\xd1\x0cA\x03\xdd\xd0\xf6QK\x9f|\
-8\x01&\xb0OI\xfa\xe5\xc1\x12\x99\x97\x08F\xacp\
-\xd8u\x16\x04\x92!\xa1\xf2\xd9\x0aG%\x800\x04\x8c\
-H\x801\x0a\x08XBt\x05\xc6\xda\x13\xb8T7\x1e\
-\x0fpgv\x1a\x09\xe1\x16Fc\xd0\xc3\xc3\xc1\xb0\x00\
-\xc2Sx*L\x05\xa9[K\xdd\xf9\xe4\x15cg\xea\
-\xfdD1\x05@\x0f\xb5\x87#\x00\x0a \xdc@\x87\x01\
-pg*\xac\x1c\x13\xf7\x02\xeb&\xceI\xeaZ\x9e\x0d\
-;o\xd1\xd5>\x1e[\xbb\xe3\xe7Z;\x0f\xbc1O\
-FU\x04$\x22\x22\x22\x80\x02 \x11\x91;\xd5\xf7\xba\
-!\x00\x94\xc2I\x09\x03`\x96\xdd\x06\xc9\xcc@,3\
-\x0f\xe9~#\xb03>7\x1a\xde\xac\xabI\x097\xb3\
-\x9d)\x10\xeds\x97\xdb\x7f\xe3\x87\x1e\xfb\xd1\xcf>\xfd\
-\xf8\x19\x1fbRv\xaeN7\xdf\xcc\xedxh\xc5P\
-r \xe5\xc4df\x84\x07\x8d\x08\xc2\x08\xce\xd6\x09\xeb\
-\xe7H\x91\xf35\x91h w\xbf^\xe2\x22X\x823\
-\xc1\x02\x04\xd8!\x88\x0e0\x1a:\x00@\x87\xe8PJ\
-\xbf\x13O9\xe5A\x90\xd1u,K7\x00\x02\xd3<\
-\xcc\xa2\x19w\xd7\x92\x8f\xbe\xaei\xd6\xe6\x88NxX\
-\xa1\x19\x8d\x8eb \xe1\x8b\x8b\x8e\x8e\xbbK\x89\x91\x9c\
-\x9c\xf5m\xce\x0b\x12\xe0f\x80u\x00\x03fp#\x8d\
-\xd9\x08cX\xdf{\x8b\x1ef\xc5\xe6\x15z\xfb\x7fr\
-=\x90\xa3}P;\x12\x11\x11\x91\x13S\x00$\x22\xb2\
-\x88;J`\xdc\xb2\x142\xc0`)\x5c\xcfx\xd7\xba\
-G\xa0CL\x0a\xaf\xec\x18\xcdR\xf2\xaa\xf2Q\x0d\x03\
-\xe3\xb4,\xbfc\x00\xcfl\x5cq/\x11\x89\xb0\xcdm\
-^\x1e\x8d?\xf6\xc2\xf4g\xbf7\x7f\xc7G\xc7\x1b\xa3\
-\x97\xcbN[\xa6\x93h'\x1e\xd3\x94\xfa\xce@AF\
-v\xba5\x06\xa2\x00\x08\x10@\x00f6\x9b\x94\xc2\xdd\
-\x01&\x82\xd6\xcec\x98bh\x96(\xc81\x1a\xfb\x14\
-m\xb7\xc2\xa2o\xca\x93&\xa0\xcdB\x99 \xc2\x0d0\
-\x02\xd6\xe4D\x22@\x9e\xb8\xe74\x00 \x0c%\xc1`\
-\xa9\xa9\xac\xcd)\xb5V\xb5\x04i\x1d\x0dNx\x004\
-r0\xc5\x99\xad\xbc\xb3]w\xf0\x9b\x09\xe6\xe82o\
-SS\xc1cF\xc1\x0fv\x01qYl\xb9\x17\xe3A\
-\x07\x1c\x86H\xechibk\x017\xecD5\xf5@\
-\x0eCxU\x8a\x07ZLh\xd7,Z\x8bI\xa6\x1b\
-v\x22\xa7\xbe\x09\xb4\x11d\xcc\x16\x93w\x07\x0f\xbe7\
-\xef\xd9\xd9\xf4?\x14\x1cLz\x97\x8b\x88\x88\x9cZ\x0a\
-\x80DD\x8e\xe6\x86.\xec\xc66\x13\xbbK\x03\x0c\xd7\
-\xd2\xb0\xb6\xf55\xf7\x5c\xbd\xef\xc2\xda\xf7<\xb9\xd1t\
-\xdc\x89\xe6k\xdb\xd3_\xf9\xfa\xf8\xe6N\xdb5\xed\x8d\
-qs\xe5\x86\xd7\xb9Z\x1fY\xf2S\x11\x03\x91\xe6N\
-7\x12v}\xab\x5c\x1a6\xff\xce\xf7\xf1\xc7\xbek\xed\
-\xc9K^\xf3F{\xf5U+H>\x1b\x1cZ\x04J\
-\x07\xeb,\xc1,|o\xa8\xc8\xbd\xf92\xf3\xa2\x99\xd9\
-}6\xdf\xcf\xbcf\xc6\xfb\xb0\xe6\xa4\xc2\xe8\xf3\xe5\xd7\
-\xe7\xb7\x00\x04:$\x00D\xf8\xbcg3\xd8v\x00\xcc\
-\xe1\x15\x97^\xea\xda\x80H0\xc2\x99\xbd\xad\xccJ_\
-$\x11\x16\xf0~BX_7\x91\x0a\xaa\xd6s\xeb\xac\
-\xacu\xd0\x11N\xb7[\x86\xb9\xc7\x85>\x87v*\xa7\
-\xc6ro\x9d\xe5&\x8e-\xcf\xd9e\xb4\x04S\xff}\
-\xe5m\xf8\x84H\xd6\x0d`\xe6\x11F\x87\x17\xfa\xd4\xd8\
-\x80apX\x17\xde\xc09[\x98o^\xfe\xd3\x17-\
-\xde\x9f\xc3\xdc\xed\x99e\xa6\xf6\xe8\x22\x22\x22\xa7\x95\x02\
- \x11\x91\xa3\x18\xc6\x0d\xd8\xb5\x8f\x8f\x9a\x17/\xd5?\
-\xf8\xfe3\xcf<s\xe6\xdc\xc5\xee\xb1\xc7\xcb\xe5\xcb\x1b\
-\xeb\xdd\x807\x1b\xc2\xbaj4M\xeb?\xdbvo]\
-\x1b\xbf\xf1\xfa\x8d?~i\xebW\xfe\x04o\x5c\x1b\xbf\
-\xb6\x99\xe8\xd5\xb0N\xd9\xdf\xe6\x10\xc8=\x0c\xd1\x84\x8d\
-'\xe5\xa9\xb5\xc9_\xfb\x893?\xfb}\x8fU\xd5\xf6\
-t\xf3\xf5\xa6\x9d$0\x99yg}\xf9\x8da\xbe\xa0\
-\xbb\xd1\xcd\xe9\xbbS\xda\x0e\x0cz\x8f\x0d\xb6l\xf7\xc1\
-'\xaf\x00\xea\x9f|x\xcb\xbb7\x1e\x1cP\xee\x86Q\
-\xe1\x06\x00\xe5\xa4\xbb\xdb\xdd6\xfa\x1d\xf8\xa1\xd0\xcag\
-5G}\xdb\x95>\xd5\x22\xf6\x9d\x9a\x06\xb8+\xe0A\
-G9\xcb!<\xe0\xdc;Z\x07\x1c\xecW\xbe38\
-\xc2`p\x02\xb1\xf7\x98\xb7\xe7\xfdIc\xe7\x11\xa7p\
-*\xac\x88\x88\x88\x00P\x00$\x22\x02\x1c\x18\xd4\x9b\xa1\
--\xb63a\xe5\xf1\xed/\xf8O\x7f\xdb\xf9\x0f>\xf7\
-\xc4\x93\x8f\x9d]_g\xaa\xae\xe6\xe1\x9bu}\x1d\xdb\
-\xa5\xab\xc7a\xc8u\xbd>Z{r8z\xfe\xe9z\
-\xfb\x853\x1f\xff\xd8\xf9\x1f\xff\x1e\xfb\x83?\xdd\xfa\xaf\
-~#\xbe\xf8\x8d\xf1\xf6\xce8\xf2 \xa5\x07\xd8\x7f\xe3\
-(\x85\xcc\xed\xf4\xd9\x0b\xd5\xbf\xf3\x83\xef\xfc\xd9\x1fx\
-\xea\xec\xc6\xce\x8d\xd7_\xeevn\xd6NO\x04\xcd\x22\
-'\x98!\x0c\xd6O\xe2\xa0\x11\xe4q\xcd\x95\x8f\x9d\xe1\
-5_\x1a~\x99\x9e\xcc$\x16v\x0f\xb2\x03\x95\x0b\x0f\
-x|\xdbW=)\xf4\x91Sj\xb7\x19\xd7\xfe\x85\xfe\
-\x1e\xec!\xf4\xad\xb4\x18\x87\x8eBDDDN\x13\x05\
-@\x22\x22{\xf9\x8f\x1b\xc6-\xa2\x1b?sa\xfa\xe9\
-\x8f\x8c\xfe\xf2\x0f<\xf6\x9e'\x9f\x18\xd8\xa0\xd9\xd9\xee\
-&;\x8e\xcdI\xd9\xbcqes\xd4\xe5\x8dT\xb5\xa5\
-t\xedt\xba\xb3\xb3\x95*\xe4!\xd3`h\x83\xb5\xcb\
-\xeb\x8f_z\xf2#\x1fH\xff\xfc_|\xf5\x1f\xfe\xb3\
-\xd7~\xed\xa5\xf36\x18n\x0c\x0d\x0f\xb2\x0d\xeb>\x1d\
-ms\xab\xfb\x8e'6\xff{?\xfa\xc2\xe7\xbe\xf3\x03\
-\xa3z\xf3\xdak/\x97\xc9\xf5:\xb16\x80a4\xef\
-\x9b\xfb\xec]\x0c\x83\x19\x10Kus\x06\xc1%N\x95\
-\xb3\xc5\xe55t\x14yX\x110\xba\xbe\x87EDD\
-N-\x05@\x22\x22\xb3\xdc\xc1\x8cMA7\x8d\xefx\
-\x1f\xfe\xdd\x1f/\xdf\xf4\xe1\x9dK\xeb-w\xde\x98\x5c\
-\x9f\xd8\xe6\xa4N\x1cV\x00\xba\xb5(\xd6:\x8aU\xce\
-\xe4$\xd0\x05\xa21\xba\xc3\x0dt\xafFkO\x9c\x7f\
-\xea{\xce\x5c\xbe\xfc\xec\xf6\x7f=\xf9\xf3W\xa2-)\
-'[\xbcn\xd4\xfd@`:\xe5S\xa3\xe9O~\xe6\
-\xfc\x8f|\xc7\xf9\xb5\xd1[\xd3\xeb_\x1eL\xbf^U\
-Mv\xa0\xed\x93\x1a'`F\xeb\xe7\x95\xc0`4\xd0\
-#\x8eKcn{\x1aK\x8c\x005eD\xe4aF\
-\x00\x169E\x82j\x80DDDN+\x05@\x22\x22\
-\x00`\x86\xa6\x8d+7\xda\xcf}\xe4\xe2\x7f\xf8W\x9e\
-z\xdf\xbb\xdf\x8c\xf2\xc5\xcd\xab\xd7l\x8c\x5cpf\x0d\
-\xc9\x0c\x0d\xe1\xf0\x04\xd4\x81\x0epx68S\x01\xc0\
-\x16\x01\x80\x81\xe9x\xdap\xbb\xdax\xcfw}\xea\xdd\
-/<\x97\xfe\xab_\xfc\xc6\xdf\xf8\x07\xafw\xc8\x176\
-\xd2\x03>\xa9.Pc\xe7\xdf\xfen\xfbK\xdf\xff\xcc\
-h\x986\xaf|\xc5\xbb\xabk5\xbc\x10\xed|\x9ds\
-\x98\xc1\xd0\xff\xda~7\x86\xb9\x8b<\xc6\x97\xaa\xe31\
-\x1af\x8b\xc0\x8b\xc8C\xc9\x11\x06\x14\xf3\xea\xed>\x12\
-\x11\x11\x119\x92\x02 \x11\x11\x98s\xd20\x83\x9f\xfb\
-\xd0\xf9\x9f\xff\xa1\xc7?\xfa\xc1\x82\xad\xb7\xae\xbd9\x8e\
-\x1d\x0c\x0d\x83\x01R\x9d1\x05\xb7;$\xd8\xba#\x03\
-\xc5\x11\x8e&\x81\x01\x04\x18\xd9\x83\x89\x04\x86\x06o\xdb\
-\xf1[_\x1f\x9e\xe7\x87>\xf0B]\xbd\xf3\x8f\xbf\xb2\
-\xfd/\xbe\xb8\x15\xf4C\x9dl\xee\xe3\x19\x01]\xa0m\
-\xdb\xef\xffH\xf7\xe3\xdf\xb5\xb6~vs\xfc\xe6\xcb\xb1\
-\xfd\xe6pD\xb7\x88\x09i\xf0\x1a\xe6\x00\xfbn\xc7\xfb\
-\xdb/\x17\x18m\xc1Z\xce\xb7?\x89%\x12\xa0\xfe\x8f\
-c\x9f\xa8\x92\x02\x91S\xcca K\xc5\xe9Z4\x85\
-\xf5\xdb}<\x22\x22\x22r\x84\x87c\x09\x0c\x11\x91\xfb\
-\xc7\x1d\xe3\x86\xdb;\xddw}\xf8\xf2\xff\xf1\xdf\xff\xf8\
-\x0f|r\xe3\xe6\xab\x7f\xdel\xbe|\xa6*\xe7\xd6\xb0\
-6@2\xa0\xed\x10\x05\xd9\xe6\xc9\x0aAG\xeb\x98:\
-\xa6\x09\x8d\xa3KV\xcc\x0bR\x87*\xb0^c\xa3\xda\
-\xee6\xbf\xbc\xf5\x8d/?\xf3D\xfd\xbf\xff\xb7\xbf\xe9\
-\xe7\xbe\xeb\xf1fZ\x9a\x96\x0f&\x01\x0a\xa0\xe9\xf8\xf4\
-%\xfb\xf9\x1f:\xf7\xdc3\xa9\xbc\xf9\x0dN^\xdf\xa8\
-\xdb\x1aS\x94\xc6j\xf3\xda\x0c}\xd3\x8e~A\xf3>\
-\xee!P\xe6\x91\xd6\xb1\x1b\xb7\x85\x1fw\xf0\x90c\x9f\
-w\xbb\xcd\x8a\xc8i\xd4\xff\xb4\x08\xf3\x8d\xb2\xf3T\xf3\
-\xa6\x81\xf7m\xbdy\x11\x11\x11Y\x9e*\x80D\xe4Q\
-\x17\x81\xd2\xb6\x9f\xfdh\xf5\xef\xfd\xebg\xde\xf5\xc4\x8d\
-\x98|yz\xe3\xadj\x80\xba\x02*\xa0\x03\x02\x08 \
-\x99\xa5\x8cH(\x06\x04\x0c\xf0\x04T\x80\xcf\x87:-\
-b\x8c\xe8\xd0\x015\x87C\xb0\x94\xad\x1b_O]\xfd\
-\xfeg\xdf\xf7c\x9f\xbd\xf4{/\xbd\xf9/\xbf\x16%\
-j\xf7\xfb\xdb\x0e\xc8\x0c7\xb6\x096?\xf7=\xe7?\
-\xf9\xde\x84\x9d7\xdb\xe98%\xcfn(\x05\x0e\xeb\x7f\
-=\xdf\x19\x08\x1a\xc2\xe6\xe9\x0f\xc3@\x90\x860\xbb\x8b\
-\x09kK\x9c\x9cF\x8b\x22w\xa7\x9f\xc6\xb9\xb7\x06{\
-\x1f\xe7\xde\x87\x8e<\xfd\xf6H\x06J\xd0g\xbb\x8d\xa0\
-\xb1\xc96\xcdy\xb6w\x11\x11\x119e\x14\x00\x89\xc8\
-#\xcd\x1do]\x8f\xf7\xbf\xc3\xfe\xdaO\x0f?\xf4\xe2\
-7\xb6o\xfc\xf6FL.\xd4d\x832\x81ex\x02\
-\x0cHF\x98u\x09q\x16\xa8\xe0Sb\x82T\xc1F\
-@mp\x04\x10-\xdc\xc1mx\x8b\x16 F\xc3\xb0\
-jk\xf3\xc6\xe7\xc7\xbe\xf5\x89\x17\xcf\xfe\xaf\x7f2\xfd\
-O\xfeo\xdd\xab[<\xb7\xb6`z\xd5=P\x0a\x86\
-h\xde\xf7\xfc\xdaw}\xd3\x13\x1b\xd57\xda\x1bWs\
-2\x871:\x03Pv\xd7\xdc2\x9a\x87\xa1x?\xff\
-\x8b\x00\x0d4\xc0\x03\x16w1p\x5c\x22\xde\xa2J}\
-D\x96a\x063\x83\x19Ip\xb6\x06\xdf|\xdd\xc1Y\
-\xfe3\x9b{j\xf3\x8c\xe8n\xf4\xdbw\x0b\x80$\x18\
-\x84\x11DDN\xddxm\xed\x95\xea\xf1\x0a\xa6\x04H\
-DD\xe4\x14\xd2\x140\x11yt\x190mc\x90\xdb\
-O\xbe\x7f\xed\x03\xcf\x9f\xa9\xac\xc91fCk\x91\xe0\
-\x86\x8c.\x93)\x0ca\x08c\xf1\x08\x94\x00\x03%\xbc\
-\x84\xb7\xe1M\xf88|\x1a\xde\xd1:\x80\xc8@m0\
-\xa0\x05\x1aT@Fiv\xae\x19v>\xf4\xee\xf5\x8f\
-\xbf0\x88\x12\x93\xee>\x9e\x14a\x93\xa6\xfb\xb6wM\
-\xff\x83\x9fz\xea}\xef:\xdfL\xda\xe0\xac\xc4\xc7\xcc\
-\x00\x879\xe8\xa0\xeb?\x01\x22\xb2\xb4>\xad537\
-33$\x9ft~u+\x05\x5cK\xc1\x8b\x88\x88\x9c\
-N\xaa\x00\x12\x91GW\x074\xe3\xf8\x0b\xcf\x0d\xff\x07\
-\x9f}\xec\xdc`\x13\x93\xb76\xdcP\x88\x16\x96r\xf8\
-\x19Z&\xb6\x99\xb6\x0d\x0c\x92h\x8d\xad\xd3\x99&\xac\
-\xc7\xa01v\x8c\x86\x18\x819\x97Hha\x06K@\
-A!\xa6\xf0\x8c5g\xe9n\xe2f\xf7\xd8\x853\xff\
-\xde\x8f^\xf8\xc2\xcb\x93/\xbd6\xae7\xb2\xd9}\xc9\
-_\x22bd\xcd7\xbd{\xf0\xf1\xe7\xaa\xb5\xf6\xcd\xe9\
-d\xd3\xe1\xb4\xe4f\x88\xf9\xaf\xe5\x8d\xf4~\xa2W\x84\
-G\xf1\xd9\xef\xea\x9d\x04aw[\x8c\xb3\xf4\x93\xb9L\
-m\x82\x86\x9a\x22o\x97\xbe\xf4\xc8\xdc=0\xa8\xde|\
-s\xf4{/\x99\x01\xf9A/x(\x22\x22\x22wD\
-\xbf\xfe\x15\x91G\xd7\xb8\x89g7\xd2O|\xe8\x89g\
-\x9e\xba\xc8\xb2\xd3M\xb63XWp\x07;Zq\xb0\
-\x0e\xe4>\x12\x81\x81FZ\x10\x85)f\x9f{\x09\xef\
-\xc2\xda\xb0\xb6_\x0d\x1e\x04\xdb\x98\xe5,4KV\xd7\
-\x96\xa2\x9bn\xdf\xc4\xe4\xe6\x87_\xbc\xf4\xf3\xdf\xfd\xf8\
-s\xc3k]\xdb\xc6}\xf8\x09\x5c\x88`|\xe2\xe9\xf6\
-S\x1f|bc\x90w\xae\xbf\xde\xb5c\xf3d\xb3\xe4\
-\xc7\x00\x07\x9c\x98\x95\xff\xd0\xd0\xf7\x7f\xde\x9f\xbbX\xbf\
-0\xbc\x88\xc8q\xcc\xcc\xccg\x7f\x9b\xb9\xc1\xad\xedp\
-s\xd2\xcf$\x9d\xff\x1c1\xd8\xa1^\xeeK4\x88\xbf\
-\xcf\x1f\xb6\xff\xe3\xed\xbd\xaa\x22\x22\x22\xf7\x99*\x80D\
-\xe4\x11E\xa0t\xf1\xcc;\xab\x8f\x7fs=\xaawb\
-k\x9c\xc7\xe6\x151\xc8\x88\x0a;4t\xe6-\x8c1\
-_\xd0&\x13\xce\x89\xa1E\xb4l\x01\x03\x810\xd0[\
-\xb0\x0b\xa03\xf3R\xa2\x8b\xe4n\xc9\x01\xa2\xc0\x92\xa5\
-\xc4\x9d\xa6\x94\xeb\xdb\xf5\xa5\xedo\xfd\xc8\xb9\x7f\xfe\xf9\
-\x0bo\xfc\x99G0\xf9\xbd\xec\x93a\x86(`\x17\x1f\
-\xff\xe0\xda'?8X\xe3\xeb;\xe3\xb7\xac*\xc8\xc6\
-B\xc6\x81\xb1\x0d\xc1\xb0\xa0\x05\xfa\xc2\x9f>\x1c\x22R\
-x\xbf\x04\xfc\xbc\x8f\xc8RGr\xd7\xe7\x22\x22\x0f\x15\
-\x07cT\xae]\xca\xf5\xe7\xa7\x01 ;\x10\xc0l9\
-0\x07\x00\xe3nK\xea\xbe\x10\x11\xb3\x1f\xa2\xf7\xcc\xa1\
-m\xd9\x91w\xf5q\xf8^\xb1a\x9f`\xc10\x9b\xcc\
-\x96\x9df\xd4\x0f1\x11\x11YI\x0a\x80D\xe4\x11\x15\
-4'/_\xf4g\xdei\x157\xa3m\x87p4\x05\
-\xe6\xf0\x81y\x0b\x00^`\x01 \xac/\x9e\xa1[k\
-h\x11\x80\x03\x04\x1df\xe8\xac\x00 Q`$\xcc\x01\
-sXb\xdb\xb1\x0b\x1fU)[\xee\x0a\xbbhw\xde\
-\xb8|\xe9\xb1\x0f\xbc\xf7\x1d\xbf\xf9\xc5W\xb6\xa2\xd0\xef\
-e\x11P\xd0\xa2\xf0\xd2Z\xf7\xc1\x17/\x5cx,\xf0\
-\xda\xab5\xc7\x96=\x18\x87~\xb5m@\xccV\x0b\xda\
-\x1b\xe78\xe04\x0f\x9f\xddfT\x1bW\x11\xb9#\x04\
-\xc6\xe5]\x17\xf8\xb3\x1f\xcb\xaf_\xf3\xc6sU\xa7B\
-\x10\xcc\xcel\x81\xc2L3X\x0b\xf6\x093\xad\xef7\
-\xdf\xff\xb4\xb9gGq\x90\x1dqW\xdf\x11\x8dnf\
-\x00\x83,\xa5\x94\x12\xa5\x94\xd2\xb5]p\xbb\xc9\x1dS\
-J\x18VH6\xef\xa4-\x22\x22\xb2\x12\x14\x00\x89\xc8\
-#\x8aD\x95q\xeel\x19\x0c7Qn\x1a[\xc01\
--(\x81\xdc\xc0\x09\xef\x0c4\x14#,\x90\x08\x8b\xf9\
-t\xa9H\xe8\x12\x8c\xf0\x8039i\x8cY\xa3\xe5d\
-n\x8c\x0a\xc8A\x8f\xae\xb5.\xa3NUU\x82]S\
-\x9az\x80w]N\xef\xac\xdf\xfc\xb3\x9d\xcba#g\
-\xb9'\xa7c\x86\xa6E0>\xfd\xde\xe6=O;\xa7\
-\x93\xb2\xbdm\xde\x99e\xf3@\x18\xccv\xd3\x1e\x82\x06\
-:\x18\xfb\xb7@\x18\x0d00\x81@\xba\x9f\xad\xaaE\
-\xe4\xa1F\xcef\x8f\x92d\xb00\x1b\xf2\x1a\xbf\xfb\x13\
-\xdd\xd3\x17\xab\x9d\xfcx\xbb6\xea\xea\x04\xd80m\xad\
-\xf1\xba\xed\x94\xd4\x0caUq\x14G\xa4\x96>\x01=\
-w\x03\xa7\xc3\xb9(\x03\xba\xe3x\xa8\xcc\x1f\xef\xfd*\
-\xf5\xfb\x92\x1b\x1e\xc8\x82\xcc}\x94|@+M\xd3\x8c\
-w\xb6\xb6v\xc6[;\x93\xeb76olN\xfe\xe0\
-\x95\xb5W\xae\xd7\xd3\x06\xd7\xb6s\xc7T\xd7\xbe6p\
-\x07B1\x90\x88\x88<\xfc\x14\x00\x89\xc8\xa3\xc8\x0c]\
-g\x83\x81]\xb8|\xdd\xaa\x1b\xecJ\xb4\xe3@r\x18\
-&\x1d\x86\x81d@\xe3\x86\x84Y_\xe4\xd4\xc1w\x03\
-\xa0n\x80f\x03V\xac\xdeN\xde\xa1*}\xdd\x0ci\
-\xf4\xdam\xd0\x8d\xcdm\xe0\xc9\xc1i\xe9\xc2\x0d\x86&\
-W,\xb9\x18n^:\xd7<\xf7t\xfe\xd2\x97\xd8\x95\
-{9\x0b\xac+\xe1\xe0\x8b\xef\xbd\xf8\xf8\xe3>\xdd~\
-m\x10\xdb\x96Q,\xe00\xc2,\xc1vwFc\x01\
-c\xd6\x94\x83\x00\xe0a^\x12\x22\xa3\xaba\x81\xd4\xc1\
-\x02\x5c\xa6\xa3\xf3\x12\xd3'\xec\x01\x0f\xae8_x\x1e\
-\x04\xca\xee\x7f\x0d\xf7\xaa\x9efI\x1f\xd3nI\x14\x00\
-\xc05\xc1Md\x8ed!\x800K\x11\xa8\xe2\xcdw\
-\x9c-\xef\xf8\xc8\x1a\x07e\xa7\xcaM\x95a\x18\xf9\xcd\
-!\xaeb\xdaa\xba\x06TH\x06\x07\xbc\x85\xed\xc0\x0c\
-\xdd\x1a\xc2aeQK4;\xe1\xf7\x5c\xff\xf0\x98\x7f\
-7\x1f~6\x01\x07G\xb0\x1aNF\xd3um\x17]\
-\xcb\x18w\xd8nFW7q\xe5j\xf7\x95o\xd4\x7f\
-\xefw\x87_|\xc3\xbb\xae\xbb\xb1\x1du\x95\x86u\xff\
-\x03C9\x90\x88\x88<\xc4\x14\x00\x89\xc8\xa3\xc8\x80\xb6\
-\xc33\x8f\xc7\xfb\x9f\x99&z\x13V\x18\xc5\xdd\x87\x19\
-\xd3\x0eN\xe4y}\x0cg)\xc1\x81\x84\xa2\xaf\xfd\xe9\
-\x97\xcb\xb2\x03\xa3\x0c\xa3\x83\xc1\x08\xa6\xe4\xd5\x00\xe6Q\
-\x0aK!:O\x96\x11U\xd99;\xb2'\x9e8\x93\
-^JM\x10\xe9\x9eM\xb4\x8a\x88:\xf3\xf9w\x9c}\
-\xec\x0c\xc77\xa7\xdd \xe7\xda\x81\x02\xee\x0e\x84\xac\xff\
-\x85\xfd\xfcp\x0d\xc4|\xd1\xaf}\xb1\x8d\x15X?F\
-\xc2\xbc\x9b\xf5Q\xbd5\x8c\xa0\xef\xbba\xdfc\xf6]\
-\xac\xfdO]8\x8c\xeb\x93\xa6\x13_\x0b\xee\xdf\xec\x11\
-;8\xb8\xcd}}?`\x86\xe2\xa0\x19\xaa\xdd{f\
-ma\x09\x82L\xf0d]\xee\x98:\xb3\xd9D\x900\
-$3*\x06\x92G\xce\xd1\xdf\x9b\xf3&>D\x04w\
-:+D\xdd\x186\xad)\xd1\x1a\x80\xd6\xb6*\x1b\xa7\
-\x16\xe8\x1a0\xc1\x13\x1d\xb4\x96V\x0c\xf0\xd2\x00\xc6\x08\
-\x1e\x9f\x01\xdb\xa2\x00\xe8\x88g\xed\x05\xb6G?\x8f\x80\
-GL\x03\xb5Y\x04\xa7$R\xf6\xbaN\xebk\xe9\x1c\
-\xea\xa7\x1f_\xc3{\xcf\x8e\xa7\xe7\xbe\xe3/\x8c^~\
-u\xfa'_x\xfd\xff\xfb\xfb\x9b\x7f\xfeZL\x8a#\
-\xd9 [\xba\xb7\x8d\x8bDDD\x1e \x05@\x22\xf2\
-(\x22\xac+\xf1\x91\xa7\xa6\xdf\xfb\x1e\xa6\xa6J]\xa4\
-\x9c\xdcZ$\x22\x11l\x90\xfa\x10\xc0\xc0dH\xa0\xcf\
-\xc7\x12\x05 r\x83\x1c\xbbQ\x01\x90<`\xb3\x9e@\
-\x0d\x88\x9c\xc3S\x03\xba\xcf\xfa\x89\x86\xd1\xd0E\xe2\xd6\
-\xf9|\xf5\xf2`xfD\xda\xbd\xfc]r\x09\x18\xf1\
-\xbeK\xed{\xd6\xdf\xf06\xaad\x93<\xaa\xe1Ui\
-R\xb4\x80\x1b\x1cF\x82\xec\xabz,\x01H\x01 \xf6\
-\x06QFx\x0bo\x00\xb32\x00\x13\xbc\x05\x9a[\xea\
-s\x02\x00\xc2g)R\x7fI\xe7\x19P\xb1\x03\xb39\
-\x0e\x0c\xc1\xe6\xf7\xdc\xfa+y\x1a\x00\x07N\xba|\xb4\
-\x11\x8c\xb4\xb7\xec\xda\xad\x0f\xb8e\xbdK\x9f\xd5\xf6\x94\
-\xb54\xbd\xe8H\xc6\x06ili\x9a\x08\x82)\x0a\xc0\
-i\x85\xb6F\xb5\xde\xdd([\xd3\xc1\x16\xacsKm\
-\x1a59\xd5\xa5\x0cl7T;\xf6\xb0D\x1eR\xc7\
-\xc6-\x07\xdf\xd6\x06$C\xea\x1f\xcd\xd2\xf7\xc3\x87\x11\
-\x11l\xaeW\xd1O%5C\x10F\x9a\xc1@\x92m\
-\x94\xfe'\x87\xcf\xdb\xeb\xf4\xf3g\x8f\xdd\xed\xa2\xe9a\
-\x87\xa2\xe7\x83\xa7\xc0\xfd?\xa1\xf6o\x0f@\xb8\xc3\x00\
-sf\xa0X\x1b\xd6\x04\xd2\xa4\xc66}\x0b\xf9\xda\xf9\
-A}\xfe\xe9\xe1\x87\x9eZ\xfb\xcc\x07\xf0\x03\xdf\xea\x7f\
-\xeb\x9f\x8c\x7f\xe3\x0b~e;\xbf5M\xa5J\x83\xca\
-BS\xc2DD\xe4!\xa4\x00HD\x1eE$\xdcb\
-\xa3\x8a\x91'\x04\x9c\x80\xc3\xfa(d\xb7O\x8e\x01\xb4\
-\xf9\x90g>\xa0\xc0\xbcD\xc4\xfaE\xdfm6=\x81\
-\x98\xb5Y&\xc9~l\xd1\xf5K\xde\xf4\xbf\xbe\xeek\
-o\xac\x14\x1ft\xa3\x1c\xd9b\xc1\xa0f\x09m\x01\x88\
-\xef~_y\xf6l\x87i\xb8\xd3\xdci}\x85\x8b\x1f\
-\xfc\x15z_\xbfb\xfb\x93\x9b\xbd\xbb\x0c\xe8{\x5c\x13\
-\xa0#\x1cf\x0f0\xcf8iWl3D\xdc\xfea\
-{\x8f\xdf+_\x82Y\xac9\x13\x0c\xf0\x09\xf6z\xd1\
-\x12 \x1c\xc5\x01g\xe7\x85h\xfb\x17\x9d\x86bN\x8b\
-\x85\xe1\x8f\xc8\xa3\xe2`\xbcKx\x7f[\x18\xbbj\xff\
-\xbcI\xfa\xfc;\x9b\x06\xa6\xd9Sw\xbf\x13\x91\x96\x9a\
-jz\xcb\x11\x9c\x80\x03\xb3\x95\x0e-\x01\x01\x0b\xb0\xa0\
-\xb4\x00P\x9a\xe8\xd04\xe06<\x9f\x19\xae=\xf6\xc1\
-\xf7\x9f\xfb\xab\x17\xd6\x7f\xf2\x95\xad/\xfey\xfd\x7f\xff\
-\xef\xf2o\xbd2\xa9\x87\xd8\x18z25\x06\x12\x11\x91\
-\x87\x8c\x02 \x11y\x14\xf5\x81O\x176-\x5c\x9b\x0f\
-\xfag\x7f\xdd\xc9?\xe8o3\x5c\xd9-s\xd9?U\
-\xa8\x0f\x8f\x1cVy\x1ax\xaaN\xda\xd7\xe26G\x14\
-\x5c\xaf\xba\xa7.\x8dF\x1b\x09\xbcI0;\xb2qV\
-\xdfs\xb2}\x19\x00x7\xeb\x8f\xd3gU{\xe7\xd1\
-W\xf8\x18\xe0\xfd\x82g\xf3\xdb\xfb$)\x9c\xe5\xe8\x0a\
- \x1e\xff\xab|\xc2\xfaYvv\x920g~8\xa9\
-\xcc\xf6}LI\xd5\xfe)`6+_\x02\x80\xa9\xd7\
-\xaf!\x0c\xd6\x01\xed<\xd1C?/\xacB8-M\
-\x87\x1b\xd3\xc1\xa8\x99\x8c\xda\xe9\xb0M\xa9IN\xcbE\
-\xd3\xbfD\x168Tvg\x07\xbf\xed\xdf\xf6o\x1f\x03\
-@ka4\xce\xfb\xba\x19\x81\xd8\xfd\xc9\xed\x19NL\
-[4\xd31\xc7\xd7\x87\xeb\xd5\x85\x8bk\x17/\x9ey\
-\xdf\x0b\xe7\x9e~\xf1\xcc\x7f\xf2w\xbe\xfa[\x7f~m\
-\x82\xc1\xa0\xce)\xa9)\x90\x88\x88<L\x14\x00\x89\xc8\
-\xa3\xca\xfb)\x08\xf7\xd5\x91\x93\x0f<%\xf3\x9cx\xef\
-\xeaj\x02f(\x1f\xb8x\xe5\xa9\x8b\xcfX\x1e\xb2\x5c\
-\x09v\xee\x99\xd1\x11q\xf2\xa4\xa9\x0f\x80\x0a\x10\xf02\
-\xeb\x85t \xc8q \xdf\xd2\x10\xb9\x9f\x0d\x07G\xec\
-\x0bY\x0e\xdc\x7f8\x5c\xe3\xb1_\x9c\xf0X\x17\x5cJ\
-\x1e\xb3\x17\x837\xf0f\xd6\x83i\xf7\xe6\x00:\x03=\
-\xf5U\x09M=\xec\x86\x83\xb6\x1aL\xa7\x83\x06\xde\xc1\
-\x88\xfe]\xa3A\x9f\xc8\xf1\xde\xf6\x94g\x81\xbe\xf2\xa8\
-\xdb7\xfb\xd5\xf6\xcf\x84\x8d\x00:x\xb6\xba6\x16k\
-\xban2\xd9lKg\xac\xbcn?\xf2-\xe5?|\
-\xfc\x1d\xbf\xfe[\xa3\xbf\xf3k\xd7>\xffj\xb76\xca\
-\xf9\xa4e\x8b\x22\x22\x22o\x1f\x05@\x22\x22\x0f\x0eY\
-\x10]\xdf`\xd9\xee\xb0\xda\xe8\x0e\x19\xce\x8cxf=\
-\xbb\xb3L\x9b>\xb5!\x83\x5cv\xae\xd9\xee\x827\xb3\
-\x0e\xd16\xeb\xd4c\xb3Z\x1f\xdb\xd7\x7f\xe3`#\x8e\
-\xe3\xcb\xa3\x0e\x96C\x1dx\xd4\xf2\x05Qwr\x1d\x8f\
-\xec\x0d\x840\xd2f\x8b\xbb\xcd\x1f\xe1@\x0dd\xb0\x03\
-\x0c\xa8\x82i\x16u\xb9\xc1\xc1\x04v\xcb\x1e\xa9\x88\x9c\
-\x12\xc6\xd9\xaa\xf1\xb3\x9fq\xfb\x16\x00,\x88\x027\xe6\
-:y\xf2\x9c\xadC\x01\xa7\x08\x8eo^\xdd\x1e\xdfx\
-\xff\x0bO\xbd\xf7\xf9g\x9fy\xd2\xfe\xaf\x7f\xef\xe5?\
-\xfcz\xaaF\xc3A6\xa3Ba\x11\x11y\x08(\x00\
-\x12\x91G\x149\x9f\xb4\xf4@X?\xcd\x80@!\x0b\
-\x83\xd8\xcdV\xee\x81\xbe\xb7s\xae\xbdJ@\x07\xb6f\
-4\x80\x88\xdd\x85\xadN\xbe\xc9\xd2w\xbd\xa1!h4\
-\x03\x8cn\x84\x81\x0e\x98\xd1\x9c\xd6O\xf6\x98\x87Y\xfd\
-\xb2hvt/\xe7\xc5\x87\xb0\xfc\xa5 pd$c\
-\xfb\xfe\xb6\xc3\xfd\xa1\x09\x12]\x22\x1d^\x90\xe6k\xbd\
-!\x0c\x1c\xa1\xd4`\x0b\x03\xba\x91\x95\xdaK\xe5\xfd\x99\
-\xd3\xac\x7f\x15Os}\x83\x88\xdc\x96\x95\xd9\xb4\xd5\x80\
-\xcdg\x90\xcej\x18\xd3l\x91@v]a1t\xd9\
-:\xf3\x91\xb9\xa1n\x99\xaeO&_\x1d\x0d\x9e\xfe\xec\
-'\x9e<\x9b\x9f\xf9\x1b\x7f\xff\xfa\xaf\x7f\xb1\x8bA\xae\
-+\xcb\xea\x08$\x22\x22\xa7\x9e\x02 \x11y\x14\xd9,\
-\x00\x02p\xf2\xbe\xc3K\xd9?m\x88\x0c\xde\x87\x10a\
-PW\xb9\xce\xe6mJ`\x18\x22R\x82\xc5<\xfb\xb8\
-\xab\xdd\x1d\xf7\xe4\xbd\xd6Iv\xa7\xfd\x93N\x93\xc3\xbd\
-\xb1{>+\xf9\xe1l\xb5\xf80\x0bC\x18\x8a1\xec\
-.j\x95D\xe4\xf4\x9a}c[\xdf=\xbf/\x05\x22\
-\x03\x056e\xb1\x88\xf0\xdc\x9dYo\xc7\x1d\xdf\xba\xfa\
-\xf5\xf5\xbc\xf1]\xdf\xfa\xa1\xc7\xcew\x7f\xf3\xef\xfc\xfe\
-\xdf\xff\xa3\xeb\x9b8S\xd5\x89j\x08$\x22\x22\xa7\x9b\
-\x02 \x11y\x84=\xf0\xc8\xc2\xcd\x91\x92\xb9\xc3\xec^\
-\xee\x9a4`X\xa7:\xc3\xac\xc0h`\xa1y2\x07\
-XN\xde\x06z>\xab\xcb\x00\xd2\x01'<l>%\
-\xcc\x00t\x86\xe8\xcb\x7f|>5\x0c\x01\xc2\x22\xe5\xb8\
-\xdd\xce\xec\x88\xf8\x8b\xb4\xe0\x12m\x91xgK\xc7\x1f\
-\xdc\xb0\x81\xc5rW\x064\xb7 \x19\x15\xa6\x86\x16n\
-p\x07\x18,\xa5.^\xb7\xdb\xb5\xed\xd4\xcd\xce \xc6\
-\x8c\xe9`:\xcdV\xc36:\xf8\xd1\x8d\x8eD\xe4\xe4\
-\xee\xf1\x84\xd8;\xdc\xe9\xbcA>\x01\xe6\xbd\x9f\x91Q\
-P\x8a\x19\xdcQ'\x8b\xbe\x840Z\xa6\xb6+l\xaf\
-q\xb0\x86A\xd5\xc5\xf8\xcf-6\xbf\xf9\xd9'\xd6~\
-x\xed\x9c\xbf\xfe\x9f\xff\x11\xaf\xb6\x177*E@\x22\
-\x22r\xaa)\x00\x12\x91G\xd1\xdeB\xe8\xf6@\xc7\xf1\
-\x96\x1cU\xf2\x94\x92\x1d\xea\x9bsW\xfaR\x95\x9cS\
-N\x06#\x88(\xec:\xe6\x9c\xe0\xb3N\x17\xcbo\x1a\
-\xb3+\xb5\xef`\x03\xfb;=\xfb\xde\xe2]\x06\x0b\xa0\
-\xd8\x11U2\xfbC\xa8#\xe7\xa4\xf1\x96yZw\xe8\
-\xe8\x19n\xbc\xe5A\x07\xef&\xac\xb0\x06\x1d\xa4[\x90\
-\x9d\xa1\x9do\xce\x08\x86\x91\xce\xe2\xd1\xa5(\x99\xadG\
-\x97J\x97<\xbb=\xa0\xb21\x11y\x10\xfc\xc0w4\
-\x1d$\x10F\x80L4 \x82\x01C6\x80\xe0\x04k\
-C`8\x1d\xdf\xfc\x0a\xa7\xd7\xdf\xfb\xa1\x8f\xff\xfc\xfa\
-;\xffh\xfbK\xff\xe4\x8b\x13f\xfd\xbbZDDN\
-5\xfd\x87JD\x1eQ\xf3\x1e6\xb7\xa4\x07\xdc\xf7\xe7\
-\x92[>\x22\x8e\x98\xed\x88\xc7-U~\xb7H\xc0\xe0\
-n\xa0E\xc0\x0c\xc9l\x96\xcbX\xdf\xcf\x99\x00\xf7~\
-=}\xdb\xc3\x98U\xf5\x98\xc1\x9dN\xeb\x07HA\x0f\
-F\x80t\x87;\x9c@2\x14\xa0#\x08$s/\x07\
-\xb3\xad\xddib\xfdu\x99\xf5>:|\x8d\xcc\x88X\
-\xf4\xdb\xf3c\xb3!\xfa\xd1\xd3\xe9\x0en\xea\xf0\x96\xe9\
-\x8c:\x02F\xb0$4\xee-\x00x\x80[\xa0\x07\xba\
-\xb00\xdb\xf2<\xa82\x8dpsD\xb2H\xa9?\x0d\
-u\x02\x12y\xa8\xf5\x0b1\xd2\xc0\x04V{\xb7[\xc0\
-\x0c\xe8H\xa2\x90\xe4\xac;\x90\x99\xbb\x0f=\xb7\x8d\x97\
-h\xd2\xa0T\x03\xb0\x9b\xa0\xbc\xf6\xccs\xcf\xffO\x7f\
-\xfc\x997\xfe?/\xfd\xc1\xcb\xed\x853\xf5=-\xef\
-\x14\x11\x11\xb9\x97\x14\x00\x89\xc8\xa3jw\xf4\xfe\xe0\x8a\
-9\x8c(V\x88{=K`v*}\x7fb\xb2_\
-\xb3+\x19\x802;\xbd~\x10s\xa29o\xb3j\x1c\
-\x03\x92\xd1\xcd\xfb\x0d\x19\x19d\x09\xc2\x08#\xa2\xc0\x8c\
-F \x80\x04d&+G\xa7K\x5c\xae\x1b\xf5\x1d\xb8\
-\xfd6\x8f8\x9e\x14\xe1\xe1\x80\xc1\x1a\xb3)\x18p\x00\
-\x01\xdbA\x05\x18\x99\x11~\xbdpHk\xc2<\xe5\x04\
-$\x16\x0fR\xd3\xbfDV\x85\x01\x19\x98\x07@\xc4\xee\
-w\xb7Y;\x9f\xf1\x8a\x0c\xc0\x08\x1a\xa6\xc3\x9a\x19\x16\
-\x98\x96\x9c\x80<\xe1\xf5/\xd8h\xf3;>\xfa\xcd\x9f\
-\xfd\xfc\xe3\x7f\xf4\x8d\x97\xc7\xd3X\x1f\x9a&\x82\x89\x88\
-\xc8\xe9\xa4\x00HD\xe4\x01\x9a-\x95\x85\xfb\x13\x84\xec\
-\xb1~:\xd5\x12\xbd\x7f\x0enf__\x0c\x03\x00'\
-\x10}\xed\x0f\x0c\x010\xfa\xf5\xb2\x92\xe5\x14\x96X\x22\
-Y{pI\xe4\xf9\x16n\x19\x11\xed\xbf\xe1\xf6\xbf3\
-_t\xff\x91'\xb9\xff\x09~\xcb\xd3\x030C\xbf\xd6\
-\xfb\xc19rF\x1a\xcc\xe1\x19\x01/\x8dE\xc3\x8a\x1c\
-\xa2&\x86\xd1\x85w\x1d`\xa6!\x9e\xc8*\xf0y\x1f\
-\xa0\xb9\xbd\xe2>\x9b\x05\xe1\xf3\xff\x03\x0eO`\x06+\
-\x94\x16\x850\x82\xd1NnL\xed\xd5\x7f\xf3\x07\xce\xbd\
-|\xf5\xec\x7f\xfd\x9b7\x9a<\xa8\xf3}\xaa\xf5\x14\x11\
-\x11\xb9+\x0a\x80DD\x1ez\xb3\xd5\xcchF\x07\xad\
-o\xa8\xea\xc4\x12-\x95\x0fn\xd7\xc04k\x901\xcb\
-\x93h}Wh\xcc\xd2!\xcb\xe8Z\x00)U\xe7\x9a\
-f\xd0M\xb7G~=\xa7}\xe3\xa9\xdd\x83\xb8%\xa5\
-\xb9w\x19\xd81\x05G{\x8e,\xd8\xe9\x10\x9b\xb3y\
- \x8e\xbd\x02)\x82D\x09X\x8d\xca\x06U\x0cr;\
-\x1e6\xac\xa7\xb0\x5cg3\xb01\xdf\x89\xbbN\xd7D\
-dn\xe9&\xd0KV\x15\xce\xa6\xc72\x01\xe9p\xfb\
-1\xdb]\x07\xd0g\x9d\xf0w\xf7E\x87\xd5`\x8d\x12\
-`\x00c8\xcc\x91\xb0i\xe5\x0f^x\xe7\x8b\xff\x8b\
-\x9f\xaa\xaf\x5c\xf5_\xfb\xf3\xae\xde\xd0?\xb0ED\xe4\
-4\xd2\x7f\x9fDD\xe4\x84:\xb4-h\xf0l\x96P\
-h\x96\xebzt\xb6\xca\xeb\xb0:[\xc0\xbb\xd9\xd43\
-\xdb\xb7j\xba\xf1\xf0o\xda\x0fX:\xac:f\xe8\xc8\
-\xfdS\xfb\x8e\x1a%\x1aQ\x02 ,\x90\x02\xceY\xc3\
-\xecp\x87!\x22\xd79\xad\x9f\x1fnW\xc9'\x8c2\
-\x9eN[\x9fX]\xe7J\xbf\xda\x17YU\x0b~F\
-\x19\xac\xaf{\xe4,\x0c7#h\x06\xf3\xa8,\xdaf\
-\xeb\xdd\xcf<\xfbs\x9f\xe9\xbe\xf2\xda\x95\xafn\xe7\x0b\
-\xeb\xce\xa2\xb9\xa2\x22\x22r\xba(\x00\x12\x11Y\x154\
-\xd0\xfb@c\xf6;m\xceVr_4\xa89nc\
-\x89@\xe9\xc79Vf\x0b\xc2\x83D\x00\xc9\x92\x19I\
-zfZ\x0b\xdf\x08\xbf\xd0\xe1\x89\xa8\xce\xd0K\x89-\
-\xb7B8\xfa\x89R\xf3]\xcf>\xef\xed\xb6\x83\xde\xbb\
-\x81\x00x\xf2\xe1\x92\xf9\xad\xa7vkE\xc0\xad\x0b\x8c\
-9\xd0%4D\x04\x00\x07\xbd\x0do\x10\x99\xe5l\x89\
-\xd4\xc4\xcd:\xa7u\x9c\xdf\x8ai\x0cr}f+M\
-\xe8\xee\x9e\x13\x9d\xdd\x12\x17TDN\x9d\x00\x09\xebf\
-?4\xfa\xe2I\x0b\xa0\x05b\xfe\x93\x0b\x80#R\xff\
-o\xe6\xb0\xcd\xc8\xf0bdr\x1b\xd1\x1bx\x07c*\
-\xe0\xcd\xb7\x86\xeb\x83\x1f\xf8\xd8\x99_\xfe\x83\xb5\xaf\xfc\
-V\xdb\xd59%\xfd\x9c\x10\x11\x91\xd3E\x01\x90\x88\xc8\
-\xca\xf0Y\xb3\x9b\xbd\x0f\x83/\xb9\x22M\x800\x1a\xe0\
-t\xd8|#\xb3(\x07n\xec\xc80\x84WmY\x7f\
-\xf5\x8d\xf6+\xaf|mk{\x00\x98{\xec.\xf5u\
-\xa0\xf13\x8d6/\xd7\xb9\xb5\xf1v\xcc\xf2\xa5\x13\x9b\
-\xb5\xbb>x\x13\x0e\xa5@\x868\xbc,\xbc!r\xea\
-\x08v\xecO5J*\xa4\xb1\x9b0,|Z\xd5V\
-W7_\xbb\xd6\xfc\xd9K\xdb\xe3\xa6\xce\xeeL\xc6\x88\
-@\x87\xa4Q\x9d\xc8\x0a\xe8\x1b\xba;\xac\x00\xbb\x01P\
-\x01:\x00\xfb\xaa\x81\xfa?\x13P\x0a\xc6\xf4\x00\x86\xc6\
-\x11-\xb9\x15Z\x07\xc0\x89n\xb2\xd3\xc5\xabg\x1e\xbb\
-\xf4W~\xe8\xd97_\xfa\xbd\xdf|\x05\xbcp9\xab\
-a\xbc\x88\x88\x9c&\x0a\x80DDVA?p\xf1Y\
-c\x1e\x9b\x0f]\x96oR\x13\x8epx\x90\x08\x87[\
-\xcc;X\x9b!\xac#;KfC\xe2l\xc1\x99/\
-}\xfd\x1b\xff\xf0\x17_\xfb\xda\xcb(\x0e\x0e\xe7+\xc8\
-\xcf\x17\xa7\xdf;\xc2[\x0a\x7f\x0e\x9cBY&\xaa2\
-\xc0\xd2\xc2\x13\x8d\xf9\xe3\x0er \x19\xd8\xcf\xfa\xea?\
-\x1c\x0c0\xdc\xc3r.\xa9B\x10\xe3\x16\xd7o\xf8\xcd\
-\xf1\x13m\xda`\xee\x225\x88.\x11{S\xdbD\xe4\
-a\xd5\xff\x9c,\xb3Ve\xfdr\x86\x16\xbb\xa1\xf5\xfc\
-\x8f\xfe\xcbB\x90\x99a\x80\x17\xb3\x09\x80\x880VV\
-\x800\x8b\x08:&\xcd\x07\x9f\xc9\xdf\xffm\xe5_\xfd\
-rz\xa5\xb5\x5c\x814\xd8\xe1\x12D\x11\x11\x91\xb7\x85\
-\x02 \x11\x91U\xd0\xb7'5T@\xe2\xac\xd2f6\
-\x0b\xec\xc4\x088:G\x97\x90\x8c\xc9\xa2B\x18\xd3\xbc\
-\x89\x8f\xc1S\x90\x1d\xdd\xfd\x5c\xa4K\xa8._o\xb6\
-\xff\xec\xcb\xaf}\xf5-\xd0\xb0\xb3\x8e\x06\xb0\xdd\xc6\xcb\
-\x9c\xfd\x92\xfdP\x1f\x9e\xdd<h~\xfc\xe6\xb1L\x05\
-\x90\x19\x8b\xcf\xb7qd\x0et`\x9b{\x8f1 ;\
-Ht\xa8\x83\x1e\xd6\xd2Z\xb2Bw>\x85\x0d\xaa+\
-\x9e\xdbbpC6/\x833]\xac\xb1\xbe\x81A\x97\
-Z$\xcd\x01\x93\x07\xc7\xe6+Ua_01/]\
-\xd9\xbbQN\xcef?\x9c\xe6\x01P\x10q\xd4\xe5\x0c\
-3\x07\x09'k\xd2Q\xd0\x06Zt0xj\x87U\
-W{1+\x91R\xc2\x8d\xd7s5\xfc\xe8\xc7\xce?\
-\xf9\xe7\xf8\xca\x9f\x97\xb5\x0a\x1d\xb2\x91\xb9_T\xfe\xc1\
-\xda\xfbaw\xcb\xae\x17\xfc\xf8\xba\xcfG\xc9\xfd\x7f\xeb\
-\xa7\xa8\x88\xc8\x03\xa6\x00HDd5\xf4\x91\xcbt>\
-,\x8c\xbe;\xe9\xd2\x1cHa\x1e\xf4(\xa0\x036\xeb\
-\xd3cff\x8e\xf0(lw\xdc\xb6\xab\xfa\xa2#w\
-@\x01\x06gr=\x1a\xb2\xaf\xa5\x01``\xcc\xff\x89\
-o\x07f~\x1dj\xddl\xec\xcb\x97N\xcePfY\
-\xd3\xad\xf3\xcavw\xbc\xff\xb4\xf6nu#a\x8e\x1c\
-\x91\x80\x96\xde\x12\x15\xdb\xb5D\xe4<2\x0bw$g\
-\xb6A)\x1e\xd3\xb6D\xeb\xc1\xfew\xf9\x1a\xb7\xc8\x83\
-\xd2\x97\xa9\xed~n\xb3\xc9\x9e\xb3\x7f\xc2\xcd[\xd5\xec\
-}K\xcdV\x05\xbce#G~~\xe47\xdd\xc3\xf5\
-\xee^\xfah\xf7\x9f\xfb\xee\xa5[\xf0S\x88F:3\
-\x00\x94\x02\x90\x01G\xc0J1\x83'0\xc0\x06\x93\xc6\
-\xf2\x99\x17\xde\xb9\xfe\xae\xcb\x93\xdf\xfe\xb3\x8e\xcc\x8e\xb8\
-uV\xea\x03@XG\x90\x04\x19Q8/\xe2<|\
-\xc1\x0e\xe6\xf2{m\xdb\x96w\xdc\x99\xd2\x0c\xfd\xff\xdc\
-m\x1f\xd8\x12\xed\xdfDDd)\x0a\x80DD\x1e,\
-\xc2\x03\xde\xff\x03\xfb^\x8e\x08\x8c\xd6E\xda\x84\xb5\x0c\
-\xa7Ed\x22E\x823f\xfd\x98\xf7=t\xf1\x96\x00\
-\xa2\xee\x1c\x00HD\x18ZX\x07K\xe1V\xcc\x13J\
-FI\x0e\x96k^\xd0N\xd7s\x99`\x03\x9b7\xf3\
-\xb8\xbePy\xed\xdc[\x82\x9ei\xdf\x89\x1e\x1ci\x1c\
-\xde\xe9l\x98t\xe2\x13\x9f'G'{\xb6!ha\
-@\x02\xe0\x04\x12-\x19\xc0jl\x000\x04j\x10,\
-,\xe6\xe4\xf5*\xa3f`\xda\x974\x89<\x18\x06#\
-\xd0\x02\x05$\xe0`F\x0c\x11\x8e\xa8A\xc2\x01\xeb\x0c\
-\xec\x97\xa72\x86\x91Nw\xfa\xee\xe4%\xdbkC\xb3\
-ofS\xef\xc8\x99I\xb7\xf9\x01\xb1\xc8\x03\x9e\xe9d\
-\xcb\xaf\xc87/\xaa:\x90\x02\xf9\xb1\xe1\xae\x05\xac\x00\
-\x9e\x9b\xf5@2\xec\x98M\xfa0%\xd8\xb5\xce\x09S\
-5h\x9c\x93`T\xc6\x8b\xa3\xf1\xc7\x9e\x8a_^[\
-\xdf\xee\xf2\xb0.\x0f~\xe1\xc0\x00\xa2\x90A7\x18\xac\
-rsG\xb2\xbd^\xfcfp\x18\xc9Ye\xe7|a\
-3\x82\x9d-\x93q\xfb\xeesf\x97\x94\xfb\xdfI\x04\
-\x82\x16\x81\x80\xf5\xfb$\xc9@\x18\x8d\x91\x92\x99&\xd5\
-\x8a\x88<\x10\x0a\x80DD\x1e\xb4\xfb\xf8\xef\x5c\xeb\x1b\
-\xda\x18\xf6FbK\x8e<l\x7f1\xc1\xfc\xb3~\x94\
-\xe9$\x88\xf9P\xa9Kh\xc9\x88\x84i\x95:V\x08\
-\x8f\x83\xc3\x9d\xbd_(\xf3\xc0\x8d\x87\xf6G\x00K4\
-L%\x0c\xe9dO\xd8\xdd\xa5\x1d\xecnM#\x08\xf4\
-k\x9e\x19P\xa1oc\x04\x9auf<\xe1\x8eD\xee\
-\x89\xc3\xd5rGM\x0a;Dc\xe9\xfb\xa1\xff)\x91\
-\x18\x95\x9b\xdb|\xfa\x9d\xc3\x02\x1e\x860\x02\x11\x08C\
-\x0b\xe2\xd3/\x96\x7f\xf8\x8e\xfa\xd7^\x1a\x0e\xeb\x07t\
-|f\x08b\xda\x92\xc1\x96\xf6x\xda\xfa\xe0\x85\xe9\x85\
-K\x97/\x5c\xb8p\xfe\xdch}\x94\x07\x03\x1f\x0e|\
-X\xe7\xe40\x84\x93\x01\xfa\xac\xbc\x8c\x0ewx\x97\xba\
-Ij\x09\xda\x09\xdfE\xce\xbe9\xfel\x1d\xca\xb0\xd9\
-\x5c\xe40\x80\xd6\x06\xda\xce\xa7\x0d\xc6S\xeel\x97k\
-7\xc6W\xaf\xdc\xbcq\xf5\xe6\xcd\xeb\x9bo^\x8f+\
-\x83'\x91\xf30\x9b\xbb\x91\xfb{\xc7\x89\x88\xc8=\xa6\
-\x00HDd\x95\x1c\xd3\x07\xe7\xe4n)Q\xba\xb5\x88\
-\xa7\x97\x88\x04\x98\x05R0\xa3\xd8\xde\x9aa\xb7<y\
-\xe1\x0emo2\xcbI-7}\xe0\xd6\x0eI\xfbO\
-z6\xeff\xfek\xe9\xbd_o\x8b<p\x87\xbe\xaf\
-y\xf0\xe3\x10rVc\xb1\xfb\xa65;\x90\x16\xddn\
-\x0a\xd8\xdb\xf0F_v\x97{\x1d\x9aOh\x99'\x19\
-\xc0@\x09\xb8\xa3\xd8\xeeO\x0b\xa3\x83\xc9\xc2#,\x98\
-\x00\x90\xa0?ui\xf4\xe4\xc5\x8c\x97\x82\xb8\xef\xab\xc1\
-\xf7\xe53\x93\x96MS*\x8b\xf3\xa3\xee\xd2\xd9\xf8\xf4\
-\xbb\xbb\x1f\xfa\xa6|\xee\xb1j\xe3\x9c\x8d\xea\xd60\x86\
-\xc5h\x94F\x83d\xd6\xb2\xed,H\xccg\xb4\x12f\
-\xc9\xe9@)hf3\xb5N\x84\xf3\x18\xdf\x02 \xad\
-o\xa7\xdd\xef\xc0#U\x85U\xe9Ri}:\xe1\xcd\
-\x9b\xe5\xda\x15\x5c\xbf\x1e\xd3-\xfc\xab\xd7G\xff\xe5\x17\
-\xe2\xe5\x1b\xdd\x8d\xa9\xbb\xa7\xb5\x01r23\xf0\xc1\xd7\
-M\x89\x88<\x02\x14\x00\x89\x88\x88\x88\xac\x0e\x22xD\
-\xd1\xd0\xee'q\xd4]o\xaf#\x93\xac;\xb1\xf4\xf1\
-/\x97\x1a\x1b\x19d\x99]\xde\xf9\x1c\xb2dd2\x8f\
-y\x13\xa1(`w\xf6\xfc\x93\x17\xce\xd31!\xd3}\
-\xbd\xc4\x06\xb4\x1d\x9b\xaeL[~\xf8\xc9\xfcS\x9f\xba\
-\xf8\xe2\xf3\x83\xa7/l?u\xfe\xe6\xc53\x91s\x0b\
-\xbf\xc2hJ;\x0d\xeb\xaa\xda<\x03\xed8Jk\xd1\
-\xd7<\xc2\xfa\xcb\xdf\xc7H\x05\xb9,\xdb\x91\x87\xf3\xbc\
-\x11\xbb\xd3\xca\x00\x00n\xc8\x0e8\x22\xc1\x06X\x1b<\
-5\x1a\xe0\x89\x8a\xb8\x00^~\xfd\xc6\xd9\x0f~\xeb\xe0\
-\xa5\xab\xfc\x85_\xbb\xfa\xa5\x97\xb7\xbb\xd6\xa6mJ\x09\
-\x83\x0an\xcb\xac\x0c \x22\x22\x0b(\x00\x12\x11\x11\x11\
-y(p\xd6\xf5\x99GW\x00q6;,\x01i\xde\
-\x07\xda\x0f\xce\x17\xe3\xc1\xfe\xd0\xb6o\xcb\xb7\xdex\xfa\
--\x1d\x00-\xd9\xeax6Suw\xe6\xa8\x03NC\
-\x18\xc3\xfaI\xa5\xa0u\x81i\xa9\xceV\xef\xb8\x84\xb5\
-jR\x02\xf9\xb8\x0e\xf5\xf7B[\x02\xd1^\x1c\xf2\xb3\
-\x9fX\xfb\xf9\xef\xb9\xf8\xc1w\xadm\x8cZ \xa1\x1b\
-\xb4\x93\x9d\xa6\xdb\x8e\xe8\xcc\x8ag&\x0f\x8eK\x89(\
-\x9c\xce\xa6\xbc\xf6\x89\xcd\xac\xffO\x02\xe8A/K\x86\
-qF\xdf\xdd\x1c\x8d\xfb\xca\xceH\x0f\x86E\x14 `\
-\xcc\x19\x96\xdd\xdc\x01\xbft\xde>\xf7\xd4\xe0\xb39\xfd\
-\xe0\xa7\x9a?~i\xe7?\xff\xa5\xe6\x0b_\xb1\xad\xb1\
-7m\xce\xd9\xfd!z3\x8a\x88<\x0c\x14\x00\x89\x88\
-\x88\x88\x9cr\x9c\xd5i\xccG\xd7\xe1\xb4\xd9\x97\x85\xc8\
-\x04\x08\xc2@K\x84s\x1e\x03q\x96R\xf4+\x81\x1b\
-pK\x83\xae\x19?\xb0\xaf\x87\xc6\x03\x0e\x80\xe6/\x01\
-\xb1w]\x8d\xc6b( \xd2\xbc\x88\x06\xd3\x0el\xbe\
-\xf3\x83\xc3\x7f\xf0\xcf\xfdw^\x8a\xf3\xeb\xb7\xce\x8b\xbd\
-[f\xd6v\x9c4a\xc6\x1f\xfb\xc4\xd9\xbf\xfc\xdd\xe7\
-?\xf4tuqc\x137\xbf\x80\xab\xd7\xc1\x14y#\
-\x05S44ZeF\x18;\xb6m\xd7\xd1\xb3\xa7\x1a\
-\xc6\xd94+#\xc0\x0cK\x98U\x02-wD>{\
-\x17Y\x00\xc5\xac\xc0\xfbJ\xa2\xfe]\xeaf\xd9R6\
-&\xd0\xadm1-\xd1D\xd7\x056\xaeTV\x85\x97\
-\xf7\x9ck\xdf\xf5\xad\xf8\xd0{\x86o\xbc9\xfc\xfd?\
-\xf4\xff\xc7/\xf1+\xd78\xa81\xac\x91\x5c\x13\xc2D\
-D\xee\x0d\x05@\x22\x22\x22\x22\xa7\xdc\x9d\x0f\xcaw\x9b\
-\xd3\x1c\xbd\x9c\xd51\xb7?R\xc3\xeb\xa5g\x9c\xc1v\
-\xcbff_\xcf\xea\xb1\xd8/dn\x0e#\x22\x10D\
-\xd7>\xf9\xd8\xd9\x8bg\xab\xae\xb4\xb8\xa7\xfd\xe3\xcdP\
-\x02;\xe3bh7F\xf6\xfd\x9f\xba\xfcW\x7f\xfa]\
-\x1f\xb8D\xdcx\xa3{\xeb\xcd<\xb9\x82\xae\xc0a\x84\
-YF\x22\x1c\xb4@D \xbc\xb2\x5c\xdbl\x99/\xa3\
-\x05\xe6\xc1`\xbf\xde\x1c\x0c`:i\xc1R\xdf\xfc\xd9\
-\xe7\x15@\x98\xd5\xa2\xed[\x88\xc0f\xab\x8c\x01\x00\x22\
-\x08G\x097\xcf\x19%\xb6\xcbN\x87:\xdf\x9ctS\
-\xeb\x1e?{\xfe\xd9\x0f<\xfe\xe2\xd3O<\xfeD\xf9\
-\x7f\xfe\xa3W\xff\xe4\xab\x9b;cz\xf6Q\xed\x9a\x11\
-&\x22r\xf7\x14\x00\x89\x88\xc8=D\x18\x97ZFz\
-\xd9\x7f\xd7\xdb\xf2c9\x91\x87\x81\xed\xfb\xd8\xfdr\xd6\
-\xc2\xbc\x1fU\xcf?l\xfe\xfd\xe0\xfd\x82U\xf3N7\
-\x87\xbeA\xba\xa3vr\xbb\xb5\xe1\xef\xc0\xd2\x1d\x99\x1f\
-|\x0f\xa0\xbbh\x1c]\xdc\xd8W[\xed[C\xb0C\
-\x22J\x07:`\xf0\x16$\xca\xcd\xe1\xe0\xc2hP;\
-\xa6\x86\xcc{\xf7c\x8aD\xdb\x96h\xbb\x1f\xfe\xf4\xe8\
-\xe7\x7fl\xed\xddO\x8e\x9f9\xff\x07[\xaf\x8fyc\
-g\xc4)\x93\x19j\x006\x02R\x00\x81\xd2u,\x11\
-\x00\x903R\x06\x88\x08\x02\x8cYi\x18\x81.f\xab\
-\x9c!N\x9cV\xf5o\xc5BV@_\x01\x14\xb3?\
-\xe7\xf7\xa6\x04 \x0c\x13\x86\x81F\xb8U\xee\xc8\xe6\xe6\
-,\x1e\x8d\x97\xc8\x855\xd1\xdd\xd8\x9e\x8c\xbf\xb2V\xbf\
-\xf9#\x9f\x1c|\xcb{\xf8G_l\xfe\xb3\xff\xc6\xfe\
-\xe0\xab\xb9K^i\x19F\x11\x91\xbb\xa6\x00HDD\
-\xee\xad\x07\x9c\xc8,\xd9\xcbC\xe4!\xc1\xc51\xc7\xfe\
-n@\xf3\xee\xbb\xbb\xfdWp\xc7\xdf\x8f\x87\x1es\x17\
-\x19\xd0\x83\xf5\x00[\xc4\xf4\xb3\xa3,f\xcb\xaa\xd9n\
-jF+$\x19\x85L\xe6>\xef]<\x1d\x0d0\x1a\
-d\x10\xc1eC\xb5[\x04\xb0\xb5\xd3\xbd\xf7r\xf5\xb3\
-\xdf\xf3\xce\xef\xfe\xae\x8b\xef{\xf6\xe6\xe4\xe6\x17n^\
-ys\x18\xa8\x06\xc8-0ut\x86\x813\x83\xd6\xa1\
-t\xe6H\x06O\x00\xe0\x11,@\xdf\xf0\x07H}\x83\
-\x1e\x10\x84\x9b\x11\xa0\x83\xe9\xa4M\xa0\xe7Y\xe4\xac\x0c\
-\xaa\xff\x13\xd8\x0b\xc8\xd0\x80\x86\xc8nf\x06s\x8b.\
-\xc2:v\x80\x0d\x10\xb9\x00]\x97\x88T\xd5L\x98\x94\
-\xcdv|\x1dUz\xe1\x9d\x17\xdf\xfd\xcc\xe5w>~\
-\xe6\x17\x7fc\xe7o\xfd\xc6\xcd\xb7v\xb0>\xea\x8b\xac\
-DDdI\x0a\x80D\xe4Q\xb5j\x85#F\x06\x18\
-\xf3\xa1\x09\xbd\xffG\xf9}?G\x87\xcd\xd7\x11&U\
-\xa0/ro\xcd\xb2\x9c\xfdy\x8e\x05\xcc\xfb\x9e?0\
-\xb8Y!\x0b\x8b\x19\x01\x940\xf6\xd3~\x8cH}\xb1\
-\xd0|\xc9*\x0bp\xfe%\x0eV\xfd\xec\xffihX\
-\xee\x87\xe3\xdd}\xf3/\xfd\xecc\x9fH\xee[\x90\x0a\
-\x00\x10\xf3\xf6\xd9\xbeLs\xe1~[af(\x09t\
-\xb0\x05\xfa\x15\xb3\x8a\x19\xcc\xddJB\xcc\xff\xd3\x12\x1c\
-\xe42\x18\x98\xe1\x1e\xb5\x806t\x85\xed\xa4=\x9f\xcb\
-\x8f\x7f\xfb\xd3\xff\xe3\x1fy\xca\xaa7n\xbe\xf2\x154\
-7\xb2aP\xc1301\xb4\x19i\xc8\x1c\x9d\x8d\xe1\
-\x05\x84\xb9\x9b\x1b<\x00\x8b0\x06\xf7\xda\x82;\xb0{\
-\xb86\xfb\xa2\x8ee\xe2*\xa2\xcc\xd7\x14\x0b\xa0\x0f\xca\
-\xf6\x02\xa0\xbe\xfe\xc8\x8d>\x8f\x9c\x18\x0c\x82A/@\
-\xe9\xdf\x9f\x15h(\x18xrG\xdba\xf3\xc6\xd6`\
-\x94>\xf6\xde\xe6\xd2\x99\xe1\x9b\xe3\xfa\x17\x7f\x7f|}\
-\xc7\x87\xa3\x94\xdd\xd4\x13HDd9\x0a\x80DD\x1e\
-z\xfd?\xd6I\x92\x06\xb3~\xd0\xe3\xbbSDD\xe4\
-\xa1e\x87\x8b\xdc\x0e\xae\xff\xc50s\x00Q\x22\xcd'\
-\x86\x99\xd5n\xb9\xaf\x04\x9a5\xa8\x01\xc1>\x14\xdeK\
-}\x8e\x1bB/\xeeW|\xba~\xa2\xdca\x0a`\x07\
-\xfe\xee\x1bf\xdbr\xc5C\xfd\x057G\x18\x98\x80\xd2\
-g\x1e\x8e\xf0TYqD\x99\xbd`\x0c\xb3\xb2Q\xa7\
-:\x83}dwwZ\xdap2\xf9\xc4\xb9\xfcC\x9f\
-y\xfeG\xbf\xe7\x99\x1cW\xc7o\xfc\xd9\xc8\xdeH>\
-\x7f\x8b\x10H\xc4\xb0F{\x16i\x87i\x8b\x19H \
-b\xb7V)\xfc@\xbfo\xeeN\x164\x92\xc5\x80L\
-\x9c\xb8\x00h\xa6\x0fr\xe6\x0e^\xdd\xd9\xe4\xad\xe8\xdf\
-\x80\xa5\xcf\x18g7z\xff\xaerDFqcK/\
-UURF\xd8\xb8L\xc6S\xf8c\x97\x9e\xfa\xab\x7f\
-\xf1\xd9\x8f\xbd\x87\xff\xa7\xbf\xf3\xc6\x97\xae\xb6\x8f\x9fK\
-\xc9\xf5\xeb\x06\x11\x91e(\x00\x12\x11\x91G\x93F\x0f\
-\xf20\x9a5\xfc\x99/G5[\x8f\xca\x0cf\xff\x7f\
-\xf6\xfe\xec\xc9\x92\xec\xbc\xf2\xc5\xd6\xfa\xf6\xde\xee\xe7\x9c\
-\x88\xc8\xc8\xa1\xb2\xe6*\x14\x0a3\x08\xb0\x08b \x08\
-\x0e \x1a`7\x9b\xd3\xedk\xf7\xb6d2Y\xcbL\
-&\xe9\xf1>Ioz\xb8O2\xfd\x15zQK\x0f\
-\x92n\xb7\xd8\xbc\xec\xcb\x1e\xc4Kv\x93\xcd\x01$@\
-\x90 \x00b*\x14\x80\x9ar\x8e\xe9\x0c\xee{\xefo\
-\xe9\xc1\xcf\x89\x88\xcc\xca\xcc\xaa\xca*\x14+\xab\xfcg\
-aY\x11'\x8e\xbbo\x1f\x8eW\xec\xe5\xeb[\x1fE\
-\xe3 \x01[\x00l\xdd\x8b\x9bk;\xa0\x0f\xe9>k\
-\xcb\xde\xa0\xff\xdc\xe6S\xf0\x0f\xf4\xc1\xb8\xb7\x1a\xa9\xbb\
-\x0d\xf6X8\xa36\xb9F\x84\x11\xbe\xa9R\xba\xd7-\
-:\x10\xa1\x00\x01\xc8\xeb\x8d\xd0\xe1\x04\xc2\xc9\x90$\xf7\
-\xfc\x91\x87\xf4\xf8.^\x98c\xda\xbc\xa1j5\x1a\xe7\
-\x87\xfd\x87\x1f\xb2\xff\xc3o<\xfa\xb9O\x5c\x985/\
-\xce\xaf\xff\xc8t\x14\xc3\xa0\x9f\x18d.\x80\xa8\x91\x08\
-=\xe8\xe6\x8d\xb2\xdfr\x84\xecX\x03\xdb87\xd7\x89\
-R\x9b\xf7\x99\x0b\xf7\xd8\x06\xfe\xae\xfd\xc3\x06\x09\xeaD\
-\xb3\xb9\xd9}\xb6\xb6#\x15\xc0`\x02\x84jFyA\
-\xad\x0a\x8d\x8b\xfb\x8f\x9e=\xf8\xe7\xff\xe8\xc1\x0b\xbb\x0f\
-\xfd\xf7\xff\xf2\xf9\x1f\x5c\xeevw\x9a\xb1E\xfc\xc8\xc8\
-\xc8\xc8=0\x0a@#####o.\xc7\xd1\xb3\
-o\xd9\xe6F)g\xe4\x1d\xceP\x08f\x9bi\xbb(\
-\x98$9\x1dkA\x88\x12\x8c\xe6\x80\xcb\xab\xdca\xc6\
-H\x0a\x83ce\x08\x8c>\x09M\x1f\xbe\xf7W~|\
-\xee\xee\x1c\xbc{\x8f\xf0{V\x0epOuR\xd4m\
-\xc6\x7f\xcc\xa9b\xac\xcd\xb0\x0d\x04\x07\xeeu\xacN\x0e\
-G1\x0d\xce*\x10N\x88\x08\x18^\xf4\xb5\x9eBg\
-\xe8\x7f\xbc\xc7kGL\xf1\x8d\xa9?D-j\xe0\x9f\
-yf\xeb\x0b_\x88\x13|\xb7\xbb\xfcl\xc3>\x06\xa0\
-\x00\x04EYS-f\xb3\xd2\xd4\xc2\xc3\xd6\xc3\xac\xdf\
-f%\xac\x9e(,8>Z\x84\x9dT\x7f\xdd\x1c\xfb\
-]\xa1|\xef\x03}%:\xfe\x8f\x9f\xf2\x9f\xf9z[\
-\x00l\xdd:@\xcc\x83\x1aE\x11n\xc8\x08\x15\x8d\x8a\
-Ex7\x9f\xcf\xff\xfe\xcc\xc5K\xbf\xf5\xa5\xf7\xcc\xd2\
-\x99\xff\xcb\xbf\xdc\xfb\xd6\xcb\xa5\x9dE\x0b\xf7|\x1eG\
-FFF\xde\xa5\x8c\x02\xd0\xc8\xc8\xc8\xc8\xc8\xc8\xc8\xc8\
-\xdb\x9d[\xe6\xd6\x12(\xd2\xd6q\xc4\x04\xa9\x01\xb8\xbc\
-\xd6Z+\xe8\x83Jd\xe4\xba\x92l\xa8\x05\x1bV\x00\
-\xea\xa4v\xe8$g\xe8U\xc3U\xee(e\x10\xf7\x1c\
-\xcf{\xaf\xcd\xbcNYW^\xf9;p(\x8c\xdd\xd8\
-\xa4\x86\xd7H\x12\xa67\xa2\xc8\x0cf\x16{\xc5\x98y\
-\x93\x92E0\xf8\xd59\x0eV\xdc\xdd\xbd\xf7\x8d\x11\xe8\
-3\x96\xab\xee7\x7f\xee\xdc\xbf\xf8\xa7\x0f'\xdb\xaf\x07\
-/G\xaeBXkz\x10\xa1(\x06 \x00\x0e\xabd\
-\x91\xf3\xe4D\xe3T\x0b2mVz|\x9ao\x95\xd0\
-\xef9\xb0\xfaNEu<\xf5\x86\x13\xfd\xf1\xce\xcb\x0d\
-\x97%(\x0b\x84\x99\xd5\xceA\xa5P\x16\x87W\xa7\xe1\
-\xfc?\xfa\xf4\x93\xd6\xef\xfc_\xff\xdf?\xfe\xca\x0b\xfd\
-\xf6N\x1b\xc7Z\xb0\x91\x91\x91\x91\xd7\xc3(\x00\x8d\x8c\
-\x8c\x8c\x8c\x8c\x8c\x8c\xbc\xfd\xd1Z\xc1\xa1\x1cr\xea\xb4\
-gf\xe8\xad$\x92\x01\x08$\x83\x94\xaa\xb7\xd5\xd7\xe1\
-\xbe\x04\xc8\xc1\xb2\xb2\xae\xfb\xd9\x84=o*\x98\x8e7\
-qW\x01\x80w\xb6\x00\xddkx4\xde\x80\x00tG\
-\x03 I\x1b\xac$\xee'\xbb$\x80\x14%\x16\x1e\xb7\
-M{=\x18 8\xd7\xdf\x9a0\xacm\xd0a(D\
-\xc27F\x18\x07J\x13=\x86\x938\xea{\xa0\x08\x87\
-G\xf9\xe7?d\xff\xdd?;\xfb\xe1'\xba\xe5\xb5\xe7\
-b\xde\x8f\x0dP\x06\x03\x0d\xe13`J\x0fd\x0d\xec\
-\xa0\x12X\x03\x1d\xa1\xbf\xcd)\xb1\xe3\xe3\xb0y\x858\
-m\xbf\x12\xbd\xdes\x5c\xd1m\x17\xd4q\xd5\x19\xc4\x8d\
-V\xa3M09\x10\xc4P7\x0d\xc8\x06-R\x82\xd3\
-jb\x0c0\xf9\xd1\x02\xa1N\xb6\xd0\x17\x1c^zq\
-k\x86/|j\x96\x90\xfeO\xff\x8f\xe5w\xae\xf9\xb9\
-\x9d\xb0\xf1\x13\x8d\x15a####\xaf\xce(\x00\x8d\
-\x8c\x8c\x8c\xdc\xf7\x0c\x7fR\x1b\xef}\x8e122\xf2\
-\xf6\x87\x90\x9f\xc87\x12\x06\xc3\xcf\xfag\x1aC\x8c1\
-\x22\xc6\x18bk\xe6Bt\xd5\xe3\x04\xde\x8d\xfas2\
-\xf7>\x1d&\xbd\xfe\x91\xd2\xab\xc4@\xdfU\x00\xba\xe7\
-=\xbb\xf7\x0c\xa0;\x8cU\xd4\x90\x86O\x0f\xd4\xda\xd7\
-$\x90\x86\xa1\xd7\xd4=\x89U<\xa9o\xb5\xb5\xa5\x85\
-\xeb\xe1;\x18\x10n\xde\x91{\xdc\xcai\xe6\x8b\xf2\xc9\
-'\xed\xbf\xfb\xcd\xc7>\xf8\x9e\xdd\xa3\xc3\xbf\xf7\xeej\
-\x1bA;^\xb7\x01\x0d0\xa1H\xcf\xb4\xdeP\x1c\xbe\
-n\x06p\xa7\x83z\xeb\xeb'\xe1\xcd\x22t\xcf\x02\xd0\
-\xab\x9dC\x1d_Y\xa7{\x90U\x00&\xc8O\x16\x17\
-\x081\xd0\x03\x8d\xd1\x82P\x83\x03P\xdf\x1dv\xe5\x07\
-\xcd\xd9\x8b\xbf\xf8\xe9\x07\xff\x8f\xfd\xb9\xff\xf3\xff\xf3\xea\
-\x95\x83rv\xc7\xc6\xce\xf0####\xaf\x91Q\x00\
-\x1a\x19\x19\x19y\x870\x8a?##\xef\x1a\xb8\x8e\x99\
-\x81\x0b\xf0Se].\x00\x0e:\x11\xa8&\xa8\x82\x01\
-\x83\xfa#\x19\x87\xca\xafa\x86}\xa2\x07\x91\x9b\x15H\
-\x9bR\x9d\xdb#\xdc1z\xd7p\xafr\x87\xee\xd5\x01\
-t7\x01H\xf2\xe1Wq\x13\xf8CPP\x00\x5c\xe8\
-\xc9z/\x1b\xe5\xc6=%\xdb\x0c{\x1d\x9a$P0\
-\xc2\xd6k%A\x89~\xef%UD.j\xd0\x7f\xe9\
-\x13g\xbf\xf4s\xe7\x17\xfd\xb2\xbb\xb1\xd7j\xd36+\
-\x02 \xca \x05u\x80\xc8>\xa8\x0bU\xc3\x89-\x04\
-\xedU\xf6\xf0\x95\xbf5\x00~\xcf\xff39>\x17\x9b\
-\xccm\x9d.\x8b\x93\x8e/\xb3S\x99\xd0\x14@'\x00\
-\x0f\x00\xc4\x02\x02VeKUB\xb0)P&uO\
-\xa2\xa6\xb1\x85\xc5\xc5\xe1^\xbb\x8d/~\xee\xe9\x7f\xfb\
-\xf5\xfe\xdf\xfe\xc9\xf5\x9aS\x0c\xaf\xb6\xab####\
-#\x00F\x01hddd\xe4\x1d@0\xf4\xc2\xd7/\
-5{\x9d!\xe8\x8d\x94\x1b\x8c\x8c\x8c\xbc\xad\x10\x06\xa9\
-\xe68\xbbe\xc0\xa5@\x89\x01\x88\x80\xe0\x95\xd9\xab\xfa\
-\x5c\x22\xa2-w\xa6M\x08\x01m\x08\xf58;\x9a\x80\
-\x0f\x95`\x1b\xa1\xe7\xb4!\xe8T^\x0c\xef\x1a\xc9|\
-\xf7\xc0\x95{\x13\x80\xeeYq8\xce\x94\xd1\xf1\x8fX\
-\x8b4C\xc1\x1c\x01\x0b\xa8B\x87R\x02\xcd\x1c\x11\xf0\
-\x18\x17oH/P\x80\x12\xd0\x0d\x0e '\x9c\x08$\
-\x94\x80\x93\x04e\xdd[\x99\xd9\xf1\xce\x11\x87+}\xe1\
-}\xf1\xbf\xfa\xccVhr=\xb8J\xef\x9b@Va\
-\x10\xb2\xc8\xc1\xd0\x049T\xcd{X\x8f*T8\xd1\
-\x1b\x10pKR\x91\x9d\x0a\xe8?\xa9\x0f;\x1d\x11\xad\
-\x9b\xde\xf3\xfa\x18\x16\xdc\x04\x8eC\x110\xd8Z\xd9\x01\
-\x86J\xc3a\x1b\x058\x1d\x195\x5c\xe6q\x10\xd4\x9c\
-\xd5\xa2\x03\x0e\x1b\xaciF\x9dSn\xa1\x1a\x98,H\
-\xdc\x9b/\xe6v\xf1\xe2\xff\xee\x7f\xf9\xcc\xc5\xddg\x7f\
-\xe7?\xbd\xb0\xb7\xd2\x99\x99\xc1\xc78\xa0\x91\x91\x91\x91\
-Wa\x14\x80FFFF\xee{\x04\xb8\xb077\xcf\
-\x80\x9d\xf2\xd8\xbf\xb5\x7f\x0b\xdf\xf2,^\x9b\x87\xe5\xaf\
-\x1c\xc5[>\xb4\x91\x91\xdbs\xf7KQ'N\x86S\
-\xe1\xb9o\xc5\xb8N\x0f\xc1\x1cqh\xf9\x0e\xb8i\xb0\
-\x99ll<2TP\x88pB\x9e\xb0\xa2\x9e}Y\
-\x7f\xfawx\xb4\x85\xcd\xe5U\xe2qn\x8f\x1d\xd7Z\
-I\xf5\xb4\x03H<\xed\x06\x227Uc\xb7\x19\xd0\xc6\
-W\xf3J\xee=\x04\xda\xefZttg=\xdb@\xca\
-\x1d\xa8C\x1f.\x0dZW!\x8ad\x15\xd1\x0c\x01\xbe\
-;I\x0f\x9e\x8d\x93\xa6\xaa\x16\xa8\x0a\x05t\x90\x83-\
-\x0a\xa7b\x88o\xd1Cn\xbfMIV\x95Vd\x86\
-\xd3\x80\xa0!Y\xc8e\x9d\x90\x87*:\x80\xac\xa0\x5c\
-w\xab\xc5\xba\xf3N\x03]!\xe4\x9f\xfe`\xfa\xe8\x93\
-\x9a_\xbf\xa4\xc5\xde4\xb0\x89\x11^\x01\xa1hm\x02\
-\x1bvg\x10\xf8\xd6\x9b\x06\xc1\x00H\xaf(\xe7\xba\xed\
-\x09\xba\xf5\xc57\xa2\xc7\x9dZ\x077\x89\xe3\xdcHJ\
-'QS\xbc9\x88\xe8\xf8\x15Q2aS\xd8\x08\x02\
-,\x02r\x98\xb6\x92W_x\xf5&\x05W9\xd8\xbf\
-\xfc\xa1G\x9f\xfe\x17\xff\xe4\xec\xf7\xbe\xff\xe2\x1f\xfe]\
-\xd7\xb7\xd3d\x1c\x13\xa1GFFF\xee\xce(\x00\x8d\
-\x8c\x8c\x8c\xbc# v\x83f\xc3\xbc \xac\x1f\xf3\x87\
-;\x97G\xbc\xf9h\xfd\xf7{=\x15\xc89\xfcu\xff\
-\xca\xa9\xa4\xdf\xb4\x1c\x1c\xb7>\xa6\x1e\x19\xf9I3\x5c\
-\x96\xb7|D\xea\xcd\xef9\xbe\x86y*<\xf7-\x9e\
-_:,c\x0a\x80(\x11\x15\x82JK8 1\xc8\
-\xa1\x95\x02\xd0\x86\xc2@\xdf\x09\x87\xee\xbf\xf7\xd5\xf8\xa7\
-?\x88[\x93\x12\xeb\xaaJBX\x07F\x13R\xd88\
-?\x82\xe3\xd8\x91\x01\xf1\xb8\x9f\xba\x82\xec\xae10w\
-\xae\xb5\xb9\xeb\xdc\xfbN=\xa2\x86\xdf\xdd\x8d\xdb\x95P\
-\x0d\x82A[\x11\xab-#\x8eZIlJ\x93*#\
-\xe6f\xa5W\xc8q\x1a\xcdf\xdd\xd1\xe7\xde\xb7\xfd/\
-\xfe\xf1\xf6{/\x5c\xc3\xe2@\xb9\x97\x06\xdb\x8e9\xd6\
-\xd9@C`N8\xb5\xe6;\xe2\x012\x8f\xab\xda.\
-\xad2\xf6\x0d\x81\xc6\x0aT\x9d]m\xafI\x1e{\xc9\
-@\x05\x14\x84Wj\x1d\xaf\x0d\x01\xb9\xf7\x8f_\xcc\xbf\
-\xfc\x81\x15x\xd4\x1c\xe4\x88\x1a\xcdC\x8d\xb0\x00V\xa8\
-\x02\x0ef o\xd6~\xd2\xdb\x8c@\x14\xe1w\xac\xd7\
-\x03\x8e\xd3\xa4^Q\xb9u\xcfXX\xafm]\x0d\xe8\
-\xaf\x88g\xd6\xcd\xff=~=\x00\x88\xc3\xe7O\x90\x87\
-\xc1\xacv\x92G\x15\x96\xe4\x92\x00\xdd\x05\x988\x05\x97\
-7.\xc9\xff\xe0\xe3\x8f\x9d\xfb\xef\x7f\x0bO\xde8\xf8\
-\xbd\x97\xb1\xda\x9e\xb5\xa6\xb7\xfa#:222r_\
-1\x0a@###\xefV\xee9u\xf4\xed\x8aq3\
-G\xe5F\x8e\xe1k\xeb\xcb\xf3f\x1c\x87\xb5\x81\x807\
-\x1dX\xe9\xf6\x8e\x80al\xc3\xb4N\xc7\xef|\x13F\
-\xf1v\xe7\xde\xc2@\xc6|\xd3\x9f\x08\x9b\xa3z\xfaj\
-\xbc\xcd\xbbt\xd3\x87\x88x\xcb\xef\x1b\x1c>\xcdC\x8e\
-\x8d\x0f\xd12\xeb\x81\x18\x82B\xa5C\x0e:e\xa2\x96\
-5\xef_\xf1\x97\xaf[\x8c\x1d\xea\xbe$\xd1\xd65V\
-\xd4\xb1\x00\x043\xf1\x16\x01h\xbd\x9f\xac7k\xb47\
-\x0f\x864\xbb\x83%\xc7]w\xec!O\x90wZ\x0e\
-w\xbfI\xdd\xd6r4\xdcl&\x05\xa9r\x9et4\
-\x01\xc4\x98\x9b\xa60\xa23\xcb=P\x9a\x12C\xd8Y\
-\xe5Gfe\xd1\x01\xacP&*#\x9d\xb6\xee\x0f\x7f\
-\x5c;6\xc4 \xf9p4\xeer\x9e9\xf4\x9ew\xab\
-t\x02i\xe8\xfe\x05\x11\x94\xac\x0ek8e\xa8\x92^\
-5\x89\xe7\x15\xb8\xb0*x\xea\x5c\xfe\xdf\xfe\x02\x7f\xee\
-)\xc7ba.\x0b\x0a\x830'\xe2\xc4\xd5\xa5;\xdd\
-\xe5\xf9j\xb7\x9b\xdb,\xf7\x1a\x1cP\xaf\x0eo\xfa\xcf\
-\xa9\xf5\xbe\xf2=\xb7\x0cf\xbdy\x9e\xfe\xb8\xad\x95\xc3\
-\x0a9\x86\x8bhp>\xc1\xb6'5s\xbf.\xfcg\
-\xde\xff\xf0\xff\xe2\x97w_\xfe\xdd\xab\x7f\xbeT\xd9\xda\
-\x8e\xb7\x0a\xb9#####'\x8c\x02\xd0\xc8\xc8\xc8\
-\xc8;\x84\xb7\xde\x9b022\xf2\x96p\x8bCc\xfd\
-\xa365\x5c\x02$\xc2\x08Y\x10'\xb1\xa4f\xd9X\
-^\xf7\x7f\xd7\xf1\x22\xc759\x00]k\x01@\x00\xfc\
-d\xce-\x86\x93\x92\x9dWB\xd6;\xd6d\xddY\xff\
-\xc10\xad\xbf7e\xe1v+];\x80\x8c\xb1\x22$\
-Y\x04\x80D%Sd\x85y\x16\xfa\xd0\xc3\xd9\xc2\x13\
-\x9d\x10\xdcJ6x\x88)\x92\x92\xbf\x11\x99\x80\x1b\xff\
-\xcc\x89V!\x0e\xc9\xd0z\x85\x93\xecu#\xa1\xeb\xcb\
-\x13\x0f\xce~\xfe\xa7\xa7q\xeb2\x16B\x0c\x80;d\
-\x14\x86\x12\xa9\xe3\x08\xea\xdb\x89?\xef\xb4\xe7\x1b\xd88\
-\xb46\xd7>\x84v2\x81\xa5\xf9\xbeM&\xddG\x7f\
-\xfe\xcc\xe7~p\xf5o\xff\xba\xbfQ\x10\xefX\xbf8\
-22222\x0a@########\xf7\
-'\x12\xdc5H/fL)\x99\xd1%\x9a\x19\x10X\
-A\xdb\xb8\x9b\x86P\x16\x1e;F\xb4\xf6\x05\x09@=\
-Ii\x11\x09\xbb\xd3\x9f\x87\xbak%\xd7:K\xe8^\
-\x16\xbc\x1b\xb7\xd3\x9b\x06\x01(\x9a\xc5\xca\x98\x14\x1b\x07\
-\x98l\x92\x0c\xc6\x0c+\x14e\xd3\xd2U\xa8\x0f\x16B\
-\x98\x80\xb1V\xa7\x04\x81o\xf7\x9c|\xe5>om_\
-\xbc\xf0\xf0E\x84\xebP\x19\xe4\x0f\x92\x1a\x8e\xf1\xdb|\
-\xf8?q\x08\xca3\x1cfbdw\xee\xe2\xce'\x7f\
-\xfe\x83g\xbe\x7fpi?\xcff\xf7\xdc\xc7~dd\
-d\xe4\x9d\xcf(\x00\x8d\x8c\x8c\x8c\x8c\x8c\x8c\x8c\xbc&\
-\xden&;\xd2\xcc\xe4.\xa9\xd6j\x03p\xb9\xe4\x22\
-\x90n\x8e\x85?\x11\x80\x06\xf3\x88(\x0d5\xa3r\x9c\
-\xbc\x8az\xd70\x9f;F\x00\xe1n1@\xf7.\x00\
-\xdda[\x04\xaa\x93\xce\xea\xaa\xee\x00\xdd\xa3\xbb\x91\x09\
-\xe8d-9\x11\xba\xaa\x9e0\xb3\x00\xd8\xd0\x15L0\
-\xde\xb1\xc8\xedmAu4\x89\x8f_\x9c\x5c\xd8MX\
-\x14\xc8I\xd7\x90\x8b\x03\x1c\x17\xce\xdenQ\xbe\x13\xed\
-?\xb7\xc73\x82BJ@9D\xb2g>\xfe\xe1\x8f\
-\xbc\xd7\xbf\xff\xd5\xbd\xeam\x18%\xa0\x91\x91\x91\x91;\
-0\x0a@#######\xef:n+\x00\xdc\
-f\xdaH\xd0\xdf\xbe\xf5\x95!\x98\x19K\xc9\x92J)\
-Cv\x8d\xfb \xebP\xd6\x1cwS\x02\x08\xa7l-\
-\x00\x11$(\xc8\xe9\x00\xb8\x11\x800\x04\xe3\xdc\xa9\x86\
-\x89\xe4\xddb\x85\xa1z\x07a\xe5\xd5\x16\xbc\x1bw\xce\
-\x00\xaa\x85\xac\xacT\xb5\x0a\xb0\x94\xc8B2\xd0b\x0d\
-\xb1\xb8\x95b}E\xef\xaa\x00d@\x04\x05\x06\xb0\xdc\
-\xe3`^\x07\x04`C/x\xbd\x1e\xf9KX\xac\xea\
-\xe7>z\xfe7>\xf3\x90\xd7#\xeb;\x10F\xf7!\
-jh\x1dO\xe4\xeb\xbep7\xadw\xa3\xfe\xacs\xe0\
-\xde\x9e\xd7\xec\x9b\x82\x00\x05\xb6\xd1'\xde\xcf\xdd\x16\xa8\
-\xab\x9d\x9d\x87\xff7_<\xff\xfd\x97\xfb\xbf\x7f\xb9?\
-\xb3\x15\xc6n`####\xb7e\x14\x80FFF\
-FFF\xde2\xeemR\xf2\xaex\x9e?r\x0fH\
-\x92H\xda\xe6G\x900\x03h\x86`<\x9d\x86B\x90\
-:\x0e\xd8\x1d\x02\x84\x88uv\xfcqp\xfb\xf0\xbep\
-\xa7\x04\xe4W\x19\x0f\xefd\xbdx\x03\x97\xf0m\x95\xa3\
-A\x002\x87\xc1,\xc8\x02\x01\x9a\xa2\x89d\xa4\xa5`\
-F\x12F\x12\x95r\x17XA\xf7\x0a\xd5\xf2v\xfeH\
-\x09\xca%\x7f\xe0\xf1\x9d\x8f<\xb5\xb3Z^\x9a\xd5b\
-\xc1\xd6I\xe0\xc3\xefq[\xa7\x157\xdd\xea\xb8V\x88\
-\xfe\x01D\xcb{\x0cy\xba\xb7M1\xd0\x8b\x97.\x87\
-\x08\xd0W\xf3\xcb?\xf5\x9e\x0f~\xf0\xf1\x9do\xbet\
-\xcd\x87>l\xf74\x9a\x91\x91\x91\x91w6\xa3\x004\
-22222\xf2\xd6 \xde\xfbS\xe9\xb7\xf1\x84\xf5\
-\xfe\xe4\x96\x16Iw\x99,\xde[\xef\xb6\x9f<\x04T\
-k\x05H\xc2\x8c:\x15mcfr\xab\xb7\x0c\xfd\xd4\
-\x8f~\x9c\xd7\xfc\x8a\xc6O\xa7[L\xbd\x12\x9dDJ\
-\xdffHw\x89\xd6\xb9[@\xf4]\xb9\xed*\x07\x01\
-\xc8\x19\x9c\xc1Y\x9c\x04\xe8\xa4\xd3\x9c\x06B\x16\x82\xa5\
-\x18\xdd\xa2\x11r\x08F\x1a\xa4\xe2\x82i\xdd\x92\xec\xed\
-\xe6\x13!\xd0W{\xea\xfc\xea\x83\x0f\xcdMs\xd6}\
-\xa1\xc0\x08\xd7\xba\xab\xe2\xf0u\xeb\xb8\x89\xa1A\xd8I\
-\x09\xd8\xbd_\xb5\xf7zH\xf8\xaa}\xc7\xee\xbc\xe8=\
-l\x93\xa8\x1d\xabb\x90\x19UU\xcb\xa5\xe9\xe4\xdcG\
-\x9e\x9c\xfd\xe1\xd7\xe3\xaa\xaf\xd3\x96oS\xdb\xde\xc8\xc8\
-\xc8\xc8?(c\x8d\xec\xc8\xc8\xc8\xc8\xc8\xc8\xc8\xc8}\
-I\xadUr\x92C\x93u?\x85\x86J\xb0!\xe6g\
-\xdd\xf1\x5c\xc7`\xa8\xca\x02\x8d\xc3W\x18\xbe\xc8p\xba\
-\x89\xf9+\xbf\xd6-\xe9o\xffu\xc7\xa5\x86\xed\xdd\xdb\
-\xd7]\xd6\xa9;\x0e\x95\xb5zv\x1f,Q.U\xaf\
-\xa0\x85\x18-\x12v\xaa{\xd7\xdb\x0d\xa2/\xfe\xd8\x03\
-\xe9\xa9\x87\x82\xf92Za\xc0\xa6\xd5\x976M\xdf\xef\
-\xb0\xe4\xad_\xef\x5c\x06\xf5\xae\xef\xa9b[\x09)\x94\
-\x0eM\xacg\xb6\xbb\xdf\xfe\xec\xb9\x8f?y\xa6\xeb\xfc\
-\xed&\xed\x8d\x8c\x8c\x8c\xbcM\x18\x1d@####\
-\xef\x18\xa8\xc1\x03@\xca\x05{g\xcf\x00~\xb2\x1c\xcf\
-\x90oy\xe5\x95\x9c~\xcf-\xfe\x87\xd7ey\x18\x96\
-\xbde\x91\xcd\x8bw;\x93\xc7\x1b\xbdw\x87\xc5\xcdk\
-x\xe5\xbe\xbf\x96-\x92<V\x16\xde\xc8\x18\xfe\xa1\xb8\
-e_^\xcb\xdbN\xbf\xf3\xb6\xa7\xef\xde\xb6\xfeZ\x86\
-1,\x04 \x84\x80\x93\x13w\xf2;w'\x00\x1aN\
-\xfa\x84\xeb\xb8O\xfb \x18\xddl$Y?\x11$\x80\
-\xa1Q\xd6\x1dx\xf51\xdd\xd3\x82\xafw\x9d\xc3\xdaD\
-\x88&\xba\xe8\x00E\x17%\xba\xd1\xa1\x22\xf5U\xd5\xab\
-@7\x16\xa8w\xf5\x80\x9b\x01\xa4W\x9c:\x1a\x5c\xbb\
-\x9e\xfe\xe1o\x9at\xaf\xdb\xdb\xdb\x17v\x9b\x06{\x09\
-\x0b\xd4:\xc4?s\xd0\xbbn\x7f\x88mS\x1f\xb6Q\
-\x7fx\x5c\x08\xf6\xdav\xe9\xf4\xc5\xf6\x13\xd2Nn\xb9\
-\x9e\x8f\xef6\xf7`\x1c\x1a\x94\xc8(\xd4\x1eN\xa1\x1a\
-P\xb2\x95\xfe\xda\x07\x9f\x9c\xfd\xef\xbf\x98\x9f\xbf\xec?\
->\xf0\xed\xe9\xf8\x9c{ddd\xe4VF\x01hd\
-dd\xe4\x1d\x84\x00\x80\x84\xbfm\x9fo\xdf\x87\x0c\xd2\
-\xc6\xf0\xef\xf0\xca\xf0\x8d\x99\xe1m\xa0\x5c\xfc\x83\xf0J\
-\xc1b8D\xa7\x8f\xd2\xeb\xe2\xee\x87\xf1\x9e\x85\x95\xbb\
-\xaf\xf3\xf6\xe2\x1d\x09\xc9\xfd\xf6a\xc6o\x96\xe2s\xa7\
-\xd5\xbe\xf2\xc5\xd7&\xff\xe96\xb2\xdd\xb08\x8eU\x1e\
-\x174\xa8\xc4\x83/\x86\xa7\x8b\xb9N\xef\x07\xef\x96y\
-}\xcf;\xfc\x13\x12\x15N{\x8c\x8e\xa5.A\xb4\xa1\
-g\xba\x0b\x22a\x01@\xae\x9e\x87\x9b#\x8f\x15\x93\xb7\
-\x1fr\xcd&\xf1\xec\x94Q\x0b\xd6\xa5\xbc\xac\xadN\x9b\
-\xa0\xa7\xdb-tl\xf9\xb9W\x07\xd0pM\xfcDy\
-s7A\xa0\x01\xba\x8c%\x18`\x11eUk\xbc\xce\
-\x06\x9f\xf8\xe0#\xbf\xf6\xa1\xf6\xff\xf5\xd7eY\xd1\x86\
-W_\xd3\xc8\xc8\xc8\xc8\xbb\x8aQ\x00\x1a\x19\x19\x19\x19\
-\x19y\x15n\x99\x9f\xdf\xab\xe8\xa3\xbb\x84R\x9c\x0a\xe1\
-}\xe5\x8bw+\xfcx\x139\x96\xba\xee\xfe\xb6;\xa9\
-\x1e\xc7\x1a\xd0O`h?\x11\x8e\xa5\x15j\xdd\xa4\x9c\
-\x04I\xbfYt\xb9\xe9\x07\xde\xbe\x9d\xf9\xab\xda\xa6\xee\
-\xceO\xec\xa0I\xc0&\xf7Y\x90\x83Z[IP\xb8\
-\xf6\x89\xac\xdf\xb9\xfeg\x10R\xee\x93\xfc\x5c\xb1:)\
-\x0at\x80\x9b\x1e\xf7''v\xd8\x1f\xe3P\x08\xb7\x96\
-\xb6\xf8\xd6|\x9c\x86\x11\xbe~\xe5\xcb\xc5\x94\xc2\xb4\x95\
-q%\xefO>\x917\xb5\x12\xbb\xc3Z\xe9@8%\
-\x8a\xbd\x9e\x1d=\x16\xb8\xef5\xca\xf9.\xcb\xado,\
-\xda<\xa3xS\x18N\xa4\x88\x9c\x18\x98\xac\xaf\xae\xda\
-\xad\xb6\xb7\xea/|$\xfd\xe1w\xfao\x1fX\x13\xee\
-\x9f\xfb\xd1\xc8\xc8\xc8\xc8[\xc2(\x00\x8d\x8c\x8c\x8c\x8c\
-\x8c\xbc>N\xbb?\xeeT\x13\xf4\xee\xe4\xb5\xe8Go\
-\x13\x18\x88\x9b\xeai\xd6^\x99\xc10s,\x8dhS\
-Us\xa2)\xdc\x1f\xda\x08\x00T8\x81M\xcb{\xdf\
-t\x86:\xde\x99\xdbZE\x08\xd4\xb7oD\xce\xcd\x08\
-p\x98\xd6\xbbF\xa0l\xc6_\x01\x13*Nv\xaf\x1e\
-\xd7G\xd9\xdbx\xf7\x06q\xaeI6k{\xf0\xb0z\
-O\x81\x0c\x9b\x93\xf8\x1aV\x80\xfa\xb6\x8f\xf8|3\x0e\
-\xff\xb0\x8e\x08T\xa2NQB\x8a\xae\x9a}\xb9<\xbb\
-s\xed\xa7>\xf4\xd0\xf9\xdd\xc6\xaf\x17`\xb4\x00\x8d\x8c\
-\x8c\x8c\xdc\xc4(\x00\x8d\x8c\x8c\x8c\x8c\x8c\xdc\x91\xdbV\
-\x09\xddR\x0bv\xfa{\x1b\x9aO\xdf\x91W\x9d\xf9\xdc\
-\xe9\x0do\xb2\xaar<\xf27\xa8\xd7\xdcs\xcd\xd7\x9d\
-\xc6\xf3\x16B\x10\x92\xd6.\x11_\xcb?\x0e\x9d>\x89\
-\xbc%\x1d\x05\x92\x9f\x98}~B\x15a\xb7[\xcf\xeb\
-\x8fI\x91\x86j\xae\x93\xe2\xb6a%\xd4\x10\xf3\xb3\xa9\
-\x02[[g6\xd5T\xf2{\xd9\xda?\x1c\xeb\xbd \
-`\x107)h\x83\x13\xcd\x88jk\x13\x8e\xbdm\xdb\
-\xb9\x9d&W\xbb8\x9b?\xbe\x1b\x11\x1a\xa8\x03\x9c7\
-\xf5w?\x96\x81n\xb9B\x8e\xfd>~\xaa,\xeeu\
-p\xd3\xad\xec\x9e\xee\x09<\xfe\xe7n\x9b y<\xb4\
-c\x89\x95\xf7.\x09E\x88\x86\x1cP\x8d\x81\x06\xe4,\
-\xd4\xe5\x03\xe7\xc3\x97>\xbc\xf3\x83\xcb\x07\xd7\xb2\xb6\x1b\
-\xfa\xdbV\xf0\x1b\x19\x19\x19y\xcb\x19\x05\xa0\x91\x91\x91\
-\x91\x91\x91;r\xda\xd2r\x17\xd1\xe4\xf8m\xf7\x8b\xff\
-\xe5\x98;E\xe1\xdcE\xcb8\x1d\x9d\x8bS\xda\xc7\x1b\
-\x91?\xee\xbe\xecO\xe2\xa8\xd6S[4\x00\x06\x13\x09\
-\x86\xb5p\x22\xdf\xccJu\xaa:\x8a@\xb0\x13{\xc5\
-+\x15\xc072\xd4\xdb\x0a\x8b$\xee\xd1\xd0\xb1\xa9k\
-\x1bJs\x88\xb01/U\xe0X7\x19\x04\xa2h\x12\
-|\xfdN\xfb\x87\xd1\xe3\xee\x05\x0aA \x0dp\xc8\xe8\
-\x81\x22\x11\x0d\xd1\x15\x0d\xc9\xe5&F\x0f\xa1F(\x06\
-\x19\xe4\x1b\xdf\xd3\xdbq\x1f\x8b\xf3\xe24\xefN\xb2\xd8\
-\x83+\xa3o\xe2\x9c\xb1\x91\x81\xea+\x16\x22 \xb0n\
-\x1cN7\xbf\xfe\x1a\xb8\xe92~\xbd\x85c7m\xee\
-\xee\x02\xd0\xfam7\xdfp\xc2\xc6\x98\xf6\xbaQ\x05#\
-\x10C\xf1\x06\x95\xc1\xcd\x0c\x06`\xb5\x9c\xf0\xd2g\xde\
-\x7f\xeew\xff\x06/]\x92\x9a\xfb\xec\x9e<222\
-\xf2\x13e\x14\x80FFFFFFn\xe5v\x12\xcf\
-\xba\xaf\xb0\x91CR\x0c\x84\x8d{\xe4m9\x95|5\
-\xde\xb8`\x01\xdc\xc6\xf9r\xbfh\x07\xda\xc4\x91\x18@\
-\xd2\xcc\x02h\x22\x88\xea\x0e9\x8eO\xab\x01ks\x0c\
-\x00\x0e\x02\xd0\x90\xa5\x5cO\xfa\xaa\xbf\x16\xff\xd7k\x1e\
-\xd5M\xdf\xaf\xc3\x89\xde\x5cl\x13\xc6\x22A.a\xf0\
-\xcc\x0ciH\xf7\x10\x5c\xf3\xf6\x81\xaf\xf8\xc2)\x07\xcd\
-\xdb\x1d\x12Ut\x10*P&%\xda\xebN\xf3y\xcd\
-\x9c\xd6\x1c\x7f\xa2\xe2\xf5\x10=n\xc67m[\x82W\
-\x10@\x84`.\x06\xd0\xccRt\xcf5\xa4\xa3\xb3\xe7\
-\xcf\xcd&\x06\xafo[\xb1oddd\xe4\x1f\x84Q\
-\x00\x1a\x19\x19\x19\x19\x19\xb9\x1b\x92\x03\xac\xeekk\x08\
-i\x0c'5\x16\x1crH\xef7\xe7\xcf\xbd\xf2\x1ad\
-\xa3\xdb\xfd\xea\xb8\xda\xe3\x15\xef\xd0+_z\xf5\xd5\xbd\
-I\x1c\xa7\xeb\x02r8\x5c\x22\x0c\xeb\xbc`\xad\x9bM\
-\x1f\xfb\x80\x9c0\xac\x85?\x1d'\xdab\xa3\x06\xbe\xe1\
-\xc1l\xc6\x02\x88\xe2\xd0\xb0k\x98-\xdf\xe3\x1a!\xdb\
-\xac\xf7X\xd6\x11d \xccH\xd1\xe5\xf0\xa1\x85\x18\x09\
-#\x82YpYa\xbeO\xae\xe7\xcd)P\x00\x02h\
-\x80A\x06\x1a\xb4\xf9\x1e\x04\x02\x90\xa0\x08\x91\x0e8\xdf\
-\xb6\xc90\xd1te>\xb9\xb2\x98\xa4\xe0p\xdf\x5cV\
-v\xaa\xa1\xbb\xdd.\x0f\xe8\x95W\xdf\xeb\xb6\xd5\xf8\xfa\
-\xa3\xfd\xfa\x07\xfd\x9a\x10\xe0o\xb2\x0cGT\x01\x8e\x0a\
-)\x98c\x1a\xdd\x82V^+\x22.\x9c\xef\xcf\x9f\xcd\
-\xe1\xcd)Q\x1d\x19\x19\x19y\xe70\x0a@###\
-##\xef\x18\x8e\xa7\x16\xb7X\x18\xecf\x05B\xbci\
-\x065\x04\xa1\x10\xc7\x1d\x90h'o\x05\x5c*\xaeR\
--\x17\xf7A\x1b\x18&3\x1c\xca\xa0`\x06\x0b\x0c\x86\
-@\xc48\xf8CN\xf7\xd8v\xa0\x82\xce\xb5\x96\xa0\xcd\
-\x5c\xee\xb4=\x01\x9b2\x9f\x028h\x92i\x10\x16\x08\
-U\x13\x0d\x84\x1f\xf7\xd9\x11\x08\x0f,\xd00\xb9=\xf5\
-\xf2z\x06\xb7\xaeXZ\xcb\x09\xb7\x1e(\x1fv`(\
-\x122r\xdd\x03\x0b\x9bb.\x88\xa0\xad\x07\x7f\xd3\x11\
-&\xe1^\x00\xa3\x05g\x10\x86\x9caI\x0e\xc2\xec\x0e\
-\x13\xbc\xcd\xe1?9\x0d7\xf7\x0c\x92Q\xc3!\xd0\xad\
-\x0b:\xe4\xbe>p6\x88\x19\x0e\xd27\xa2\x0bOM\
-\x89u\xb2\xd8\x89\xa0\xa2\xcdq_\xcf\xa5\x05\x0aB\x08\
-C\x9f\xf0R\xa5*wWQ\xad\xf2\xaaA,\xa9\x9b\
-\xd5{Xk)24\xe4\xd4B\x0c\xc3\xe1\x12I#\
-\x08Z0j\xb8Z|\xdd~\x1d\xd2p\xc6h\x1b\x9b\
-\x18\xd7;4\xcc\x84\xcd\x04J\x14`!\x0c\xdd\xc7\xd6\
-V\x22\x07)\x11p\xb7c\x05\xe7\xf8X\xadO\xee\x90\
-\xd53\xac\x9c\xdcD\x1a\xad\x0f\x10\xaa\x10]\x0d`T\
-\x00\x04\xab4\xb9\x04\xb3`\x04M\x92\xe7*\x89n\x90\
-9B03\x0e{\xfb\xca:\xa3\xb7'\x22DA\x0a\
-@\xa4\xa29\x00\x93\x05\x22\x10F\x19Dz\xa0'(\
-\xc2\x03U\xa1!\x0f\xe8\xed\xb8\x8f1\xe8\xc6*\x1d\x95\
-I\x13\xe7\xe8\x8a\x5c\x14\xd7\xb9\xd5<\x0e \x1f2\xca\
-\x8f\xaf\xf6W\x08\xabw\x97<\x8e5\x1ei\xc8\xf0\x1a\
-\x94\xc6\xcd\xcd\xe2\x0d\x0a4\xa7\xccJ\xa7\xbf\x1dn+\
-\x02\xe0\x5c'N\x0d\xb1M\xf7^pf\x09N\xe4*\
-'cjPU\xbbJ\x88\x06X9\xb7[\x7f\xf9\xa7\
-\xed\xaf~\xa0\xebsl\xb7\x18c\x80FFFF\x06\
-F\x01hdddd\xe4>F\xc7\xb1\x17V6*\
-\x00\x01\xd2\x13a\x94\x13\x00\xab\xac\xc3F\xf2p4P\
-cF\x07j\xadF\x05#J%\xbdm\xcc\xa8\xdc\xad\
-\xdcE\xa1dW)T\xdd\x0a\x9a4h[\x0f\xa6\x90\
-\x10[\x03$7\xc1jQ\xce\xca\xbd\xaf\x8e|\xd9\xa3\
-\xc6\xa0\x14C\x93\x98\x02\x22h\x22[/gr6i\
-a\xb1\x8f!\xca\x93\xaa\x84bVa\x95\xa8 *\x00\
-W\xc4\x94j\xfb\xd5\xc2\xeb\x9c**\x0aD s%\
-d1\x98\x09\x82B\x0b\x0b\xb3j\xbbH\xac\xb6\x92\xaa\
-It\x18\x8b\xa1\x0a\x10\x83\x00\x13\x0c\x14X\x017\x88\
-\x90\x0cn\x89-=\x97\xd5\xa1\x95.T\x03\xed$\x1f\
-8\x08\x90;\x18#\xdb\xc4\x94bL\xb5\xaaz\x09\x94\
-\xdc\xddIki\x86\xd2\x85:7\x97\xf7\x06\xc9Q\x8a\
-\xfb&|\xf7f#\xc1\x89\x125\x04\xebh\xd0NN\
-\xa95\x8c\xa0\x09\x0e\xba\xad5\x12@\x83:\x12\xa0$\
-\x00\x14\xbcVTyh\xcd\xd2\xc4\xc2\x96\xa5Pm\xe9\
-\xea\xa0\xb4~\x17@HV\x81\xea\x90@\xb3H\x8f*\
-\x08k\xb1\xa6\x84\xe0)Xq\xcf\xcb\xbe\xebr\xc95\
-\xc8[\xab)\xa0i\xd1L=$p#d\xd19\x14\
-I\xd5Ny\xc5E\x8f%\xb8\x82\x85\x10\xdai\xd3L\
-\xa7\x08M\xf6\xda\xa9`\x90\x00er\xd4^\xb4\xd8\xa6\
-DW\xe93\xa1\x18e^\x08\x16N\x14\x92y-\x8b\
-\xa5\xf2\xd2<\xab\xaa\x9a\x85\x80 \xa0\x92\x91r\x96\x22\
-\x0fd\x0a\xdeFk%1\xc8\xe9\x1b\xab\x8b\x02h.\
-/\xde[\x03F\xefr\x06\x94\x1a35\xa5k\x88\x90\
-,I\xa5\xef\x0f\xaaw\xa8\x90#\x10\x8d\xc9T\xbd\xc0\
-\xcc\x9c.ge\xec\x1dbn\xdaf2\xdd\x95\x07G\
-\xa1\x9d\xe8\x97oc(7\x17\xa9\x1a\xbd\x17\xaa\x9b\xe5\
-`&\x05\xd9 \xcc\x02VM9vnshEH\
-\x1c.\xf87l\xd9:\xae\xcf\xdb\xa4CQ\xc3'\xee\
-dt\xe0\xfaZ\x7f\x1dk\x95\x8c\x9e\x081\x88&V\
-[w\xb8wm\x0a.\x8f7\xf0\x8a\xa5_\xa9\xb3\xae\
-_\x147\xad\xdf\xa4\xb5\xb7\x8d\x00!\x97\x5c\xa01X\
-\xad\xa8U\x06\x05\xde\xf1\xd0\xdc\xb4\xed\x9b\x07\xc2\xe2P\
-@\xb0\xaa\x22yH\x11\xa4{\x85\x14\x88u-\x96\x00\
-%\xb2\x01X\xe1\x1e:\xc4\x1a$\xf3{\x91\x81\xd6\xe2\
-{\x95\xc1\x1b\x14h\xe5\xbe\x02D\x04yl&\xfc\x99\
-\x0f\xf5\xe7\xcf\xe0\x85\xeba\xa7}\xdd+\x1f\x19\x19\x19\
-y\xa72\x0a@#####\xf7/\xc3\x14\xa4\x01\
- v\xe2r3\xad\x99\x98f\xe61\xa8\x069\xe2!\
-p\xe8T\xcfP\x11\x8b\xa6\x15;\x14EC4\xaa\x98\
-w\x86~b%X\xcd\xfdrq\xb4P\xad\xd3\x88\xdd\
-\x06\x17\xce\xa4\x87w'\x0f\x9f\x89\x8f\x9c\xb7G\xb6\xb1\
-\x9d\x14fH\xdb\x00\xe5\xa5\x96\xac\xd5\x8a\x8b\xc3\xe6\xfa\
-\x95\xe6\xd2\xe5\xf4\xc25\xbc<_]\xef\xe6\x07\xab\xc5\
-\xa2\x11\xb6\xd1\xcc\x94x\xde\xf3\x93\xa5?\xeb\xfcaJ\
-/)L\xbc\x9eU\x91\xd9\xd2l^\xb1\xef\xb6\xb4 \
-\x08.Q\xe7R~$\x96+\xdb[\xabs\xb3\x19\xe7\
-\x13\xablZ\xefKa\xf5\x9dI\x85\xbc@l\xeb\xb5\
-\xc5\xd6\xcb\xf3\xf7\xac\xcc\xfb\xf0\x82\xf3\xa8\xadl\xa0\xc6\
-\xbb\x80e5e$Gj\xa4V\xe6\x8csZ!d\
-\xa1\xc8T\x9bTv\xcf\xb6\xfd\x993\x8bs\x8ci\x1e\
-kOF\x02,\x82\xb7\xac\x91\x15\xabl\xf3+=n\
-\x94\xb3D[\x91\xb3\x14\xcc\x0d]\xa9\x91<\x1f\xd1\xa4\
-\xfa\xc2\x85f\xf9\xd8\xd4\xda\xbe:\xadX\xe8sPi\
-\x8d\xf1\xd8\x01\xb59K\x83s\x81N8\xac\x0c\xdf\x04\
-8\xe0a0\x1eh'\xd7\xa6\xaa\x0f\xec\xa2\x8a\xa1\x90\
-\x04\xadZ\xac\x9cUOE \x9a\x16\xa5p\xe1*S\
-\xdb[4\xd7\x17[\xb0\x80fO:b9\x07\xed\x10\
-\xe6\xa0Pe\xfb\xc5\xbab\x10I\xb7\x92gI\xed\xd9\
-f\x9a\x84\xbc\xba\x14\xcaA\xcbT\x8e\x9c}\xde\x01\xb6\
-Z\x9e\xdf\x8e\x8f<\xd0<x1\x9c{\xc0\xb7\xb61\
-\xd9\x8a\xcd4\xc4\xc8\xe0!t\x16:Z\xa7\xba_\x97\
-\x97\xeas{\xf5\xef\xdc\x9f\x9fko\xaf[\xcc\x97\xcb\
-\x1c|\xd2\xd46,\x9aR\xadg\x10CT\x9d\x82S\
-\xf3\x89\xb8\x95\x5c^\x97\x91%\xe4\xf9D]\x08\xf1\x80\
-\xbb\xce\xf3(G\xed\xea\xe8B\x5c^<s(\xd5\xaa\
-\xd4N\x83\xe5\x82N\xa9u\x85\xbc\x5cj\x89\x87\xafk\
-\xeb\x1aod[\x9a<VO@\xaa\x13\xab\xad{+\
-N\x0a\xbc\xd8\x9e\xdb\xc2'\x8b>u\x04d\xc6~\xc7\
-\xeb\x85\x89=\xe0\xabUY^=\xb3\xdd^8\xcf\x86\
-\xee\x8b\x12\x8b\x9f\xb5\xd4\xd6\xed\xae3\xa9Z\xc3U\x93\
-\x8f\xb0\x5cD\xd8\x99\x14&\xdb\x87Gg\xaf\x5c\xf3Z\
-\x96\x93\xd6y\xe27y\xdb\x22\xa0q4\xf4\xf9L\x8b\
-B[F\xf5\xc9\xd2J\xac\x81f\x84\x01\x96\x8d\xcb\xf6\
-\xa8\x06\xc0\x0f\xa9\xea\x16`?\x91P\x98\xdbf \xd7\
-\xd7\xb9\xa5\xbe\xf2\xe1\xad\xee\xf1\xe9rU\x02\x98\x22=\
-\x98\x03\xf5\x94[\xf0$\x19\xea\xcel\x5cb\xeb\x91\x85\
-S\x15\xab\xa2\xeaI\xabxwT2E\xc6Ivd\
-r\xca\x95\x95\xd5m\xccD\xb7\xdd\xb7\x81A\xf4\xca\x80\
-E\x04\xf3\x9c\x8b\xc0\xa6ZB\xed1ta\xa3\x10\x00\
-z\x80o\x01g\x85\x94\xb1\x5c\xa5K\x98v\xb3b\xcd\
-\x8a\xf7`\x05\x92\xe0@0\x85\xd2\xd9\xaa\x97\x1d\x86\x90\
-\xe1\xc1\xeb\xa4\x94\x94x\xe3\xdc\xd9\xc5v\xbb\x0b\x9f\x8a\
-\xf5m\x7f1\x8f\x8c\x8c\x8c\xbcE\x8c\x02\xd0\xc8\xc8\xc8\
-\xc8\xc8\xfd\xce0\xff\x10\xe8\xeb\x9a\x82Ao\x10\xa9\xf5\
-\xe3\xf7u\x8b#\x1bz}\x13\x08\xb9VR\xb3Y\xa3\
-\xecy\xd57\xa1F\xf9j\xefh\xb9Z\xceZ=x\
-\x11\x0f?\x90\x9e~\xec\xccG\x9f~\xe8}\x8f\x9e}\
-`;>0\xd1\x85F\xb3\xc6\x14\x95\xcdi\x99\x9a\xd7\
-\xd2{m\xfanw\xbew\xf1\xc6\xfe\xb9\x97\x0f\xe2\xf7\
-\xaf\x5c\xfd\xce\x0b/|\xe7\xe5\xef}\xe7\xca\x8d\x1b\x1d\
-\xf2\x02\x15\xcbP\x17m<\x8b4aj\xdc-WF\
-K)\x09\xa1/\x8e\xe2\x1e\x03c\x02\x84\xb2\xca\xa1\xd3\
-\xa3\x17g\x9f\xf9\xec\xc3\x1f{\xef\xe3a\xb5]\x17j\
-\x1bs \xe2\xe8\xccd\x0f\xca=xu\x9e\xff\xcbW\
-\xb6\xae}\x93\x87\xab\x95\xc7\x1e\xe6\xc2q&M\xb5\xf5\
-\x84\x8b\x1a\xca\xb3\xc0\xa1\xeb\xb7SBu\x95\xbe\xeb.\
->\xd4\xfc\xda\x17\xdf\xfb\xc1\x07[\xeeEu\xb0H\xd1\
-\xb3\xd7\x1a\xa3&Mh\xca\xf3W\x7f\xf8\xef\xff\xf2\x85\
-K\xdf\xeez\x8b1\x88`0F\x06\xb9eG\xf1\xb2\
-;\xe1O\x7f\xf0\xe2/}d\xe7\xe1\xe9Q\xc1\xa4\xe7\
-y\xf7\xd6\xd6\xb3,\x87U\x80\x84\x03\xa2\x0c\x1e\x01\xab\
-\x16*\x82\x10\x9d\xa8\x94\x07U\xb8\xe8d\xdd\xe9\xd1f\
-uM\xeeb\xcd\x86b\x94R\xa8\x93\xe4a\xd2\x17\xae\
-:\xd2g[Ml\x9a\xa5\xcd\x9e?\xd0\x1f\xff\xc5\xcb\
-_\xfe\xfa\x8d\xae\xcbjE\xb3S\x01:\x02]\x80\x02\
-\x8c\x81\x0c\xd5\x8d\xce\xc4\xd0Dk\xbc\xe6\x92\x17\xcbe\
-\xf1e\x22\x1e>7{\xffS\xe7\xdf\xff\xd4\xce\xe3\x0f\
-\xb6O>\x12\x1f|\x88\xb3\xadb\xc1\x9bI3\xdd\x9a\
-\x98E\xd5h+\xa4l\xad\x87\xd0\xd7zcyeY\
-\xbe\xe9\x93g\xf7\xfc\xdb\xdf~\xf9k\xdf\xf8\xf1\xf7_\
-\xda\xdf\x9fw\xc5'M\x8c\xb2TK.\xd9\x11\xac\x99\
-L\xac\x8f\xddb\x0e\xc7tb\x06G\xd7\x07x$!\
-\xe5\xd2\xa1t\x0f\xee\xce~\xf1\xe3\x8f}\xe6\xa7rj\
-J\xadi2i}\xd5\xd7\xf9\x22\xb59N\x0e\xab\xf4\
-\xf2\xfe3\xff\xe5\xdb\xf1\xcf\x9f\xfd\xea\xd5\xba\x9f,h\
-\xc8#\x1aLTD\x953p:\x9b\x1di\xd1w}\
-\xbbcF.\x0f*V\xabibt,\xe7{gg\
-\x8b_\xfc\xcc\xe3\x9fx\xe6\xec\xb9i\xa7\xee\xd0\xfa\xae\
-Y\xb6S\xbfH6\xc5\xfb4\x89\xcbt\xedry\x01\
-;\xbb\xb3\x07\x1f\xfb\xc1\x8b\xf6G\x7f|p\xf5\xea5\
-\xde&b\xe6m\xc8\xb1\x0e2\x98[\x9c\x90\xe8\xeb\xfa\
-\x22\x1d\xbfn\x22\x9c.T\xe8\xf5\xaa1o5\x02\x8a\
-\xf3\xdc\xa4\x9ckz\xaf[\x82\xf1\xc4b\xf4\x06\xe1)\
-\xdd\x88\x18J5\xe5 \x18\x03C\xf4\x0a\xc1b\xd3\x86\
-\x90\x90\x87\x22\xc8M-)6K\xde\xa2\x9b\x85\xcd\xa0\
-\x87u[\x02\xb6\x10<\xb4\x04UL\x10-\xc1P\xca\
-\xaa\x18\xdd\x00\xb8C\x02\x0c\x16\x8d\xd1\x82\xc9p\xb2\xad\
-\xd7\xc9\x90\xd3\xcea\x05\xeed\x85\x01\xa4`\xb5\xbaj\
-?\x9d\xf8\xa7\x1e\xb3\xef>\xa7UAsO\x9d\xf4F\
-FFF\xdey\x8c\x02\xd0\xc8\xc8\xc8\xc8\xc8}\x0c7\
-\x15\x16T\x90\xa7\xf5k2\xb2\x82pJp\x10\xceV\
-P\x15\xc1\xc64\x94\x86\xc9\xb4\xc0r\xbfA\x995\xf3\
-\xd0\xf7\xf5\xa8n\xa1<\xfd\x10>\xf2\x81\xc9'\x7f\xe6\
-\xf1\xf7<y\xee\xa1s\xe9\x91\xf3\x93\x9d\xb6X\xbf\xe0\
-j\xd1\xaa\x8f\xd1\x10 \xafD\x17\xc3\x92\xb1\x10\x86\x9d\
-\xab\x0f\x9c\xbf\xf2h9\xf7\x9e:\xfdP\xae?\xdf\xe1\
-\x85\xfd\xad\xbf\xfa\xd6\xfe\x9f}\xd5\xbf\xf7\x1c\x16\xf3\x85\
-\xe9\xef\x93]\xf26\xf5\x08}\xaf\x9aW\xd6\xb4\x1e\x5c\
-\x80\xab\x95\xc1I\xf7J\xcf\xb5?Z\xad^<s\x06\
-\x9f\xf9T\xfc\x95\x9f\xcbm\xbd\xdc\x1f\x1eR\xe7Q\xce\
-\x05\xe3V[\xcd`a\xeb\xd9\x97\xcb\x8f^^\xfe\xd5\
-\xb7\x7f\xa8\xba\x1f\xb04\xd2\x18\x9d\xa1\x90B\x14\xadp\
-\xea\x08\xc6\xda\xcb\xaaY\xb6\xa1|(\x83\xc5L\xf2\xbd\
-\x9d\xed3\x9f\xfc\xc4\x93\x9f\xfc\xc0.nx\xf2b\xa1\
-V\xe5\xea\xb9\x86.Lr\x9c=\xf5\xb5o\x9d\xff\xab\
-o\x16vWee\xb23\x13\x89\xba\x12<\xc5T\xbd\
-\xef\xfb\xae\x09\xdd\xd3O>\xf4\xb9\x9f\x7f\xe2\xfd\x17\xe7\
-\xcb\x1c\x96\xe5A\xd2B\xf3=\xf0%\x0c\x95g\x00\xe1\
-\xa6\xf5l|\x9d\xa3\xb3\xa9\xadrV\x1f\xea\xd9\xcc\x09\
-NW\xd3\xa6\xa4>.\xbb\xd4\x17c1J\x16\x90\xa2\
-\x87\xe8\x8e~UK\x09Mjvv5y\xf4\x1b\xcf\
-\xf5\xdf\xfe\xd1\x0b\xf8\xbbkr0\xcfd\x13)\xc8\x96\
-\x00\xdc\x1c\x90\x9b\xe8A5\x12\xd3Yl\xd9\x18WG\
-\xf9\xe0ea\xd5h5\x99\xe0\xc1\xb3\xf8\xc8\x07\xec\xa7\
->\x14?\xfa\xf4\xec\xc9\x87f\xe7g~f\xb6\x9a\xce\
-z\xa8+\xab\x95K\xc6$\xc6L\xd6\x90\x83!\xc5&\
-\x04\xa4\x07VOx\xf3 \x9e\xf8T\x99\x5c\xfe\xc8\xce\
-\xb7\x9e\xd9\xf9\xebo\xf5\x7f\xfd\xcd\xd5w\x7f\xd8\x1f]\
-\x89\xd6\xee\xc6\xf6\xe1\x8c\xb8\xf2\xccpd\xe8{\xee[\
-\xcc\x08\x11tS\x91\x87B\x02\x97K\xbd\xa4n\xb9}\
-a\xeb\x99O\x87_\xfb\xd5Y\x13\xfch~\x18\xc3\xd2\
-\xb2\xea\xb2\x03k;S;\x9b\xfd\xe8j\xf3\xfcj\xef\
-/\xbe\x7f]}\xb1&\x99X1\xd4~\xad\x84R`\
-\x8c\xd1b\x8b~\xaa\xa534$\x9a\xd5QK\x9f\xa5\
-\x97\x17\xfb\x97\x1e=s\xf0\xeb\x9f\xb7\xdf\xfa';\xef\
-{\xaamBN\xae\xa4\xd4\x1dt\xde\xbd4i[k\
-\xa9T\x0f\xfc\xe8(4\xcd\xee\x03\xfb\xdd\xd6\x95\x17\x7f\
-\xdc]\xfb~\xea\xfb\xd4L\x1c\xed\xb1\x90\xfa6fS\
-\xd4\xb4\xae\xee4\xc0\xccm\xc8\xe7\xc2\xe9\xd1\xcb\x86*\
-\xc3\x9f\xc0\xc6O\xbew\xc2\x89;\x97O\xbd\xb6\xb5\x12\
-\xa5R%\xb5\x9e&\xb0M\xa3\xc1{\xd0GtZ#\
-\x03l\xa3\x00\x0d\xe5j6DT\x91D\x88\x80\x95\xde\
-)\x85\x88\x9c\xce\xd5\xf6Q\x90\x82\x03pm\xc2\xb3\x86\
-\xc0\xb3\xe3\xb8!\xadEWs\x10\x0eB\x9a\xd6nR\
-Q\xd2\x8eB\xc2rUV\xd9g\x13Ly\xe8\xbaV\
-\xcb\x8dT\xdd\x8a\xe0=\xc2\x92\xf4d\x99\x90*\xc2=\
-\xd5\x7f\x01\x80h.J\xa4\xc3\xb0\xae\x1d\x95\xc8*\xa9\
-V6\xed\xd6G\x1f\x9f\x9d\x9d\xf2G\x0b4c\x15\xd8\
-\xc8\xc8\xc8\x08\x80Q\x00\x1a\x19\x19\x19\x19yg\xc1\x9b\
-\xfe\x03m\xa2>\x86\x1eH\xc7\xd1\xcb\x0c\xd1XQ\x97\
-\x87!\xd5`]]\xe5\xad\x88g>t\xfe\x17>\xfb\
-\xf8\xc7>x\xee\xf1\xc7\xce\x9e\xd9B\xc2Q\xf09W\
-G\xe8\x8f\xd0/P{X-\xe6\xaeB\xebj\xdcL\
-\x81\x08\xda\xa5\xc0\xe9$\xee\x9e\x9f\xb5\xbbM\xfb\xd8{\
-\xb7\xdf\xf3\xfe\xa7\xdf\xfb\x81\xfc\xa7\x7f~\xe3\xeb_?\
-x\xe9G\x87\xdeK\xed\x99jI0c\x80\xd8W\x17\
-\xaa\x18,N\xc0\xda\xf5\xa5q\x8b\xa6^\x87eY\xda\
-\x94\xb6\xb6\xe2\xa4\x5cw\xee\xd5\xfe\xd1\xb2\xec\x83\x96\xc1\
-/\xc7\x80\xb4\x15v\xb6`<@]\xc4\xd0\xb9\xf5\x9b\
-D\x8eAl1\x81\x04\x09\x1b\x9e\xb6\xbb\xb4n`\x06\
-\x072X\x8c5\x90\x91Gm\x8c\xd6\xd4T{\x0b]\
-\xf5e\xad\xbd\xc7>4-\xf8 \xcbT}\xa2\xd86\
-\xcd\xb4\x9d\xf49\x97\xbeT\xe6\xd44\xc1P\xe6\xfd\xaa\
-[\xc1\xebV\x13\xda\xb6U-}\xed, \x85\x97,\
-\xbd|,\x1d\x04\xac\x0b@\x86\x10\xdb\xd33=m\xb2\
-\xa9\x15`\x8e6\x04\xa8m\xc2*\x05/\x86bp \
-\x08\x81\x984\x08\x13\xe4\x15\x16\x15\xee\x97\xda\xa6\xcc\xa6\
-\x22.\x99\xf9\xa4E\xb1\xed\xde\xa7d\x01\xaa\xa8A$\
-\x01H\x912\x15\xba\xd7\xc6\x18L\xe5\xe8p\xd5\xf7\x17\
-v\xf0\xcc\xc7\xce\x7f\xf6S\x8f}\xfc\xc3\xcd{\x1e\xc1\
-\x85\xed\xd8\xa8p\xb1g\xddu/Kc\xcf\x0cT\xd4\
-\x00E\xb8\xa3T\xd4\x0a\x10M\x80\x19\xe04\x85\x1d\xdb\
-\xdd}\xd0\xde\xfb\xe4\x93\x9f\xfe\xd4S_\xffF\xf9\x8f\
-\x7ft\xf5O\xbfr\xe9\x85\xab\xcb\x1a4;\xb3\x93\xc2\
-b\xb1<p\x1e\xcd\xb6V\x0ae\xd5w\x01h#<\
-\x17\xaf\xb0\x18R\xf4R\x97}Y\xb5\xed\xe4\xcc\x993\
-\xde\x1d\x02\x07\x81q:\x9d0\xb0\xef{\xa2\x9b5v\
-n\xb7\x0b\xe1F\xd7\x1d\xc0\x93\xadC\x7f\x0d\x84\xdc\xc5\
-\x82\xc0\x22\x95\xde\xc1\x948[\x1d\xa9\x09q;Y\xf0\
-\xfd~q#\x02\x9f\xf9D\xfa\xe7\xbf\xbe\xf5\xf1\x0f\xf6\
-\xb5\xbc\xd8\xcd\xe7)\xd8\xac\x9d\xcef]\xe12\xc4\x80\
-\xe4K,\xb6\xb7f\xbb\xbb\x0f\x5c\x9b_\xfd\xea\x9f?\
-\xfb\xc7\x7f\xf8\xf2\xe5\xe7\xbd\x0d@\x9a.ul\x1f{\
-\xc7\xf0V\x88Yo\x8eW\x07\x00`b\x00\x7f\x229\
-\xd5C:\xf9P\xc1%\xa0J\xe6\x02\x03\xe9\xd5\xaf\xef\
-\xaf\xaew\xd5E3\x01(\xdat\x22\xa3\x91\xd4&\x88\
-\x9e\x9b4\xf5\xc1J\x04\xc0\xbd\xe6U\xef\xf0\xc9n\x0c\
-\x91\xcby\xb7\xcce{\xca\xc7\xce\xc7\xf3[g\xbc;\
-\xd0\x91\xc3\x85Z\xa1\x1e1\x922\xa9\xe4{\x0f\x1c\xe7\
- \xfe\x0d\xa9\xe9\xeb\x9d\x01@ARE\xf5v\xb6\xbd\
-}\xee\x5cHK\xa9\xc7\xdb\xb6\xf1\xdb\xc8\xc8\xc8\xc8[\
-\xcb(\x00\x8d\x8c\x8c\x8c\x8c\xdc\xc7\x90\x5cOT\xb5i\
-+\xb3n\xc0T\xdc4T\x83h\xf0\xc5\x0c\x0b\xc8\x86\
-\xf9\x01\xbc\x9fr\x7f6[\x95\x95\xfba~\xfc\x1c>\
-\xff\xa9\xe9\x17>\xfb\xd8\xc7>\xf4\xc8\xf93\xee\xf9E\
-\xef\x0eT\xe6\xf4>\xb0\xc6P\xc2T\xa1w\xf4\x85\xee\
-!:\x890$\x15W\xc8\x01\x80AM\xa8\xacyy\
-\xd8\x81\xf6\xf8\xb9\xb3\x8f}\xea\xe1\x8f=\xf4\xd0\x9f>\
-\xf2\xfc\x1f\xff\xcf/~\xf7{\xcb\xebK\x82h\xd34\
-\xb5\x01\xcc\xab|\xd0\xeb(\x98\x05\xa6\x5c\x95sh\xd3\
-\xd6\xacm\x85\x8a\xd5\x9c\xcb\x0e\x877\x98W\xd6\x81\x9a\
-[\xb9\xca\xb2\xf2\xa3\xfd\x1a\x988\xf3E\xf2\xa3\x9e\x1d\
-\x9a\xd9\xa4\xc0\xaa\x93>\x95\x1a\xa18\xcc\xc1\x82\xad\xca\
-\x04\x94\x02\xd5a\x7f!\xa8\x10\x06\xad\x823V\xb1_\
-riaYX\x96\xe2\x82ue\xee\x96\xaay\x97\xc3\
-\xf5\xba8\x1b+ZD\x82^j\xe9\xb3;B\x8a\x80\
-\xbcv\xb5\xf4\xa5G\xbf:\xea\x96?\xc6j\xa9\x95\xb8\
-\xba\x0a\xc2j\x9fR\xf2\xa1*D\xeb\x22\x9cu\xf7\xb2\
-\xb5,\xb4)/\xf2uE\x09\x0d\x10j\xd7\xb2\xb6\x0a\
-@\xec\xcd84s\xa2H\x0dF\x05\x91`\x8f\x92\x19\
-\xe3,\xf5\xdbm\xde\x9b\xf6\xd7k\xdc^\xe8\x8c\x14D\
-\x07;\xb1\x8a\x05 \xd0Pm\xf0Hg\xac%`\xd1\
-\x94\xbem\xf2\xd9s\xf8\xe9\x8f\x85\x7f\xfc\xc5\x87?\xfd\
-\xd3\x8fn\x87<\xf3y\xe8\xb2\xe7e]\xac\xbc+\x05\
-\xb4\xd8\x22\x84\xe0\x12\x81\x14, z\xf1\xdaC^\xca\
-\xd0\x83,\x90\x0b\xa8\xa2\xd4\xa6N\x9e\xd8\xd9z\xe4\x97\
-fO?\xf9\xf0\xfb\x9e\xd0\x1f\xfe\xa7\x97\xbe\xfe\xdd\x1f\
-\xf47\xaeo]h\xd3\xb4\x1e\x15@\xc1\x82Y\xa3\xe2\
-e%k\xeb\x96J@L\x936\xe4d\xc8K\x9f\xe7\
-\xbc\xbf(\x8b=\xce\x17\xcd4\xa5T\x83L\xb9\xefV\
-\xabU\x22}\xafe\xd7\x08tR\x01\xa2\x83\x82+\xba\
-[uc\xf5\xdc\x95\x10l'\xdaN*\xdc\x92\x9a~\
-o\xbe\xdf\xb7S|\xf6\x93\xe9\x9f\xff\xea\xce\xc7\x1f\xb5\
-v\xd1/\xe7\xb2\xe5\xaa\xa0\xf6\xa9K\xc6\x10\xcck9\
-\xdc\xebk<3\x9b<\xbdwe\xfa\x9f\xfe\xf4{\xff\
-\xea_\xbf\xf8\xb7\xdfFl.\xa6\xd4,j]\x87)\
-\xbd\x9e\xf4\xe2w\x0b\xfe\x9ae\x1e\x11\x82\x0dq\xe7\xaf\
-\xa7\xb5\x96A&\x9a\x1bn*\x01{\x9d\xe7\xe2TJ\
-\xb3x:\x93k\xa8\x0du\x08\x08\x94\xcbsaJ\x0c\
-MJq\xd1\xf7_\xfb\xc6\xe1\x7f\xfcJZfN&\
-\x00PT\xa4M!)\xcd\xdd\x8f;xq\x9ds\x0d\
-\x0e\xfd\xe8B\x05\xabCLV\x05\xcf\xaeZ\xcfn\xd9\
-\xa7\x7f\xfa\x81\xcf}\xe2\xd1\xf3\xd3\x82x\x19}\x0d\xa1\
-\x00\xcbu.Xqp\xd3\x1d\xfe^\xe00,\xd0O\
-%0imOr\xb6\x16\xcf\xef\xa6IZ\xaa\xbe\xcd\
-\xbdl####o\x1d\xa3\x0042222r\
-\xbf3\x08@\xc6\xa1!:\x1d\x18\xcc5\x10$\xb3A\
-\x00\x02$\x90\x8a\x0e\x13\xc8\xda\x05\xedm%\xb7\x88\x07\
-\x1e\x9d\xfe\xe3\xcf]\xfc\xed/>\xf6\xf4#\x93X^\
-\xe6\xd1\x8b\xc0\x01\xbcW\x95\x17phR\xb5\xc9\xbf\x18\
-\xfaK\x9f\xcc\xcb\xb4\x09z\xad]\x00\x83Y\xb0\xd4\xcb\
-\xea\x95k6\x8d?u\xf1\xf1\xc7\x7f\xe5\x91\xa7&\xcf\
-\xfd\xde\xff\xf4\xbd?~\xee\xf00#\xb0K\x0de\xc6\
-z _ N\xc5\x90K\x95\x1a\xc3v@\x0a\xc8\xad\
-w[Z\xce\xfcz\xdb\x03\x19\xe0!\xd0\x81.fT\
-\xa0\x1c\xc52\x09}\x09\x15\xd1Mh\xe4\x81e\x0bl\
-\x9d\x15J\x95\xcc\xd8\xaa\x8a\xac5H\x1eP\xe1\x80S\
-\x99\x90\xa9\x06\xd5\xe8\xb5\xf1~\xe2\x88y\xc9\xfe\x088\
-Z\xf7I\x16`\xcb4]\xcc\xc2\xf9\x995M\xe5j\
-\xd5\xaf\x8c\x10cL!\xb2V\xcfyN\xe4\x94\x10\xc3\
-2\xf8\x15h>\x89\xb0\xd4\xa0\x22\xe5je6<\x83\
-\xdfL\x0d\x05\xf9:\xae\x03\x05Z\xb7l\x1f\xa2l\xd6\
-gOdN\xf2\xc6\x0c!\xac{7\x01\x83\xa8W\xe0\
-\x82\x14\xa7\xd8\x22Jm\xc2j+u\x17\xdb\xeeR(\
-\x87\xfd\xd1.\xe2\xb6\x02\x81LVX\x07+\x80\xc1\x13\
-\xd4\xd0CR\x98\xd4\x8c|\xd0\xb2\xfb\xc0\x93\xe9\x97\x7f\
-\xee\xe2\xaf|\xe1\xb1\xf7\xbfw{R\xae\xf1\xe0 \xce\
-\x97!W\x84A%\xdcB\xe7\xec\x85`\x10\x11\x02d\
-H\x0e\xef]\xa8\xe8Ag\x00\xab\x87\xfe\x00m\x03\x1d\
-\xae\xae\xd6z\x8d\xb3\x87&\x1f~\xea\xa9\x87~\xfd\x89\
-\x8f<\xfa\xe0\xbf\xf9\xf7\x97\xfe\xe4/_Z\xec\xd5\xf6\
-\xfc\x8c\x13\xee\xf7\xb9\x92\x933\xd3y\xc1\xe2\xc0b\xd9\
-\x81\xa3:\x22&)t\x0d\x16\x5c-\xc3\xca\x1b\x9f\x07\
-\xab\x13/a\xb5\x8c\xc6\x00\x05!\x94=\xaf/'\x95\
-\xc4\xa1E\x9a9\x22@X\x96\xe5b\xc5\x83\xc3\x892\
--\x95\xd1\xb6\xb7\xb0\x13\x97{\xcb\xf9\x8f\xa7\xe6\x9f\xf9\
-\xe93\xff\xab\x7f\xf6\xe8\x17>\x9e'\xcb\xe7q5\xcf\
-\xc2\xf6\xb4\x9d\xa9\x9f\xfb\xd1\x81b\xb0\x09\xc92\x09S\
-L.\x5c\xbb\xdc\xfc\xa7?\xbf\xf1;\xff\xf6\xe0\xeb\xdf\
-G\xc0\xf9\xdd\x9d\xc7\x8f:\xefp\x15[\xc5\xee\xb1,\
-g\xe4&\xee\xc1\x13D!:B5\xc0(\xbe\xd1\xf3\
-0\xa8?\xd2\x89>\x82\x8d\xa0\x14\x82\xab\x16\xf7\xe0\x16\
-\x9a\x09g\xa9t\xabo}\xaf\xff\xd7\x7f8=,q\
-\xbb\x11\x80\xeaQC\xb6\x98\x91fr\xf7M\xe7\xc5\xe3\
-\xf0\x1f:)\xb2\x99\xdb\xb4\xa3\xa1\xcfXvh#\xa2\
-c\xcb\xea\xf5\x83\xe5\x03\x0f\xc6\x8f\xbfow\xd6,P\
-\x96\xa8\x19\xde\x0f\xc9\xfdAC\x04\xfc\x1b\xd9=\xdb\xdc\
-\xf3\x8f\x11\xd6N9\x99\xb0{\xc6\xa6-u_\xa4Z\
-\x8d\x8c\x8c\x8c\xbc%\x8c\x02\xd0\xc8\xc8\xc8\xc8\xc8}\x8c\
- Rt@\xb6y\x8eL`x\xc9@\x88.R\x1c\
-2hDx@!\xfa\xc6J\xeaQ\x0b\x9ez\x1c\xbf\
-\xf6\xc5'\x7f\xfd\x97?\xf2\xc4\xd9\x92\x0f\x9e\x9f\x1f\xbe\
-\x9c\xea\x8d&\x94AMB\x00D/&\x11\x14\x1a\x8a\
-\xd0\xba\xb0\xcc\x8c\xc6@\x08t'HI%\xa7\x9d&\
-\xb5\x93\xc5\xe1b\xff\xca\x0bi\x9b\xe7\xce>\xf9\x0b\x9f\
-|\xb4M\xee\xff\xe5\xfb\xff\xbfo.\x0e\xe6}\xa9s\
-k\x1a\x0aA\x91\x0c\x22\x01\x0b\xc1J-\x8b\xde{T\
-\x06K6K\x22j\x87\xae\xf7Z\xa5B\x83q\xd0\x9f\
-R\x0cM\x8c\x12r\xc9\xa8\xc5D\xc2\x5cp\xa0\x00\x19\
-\x83[\x86\x15\x1cZ\xc2\x13t\x91\x80L\x0aB\x90\x02\
-\x11\x8d1\x0ce\x1d$\x02\xac\x82\x14EFC\x0c\xe6\
-T\xae\xb5\xaff\x8dM-64\x96\x9as-\x15\x81\
-1\xc6TScm\x22L$\xe3p\x0eXn\x9ag\
-\x0e%\x1akc\x16A\x83;`\xc4&\x8fe\x98\x98\
-\x91\x08\x99&X\x05\xeb\xda\xf7\x80M\xdd\x9e\x84\x08$\
-\x80\xa8R\xc1\xb2\xd3a\x0d\xcb\x8c\x5c|%M\x0dQ\
-\xe6\xa2\xc0 \x09\x08\xf4H\xe7\xf6\xa4\xb5\xae\xae\xf6\x0f\
-\xb6b\xf7\xe1\x0f\xe1K\xbf\xf4\xe0\xe7?\xfb\xf4\x07?\
-p\xaevW\x16\xd7_\x98\x22\xc3$s\x9a!\x1a\x83\
-\xc0\xac\x5c]V-\x0d\x8d\xa2\xe4\x05,\xa2\x0b\x08\x91\
-a\x22\xac\xbc,\x160\x85\x99\x85\x19\xfa\xb9\x1f^^\
-6\xcb\x97\xb6f;\x9f\xfd\xb9\xc7v/>h\x93\xee\
-\xdf\xfd\xe7K\x87\xfb\x8b\xc9\xf9-\xa9]tE\xde\x14\
-\x8b\x15\xee\x81\xa2\xfaAS\xca\xb5f*\xa7\xa0\xedI\
-\xaa\x96\xe7\xeb\x83\x1dh\x11mS\x99\xa2ex\xadp\
-\xa37\xf4(\x0d\x99\xe6t\x06\x87\xe4 ,\xc6T\xb3\
-\x9b/P\xf2\xfc\xe8r\x83\xe5\xcf\xfdL\xfao\x7f\xeb\
-\xf1\x9f\xfd\xe8\xb9\xc6.\xa3\x97\x8a\xbb\x95\xd0\x881\x80\
-\x10\xcb\xca\xa1fgz\xee\xe9\xbd\xe5\xd6\x9f\xfc\xe5\x0f\
-\xfe\x87\xdf{\xe9\xaf\x9f\xf5b\xdb[\xbb\xbbs\xeb\x8f\
-\xd8+\xac?9o\xedG\xf9\xfe\xe4\xd5\x9aq\x05l\
-\xb4\xe3\xd7|8\x05T\xd29\xdc}xJ\xbb\xb9g\
-NT\x96u\x8e8\x053\x04c\x059\x94w\x19B\
-*\xde\xac\xca\x5cm\x16\xe5\x8dDH\xa8\xaa\x00h\x81\
-\xeb\xaa1\x9d\xacn\x10\x80D\x00Y,%5\xad\xd5\
-H9\xd8D\xcf\xbc>_|\xe7\xd9\xe5\xf7\x9e\xbd\xf6\
-\xd4#\xd3\xad\xe9\x84i5\xd4gB\x15F\x18\x0c\xf7\
-.\x00\xad\xe5\xa7\xc1W8\xe4\xcf\xbbA$\xdc\x0c\x92\
-P\xcb\x99Yj\x9aP\xe5\xf7\x184=222\xf2\
-\x8ec\x14\x80FFFFF\xeeo\x86\xe8U\x0e\x02\
-\x10\xa5u\x1chup0\xfb\xc8\xa1\x10\x00\x04:\x1d\
-D\x17\xe0\xd6\xad&\xf0\x8f>1\xf9\xd5_y\xe4\x1f\
-\x7f\xfe=\xef\xb9\xd0\x95\xeb\xdf\xf6\xfd\xe7\x1b\xd6\x10|\
-(\xf4`\x83\x10\x00\xa8\xaa\xca\x22\xc3\x84)0Q\xa8\
-\x9e\xc5\xda\x98Z\x8a\xaa\xae\xda\x03K\xa2P\x15\xcbC\
-\x94\xe5\x14%\xb4R)\xdc\xbb~~:\xfb\xd2/M\
-\xc3\xd9'\xf6\xeb\xcb\x7f\xf97\x07\xdd|\x1eQ\xdb\x08\
-\xd1\xdc\xe1d\x88\x89\xd5r\x97\xd17@2\x1azb\
-\xdebq\x03\x8b#\xb99\x83Y\x01\x0b\xa2\x90#}\
-\xd6\x846\xa0\xcby\xa5B\xc60\xf4\xff\x023\xb8\x84\
-\x05\x0e3\xba\xc1G\x13\xecTt\xab\x82\x14\xc0\xe0b\
-%\x8b\xc1#k\x04[\x84\x0a\x0b\x84\xa3D\xd4\xa8\xb2\
-T9\x80r\x88\xdb\xa9i\x9d\xccR\xef c\x88m\
-\xdf\xaf\xaa$8\xad\x00\x1dz\xb0')\x04?U\xed\
-\xb5\xae\xf0r\xd0\xa5u\x84,7Q\x1c\xa7JR\x00\
-\xa0Y\x9c\xc8w\xd8L\x98\x07y\xa8\x01\x22\x10\xe0@\
-\xb6\x85\xda\xcb\xa5]\xf9\xec\x06S1vD\xa1L\xa8\
-@\xad\x22,\x01I\xde\xc6\xdaN\xa2!\x1f\xf4\xbe\xff\
-\xfe\xc7&\xff\xed\xaf?\xf1\x85\xcf\xed\x9e\x9d\xde\xe8.\
-\xfd\xd0\xfb\x83-\x1c\xa6(\x8bD#d\xc0\x85 l\
-\x83B\xf0@\x9b(&\x0bD\xa8\xb0\xaex_\x0b\x8a\
-\xa3T\x04\xc0\x22\xe1\xbd\xb2\xc5\x98\xb6\xcfz\xe9\xfb\xc5\
-\xd1\x9e\xf2\xdf\xb5g\x9e\xff\xf8'\x9e\xfcm\x5c\xbc\xbc\
-<\xfa\x8b\xaf\xcd\x0foT\xec<\xa8d7V\xd9\x1b\
-4\x13\xeb\x97ff\x16&\xb9\x12\xf9\x80e\x1a\xcb\x83\
-\x5c\x9d\x85Z;:\x00\x8by&\x1d1\x87\xd9\x1cL\
-A\xd10\x8f\x8a\xac[\xd0\x84(\x0e/\xb4J\x03\x87\
-\x92\xc6\x10B\x9c8\xc2\xf2z\x7f4\x9fb\xf53\x1f\
-8\xf3_\xff\xea\xa3\x9f\xffD\xd3\xea\x07\xcb\x97\xf7\xb7\
-\xaa\xa1I\xd5\xbb:\xef\x9b\x19\xb8\xabeA\xcf\xd4l\
-?~5?\xf4\xc7_\xd9\xfb\x1f\xfe\xc3\xfe_=\xeb\
-K^\x9cl]\xdcOq\xceEm\xfa\x09d\xf5\x0d\
-f\x19\xbfk\xb8{Cy!`S@\xf5:t\x0e\
-9\xe0\xb0\xb5\x00\xf4\xe6p\xfa\xf36|6\x05\x01n\
-F\x13B\xce\xb5-\x82\x22\x9a\x8a\xdd9J\xc0\x0c\x10\
-\xdc]r\x004S\x18\x12\xbd\x04\xac\xf5\x96c\x99\x97\
-\x14\xca\xd4\xfbs}\x081\xc6P)k\xad\xb4y\xfe\
-\xf2s/_\xfd\xea7\xaf?\xf3\xf1\xf7_<s\x06\
-\xf1jbfo\xf0\x15\xcc@\x7f\x83\x99I\xeb\xb0o\
-\x16\xd0\xe1\x04\x02\x08\xa8\x9a\xcb\x8b<\xfb\xf64~\xea\
-q\xfb\xd6s\xbe,j\xe3(\x01\x8d\x8c\x8c\x8c\x8c\x02\
-\xd0\xc8\xc8\xc8\xc8\xc8;\x84\xc1g\xb2\x09\x14]'\xfd\
-H\x00I\xd1 @n\x10T=\xd7\xb2\x9c?\xf4(\
-~\xf3K\x8f|\xe9\xf3\x1f\xdf\xdd\xf2k/|\xab\xe9\
-~\xb45)\x167%] \x04/\xa6\x10\xd1Dk\
-'\xb0\xa6\x82\x1e\x8cd\xf1J4\xc44Z\xa2U\x84\
-\xb9z\xf7Z,\x08*X\x14\x12m\x02\xac\xf7z\xa0\
-\xd5aHg>\xfc\xde'\xbe\xf4\x8b\x0f\xee\xed\x7f\xf3\
-\xdb\xdf\xbaf\xb9ob\x9b\x91\x8a\x9b\x9b\x81\xb4`\x0a\
-n\x01\x11)Jp\xaf\x19\xa6\x06\xd6Z\x13\x19\x03\xea\
-J\xb5\xa7\x84R\xe0\xce`4\xba;h4@\x0e9\
-Xa\x0e\x08\xd6\x83\xc3\xfcj\x98\x14\x0d=\xe25\xb4\
-\x02\xa2 \xc8={\x0d\xe6=P1xr,H\xbe\
-~\xaen\x05\xcc1\xc0S\x10\xd1\xe7\xbeW\x01Cj\
-\x9a\xecV\x1d}\x86\xfbP`\xe2\x80\xcc\x80\x86\x80\xb0\
-\x99\xd3\xd1\x0c!\x22\xc6\x10\x9b\x10\x0c\x12\xe4\x9b\xaeF\
-\x9b$Z78A \xf6\xb0\xba\xae\xdePX\xff}\
-2\xbc9\x15\xb0B\xa0\xd5v\x12\xb1=\x0bGS\xb6\
-\x8d\x22\xea\xe0e@\x1drD\x08\xba\x03\xb2\xc8h\xb2\
-\xfd\xeb7f\xbe\xff\xf1\xf7\x9f\xfb\xcd_}\xf2\x17?\
-\xfb\xc8C\xe7n,\xf6.\xf7\x87{\x93\xe4m#\xc8\
-aP\x042\x94a!`k\x86\xa6\xc1*x\xb5b\
-\x81\x06\x8bJ\xb1M\x96\x93\x97R\xd0\xad\xa0Pl\x8b\
-(U\x0ee\xc0<\x18&\x0d:-\x96G\x8b\x14\xec\
-\xc3\x1f\xf8\xc0o\xfd\xfa\xf4`\xf1\xad?\xff\xbb#5\
-\xdc:\xb3\x9b\xf3\x9e\xbb\x98R^\xe5\xc6\x98\xdaF\x19\
-\x0a!\xa5\x94b\xcb\x1aQ\xa0,\xc6h\x81P\x8f\x0a\
-\x14\xa0T\xaf\x99p3\xa3\xa24$\x02\x13\x00a.\
-\x09FZ4D\xd4\xb2Z\xb4\x98\x7f\xf4\xe93\xbf\xfd\
-k\x1f\xfa\xec\xcf^h\xf1\x83\xee\xf0R\xbb\xac\x1e'\
-\xd8iC]\x96U\xe93\x98\x90\x039\xdd]\x94\xf0\
-\xc7\x7f\xf6\xdd\xff\xcf\xffx\xe5\xab\xdfX8\xcf\xee\x9e\
-{`\x81x\x94\xfb2u\x85\x92sN\xc0\x1b\xeeg\
-5r\xc2\xeb:\x92?\xf9\xc3\xceuBP\xae\x90\x91\
-\xe6@.\xb5-\x1e\x03`\xc8\xee\x9d#\x15B\xc8\xa8\
-\x9b\x01U#\xd7\xd1\x5c\xeb\xdc\x9f\xe3\xbcj\x01\xb2\xd4\
-\x18&\xb9wg\xa8\x8e\x92mj\x934\xdb].\xaf\
-\xfe\xe8\x85\x83k7\xfa\xfc\x98\xc1\x10\x0alH\xa3\x97\
-\xe1M+\xcd:>f\x9b\x1ep\x84\x8a{\xae\x936\
-~\xec\x89\xe6\xc2\x16\x9f;B;NzFFFF\
-F\x01hdddd\xe4~G\xa8n\x8c\x12\xd6\x8f\
-\xdb\x87HR:<\xd7b!\xa5\xb6\xa1W/Y\xa5\
-obF\xd5\xe2\xc8\x1f\xdd\xcd\xbf\xf6\x0b\xed\xe7\x9e\x09\
-\x17\xa6\xd7\xebb?\xd5K\xad\x15\xa3\x81\x82\x09\x08\xd5\
-'+\xdf\xaa\xe1\xbcO\xce\x978\xd9[\xd5+\xfb\x07\
-\x07\x07\xf3\xc5\x22\xf6\xcb\xa6V\x9f\xa4xvg\xfb\xa1\
-\x8b;\x0f\x9c\xe3l\xe7\x00y\x1a\xca\xa5\x89\xdd\xb0*\
-,\x81\x0c\xf4D\xc8\x16\xcd\x0b\xf3\xf5\xa3\x0b;\xfe\x85\
-g\x1e\xb9\xfe\xe2\xf5\xe5\x0b\xd7\xae\xeey\xeec\xd3n\
-i\xd6\xf6Ny\x05\x97J+\xa1\xafG\xf3\x1aW\xb5\
-\x095\x9eK\xd9`A\xa9x\xd3C\x9d\x15\x91D\xdb\
-\xf5\xe9`\x19\xd1\xd9\xaa\x86%ZS\x0c\xcc\x0cnD\
-&V! \xda\x8ad\x88ba@\x8c!\xba+\xb0\
-Zp\xe4\x22+0CZ\xa8\xc9\x8a\x0bL2\xd7\x1d\
-}zye\x9a\x22\xf40G#5\xa8\xf0^%\xd3\
-\x9d\x01\x0cE1{(l\xc4\xa5+\xb8'(\x82\x19\
-\xc1\x04\xaa\xc8\x90\x5c\xb1\xa0\xb1t\xb6\xf7\xe9\xd1!\x9b\
-3\x17c\xbb\xbb\xe8\xbb\x22A\xeb\xda/#\x22H\x05\
-\x22\x005\x87}\x0f+\xb8A)\xfa\x94u\x06\xb7 \
-\x03\x90\xcb!\xc2\xa1%,}\xee5Xy\xf2\xca*\
-\xec\xd7\xaeK\xec\x1c1\xae\xbc\xd6Z\xbb&%\xf7\xb0\
-\x5c\xca,M'\xc1\xba\xd5by\xfd\xb1G\xec\xbf\xfe\
-\xb5G\xbf\xf4\x8b[\x17&\xcf.\xaf_f\xb7\xd8i\
-<FC\x0d(Dm\x84\xd8sR\xd3NMgW\
-ew\x7f\x19n\xec\xd7\xcb\xd7\x8e\xf6\x8e\xe6%w\xe6\
-y{r\xe6\x91s\xdb\x0f\x9d\xdf\xde\xd9\xdai\xd3\x16\
-\x9bK\x0b}\xad\xda>\xfbI\xcb)\xfa,\xcf\xed\x14\
-\x86\xce\xe1\xf5\xe0`\xd6\x5c\xf9\xf4G\x1f\xbc\xf6\xf9'\
-_z\xf9\xdb\xdf\xbd\xf6\xd2\xce\x99\xb2\xd3\x84U5C\
-W\xe3\xc1\x0a4\xae\xd0F\xb6+O\xbd\xe2\x0d\xa6\x0c\
-\xee[\x9a\xd3\x1c&\xc8\xc5\xcc\x00\xa8wt\x8cN\x06\
-\xf9\xb4\xe6\xc8\xd8\x87D\x84T\x9dp\x1a\x9bI\x08\xa9\
-\xf6\xb5[L\xe3\xf2#O\xe37\xbf\x98~\xf5\x97\xf0\
-\xe8\xb9\xcbG{\x97lU\x9b6\x08*]\xd7\xccd\
-\x09{+\xa0\xa4t\xe6\xd1\x1b\xf3s\x7f\xfa\xe5\xeb\xff\
-\xfaw\x7f\xfc\xb7\xdfVNg\xd2\xcen?\xa9+_\
-V\xae\x94:g\xa7\x12\x81\xc9?\xe8g\xfa\xfegH\
-\xa2\x07T\xe9\xfe:2\xa0\x09\x14\xb0\xd0JD\x95\x18\
-H\x7f]\xee\xa1\xd72\xb2c\xe7N% \x9a\x00\x86\
-\x08\x8b\x15\x15\x88\xe8\xb6\xadO64\x897\xf9\xb0#\
-\x06\x83qcgZ\x17\x7f\x0dc^K\xc6\xc9 \xf3\
-RJ\x05D\x0f\x15\x8a\x93)\xeb\x99\xcb\xd7\x0e\x9f\xfb\
-\xf1\xf5\x9f\xf9\xc0\xb4iS\xf1.\x08,\x15C\xf9\xd9\
-\x1b\xdd\xb3\x00\xf8\xc6+\x98\x80\x04\x163'\xe1.\xf6\
-e\xd2,g\xb3U\x0c\xf5-\xd0\xd5FFFF\xee\
-\x0bF\x01hdddd\xe4\xfe\x85\x10\xc4\xc1\x88\x02\
-j(\xfe\x1aZ\x8cKt\x99\x14 \xb8\x04\x9a\x058\
-KW\xb3\xa6\x89\x9f\xf9\xe9\x87\x7f\xed\x0b\x0f?\xfe`\
-Y\x1e<\x1f\xea\xd1v\xd3\x99C\xbe\xf6\xbf\xc0\x05%\
-4\xbb}\xb8p\xfd0>{i\xefo\xbe\xb7\xf8\xce\
-\x0f\x0f\x8f\xe6]?\xe7\xfc\x80\xee\x98\xb6\xe1\xccN\xfb\
-\xe8c\xd3\x0f>\xc5\x0f\xbc\xa7\xbc\xef1{\xec\xc2\xae\
-\x95\xa3z\xa5\x97\x10\xb6\xc0\x22t\x05M2\x8bZ\xe5\
-\xa9/\x1f\xbf\x90>\xf9\xd1\xf7\xfc\xe8\x1b\xfb\x7f\xf97\
-W.\xafj\xad\x86\x988\x891z\xf1\xa5\xa3wR\
-(\xd5\x8a,\xc2*\x14\xe1&-\x8b:\x83\x18\xa0@\
-6*\xb1\xcf(\x15\xbd\xac')3\x06\x00\xa4\xf2\xf0\
-\x90\xde\x08\x10f !\xf6f\x8d\xc3a\x15\x06\x9a\x04\
-\xc1\xc4Pd\xee\xb6\xb2(\x98\xc1\xeb\xa6\xba\x03\xb2\x22\
-\x14\xb1\x8apy\x95\xc4!V\x15\xd9U<\x80\x91\xd1\
-\x86\xf0\xe4a\xa2\x0b\x89E@DlY\x934\xed\xca\
-\xf6\x8f.\xe5\xaf}kq\xd8{\x89\x87G\xa5\x86F\
-\xc1L\x9b\x99Xr\xc6J\xca\x9c\xde\xb7\xcb\x122\x10\
-\xa8\x90\xf2Q(\x09\x8e\x08\xd2Y\xd8\xc7\xe9*\xb5:\
-(\xfd*\xa0\xd9\xfe\xfe\x95\xeb\xfe\xed\x1f\x1e\xae\xd4X\
-C\x86J_\x02\x00\x22\x11L)0\xaax]\xf6\x0f\
-Og\x9f\xfc\xd8\x85g>\xfc\xe0\xc5\xb3G\xec\x7f\x1c\
-\xca\xb2\x09\xb0A!\xec\xe8K\x98\x1akv&;\x0f\
-\xd4\xd9\xc5\x17\xf7\xed\xcf\xfe\xe6\xf2W\xbe\xb3\xba~\xa0\
-\xeb\x07\x8b\xfd\xc3\x85jf_\xa2\xa7\x8b\xb3\xc5{\x1e\
-^~\xe0=\xf9COo=\xf2\xc8t\xebBi\xb6\
-Y\x0e\x9a\x5c\xd2$N\x94W%/b\x1b-)\xaf\
-\x16\xb5\xbb\xf2\xc0\xee#?\xf7\xc9\xf7\x7f\xfd\xdb\x87\xcf\
-\xff\xd1\x8fW\xf3\xeb\x8c\x0f\xd4\x5cK=\x8a\xcd\x1c\x00\
-\xe4fmdvd\xc7J\x8c\x08%\xc4\x0a\x14\xc8a\
-$}HF!+M\x12\xe8\x8d!\x09\x8b\xea\xbdg\
-\x8a!ZJ!\xc6Z\xf3\xd1\x9e/\xe6\xef{\x9c\xbf\
-\xfa\xf9G>\xff\x0b\x17/\x9c=\xca\x8b\x97Z\x1d\xa4\
-i\xf4\x1e\xb9+C6S1\xd8\x14a\x9a\x16\x99\x7f\
-\xf1\xd7\xd7\x7f\xe7\xf7\xaf|\xfd{\xaa\xa1M\xd3\xddU\
-hV\xb5/1{\x93K\x98;r\xeb[(\xc3D\
-\x7f\x9c4\xdf\x0e\xbd\xe2{\xde\xee\x0d\x0eT\xbe\xef\x5c\
-~t[Ws;\x19\xc2\xbe^u\xddd CP\
-%\x1d\x8a \xd7\x8b\xbd\xfe\xf2\xa5\xe3\xe5N\x0d\x98C\
-\xe5\xd7f\xd8\xeb\x82K1\x84\x84`.I\x81\xda\x0a\
-\xde\x04\x0d\xa5\xb5\x9b\xbeg\xeb\xb8\x9f\xdbma\xb8\x01\
-\x94\x22T\x98\x89N\x9a\xa1\x91\x07g0N\x0e\xe7G\
-\x97\xae\x1e.\xfapv+z?(6Cg@\xad\
-[(\xdeSm\x16u\x22GI\xa0\x0c4\x90\xb4A\
-\xb9\x22]\xc1\xbb\xe94\xa7\xa8\xb5in\xd4\x81FF\
-F\xde\xf5\x8c\x02\xd0\xc8\xc8\xc8\xc8\xc8}\x8c(\xa1\x00\
- \x82)\x0c\x91\xa2\x04\x5c\x85D\x0c\x01\x81}\xdf\xd3\
-\xb5\x9db\x8c\xf2\xa5\x90\xf1\xd1\xf7m\xfd\x93_|\xec\
-\xc3\xef\xddiq\xb5?8\xcc\xabyN\xa5\x8d M\
-\xd6\xf4\xb9\xad8\x8b\xf6\xe1\xc3\xb2\xfd7\xdf\xbe\xfe\x9f\
-\xfe\xea\x07\x7f\xf3\xed\xbd\xe7\xaea\xbfC\xce\x08\x05\x0d\
-w@\x16_\xe6\x92\xed+x\xe8<~\xe6\xa3\xf8\xec\
-'.\xfc\xc23\x0f\xbe\xef\x91\x8f\x84x ?\x88\xed\
-JX\xd5\xae\x06\x82\x81\xb9v\xb9\x7f94\xe1\xa9\xf7\
-\xc7g~v\xf6\xdc\x8b\xf1\xc6\xcb+\xa4UE[3\
-\x9cR `N\x10\xe6\x86JTs\x84\x82Pj\xf0\
-\x1a \x00>\x04\x22\xab\xd2\x9c\xd1Y\x9d\xc9`\xf0\x88\
-\x1aX\x02\x91i+@\xa6\x04\x989\xe8\x82\x1a\xa2\xa1\
-\xfb\x90\x1e\x83\xd2\xc1\x17p\xca\x83dB \xcaP+\
-\x07\xa2\x12Nqh8\xbe\x9e\xed\x0d\x1d\x9b\xd7\xa9\xc0\
-\x94Q\x0128$\xba\x12\xd4@\x84\x0cF\x9a*\xbb\
-LG8\xd3\x8b?xi\xef?\xfe\xc9\xa5o\xffP\
-s\xa2\x03\xe2t\x1d\xd9\x0a\x80\x18Z\x1d\x81\x0e7\xe4\
-\x84\x1a\x00\x81\x8e\xe8\x88\x15\x1a~\x0bC\xf0\xd8\x82\x01\
-\x87\x19+C\xbb\x05\x17\xae\xde\xb0\xa2G\xa6\xcdL\xdc\
-\x8f\xa1\x92\xd1\x8b\xa1\xda$5M\x0c\xdd\xc1\x8d\x94\x8f\
->\xfe\xcc\xee\xaf\xfc\xfc\xc5G/\x96X\xaf&/q\
-P\x7f\x0a\xbc\x87w\xc9\xfd\x0c\xd3\xc3\xf1\xcc#\xcb\xd8\
-|\xe7\xb9\x83\x7f\xf7g\xcf\xfe\xbb/\xbf\xf0\xbdK\xc8\
-\x05\xb9\x02\x16g\x93f\xa2P\xe6\xf3o\xac\xae\xed\xfc\
-\x0d\x1e{\x88\x1f|\xea\x89g>\xba\xf3\x99\x9f;\xff\
-\xa1\xa7\x1fmfq\xb5\x7f\xa8\xd8Y\xcd\xdd|\x15\xcc\
-\x00SWR3o\xe2\xb5\x0f>~\xe1\x17?\xd9\xfe\
-\xed\xb7\xf0\xfdk\xdd\xb4A\xf2\xad\xb9j\xad\x99&\x22\
-\x0c\x0d\xd6E\xc9\x96\x08\x02\x97\x1e{b#>\x0eM\
-\xd3<y\xdd\xf1\xb2\xac\xb5s\xf3\xd8\x983\xacJ\x16\
-\xbc\x9d\xb4mK\xe6U>\x9c\xdbr\xfe\xc4\x83\xf8\xd2\
-/6\xff\xf4\x1f\x9d\x7f\xfa\x91\xb8\xbaq\xb9\x1e\x1d\xee\
-lG\x0b\xad\xbaB\x0b\x0ci\xb9(\x9e\xce\xec\xee>\
-\xb8\xdf5\x7f\xf9\xe5\x17~\xf7w_\xf8\xfa7 \xdb\
-M\x93Y\xaf@\xf7D\xd1\xc5>F\xdb\x06<\x95\xa0\
-Q\xfay\xed\x1c\x8b)\x5c\x7fJ\xd6y\xc3\x22\x1c\x8f\
-\xed\x94\x0b3{\xf1:&\xe1\xd5\xd7D \x99_Y\
-\xa5K\xabd&w\xe8\x0dU\xe2\xf1xx\xa7\x9a\xc2\
-\xdfT)\xbb\xfe\xddp\xf1\x0da\xf9RT\x0d*\xc7\
-\x02\xd0q\xc3\xc3;l`]\x13\x068QM\xa2\x15\
-\xd1\x02;\xb3\x86\xea\xc0Z\xab\x1f\x1c\xce\xe7\xabm1\
-\x09\xacUq8V\x0e\xdd\xab\xfa\xb3\xde\xbe\x08\xae\xc3\
-\xd1\xe1C\x1f\x00\x12\x0e0\x0c\xf6\x22_m\xcf\xea\xa4\
-\x1d\xc5\xcc\x91\x91\x91\x915\xa3\x0042222r\
-\x1fC\xcaQ\x81\xa1\xe7/\x00\x9a\xc20\xad0H\x0c\
-.\xab\xde\x87\x8a\x14\x11\xbd\xaez\x5c\xd8\x0e?\xff\xcc\
-c\x9f\xfd\xf8\xf9\xb6\xfe\xa8\xce_\x0c>\x8f\xd1ck\
-C\xc3r\xf7\xd4\xe3\xc1\xdc<\xb9\xbf\xda\xfa\xf27\xf6\
-\xfe\xcd\x1f\xbd\xf4\x9f\xbf\xbawu\x05N\x91vbV\
-\x81\xb6\xce\xa5\x87B\x13\x8a\x0e\x96\xab\x83\xc3\xc3\xd5\xa5\
-\xcb\xf5Z\xc6\x0f\xae\x1c|\xff\xb9\xf8\xcf~\xe5\xe9O\
-}\xe0\xe1I\xbdR\x0e\x9f+\xfd\x8a\xd1\xact4\xc6\
-Y\x93\xd35\xf7K\xe7.L>\xf0\xa1\x0b\x8f|\xb9\
-\xfe\xe8j\x8d\xb1\x86f\xd2\x15v\xfd*\xb4`\xa4X\
-e\xee\x01n\xa8VaB\xca5\xf69 \x10\xb5\xc0\
-(\x9aW\xca\xc9\x12\x82\x9b\x13\x81j\xe1-\xbd1\xad\
-\xcc%3\xe3\x14h\xe9B\x15\xac\x01\x1aT\x87U\x06\
-G=\x82z\xa9Jq\xa8v3\xc0\x89\x12`@\x06\
-<x\xb2\xe2\xc79\x1f\x9b#\xbd\xf97\x01q\xd3p\
--\x00-0\x01\x02d\x10\xc1eU\xb7\xf2\x12S\xcc\
-\xd8\xde\xcbG?\xban?8\xac\xdcB\x89X-\xd6\
-\xce\x92aEA\x08\x15\xe6\x90\xa1/(\x01t\x84\x0a\
-\x13B\x8d\xa8m\xac-\x14\xa5\xa5\xf3\xd0\x12<\xa2\x18\
-\xb4\x18:#MR\xb3\xd3\xc3XW!tT(\x95\
-\xa8!\xa5dU\xe5h~q{\xf5\xa9\x9fy\xea3\
-?s\xfe\xdc\xf4\xc7\xec~l}\xb1\xb8\x9esz\xa1\
-|\xb7\xd9z?&\xef}a\x7f\xf5G_\xff\xd1\x7f\
-\xf8\xb3\x1f\xfd\xe9\xdf_~\xa1G7\xa1\x07\x03\xa6\x8c\
-\xd3.4[\xc6\xe4\x9d\xbb\x1d\xf4\xdd\xe2\x92=w\xe9\
-\xfa\xf7\x9f[\xee\xedO\xcb/\xf1\xa7?|a\xebL\
-\xcc\xf3\xe7\x1a[\xc4(\xf6\x15\xaaM\x03\xe9H{\x7f\
-wf\xf7\x81\x9f\xfdP\xfa\xd8S\xe1\xe5\x97j\xda\xf3\
-\x9dv7L\xe2\x0d\xeb]\xbd\x11\x18\x147sO\x87\
-\x8aG\xf0:d\xd7\xae\xe7\xd9\xc3\x977\xf0\x1d\x14\xba\
-\x1f\xd4\xa1\x8b7\x19C0Z\x1b\x11\xd5u\x87G<\
-Z<\xf5P\xfb\xeb_8\xff\xcf~\xe3\xcc\x87\x9eZ\
-\x94\x83\x1f1\x1f\xce&\x08\xb4z\x94\x89\xb6m\xb7\x17\
-\x0b\xafhv\xb6?\xb4X<\xfa\x95\xbf|\xf1\xf7~\
-\xe7\xb9\xbf\xf9F\xcc8\xdf\xb4\x0f\xf4\x1e\xdd:\xa23\
-yt\xc5\x1a\x84)d@\x07\xf6c\xd3\xa47\x01\xa1\
-V\xd6J{\xcd\xc72\x11W\xbbxe\x950t\xcc\
-{\x13\xe0&:\xea\x8e\xbf\x16\xe0\x04\xc0!\xc2=U\
-o\x5c\xc9\xb5\xe9\xb0\x05\xac\xdf\xb0\xfe\xf7d\xbd\xeb6\
-\xf0\xc2P<\xcb\xec*@\x11il\x84\x04\xf5d-\
-\x15\xd7\xae\xd7\xa3\x05\x10\x92SY\x08\x9b\x96\x80\x02\x82\
-\xbd\x81\x127\x0d\x1a\xd0\xa0?\x11\x1e\xc9L8`\x06\
-S\x15\xea\xc1\xee6\xa6\x93\xe8\xa3\x004222\x02\
-`\x14\x80FFFFF\xee{\xe8\xb2M\x89\xc2f\
-\x9ass\xf5\x03\x03e\xf2\xd2):>\xfc\xd4\xf6\xa7\
-\x9fy\xe4\xc2\x8e\xf5\xfb\x97\xcb\xea0D4m0C\
-\xeePj\xb0\xc9\x0e\xd2\x85\xab\xfb\xf5\xcb\x7f\xfb\x9d\xff\
-\xf1\x0f~\xfc\xe7\xdf\x98g\x9b^|h\x9a\x0d\x8b\xba\
-\x0aM\xd34\x13\xf4\x0b9c\xebgf\x93\xd9\xb9\x90\
-\xbbn\x95\xf3\xb7\x9f\xcb\xd7_\xb8\x14V\xab\x8b[\x1f\
-\x7f\xffcg\xe7}\x80\xea\xf6N\xac}-\xeea{\
-\xe2\xca\x07\x07\x99[z\xec\xd1\x07\xdf\xf7A|\xed\xd9\
-\x17\xf6\x8f\xfa\xb4\xd5O\xa7[\x16c\x15]\x04\x22d\
-P\x1d\xb2\x90\x87NO\xf4\x86^I\x99\xdc\x00S\xa0\
-\x1b\x00\x0c\x8d\xcfd\x9b\x00\xec\x00D\xa8\x81\x1b\xd8\x12\
--T\x80\x0aF \x9e\x0403AC\xc4rX\xa7\
-glz9\x13\x82\x83\x9e\x88\x08\x94\xe3#y\xaa\x04\
-e-N\x1c\x1f\xfa\xcd7Z?\xc9'\xcc\x10\xdd\xcc\
-\x82aB\x9b\x881\xa0\xb6\xdbAm\x132z\x1b&\
-\x95\x22d\xb2P\xc3\xb0\x93)\xaa\x10\x84\x82\xcb<P\
-S\xf8$\xd4\x09\x94\xa4U\xc54\xb4\xcb8\xebDu\
-\xd9K6\xe2L-\xa1_\xaeb\xf4\x18\xc3\xd0\xdc\xcc\
-\xccP\xba\xbe\xeb\x02\xba\xf7\xbdw\xfbc\x1f\xb9pa\
-\x17X\xcc\xf3\xbc\x98\x10\x87\xa1\x17 \x06\xda\xb4\xa4\xf3\
-\x87}\xfc\x93\xbf\xfa\xe6\xff\xfdw\xbe\xff\x8d\x172\xcf\
-\xc6\xb3\x0f\xb4\xfb\x19\xe2,\x85\xadZ\xa9\x9aK\xc9\x91\
-\x9a\xee\xcc\x92\xb6\xbc\xa2_\x96g\xaf\x1c\xad\xfe\xe7k\
-\xfb{q{{\xf7\x83\xef\xbb\xb8Z^\xef\xd4\xcd\xce\
-D\xacz\xa7s\x12\xfby9\xbc\xde\xb7\xe6\x0f_|\
-\xe4\xe3\x1f\xab\x7f\xf9\x8d\xe7_\xda\x9bO\xeb\x02I\xd1\
-c\x85\x9bS\xb6i\xb2\xae\x00\x06\x10d\x95\xc0\xb5\x8d\
-\x04\xa0\xe0\x06\x0d'\x17\x8e\x92s\x17\x1b\x9fM\xa7T\
-\xce\xdd2\xf7K\xeb\x16\x8f>\x80\x7f\xf4\xb9s\xbf\xfd\
-\xab\x1f\xfa\xe0\xe3\xf9\xf0\xca7\x177\x0e\xcf\xec\xa0i\
-\x99\x0fr^\xa9\xd9\xdaZ\x01\x9d\xb5\xd3\xad\x87\x97\xbe\
-\xf5\xe5\xaf\xfd\xe0\xdf\xfc\xbbo|\xf5\x1bW3\xb7g\
-\xb3Y\x1f\x94\xb1r+CA\xce\xc6J\x91%:\xeb\
-8Y~Ux\x9b\xefn\xc3Pq\xf5:y\xb3Z\
-\x96\xf3\xd47\xb7\xadU\xbb\xf3\x006\xbe!\xe9\xc4\xb5\
-w\xc7w\x13\x83\xa7\x88\x0a0\xc02\xcc\xc1\xaaR\xa4\
-\x02*\x17\x1e\xeck\xb9\x88f\x89l\xdd{\x85uL\
-\xbf\x91|3vv3^[\xff<\xd8\x9aJE\xbf\
-\xda\x9aM\xdbI\xf2\x13k\xd6\xc8\xc8\xc8\xc8\xbb\x9aQ\
-\x00\x1a\x19\x19\x19\x19\xb9_\xa1\xe8\xf4\x12\x8b\x08xJ\
-np@\x04}\x989\x0f\xdd\xae\xa2Y\x03G\xce\xbe\
-\xf2\x0bS|\xfa#\xbb\x1f}\xdcl\xf5R\xac\x07!\
-\xc2\x8c\xa4\xd7\x1e\xcb\x0e%nOg\x8f\x1d,/\xfe\
-\xc9W\x9f\xfb\xfd\xff\xfc\xc3\xbf\xfd\xce\xf2\xb0L\xa6\x0f\
-<\xd4n\x9f\xe9\x97]\xdf\x1f\xb2QJ%\xf0r)\
-\xa5S0cjc\x98\xa4~\x11\x16]\x9e\xef\xe5?\
-\xf8\xf3\xfdG\x1f\xba\xfa\x1b_|\xcf\x03\xbb\x17T\xaf\
-\xf6M\xf1\x88U\xbfJ\xa5\xcf\xa6e\xc5NHO\xbc\
-\xf7\x91\x9f\xfd\x85\x0b\x7f\xf6\xf7\x87?\xfa\xdb\xfd\xbe\xbb\
-\xc6\xa4\x18\x85\x02yC\xa7\x04\x14\xc1\x03\xd4J\xb2Z\
-\x02bR5[\x05\xef\x8ddi\xa2\xcfbU(\xc1\
-\x10(\xc2\x1bz+o\xe5C\x0c\xaa\x81[@#\xf4\
-\xae\x15\xd4\xb8f\x0e\xa7\x9c\xd5Y\xdc|e\xcaV[\
-s\xc9#\x85Pi\xee\x06\xc2My\x9b\xed\x04XR\
-f\x82I\xe6\x8c\x1a\xbav\x01*r\x8b^\x87_Q\
-\x15\xa8\xa0\xaa!@\x90\x820\x89\xf4\xd8D\x9f\x05n\
-\x05\x0b\x02\x96\xcbI\xd1Y\xb7F\x92\xab\x02\x85\x10+\
-\x1c4\x01\x8a\xca[\x8e\xc6\xb8\x10\x97r\x0e\xdaVg\
--0\x01[a'\xb3\x8b:\x02J\xef\x95T\x13\xb6\
-\x03&9\x17\xf3\x88\x0ay4\xa5h\xf4~\xbf,\x0e\
-.\x9c\xf1O\xfc\xd4\xd9\xa7\x9fp\xeb\x9f\xc3\xfcJ\xb3\
-BL\x90\xc3\x87\xca\xb2i\x83\xf6\xdc\xb5\xc5\xb9?\xf8\
-\xda\xb5\x7f\xf5_^\xf8\xe1\x8d\x1c\xce\x00[\xed\xaan\
-I1\x86\x89\x99Qn\x1e\x02\xab\x02{\xb3\x02\xb01\
-\xccf\xcbe\xf3\xc3\xbd\xab\xf8r\xff\xc8\x13\x87\xb3\xdd\
-\x87w\xd2\xa3\xa5\x1cF\x9f\xdbPC\xd3\xd7\x0a\xb0m\
-,\x9d;\xb3\xfb\xf8O}l\xf7\xbd\x7fqx\xf9k\
-\xdeUY\xe5$O\x0a\xa3\x82\xa9\x10%#w\xc8\xdb\
-\xf2\x09\xfc\xd0}\x01\x88\x0a\xa6\x16n\x08\x15h\xad6\
-V\x1b\x1a<\xac\x8a\x95\x14\xbc\x09!w\xab\xc5\xf5\xbd\
-X\xea\xd3\x0f\xe1\xf3\x9f\xde\xfa\xb5\xcf_x\xffCs\
-]\xfdq\xbd\xbe7i\xd86A]]-\x10'\xb3\
-\x12\xc3\x02e\xf2\xf0\xe3\xb9>\xf6\xe5\xaf\xec\xfd\xeb\xdf\
-\xff\xfb/\x7f\xeb\xea\xb2\xdd\x0a\xed\xceQX\xf6\xe1H\
-\x14\x07\xd1\x0e2W\x00\x82\xf7\x80g\xa6\x1e\x0d^}\
-\xe2\xff\xaeD\x80\xd6I\xf1\xa6\x8d>z\xdb\x0c \x01\
-Bk\x08\xe6\xafQ\x05\x12\xd0;\x1f\x9c\xe6G\xa6=\
-j\x0a\xe2:\xe6\xe6^X\xab\x87\xc0\xe9\x02\xb0M\x02\
-\xf4\x89@.\xd1\xfd\xe4K\x0eUzE\xae&#\xab\
-\xe0\x80\xdbz\x91\xdb:\x80\xb0\xce\x013C\xeb,n\
-sY\x86\xf7\x1ez\xa0\xa3\xa9\xb8-\xe6X.\x1a\xf7\
-\x89q\xe6*^E\xa3\xc17W\xe0=\xb1\x09{\x93\
-\x0d1o\x11L\x1b\x15\xd5!\x9aC\xa5k\x9b\xf8S\
-\x0fu_\x996\x0b\x9fL\xa24^\xd4###\xef\
-nF\x01hdddd\xe4\xfeF\xac\xbeqT@\
-\xa7\x1e\x02\xaf\x1f\xbf+\x18\x03\xe0}\x09^\xde\xf3p\
-x\xe6#\x17/\x9cm\xf2\xde\x95i\xa8\x88@\x96\x04\
-\x08\xa9\x9d\xd8\xe4lFz\xf6\x87W\xfe\xf0O\x9e\xff\
-\xdbo.k\x9a\xb4\xdbg\x8e:\x1c^_Y\x8c\xd3\
-\xads\x8c\xc5\xb0\xcf\xea.\xf4\xb9\x0a\xc8\xe6\x08\x11i\
-6\xddm\x92\xf5\x97n\xdc\xf8w\x7f\xf8\xa3G\x1eL\
-\xbf\xf5\xab\xe7\xbc\x9c]\xcco\xec\x9cI61\xef\xbd\
-\x99\x85\x90\xa48El/<x\xf6\xc1G\xce\xb4\xdf\
-\xd9_z\xae\xddR^\x10*H\xd0\x86\x8e\xe6`$\
-\x06_\x93Q\x0aN P\xc3\xbeqp\x09\x0d\x13\xb0\
-u\x00\x87\xb8\x99\x9c\x11\x0a@\x03D\xa0\x0c\xbb&Q\
-\x9b\xb7\xad\xa7\x94\x22\x81@\x8a6Dh@\x22\x8d\x0c\
-P\x80l\x88\xd6\xd0\xba\x22I\xe6\xa6\xf54\xb2f9\
-%\x0a\xe4\xda\xce3\xacN\x18\xc2\xb3Asy\xad\x0e\
-)\xa4\x88\x14Pl\xcb}V\x14\x5c\x00\x07\x01\xa8\x12\
-\xa2\xc3\x05)U\xcc\x84\xa9\xa8j\x15>l\x88\x1b\x0f\
-R\x14Pj\xed\xba@\xba\xbb%\x8a\xb0H\x22D \
-\xa9\xfap\x92\xa9Zs6\xd5'\x1e\xe3\xc7?\xfa\xc0\
-\x03gS^]Ou\xd1\x0e\xee\xa8\xc1\xe5DcL\
-H\xcd\xd5\xa3\xfc\xfb\x7f\xfc\xfd?\xfc\xda\xd1\xd9\xb3a\
-{\xc7^8\xecK{\xf6\xec\x85\x87\xe6\x87\x87\xf3\x83\
-y\xdb\xa6@\x063\x02E\xa8^k\xad=\xfa\x09x\
-q\xb6{\xfd\xe8\xe0\xdf\xfd\xc1\x8f\x1ey|\xe7\x1f}\
-\xeeL\xc4n\xdf-\xb7\xb7&T\x054\xdb\xde\x9dM\
-/\x88\xe7\xe6\xd9\xa6\xd3s\x17\x1fz\xf0\xccl>/\
-\x01\xf4 \x00\x5c[\xbd\xd6U7\x01J@\x10\x8cp\
-\xcaP\x03D\xc8A\x980\x5c\x03\xb0b1\x9a\xa1\xe4\
-~9?*\xa5>0\xc3\xa7?\xf1\xc0o|\xe9\x03\
-\x1f~\xff\xc4W?\xc0\xd1\xcb;;\x08\xd3\xa4U\xed\
-\x16\x8a\xc9R\xb2\x0ehv\xb6\xd06\xdf\xf8\xeb\x17~\
-\xe7\xdf~\xff\x8f\xbf|\xa5\x0f\xd3\xe9\xb9\x0bKb\xd1\
-\x1fU+!\x925\x0d2@\x12\x83\x14T\xc1\x5cO\
-}\x82Fn\xe5\xb5\xcb\x07\x14L\xcf\xed\xc5K\xf3\xd0\
-\x04\xbdF\x95#;\x1ek\xf2\xc5\xb6\x97\xb6\xde\x0ck\
-\xcc\xe95\xe8D\x00\xba\xf9\xd5[_\xa2\x8b\x0eh\xed\
-G\xb3\xe3\x04\xb0[\xf3\xaf\x8f\xe3{\x86\xa4j)\x00\
-Up\x87\x03E,4\xd1\x08\x86EW\x0e\x0ek\xdf\
-!\xb11\x06\xf7\x1c\x08\xb3{\x17\x7f\xee\xb0\xb3\x1b9\
-IkUJ\xee\xa9\xc5\x87\x1f\xcd\xe7\xa7\xb6\x7f\x80\xc9\
-8\xef\x19\x19\x19y\xd73\xde\x08GFFF\xde\x09\
-\xbc\x81\xa7\xa8\xf7=b\xd1:\xedF\x9b\x10\xd0\xb5\xd8\
-aC\x8c\x8d\x1c\x92j\xd9n\xf1\xe1\x0f\x9c{\xea\xc9\
-\xdd\x86\x87}>\xf0\x0c\x8b\x90\x80\x0a$\xb6\xd33\xde\
-\x9e\xff\xe1\xe5\xf9\x97\xbf\xfa\xc3g\x7f\xb8\xd7\xe7\x10\xdb\
-\xb3\x93\xf6\x02\x8c\xd9\xab\xe0\xf0E\xf0.\x954;z\
-:y\xd6\xe4\xb0\x0f9\xf7V0\xb1\xba\x9dt\xb6m\
-C=z\xfe\xbb?|\xf1/\xbf\xf2\xc2\xe7~\xf6\x99\
-\xc7.~4\xcf_0OM\xdcY\xd4\xd4\x1f\xa6#\
-\xf9\x8f_\xc6\xcb\x97\x97\xcf>\x7fx\xe5e\x0f\xd1B\
-0\xa4\xea\xa5::\xc0\xa9D\x98I\xe6N\xf4\xb0\x0c\
-.\x83h\xc5\xb4\xe9n\x03/\x09G\x09]\xb4\xccP\
-\x19\xc0Hx\x0b&\xa0\x02\xbd`\xc4\xbe\x18\xc4\x85\xac\
-\xc8\x1a\xa0E\x95\xe8n\xb0\xba\xe2ra\xa6\x10z\x9a\
-\xd1zx\x05\x86F:n\xa8\x86\xecNz\x84\x8cB\
-\x14\x9a\xe1\xe0\x0a@\x05B\x95\xaa\x94\xa4\xa0j\xc8@\
-^\xd7\x8b\x19i\x02\xe0\xb5\xa2\xec\xa9\x1e(/\xbdw\
-\x13\xa74\x0b\x9a\x97j\xee\x8cU(\x86\xdc\xa8\xc4\xaa\
- \x07B\xf4\xe4\x02m\x8ep\x9d,\x08p\x10\x8aB\
-\xf4\xd0(Dz\x06\xe7f\x9eB\x8cr\xe5\xac|\x84\
-B\x06\x83\xcf\xc8F\xa2\xe0d\xdd>\x83\x0f~`\xf6\
-\xf4\xd3h\x9bk\x9a\x1f\x04\x0e)#\x09u\x02\x04&\
- \xe1\xf9\xeb/\xfcO\x7fz\xfdk\xdf})C\x0a\
-M_&\xa8\x9a\xd48\xc9\x94\xc7\x88\xd0\x94B\xcfP\
-g bP\xb2\xd2\xa0H\x05\xa8S\xeb\x8a}\xf5\xf9\
-\xa3\xf7\xff\xcd\xd5\x8f\xfd\xec\x07\x1f\xbdpNG\xcfr\
-\xd2\x97<_-\x0b\xca\xc3\xcbk\x17~|\xc5~x\
-\xa5\xfb\xf6K\xfd\xf3G:\xdc\x99\xef\xe7\x1f\xb7\xb1\xce\
-\x98CeF\xe3HP\x17aV'V\xb6@\x97\x07\
-x\x11\x06KN\x07\xcb`\x8e\xe9\xe5\x98\x0ac\x07'\
-\x1b\x16\xf7\xe5Q\x8f\xe2\x8f=\x14>\xf3\xd1\xed/~\
-\xfe\xf1\x8f}t\xb2S_\xc8\xf3K1\x84\xb03C\
-A\xde_\x12\xb1=3\xc9\xbe\xec\x9a\xe6\xd0\xce\xff\xdd\
-\xd7\xaf\xfd\xfb\x7f\xff\x83?\xfc\xbb\xe5\x15\xc5v\xeb\xcc\
-\xaa)\xcb0_MK\x06\xa4H\xee\xc6\xb2\x1bU\xab\
-j\xc22\xc4\x0eV\xaa\xcah\xfdy\x13 `xn\
-/\xbe\xbc\x88\xbb\xb3\xf5k\xafRK\x05\x90\xe8\x0bs\
-f\x10\xc2`\xaf{3\x07t\x9b\xffK\xe8\xa67\xc0\
-\xcdsP\x0e\xca&#\x9cp\x83\x0f\xf22or\x00\
-\xe1xu>H\xc8\xc1j\xe3C\x8e\x18a\x94\xa3F\
-2Z\x03\x94\xc5\xaa\xec\x1f\x94\xc5\x91\x9dm\xa61\xac\
-T \x8aQ@\x85\x847\xac9j]\xffe\xc7\x02\
-\x10\x5c&\x91l\x92\xda-\x86\xf8\xae\xfd?\xe4\xc8\xc8\
-\xc8\xc8M\x8c\x02\xd0\xc8\xc8\xc8\xc8;\x84\xd3\x7f\xdd\xdf\
-\xa9i\xcb;\x0e\x03J\xb5,\xc2\xe9\xa2\x89A\x22\x05\
-\x93\x01\xb4\xc0Zs\x9fsc\xa4\xb4=\xb5\xf7\xbd\xe7\
-\x89\xdd\xed\xb6v/N\x1b\xb7\x1e\xd0:\x8b\xb4V\xd0\
-Y+^\xbc|\xf0\xf5o\xec\xed\x1d M'\x95g\
-\xdcg\xb4j,U\xd9\xf3\x1c~\xc8\xeeb\xbb|\xb8\
-\xb1R\xa7@\xc8\x85\xa1\xe4\xe4\xdd\x96\xfb6k\xda\x8a\
-\x17R\xb9\xf1\xc3\x1f\xee\x7f\xf3\xef\xaf>v\xf1\xe9I\
-\xcc?z\xf6j\xbfZ^\xbbR\x9e{\xbe{\xe1@\
-\xcf_\xea\x9e\x7f\xe9G/\x1f,\x8fPC\x9c\x82\x0e\
-d\x8b\x92W\xa0\x9a\x02@\x13(\x17+\x99\x89\x0aD\
-\x0e\xd3\xc0\xa1g\x97\x97\x84\x9cl\x15Y\x8d\x8e\x003\
- .\x1d\xc9P\x84\xc1\xea\xb3\xa0\x82\xc7\xce\x87tf\
-oE9\x8b\x07S,f\xb0\x88\x18\xf2\xba]<\xfd\
-8|\xc6T)\x05\x05\xf34\x94\x80E1J\x90k\
-\xe8\xd9\x03D)JQ\x88rS\x01\x0aX\x01\x12\xc6\
- \x08V\x15\x98g\x0dZC-*\xae\xa6\xd4\xa6\x09\
-\x1d(\xc1<\x0bn(\x8d\x97\xa4\x12T\x80\xd0\xd4\xe2\
-\x15H\x156G,5\xa0\xac\x03hY9\xcdl\x18\
-$\xac\x10\xd8R!\x97Z\x16MiR\x98U6\xf2\
-DF9E\xc5T\xcf\x9e\xe3{\x9f\xbax\xf6\x9c\x8a\
-\xbf\x18\xb1\x0c\x00\xdcP#\xb8\xc5\xd00V\xd8\xc1\x0f\
-^z\xf1?\xfe\x19\xae\x1e\x85\x8b\xe7\x93\x9b-\xfb&\
-\x85\x06]\x98_>\x88M\xdaa\xc3\xee\x10\xd638\
-\x80\x15\xbc\x90\xa5\x09L)\xd7rc\xd1O\xb6RU\
-\xff\xed\x17\xf6\xbe\xf9\xdcrw\xf7\x11\xcf\xd7\xaf]}\
-noou\xf5\xaa\xdf\xb8z\xf5\x07?>\xfc\xee\x8b\
-\xe5\xd2<_\xea\xbb\xab\xf5h/\x1c,\x12\x92!d\
-\xa0\x02\x9aV\xb9\xbc\x04\xd1|\xa2\xb2\x83\x00xp_\
-\x99\x0a\xac\xc02X\xc1\x1a\xedzJF\xeb\xdc\xa8\x10\
-\x97]Y\xce\xfb\x07vw\x9e\xf9\x99\x87\xff\xe9\x17\x9e\
-x\xe6\xe31\xf1\xd9\xb2\xfc\xee\x84\xb2J\x5c\xaf\x12-\
-\xec\x84\x10\xe9\x99\xd6\xab\xe9\xff\xf6\xb9\xbd\x7f\xf9;\x97\
-\xbf\xfa\xe5ef\xd3>x\xe1\xa86\xabzX\xa7G\
-\x9eP*Q\x08\xccR}\xa0\xf1\x1cU\x0d\xfb\x08/\
-#\xb8\x97\xba\xa9<zw\xdcE\xee\x8d\x93\xb41\xde\
-\xfc\xea\xb1\xa5F z\xb7U\xe6\xd4\x19\xb9\xa9\x94\xba\
-y\xf9\x0dC\x97?\xe6\xca\xaeX\xe9i\x80\xbdQ\x01\
-h\xa3\xaa\xdc\xd4K\x8c\xa7O\xab\xd6\xa6@n\xea\xc4\
-\x86\x06`\xb5\x06\xab&\x91C@\xd4\xa0\x01\xbdR\x00\
-\xd2z3\x83\xff\x90\xf2I\xa5gJ\x80\xb1\x0aN\x06\
-\x9a\x05\xa4\xd5bu\xb0\xdf/\x17~\xb6\x99\xc4\xb8U\
-\xbb\x0a\xcf\xa0P+\x5cx\x0d-\xd2n\x8f\x93\x83\xec\
-#9\x0c23b\xe8]_\x01\x1a#-\xd4fb\
-1R\x12\xc7kzdd\xe4]\xcf(\x00\x8d\x8c\x8c\
-\x8c\xbce\x9cN\x8cx\x93\xe7W\x02:\xa0\xd8\xd0\xca\
-\x85Q\x0c\xae\xa1\xdb\xf4+\xd9t\x9b~\xe5/\xee\xb3\
-?\x8eE\x01\x8ce\x0az\x10\xc9^\x94#\x00\xb5Z\
-\xa9&\xa05\xce\x22V\xe8\x97\x89\xe5\x81\x8b\xf6\xc8c\
-u\xd6\x1c\xe2h\x19CT\xa2(\x06\xa0\x02U\x02\x8f\
-\x96\x93\xef>\xbb\xf5\xfd\x97\xa6\xd7|9\x99\x90\xb1\xeb\
-\xf3\xc1j\xb5t\xcbM2kS\xf5\xad\x95\xe9\xb0\xdd\
-\x13\xbdg\x85<\x09\xa4<\x1cE\x16\x90\xde\x1ep\x1a\
-_\xec\xba\xdf\xff\xca\xcb\xd7}\x92WG\xdf\xf9\xeeK\
-\xd7\xaf.\xaf\x5c\xc6\x0b\x97p\x90\xad\xaf\xa9[\xb1\x07\
-\x9b\xdd\x09&\xad\xd7\x5cJa\x00i\x10\xa0 D\xa9\
-\x8a\x06\x1a\xe9\xa0Wz\x09!0F\x0f\x90\xc3\xdb\x5c\
-\x9aE\xf19W\x95\x13\xf3I\x05\xdb\x5cSqC\x0a\
-(\x95a\x15\xceU\xb6\xc1\x8f\xa89\xac\x92L`(\
-gR\x9fb^\x19\x16p\xe5\xdad\x17co\x04\xdd\
-\xe0\x0d(\xb2\x07W\xb0\xb9\x82\xc4*\xa0\x88\x86X\x09\
-\xa1\xc2*\xa0R\xd1\xb3\xcfPQ\xa8j\xa1\x16X\x89\
-\x12+\xe1 \xb2 \xb2O\xa1L\x1aLc5_Y\
-[M\xdedi\xa8\x85\x89R\xe3D\xa5\xbb\x0a\x80\xd2\
-\xa8j\x0e\x82\xe1,\xd0\xb9I0\x82\x01\xd6:\xa2\x04\
-\x93\xd1\xe8\xa0\xab\xba\xb9\xc5\xbe\x9d\xb6i\xea\xa5\xaaV\
-\x06\xe6@\xcfeV\xfd\xd1\xb3|\xdf\xc3<\x1b\x8au\
-\xa4\xa2\xcbI2@<\x12\x0c\xdc>\x5c\x9c\xfd\xde\x0b\
-\xf5\xe5\x83n\x85\xd0\xc4X\x15\xaa\x0a\x83\x89^\x05x\
-\xf0\x9a\xc1\x12SH\x96\x04w\xb9\xf7EE\x96`\x15\
-XY\xb0vg\x97\xd7\x0f\xbb?\xfc\x8b\xef]\xb9\xb6\
-\xdf\x1f=\xff\xe2\x8f\x9e\xbdr\xc5\xf7\x0f\xb0\xbfo\x97\
-.\x87\x1b+\xd6\xc0\xd2\x9a\xa6ML;S\xd6\xe4\x0a\
-\xd9je\xb6\x98M\x1e|\xc5i!\x15o\xc0\xf6M\
-\x19V\x00\xf7Zi\xa4\xb5\xb03\x05\x0f\xb8\xdfP\x15\
-\xeb\xc4\xf2$.n\x5c\xc4\xe2\xb3\xef\xb5\x7f\xf6s\xe9\
-\x97\x7f:\x9c\xdb:\xe8\xf7\xf7\xfaU\x13\x0a\x92\x8b\xec\
-\x18\x93\x1a\xe5h\x9c\x5c\x5c\xda\x13_\xfd\xde\xfe\xbf\xfa\
-\x0f\xcf\xff\xc5WW\xcby<wa\x8a\x86\xab\xf9\xaa\
--\x8e~\x9a\xb3\x02\x02\x94X\x96\x86+\x91%\xd2\x0d\
-+\xab\x01JPSn\x7f\xe7\x18\x01LpQ\xb0:\
-\xc4u\x17\x80\xe2P\x05)\xaa\xca\xe5d0\x03\x12:\
-\xfd\xc2{\x8f\xfe\xea)>w#1\x10\x83;q}\
-\x93=\x8eY\x1e2\xd5\x870d\x15\xc3G\x1f\xee\xdf\
-\xf3\xf0\xa2\xe6\x94m\x16X\xa9\xc5\xd0\xd7\xfcu\x0eT\
-\xeb\xff\xe3\xac\x8b\xb96/\xbbm\xee\xf2\x0e\x1b\xf4\x9f\
-L\x02l)\xd1\x9bP'\xd1C\x10\x02N\xe2\x99\x87\
-f\xf0\xc75a\xb7@\x81\x08\x84\x0c+\xaaN4\xad\
-\xa5w\x18X\x04\xf5\xc1\xfa\xa6&\xf8\xc1<v\xcb\x96\
-;\x19,\xb4\x8e\x14,\xd6\x1a\x05\x0f\xf7\xe4`\x15\xa0\
-PH\xa0D\x13\x89%\xac\x90\xd5\xbd\x85\xaa\x05\x08\xf0\
-\x9cc\x0d\xe7\xdb0\x89t\x970J@###\xef\
-vF\x01hddd\xe4\xad\xe7M.\xd8\x1aV\xb7\
-\x02\x96\x91\x00B\xa1\xc9\xa8\x0am\xac\xfb\x00\x80\xf0\x0e\
-\xfc\xbb\xd7\xcd9\xe9\xb7\x00\x02\x95Xz(R+\x96\
-\x1aW\x05B\x9d$\x9emm\xc5n\xd1\xa6\xfc\xd8\xe3\
-|\xf8\xc1\xcb\xdb\xe1(\xe7yU\x0d\xb1\xa9\xb9\x0b\x06\
-3$Pivc\xef\xe2\xd7\xbf=\xfb\xc1\xc1\xcb\x07\
-\xb3\xbe\x9f(\xea@\xeaC,MX\x02\xdea\x96m\
-VZ\x94xc\x98S\xb1*(G\xb9\xd9\x9cV\x89\
-\x9c\x93\xef[\x9ck\xfb\x85\xaf\x97\xdf\xfb\xe6\x0f<k\
-\xb5\xb2\xe5\xdc\xba\x95\x14c\x9c\xccB\x9c\x8585\x0b\
-5\xf4\xc2\x1c\x0d\xb9N\xf1!=\xcaSE\xaa\x1c\xb2\
-}\x08T w!\x1c$k\x19vW\xbd\x95\x8az\
-\xce\xeb\xb9y\xc8\xf3iW\xe3CY\x8fx\xaf\xe9\xea\
-\xf2\xb4\x1c:\x0d\xf2j\xed\xe1\xf4=\x9d\x9d\xd9\xd2^\
-\xebW\xa0\xeb\x8c{\xc9RX]\x08\xcb\x9d\xd6\x17\x11\
-/U\xf5\xf3zf\xbfv\xa9\xe9\xb6\x1ca\x9eT\xcf\
-2T\xf0:p\x04\xee\xd7\x10\xdcr\x152\x22\x91\x1c\
-P\xe8\x18z\xc92jo\xab\xcc\x9a\x19\xb3f\xd0\x02\
-\xe8\x85~H\xb6\x81\x90\x0d}\xe4\xa1\xa5}\xa6\xf9\xc4\
-\x8e\xd2\x94\xb6\x8d\xe8=;A\x01\xc1jcu7k\
-f\x12-\xcbV\xcb\xc9~\x17\x0f\xa9\xd6\xfc\xbc\xd5\x86\
-\xb0\xe0H5'\xf4\xad/\x83\x16\xa5v\x91n\xb4\xde\
-\x8b\xc7\xd6\xdb\xe9B\xecX\x1ax2\x95\xa4\xceX\xfb\
-\xfeL-\xef\xbb\xc0\x0f\x9c\xdb?\xafU\xedc\xa9\xdb\
-U\xab\x98\x0c\x0d\x89\xb9J\x15g\xcf\xdfx\xe4o~\
-X/\xe7\xc3E2C4\x1bZ\x98\x15\x8b\x12D\x0d\
-i=\xd6\x13\xbd\xd6Q<\x0dCr\xb0\x97)Dm\
-\x95\xca\x1a\xd2\xa5\x03\xff\x0f\x7fq\xf9?\x7f\xedZ\xc9\
-\xf5\xc6\xc1\xf4\xe0h)Y\x083\x0bS;\xdb\xc4\x90\
-,\x1a\xa0T\xe5\xd9\xe5\x83\xf5\xaa\xec7y\x11\x8f\x94\
-\xea\x9c\x93\x15M\xcd\x8b\xf0\xc3 \xa2\x81\x0c\xde\xa1\x22\
-\x98\xef\xaa\xbe\xaf/[\xf2\x83\x14\x93\x96\xbb\x8b}{\
-0\xd7_|\x7f\xf3\xbf\xfe\x95\xf2\xcb?\xfb\x83\xe9\xec\
-y-\x8e\xd0\xd7\xdc\xefz\xdde\xbb@\xd8+\xb5\x14\
-\xee\xd9\xd9\x8b\x8b\xc9\x13_\xfb\xde\xe4\xff\xf6{\xf3\xdf\
-\xff\x93bj\xb6\xcf\xc6\x85\x17-\x8f\x12\xacq\xd3r\
-\xab2\x15\x0en\x949xDS@\xa5d5Z\xdd\
-\xc94\xd8;\xf0f\xf1\xe6`\x0eVB!\x0f\xcaG\
->\xfe\x0d\xe1Vj\xad\xc8\x16\x10[\xd3D+\xfe\xea\
-O-\x1e\xdf\xea\xff\xfe\xd2d\xb9\xb5]bCw\x0a\
-t\x03dn\x83+\x88\x82\x19\x93\x19T\xbd\xf4\x8f]\
-\x98<\xf5\x88\xf79{\xb8\xd0 M\xb0\xe2\xa6%\xdf\
-=Qau#z\x04\xa8\x05l\xa8\x15\x05*L\x81\
-\xbd!;\x1aa\x87e\x16sN*\x01\x0c\xa7\x1eV\
-h\x9d5vs\x93\xad\xe3\x1d?i\xc1\xb5\x08D\xec\
-w\x1c\xde\x87.\x87\x15\x10V1u\xb3\xc2\x1e\xd7\xe7\
-\xb3\xd5\xd1\xd9pn\x05\x1e\x99e$:'\xd9\x1aj\
-\x15Un\xaf-\xdd\x15\x85Z\xcd\xe9!\xf4\xb3  \
-.\x10\xaakR\xb4#\xe5h\x1d\x83\xf7\xabn\x9a\xf9\
-\xf0t\xb6\xd3@\x1a\xdb\x80\x8d\x8c\x8c\x8c\x8c\x02\xd0\xc8\
-\xc8\xc8\xc8;\x05\xbe[\xff\xb8]\xeb'Co\x9eM\
-\xf5\x9b\x03\xeb\xca&@\x90\xbb\xa7\x84\x07.`{\xab\
-\xd2\xb3j\x16\x14\x19B4\xd0!0\x9a\x0b7\xf6\x17\
-W\xae\x1e-\xba\xac\x1d\xca\xe8\x05\xb6\xce\x0d\x96\xcb\xe5\
-\xd2\xf0\x98\x9e\x15\xc0\xfa\xf1\xb8D\xc8\xe0B\x01\xdd\xa2\
-\x89\xd6U.\x17\xfdj\xd5\xc3\x99bLi6\x9b\x04\
-\xc6P\x90X\x1b\x8b\xad\x89b^?\xa1\xdf\xec\xc7\xa9\
-i\xd5\xe9o\xb4\x9e\xad\xc96\xbd\x84\xb2y\x0ep\xab\
-B.^\x8fT\xbdv\x8bZ:\xa7A\xaa&\xd7\x9e\
-B\xa9:t\xcda+D\x11\x19\x8b#\xacT}%\
-t\xb5c@\xb2aGx\xda! @\x1a\x82\xa8\xd7\
-z\xce)\xaf\x025\xec\xf0\xda\xaepj\x86\xb8^\xb8\
-\x02@\x0a\x08\x93&\xc3U\xe7\xfd|\xb5\xea\x10\xb4\x1f\
-\x08\xe7\xd2\x1d\xa0y\xe9\xac\xcako\x12\xad*\xf4\xb9\
-\x1eU[A\xd9\xdc\xad6&\xa3\xa3zO\xf4\x8du\
-\xf2\xd5\xaa\xef 4\x09\x1e\x19\xb6\xa7L\x93\xaeS_\
-J\x02Dw\xc1\xa5ZK\x1bq\xf1\x5c\xbb31\xd6\
-\xec\xc5\xe1b\x08\x14P*\xacZ\x0bL\xc2\xf5\xfd\xfc\
-\xc2K\x87}\xf5\x10\x9aa\x97\xd6W\x0eq:vW\
-\xc2\xa6\x0b6\xb8N\xb9u#C\x8c\xb5z.u\x99\
-\xf3\xfe\xbc\x83j\x08\xc9\xad\x89\x13\x93\x8c\x98\xc4\xa6\xb5\
-\x98\x0c\x11\x844\x1ca\x0e\x852\xa4a\xe8\x5c\xb49\
-\x9a'\x87\x5c`\x80%zU\xdfgYqy\x8cl\
-\xcdj\xd7E\xce?\xf2\x81\xfe\xbf\xfa\xa7\x8f\xfe\xd2g\
-\xe3tz\xb9\xec\x1f\xf6\x9d\xab2D\xc4\x86\x08\xf2\x9c\
-\x95=Mv:\xed|\xe7{/\xff\xee\xef\xef\xff\xe9\
-_]\xebJ\xdc\xddj\xccj.r\xb9\xc1L\xc1\xc5\
-\xf5\xa7\x86\x02]\xeb\x22\xa3u\x91!\x9c\x08\xef\xca\xfb\
-\xc8\xeb`\xe3\xdf\xbc\xf5\x96+\x03DT\xb0HV\x9d\
-\x08q6\xfb\xf8\xc7\xd2\xc7\x9fi\xcbl\xbb\xc4\x96^\
-\xe5\x0c\x1eA\x04O&\x83\x04U\x98`\x11\x9e\x91\x17\
-5\xd7e\x95\xab\xb8\xaa\xfbj\xc81\xfb\x09\x8c\xff\xa6\
-\x91\x9f8\x86\xf4\xfa\x95\x98S\xeb\xa1\x00\x19oy\xc9\
-X\x1c\x87G\xddjU\x08C\x15\x00\x18\x1c\x82ho\
-\xa4\x11\xfc\xf1\xed\xe7\xa4\xba\xeb\xf8\xc3%\xc2\xcd\x04\xa2\
-mc\x1b\xc7h\xf3\x91\x91\x91\x11`\x14\x80FFF\
-F\xdeI\x9c\xe4<\xbck\xd8\xb4\xa6\xd2I\xf63\x08\
-\xd0`\x06\x07\x05\xf5\xb5tTm'x\xe8b\xb33\
-\x9b\xaa\xc8\x91\x01\x97\x07\x86\x00s8\xd0\xa4\x5cu\xed\
-\xda\xe5\x83\xfd#\xd6>0\xd8:[\x22BUC4\
-\x0f\x10\x86\xe9\x8c\xcc\x00\xac=\x14\x04\xe8\x88\x80\xc1U\
-\xbd\x00U\xaaSr:k$\x991\xc5\x10C\xca\x95\
-\xa8NU\xf3\x0c\x10\xac\xe0\xba\xe5\xd7\xe9\x1d:\x95\xe0\
-Dx\x03-#\xbbm\xeb\xa3\xd3\x82\x83\x04\xae\xb0\x5c\
-\xdb*\x8b\x9d\xaez\x7f)\xd9\xb5\x10\xb4m>1w\
-\xd2\x84\x0c\xb0.W\x08m\xad\xa9HV\x11\x03\x01\xab\
-{\x11\x07\x11\x0e\xe4I\x9d\xed\xb0\xd9\xa1\xd7\x1a\xa9\x02\
-j\xed\x08\x18\xca<h\xc7\x22\xd4f\x86%\x1c{\x95\
-@\xae\xbf@\x9e\x08D\xdcHp\x89\xb0\xb2\xec\xeb\x8b\
-\xbb\xf9\xeaC\xacW \xc3\xb5TX\xcc\xa5\xa1\xee\x04\
-\xd0\xa1\x810\x88\x82\xe4\xdd\x90\x9cR\xa0\xd5\xb0\xd6 \
-\x04\x17\xa1\x18\x87>aA\x11LZT\xf9\xd2-\xb4\
-\xc9'\xae\x0c\x1cVv\x83<\xe7\xde\xcf\xb6\xd3\x83\x17\
-\xcf\xb7\x13\xd6:\xf7\xd2\x01\xb0\x10Q\xa1>+\xc2v\
-\xa9\x14\xae\xed-\xaf\x5cZx\xdf\xc4\x04\x93N\x92Y\
-\x8e\xcb\x9e6\xe7\xf5\xd4YYg\xbaH.\xac\xcc\x18\
-\xcc\xa9\x12\xa3\x08\x05\xcb\x16\x19CS\x1d\xb5@\xc85\
-{\xc5J\x14\x8d0\x8f\xa6\x18\x82Ws9Y\x83X\
-\x87@\x15\x06\xa8\xd9\xc8z\x04\xc5\xa1c\x9d\xf7f\x87\
-1E\x0b\xcaG\xfd\xd4/\x7f\xea\xa7\xf4\xdf\xfcF\xfb\
-\xf9\xcf\xc5\xd9\x96\x95}\xeb\xfa\x194%=\xb4G\x15\
-G%\xd7h%mo\xad\xf4\x9e\xbf\xfd\x9a\xfe\xbf\x7f\
-\xf4\xec\x1f}y9\x9fc\xe7\xcc\xcc\xcc\xfa<\x14\x1f\
-\x99\x10\xb3\xcc!\xa8\xc8\xd6aQ\x9b\x1d\x0d\x82*\xe1\
-\xa6W\xec\xfd\xc8i\x06g\x8co$\xb3\x9b\xee\xb9\x0c\
-\x0c\x16 V/9/\xc8\x96lC\xd8\x11m\xb9:\
-*8\x08\x00\xaa\x19\x8d\x16Lf\x16M\xc8}\xa7Z\
-\xdb\x18I/\xde\xc9\xfbI\x02\xa8R2s\xa1\x1c\xbc\
-\xe7\x8c\x9c\xdb\xe2\xb8U\xbb\xda(\xce\xf4\xcdm\xed\xde\
-\x18j\xe1\xdcQ\xc4\x0a\xda\x90\xc4\x1f\x18Ttxx\
-0\xef\x96b\x84GU\x10r/d\x88\x0c\xd0\xbdZ\
-\x9c\xd6\xf7~\x9d~\x01(D1U\x1661\xc2,\
-\xa6\x14\x137;>222\xf2\xaef\x14\x80FF\
-FFF\xeec\x8e\xe7\xeck!\x08'?\xae{\xa6\
-\xbbC\x0e\xaf\xed\x04\x17\x1e\xd8\x99\xb5M]\x1cRn\
-\xc6\xe2\x1e\x82l\x98\x14\xa4\x94{\xbf\xb1\xb7\x7fp\xb4\
-\x02C\x8a6\x14\xd0\xad;\xafk#/i(\x8e\x11\
-\x86\xe6\xea\x1b\xbdI\x10a\x82\x97\x5c\x1d\x9eB\x0a)\
-\x81\x94\x5c\xae\xbe\xf7\xce;Y\xa4\xc5W\xd4\xff\xdd1\
-\x93b\xd88\x01\xa3\x82\xebX\x14\x82\xd5\xe9\xcc\xde\xf7\
-\xa4\xfd\xdc3\xdc\xcf\xb38\x9d\x05\xe3\xac\xcf\x13w\x07\
-M*L\x87i\xd63\x85\xc2\xd0SV\x19\x97\x00P\
-\xa6\xb1\xc4T+\xfb\xc3\x0f>\x8d\xad\xa6\xb1\xb2Z'\
-?\xb9@'\x1d\x04\x86\x14\xd5;(\x00\xc3\x91\x18\xfa\
-\x91qm\x05\xe2\xa6\xcb<\x09\xa0\xa8T\xe4\xc3#Y\
-\xfb\xc8\xf9\xf6\x17>\xf5\xc0\x93O\xb65\xb5!e\x8f\
-\x99C>\xab\x07\xd4DE\xb1\xc0:I`CD\xac\
-e\x09\x83hB\x90\xafMV\x12DnM\xf6{}\
-\xe3\xfb/>\x7fe\x91\x17}\xc5V\x8cF,\x1c\x0e\
-\x1a\x01Wn\xa7\xed\x85\x0b\xe7&\x93#\xd5\xcek5\
-\xd2\x02\x86*\x1b\x18\x90B\xa9\xf5\xfa\xf5\xfe\xfa\x0d\xab\
-\xd5B{S\xee\x95^m\xe6K\xd2\xddk\xe9S\x08\
-M\x13C0\xa9\xba\xfaRkqw\xaf@$\xb9\x09\
-\x01\xf6\xcdR\x22ET\x18\xdd\xe1\x9b\x04\xae\x8d\x05\x87\
- \x10\x81*\xad\xc0\x16\x08H1Xc\xc8e~\xd8\
-ws\x7f\xff\xc5\xe6\xb7\xff\xc9\x07\xbe\xf8\xf9\xb8\xd3^\
-Y\xdd8\xb4\xd2G\xb6\xe44Dx<Z\xce;V\
-4\xdb\xc0\xf6l~\x85_\xfb\xdb\xcb\x7f\xfc\xa7\xcb\xab\
-\x87\x9c\x9d\x8b\x1d\xadV\x04\x1b\x94\xbb\x08\xd8\xba\x03=\
-\x8f/C\x1f\xc6y\x1c\x03N\xc2\xf9F< \xef\x1e\
-\x86k\x93\xc7\x09;\x02H\xd2\x18\xdc Uy-\x9d\
-W\xa5\x8a\x1a\xbc\xe7AUv\x19`\xa0\x05\x18\x10h\
-!\x00\x9e{\xaf\x0a5\x86(\xb1\x10\x85\xc35\xef\x80\
-C\xb4\xfb\xe4th\xf8\x04\x09\x0e\xf3\xa1/\xfc \x12\
-\x9b\x19\x80\xc3\xc3\xa3\xe5j\x05\x9b\xc0\x0c\x83\x84\xe6\x95\
-\x00\xcc\xb0\xbe\xbf\xbd\xce\x1d\xa5n\xbd\x9dj\xed\xdc\xe3\
-\xda\xcd'2@jb\x9c$\x1a\xfa{\xc8R\x1a\x19\
-\x19\x19y\x871\x0a@#####\xf75\xb7\xfe\
-=\xbf\x0e+U\x01\x04/\x94\x1b*Q\xa6\x0dw\xb7\
-\xb6\xa2\xa9\xf6\xf3\x08gL\xbd\xd1\x19bu\xd0\xa3\xc5\
-.\xd7k\xfb\xf3E\x87\xd0L\x90\xbc\xb0\xaek\x136\
-\x85\x05\x94qh\x9b\x03\x9c\xaa\xe0Y\x0b3\x82@\x8b\
-\xb1\x05`\x16\x1c&\x97D\xb9\x0f\x06\x22bx\xc0^\
-\xe1\x8e\xdb\xb4\xbd\xe1\xe9z0\x01\x82\xcb2\xe9VB\
-\xa8\xc6ZQ\x1c&4\xf1\xec\xee\xce\x17>;\xf9\xd0\
-Gj\x0d\xbb\x953I\xad/\xd2:+\xa4:\xd5\x05\
-\x15\xc0UY\xab\x9b\xc0\x22E\x94\xd6|\x12U\x93\xec\
-\xccty~\xfbz]\xcd\xe3\xba\xa0MN\x17Lj\
-LC\xb3\xb1\xdb0\xd8\x06,\xdcy\x12U\x81\x02:\
-\xd8w\xd3\xc9\xc1G\x9f\xda~\xf4\x81\xad^\xbb\x85S\
-`nqI\x0a2y\x84O\xa1\xc6\xc3\xd2\xc3\x0d\xc0\
-C\x89\xe6\xcd\xa9F\xce\x83\x8e\x22\x02.w\x99\xa5\xed\
-0{\xf0{/\x15\xfe\xfe\xfe\xf5\xeb\xd7\xf7\xfb\xab!\
-\xd5\xc8$\xf4\x15\x8a\x81A\xa2\xea4\xda\xceV3\xb1\
-\x8aU\x8e\xb52\x06x\x85\x0c\x8c\xb4\x00\xa4E\xc7\xab\
-\x87y\x9e}\xb0t\xbd>\x04\x92\x8c\xa8\xa6\xe2C\xfb\
-\x22\x07\xe02\x1b\x04\x14\x99\xaf\xc50\x18M\xa1J\x12\
-2X\x1c\xa9\x22:\xe5T\xa5\x86\x89/\x15\xa9\x00\x18\
-\x02%(W\xb83\x10\xec\xe1G\xb9\xcb\xcb\xc5\xea#\
-\xef\xc1\x17\xbf\xb4\xfb\x1b\xbfp\xf6\x91\xadk\xf9\xea\x0d\
--\x17\xd3\x19\xbdRya)\x90\x96\x12\x98\xe0\x06\xf5\
-\xb5\x12\xed\xd6\xa4i\x0dG\x0e\xd1ed\x10\x09\x04 \
-\xc2\x8d\x82\xe0\x90(\xdf\xa8?\xeb\x0e\xdar\x0e\xd2\xcf\
-\x1d\xc5\xbf\x11\xe0T\xa9\xe6\xf1\xad\x81\x83iF\x0e\xaf\
-\xa29\x8d1\x04\x92%@\xa5\x96\xbcD\xf16UE\
-\x98\x0b\xaa\x90\x13$*+\x09 8\x8d!d\x12\x94\
-\x03\x18\xba\xfe\xd9q:\xf4\xfd\xc0\xb1\x18\xb3\xd6\x88}\
-][*E\x9a)\xc6\xa3e\x7f\xb8\xc8n[\xb0\xc8\
-M^\xd8\xb1\xf5\xe8M\xf3\xe6p\xa8\x99\x15e\x90C\
-D\xa9\x91\x88\xc1\xc4\xfb\xad\xcd\xc1\xc8\xc8\xc8\xc8O\x80\
-Q\x00\x1a\x19\x19\x19\x19\xb9\xdf\xb9\x93Y\xa5\xc2}(\
-7J\x86Y\x9bfM\xa4\x17\xd5\x95\xd1\x99&\x16Z\
-\xa9\xd4\xda\x19\x1c\xe4\xaa\xaf\x07\x87\xcbUN\x16'\xd5\
-\xb2^\xd9\x80y\xed\x03\xda\x08@\xb7N&\x08\x22\xa4\
-\xc6dU*\xd5k\x95\x042\xc4\xd0X\x88Tvu\
-\x18\x94\xa9WA\x80\x09\x10\xb3 S\xd3 \xa0f\xd4\
-\x1e\x15\x9a\xf7\xd6.\x9fz`\xf2\xd4\xe3\xdbHA\xbe\
-ty\xe0\x12\x9c\x83+\xa0\x0c5p\x22\x0a\x5c\x92\x8c\
-\x15TM\xa8+Z\x1b\x10\x12M\xdd*/\xae[\xa9\
-\xb6\x8e\xe2\x00(W\x90\x1aS\x00\xc2\xb1\x81\xe5\xf5\x1c\
-p\x0d\xdd\x8ab\x02\x92\xcb\x0f\xce7\x8b\x07\x1e\xb9\x80\
-\xd9\x0c\xee\xe8\x0f\x10\xe6\x000\xac_\x0b\xa0E\x5c\xd4\
-t5\xc8\xb1\x8a(i\xdd\x96\xfe\xa6\xe3\xe3@\x04&\
-H\xc4v\x8eV.n\xe5\x89\xd4s\xa9\xd42\xa4\xa5\
-g\xb9H@9\x18f\x13N\x1b&\xd6P\x0b\x80\x00\
-\x87\x1c\x8a\xb0\x00\x00\x1e\x0f\x97\xd8[\xd52\xb4B\x22\
-\xef\xba\x9b\xb7\xc1\x8c\x16\xadT\xefJWs\xa5\xc1\x88\
-\xc8 Fcr\xc1\x1d$a4BFW\x06zW\
-\xef\x90\xb3\x15\x06\xb7\xd4`m\x22\x15\xa1\x08\x1ad@\
-a\x22\x13\x1cR\xbf\x82\x1f\x10\xe7\x1e{\x04\x8f<4\
-\xfd\xcd/^|\xe8\xcc\xb5\xd5\xde\xf7b\xe9\x9b\x08\x9a\
-\x0c\xa5\xd6Z\xfa\x0cv\xcd\x0c \xfa%\xca\xaao\xb7\
-.|\xf4\xa7\x9f\xfe\xe4\x8f\xd2\xe5?y\xf6\xa5\x83\x82\
-\xb3!\xc6(\x11\x8cT\x14\x8dt\xd3\xe0\xc2\xd2\xa9\xaf\
-\xa1\xc4o\x88\x89\xa7F\x05\xe85q\xabf1\x88\x1f\
-\xaa.\xc1,\xc4\xc0\x18\xa3\x22K\x11 \x8bC\xe1\xa8\
-\x8e]*@]\x87\x099\xb4\x11\xe2\xa2\x9d\xe8K!\
-A\x01|#\x01\xd0o-\xa7\x0f\xc7\xf1'\xd9A2\
-0\xc4U_\x0f\x179;\x1b\x8b \xe8\x08C\xfd%\
-\x1do\xa4\xec\xecV\x1c\xc8\x9b\xc2Z\xca]\x9d\x9b\xf0\
-\xb1G\xe3\x1fl\xf5\x87\x05\xd3\xf4\xa6nmddd\
-\xe4~c\x14\x80FFFFF\xeewn\x9bi\xba\
-\x8e\x07\x1aJ\x0bB\xb4\xd9\xb4I)\x18{\x83\x00\xa7\
-!\xc6X\x8b\x9ck+\xc8\xaa/\x8bU\xae\x9e61\
-(\xb7\xd9\xc0\x9d\x9f \xafE\xa1R@9HZ0\
-\x86\xf5\x5c\x9a\x01CW/\x1d\xcbF\xaf\xd4\x8f\x8e\x07\
-\xce\xe3\xef6/:\x5c \xd1N\x00\xa2\xa2.W*\
-B\xa9\x92W\x15\x90\xd5\xaa\xb1\x90\x82\x13\xf2j\xd5\x01\
-\xd7\x90X\x22\x01\xb5finVdV\x9d\xa1\xe6\xe0\
-q\x10\x996>\x86\x02T\xa8\x8a\xad\x86\x1d\xbdc\xac\
-8\xc9u\x09\xd8M5x\x02j\x83\xdcbZ\x10:\
-/\x9e\xfb\x12\xcb<\xd6\xd6\xab\xd5\xfe\x10\x9c\x13\x82\x22\
-\xd1@\x8d,\xd7\xb8\xac\xcd*HmW\xa0\xfe\xc4\x0d\
-prP\x1d\x08\xd9\xf2\xaaO\xe4\xceQ\x9f\xe6\x19\xcb\
-\x0ao\x9b\x12\xb6]\x90\xdc\xe8B)\xa5\x84\x80\xd9\x16\
-\x9a\xa8@\x9a\xa1`\x90x\x86=\x89\x92\xe8\x5cv\x5c\
-t.\xc8l\xbd\x13x\x0d\xc5_\xa7\xcf\xb3\x8b\x00\xc5\
-h\xd1\x02\x87\x88\x13\x83\x98\x8b 3\x18\x146\xa6\x0d\
-\x1f\xaa`\xd6Ua\x06m\xe4&;\xd9KBa\xed\
-\xfdi\x0d\x0dQ\xaa2\xe8\xddl\xc2O~bwb\
-~!Y\x7f\xf5\xc8\xdd\xda&@^V\x8a3\xc6\xa6\
-t\xf3\x8c\x0e\x81A\x10\x8a\x07j2[>\xfd\x9e3\
-?\xf73\xb3\x1f\xbdhG\xcf\xd6Ce\xca\x86R\x19\
-\x22\x00\x10\x87\xba\xc5 Tn\xd4\x88\xe3K\xef\xb8\xca\
-p\x14\x80^\x1b\xa7\x0f\x95\x18\x08\x18\xaa\xbb\xbb{\xcf\
-\x10i\x00,\xd8`\xfe3\xc8\xe5\xa0\x00\xe7\xf1\xa1\x06\
- X\x95\xd1e\x14\xddaB\xd5p\x89\x9c\xb8\x0c\xef\
-\x87S\xb2\xd9)\x1d\xdf\xc8\xd6Y\xf1\x81\x16bW\xba\
-\x83\xa3\xdc\xad|k\x1a\x11AG@\xac\x84\xbb\xdb\x1b\
-p9\xbdbI\x01\x15\x1c4t\xb9W\x80\xb1\xb1\x8f\
-?\x89\x8b\xdb~\xe5\x0ag\xe9]\x98\x957222\
-r\xc2(\x00\x8d\x8c\x8c\x8c\x8c\xdc\xcf\x08\xc7\x0f{\x8f\
-_[W\xe3@`\x8dt\x877\xc1&\x93\xd4\x04\xa4\
-\x88\x98\x8c^Qs\x0d\xe8+\xe4\x8a\x91\xa0\xf5\x85\xd9\
-\x89`\x05C\xf1\x16\xa5uO\x1c[w\xad\x19\x82\x85\
-6\x92\x896[[\xc7\x00\x11\x80W\x80N\x06Z0\
-R\xa2W\xcf\x22+\xcd`\xf4\xa0\xcd\xac\x8eC\x01\x0e\
-OR\xa0\xd7\xbdl\xb8NbYK\x0dDqd\xc9\
-\x88v\xc6\xd8\x02\x85\xb9G\xc9\xe8\x96\xde\xf51\x92\xc9\
-\xc8@\x1a\x94\x00I%\xd6\xaaMi\x0f\x22(\xd4\xea\
-\x85\xcb\x10{ZPu\xab\x0a\x96\x88\x16\xa8@ E\
-v\x15R\x15i\xba{\x10,\xc1\xdb\xd7\xa5\x18\xfc\x01\
-tg\xa4kDo@\x12Y;\xcc\xf7\xe8!\xfaJ\
-\xbe\x82cci\x90Y\x09M?\xec\xb7\xb3\xd2\xeaz\
-f\xb6QG\x9cp0\xb0d\xf4\xf3j\xc2\xb9#\xdb\
-\xddw;$\xfa4\xed\xc2\x19/u\x9b9ZWj\
-\xe9\xfa~\x16\xb0=\x8b)8\x13\x11\x18\xab,\x09\x09\
-\x10\x95U\xe9\x91\x93\x82\xd9\xaa\xab]O%\xd9\xd09\
-\xef\xd4\xbej\x1d r\xc7\xe9\xa8\xbb\x8a\x04\x9a\xc5\x14\
-\x8cC\x80\xd4\xd0\xc2\xab\x8aA\x81\x96\x00\xb8\x5c\x1bk\
-\x03\x0d\xd1h\x067/\xda\xf4I\x12\x82c#\xc0E\
-UB\x06\x0e%b\x08\x01\x0c\xab\x86\x87O<vn\
-\xda\x95\xb8w\x03P\x93v\xa0\x83b\x1d\x03\xa0\xe2<\
-\x8a\xad\xb0L\x9c7\xb4\x9aBV\xe8k\xf9\xde\xcet\
-\xef\x93\x1fm\xaf]\xbf\xf8\xe3\xc5\xcb\x7f\xfb\xd2\x1c\x13\
-4\xa1\xf1A\x89\x94\x8b0\x18\xe4&\x11.\xb8\xe8\x10\
-d\xactG\x14,\xba\xc2\xeb\x90\xc4\xde=h\xf3i\
-\xdd\xd4/\x01k\xe1s\xdd\xa8\x8b$\x18\xd7\x19>U\
-\x05\xb5@F\x06\x83X7\x85\x8dN\xc8N_c\x16\
-\x03,\x10\x22\x5c\xaa\x94C\x15u\xb3\x89\xfbD\x90\x13\
-4\xe8ZQNw\xa3G)\x0f\x81a\xa0\x18\xba\x1e\
-G\xcb\xba,\x1a2\xad\xdd\xc1h,\xee\x9ei\xf7\xd0\
-\x05\x1e\x10Lku\x13\x00\x9c\x0a\xc3\x9d8C\x14Z\
-2\xacs\xd5\x93YS`\x05Jo\xeaN\x8f\x8c\x8c\
-\x8c\xdc\x7f\x8c=\x11GFFFF\xdey\x0c%M\
-C\x97)\xc8\x1dD\x8a1\xc5\x18\x831\x1a\x08\xd5R\
-K\xad\xb5nf\xba\x94 \xd9\xd0\xa8\xfb\xe6\xba \x1e\
-\xbba\xb8\xee\x91|\x07\xff\xceZK\x08\xa4\xc9UK\
--\xa5J2r\xc8=\x95|S}\xe3\xd01\x18\xbe\
-n\x85XO/\x031\xf40\xf6\xac\x9aK\xe9z\xcf\
-\xa0[@0\x0f\xf4 qmu\xb2!\xff\xd4\xc4\x00\
-\x041\xb8\x85\x1a\xcc\xcd\x14\x82\xcc@\x93L\x15\xaa\xa8\
-B\x05\xaa\xa0\x8d5\x89r\x0e\x22\xc8&\x9c\xe3\xce2\
-\xc0P\xc8r2m\x13D\xaa\x9dx\x8a%\xf7\xa5V\
-\x12\xa1!\xa3\x84\x0c\xe5\xf5\x0cx}\x18\x87B\xa8M\
-\x09\x12\x87@\x9e \x06\xd1D\x1bfv\xd8\xf4N\x0f\
-\x1cZ\xb0\x0dA>4G\x83\xd8 \x05\x04\x92\xa0\xaa\
-{\xadNb\xd2\xa6\x98\x22\x02\x07a\xc7\x1d\xe0\x10\xcf\
-=\xfc`\xb4P*\xfar\xaf\xfa\x06O\xf6\xa0\x16U\
-\x97\x04\xaf\xee\x15\x81\xd1\x98N\x0ax\x04\xd5AN\x1a\
-.*s\x9c\xfc\xd95\x1c7J\x83\x85\xca,Z\x8c\
-\x04\x90\x87Hk@\xaa\xfd\x92\xdeGT\x9a3Ee\
-\xe4\xa5\xd0\x84\xb0m\xcb\x95\xe6\x87\x82!\xc4\x006\xb4\
-\x10\x9d\xca\xa5_\xdc\x88<|\xfa\x893\xbf\xfc\xe9\xa7\
-?\xf6\xbes\x11\xca\xab\xceP\x0cY\xb5\x08.\xa9\xb8\
-K\xf7M\xb2\xcc\xdb\x92\xdb\x1f:I\x90C0\xa3\x05\
-\x06\x0e\x09\xc8>DpCD\xe5:\xe3|\xfd\x15\xc0\
-\x00\x06TZ\xa9,\x15E\xeb\x1aSm\xde\xf3\xfa\x83\
-\xaa\xde\x08oX\xf5\x1b\xa4\xf0\xe3\xa04\x1c[\x81$\
-\xe4\xc2\xf9\xa2,\xbb\x82@\x18\xfdX\xbb\x97\xbf9\xd9\
-<\xbae5\xd2:s\xdd\x10m6U\x0ak\xcf\xdb\
-\xc8\xc8\xc8\xc8\xbb\x99\xd1\x014222\xf2\x0e\x83\x90\
-\xaf+\x08N\xcf\x1d\xf4\x8ao\xde\xb1l\x1a0\x11$\
-%\xe4R*+\x8d\x16\x98s\x09\xf2`PU\xa5\x9b\
-\xc5&\xb4\xe4\x0a\x92h\xd5\x87\xf4\x1c\xd3\xf14~\x0d\
-\x013\xf1\x15\x0f\xffo\x81\x82\x5c\xa0\xbb\x91\xc5\x9d\x8e\
-\xd4$\x8b!\xe7ZJ\x17C\x86(\x1f\xb4\xa6\xd3\x03\
-\x06n\xdd\xe2\xda\x1b\x02\x00\xa1\x22\x0e\x1a\xcdJ\xec\xb3\
-y\x95B(ft`\xf0*9(\x0e\xad\xa5\x10\xc0\
-uN3#\xbcE1G\x90\x81\x86\xaa\x0a\xcf\xaaf\
-\xb0\xc0\x04\x87\xabr\xe8\xffeZ\x17L\x9dX\x93\xee\
-|\x849LS\xb1\xeePt\xdcf+\x1e\xfatY\
-|\xa5\x16%\x82\xc1U\x11BE\xf6Zs\x8c0\x01\
-n\x90\x09&Z%\x8b\x01@\xdbOB\x9d\xc0\x1c,\
-\x18\x82{\xe0d\x05\x1d!DMfe\xaa\x10&\x0b\
-\xedf\x9c\xcd\xf0%k\x09G\xb5\xaf\x8d;=\x98\xc5\
-\x90j\xe9j\xad\xc9\x8cY\x10\x18\xa1*\xe4\x0c\x0f\xb0\
-\x86\x81\x18\xc2\xb9\x09\x0bzE\xc2\xd3k\xba\xb4\x08\x0b\
-h\xdcA\x15\xf7b)Z\x88\xa5\xf6(\x08\xd10\xf8\
-\x1a\x00\xca\x04\xc2\xe2q\x15\x8c\x14\x04:|3G\x86\
-mt\xc0\x8d\x09\xcc\xe0AV\xd6\xd7\x82\x10Q\xd5\x1f\
-\xa8\x0a!@\xb9\xcf\xb9\xc4i\x08\xea}Y\x13\x93\x05\
-\x95Z:\x99\x1b-\xa0\xd6@M\xa1\xb0\xdc3|\xef\
-C\x0f<\xf6[\x9fy\xcfw^\xf2o|\xef \xd6\
-\xb9\xc5\xb0R1n\xbbb\x9f\x0b\x93\x05\xde\xaa\xf2\x11\
-\xd8\x08\x13c\xb7\xec;\xc1\x93\xdb\xcb\xad\xaf\x1f\xd7\x9b\
-j\xdd\x0c\x1d\xb0\xb5\x88[\x81\xc1\x9d\x17\xd6\x9f,\xde\
-\xf2a\x17\x8e\x83\x97\x8eU\xd1\x93\xaf\xb7(\x04\xe8\x8d\
-;\x8d\x04\x03t\xca\xcd3\xa8?\x14\x0c\x16\x9d\xe1\xc6\
-\xe1\xe2\xda\xc1\xea\xfdOL\xe0\x01}\x81\x867\xdf=\
-q\xec\xb5cP\x80\x1c\x81\x10P\xe4E\xee\x0e\x01\xcc\
-;\xdb>i\x86\xb0!\x1b/\xef\x91\x91\x91w3\xa3\
-\x004222\xf2Na\xfd\xf7\xfb\xc6Ur\xd3\xf4\
-b\xfdx\x1aC\x01\xca;\xf3\xe1\xff\xf1dV'\xaf\
-\x18Q\x05\xc8\xdd\xdd\xab\xab\xe6\xd2\xa3\xe4\x00\x00t\x81\
-\x0c!\x04hh\x1a<\xa4\xb8\x92\x0cP\xd1`\xf7!\
-\xe8\xc3\xaf\xd6}\xcf\x8f+\x84n\x97\x13\xc4&E\x01\
-ri\x08_\x09Fc-\xa5[\xad\xc0\xbe\x89Cg\
-\x9c\xe3\x09\xa0q\xe3)\xda\x14\x7f\xad\x11 \x91\xeb\xc9\
-\x94\x03k+\x80B\x8d\x06\x140:\x04\x04\x90\x16,\
-B\xd19\xcc{D\x05\x0a\x90\x03-|\x8a\x12\x8cf\
-)\xb8\x09\xc8\x92\x19\x14\xcc\x88\x80*\xc8\xc1\xacu\xa6\
-\x8f\xd66\xa7\xd3\xae\xa7\x9bY\x1b\x8d\xb8\xb6'\xd9\xb0\
-?\x1a\x0e\x95\x80\x8eI\x81\xa8\x09\xd9\x86\x83\xe5qb\
-\xd6P\x1d\x18`\x00J\x84Z1\xbaG\xc4\xa2\x04\x0a\
-\xa1\x9fP\xdbP\x06\x0a\x90\x81\xba\x9e\x13\x0a(F\xb7\
-\x09[\xd84*\xb6R\xcc\xe8\xbd43L\x18\x96\x82\
-Kf\x16L\x12J\xce\x90P+\x5c\x83\x8f\x06^\x87\
-d\xe6!\x07\xbanbx6\xfd\xd0_\x17\x22\xcd\x18\
-\xe5 e\x10e^\xe5\xc5M\x11\x1bUGC\xd9\x8b\
-\xe40\xc2\xe46T\xc1\xb8\xc9}p\x91i}%i\
-Sl\xb7\xbe&L \xb9v)\xc4(\xa2\xb0\x08\xde\
-K\xc6\xd8\x22\xc6\xe5\xaaScgvg\xff\x7f\xf6\xfe\
-\xb4I\x92\xeb\xba\x16\x05\xd7\xda\xe7\xb8{DdfM\
-(\x8c$8\xcf\x12I\x0d\xd4\xbd\xba\x92.\xdf\xbbO\
-\xea\xabw\xfbZ\xb7\xb5u\xb7\xb5Y\x9b\xf5?\xe9\x7f\
-\xd3\xd6\xfd\xa5G{w\x1e4P\xd4@R\xa2(N\
-\x22\x09\x90\x041\x035W\xe5\x10\x11\xee~\xce^\xfd\
-\xe1\xb8GF\xd6\x04 Q(\xa1\x00_\x06dez\
-\xf8p\xfc\xf8q\x0f\xdf\xeb\xac\xbdv\x15\xad\xbdr\x90\
-W>7\xa1\x16\x1aX\x06\x12\xf2r).+\xdb\xf9\
-\xcd\xcf|\xfe\xeb\xbf;\xbb\xb9\xff\xc3\x9b7\x96`6\
-\x05\xc1c\x0c\x22\xa5\x9c\xa5\xb8\x19j\x9b\x0c\xc6Q\xaf\
-2%\x80\xdd\x0d\xdb\x8f\x17\x9d\x5c\xbe\xf9\xa7\x5cM?\
-\xf1\x81T\xc6\x06\x11Q\x18\xc0\xe1\xc3\xad\xd1W\x9c\x9a\
-\x86\xf5}<\x84\x8f\xeb\xbf\xd7&@,i\x9d<\xe5\
-w\xc3\xc8{\x15\xd1\x938R\x5c^\xc8P\x88\x023\
-\xb0\x5c\xb5\xcbe/D\x9a\x91\xa0\x97'\xefi\xa9\xa7\
-\x0d\x8d6(\xe9\x0c\x92S\xa2\x97g\x8f\xdc\xa1bj\
-\x9e\x9b\xc6\xabj\x1a\xd7\x13&L\x980\x11@\x13&\
-L\x980\xe1\x03\x82c\x1d\x8d\xc8\x92\x13\x15\x043\x0b\
-1\xaaC\x9f\xfa$8\x99\x8b\xc6\x22\x22\xb8+\xf7\xce\
-.\x9a\x032S\x8c\xa2\xc9\x08\x9a\xf9\xa0\x11\xe1H\x98\
-\x95\xfa\xde\xc7!\xd2]\xadD\x03A2\xcb]\x1e\x02\
-\x84\x9c\xfa.{\xaek\x8b\xa1\x06\xb3 \xc62\xe1/\
-\x8cQ\xd7x\xa0c\x14\xbf\x10\xa2\xa7\xe4\xe2&E,\
- \xd6U\x13\x9b\x85B\xd3#8\xeb\xcc*3\x0a\xa4\
-\xdc\xe8@\x16\x98\x07\x8dQ\xa0\x07w\x17\x89\x10\xc1@\
-'\xbc\xab,\xc3\xdb\xb4>\x80\xad\xc3\x90\x7fA\xa1\xa2\
-\x9c\x9e\xcd\x1dr0\xdc?\x05\xec6\xb0\x98\x0f\xa9w\
-9,{\x80\x07\x13\x9b\xec34\x17\xabj7u\xcb\
-\x84\xb5\xc1\x98w\xa1\xb9\xd4\xc8k\x85#o\xaeR\xe8\
-\xeclL3\xd1\x0b\xf5c\xc8D.L\x90;\xb2b\
-U\x9f\xe7\xee3\xd5M\xb7Y\xa5\x08\xf7u\xb0\xc3\xaa\
-B\x0a\xec<\xca\x8b\xea\x0a.KN\x19\x08\xb8\xc0\x08\
-\x98A \x9d0\xa8\x8fl\x03\xb2'\xaa\xba\x9b\x82\xeb\
-m\xc4\xbfryrc\x8eFxRN\x81\xa8*\x98\
-\xc1s\x16A#\xcc\xe0\xca\x922eF\x18\xcc\x06\x86\
-M4\x89\x80i<M\xba\x8a\x09\xca@\x07\x8e\xf6M\
-\x85B\xb2\x84\xba\xa71e_\xd9Y->\xd5[\xb8\
-\xfc\xc6%.\xfb\x0b\xf5\xe3g\xe6]\xce\xd7\x02V\x9c\
-K-\xba\x9b\x081\x86\xdd3\xe8uq\xe1_\xff\xea\
-\xf9\xd7_\xd9\xfd\xd6\xb7\x96\x07\x87\xacvz\xb7\xa5\xc5\
-\x86\xb1Z\xae\x13U\xacX27\xe2\x93\x0d\x11\xa9\xf7\
-\x94kx\xc4\xc1\xdb\x08\xa0\xc2\xf8\xdc!\x09\xe4v'\
-\x12tX\x07%Q\xc7\xfd|\xdb\x00<\xfekC\x00\
-\x01t\x9e\xfc\xec}\x8b\xe1\x896R2,\xac\x0f\xa8\
-\xe2m-\xcb\x8am\xb6u\x8f\x94Y\x0d\xd9r\x03\xd7\
-\xf9\xee\xa6$6R\xa9R\xdb\xcf\x07.\xd3\x8cf!\
-\x8b2\xb8\xccr\x15}\x12\xffL\x980a\xc2D\x00\
-M\x980a\xc2\x84\x0f\x128\x9a\xbe\xc0!+\x06\xa1\
-\xc6\x94\xd1u\xc9E\x8bUvd\xc0B\x08R.\xf2\
-\x10\x13\xe4\xc1TEB\xae;\xa6\xf7K\xb6\xd6[e\
-)PR\xd7\xaeB\xb0\x10\x22\x09\xc0\xe1)\xa7\xce\x95\
-\x17\xf3\x9dh\x5cw9\x0b\x01\x19\x0eY\x86\x0aQ3\
-h@x{\x98'C\x864$\x9fI\x12ro\x16\
-\x9a\x16\xf5\x95\x83x}]g\x9b\xd1\x0aO\x93\xabR\
-\xf0\x1d.\xc8I\x00\xb5\xa7\xe0}\x92\xbb\x014S\xa5\
-ltU\xc8\xf3*\xed\xce\xda\x99\xad\x0dI\x94D\xe4\
-\x08Z\x80\xdb\xc0?\x9c\xa2\xeb\x95\xb5J\x06E\xa8B\
-\x8e~\xe3\x00\xaf_\xb6^\xaajx_\x0d\xd63\x19\
-\xf0\x04\x01\x9ee\xee\xcd\x0c\xd2\xa2\xf5:\xb7\x8e\xc1U\
-\xa8\x18\x18QA\x03Ef\xc6#k^{\xe5R^\
-\xed/\xe7\x01U\xe8\x81}wRn\x88\xa5\xc6\x929\
-\xb2\x98T|\x83\xa00\x0e\x07\x9a\xe8\xc5\xdc\xa9\x8e>\
-\x9b3\x04d\x0d\xc2\x8cw$w\x91\x0b\x19\xde\xcb\xcd\
-\xeb:\x18\xe1\xf0\x10+\x98R^\xc9C\xb0h\x16A\
-\xc9\xc4\xcc\xec\x84\xa8\x10\x82\x02e\xa5\xfe\x93I\x06\x04\
-( \x03\xb9\xb4\x80D\xc9\xc4#<\x0c\xe3\x09A2\
-t\xa8:7\xb4U\x9b\x17\x17\xeb3_x\xe1\x97\xe9\
-\xff\xfb\xff|\xa9\xbd\xd2\xfd\x9f\xff\xedg~\xf7\xb7\xb2\
-\x96\x97\xfbU\xaa:0\xa06\xb2k\xb0\xac\xe0\xdd\xce\
-\xee\xad\xdf\xfc\xf8\x93o\xfc\xf6\xd3o\xfe\xf2\xfa\x8f\x9e\
-O\x9c\xa7\xa6nW\xa9+\xfeGDt\xa4\xbb\x19\xcc\
-<\x02\x5c\xc3?)n\xcb\x8e\xbc\x9b\x10\xf0\xae$\x83\
-\xf5\xd8\xbe\xb1\xee \x80\xb6\x1cl6O\x1aB\x85\x88\
-}T\xb0!X\x86\x0c8+fF\x22\x19\xb3\xd5G\
-\xa9\xbf\xb5L}_UF\x10\x90\x1b\xc2\x83S\xa4\x12\
-\x08\x84\x03\xd9\x01\xc9\x02\x83\x08\xc8\xa0\x1cc\xdfT\xce\
-c\xbes\xc2\x84\x09\x13>\xa4\x98\x08\xa0\x09\x13&L\
-\x98\xf0A\x83\xc6\xc0_\x8eRv\xb9w\xacS\x92T\
-\xd5u\x0a\xc1S6\x9a\x99\x94\x1c\xeet\xc0=\x06\xcc\
-f\x11P\xce\x09\xf2w\xee\xbe:z\xb7\x8aF\x972\
-)\xab\x11\x8c\xeb.w\xab\xa3\x14 $\x81\xf2\x0c\xb1\
-\x98?o\x08\xa0;\xd8\x1fl\xe7\x9b\x18\x8d\x16\x5cP\
-\x8e\xea\xe3\xb5\x83\xf5_\xfe\xf0\xf2\xf7~\x89\xa3\x9e\xa1\
-\x09!0\xe6\x5c\xbb\x8c\x00\xe4`g\x95h\x8d\xe7\xa0\
-\x94\x91UJJ'cb\xc8R\xa7O~,\xfe\xab\
-\xaf\xcf?\xfax\xdd\xf59\xa2\x14\x8f\x0f\xa4\x8c\xa31\
-\xeb\xa9z>2\x06Y\xcap\xc5\xb6\x8d/\xfc\xd2\xff\
-\xec\xaf\xf7_\xbdt+\xd4\x10\xe9\x1a\x92\xcb\xe8\x82\x07\
-:eRt\x90!\x0f\xb6\xcd\x1b\x09\x0a5X\xe0\x9a\
-\xc1\x80>\x01\x11\xab\x84_\xbe\xe2\xb7,pq&\xc5\
-\xf9:%\xe5lVr\xe4\x08\x22e\xef]\x0c\x15\xa2\
-\xa9\xf3A\x8f \x0e^*\xc2,\xda\xb9E=\x8fl\
-\x01\xd7;\xad\x85A\x02FU\x81\xa4U\x11rw&\
-\x9a\xbb\xa0\x94\xc1\x004\x80\x0f\xa5\xd7\x86,\x1e\x0d\xb9\
-\x83c^\xa6\xc6\xe8_\xf0M!\xf6\xb1\xc3\x8fmy\
-\xc6\x94\xc3J}\xca!Tg\xcf\xb7\xb3\xa7\x9e{e\
-\xf9\xdf\xfe\xfa\xe5\xff\xf0g\x97\xd3\x0a\x9fx\xea\xcd/\
-|\xee\xa9s\xbbO\xb4\xed+\xed*\xcfg\x16\xf7\xe6\
-X\x06\xb4G@\xe5\xed\xb5\xdd\xc5\xde\xd7\xbex\xe1\xb5\
-\xaf\xed\x5c\xbbq\xebr\x0b\x08)\xb7]\xaf\xba\xa9\x8c\
-\xae\xcc\xb1\xe2\xdaF\xe66\xe1\xed\xe0\x147\x07\xf56\
-\xb6\xbaSr\xf7h]\x94\x93\x89j\x9b\xc7WI\x9b\
-\x0d\xb0\xb0Z/\x0f\x8eV]\x9a-f\xa56\xd8\xbb\
-:\xc3;\xba\xab<\x807\x96I[\x1f\xba\xd7\x95\xcf\
-gn\xd4{\x9dM7a\xc2\x84\x09\xefsL\x04\xd0\
-\x84\x09\x13&L\xf8@a\xcc\x070\x89.:\x98E\
-\x00\xeb\xce\xd7\xeeV5\xd5l\x86\xc3#%D\xb8Q\
-p\xa0\x07R\x8e\xd1v\x17\xb3`\xf2.\x8d\xfe\xb8c\
-\x00#r+T\x1e\xfcR\xb6\x0eJ\x08\xc80\x86`\
-F\xf7\xdc{Z\x87@\xb3\xaa\x9e\xa1\x8eX\xaf\xd7\xd9\
-\xe5\x06\xa2\xc1\xa6\x12\xfcq\x083\x1aa\x940\xdc\x03\
-4\xba\x05\x1bR\x96gVU\x15\x18\xc0\x1a\xe1b\xbf\
-\xe4?>\xdf\xfe\x87\xbf:\xbc\xbaDl\xce\x86\xd8\xcc\
-\xfb\xf5,\xf7$!d4\x87\xe1l\xcfz\xaee\xcd\
-\x83\xcc#\x84D\x82}\x15\xfb\x10}\xed\x9e\xbf\xf6\x85\
-\xfa7\x7f\xe7\xf1gf\xeb\x8c>x\xb6\x14\xa0\x8ar\
-\x1b\xce\xef\x9d\x85\xb8\x85\xb3\xa1Pi\x8e\xee\x0c\x9d\xc9\
-\xce@\x17/\xbd~\xf3[\x7f\xff\xf3\x9f\xbc\xba\xaaB\
-\xc5\x86\xd93\xca9)2\xcf,W\xc6D\xaer\xe8\
-o\xce\xb5\xaaG\xb6d\xecQB\x01\x88\x01\x04\xfa\x0e\
-\x8a\x88\x0d\xbbT\xe7\xb3{\xf1\xcc\xd3I\xbbX\xaf\xce\
--\xaf\xcfR\xd7\x06\x03*\x08]\xabu'Y\xcd\xba\
-\xcamg\x88\xb2H\x02\x9e\xdcSHm\xc5\xdd3M\
-\xb5\x13\xed \x9f\xa2 \x10%Gng\x88u\x15\xc8\
-\xb6\xf7C\xa9\xcd\x99\xb3\x18m\xc7\xfa\xd4\xa6\xbe\x15\xe6\
-\xb0\xa6\x88z,\x14\x0d\x1a\x08\xa3\xac\x94Y\x0bP\xc8\
-\x08\x12\x8a\x02H\x19\x0c\xc5yGN\xd0\xa4L\x00b\
-\xa9k\xed\xee\x9c\xed\xc43\x9f|\xe1\xf5\x9d\xff\xc7\x7f\
-\xf8\xc57\xfe\xea\x95k\xae\x86\xf8\xe6\xf7\xae|\xf6\x8b\
-g\xff\xf0\x0f\x1e\xaf\x1f\xdb?:\xb8\xee\x9d\xed\xcdv\
-l&\xb5\xb7\xc8\x16\xb9\xaf\x8e\x96\x9f\xdc\xbb\xf8\xaf\xff\
-\xc5\x13W\xae\xb6\xff\xe5o\xd7\xd7\xf7;\xce\xeaf\xb6\
-`\xa0;\xb8\x91\x22\x81A\xa2\xd8\x93\x9bQ>e\xca\
-\xdc\x03\x02}\xabw\xeeJ!rC\xf6\x8d\xdb@v\
-\xfc@\x01J\x8e\x98\xb6\xef\xb3\xbb\xb1\x12E\x15\x14\xde\
-u\x9b\xdf[lrXE\x942\x87\xc5\xdf\xca\x06}\
-\x1d\x01\x0b\xa1\x81\xe5\xb6;8Z\xa6N@\x88f\xc5\
-0\x1f\xa7&d\xc6|3A\x82\x17\xa5T\x80\xba\xad\
-\x06\x19$8\x90r5\xcb\x8b\xb9\x8a\xf7\xf9\xc4\x00M\
-\x980\xe1\xc3\x8c\x89\x00\x9a0a\xc2\x84\x09\x8f:\xee\
-\x8cU\x8b\x92\xc4\x04\xba\x0bf\x02V\xad\x1f-W\xd9\
-\x17UU%\xd2s\x0e\x16b`N\x94\x80\xecu\x15\
-\xcf\x9d\x9d5\xd5JG-\x9d\x0c\xc3\x8eJ(\xbe\xf1\
-I\x1d}.\x8e1:\x04\x95@\x07\xca\xc9\xfbV\xea\
-V\xadn\xdeX[\xc4\xee\x1cM\xcd\x14\x90`\xcaf\
-F\xc0D\xc2\xccL\xb2\xd1\x06X\x1b\x07\x0d\x9c8\x84\
-\x90\xe5\xc1} \x09\xaa\xba\x99\xcfe\x8b\xd6\x0f;\xcc\
-;\x9ce\xaa\x90\x02\xbc+\xfe1\x19\xb3#\xec\xadY\
-g\x84\x86rs\xf8\x12\x0c\x96w\xa2W\x95\x1bp\xd0\
-\xa3\xcalXyH\xd1\x04\xebM\xbd\x8d\x09\x1c\xef\x9c\
-\x19\x19\xcc\x91\x08w\xa4\xec\xc9\xe0u\xac\xcf\xc1\xf2\xba\
-\xb75X\xd5\xe7\xe3<\xa6t\xe4\xf2 s\xd5!\xef\
-\x22\xcf\x80\x968@\x5c\xaa\xe9|\xe6\xccQ\xaa\xa0\x00\
-\x04\xc0\x80NJ0\x91\xee1\xd3,\xc7\x99\x87\x98C\
-\x9d\x8bz\xc0\xac\xa4N\x19\x18L\xee\x5c\xad\xd3\xd1\xaa\
-\xed\xb3\x9aR`\xdb\x8a\xf4\x80\x9e<\xf5\x09\x9d\x07\xf8\
-ba\xf3\x8a\x96\xe9\x0e\xdaqGo\x0c\x80t\xaf\xa4\
-0B\xd9s\xd7U\x15\x0d\xb6Z\x1e\xf6\xfdR\xc0*\
-!\xc54_\x18\x8c1RJY\x90G\xb0\x10*\x86\
-Amd\xe3\xd5\xdd\xf8\xc8\x94\x82k\xe5\xbar\xe0\xd1\
-\xc6:\x5c\x14\xe0\xa0\xd5\x98\xcf0\x9b\xbfr\xf9\xe8\x1b\
-\x7f\xfd\xea\x7f\xfe\xf3\xcb\xaf\xbe\xa1\x8f?\xb53_\xf1\
-\x857\x96\x7f\xf9\xed\x9f}\xe6\x93O}\xe1KO:\
-\xfb\xfd\xab\xcb\xd0\xf7\xbb\x16Y\x11p\x0b)\xad\xaf\x19\
-\xea/|\xf2\xd9?\xf8\x17\xe1\x1f^x\xfe\xd5_\xf8\
-N\x83\xd9\xbc^\xad\xd6\x9ese\x11>\xc4\xdf\xd2\x90\
-\xea(N\xec\xcf\xfd\xa1\xbb\xfdy'\xa3p\xa2\x04#\
-\x07Vz\xcb^\xfb\x8e\xbb|S\xba\xf0x\xc9\xddd\
-\x81\xefg\x08\xb4-\xeaK[\x9dC\x92f\xeb\xd6\x8e\
-V\x9e4\xb2\xa2\x0e\xdc\xf18}'\x87\xc3\xe6\x8e\x85\
-\xca\x8d\xc6\xa1\xd76\xba\xba\x92\xf4%\xc5\xa8\x10|\x90\
-\x18\xbeC\x82{\xc2\x84\x09\x13>H\x98\x08\xa0\x09\x13\
-&L\xf8\xe0``\x22\xa0wdk\xf2H\xe3d\xc6\
-\x81o\xec3\x8a\x08\x08`\x16\x83E\x84\xd8\xb6\xe9\xfa\
-\xcd\xeb\xfb\xcb\xee\xbc\x01!\xb8\xe7\xc0T\x08\x00O\x08\
-}\xdai\xea\x0b\xe7\xcf\xcff7\x15\xba\xcclC\xa9\
-sll[\x07OSR\x83\x04\xc0\x86\x85%\x88V\
-6C\x08\x5c\xad\xd7\xf2\xfc\xd8\xc5'\xeb\x18\xaf^\xdd\
-\xbfu\xb0:\x5c\xa5U\xab\x1c\xc1\x1a\x06\x8bb`\xc9\
-\xbe)\x06\xcc#\x01t[lY(!G\xac\x18*\
-A\xad\x0e\xc8\xbeC\xb3\xaf\x0a}\xed\xeb\x1d\xe4\x9d\x19\
-\xe6s\xc2\xd4\x1fY^\x193$\xa0\xcbM\xe5a\xd6\
-{\xa2\x07\xb7\x86a\x19\x9chw\xb4Z0\xcfB+\
-.\xb4\x8eG+\xb4U\xe5T\x96U\xf2]K\x09\xe1\
-\x089\x1fgo\xdc\xa5\xbf\xef\x88\xd6\xca\xe9\xbb\xc1\x04\
-\xac\x11;\x0b\xa29y\x96M\x1b\xa3Wh\xb8X\xf4\
-;js\x94\x92\x81\xa6\x14\xf2\xbaJ\xa4\xbal\xd9\x18\
-\xceY\xb3\x9b\x04\xd4Y3W\x03\xd4\x80\x11\xc9\x5c\xa1\
-o\x815c6\xb8\xf7\xe8\xe4mZ\xf7\xeb\xcb\xc9\xe6\
-\x15,d\x0f\xac=\x80\xc9\xb3\xe3h\x95\x8f\x96\xeb.\
-\xf7\xb5\x94\xddeT 3\x1d.dd\xcc\xebx\xe1\
-\xecbg/\xa0U\x16\x22\xc01=g\xa3\xc5\xba\xe3\
-\xac\x07\xbeF\x02\xa9\xaaRd\x9fr^\xae\xd6;{\
-\xf3\x8bO\xee\x1d\x1e\xaeo\xddZ\xdeZ\xba\x05\x8fU\
-\x96\xaf\x5c\x04kcc\x88\xa4\xe7\xb1\x90\x9c\xb62\xc1\
-\x0c\x0aH@\x1a\xcb\xae\xcb\xc9l\x11Jq\x08m\x13\
-sFs\x16\xe1\xb17_\xd2\x7f\xfa\xee\x1b\xff\xf1o\
-.\xbd~=`\xb1\xb7\xb4\xda\xea\xb5\xe3\xe8\xbb?n\
-?\xf3\xeds\x17\x9e\xfc\xe2\xee\xee\x22\xcf\x7f~\x14\xf7\
-\xad\x0a\x95\xa5\x90a\x9e\xacu\xe6k\xcd\xde\xe3_\xfe\
-\xe2\xb3\xbf\xf3\xb5\xe5\x0b7^\xbe\x95z/\xcd\x193\
-\xedx<\xfe\x86b\xe4c\x00\xfd\xc8\x90\x0f\xdb\xa4\xe9\
-\x03)'~_\xf8\x89\x8e\xd9\x92\xf4\xdc\xde\x22m\xad\
-d\x84ba\x80\xb8\xb5\xe1I\x13\xa0;v2P\x18\
-\xf7\xbc\x1b\xdf'\xd0@w\x0d\xf5\xed\x82\xcb\x04/z\
- A\x0cByf\xb2]\xe3h\xad\x9c\xc7>t\xc2\
-\xee!\xa2zg\xd8\x88\x81\xc6\xbc\xc9\xc2\x84\xa3\x82\x22\
-$\xb8\x87\x98>\xf3\x91\xf5\xb9\xdd\x9d[\xabf^\xbf\
-\xf7\xc3d\xc2\x84\x09\x13\xde\xaf\x98\x08\xa0\x09\x13&L\
-x\xe0\xd8\x0e\x9f\xee\xf5\xe2\xfe\xe0g\xd97\xe2\x02\x9e\
-\xdc\xf3V>\xcf\xfb:\x8a85\x8a\xefM\xd1Kh\
-<\xdd\xf1\xac)X\xb0`\xa1\xea\xbbt\xf3\xd6\xd1\xc1\
-a>S\xd5\x16\x82R\x92e\x16\x0be\x07\xa4\xa6\xaa\
-v\xf7\xf6fMK31\x0f\xe9\x19[Q\xdc(\x05\
-\x92\xca\xcc\xb5\x0c\x80\x0d\x1d\xef%c\xc7\xcc\xda\xae\x0f\
-f\x9f\xfe\xf4g\x7f\xeb7\xbe\xda\xb5G/\xbd\xf6\xca\
-K/\xbd\xfc\xe2K/_=Xg\xf7\xcar\xc3\x1c\
-(\x0b2+\x93\xd3\x80\xc4M\xdc\xb2}^\xe5\x97\x00\
-\x8b@r8\x80\x8c\xd8\xb1Rk<p\xae\x22Q\x19\
-`\x15r\xb4\xb5\xc1)\xf4L\xcbz\x9e\x02zWL\
-\x84\xc1\xa2\x87\x9c\xad\x0f\x0d\x1b\x99\xa2\xd5+\xb4G\xbe\
-\x5c\xaa[\xa0O\xcc&\xc2g`\xb7\xc9\xa0{'\x17\
-\xa0\xd0\x1a\x85\xcb\xca\x089\x1a\xc4\x03O+)\x87\x86\
-\x08\xd5Ab\xbb\xeeT\x034B\x86\x14\xd0\xd7\x1e\xa3\
-z2\x19\x10:\xab\x00!PUR\x03\xcc\x00\x00\x15\
-E\xe6@  \xd3{\xcb\xbdE\x10b\xbf\xb6\xa8\xc6\
-\xea\x0a0\xc4\x92l\x922\xd6+\xad\xda\xae\xef\xbb\xde\
-R\xef\x1e=\xa8H\x93\x08\x12!`>\x9b]<\x7f\
-\xe6\xcc\x99\xc6\xae\xf7\xd9\x850R\x07\xbc\x8d\x81\xdbt\
-\xffv_\xc8\x22g4\xcb9\xe5u\x1d\xed\x8b_\xfc\
-\xfc\xef\xff\xab\xdf^\xad\x8f~\xf1\x8b\x97_y\xf5\xf2\
-k\xaf\xbevp\xb0\x92\x17j%\xc5\xc0\xda\x02\x07\xab\
-'CQ\x91\x15Vo\x88V\x07\x13\xe82~\x048\
-\x82\x99\xcbQ|\xa9\x10\x02\xe2\xbc\xbd\x9e\xbe\xf9\x17\xd7\
-\xfe\x97?\xbd\xfa\xcb\x83j\xf7\xb1\xc7W\xaa\xae\xafZ\
-\x0bZ\xcc\xed\xd5k\xf9o\xff\xe1\xe83\x9f?\xfa\xb5\
-/\xefVg\xcf\x09\x07\xeb\x9cs\xc4\x8c\xb0\xd6c\x84\
-\xeb`\xb5\xff\xe6\xc53\x1f\xf9W\xff\xf27\x7fr\xa5\
-\xff\x93\xbf\xbb\xb4\xbeupvw\x0f0e/-\xd2\
-\xc85\xf2\xde\xe2\xa7\xf7-\x8eE&\xe5~\x1d\xaf\xdb\
-1\x95\xb2\xf1\x80\xba};\xddA\xba<(\xce\xeb6\
-\x02\x08\xa3>\xc5\xb6I\xea\xe3\xd6\x0f\xbf\xdb\x96\x892\
-\x06R\x95\x19!\xe1\xe1\xa1\xd0\x94'\xff\xbe\x87\xea\x09\
-w\xf4\x97\xb30\x9b4\xc0\x8b\xc3\x15!\x18i \xb2\
-\xb3s\xb6\x1dR\xce\x83\x97\xb64\xb2\x9f\xef\xba\xd9%\
-\xc5\xee\xb8YC\xf5D @\x19Y\xb4\xfc\xb9\x8fu\
-\xe7\xf7\xd2\x95}\xce\xebw}\xc0\x09\x13&Lxd\
-1\x11@\x13&L\x98\xf0\xceq2P\xbf\x0d\xc2\xb1\
-C\xc4\x90T2\xa6\x96$G\xb4\x90j t@|\
-\x90\x84\x8c\xb4NX\xa9\x96\xfb\x0aM3CP\x8f\xc1\
-p$\xeb8\xb6}\x0b\xcf\x89G\x11\xceV&\xf3\x1a\
->\x0b0(\xc8\xbc\x14#WH\x19\xcb\xd6s\x15\xe6\
-\x87+]ys\xd1\xb7O\xd8\xce\x91w\xaf\x9b$\x99\
-\xc4L\xa4\x08khU\xbep\xe6\xf0\xd3\xcf\xee\xff\xf4\
-\xb5\xe5\xd1M\x9b_\x98\x0bu\x9f\xbdWv*V\xc1\
-\xe5\xd9\x8f\x82Wu\xff\x18\xe4\xa8\x8eX\x0b\xc6\xe49\
-\xf7\x80v\x80\x80v\xdd\xf4<\xbb\x9b\xbe\xfa\xec\xc1\xff\
-\xee\x0f\xb8;\xdf\xbd\xf2\xfa\xde\xe5\xd7\x9e|\xf1W\xed\
-\x0b/\xbfr\xe5\xa6_\xbbv\xf4\xe6\xe5\xf5\xfe\x8a\xb9\
-\xb6\x8c\x90\xaa(k\xe0V\x92\x13\x02\xac\x98\x00\x01Y\
-\x8c\xc9`\x06\xf6R\x02\x005p2\xd6\xaa\xb1\xde\xcd\
-\xdd\xbcU\x9bZ\x8bG\x84\xd5\x1db\xbf\xe3\xb1\xed\xaa\
-.\x83Mk\x14k\xa5\x98\xe5\x06\xc4\x1d%0\xb7\x0a\
-7\x92\xaf,\x1f\x9a\xabA\xb7+\xc55)\xa7Z\x84\
-k0/IG\xa0A\x01\xce\xa16\xf9P\xa6J`\
-\x0f\x05\x0e\xa5v\xc6`1\x1bs1W\x05\x10\xe0\x94\
-'o\x8cam\xf0`\xa8HdxN\x81+P\xcc\
-45\x96\xce\xc4~7\xda\x8a\x96\x89\x1e!\x03\x002\
-\x94\xc0~0\x12\xa1\xbb\x0b\x95\x07PVI\x94E\x90\
-\xc1\x18!Z\xb0\xa8\x1c\x8fR\xce)\xcd#\xf6f5\
-o\xad\x0f_\xb9\x8ck\xeb'mn\xae\xab5\x22s\
-\x86\xfa`\x19Br\xc4\xb0|\xe2\xfc\x8d'.\xb6\xd5\
-\xeb\xbdP\x01)gE\xab\x01\xabB \xd9\xf5kW\
-\xa6\x15\xbd\x0f\x82\x05\xb0r7\x97Q\x06UI\xa6\xae\
-\xa7\xaf\x9f\xdc\xf3\xdf\xff\x5c\xf5\x7f\xfc\x9d\xddZ\xe9\xd2\
-'\xe3\xb5k\xd5\x0b/\xc6W_\xe3\xa5\x1bz\xe5\x0a\
-.\xdd\xf4\x83t\xd0\xe7\xae\xc7\xac\xb7\x10\x1c\xc1E\xc9\
-r\x15\xd2\x8c\xbe\x96\xe0\xac\x10\x1a\xa0\x877P\x1d\xd5\
-\x19[\x8b\x19T\x97\x80f/,\x9e}\xe3R\xf5g\
-\xdf|\xe5?~\xeb\xca\xcf\xaeRgv\x17\xbb\xb3n\
-\x95\xd22%\xd5\x8a\xe7\x92\xb5\xff\xf8\xab\xa3o\xfd\xf8\
-\xd5\xc7>\xf5\xec\x93\xf3]\xcb1\xa6\xbe>\x0c\xa17\
-\xd5\xf4]t\x19yymw\xfe\xcb\xdf\xfb\xc4'/\
-\x7f\xe5\xe9\x9b?{\xe3\xa7o^g\x15\xd4T=\xe5\
-\xee\xc1- \xaaU\x08a1\xab\xba\xdc{\xee`\xe1\
-\x910\x02\x22\x10\x84\x9e\xe8\x02\x1c\x08\x8e \x10p\x22\
-\x8fb\x9b\x90Q\x17[\x9aP\x14w\xc2 K\x19r\
-\x942J\xa5\xad;}\x9ao\xa3\x80\xcb!y\x8f\xa7\
-\xe8\xf6z\x0el\x0b[\x8a\x86\xd0\xb9]\xdf\xfd.'\
-\xe3\xb7\x0b\x98\xec]^\x82{<\xe2\x87T\xd3\x80\xc1\
-\x85\x0a\xa3\x01\x19\xc4\x0c\xe40\xd2\xe7\x022K\x9a \
-\x80AWZ\xb4\x8b\x1b\xba\xadp\x87\x09\xa0\xb4H\x19\
-Pk\x02\x194\xa3\xcf\x1a\x9a\xd9M\xcfL)x\xe5\
-\xeb\x1co,g\xb7\x0e\xce\xe2\xfc-p\x09&(\xbf\
-\x0b\xb5\x19U\x9a\xca\x1eA@\x03Db\xe0T=$\
-\xa13\x00U\x10\x8d>o\x22+#\xf40\x09\xb5\x09\
-\x13&Lx\xdfa\x22\x80&L\x980\xe1\x1d\x81\xe3\
-\x8f{\x13@\x9e\x87r\xd7@\xb1>\x18\xd2\x84\x5c\x1d\
-\xd1\xd6\xb6\x0e\xd9\xeb%\xb4\x07\xd9\x03IY\x10h\xc8\
-\xcf\x5c\xec\xe3\xde\xfc\xd0\xe3\xda\xaaY\x9d\xd8\xf5\x12H\
-\xe7P\xd6|\xac~{_\xcb\x85\xbb\xca\x1e\xde\xc7 \
-\x90\xddVn\xb4\xbc\xc7\xbc\x1b\x90\xa8\xecpW\x06\xb2\
-\x87\xce\xe9\x9eB\x0c\x8b\xc3\xa3\xf0\xd2\x0b;\xfb\xb7>\
-\x82\xa7^O!\xcf\x1aZW{\x96\xd3\xb5@j<\
-\xeb\xe0\xfcy\xff\xca\x17\x0e\xfe\xee\xbb\xab+G\xb3\xb3\
-;\xf5-G\xaf\x1c\x9a\x00V\x1e\xd0\xa7VH\x8b\xfc\
-\xd4\xde\xf2\xd3\x9e\xdbv\xf1\xd3\x16\x07}\x84B\xf6\xb0\
-\xe3\xfd\x1e\xda:\xe2p\xd6\xdf\xfa\xd8\xae\x7f\xf5\xe9\xab\
-\x9fZ\xfcU\x95\xae~|\xafm~\xfdq|\xf6\xb1\
-\xfd\xeb\xb8v}\xff\x97/\xfa\x0f~U\xff\xe2&_\
-\xb8~\xf8\xdc\xf5\xe5a\x8a^7f\x8d'\x88\xaa,\
-\x8cS\xee\x9e\x95\xba\xe0U@\xd5\x02\x0e\x04\xf4\x0d\xb2\
-1jm\xeb\xf5\xa2;\xdc\x15\xda\x9c\xa2\x8e\x88j\xd6\
-\x87Y{f\xcde;\xef\x00,:\xdbMf\x00=\
-\xbb5)/\x92\xb2\x85\xde\xea\xa3\xac#)5!\xec\
-\xc6\xee\xacUZ\x97\x08\xb8El\xc1\xe2=\x1d\xa1\x0a\
-^\xc97\xb6GY\xa21\x83\xbd+\x07\x85$\xa7\x14\
-\x00s\x22W\xcc\x95!\x11\x84\x1a$W\x8a\xdc\xadB\
-\xb34#;\xc6lU\xa8\xeb\xea\xc8\xb5,\xd2\xac\xd0\
-7\xb6\xde\xb3\xfe\xb1\xc0\x03\xabW\xb0\x1eL)\x94r\
-hF\x22\x0fc5\x83\xcc\xa5\xd4\xbbGx\x0d\x94\xc2\
-[N((\xc1V\xfd\xfcF\xdf\xa3?\x0a\xbbxz\
-6\xdb\xbb\xd9\xfe\xea'/\xad\xdf8\xb8x\xf6\x5c\xd5\
-\xac\x8e\xea>!\xb5\xca\xc9\x00UX%\xcc\xbaK\x8f\
-?v\xe3S\x9f8\x8a?\xc1\xe1\xf2\xb0\xae\x19,z\
-\xea\xfau\x8e\xb3\xd9|\xd1PYX\x93\xde\xbbKn\
-\x8cY;95\x92\x19\xe7\x863Y\xf3uw8\xeb\
-\xaf?\xfb\x11}\xf1\xc2\xcdO\xe5\xef\xce\xfd\xc5\xcf\x9e\
-{\x03\x17\x89\xcf5m\xf7\xe4/_\x8f\x7f\xff\x8b\xfe\
-go\xf2\x177\xf4\xb3+\xe9\xe5\xc3\xbeu5\xc9B\
-reE\xab\xcd\x16\xf4\x8e\xa2\xb3\x96\xcd\xa1,\x9fQ\
-M\x88\x09\xa9+\xd7Z5\xda\x9d\x9dKy\xf1\xef\xff\
-\xe1\xc6\xff\xe7\xbf\x1f\xbcz\xb9^\xcdf^\xcd\xd7\x9d\
-\x821\xc4\xaa\xefC\x8e3\xee\xf4/\xed_\xfe\x8b\x1f\
-\xec\x7f\xf2\xb7W\x8b\x0b\xdcA\x9ewh\xd63\xb4\xf3\
-\xae\xf2\xa3\xa6\x0d\xb9[\xac\x0e\xe3\xf2\x87M\xb3\xfe\xdf\
-~\xf4\xe2\xe1\x97>\xfe\x7f\xbbv\xe5'7n\xf8\x93\
-\xbb\xa1\x99-\x97)8\xcf\xd8\xbc\xca\x8d9\xea\xd9\xda\
-\xd5\xb6}\xd6,<\x126)\x06D\xa0%V\x11\x04\
-\x9a\x0eUB\x10\xb2\x0d\xcc\x85\x0a\x01\x94`\x06T\xc8\
-A\xcc\x82\xe8\xb0\x81\x0c\x1a\x9e\x9f\x85\x00r\xd2\x8fO\
-\x5cw#\x80\x8c\xb7\xa7j\xdde%\x8d\xa4O\xc1\x90\
-$\x89;*P\x89wl\xb5\x0d\xbe\x9b\x5c<n{\
-\xe1\x8c)W\x1aS\xffl\x14\xe0\x14\xe2\xb5\x94\x09\x94\
-,\x11}p\xa3K\x02\x8c\xd9\x06.v \xc8\x04\x03\
-\xc2\xb8W\x07\x9cH\xa4\x80\xda}\x9es\xa6n\xcdr\
-2\xce\xfbE\x93\xaa\x86\xab9\xae'\xd7\xcd<O\xb3\
-f\x9dye9\xbfz\xe3\x82\x9e9\xa0]\x19h\xdf\
-!\x1f\xf6\x1dC\xa2DH\xb4\x1e\xe8\x91#\x19(1\
-C@\x0e\x19h+\x88a\xe14\xfa\xfcL3\x9f\xc5\
-$d\x0d<\xfb\x84\x09\x13&|\x181\x11@\x13&\
-L\x98\xf0\xc0Q\x04\xef'\xddi\xe0\x90*6\xd2\x0e\
-Z`-\x97\x1c\x1a2\x806\xc6\xab\x82J\x19[\x0e\
-S\xd9\xb8\xefD|\xf9\xa8u\xeba\x9f9\x7fx\xd6\
-RN\x8b\xa8F]\xefm\xa0\x01\xd1\xc6\xf7\xf6\x0f2\
-6\xe9;\x83P\x05\xb9\x84+\xae\x1c\xac\x0eU\x1d\xfa\
-\xd8\x1d\xad^{\xed\xda+\xaf\x9e\xfb\xfc'a!\x0a\
-\x89!3{\xa8\x11jv\xad\xb7\xde\xef\xcev?\xf1\
-\x91\xea#O\xed\xdfz!\xad\x8f\xba\x1e\x16g\x8b\xaa\
-\x9a\xf5X\xf7\xfd*)\xb3\xf2\xcc6\xc7\x9b\x8a}o\
-y\x9d\xd0g\x0bU\x15l!I\xbe\x0a\xb1MJO\
-?y\xe6K\x9f{\xa6\xe6\xfe\xad\x1bo^l\xe6\xf0\
-\x03\xb0=\xf3\xe4\xec\xcc\xe3\xf1\xe9\x8f\xef~\xe5\xeb\x9f\
-{\xe1\xe6\xee\xff\xfbO\xbe\xfd\xf3\xbf\xfciJ\xa4\x07\
-\x90\xa0Ci4\xfe\xe9\x087D\xaa2O(n\xc0\
-\x00\x86\xb0\x92\xee\xd20\xfdN\x81$\x1d\x14B\xe6\x90\
-\xf8\x06\x99\x10\x00:K1\xb4\xa82\x0a\xa8\xc1\xc6\xba\
-\x04\x96%-\xa5\xd4\xca\x19BM\x15\x83j\x8d\x89I\
-[S\xfe\xa1\x84~~\xa2\xc2yI\xb3+\x92\x1d\x87\
-w\x90d\x82eQ\x0e\x08rZ\x0c\x15C%\x06Q\
-\xa4!\x07\x05\xca\x01s\x8f\x99\xcc\x103\xe8`\x063\
-t,\xa23QY4\x19i\x80Sp\xc1\x9d\xd9\xd1\
-#'K\x15\x0dU\xb4\x9c\xba\xc8\xec\xd0\x9b\x97o\xbe\
-y\xf9\xe8\x8b\x9f8\x13g{\xdd\xfe\xa5\x98\x92e\xa0\
-\x82\xedD:\xd6\x07\xbe\xb7\xb0\xdf\xf8\xe2\xc5'\xbe}\
-\xf4\xea\x1b\xab\xd9\xd9\xe6\xdc\x99\xdd\xa3\xa3\x94\xd3\xb2\xed\
-S\x95k\xb7\xca\x95\x88\x0c\xd2\xc1\x9c\x95\xbd\x17*\x92\
-\xb0\x10\xa3\xc3W\xcbt\xab\x0a\xedg>~\xfecO\
-\x9dW\xbf\x84\x8e\x86\xcaP\x96\x9b\x0b\xb3/\x9d\x7f\xf2\
-\xb1O\x9c\xfd-\x7f\xfc\xf9+\xf1\xff\xf5\xa7\xff\xf8\xc6\
-w\x9f_v\xd9\x0cN\xc9\xdc\xe9\xe5\xc2y\xf1\xe7\xa6\
-\xe0J\x9e\xad\x8a6\xab\xb5\xa6V\xb23h\xce\xc6u\
-\xe2\xf7\xbe\xf7\xe2\x9f\xfd\xf9\xe5\x97_\xcf\x8a;\xb1\x8e\
--\xb0n\xd7\x88hf\xa1\x0e\x06wFw\xe8'?\
-\xbb\xf17\x7f\xf3\xe2\xe7?\xf1\xcc\xb9\xb3O\xb6\xe9z\
-]\xd7u\x88\xca\xfb\xca}\xa0\x87\x1a\xea\xc4t\xed\xb1\
-\xc7\x9f\xf8\xfa\xbf\xfc\xec\x0fn\xf0g\xdf}\xb1;8\
-j\xce\x86\xce]NT\xa8\x17\xb1\xefV\x87\xab\x03Y\
-k\xb1)\xc9\xa4\x0f\xf7&>%t\xe2\x9fc\xf0.\
-\xbf\xdd\xb6]\x19\xc2|o\xb8\x80\xdb\xf6\xaa\xb7\xa0\xde\
-\xef\xbe\xd5]\x97\xbc}\x1c\xa7\xc7\x9db\xb3\xcd\xe1\xef\
-\xe5\x89u\x1fp\x8bv\x22@Cd\xec\x81.\xf5\xeb\
-\xb6\xed\xba^\x00\x9d\xc8\x0f\xae\xc4\xd96\x976\x10_\
-\xe4\xd6\xe0 \x19\x8c\x81,B\xaf\x89\x00\x9a0a\xc2\
-\x87\x16\x13\x014a\xc2\x84\x09\x0f\x18\xbck@!\x11\
-h\xb4\x8b\xc3\xa7\xe6\xb7\xb0\xb3\xda\xef\xd6\xdd~\xe7)\
-;\xa4yC\x92r\x1c%\xd1\xf9x\xce\x80\xae\x85\x90\
-\xc7\xa2*(\x91\xff\xf8\xea\xba\x99\xa3.\xf1\xf9\x99\xd4\
-\xee\xe5u\xb8\x05\xee\xd7;\xe7\xcf:\x9e\xe4\xaaVw\
-\x93MB\xec\x81\xfe\xe1\x9c\xf8?\x11\xb8\x15Cd\xc0\
-E\x89\xb9\xf84\x0b\x99$\x19\x9c\x84\xe1\xfa\xfe\xf2\xd5\
-\xd7n\x1e\xae\xce\x9c\x9d/|\xbd\x8f\xb8\x02e\x15\x8c\
-a\xb5\xb2\x9c\xe7;\xe7\x9f\xfe\xe4G\xeb/~\xf6\xf0\
-\xe7\xaf\xbcvu\xb9_\xcf>B{\xecp\xd5\xad\xd3\
-\xda\x02\x9b3!Y{ky\xa9\xdf\xb9f\x819\xd4\
-\xc6\xc7\xeb\xbc\x9b\xfa\xba\xeb\xbd\xb2~\x1e\xf6sw\xf5\
-\xb1\xf3\xfe\xe5/_\xfc\xc83;\xc8ozN9$\
-\xb6W\xe49\xc4j\x99\x99\xe7\xf1\xc2\x85\xb3\xfb\xb3s\
-]\xb6U\x87jv&\xd4;r\x97\xb7bK\x06\xa2\
-'\x8f\xc8\x8a\xda\x0d)0\x0bX\x0f5\xe8\x1d\xd9L\
-\x8c9\xa8'\x13\x90\x18\xc0\x9a\x0c\x99Hf\x99V\xca\
-:\xf5\x16\xa1\x18 \x22)(\x19\x5c\x02\xe1\xc5\xf3\x85\
-\xc5\x89$\x08Q\x88C\x9c\xa4\x0c\x10\xcaP-Zf\
-\xf22\xbfN\x0a\x14%\xd0\x113\x90\xc9L\x03\xe9\x84\
-S\x85\xb4\x11\x85\x92\xcc%\x90R\xa5\x1ei-\xb6\xf0\
-NL\x99IU\xb2\x06p\xaaF\xa8Yg\xb36\xd8\
-\x1a\xf5\xd2\x90M\xd1<:Bb\xe5\x0c\x03\xddE\xc1\
-2\x94\x99\x13\xd4\x93\x86h\xe4Xq\x0d.\xc4\x9c\xf6\
-j\x8b\x08\x96\xfdz\xa2[\xf0\xab\xd7\xba\x17_\xbc\xbe\
-\xfe\xf2cg\xe6\xe7\xd3\xf2\xb5j\x18 \xa4\x16\xb5\xea\
-\xf5\xb2\xab\xab\xd9\x17\x9f\xfd\xe4\xd7\xbe8\xff\xd9\xcf\xfe\
-q}p\x80E\xbdh\xf6hg\x93\xf7+G/\xb4\
-\xea(U1\x98Q\x22\xbc\x22j\xb0\x91\xc7\xa4[\x96\
-\xaf\xd6v\xf4\xc4E\xff\xe2\x17\x9fx\xfa\xe93\xbd\xbf\
-\x99\xa5@C\xef)u\xa6\xcbi\x91\x17\xe7\xaaO\x9d\
-;\xd3\xef\xc4\x99\xad\xfc\xe0\xb0\xf2Y\xb3\x80\x87\xdc1\
-\xbb%\xa1'\xbc\xa7gvb\x02\xfbdUm\x01\x16\
-\x04d\x07\x8d\xacf\xfd2\xfe\xfc\xb9[\xbf\xfcy\x02\
-\xb8\xb7\x98u\xbb{Yy\x9d\x97\xa4\xeaX\x01\xde\xb6\
-yf\xb6\xb3hn-\x0f\xff\xfe\xdb7\x7f\xebs\x1f\
-y\xea\x0f>\xbf\xb3xI\xe1:\xfc \xfa\xb2\xc9\x08\
-b)\x8d\xddu7\x9a3o|\xee\xab\xcf\xfe\xde\xf5\
-\xe6\xfbo\xc6\xe7.w\xac\x0e\xf7\xaa]TuV\xdb\
-6\xad\xdb\xbam\x0f\x22\xad\xaa\x9b\x9c\xefoa\xf6\xfe\
-\xc2)\x05$\xa3W\xcc[\xc8yn\x93BI\xb7/\
-y\xbbx\x98\xb4CQ\xfa\xd8\xb1\x83}\xc1\xe8\x95\xfc\
-^\x5c\xd8b\x22\xe5\xe3\xd4\x07!\xc1\x058\xa2\xa0P\
-UH\xe8\xfb\xdc\xadW}Z\x15\x8f \xf9\xe8\x8c\xf4\
-`\xdas\xb2{%\xd2\x08BN9\xe14\x0f\xa6\xf7\
-\x88\xf0\x9b0a\xc2\x84G\x05\x13\x014a\xc2\x84\x09\
-\x0f\x18\xf7\x88\x9cJ\x8cmh\x11s\xf5\xc9'\xcf\xff\
-\xe1\xe7\xaf\xbc\xba\xb4\xaa\xdeM\x1e_\xbc\xdc\xae\xbb\xbc\
-\xa8\xecsOW\xbb\xc1\x9f\xee:\x0a\xafU\xb1#E\
-\x13\x14 *C\x14\x0d\x82\x97\x12\xe5\x90\x13\x11\xfeL\
-\x7fsW\xeb/}\xfc\xb1\xbd\x9ds\x11tD\x22B\
-\x11.\xa8G\xf12y4B\xb9\xd3a\xd3\xe5\xa5\x1a\
-\xb0\x06\x8f\x0b\xc8`\xc9\xdd\xbd\xaf03\xc4\xb6\xf7\xd7\
-\xde\xb8~\xfdF<\xb33O:\x08\xc9\x01X\x22@\
-f\x0b\x08\xd1\xc2\x93\x8f\x9f\xff\xf2\x97>\xfe\xad\x1f\xbc\
-q\xf9\x8d\x8e`\xb4\xe8]\x97\x13\x11,T1\x83-\
-\xba\x10\xfa* \xa1BO$\xcb\xb9\x22SU'\xb4\
-\xde\xb7\xdd\x97\xbfz\xe1w~\xfbI\xfa\xaa=:8\
-\xb3\x88M\xc8I-\x05\xe5\xae\xcb\xe8\xb4\xee\xf7o\xfd\
-\xe2\x17W\x7f\xf5\xab+\xeb\x15\xab\xddF\xb4\x9c\x93\x8f\
-n\x1bD\xa2e\x22P\xa4\x07(\x0c\x1a\x85\xe3kH\
-Q\xa3\xe7\xe9&\xa4\xc3\xe8\xc9C\xd0\x8a\xab\x89\x80\x22\
-\xb3\x01 \xca)Q\x1a\xbc\xb27i*c\x046\xec\
-\xdd\x06\x05\xd0\xb0>\x04J6\x18\xban\x0eD\x96\xfc\
-\x1aP\xa0D\xb9)P21\x0e\x0eB\x83A\x07E\
-\x910w\xa4B\xc79\x01\x81\xd9\x982\x13\xd0\x05\xe6\
-\xca#T$E\x12}\x08[G\x8f\xd8\x8c\x0c\x87@\
-R$J\x18'\x93D\xa0\xf6\x5c\x192\xd89{\x0b\
-88\xc2\xcf_x\xf3\xf2\x95\xa7\x9f\xfc\xf8\xdcBD\
-\xec\x01`\x05\xacr\x8cUe\x86\x1e\xbb\xcd\xe2+_\
-\xfa\xfc\xe7\xfea\xff\xe7\xbf\xfc\xf1\xf2\xd6r\xe7\xecl\
-V\xcf\x0e\xd7\xb9\xed{VF6N\xf3@3(\x8b\
-\x85\x86\xf5\xdcv\xab\xe5\xeaV\xed\x07\x17v\xf0\xb9O\
-\xcd?\xf3\xa9'\xcf\xee5<h\x85\x1eQ ,(\
-\xe7\xe5\xcd\x9b\xdd\xba\xaag\xe1\xe97_]_z\xfd\
-\xb5\xb4\xf6\xd9\xac\xaabh\xbd\xcbp1\xcb\x9cFQ\
-\x8e,$\x18,\x18$u\x99D\x98\x83\xc1\xd0\xa1k\
-\x05V!\x22\xb4!\xc4YU7!\xb7t\xb9\xb2\x84\
-\x9c=\xa56\xb2\xde\xdb\xd9\x8d\xa1\x7f\xf3\xcd\xfd?\xfd\
-\xb3\xd7\xbf\xf0\xa9\xb3\xff\xec\xb3\x17y\xed\x86\xba#\xab\
-Q\x119\x09 \x83<\xe7\x94oT\x8b\x0b_\xfe\xb5\
-3_\x7f\xf5\xe2\x8do\xbcy\xe9\xa8;{\xb1\x0e\xf5\
-\xce\xfe\xc1\x8d~\xb5\x9c7\xd6\xcck(kK\x80\xf5\
-\x81\xc4\xe6\xe4\xca \xbb+a\x7f\xdf?\x1f!\xfc\x13\
-\xb3\x1d\xa3S\x10-\x04\xbarF\xdb\xa6\xae\xefe\x06\
-\xb3c]\xd4{\xda\xc1\xcaR\x06PEs*M\x14\
-\xd0\x84\x09\x13>\xdc\x98\x08\xa0\x09\x13&Lx\xd0\xb0\
-R\x1d|T\xeeh0\xe0\x81\xc8p\x1d\xf6\xfdf^\
-\x7f\xe5\x0b\xed\xff\xf5\x13\xed\xcd|&[H\x98\xff\xe8\
-e[.\xbbs\x0d\xbf\xfaQ;S\xa7\xce\xe1$-\
-e\xb2\xb5J\xe2\xdc\xd1\xa4\x98\x11\x9c\x06\x85\xcc\x0a\x80\
-\xcc!DK\xd2nn\xf3\xd9]\x7f\xe2\xe2\x8b\xee\xab\
-^\xfbU\xec,\xf6\x8c\x02\x04/\xb3\xe3\x8fn\x0cs\
-?\x88\xa0\x8c\xa5\xbe\xb2\xb9\xe0\xa0\x8b\x12$\xa3YT\
-re\x04FXX\xf6\xf6\xd3\x17\xf7\x7f\xfc\xcb\x0b\xe7\
-\x1e\x7f\xfa,\x1c\xf9\xaa\x89\xe8\xeb\x94c\x83\xd8T\xd9\
-\xbaWf\xf5\xfe\x17\xbf\xb0\xfc\xbd\x7f>[\xfd\xf5\xf2\
-\xf2\xad7\xf3r\xbd\xb787\x9b\xed-\x93u+2\
-8\xe5\x99\xa9\xb2\x05\xfb\xc7\xdbu\xed)-\xea\xd5\xa2\
-^+\xdfh\x97G\x9f~\x0a\x7f\xf4/\xeb/}b\
-\x89\xc3[:\xf2\xc5\xee\x1eW]L=\xe8}\x82W\
-\x98\x9d\xab\x8fV\xdd\xcf_z\xf9\x8d\xcb\xd7r\xa6z\
-O\xcaY\x08\x96\x02;\x03\x80l\xa58\xb2\x9by\xa0\
-7\xb0u9Y\x07\xbddu\x89.\xf3b\xd0C\x16\
-+\x1e\xa7\x95\xff@#Y\xeam\x01.\xb9\xd3\xdd<\
-P\x92\xb9\x99[1;1W\x00\x8d\x0c\x01^\xca\xe8\
-P\x84\xcc\x017\xb9\xc9\x8dN\x12\xe6\x02\x11\xa8@\xc1\
-\x19J\xc1p'\xdc\x08\x93[v\x89\x94e`\x10\x02\
-D\xa01*\x06T\xd1,V\xd9*g\x0d8X\x83\
-\x81r\xc6\x0cK\xaaz\xc9\x91\xe7PM\xc2\x86\xc4\x9c\
-0\x9c\xb1+\xd2b0\xa0w\xef\xe0.3xp\xd2\
-3\xa8Y\xe8\xcfy\x8a\xa8oZ\xdd\xa6\xd4ZH\xc9\
-\xf1\xf3\x17\x0f\x7f\xfa\xf3\xa3O=s\xa6j\xce\xb1\xbd\
-\xd2\x10\xa2\xf22\xb1V]\xcf\xd0\xf5{\xb8\xf6[\x9f\
-\x7f\xf5\x8f\xff\xf0\xa8\xdd\xef^\xbfr\x93\xb6\x9e\xed\xd4\
-\x95\xed\xe6\xb4+\x9fE\xab\x1cTJI+\xf5\xcb\x80\
-T\x05Qkx\xeb\xddAC|\xe9Y|\xfd7\xcf\
-}\xe2\xf10\xd3\x129\x99\x80\x00\x08\x16\x80\x0aR\x8e\
-\x11\xeb\xd5\xe1/\x9e\x7f\xf1\xca\x1b\xfb35Q\xbb\xea\
-C\x16\xdc\x8a\x11\xb4\xd3\xdc\x89\x0c\xb9%(\x85\x0a\xca\
-\xbd\xf7}\x08\xc6H\xe4\xa8u\xccy\xb1\x98kwQ\
-\x1d\x1e\x9dY\xb7UZ\xafSX!\xf6\xb2\x9c\x98\x0c\
-\xb0\xe0)\xe7\x0c\xce\xf7.\xec\xaf\xd2w~p\xe37\
-\xbes\xf0\xa9\xa7\x9e>S\xbf\xe6\xed\xcd9\x103,\
-\x83\x1e@\x84*'?\xccG\xbf\xfa\xd4\x13{\xff\xf6\
-\xf7\xaa7_\xab\xbe\xf9w}\xdao\xc3c\x0b\x18\xd6\
-\xdd:\xcevv\xe2^\xbf\xee\x92\x0fF7\x1fX\x10\
-&\x97\xca\xe3B\xc5\x03\x88\x85g-\xb9\x90'N\xff\
-\xf6\xaex\xb4\xfaf\x93>\xfaV:)m\xfd\xf7n\
-1\xe4`\x15\xff J$@\x13\xe1\xe8{O\xbd`\
-\x11\x16\x89\xee\x01\x1d\xf0^\xad\x000<\xff\xe0\xa8\xac\
-\xfa\xc8^\xbbW1y]\xd9#u\x15'L\x980\
-\xe1\xc1a\x22\x80&L\x980\xe1\xe1\x80 \x18V\xd0\
-\xaa\x0a\xb8\xb8\x87\xc7\xf7\x9a\x14\xebU{\xd5\x18\xfe\xe5\
-Wf\xa0\xd0\xaf\x90\x97(\xae\xbcF\x18\x9c\xec-\xb8\
-\xe2<\x05\xa4\x0a \xcc\xa0\x08T\xc0\x18\x88\x10@B\
-\xa2\xf2\xcd\xd4\xbd\xde\xae\x05\x81\x15\x18\xa1\x00\xb6\xf6O\
->\x09\xfc^c\x93q0\xd6\xd2\xf6\xa2q\xd1`\xa6\
-\xac\x18b\x15\xe7^\xad\xbb\xc4\xe7^\xc2\xf7~\xd2~\
-\xf1\xd7v\x1f\xbf\xf0d\xc8\xb7\x90\xd9\xafj\xefX/\
-f\x0c\xe8\x96\xaf\xf7\xe9\xcd\x8f<\xb5\xf7o\xfe\xf5\xb3\
-6\xbb\xfe\xdf\xff\xe2\xca\xaf.\xad\xe4Bs>y%\
-\xf3\xd8\xf4\x8c\xb5,\xf7\x88\x81\x17\x16\x8b3\x9e\x8e\xb8\
-\xbe\xd1u\xd7\x80\xebO?\x8e\x7f\xf3\xc7\xcd?\xff-\
-\xed\x85k\xc8k\xc2\xb4D\xeeR\x08\x8e\x08\x17X\x83\
-M\x7f\xe5\x8d\xab?}\xfe\xf5[\x87\xb9\xa9\xab\xce\x05\
-\x85*\x18!\xf36`C\x1c\x82BP-%(l\
-\x89}6'}\xbb\x15\xf9m\xd1\xdb\xe8\xf8\xed\x1b\x87\
-$A\xa5\x10\xd1X\x04\xb9x\xfa\x84-'\xf2b\x09\
-\x14\x8bv\xe8D\x17\xab\xac\x5c\x09\x00\xaaq\x13\x09\x80\
-\xc9\xcd]\x22a\x00r\xa9a\x86$\xbaC\xa2\xa0\x9c\
-S\xce\xa0U\x80\x84\x0a\x0c\xa2d\x09\xa1WL\x12\xbc\
-\x0b\xa6J\xcc\x82\xbb\x06%\x17\xe9t\xb7\x80`&9\
-\xd5\xbb9,\x9a\x99\x9bdf\xb9\x0e~\xb6\xef\x0c\xe1\
-V\x9c\xb7\xae\xce\x81\xd8\xe0\x957\xf5w\xdf\xbf\xf6\xb5\
-\xaf\xcc?\xf1\xf8Y_\xdf\x80\x12j\xfa*\xda\x8a\xc1\
-\x02\x8c\x8bt\xf4\xe9g\xae\xfe\xdb\xff\xf9\xfc\xfe\xd5s\
-\xff\xedOn\x1c\xae\x8fV8\x0a\xb3\xdd`g\x97}\
-\x03[Xh\x5c\x09\xd8\xafpd<2?\xa4'\xcb\
-\xeb\xbdY\xfa\xcc\xe3\xf8\xfao\xef\xfe\xc1\xd7>\xfa\xd8\
-\x9e\xb4\xbe9c\xa2\x17c\x22x\x0fD\xec\xee\x06,\
-\xaa\x97\xaf\xde|\xee\xf9\xd7\xaf]\xf2\x99\xe6\xe8\xeb\xa5\
-\xb2\xcf\x09\xc2\x0d2\xa7\x15+^\x81.x\x86\x08\xb7\
-@\xc0<\xc9@\x85\x99\xd9Y\xcf\x9drC\xec\xf5)\
-\xac\xd6\x87\xa9Y\xdb,\xbby\xce\x8e\xe8\x15\x89\x1e\xcb\
-\xaek\xdb&\xd4\x8f\x1d\xad\x8e\xfe\xe2/\xae\x7f\xee\xd9\
-\xf9\xef\xff\xb3\xb08\x03\xac`\x1d\x8cPFv\x849\
-,\xb69]9W\xef\x7f\xeds\xcf\xbe\xfa\xb5\x8f\xbe\
-\xf1\xab\xd7\xbf\xf7\xe6\xfe\xda\xa2-\x825\xb1G\xea\xb3\
-r\xb2\xec\xd9\xaa\x07ts\xbe/q\xaf\x07\xe2\xa3\x94\
-\xf6\xf6(\x81PQ\xd2\x05\xb3\xd0\xa6\xbc\xee\xb2\xc3B\
-\x08\x856-.\xd3\xef\xc9qQ\xbc\xe0$\x09b\x08\
-\xf1\x0bO\xa4\xef\xee\xf0\x8du3\x11@\x13&L\xf8\
-\xd0b\x22\x80&L\x980\xe1=\x80\xee\x984.\xb5\
-\xb4E\xf4B\x0f\xef\x18\xd6\xf3L\xcbm\x9f\xbd_\xaf\
-r\xa0<\x1dz\xeeJEcg\xd1h\x84d.d\
-dE/\xc6\xb1\x84\x02`C\xa8O\xc0a@\x1d\xe1\
-\xe8S'\x021\x0eQ\x9f'\x04\x7f\xef\x05\xf6\xff\xc4\
-\xb8\xcd\xa5t\xa0\x81\x0ctx\xceI\xd9\xac2\x92\xa1\
-\xaa\xe8;\x87\xcb[\xcf\xff\xea\xd6\x0b\xaf\xad?v\xe6\
-bc\xfb\xc8kI@\x02;H\xcak\xb6\xdam\xaa\
-\xaf|\xe6\x8c\xe1\x5cZ\xdd\xc2\xb7\xbb\x97.\xbd\xd1\xad\
-\xf6wv\xe6\x15r\xeeZ\x0b\xac\xc2\xce\xea0\xb1\xbb\
-\xbc7\xcf\xeeG\xb7\x0e.\x1b\xae\x7f\xfa\x13\xf8\xe3\xff\
-\x01\xff\xfb?\x9a=\xb3\xdb\xa7}\xcc\xb9\x08\xec\xfa\xa3\
-\xa5!Z\x08D\xae\xe6\xf3\xf9\x99\xf3\x97\xf6\xeb\xef\xfd\
-\xe8\xe5\x9f<\x7fu\xd9avf\x86\xba\xea\xccB\x90\
-\xe7\x8a\x1e\xe9\xc5\xe8\xb8'\x00dp\x0d\xac\xb6\x08\x9a\
-\xe2\xb3QR\xdcd\xc3\xf9n\xc6B)\xf0#\x0c\xe5\
-\x8f6\xbe\xce\xc7f\xb0a\xebw\x0eu\xa9\x9dH\xe3\
-\xca\xa5@\xb2\xd9P\x1b\x08\xe3\xb1\x08\x18\xc7\xae\xa6H\
-\xbfW\x1a\x85\x01Fw\xf4\x01\x9e\xa2\xa7Fj\xfc\xc8\
-\xbb7\xb2:\xe4\xae\xac#X)4\x06[)\x83b\
-\xb3^\xc7\x94s\xc8\xd9\xe4C\xab\x8d\xa09\x8c\x89p\
-\xe6Np\x0b@\x04BL\xb9\xe9<\xb8GI\xb2\xb2\
-E$\x5ct\x0f\xf5a\xdb\xfe\xf8\xf9K?\xf9\xe5\xd9\
-\xa7\xce?Y\xd5]\x9f\xafV\x01q\x0e\xad\xf6\xe1k\
-\xc4*\xe5\x96\xfb\xf1\x8bO\x9c\xfd?\xfd\xf1l\xc7\xf1\
-\xbd\x1f\xe1W\xafb\xb5\xba\xc9Z\x8b8\x17w\x90+\
-\x22G[\xd7q\x85\xb4\xf4\xf52\xa7\xbe\xf2\xf5\xc7\x1e\
-\xc7\x1f}\x0d_\xff\x8d\xb3\x9f|bn\xfd\x12\xfd-\
-\xaa\x152\xdc(%W\xf6\x1d\xab\x9e:l\xcf<\xf7\
-\xfc\xf5_\xfe\xf2h\xd9r6\xdba\xd83kM\xd9\
-h\x82\x95\x22DF\x04sZ\x09P\x13\x99i\x82\x5c\
-]\x96\xc9\x22b\xe4z\x95WK\xab\xb1\x97k\xae\xc2\
--\xc4D\xa3\x91\x90\xc9+\x22Z\xa8\xbb\xd6WG\x07\
-\x17\xce>\xbe\x98\xed<\xf7\xd2\x8b\xdf\xf8\xce\xe1\xb3\x9f\
->\xff\xd9g\x9e\xe2\xfa\x10\xfd\x1auH\x0c\xbd\xe7\x9a\
-9V\xf0\x0c\x1d\xa5\xdd\x19\xfe\xc5\xaf=\xfd\xfc\xcfW\
-\xbf\xfa\xd37/\x1f\xde\x5c,\xf6\x9a\xf9\x8ewl\xbb\
-\xca\xbc!\xba\x0f\xf6#\xe3C\x8b\xb7r!zO\xd4\
-8D\xb1m\x17\x8d\x8c!\xe5t\xb4Zy\xaa\x00\xc3\
-F\x9c\xfa\x9e\x10@2\x14\x01\x92\xc3\x1d\xf4*bV\
-\xd7\xc6\x07\xe694a\xc2\x84\x09\x8f\x22&\x02h\xc2\
-\x84\x09\x13\x1e4\xee`\x7f\x0a\x08\xb2'\x5c\xc1\x84\xbe\
-\xd6A \xf2\xbc$\xce\xacS@\x86: \x17/\x96\
-@\x14\xef\xddd\x10\x14\xd1q\xc3\x02\x9c\xac\xd1\xe2\x09\
-\xee@\x03\x13\x1a\x07\xe7@@^\xc3\x13\x18 \x8e\xda\
-\x91\x0f\xe6\x1b\xaf\x08\x95\xdc%\x88\x80\x8b.\x16R\x03\
-t\xb8\xe7\x10\x02\xc4\xe5z\xdd .\x16\xe7\xb2\x0e_\
-x}\xfd\x97\x7f\x7f\xf8\xd1\xb3\xe7~\xfb\xdcG\xac\xbb\
-FuV\xf5\xd4MuGMD\xdd \xa57\x9b\xea\
-\xd6W>q6\xfc\xe1\x93g\x17\xabo\xffC\xfb\xab\
-\xd7\xbae\xbe\xd6\x1f*w`U\xa3Z\xf8\x81g]\
-9:\xb8\x19\xd1=1\xef?\xff\xa9\xd9\xbf\xfc\x17\xfc\
-\xd7\x7f\xe0\x9fy\xac\xb5\xa3\xa4\xb4\x17\xd3\x9e\xb70\x0f\
-\xa1\xaeh\x97=\x1d\x868\xafv\x9e\xba\xf4Z\xf7\xa3\
-\xe7^}\xf3ZV\xb0X7f\xd1S\x86\x8b\x08\xa6\
-\xda\x9c@o\x0e\x93h\xd9-\xd3V`_\xac\x8d\x22\
-\x90Kn\x16\x19\xe5\xe6\xb2\x92\xfb\x057\xc0@\x83\x1b\
-\xbc\x98\x9eBn\x90\x89\x82\x05\x99\x1c\x06\x05:\x1d\x03\
-\x09!7e)Q=\x080\x95\xc4E\x9a\x19\xb3y\
-\xa9\xcbE\xa3\x99\x9b;\xcdI3wE\x84\xec\x91n\
-\xe6\xc5^H\x06\x0d\xae\xc1\x99\xe8\x03U\x85<\x9f\xb1\
-^(5)U\xdezw\xa4\x04K\xa3p\x08c\xb9\
-3\x0a\x09\x94\xaa\x95B\x1f\xcc<\x84<|\x0a\x12\xc1\
-<\x98\x03h\xc9@\x0b1R1$\xd4\xea\xe6UZ\
-\xe4j\xde/*\x8bB\xb0\x94A\xc6L?\xca9G\
-\xbdty\xfd\xed\xef\xee\x7f\xe6\xa3\x17?\xfd\xcc'\xba\
-U\xcb\xf6V\xb4\xa4:!\xb4@\xb4\x94\xc3\xadK\xb1\
-\xb6\x7f\xf6\xb9\xd9\xc5x\xeeSO\xe7o|+\xff\xe8\
-g\xab\x9b\xabC\xd4{\xce\x9d\x9c $\x84\x9ea\x89\
-\xae\x8fY\xe7w\xc3\xb3\x1f\xbd\xf0\x07\xbf\xd1\xfc\xdb\x7f\
-\xce\xcf>\xdd4\xcbK\xde\xaf\xe9+\xe4#\xba`\x0d\
-B/\xe4\xce\xcfD}\xf4\xf2U\xfb\xee\xdf\xbf\xf8\xe6\
-\x1b\xa9\xae\xe7\x16\xce\x91\x17\xa2\xad2[\xb2\xb5B\xd0\
-\x01fN\xcb\xb4L\x81\xe6\xe8;1!\xc2DBJ\
-.\xcf\x92{\xa6sa!\xc4\x99\xfa\xd8\xa5\x1c\x9c9\
-0(\xd7\xc9\xebH\xcar\xa8\xe7=\x17\xbd\xd2\xaa\x0d\
-\xdf\xff\xc5\xf2\xd7_8s\xfe\xf1s\xf3\xa8\x90\x85\xae\
-\xf2P+:t\xa0\xd4\xd6\x0e\xac3\xf2\xf5\xcf^|\
-\xe6\x8f~\xeb\x13?z\xe9\xe0\x9b\xbf8\xea\xdb\x80\xe6\
-L\x97kt{\x8b8g\xd8w\xde\x80\xfc\xc1\x95h\
-z\xff\x80\x80\x81\x929\xdc)A\xdbe\xc0\x04\xfa\xd6\
-\xca\x0f\xf0\xa1I\xc0\xeen7\xf4\x9e@\x80\x89\xe5\xee\
-\x1c\xbd\x8e\x00q\xbc\xa2\xa3\xd8itn\x96\xd3\x9dC\
-\xfe\xec\xdb)Wv7\xf0\xae\x14\x92\xc32\x90\xe54\
-c\xb4.\xad\x97\xcbU\xbffSC\xc1\xf8\x00\x0d\xa7\
-X\x0e7(\x8a\x8c\x08\x10\x5c\xee2s(W\xccU\
-\xa0\xdd\xf3+z\xc2\x84\x09\x13>\x14\x98\x08\xa0\x09\x13\
-&Lxo\xb1]\x14Lr@\xac\x02d\xca\x1d\x84\
-\x10-\x18\xe5\x0e\xef\x8b\x10\xe3d1\xdb\xb1\xac\x8a\xca\
-\x0bm\xd9\xcb\xd6\xde\x85@\x84\x0a \xbcWI\x9a\x11\
-\xe0=\x00\x84\x08\x8a\xc8\x83}\xee\xc38\xdb\x87\x0f\xa1\
-x\x18\xeb8eI\x85\x0f\x12\x18h!\x04O\xde\xad\
-W\xa1\xaaC\x15\xc3|q\xf5\xc6\xc1_\xfe\xcd\x0b\x9f\
-\xbd\xd0\xff\xfa\xd7\x9f\x9c\xd7M\xea\xfb`,~\xc2\xa8\
-\xc0\x9a\xbe\xf4\x9c\xd6\x8b\xdd\xf3_\xf9\xec\xb3g\xce4\
-\x9f\xfaD\xfb\xc3\x9f\x5c~\xfe\xe57^}\xfdh\xff\
-\x08\xbdwi\xdd=\xb1\xd7\xccB]\x13\x8f\x9d\xdf\xfd\
-\x8d\xaf\xec\xfe\xeeo\xcd\xbf\xf0i=y\xf6Z\xbb\x7f\
-\xb5f\xacg\xb5_[\xe6\xce\xe3\xce\x0e\x9b\x98\xc4\xd4\
-\xa3\xca\xb3\xfd\xc3\xf0\xfc/o\xfd\xe2\x85Ur\xce\x9a\
-\x90\x90\xfb\x94\x05\xba\x8b\x00\x15K9u(Kte\
-\xc1\xc9<84\x0f\xffIr\x88\xe3B\x15\xd3\x9cR\
-\xa9\x8bp\xaa\x94\xf9\xcaea\xa9\x03d%\xd9\x08C\
-M\xaf\xc1\x0aD\x1c\xaa\x81q\xdc{\xf1^\xa6\xc33\
-\x11b\xb0H\x0902\x92\x06\xca\xc1<\xa4z\x0d\x0e\
-\xae>ZI\x13V\xac\xaf\x9c\x80\x99\xa3\xa9t\xf1|\
-\xfc\xe2gg;g\xa8\xaaNl\xad\xeaD\x02Q \
-UA\x15\xd8!\xac\x00\xc6\xf6\x8c\xa5E\xb6\xb53k\
-\xe0,\x8d^\x87\x1c#2\xd8\x81\x99\xa1g\x90s\xd6\
-\xfa\xfc\xf00^\xb9\xa6\xeb\x87}\xef-\xebH\x04\xcf\
-\x91\x06\xb1\xcf}\x1b\x9bp\xb4\xcc\xdf\xfd\xfeK_\xfc\
-T\xfd\xc4\x85\x8f\xef\x86\x0b]:\x04\xd6\xd6\x10\x22\xfa\
-\x14-\xed\xd5\xbcuK\xd1\xabO\x7f\xe4\x89Y\xb3\xf8\
-\xe8\xd3\xfe\xdd\x1f\x1f\xfc\xe8\x97\xd7\xdf\xb8\xd6\xdd\xbay\
-\xfdh\xe5\x9e\xbd\x82\xefU:\x7f\x1eO\x5c\xc0g>\
-\xf1\xd8?\xff\xe7_\xf9\xda\x17\xf6\x9e\x99\xbf\xc1\xd5\xd5\
-ny# Y\x14,\xc3\x84`\x091\xdb\xacj.\
-\x1cu\xf1'?\x7f\xf3\x07?\xb9\xb1\xbfB\x9c7\x12\
-RnSje\x0c\x8c4\x89\xc6R\x91z\x0c\xb4\x8d\
-\x02\xe4\xf2`dep\xc1\x93\xd0\xcfj\xc4\xda\xf7\xfb\
->f\x89r\xf5\xd9\xdd\x81\x80\xdaT\xc3\xa3(\x9a\xe6\
-\xbb\xf3\xe4\xedj\xbd\x1f\xeb\xf0\xfa\x95\xf6;\x7f\xff\xda\
-\xa7?\xf2\xcc\xb3\xcf<\x89yHG\x07n\xa9\x9a\xd5\
-\xb4\x98VmH\xa0\x83]\xcbs\xf8\xb5_\x7f\xe2w\
-_y\xec\xb9\xebG\xaf\x1c\xad\xad\x99G\xce\x9a\x10\x9b\
-X\xe7\x10\xb3?<\xae\xe2\xbdC\xd1\xc5\x91\x04I\x0e\
-n\xc3\xa5\x92\xe2\xc8qP\x944\xd8\x02k\xf09/\
-\xd5\x16Q\x96\xf2.l\xc1)\xfa\xe6\x9f\xa2;\x07\x8b\
-e\xde\xbel3\x1fp\xcc\xf4hde\xa9\xc1\xb7N\
-C\xe5?\x90\x9464\xd2\xfd\x0e7\xa4Z\x09\xd2\xe0\
-\x1f\xaf\xcdcJ,\xd4r\xc8\xd9\xd7\xedz\xdd\xc5\xdd\
-\x8aD\x80m\x09\x1c\xdf!8*\x1fO.\x041\x88\
-!](\x99^r\xa7+\x18\xeahf\xd4\xc4\x00M\
-\x980\xe1C\x8c\x89\x00\x9a0a\xc2\x84\x87\x88\x00\x14\
-\xf3f\xb4\xf06\x8ea\x09C\x99y\xde\x9a>UI\
-\xf3*\xf5\x87\xe8h2\xacD\xdd%z\xdf\xc4\xec\xc3\
-\xb4k\x1aL\x86\xd0\x12\xb2(\x02d\xe7\xe0\x12l\xf1\
-Ae\x7f\x80\xe3\x08\x86\x02\x12\xe5#M\x12\x02\xcd\x10\
-\xa4DOu]\x83Z\xe5\x1cm7G<\xf7\xf2\xc1\
-\x7f\xfb\xd6k\xbf\xfb\xd9\xc5W?I\x04\xeb\xdb5\xb4\
-\xae\x8b\xb3\xcd\x81bo\x86\xc6\xfa~\xa7\xb9\xfck\x17\
-\x17\x9f8?\xfb\xfd/\xed\xbd~\x19\xaf\xbc|\xf3\xcd\
-\xab\xeb\xa3\x95%\x0f\xb3\x9d\xea\xcc\xce\xee\xd9f\xfe\xe4\
-\xc5\xc5\xc7?Z=u!\xcd\xe2\x11V\xa1]\xcd\xad\
-\xae G^\x85h\x9c\x85\x8c\xdc\xa5\xa5\x9dA\x9a?\
-\xf6\xfc/\xce\xfd\xc5\x9f\xff\xea\xb9\xe7eM\xcd&\x1e\
-\xa46Ye1\xf4)\xc7\x1c+\xec\x99(\x88X\xcb\
-\xd7)/s\xe8-&\xa4\x12\xc4`\xe0N\xe0\xc5\xe1\
-9\x1a\x22r\xa5D2\x16;\x9f\xec\xd1%\xc8\xd4\x01\
-!\x0a\xc1\x1b(0\x04\x8a\x96\x19\x99 \x85\x8c\x90\x11\
-$0Q\xfd\x98\xf9\xb5\xe9N\xcf\xb9\x0f\x993\x8b\x0d\
-Sv\x0fB$\x98\x91\xdd\x83\x0b\x96\x83g\xcb\x08\xb9\
-L\xeegdX\x80\x91P\x05E\x0bJ\xedR)}\
-\xe6#;\xff\x97\xff\xc3\xd3\xeb~!T\xb0\xce\xaa\x96\
-\x0e\xaa25\xccs\xa0\x06\x93\xb8\x84\xb5nK\xc4#\
-\xa1u&\x0e\xc9j\x8d\x92\x05\x8f\x11\x06\x05W+\xeb\
-\x13]\xac\xac\xbex\xf9r\xff\xa7\x7f\xfe\xc2\x9f}\xab\
-[\xfa\x13\x1e\x16\xa2#\xefI\x19X*\x98\x85\x88\x9c\
-\x7f\xf1\xda\xe1\x7f\xfa\xc6\xd5\xb3g\x9e\xfd\xbd\xdf\xfc\xe4\
-\xf9\x0b\xb9[\xff\xc2:\xaf=Y#$TG;{\
-y\xd7\xda:\xd4\xe9ca\xf9\xcc\x97w\xfe\xd9\xaf?\
-\xfe\xd2\xd5\xe6\xa5\xd7.\xbf~iys?\xf4]`\
-\xe6\x85\x05>\xfeT\xf8\xf83;O<~\xf1\x89\xf3\
-}\xc3KX]F\xbaivd\x9e\xe1@pT\x82\
-\xd6\xcb\xd5\xdc\x17\x1f]\x5c\xf8\xd2\xcf~t\xeb\xdf\xfd\
-\xd9\x8b\xbf\xb8\xdc\xf7\x8by\xe2\x0c\x01\x19\xabv}\x18\
-\x92*,\x12\xba\x8c>dD H%\xd9\x8e\xa9'\
-C\xa0\xd0g\x97h`\xddE\x1c\x19\xd7F:\xd8#\
-9:\x04Y\xc8\xf4\x1a\xdd\xae\xf2\x05x@\x5c\xcb\x96\
-\xd9\xda>\x1e!\xac#p\xf5 \x7f\xe3[\xfa\xd8\xd3\
-\xf5\x97\xff\xd7\x9f\xbc\xb0\x88\xfd\xe1\xcdV]\x15z\x18\
-\x0c\xd1\x9d\xd1\x84\x94\xd0\xbe\xf0\xc4\xb9\xdd?\xfa\x17\xfe\
-\xe2\xfe\xe2\xdf\xfd\xcd\xf2\xfa\xfe\xe1\xb9\x9d\xb3\xf3Py\
-\xd7{\x95F\xdd\xe0\x07\x01$Ba=\x06\xf5K!\
-3Bq\x08\x1b\x1e\xb9Y\x03W\xc2-K\xacG\xdb\
-\x13\xa8\x9c7n\xafr\x1f\x80\xbcE\x00\x1dC\x1b\xae\
-\xe8]\x9f\xf1\xc6\xc7\x0c\x19\x94\xb2\x04\xd1\xb2d\xc1\xe8\
-\xe1p\xb9^\xa7\x19b\x85\x14\xc6\x15Os\xccQ\xd8\
-t\xefv8\x00\x84@\xc9\x81\xdcT\x5c\xccb`>\
-\xc5\xb1&L\x980\xe1\x03\x83\x89\x00\x9a0a\xc2\x84\
-\x87\x88Qz\x01\xa8\x14\x9e)\xf3\xa3w\xc9\xd2\x1a\x95\
-\x01V\xde\xe0\x19\x1c\xb1\x08\x82\x86W\xf7m\xbd\x8b\x13\
-\x83\xd4(\xc2\x8d\xa5\x108\x02\xb2#\xac?(q\xdc\
-\xfd\xb1\xa1\x816\x7f\x1a\xe5 \xe4N*\xc6\x00\xa1\xcf\
-p\xc68\x9f[\xee\x9e{q\xfd_\xbf\xf9\xe2\x99f\
-\xef\x93\x9f>\xafy\xee\xae\xdfj\xd7\xde\x04 !d\
-\x06\x10\xfd:w+o\xe2l\xb6\xf3\xd1\x8b\xbb\xcf<\
-v\xe6\xab\x9f\xb9\xb8Z\xb1\xd7\x0c\xb6\xe3\xca\xee\xa9!\
-\xe71G[\xb2;\xf2\xc3}\xd3\xba\x095\xda\x84v\
-e\x160\xaf`\x19\x9e\xea\xd9<\x9e\xe5K\xd7\x97\xdf\
-\xfa\x9b\x97\xfe\xf1\xc7\x87\x87k\xec\xccC&\xb2\x8b&\
-1g\xe5\x88\x10X\x1b\x91QD=\xbd\x98\x10r)\
-\x14^F\x89\x11\xd1\x0c!\x86\x00+\xdc\xa1\x049\xe9\
-\x06\x1a4\xf2\x83\xa5\x86{YH\x80v<\xd9?\xaa\
-NJ\xe6\x0b\x05\xf3\xdbMX)\xc2!J\xc8\xc9\xb3\
-\xfa\x982-\xd0d\x06b\xa8$oB \xcdl0\
-yM\xc8@p#HI\xa9s\xef\xcf\xec\xd4\xe7.\
-\x9c\x01\xe7\xca!\xc4X5\xf3 Z\x8e\xf4\x06y\x0e\
-T\xa0\xc03\xb0\xa3\xbe~-\xc7\x96\xec\xc1<\x18\x19\
-\xc1\x91e\x0es\xb9\xcb\x01\x06&R!\xd4\xb3\xf9k\
-\x17\xf0\xb3\x1fv3\xae\xe8k1\x08\x02*9a\xd1\
-\x18\xc0\x10fU\xb7\xea\xff\xf1\xb9\x9b\x7f\xf2\xcd\x9f=\
-v\xfe\xa3\xbf\xf3\xeb\x0b`\xde\xb5G\x81\xb2\x06\xc8\x86\
-u\xd5\xc4\x05`j[\xf8\x92Z\x9f?\xb7{\xe6\xb3\
-\xf5\xe7>\xf5\xf4\xba\xb76\x05\xcfb\xc2\x9c\xbeW\xe5\
-y \x1ci\xf5J\xbf\x5cU\xd6\xc2\x96\x11\xedp;\
-;\xd0#\xc1\xc3l'\xec=\xf1\xda\xd5\xf57\xbf\xfd\
-\xab\x1f\xfc\xe3\xd12#\xec4\xab68z\x8b\x08\x0d\
-\xa3G\x83Q\x19Y\xc8\x82C\xa3Y\xb9\xe4Tfa\
-\x81\x07\xfe!\xc3\xd7}\xee\xdc\x09Pt\xc1\x8b\xf6\xca\
-i@\x05\xcd\x08Ky\x9d\xdd\x19\xb2\xaa\x1c\xa2C\xee\
-\x91\x97\xae\xeb;\xdf\xbb\xf1\xaf>\xf1\xe6\xef}J\xd5\
-|\xd1VG\x9d/\xa10\x9f/\x80\x84e\x86\x90\x0e\
-^3\xce>\xff\xe9\x8f\xff\xe1\xff\xb8\xfb\xfc\xe5\x17\xbe\
-\xfd\xc3\xb6;Z\xd7ls6Xf\xc5\x0fB\x9e\xcc\
-=s\x99\xb650wY\x85\xdb\xd4\xc2\x83z~\x9e\
-:\xb3\xea\x94\xd8Ha\xee\x5c\xf8p\xbf\x12\x86\x9e\xa6\
-\x03\x04]h\xbb.\xb9\xc0\x08\x19pz:Fo\x99\
-\xdb\xbc\x99O\xa1\xa8\x1c\x02\xea\xca\xcc2\xde\x8e\xa0i\
-\xc2\x84\x09\x13>\xa0\x98\x08\xa0\x09\x13&Lxxp\
-\x98\x06\x03J\x0d\xde\xaf\x85\x14\xe2\xf8*+\x039\x98\
-\xda\x14\xdb\x08\x18@\xa7g[\x95\xf9\xea\x12\x97iH\
-`(\x9b\x97\xdds+\xc6(\xdb\x0a\xec?Lo\xba\
-\xe5}?\x0c\xfa(9U\x18\x90\x04t\x80\x95\xb2T\
-\xb40;s\xe6\xfa\xd1\xe1\xbf\xff\xc6A]\xaf\xff\xe7\
-\xf9\x85O|\xf4\xd9p6\xa6[\x97\xcd\xfb\x18\xc9\x92\
-\x00\x11\x85*\xa9j\xbb\xb4F\xbfo\x98\x05\x5c8W\
-\x9f\x15\xd7\x19G\xaeN\xdeAI\xae\x94{\xf35\xd0\
-\xc2Z\x0b\x19\x9e\xd08fU\xae\xd59\xac\xbe`\xcd\
-\xd97\x0f\xfc\x1b\x7fs\xe9\xcf\xfe\xf2\xd2\xd5\x9b^U\
-\x8b\xac&\x09\x0c\x19\x01\xce\x04\xba\x80>g\xf4\xc1\xc1\
-$sFD8S6\x1f\xf4aF\x07\x12-*\xc8\
-\xe5\x09}\x8fT\xbc;\xc6\x910H\xcaJ\xc2W\x06\
-\x07\x83\x8d!\x94\x17PV,F\xd9\xd9M2 P\
-i\x13\x15f\xc0\xc0P51T9{\xca.\x92\x94\
-{\x02;3g0\xf3q\xc4\x92\xb0\x888\xb7\xdcd\
-\xcf.\x12\x1e\xacg\xf0*f\x04&\x1e\xe4\xaes\x04\
-\x829Qk\x06\x0d\xe5\xed\xe1\x06EP\xa2\x83}\x8a\
-K\x8f]\xb1 \x81\x04\xf4\x80\x90r\xf0\xcarv%\
-0\xab\xf6\x1c]a\xe9\xfda\xbb\x0f\xad\xaa\xcaW\xb4\
-#\x86\xcaR].\xad+:r\x82\xcch\xf3\xf9\xad\
-\xe5\xfao\xfe\xfe\x95\xc5\xce\xcd\xdd3\xcf\xfe\xfag?\
-fvu\x7f\xffz\xe8\xf2\x990\xb7E\x8d\xee(w\
-\x1d\x83[\xe5\xbd\xf6\xd77\xafs\xd5\xd4\xb3ym\x95\
-b\x0835&\xf6\xe8\x97]w\xd8*\xf7\x8af\x15\
-r\xdf\x99'F\xa0\x06\x0cHX;\xd3\xecB\xdc\xfb\
-\xd8-\xed\xfc\xe9\xdf\xfe\xe2\xbf\xfe\xf5//\x1f!\xec\
-\xc6l\xf0\xd8w\xba\x1a,4\xf3yX5\x10('\
-\x8b[\xb7\x05\xaf\x0d\x15\xcc\x89Z^\x83B\x1c\xc7/\
-\x91h\x1e\xccc\xe7X\x99A4\x8a!\xd7R\x15\x14\
-\xa2\x03rW\x06S\xa8\x12b\xdfu\xadY\xa8\xf7\x9a\
-N\xe9'?;\xfc\xc6_\xbd\xf1\xb9\x0b\x17/~\xfc\
-bH\xfd\xd1\xe1J\xee\xb3\x9d\xdaL\xfd\xaa\x0bu\x84\
-\x94s\xbf\xbbs\xf4\x1b_\xa8\xfe\xf0wx\xfd\x12^\
-z\xf9\x9a7\xaa\xab\xa6cQ\x84=\xfa\xcf\x8dQ\xfd\
-\xa2BgyI\xef\x22KQ\xaa\x81\xe7\x09\xdb'*\
-\x89\x1cx\xfa\xd1v\xed\xce\xe2\xe9\xa7u\xc8y\x88\xd8\
-8\xc3\xf36\xc2G\x1bj\xe8N\xdd\x8d\xfb\x96\x18\xa7\
-l>\xe2\xed\xb4~\xa3J\xbd\x0d\x1c\xfc\xdc3\x91\x91\
-S\xce)x\xf2\xe2Z\xe6\x19\xa6\xb7(P\xff.\x90\
-1$\x94\xb2TV\xa8\x8d\xd1\x1eYQ\xd7\x84\x09\x13\
-&<\x08L\x04\xd0\x84\x09\x13&<<8\xad\xa4j\
-\x1921\x04\xe6\x83\xdd\xed\xb1'E\x05\x18\x10\x00B\
-\x06\x05\x80\xd9V)\xb44\xb9`\xbem\xb9r\xc7|\
-\xee\xe6\x0d|(\xb0\xf2\x81/\x03\xbf\x99\xcb\x956\x06\
-\xae\x8a\xa3\x1f\xe8Hk\xb0\x07\x22`\x0e\x03\xe9\xd6\xe4\
-\xe8/\xdfX\xfd\x97\xbf\xea\x97|\xf3\x8f\xff\xa7\xf0\xd5\
-\xcf\x9c\xd9\xa9s\x7fc\xbf[\xa7*\xcb\xe8T\x1bB\
-\x17\x82\x8a\xc4\x03\xf9\x96\xba\x03\xe0\xbc\xe3\xa0\xd7~0\
-4\x15\x18\xe0\xa0<Z\x96\x92S\x02\x85\x1ah\x80\xa6\
-[w\xddR]]_<j\xc3\xb7\xffa\xfd'\x7f\
-\xb1~\xfeW\xe8}Q\xcf\xf7\x92\xc5l\x9d\x85\x1et\
-3\xaf+B\xcc\xc9,\x05\xa1h\xc3\xfa\x92\xa3\xe5D\
-\x8c\x85\x19\x0c\xae\xdc\xa5\xdc\xe4\xec\x99\x02, (\xd0\
-!\x88\x22\xc5(X\xd1\x94\x08\x01\xce\xb1\x9e\xfa0T\
-L\x1a\xec\x80\x062\x88\x0c\xb2\xa0\xe2\x12\xb41\x8b\x8d\
-n!D\x8b\x94\x0c\xac\xab\xba\xaa\xab\xd4\xf79gW\
-K\xab\xc0\x98\xe5}\xef]\x9bS\xdb#\x13n\x83\x18\
-I\xbd\x15'\x10\x22\x10\xb4T\xf1(\x94\x13\xca`\x06\
-\x1d\xc8\xa3M\xab\x1f\xcb\x11*\xc0\x1d0\xf8v\x89\x9e\
-\x1e1\x91\x1c\xe2xwt\x09Y9\xda\xee,\xcfw\
-\x9c3\x82\xe1P\xa8\xa89\x15\x05BI\x86L\xcf\x06\
-\xd6\xb5\xba\xf9\x95\xfd\xa3?\xff\xd6\xc1b\xefJ\xb3w\
-\xf6\x8b\x9f\xdc\x9b\xd5:\xbc\xba\xdfu\x98\x01h\xd7\x96\
-\x0f\xb0\xf0\xb8k\xb1\xf6yF\xdb\x1d\xa2\x1f\xb8S\x18\
-\x92\x80\x0c\xf4\xa8\x05\x06 \x10fJ\x99\x01h \xc1\
-\x13\xacB\x98\xb1\x0d\xf3\xfd\x0e?\xfc\xc5\x1b\xff\xf5\xaf\
-\xde\xf8\xd1\xaf\x5c3\xc4\x18s\x86[\x9fm\xe9ug\
-i\x8f\xddE\xa2\x0ef\xb0h\xd1\x22\x19PS\x01\x09\
-R\x00bN\x9d\x95\x92I\x84\xc9\xddd\x15\xad\x12\xd9\
-\xca(\x01\x0aP\xa0\x22\x15M\xd1\x1cU\xaca\x86\xd8\
-\xe5j\x95\xfb\x9c\x18\xab\xdd]\xeb\xe6\x97\xae\xf9\xb7\xbe\
-\xdf\xfe\xc1o.\xff\xe0\xf3A}\xf2\x15H)\xad\x84\
-\x0a\xf39\x83\xc7&)\xa6\xa3\xc3W\xce6\xbb_\xff\
-\xeds\xbf\xfa\xe5\xadK\xaf\xaeM\x87u\xdd\xb5I\x1a\
-\xee\xa0G\x18\x1b\x03\x9f2\x1e\x07;\x1c\xe3\xe8@\x0e\
-Hd\x11\xd2\x09\xf4\xc2\x92\xbak\xb4f\x1a\xb3\xc3n\
-wC:\xb5\x82\xe6\x94\x89N\xa7;\x96\xc0\xc1rN\
-\xbeuT\x99;\x1d\x83\xdb\x8f\xa4M\xed\xc0\xc16M\
-\xa0\x8c(\x96_e\xbeaX\xef-\x1b_xh\xde\
-\x96sF\x81\x90\x91&Y\x86%\xc7\xba\xcd);,\
-\xc0\x82z:\xfc\xc1\xf0?\xb7\xebzD\x03\xe4\xa0\x11\
-\x8e\xdc\x1b|\x11cee\xea\xe5\x83\x9c\x17=a\xc2\
-\x84\x09\xf7\xc1D\x00M\x980a\xc2\xc3\x03\xa5R\x09\
-\xc6\xb6\xa7WG\xffQ\x15N\x88\xc5\x94\xd7Y\x5c{\
-a\x00\x0d^y\xb0\xe2\xcd\xe9\xc3\x9b6F\x92c\xeb\
-\xedy\x13\xac\x8c\xb3\xd7\x1f\xa2\xb7\x5c\x1d\xc7f\xc5\xb9\
-\x18\x1c\x9d@%$\xc0\x85\x002!da\xb6;\x9b\
-\xc5\xdd_\xbe\xb9:\xfa\xc6\xd5\xce\x97}\xf7\xf4\xe7\x9e\
-9\xbb;?\xebv\xd4/oV\xec-\xb8\xf7P\x07\
-\x0c\x05e\x88XA\xc1\xaa\xb0\x88\x80C\x8e\x9c\xd1g\
-)\xf5\x01\x0c\x08\x8c\xc1C\xee-u=\xb2\xa3\xb7s\
-\xb9\xb9x\xe5h\xf1\xdd\x1f\x5c\xf9\xf7\xff\xf9\xe5\xef\xff\
-49\xeb\xf9b\x9eC\x9d%)\x08\x9eR\x92\xf51\
-\xd4\xa1fd\x0e\x9d\xfa\xce@\x17\xe8^'\xafs\x9f\
-\x98\x831\x0a\xd6\xc9z1\xb1\xf1`\xd6,\x9a\x9d\x5c\
-k\xde\x9bI\xe6\x08\xc5\x10\x5c\xa4T\xcc\x82\xa2,A\
-Yd\xa6\x9cb\x91\x03\x183,#&\xc6l3X\
-\x92\x03J`f0\x87\x8b\x15<\xac\xfb\xd4&\xefU\
-\xc24H\xc8)\x11)\xc6h\x81\xa1c\x16:W\x82\
-\xc3\xe5\x88\x09t\xf7\xca!\x87\x93)\x17[n\xc1\xb2\
-2\x0c\x08\xc5\x89|\xe4V\x802\xb4\x8b\xcf\x15\x81\x08\
-\x03\xad7\xcb\xc7\xb97\xd6 D\x00P\xef\xe8\xb2\xd4\
-:\x9c&\x85NU\x87\xaa\x07 \x83\x9b\xc1\x9d\xbd!\
-I%%R\x99\x02\xd5\xec\xd4\x8b\xbd\xb37\xd6\xdd\x7f\
-\xfc\xd3+\x07\x87W\xff7\x7f|\xf1k_\xfe\xf4\xde\
-E\xb4W\xdeT\x7f\x18\xe6\x0e\xab0\x07\x83\xd3]\xb9\
-(\x15B\x08N)\xf5\xcc=M\x16\xa3\xd1\x08fo\
-\x93+\xfb\xacB\xd5x\xf2\xee\x08b\xb3\xd8\xd9\xeb\xeb\
-\x9d\x97\xdfH?x\xee\x85?\xff\xdb\x9b\x7f\xf7\x83\xac\
-\xba\xde}l\xd6f\xa5\x94,\xc6h\x01\x8e\xdc%G\
-\x1f,(\x80\x16\x04f\xb2\x17\xdb\x96\x84z4\xc1\xe6\
-9\xf5L\x11\x06\x8f \x9ad\xf3\xdez\xb7#\x85\x95\
-\xa1\x86f\xc8\xc6B\x0a\xab'\x0f,\x10\xd6\x8b\xc8\xce\
-\x9c,\xe7\xec)\xd7Q\xf5l.K\xbf|\xed\xda\x9f\
-~\xe7\xd6c\x1f\x7f\xfa\xf1\xa7/TM`\xbf\x5c\xaf\
-R\x13\x9a\xea\xfcy\xefZF\x0a~t\xb5\xc59\xfb\
-\xf5O?\xf1\xfb\xbfU\xfd\xe4G\xaf^\xb9\xbe\x8e\x88\
-\xdcbU\x1fY\x08@\x08\xcc\x83E\xb0@\xc1\xb6\xb8\
-\x9bbS<\xe4C\xda\xc8G\x0a\xa0\x5c'\x1e\xcd'\
-3$\xf5h\xf4M\xe1n\x04\x0c\xae\xd7\xc7\x1f\xb8\x94\
-\x11\xec8\x19t\xb3~I'\x06\x00\x1aHb\xdb\xfa\
-\xd9O\xad\xd2q\x14\x83}\x03\x19\x88\xec\xb6j\xbdO\
-\x19\xd6\x80\x15\xb0<\xfe2{\xa0`\x11\xfe\xa8$D\
-;r\xb2\xe0\xf3\xa6\x8e\xb1\xff \xa47N\x980a\
-\xc2i1\x11@\x13&L\x98\xf0\x90 \xc0\x90\xc38\
-\x19}\xcc\x00qx\xefv\x96\x0c\x84\x0e\xc5\xcf9\x0f\
-9]\x00kUU\x9eA\x92\x15^\xc7G\xf1\x90\xc6\
-wv`K\xda1\xb0L\x00\x98O_d\xe5\xd1\x02\
-]#\xb7f\x02\x10\x0d0e\xc2E9z\x00\x99\x96\
-Yg\xc4l\x968?\x0a\xb3\x0e7\x8e\xae\x5c\xef\xfe\
-jy\xf5\xc6\x8d\xaf\xff\xce\xec\xb7\x7f\xed\xe2S\x8f=\
-f;u\xdb\xddt\x87\xe7\xa5zT\x86*\x06\xe3\x82\
-\xdd\x22\xf7\xd9:7\x0e\xe6\x1a\x0c\x88\x06\xaf\x003Z\
-\x95\xa9\x95\xa7dP\x05\xaf\xf6\xfa\xea\xe9\xab\xfb\x8f\x7f\
-\xe7\x07\xed\xff\xef?w\xdf\xfd\xae\x02y\xee\xec\x5c\xaa\
-\x96=r\x88\x849\xd0{\xe7r\x04J\xbd\x8c\x1e\xe8\
-\x88Yj\xb3\xf7y\x8e\xd4)\xf5JUd\x84\xb1\x03\
-<\x04\x8f;\x1e\x98\xacM\xe697\x19F\xc0\xcd\xc4\
-\xe8\xec\x86I|\xc4\xccZX\xd1:\x0f\xec,\x96\x04\
--\x91`0\xc6\x8e\xd5Zu\xab\x19P\xca0\xb7\xae\
-T\xa1\xea\x91\x93\xea\xe0uB\xeea\x9d'z\x17\xd0\
-uH\x0a^G1\xca\x91\xc4\xc4H\x9b\xc5\xd0\xd4h\
-fb\xca9\xb9y\x88\x89%\xea\xa4\x1c\x09\xe81\x0e\
-S&\xc0e\xbe\xc5.\xb0\x04\x9dY2X\x05\x99\x90\
-p\xec\xe7$\xa8v\xeePI\x02\xe4\x8e^\x11n\xe8\
-\x19\x97^\xdf\xea\xc3~\x07\xafc\xa5h\xea8\xa4\xb4\
-\xb8C*e\xccfU\x12\x8er\x1f\x16\xd5\xe5\xc3\xf5\
-\x7f\xf9\x86\xde\xb8|\xf0\xc6\xbf\xe1?\xfb\xeaG\xce\xec\
-T\xd8\xf9U\xad6\xb9r\xdf3+\x02\x8d\xb1\x8e\x06\
-E\xf5\xc8]\x80\xea\x80\x10C\xc5\xc6\x102\xf2\xcau\
-\xd4\xf5y\x9d\x22l\x1eB\x833{\xa1>\xbbn\xce\
-\xbc\xf0f\xfe\xf3\xef\xbc\xf2\xa7\x7fs\xf3\x1f~\x9eo\
-\xb5\xd8}b\x07\xcd^\xbf<\xb2\x90\xcc\x00\xe4\x90\x05\
-fV\xa2e\x0f\x9eD:;\xb1S\xcc\x9a'S\x0e\
-{\xd0\x8e{oX3\x98*\xcb\xf5\xcez\xbd\xbb\xf4\
-u\x8b\xb5\xe2\xbex\x0e\xbe\xa0/\x0c\x99t\xe3\xda\xc2\
-\xda\x08\x09\xde\xe7\xde\x90C\x84y\xee\xf3\xaa\xedvT\
--v\xf6\x0e\x0f\x8e\xbe\xf1\x83\xc3\xc7\x9fM\x7f\xfc\xbf\
-\xfa\xc8\x13\x17gmz\xa9w\x18\x1c\x9es\xe7\x11\xb5\
-rZ\xe46j]\xc7\xa3\xdf\xfd\xc2\xce\x0b_\xdb\xfb\
-\xf3o\x1d\x5c:8D\x5c\x14%\x19\xdfR\xf4\xf1~\
-\xc5\x96\xd8\x86\x10\xdc\x07U\x1a0\xf0\x1a\x12 ;v\
-R+rK\x8c\xf5\xf5\xca\x92;w6\xa4\x91\x9d\x82\
-\xad\xe0\xb8\xab\x87\x03A6\xb2\xadw\xb4v\xc3\xe4\x1c\
-\x13b%gV\xc7\xa9\x9d\xc7{:%Y2$\xd2\
-\x8e\x93\x1e\x1a\xd2T\x83\x10\xd6}\xdf\xf6\x0e\x0b`\x05\
-\x04\xbe\x0b\x1b\xa0;\xa1\xed\xa9\x00\x01r\xc0$0g\
-\xc2gu\xa8\x82\x9d\xb0\xbd\x9f0a\xc2\x84\x0f\x19&\
-\x02h\xc2\x84\x09\x13\x1e\x12\x8e'$!\xf0Dxq\
-\x1c\x17\x0c\xda\x1e\x00\xdb\xa2{QCI^\x1f\x1d\x80\
-8X?\xdf\xeb\xe5\xfcQ\x8d\xdc\xde\x1d6\x91\x1bK\
-B\x03$\xc8\x10\xb2\xc1Q\x94!@\x11\xa2tY9\
-\xab\xd9\x99\x05_\xbc~u\xfd\xcd\xef\xdc<\xb8yt\
-\xb4\x7f\xe97\xbf\xf2\xd4\xc7\x9e\x0c\xf3\xf9.D\xef\xc4\
-\xd0\x01P\xa8\x5c\x8d\x02\x95\x93r\xd6\x9a4\x89\xf0P\
-\x92\xf1\xa2[\x9dQ%\xf7\xacz\xe7\xdcN\xbd\xb7{\
-m\xbf\x7f\xee\x17W\xbf\xfd\xfd7\xff\xfc[\xfd\xdf\xfd\
-\xa8c\x98\x9f;WQ\xb9k\xfb\x94\x22b\xc9\xb2\x92\
-yt\xf4\x8e\xac\x9c\x5c\x16\x18\x0d\x81Q2\xc2f\x8c\
-\x88U\x88\x8c\x01P\xb0X\x911\x86\xb8\x80y\xf6\xd0\
-u}\x9b\x92\xc5\x19\xcd$8,\x0d\xa3\xc7\x86\xf1b\
-\x10\xdd\x99I/\xa9\x83%\x1as\xd2i\x0a\x8d\xc2\x9c\
-\xa1\xb8\x11\x070\xb3\xaa$W\xa8\x18\xe7\xb1\xe9\xabf\
-\x16j\xef\xe0]j\xbb\xe418+\xba\xd2j\xe5\xeb\
-\xae\xcd\x0bg\xa8X5\xa8\x1a\xa5N2!\xc3\xa2\x86\
-\xd8SB\xaf\xe2Y\x5ch\x1e\x12\x0a\x10\x87\xf2\xd0t\
-!\x0fU\xe8- \xd7\xf0\xa0(\xc5v\xd0\xc0\x89L\
-5\xbc\x82\x19\xc9\x10\xa2\xd5G\xb1\x12\xc2.\xc2\x9e\xc2\
-\x22s\x9e\x18\x85h\xc3\xad\xe2\xc2`\xb1%\xa0d\xc1\
-\xe5\x94\xdb\xbe\x9d\x19ww\xe6\xb9M?\xfcq:\xdc\
-\xff\xf1\x1b\xaf\xbe\xf4{_\xdb\xfb\xf4\xc7\x9a\xc5\xde\x85\
-\x0a\xe8V\xeb~u\xe4}\xeb$\x1d\xe83RE\x9b\
-\x19\x1b2f\xc0\xfb\xa4>\x03\xb4\xd0X\x08\x86=\xd6\
-{\xf3\xf9\x0e\xe3\xd9\xfd\xa3\xf0\x8b\x9f_\xfe\xc6\xdf\xbe\
-\xfa\x17\x7f\xbb\xff\x8f/\xfa\xfe:\xcc\xcf\xcfB=?\
-\xearr\xce\x9a9\xd0{\x0f3\x06\x06\x18\xc4\x9c\xe5\
-\xd9e\x10\xcd,\xce\xeb\x86M\x15\xfa~\xd6w\x15\xd1\
-\x84j\x16\xaa\xe8\x15\x13\xea6\xc7.\x85\xe4\x14{\xd2\
-KW@$z\x22\x93\x99\x80d\x12\xe4f\xacfU\
-\xec\xb5\xca9'\xa5Y\x1d\xd9\xec\xbcz\xe9\xf0{?\
-\xd8\xff\xed\xdf~\xfa\xc9'v-\xec\xccw\x18}\xb6\
->\xf4\xa0&gu\xed\xaajv\x82\xfb\xe1\x95\x9b\x1f\
-\xb9\xf8\xf9?\xfc\x1f\x9e~\xf1\xb5\xe7^\xfc\xce\x1b\xeb\
-yW53r\xe38\xff\xc8B\x80\x0fB\x18\x1b\xf4\
-o%\xa1\xc9\x81P\xfe\x92\xb6\xa9\x19#\xc5\xdb\xf8\x9d\
-!\xb1t\xc3\x94\x84;\x19\x95\xb7\xdd\x9a\x87&\x1d\x12\
-dt+\xba\xa7\xc1\x06\xa7\xdc\x16f\xe6\x1c\x15Ow\
-\xdb\x900\xd26J\xa9\x92_\xfav\xe5?w3\x00\
-\x1aad\x88\x06\x84\xb6\xeb\xdb.\x8d\xdf\x83\xe1\xbd\xec\
-\x16\x01\xc5\xf4\x09\xf4LhVWu\xd8\xf0b\x8f\xf8\
-\xf0\x9e0a\xc2\x84Sa\x22\x80&L\x980\xe1\xe1\
-@\x00\x90\x1ax\x0d8\xd8\x83\x0e\xcb\xc3t\xb2\x00\xc2\
-\x196+\x9a2\x95\x87H$\x03\x9e \x17`\x83\xc3\
-\x82\x8d\x16*'\x9c:y\x97\x17\xda\x0f\xba\xfcgp\
-\xeb\xc0\xf1\x1c;\x0dn,\xf5\xb5\x04\xb2\x85zX\x9f\
-\x09Y\xa0\x820\xcb\x0a\x0a\x09\xbb9\xc7\xb9u\xf3t\
-\xab\xbd\xb4\xbf\xff\x9d\xef\xef_\xba\xd4\xfe\xf0g\xb7~\
-\xeb\xd7\xce\xff\xc6o<\xfb\xf8c\x17+\xae\xab\x99\xc0\
-u\xce\x87\xc9\x0f0\xbf\xd5\xecx\xe5\xce\xce%$\x87\
-\x08\x85\x19\xe3\x1emO\xd8\x0d\xda!\xce\xdc\xbaY\xbf\
-\xf2\xdc\xfew~\xf0\xfc7\xbf\x7f\xe5\xb9\x97q\xf9\x08\
-\xdak\xea\xdd\xbaG\xef\xcb\xa3\xccu\xac\x16\x0au\x82\
-g\xaf,6\xd1\x5c\xecB\xb5\x8e\xc1*U\xb6\xafj\
-\xee\xcd<\xec\xccgU\xda\x8dX\x85b,Mz\xe5\
-\xb2\x18gMh\x92[\xb5\xcajQ\xd76w\x86\xcc\
-,\xc4\xacU\x0f\x82\xacP\x13\x8dS9v\xd9\x90\xad\
-\xee\xe5\xc1B\x0e\x86`\xb2\xca\xad\xb6\xba\xaa\xe7s\xae\
- \xb3\xec\x95\x90\xe3\xacq\x01\xb1\x8a\xcd\xac\x9ew\xcd\
-\x8eBS\x8b\x96\xe8\x1e\x94b^\xa3E\xa8\xb0\xbb`\
-\x08\xac\xfaz\xc7\xe6\xbb\x11s\x8b\x88\x0b\x11\x8c\xa1\xad\
-\x91j\xb3\xaa2\x93\xb2\x98\x87!*\xa3\xd7\xb0\x0aN\
-\xc0\xc1\x8c\xb0\xa6\xad\x10\xdc\xcdM\xb1j\x9fD\xdaE\
-u\x03\xd5\xcd1\x17'\x22\x9dC\xda\x05;h\x09;\
-\xf4xC1\xa1z\x8c\xcd\xd3a\xe7\x19\xcek\xc5\xb5\
-\x5c\xcc\x0b\xe3\x12\xb6\xf6\xd1\xe2\xd7,g\xf3eZ\x9b\
-ysf\xa7_=\xb6l\xe3\xc2B\xbb\xd2O~\xfa\
-\xfa\x8d\x1bo\xbc\xf4\xca\xd5/\x7f\xe5\xe9\xcf}\xee\x89\
-O~\xf4\xdc\xd9]0^\xf3\xd5\x9b\xf2[\xc6\x9e\xb3\
-\x80.!\x1f\x00\xadT\xc1\xd9Kn\xb4\xaa\xaafu\
-\x9c\x9d]\xc4g\x0eW\xb3\x97\xaev\xaf\xbf\xde\xfd\xfc\
-\x97\x87\xff\xf0\xa3W\xff\xeeG\xd7^\xb9\xd5\xf4\xe1\xe9\
-\xb83\xf78[\xad\xd1uk\x22\x22\xb1b\x85\x1e\x15\
-\x9c\xa1Y#%\xe6lr\x13L2\xc6\xba\xaa\x9b\xce\
-\xa2\xd5M\xc3x\xc6\xe0UM\x04s\xba\x9a&\xe2\x5c\
-}\xd6\xe3\xec\x15\xacZ\xa8\xa7?\x015\xc4\x81\xf1F\
-@\x1bl\x1d \xa1\xaa\xaby\xe6\xa2mC\xa8P\xc5\
-\x98r\x8f\xd4+,1\xab\x97\xed\x85\x9f>o\x7f\xff\
-\xb7\xebg\xce\x9e\xf9\xf8\xc5\xc7\xb1w\x0b]\x1d\xc3\xcc\
-\xec<\xba\xdd\xbaK\x8c7\xd1_\xd9[e\xfb\xb8\xfe\
-\xc7\xdf\xf9\xc4\xa5\xd7?v\xe5\xfa\x0f\x7fr\xe5\xe5U\
-\xeeCx$l\x80\x8c\xc76g\xc2\xe8fS\xc2~\
-\x22\x08\x96U\xc4a\x0e9F\xb35\xa3\x8d\xf68\x04\
-\xdc9\x10\xf4f\xb8\x8d\x17\xd0\xedz\x9fS\x13@~\
-\xd7\x07\xf4{\x04\x89\xa6\x92C\xac\xd1\xf2\x19\x00iF\
-\x18|\xf8^\x18-\xa2\x07\xed\x8f\x8f\x99a\xe5{\xc9\
-\xa5\xa2\x22\x12\xee\xe0\xc5\xeev\xccq~\xa38\xf0\xc3\
-YX7B\xcc\xaeDE\xa3#\xa4N\xa9[!\xf7\
-\x123\x11yj.F'h\xb5\xa1\x06\xc2\xf0\xa5H\
-3R\xc8B4\xc2\xe1\x99\xf2*\xd6\x16\xa2\xb4\x9e\xd8\
-\x9f\x09\x13&|h1\x11@\x13&L\x98\xf0\x10\xa1\
-\x92/T\x02\xd5\x0cz)\x02=z@o\xcf\xb2\xfa\
-\x89\xd7\xed!\xa9e\x94\xb6\x1b\x00n\xd6\xbe\xc7\x9bl\
-\xd1\xd5?\x0aA\xdc\x03\x06\x81\x80\xc1\x904\x97\xf8\xc3\
-\xe1\x03q6\x98\x5c0I\x9d\xba\xceU\xfb\xbc\x8e\xd5\
-|\xb7\xeaZ\xfd\xf4\xa5\x83\x97_\xef\x9f\xfb\xf9\xd5\xef\
-\xfdD\x1f\x7fv\xf6\xa9\x8f\x84O~\xe2\xcc\xe3\x17\xe6\
-u \xc3*V\xbd52\x19\xd2\x9c^\xd7\x00\x18\x85\
-\xf9\xba\x9f\x1d.\xe3j\xcd\xa3\xa3\xf4\xea\xeb\x97\x7f\xfa\
-\xd3\xf6\xc7\xcf\xdd\xf8\xe9\xcbW\xde8\xc0\xa1!\x9e\xab\
-\xcf\x9e;\xb3r\x1e\x1e\x1c\xcd\xe5\xb1J\xb5\x85\x8e\xb6\
-\xee\xdb\xb6O\xd60V\xa1O\x123Cvz\x8f\xfe\
-h\xedWoVo^>\x88+\xb3n5\xaf\x93\xa1\
-\xeb\xe47\xe9\x1d\xc3\xf9\xdd|\xf3\xaan\x1d\xae\xd6\xc9\
-<\x04\xb7\xda\x182\xfb\x0cfY\xf2@0\xc2\x8a\x1f\
-\x90[v\xcb\xb9\x94\x0a\x13\x8c\x90\xb1\x8a\xd5*\xeb\xf5\
-+\xd7_~-U\xfb\xc9\xdbU\xef\x1d\x90\xebY\xd3\
-\xc2R\xa8\x9a\x05\xaf\xdc\xd8?\xea\x96\xd9*\x98!\x9a\
-\xb9\x10\xd0J\xc6\x1c\x1a\xb3\x14\xba\x8c\x1b\x07\x87o\x5c\
-y3\xae\xae/\x8f\xd69\x9a\x05T\xeb\xda\xfa\x19\xd8\
-d\x0b\x19\xc5\x06\x08 L\x9192\xc9\x5c\x85\x00\xf2\
-\xd8\xa5\xb0N!\xf513\xc7\xc5*\xc5^\xaa:\xc5\
-\xa3\xf1:\xd6L\x0b\xe4\xce\xd9\x09]\xe6r]\xad\x8f\
-,\xe5f\xbf\xda=\xb8|S\xb7V\xb36\x1b\x10\x0d\
-5pT\x0a\xbd\x15\xabo\x09\x923\xf6n\xb9S4\
-\xcc,/\x96\x89\xd1-\xf0\xf0\xd2\x95\x83?\xf9\xcb\xfe\
-\xef~r\xf5\x13\x9fj\x7f\xf3\xd7n|\xe9S\xd53\
-\x17\xf2\xe3g\xabj6c $,j0@F\x8f\
-QU\x94\xb5\xb0^y\xe9\xe9\xe8\xb0\xbbz\xeb\xf2\xcb\
-\xaf\xf6?\xfe\xe1\xeaG?^\xbf\xfaZ{\xedF{\
-\xa0]\xc4\x0bqv\xae\x8f\xf5\xba\x83\xac\x8fq\xe1\xe8\
-\xdb\xf5QS\xc7\xc8\x05{\x17\xe8\xec<\x9a\xc5\xa2\xc0\
-\x0a\xeb^7\x0e\x96o\x5c\xb9\x11\xd2\xc1\xea(T&\
-\xc3-\x8b\xb7\x04\xac\xb2\xf7;\xcd\xa5p\xf1`\xd9;\
-dC\x1d\xb8\x1a\xbe\x00[\xd2\x0c\xbd\xb1\x07`\xf4\xc8\
-\x9d5\xaan\x8d\xe8\x0aM\x1d\x0c\xa0RZ\x91u=\
-{\xfc\xda\xad\xe5\x9f\xfe\xc9\x1b\x1f=\xb7:\xf3;\xeb\
-\x94\x0f\xd6\xeb\x18\xac\xb5lX\xce\x9a<\x8f\x07WM\
-\x87\xa9\xcfm\xfb\x5c\xb8\xb8\xf8\xd4\xb3\xbf\xff\xd5_\x8f\
-\xaf\xfe\xfd\xcd\x83\xfd\x1b\x04\x83\x85\x7f\x8a\xfb\xf7\x1d\xe0\
-6G\x1e\x8d?\x8f\xf5+c\x22\x90\x08\x90\xae\x8d\xe6\
-\xa7\xa4\x8b\xfa\x90\x8bk>\xe6=\x19\xe4\xdb\xcfT\x0d\
-\xb4\xcd\xb0\xc4\xb7~\x7f'x\xd8)`\x1c\xbc\xaf5\
-\xa4\xb5m\xda\xb1Y\x0e@pm\xdb\xd1\x0dM,=\
-qjJ\xe6\xf8X\xc7\x0b\xe8\xae\x5c\xea\x17\x00\x9e\xd0\
-\xf7\x19\xd9\xa5Mj\xde\x83\xc0 \xf0\xda\xd6\xf7\x8c\x97\
-\x1a\xe5Bz\x88\xe1m0Y\x13&L\x98\xf0A\xc6\
-D\x00M\x980\xe1\xc3\x0c\xbe\x0d~D'\x7f9\xf5\
-\x1b<\x01!\xf4C\x85\xf2\x81\x03:\xde\xb5\x01\x95\xb6\
-\xac\x10\xb6\xb3\xc48:\x1a\xe3\xd8<\xe5n\x0a\xf6\xad\
-?\x1f\xde+\xee\xfb\xe1ez\x9b8\x13\x90`\xeeB\
-\x0a\x82\x9c4\xa0\x11\xe2\x90\xfd\xa5P\xa1\x0f@\xf06\
-\xe5C\x10\xf4%C\xb4:Z\xb3\xc8+\x1e\xf4|\xee\
-\x0d\x7f\xfe\xf5\x9b;;\xe9\xe3\x1f\xad>\xf5\xc9\xc3g\
-\x9e9{n\xaf\xde\xdd}lw\xef\xec\xee\x82\x8bP\
-\xcfl.\xc5>{JX\xae\xf3\xd5\x9b\xab\xabW\x97\
-\xb7\x0e\x0eo\xdeh\x7f\xf5\xd2\xcdW^M\x07\xcb\x98\
-lf\xbb{\x8b\x10\xdc*_\xce\xacG\xea\xbd\x0f\xd1\
-\xad\x82\xe5\xa4\x15\xbc\x8d\xca\x96im4\x9fS1\x8b\
-9{_\xe9\xe5[\xfa_\xbe\xc1\xef\xfe\xe3\xad\xd8\xc3\
-\xdc\xab\xd0\x05v\x9d|-db\xd6\xe4vm\xdf\x7f\
-\xc5C\x08\x8b\x80\xcaE\x18L\xeb\xda\xddR\x9d\x17\x10\
-\x89\x96\x10D\xf3\x1d\xcaL\xaaD\x22Y\x97\x80\xbe\x9a\
-\xe9\xd2M\xfd\xbb\xffv\xf0\xdd\xbf\xdd\x0f\xbd!e\xcf\
-\x19@\xa8:\x879\x82\xcf\xd2\xb5\xa5\xff\xec\xd5\x85[\
-\xa8,\x04G\x80\x90g\x11b\x0a\xd6\x03k\xe6<\xff\
-\x87\x9f\xac\xfb\xa3\xd5\xd9j\xb9n\xb3\x8c!\x10y\x0d\
-\x1d\x09\xa1\xf8\xab\x0c#\x920\x91\x8a\xf0\xc02n\x95\
-\x15zY\x9f\xc7\xe4F\xeb{\xf3\x0a\xb6\x14Wc\x00\
-\x17\xa8\x9b\xf0\x0a\x94\x05\xcfXw\xe8z\x93B_\xd5\
-?]\xb5W~\xf1\xe2r\x15\x0f\x19\xe6>x\xb94\
-\xc3\xad\x22\x98W\xf4PU\xb5R\xea[\x06\x1c\xc4\xa6\
-\xcb\xf4l\x9a\xc5\x8c\xb0X-q\xf0J\x7f\xe3\x8dK\
-\xaf\xfd\xec\xd2\xf7\x9e\xe13O4\x1f\x7f\xe6\xec\xd3\x17\
-\xcf\x9e\x9d\xc7Y\xc0lg\xa7Z,\x0cf2\x22\xb6\
-}><Z\x1f\x1e\x1d,\x8f\xf6_\xbb\xb9\xfc\xf1\x9b\
-W\xdf\xb8\xde^~\x03W\xaf\xb2\xedY5u5\x9f\
-\x87\xc0\x16\x87\xe6\x8a\x10\x0d1\x98+'\xb6\xae\x94\x03\
-]Y\xa4\x18L\x86\xac\xda\x83\xc7\x9d\xfd\x14\xfe\xec\x87\
-\xfb\xaf\x5c_\xabO\xfd\xfa\x9a\xf1\xd0\xd0\xd2V\x12:\
-H\xf5j]\xbd\xf0\xf3\x97s\xdb\x05\xc5\xe8$p\xdd\
-\xb8\x0f\xac\x0dIhZ\x944\x1dK\x80\xd0Up\xcb\
-\x08\xbdCF)!\x07\xeb\x9a\x1d\xf6!\xfd\xe3\xd5\xa3\
-\xff\xfb7\xdbo\xbf\x8c\xbe\xed\xbb\xae\xaf\xaa\xb5\xa7C\
-\xcb7\x9a\xb0\x88\xbc\x09\xad2m\xe9k\xcd\x9es\xab\
-^\xba\xd4w\x9ec\x88|_\xdc\xda\xf7\x01\x01\xa4p\
-\xa0\xb0\xef\x96\x83G\xa1v4\xadE\x93\x82\x83b\xc0\
-\xe1\x5c\x87\x8d\xe5\xca\xd4\xeb\x8c\xfb\xa2\xf3\x16\x5c\xd7\xc1\
-\xe8\x0eOc\x1dF\xb1\x98\xf0\x97\xc4Z\xdd\xe6\x9b|\
-\x82\xc8\x08\xa7\xd7T\xea!*\x80\x04\x819\x83\x84\x07\
-\xd2G\x1d\x13\xe1\xfd\xf0 \x04\x5c\x96R\x00\x83\x85\xca\
-\xbb\xdaz[$\x84\xe4+\xb2\x0dF\xd3V\xb9\xac\x13\
-\xdf\x95\x9b\xf2\x8a\x056\x92-mp\x07\xeal\xcc!\
-\xb8\x02\xfa\x0c9*\x87\x19R-\x1a\xdc\x91\x8e\x92\xed\
-\xf7O\xf4z,\xe0\xcd\xc0\x0e\xf4S~\x8f\x88P5\
->\xf3!k\x81\x9e\xf0*Gd ;\x08Up\xeb\
-]\xc86\x0b\x9c\xd7\xcd\xd1N\xbd\x0e\xa0\x83a\x12\x01\
-M\x980\xe1C\x89\x89\x00\x9a0a\xc2\x87\x15C\xba\
-\xc06w0\xb8\xf3l9\xf2l\xbf\x98\x16\xe5H\x99\
-8\xf5-\xfd\xcd\xdb\x07\xc1\x8c\x90\xc6c\x9d80\x07\
-c\xd2m\xd8\xf1\xc7\xc6\xbb\xbc\x22\x8f\x1e@\xc7<\xd2\
-]\xde\xa2\xdf\xeb(\x8e'\xe6\x97\x1f>t\xdc3e\
-v\x19\x80\x9808\x8b\x96O+\xa0*3\xc3\x06\x01\
-]T\xaa\xacwk\x01\x17{\x0b\xd5\xda+`f\xf3\
-\x0b\x9c\xdb:\xab\xef\xba\x9b\xcb\xf4\xc6\xf3\xfew\xbfJ\
-\xf3\xd9\xf5\xc5Nufo\xb6wn\xb1\x985\x8dU\
-\x81A\x9e\xfb>\xa5>/W\xcb\x83\xa3\xe5\xd1\xb2]\
-\xadR\xdbz\x9f\xe6\xb4\x18\xe73\x0b\x8d\xd9\x5c\x8c\xde\
-#\xad\x80\x8cPY\xb6Y\xa2\x1c=\xd9\xc5\xc0\x0a\x94\
-\x03\xad\x05.b0\xf5\x12\xdd\xce\xe4\xcb\xbd\xde\xf8\x9e\
-\xe8\x08\x16\xcc\x22\xb9.\x06\xdf\x04%e\xba\x8c\xac\xc3\
-l\x0ec\xab\xdc\x01Af\xeb\x1a&\xc6\xbc\x03\x90\xe8\
-a\x89\x0a\xcc;\xa4\x1b\x14\xe1\x90\x1bzCF\xa5k\
-\x87\xf8\xc6\xdf\xd1s\x02\x83)\x9a7%W$\x0a\xf4\
-pP\xb1\xab\xea:4u\x85 \x97g\x93\x88\xdaP\
-\xd3\xdd\xba4c\xa3\x80_\xbe\xea?\xfb\x95g.\x0c\
-\x08\x0e\x09]\x84\xdb\xbd\xc2\xaa\x0c\xe4\xa1\xe2\x8f\x00\x18\
-\xd8pt`\xc9\xb6\x16\x8f \x02\xf5\xe6\xd2\x02-\xb8\
-\xde\xb0\x9eD3\xd8\xb6\xe0\xaa\xf1rU!\xee\xd5\xe6\
-)k\x05\x00\xa8\x87\xd100O\x11k\x10\xb3\x8a\x12\
-Z\xe7\x1as\x80X\xca\x9cg\x9a\x80\xc7B\xaa\xd7\xfd\
-\xcdK\xf9\xda\xa5\xf4cb1_\x9e9\x13vv\xe2\
-|\x16gs\xc5\xd8\xc5\xc0H\x03\xdb~\xdd\x1d\x1d\xae\
-V\x87\xcb\xeeh}\xa9\xcf?\xe7Nk{MP\xd8\
-#\x0d\x19h!`I\xc9\x0c\xb3\xe1|``\x15\xe9\
-\xc8.  \x83*kg\x98\xac\x8a\xf3C\xe8\xaf\x9f\
-\xcf\xdf\xfc\xc7\x19\xd5\xc0\x13\xd0\x13f\xd8\xc1\xe0\xde\xab\
-`\xfbu\xed\x08\x8d\xd7\xb5K\x86k\x035&\x03\xea\
-\x1eu\x19\x11\x80\x884/\xd5\xd2\x06\x13m)\xc8\xa5\
-\xb5\x12\x16\x5c\xf9\xe2\xcf\x9e\xd7\x7f\x7fN\xe0\x1e\x07\xcd\
-\x87\xc0\x15\xb8\x94\x08\xec\x12\x01\x12|M\xfem\x1d\xc9\
-\x18bx\xbfk\x7f\x8a\x9a\xcf\xe3a\x0e=\x85\xa0\xb3\
-\xee\xf3\x8cYfE\x22\xca\xa2\xa7\x0a7\xeb\xbc?3\
-\xd4\xc1\x15\xce\xaa\xaa\xe3\xec\x06\xb5\xb2*\xa3\xef\xc1\xcc\
-MJ\xd8I\xf0\x1e\xbf\xbfk\xdckgw>\xfc7\
-[\xbc\xe5,\xc5]7,;\xec\x8b\xef\x1c\x187w\
-\x05b\x87P\x88,3\x05\xf3\x9aVYl<\x89\xd2\
-Yu3\xacWaw\x9d\xad\xb6!q\x8c'\x8fs\
-\x1b\xfb\x03\x0cs\x19NO\x96\x0d\xacrUe3f\
-\xa1\x03\x99Q\xcb\x14\xdc\x03R\x90\xf7\xcaK\x8f7\xd3\
-\x13k\x9e\xdf\x8do2%\x9e\xf6K\x84^\x0a\xe69\
-B\x06%\xb6\x02\xa8\x18s\xad\xecR\xa7(\x0f\xc8L\
-\x89L8[\xa3i\xea\xc3\xddz\x15\x19o/\x19?\
-a\xc2\x84\x09\x1f\x1aL\x04\xd0\x84\x09\x13&<d|\
-\xc0\xde:\x1f\xe6\xb4\xf6\xdb\xc7m\x9d|[\x0b)\x10\
-\x22\x0b\xfd\xa70\x94\x0fc\x99\xf0v#\x9aY\x84\x9b\
-\xe7.\xe7|t\xb0<<JW\xaf\x10\x91FZ\x1e\
-k\xc8X\x09\x1fK\xe8F\x17\xa1\xc88\x0b!\xc2(\
-zV/\xb8\x93\xa0\x14\x01s\xd0\xc7XG'\xb4\x5c\
-\xc8\xeeeO\xd9(\x12\x16@#\x03L2\x03\xc5\xa1\
-\xfc\x90\x04Rf\x86\xb2\xdf\x91B\xe1&\x84\xda(o\
-4\x1ap\x14\x07\x94\xb2\xb9\x0dV\x1dD\x08E\x07\x00\
-\x13\x8dV\x08 \x0af\x0c\x81!\xc0L\x1c=\x9c5\
-\x14\xd4!\x0d\xf4\xc1N\x9bd\x88fp\x80%[(\
-ZY\xff>WfC\x00\x9dXJ\x0b#\xe3\xb9\xb9\
-v[+m\xa4D\xc3\x1e\x8ct\x02p\xdb\xe2p\xef\
-\x10\xc4q\x93\x0d\xb4\xa5\xe1\x10 9\xd9\xcdjU\xb1\
-\xcf\xa9\xcfmN\xfda\xbf\xbctu\xc9k\x00\xbd\xc8\
-\xedH\x18\x19 A\xca\xa6$\x88]Usw\xb7\x89\
-VA\xdc\xca\x0d\xe2\xeda2p\xf2\xc6\xb0\xb1\xdcZ\
-\xb9c4PzD\x80\x95J\xd5E\xcfS\x06\x04\x05\
-\xd2(q\xbc([\xda\xbfr\x9c\xad\xcb}\x97\x93\xc7\
-\x90\xcbC\x004\x84H\xfa\xd8\xf9\xa5W\x86.\xb1r\
-9FWy#e\xa3\xef\xf1\xfb\x1b\x02@\x8f\x84\x03\
-\x81\x0a\xa3\x89M6Q\x10\x83\x03!G\xf3\xec\x1dc\
-\xcb=\xce\xce\xd5g\x97\xde\xcd\xb3\xbb,\xc8N]\xe5\
-\xec4)`\xc4pu\xef\xb2;\xbf\x1f\x01\xc4{l\
-u\xbc\xed\xdd\x16CFo\x00\x80\x85\x1c\x19\x1f\x0b\xcc\
-\xb0ro\x04\xa2\x82\xd5`\x9dB\x9d\xdb\x5c7\xd5z\
-~#\xcf\xca\x90\xd0)\xcer{t\xeax\xc1\x89!\
-JP\xee)%\x1f\xd2R\xdf\x8b\xc48\xc1\xca\x13q\
-8k\x92@\x96d`0p|2\xbc\x0f\xbf\xba&\
-L\x980\xe1\xbd\xc6D\x00M\x980a\xc2\x84w\x83\
-G\xf6\x15Z\x84\x22P\x0a\xdc\x18\x00\x98\xc3{8\x07\
-\xe2\x80)\x84\x14\xa3\xb1n\x1c\x04\x92\xc3\xdd\x81\x80`\
-(<\xc1@$1\xd0B\x08f\xa82\xcc\xe1`\x12\
-\x1dJ\xa2A\xa6\x8a\x82\xc4\xc4cv\x06'\xbbN\x92\
-\x0fF%@\x08@@\x80\x00\x99'\x83\xcc\x08 \x91\
-\x10#\xcb\xa1\xe1\x1b\xf2a\x13[A@\x066\xb6\xb8\
-N\x09\x0c\xe3r\x08\xf4\x81\xe5A\xa8\x10E\x82\x14\xe9\
-\x18\xdd?\x0c\xb0YP`>i\x0c\xa2\x91\xed\x90\x87\
-\x81!\xb0\xc8Z\x18\x98\x0e\x03Xh\x8e\xfbS\x9cw\
-\xfd\x94B\xfd\x8e\xc6\xd2\xb0\xaa\xbf\xa5t`\x13X\x1f\
-\x13\x1e\x01\xca\xd0+\x0d\xdc\x18\x10h3S\x05\xa6\xec\
-\xbdr\x16 \xcfEBA/4\x10\x8cf4\x8bf\
-\xaa\x9aL(\xe3.\xb1\xeb\xdb\xe2vGE\x87\x08\xc5\
-\x00\x06\x06/\x19:\x01\x00\xe9\xd8d#Y\x1c\xaa\xa4\
-\x0d\x87\xb9Su\xf8\xb6z\x8c@\x1d1r\xb5\xdaZ\
-<\xc6\xe7\xda\x8c\x1f\xd3\xed\xf6c\xef[\x08\x00\xf3\xcc\
-r\x05\x04\xb1V\x19\xcap\xd2\x15\xbcc&\x19k\xb6\
-=\xde8\xb0\x7f\xf8\xf9z\xd5\xf5l\xf7\xd0\xbb\xbb'\
-\xd6\x1e*\xbe\xf3|.\xe94\x85\xd1i\xa3\xb7\xf2\xbd\
-\xce\xe4\x1e\x97\x92|\x0b\x96J\xf78\x05\x8a\xa6\x08\x10\
-\xc8\x10\x1cB\x10\x00\xa7Kp@\xb4`1[$\x22\
-\x18R\xaf\xbdEux\xd0\xfc|\xbf%\xf6c\x19\xfa\
-\xef\xc1\xd3]\x84\xe4\xa9o\xe5\xbea#\xdf\xfb\xaf\x11\
-\x09N\xb8Y\x08\xa7\x10\xefN\x980a\xc2\x07\x08\x13\
-\x014a\xc2\x84\x09\x13>\xb4\xd8\xd4\x03\xde\x86\x84\xe2\
-\x14\xeb\xc1D\xb3\xc0&\xd2h\x09L\xf2\x0c3z\xe5\
-\xce\x0c/\x95\x85\x00\x03\x0d\x16J\x8c\xa5\x22%B1\
-\x9c\xcdD\x90\x15A\x89\xee\x13\xe8\x08\x82`\xdb\x0e\xa5\
-\x82\xe4\x12\x8a\x15\x87\x8aB\xe8\x1dgK\x9c\x98\x84\x1f\
-\x97\xb0\x04\xfd\xc61\x89pXk\xc8*\x1c\x8d?N\
-\x14\xc0\xde\xc0\x0bW\x81\x81\x84\x1a\x09\x8d\xc2\x86\xddS\
-\xcap_H\xc7\xa4\xd5{\x0e\x96\xa4\xa9`\x99Lr\
-B\x0c4\x06\xab`\xa8A\xa7:)S \x82\x10\x01\
-PtG\x92\xc7b\x874\xda\x9e\xbc{\x08\xf0M\xe5\
-%\x0c\x8e\xb8\xc3O\x0d\x89\xaa\x0f\xe4(\x1fH\x10\x01\
-*\x04.9\x08\x9er\xe19]\xc9\xe9\x0c1\xf5\xfe\
-\xab\xd7\x0e\xff\xd3\x9f\xfe\xe0o\x9aF\xeb\x1c\xe1\x88\xea\
-a\x89f\xa7\xea\x98\xbbkn\xee\x0b\xdb\xba\xbf\xeez\
-\x1a\xbc\xa7n\x8e\xba\xdfc\x03\xf7\x12`\xf2\xa44S\
-\xc7\xcaC\xfax\xd3\x9b!\x01\xca\x80\x19\xa4\xdd9\xbb\
-.\xff\xe2U\x81U]\x13\xa7\xbb\x95\xef\x0bA\x04\xdc\
-\xd5\xb5]\xca\x8ej+\xc5\xed\xbd\x1b\xa3\xc3\xfe\x05 \
-\x04\xc6\xc0\xe11\xf7h\x10\x9d\x13&L\x98\xf0\x801\
-\x11@\x13&L\x980\xe1Aa#?y\xff\xc3\x01\
-Rq4U\x19\xc3o\xe6b\xeeD\x92\xa0\xc3\xa4\x9c\
-]$\xe5\x91\xa0`\xca\x01\x9aKT\xb1\xbe\x08$4\
-\xe4\x15\xc0\x5cI\xd4@\xdcP\x22\x08c\xc9\xad\xf1m\
-\xbe\xe4\x8eD(\xdfRyl\xdc\x8cJ\xed7\x83\x0f\
-\x93\xf9\x12l;]d\x88d\x06h<5\x1f\x8d[\
-\x0d\x0a#\x8fSt@&\x94\x14\x1f\xa9T}\x06l\
-\xa8lM\xb8\x91\x85\xda\xf0\xf1\xc3\xb2[\xd7F\x0e@\
-`tO!J\x02\xd6&\xa7M~Z\xc2\xc2\xdcN\
-;r\xdeJrt\x97\x0d\xdc\x18w\xd0$\x98\xe7N\
-\xb9u:\x05\x99J\xc6\x0d\xd5\x90\x08@`\x00+\xc0\
-\xe5\x94#'\x0f\xe3y\xbf\xd3V\x122\x0d\xc6#*\
-fN%\x81p\xb0y\x89\x9b\xb6\x1d\xc7\xea\xc3\x91\xee\
-O\x00\xdc\xef\x90\xf9\xb6\xbf\xef\xd2Q\x9bE\x1bJ\xeb\
-\x11\x0a\x8bI5tCa$\x83I\x0ed\x12\x90\x8b\
-n!\xa0\xdaqV7\xd6\xdd\xf7_\xb8\x95\xd7\xf0\x16\
-\xb3\x88P\xa3\x15:=\xf4G\xd5\xbd\xd2\xbc\x0c\xbcG\
-\xaf\x0f\xd6p\xf7#\x80\xee\xfd\x896\xf7\xef1\x01T\
-~\xe7\xa8\xf7s\x87\x97qF\xce\xea\xe8\x8e\xb6\x8fa\
-\x16\xabH\xe5{\xee\xf9>\xd8\xb4\xd4\xc7'\xdc\xf6\xa9\
-\x95\xbfU\x08\xa0\x94Q\xf1T7\xd3\xfd\x0e?\xd4{\
-\x1b\x8e\x04\x1a\xa2\x15_o'r\xb0XE\xdd\x9bn\
-\x9b0a\xc2\x84\x0f>&\x02h\xc2\x84\x09\x13&|\
-8q7\x0bp\x00\x80(\x92 \xdcA\x97\x0f\xa5\x9f\
-\xcdB \x1d\xaa\x1c;2\xd2\x86\xd0\xc9\x95\x01\xb8g\
-\xf7\xccP\xa8\x92\x22\xa3q\x99\x0f\x99Q\x04<\x12\x1b\
-\xbe\xe4N\x1b\x9c\x92\xe83\xe4bmf\xadGS\x98\
-m\x7f\x1c\x0e\xde.,\xaa\x1b\xdd\xb1?\x8d\xffm\xb6\
-\xda\xe4Z\xd8H\x03mR\xa38:\xbdr\xe4\xa4\xe8\
-\xcc\xb8\x9dw\xd8\x8a&A\x1d'\xb4\x8c\xe1]\x118\
-\x9d\xbe\xa8\xb3\x8d\xba\xa2w\x8aw\xcc\x8f\x10\x94#e\
-\xcf4c\xb0P\x1bEe2\x8e\xc6!\x92#\x0fz\
-\x05BA\x8cD\xa8\x0c\x86\x04O\xa7n\xe7v\x16\xd0\
-\x86nq\xf2X\xf8%\x1b\x84T\xc7\xeb\x0c\xe9{\xa7\
-8\xde=\xc0\xdb\x7f\x7f$\xddPJ\xdfT@\x05d\
-\xc0)\x9a\x12,\x0fY\x89\x9e\xbb\x94{\x93\x09\x16\xea\
-\xcek\xaf:\x9a\xcb\x82\xd1V\xb4\xfe\x9e\xac\xcb[\xe0\
-\x14[\x0d\xaa\xba{Hj\xc4{7\xe5\xce\x9b\xfb\xb6\
-\xa6\xdcsKR\x15\x80\x22\x89\x12}tv\xca\x902\
-\x5c@\x0c5\xbdr\x104\x97-\xbdry\x08i\x87\
-0?\x1d\xff\x83;G\xf8H\xfb@\x22$\x12\xd9\xd1\
-v\xbdg?^\xfb\x81\x9aN\x95\xee\xdcN\x8b%A\
-\xc1\x85`\xac\x02\xcc\x90\x1e\xbd\x01?a\xc2\x84\x09\x0f\
-\x06\x13\x014a\xc2\x84\x09\xa7\xc3\xe9\xde\x1f\x1f\xfe\xec\
-\xfa\xa9\xdfsy\xb7??`o\xcd\x9bL&\x1c\x9f\
-\xda89\x5c\xe2K\xa7I\x83(hHSbt\x18\
-(0hH\xf5\xa2<\xbb\xbb\xe0A\x84\xb3\xf8\xf3p\
-\xa30\xc8\x1c%\x1d\xf7\xf4\x8c\x19C\xb9A\x084\xb8\
-\xb5\x14S\x93\xe2Q=6J\x85\xaa\xe1]v8B\
-w\xfbs\xc3\xfe\x08\xf0\x0dO\xa3BPm\xaaD\x0f\
-D\x94\xee\x88\xc9\x8e#\xbbc}\xca\x09B\xe3]h\
-U\x8e\x99\x8ew\x8cSq\x17\x04T\xb5}\x0d7c\
-\x08\xc6M\x86\x8eg\xc9\xcd\x02i\xcaYYr\x97@\
-\xba\x99E\x06!t\x96NW\xb6\xfa\xa4\xe4\xeb\xb8\xff\
-\xb5-\xcd\xa1\xe9\xd8\xdd\x09E\xa5\xc1a\xc1\xe9\x98\x87\
-\x93M\xb8\xe7\xc2\xedM\x1e\x11\x11\x90\x00\x163&\x89\
-%\x153\x95\xecM\xb8@\xf6\xd9r\x9f\x03\x03YY\
-\x0cUs\x86`N\xeaS\xae\xa35vJ\x1d\xc8)\
-/C\xc9\xe3\xbc\xef*\xef\xf8h\x04\xefS\x8fRa\
-\xbc?\xb4\xa5?\x14\xe4\xbd'\xc9\xebP\x93\x95\x18`\
-Tf\xd7y\xf6\x1c\x83\x11\xca\xa7L\xff\x1a2\xcf|\
-K\xce\xb7%\x1c,Y\x8dL\x8e\xb6K)\x9f\xb6\xfa\
-\xfb[\xb5\x01\xb0m\xce\xd4\xc6G\xabA\xc1PG\x06\
-\xe2t$\xee\x84\x09\x13&|\x000\x11@\x13&L\
-\x98p\x0a\xbc\x1b\x1e\xe4!\x07W\xef\xba\xa9\xdc\x04\xa9\
-\xf7\x12w\x9c>\xec\xff'\xc5X@\x8a\x1b\xbdL\x99\
-*/\xccF\xc9\x9b\x10hB\x10\x04\xd0\x9dP\x14\x82\
-S\x1c\x83L\xb2\xd4\xda\x0af$!w\x0d\x0e:%\
-\xd7g0\xef\x19\xbbr+\xd2?\xd9g%@\xda\x18\
-\xcc\x16\x1a\xe6\xd87h\xc8=\xf21\xe7\xeb\xb6ys\
-m\xed\xa5\xa8\x0d\xca\xe2m\xd5\xcfF\x80\xe2\xb7\xa5@\
-hHA\xd1\xd8B\x02\x22\xf3Vk9\xa8a\xca\x01\
-\xb89\x03\x9e<\xa9wA\x00\xdd'\x8e}\x8b\x0d\xdf\
-\xf1&\x19\x08\xc2N\xb6\x90!8\x09p0\xc6\x85K\
-@e!ZtY!\x7f\xe0\x82\xacTf\xeb\x03\xbb\
-\x19UR\x08\xdf\xe1q\xef\x10\x80\x0cW\xa1\x08#\xc6\
-\xd396j\x16\x09\x98\x1d\xe7\xf2\xbc\xb3\x03\x1e\x17~\
-\x1a\x0fw\xd7F\x9d\x14ril\xd6\xfb\x9f\x03*\x82\
-5\xe7\xa8\xd3\x22\x125\xca\xb6$\xab\x82\xc5\xaamE\
-\x0b\x8e\xd8\xb9\x01\x91\xac\x92L\xc8s\xef\xab{\x14\xd0\
-zK\x9c\xde\x95\xe9\xde\xac\x8a\xdf\xe3#\xbb\xff(\x13\
-\xee\xad\xb8\xdbR8\x0e\xc3{$\x80\xe0ed\xbb@\
-P\xc5\xc1^\xd1R6x\x0c\x02\xd6\xa7\xe0\x015<\
-j\x8a\xa2mh\x99\x8f\xdf\x1e\x9b\x87\xacH\x10\xbd\xe7\
-,?\xf5\xe3\xe2\x8eCo~r\xb4\xc0\xdf|o\x0d\
-K\x09'dF\x1b\xc9\xf5G\xf3kk\xc2\x84\x09\x13\
-\xde-&\x02h\xc2\x84\x09\x13&\x9c\x06c|0\x04\
-\x8b\x1f\xa4W\xe9b\xba\x8c\x81\x82a\xf1\x8a%\x8b\x9f\
-\x0e]$\xf3\xe8\xd0\x0b\xd1Q\xf8 \x00\x9b\x8c\x03'\
-\x8c )J^\x98\x12\x9d2\xe3\xe4\x81\x83\xef\xcb\xf0\
-\xfe\xe1\x8d\xa0R\xb9M\xa1\xc4\xc4\x92\x1cp\xd1\x8d\xc1\
-B0c\x9f\xd5\xa7N&#\xc1H\xa3dpe\xcf\
-\x89\x09\x12\xed=w\x11!@n(\xb6\x07\xdb=w\
-\xa4\x80=\xb2\x10\xb3\x97\x9c\xaf1\xe0/R=\xd0\xe4\
-TvfQ\x01\x94\xabS\xee\x83y\x8c\x15#\x99\xb3\
-\xe7\xd3%9\xdd\xb3\x9a\xfb\xbb\xc1\xbd\xed\xa8\xdf\xeaX\
-\xf7d\xb1\xb8\xe5qT\xfc\xbeJ*\xab\x00\x0f\x83\xc7\
-\xbb{.z@'\x11\xcd-0\x04\xeb}\xc3\x1d\x9f\
-\x1aw\xdd\xb6\x90?\xf0\x0c\xef]Y\x0ffl\xdfq\
-(Adq\xf1\x1a\x0d\xaf\xcb\x0f9\x91\xf3P\x09\xf1\
-\x83\xf4\x955a\xc2\x84\x09\xef\x00\x13\x014a\xc2\x84\
-\x09\x13\xee\x86\x8d.fxK\xf7M\xbd\x96!\x9d)\
-\x03\xe3\xb4*D\x09\xb4\xa1\xda\xb1\x1eL\xe5\xa2\x87\x80\
-MJ\xd4\x06,\xb9$c\xfb\x83`c\x10\x1e\x80\x08\
-\x90\xec\x03\xfbQ$4\xcc\xc0\x97\xdf\x07\xe9D\xb1\x91\
-\xf1\x00 8\x01\x95\x98T\xcc\xa3\xb7\x0epG\xd8\xc2\
-\xcd\xe2\xd2\xbd\xc7?Kw\x0e\xb1\x5c\xd1\x04\x0d\x8bG\
-\xd9\xd0(Y:>\x91\xcdo'K\x8f\x0dyd'\
-\xe4?0m\xf2\xbf8$e\xd8\x18Ko\xb7P\x9b\
-\x99s\x05lO\xaf\x8f\x1f\x13$N;\xab\xcf|Z\
-#\x90w\xccg\x11t\xe8(\xf6\xb4Q\xa8\x00\x87\x09\
-\xc8Q%W\xc4\x11JoY\xf1\xbf\x86|pH\xe2\
- \x86;E+\xad\x18<\x0d\x97\xe4X<%p\xa3\
-\xd5\xd8|$\x0c\xd2\xafw\x13\xa9\x9e,\xe8>\x8e\xcc\
-\xdb\xdbU\xfe=\xee|\xbbC\x9e\xf6\xbe\x04\x01\xb9\xad\
-\xdc\x92\xc9\xe8F\x05\x91\xe6f2\xc8\x94iP$\x13\
-\x04\xe4\x19\xb3\xd3a\x09\x94AQ\xc3\xe58\x0d\xfc\x9d\
-\x8d\xb7\x93m~\x87x\xeb\x0bq\xaf\xb3\xa0\xb0\x95\x02\
-\x86\xcd\xfd5pd%!Q\x068\x99A0\x10\x94\
-yo(\xe6b\xef\xf0F\xe6\xb17\x99\x11p\x16y\
-\x91\x17\xae\xd4\xdd\x1dV\xd1d\xd6\xb7h\xd7\xf2DX\
-\x84\xe8Iv:\xfb\xafm\x8b\xb3\xe3f\xe0X\xe23\
-x\xff\xa0H\xe9\xe4}\xd6\xfa\xa93ioV]Y\
-\xa1\xf9\x80M\x5cL\x980a\xc2\xdb\xc3D\x00M\x98\
-0a\xc2\x84w\x831P\xfd\xe0\x81'*\xae\x8f\xb5\
-x\x8a=t)5M\x00\xa6\x13iP\xc7<\xce\xf0\
-\x8b\x01\x80\x8c\x90\xdey\xbd*\x0d\xed\xb8m\xc9\xbb\xef\
-\xf0G\x84\xa0{/\xe1p\x1d\x97\x5c\x03\x0c\xa5x\xdb\
-@\xaa\x95\xf7#\x01a\xe8r+V\xbd\xa76\xb9\xbe\
-/t\xc7/\xef\x19>P\x97^\xcc@/\x04\x22\x9e\
-\xa8\x227hMH0\x0c\xa64\xee\xe6\x82\xbb\xf7\x80\
-\x13\xd5\x07\xaa#\xee\x82\xe3t\xce\x13\x0a\xa0\xc1r\xca\
-9\xe4\x98Z\xa9+\xc8!)\x8aRP8\x1d\x1f3\
->\x13\xc7Q|\x92h\xc6F\xa2\xe5@\x9fJ\xd6\xdb\
-\xa6\x85\x0f\x0c\xba\xb3\x9a\xa0\x00\xc2(\xc1\x93\xfb\xaf?\
-\xb5~z\x8f\xaf\x1e\xda.\xf2\x07\xf3\x9bk\xc2\x84\x09\
-\x13\xee\x8b\x89\x00\x9a0a\xc2\x84\x09o\x1f\x0f\x88\x7f\
-x\x9fbK{\xc3At\xb3\x15%j\xb4v\xf6\xd1\
-Bt\xb3\xc2h<\xb1\xc9\xf2\xdaXOl{P\x1c\
-\xdb\xdc\xbcCs\x8d--\xce}\xb7\xbc\xed\xc3\xcd\xc5\
-\xba\x1f\xbd\xb0]\xdd\xfd^\xeb\x9c\xdc?\x01m\x89\x8f\
-n?$O9<t\xdaqu\xdaZ\xde\xe6'\xad\
-C\x06\x0f\x93\xadF\x145\xd6\x90(\xe4\xc5\x11\x8a\x88\
-\xef\xbab\x11\x8f\x8f\x8b\xf1\xd7-\xcd\xd6]4b\xbc\
-}\xc1f\xcb{\xeb\x83NxK\xdf\xbe\xab\xedC\xbf\
-3\xdc\xd7\xc9\x18|\xd8y\x8e\x022\x081\x10^l\
-\xdd5\xda\xfe\x0e\xe4\xab\x1c\xcc`o\xc8Br$\x01\
-\x191\xb1\xe6\x83\xad>\xf5\xfe\xc2\x96g\x1b1V\x22\
-\x04 \x83\x80\x80\xed\x1b\x9f\xc7\xb7\xf3\xa9\x19N\xe1\xf6\
-G\xc9\xf6\xf2\xc1\x0e\x0d\xc3\xb30\x0b\xee<\xfd\xcd{\
-?\xf0\xf6\xfb\xa5<}!\xc0I\x14\xcf\xb6\xf7\xe0\xb8\
-\x13&L\x98\xf0h`\x22\x80&L\x980\xe1t8\
-]\xb0\xfa\xf0\xdf;OM\xd6\xdc5\xba\xbfs\x9f|\
-\x17\xa1\xfb?9\xb6\xc3\xbf\x81e)\xd98\x1a\xe4\x03\
-\xe3'P\xf1\xce\x00\x8c\xc8D\x02\x04U\xd8\x0e.\x86\
-\xec B6\xc8\x82<\x8c\xa1\xbc\x01\xa42U8\xa2\
-\x13\xce\x17w\x1d\x13'\x98\xb6\xed\xa0\xfa\x1e\xf1\x19\x87\
-l\xb1\xcd\xdf\x008\x16\xe4\xb9m\xaf\xb7'\xe9\x0de\
-\xeb\x87\x1d\xfb\xb0\xec\x0eW\xe6\x8d7\xb0\xa8\xe3l\xa8\
-;\x9a|*\x02\xa8Tq:U4.;\xc5m\xe5\
-@6\xbf\xcb\xf1N\xec\xc9N6\x89\x02\x03\x10\xde\xb1\
-\x90k\xd81O\xde7\xa3&b\xcc\x03\xdb^<\x18\
-\x97\x94\xb1\xa2c\x1b\xefwt\xc4\xbb\x8a\xf3\x8e/\xf4\
-\xd8\xac\xad\x86lm\xf8\xa8 \x81Y\x84\x94\x09B&\
-\x00\xb0\x92\xf1\xc3\xe2w\xa3\x0cKP\x82u`\xe7\x90\
-\x03=\x17\xce\x0f<\x110\x8e%\x1e33\x94|\xa0\
-6\x0b\xf5s\xf2\x99Q\xd6?\xd5\x00\xd0\xf8<\xd0\x90\
-&)\xd2\x87\x0av\x1c2\xc4\x04X\x80\x84\x94\x90\x1c\
-\xa0\xc1l8\xe2\xbb\xbf\x14\xc2\x86\x88\x1fO\x88\xf0\x81\
-\x9f'\x5c\xf0@\xd0x\xfb\x88\x9f0a\xc2\x84\x0f\x13\
-&\x02h\xc2\x84\x09\x13&\xbc\x1b<\xba\xaf\xd1\xda2\
-\xc5\xc0V\xfca\xc0m\x05\xce5\xfeW\x82\x89\xed\x1a\
-\xc7[j\x0dac\x05\x94\xcb'\x9bD\x0a\x09\xa0\xa8\
-RP\x8c8\xb6\x10\xbe\x8d\x17\xb8\xd3<i\xa3O\xd9\
-j\xcd\x10\xc4o\xab\x82n\xcb\xb6\x18OI\xf7bU\
-\xee\x08\xf2u\xc7>\xb6\x9br\xc2fck\xdb;\xaf\
-\xfe\xbba\x03\x1f^4N \xe6\xb7\xces\xd1\xed\x7f\
-\xca\xdey\xf1\xaf\xb7\xb7{\xdf4l\xb3\x7f\x8e\xc7\xba\
-O\x87\x9a\xddSC\xe1\xc7~L[\xbb<y)\xef\
-\xd6\x92\xb7\x88\xc5\xefsD\xbc\x95>\xe8\x81\x83\xaa\xe8\
-\x00\xa2\x14J\xd1+R\x8e\x5cl`T\xf26\x8b\xb3\
-\x95\x0c\x08T\x0d$\xc00\x9a<}pq\x1bM\xbf\
-Yz\xfb\xe3\xe2\xb6\x95\xf8\xaeF8O\xfe,OK\
-G\xb1\x07R\xc9\xa0t\x12}\x8f\xec\x02\x0c\x0a\xc4i\
-\xdd\xb8\xef\xdf\x8c\xe2xecY09\xe5f\x8a\xd1\
-\xcc&\x0f\xe8\x09\x13&|x1\x11@\x13&L\x98\
-0\xe1\xae\xb8#\xf8\xbd-,\x1c\xe4\x11wU\xfd?\
-\x12\x10X\x02\x0f\x0es\xc4\xc3\xe2\x80\xed\xc9\xf0\xf2\x1f\
-\xf3\xa6f7\xe0c}\xe5A\x0esr>\x99[\x86\
-\xd9\xf9x7\x80(ga\x97p/\x02h\xb3#\x8d\
-\x22!\x01c\x8d\xf6Mv\x90\xca\xa4>\xc76\x94\x7f\
-5J{\xb6D8:\x99\xe4r\x1c\xf1\xdeN\x00\xdd\
-^2\xfc\xb80\xf9V\x17\xdd\xb6\xed]C(\x9dN\
-@\x22\xdd\x95\x98x\xaf@`\xd6\xbfe\xfc\xafAP\
-2\xfeY\xfeI\x0f\x86\x02:\xd9K\x9bN\x1b\xe5E\
-\x01\x9ba\x03\xe1\x14\x9d\xc3\xad\x11d\xa3Nj\xab4\
-\xf8\xbdZu\xec\xa0\xfb>\x87\x00\x98\xd7@\x85\xe3t\
-': K86\x15\xd7p\x8f\x1a\xa0\x10\x14M\x91\
-\x08\xb0\xa8\x0f<\x01\xb4%\xfc\xd9\xc20\xb2\xee\xe5d\
-m\xf0J\xa7cd6\xdaF\x8e\x8f\xa8\xf2\x9cr\xc0\
-h\x94C\x12\x0d\x10\xda\x0e)\x15\xf9\xdei\x14|\xf7\
-\x84\x08\x85\xc1*\x1f\xc7t4\x01HF'UE\xdc\
-\x97\xc3\x9c0a\xc2\x84\x0f8&\x02h\xc2\x84\x09\x13\
-&|8q/\x9e\xe2^\xaa\x8b\xdb\xd44'\x14C\
-w\xac\xc9\x93{x\xc8V#\xdb\xda\xa5G\x08\xf7j\
-\xf6\xbd\xe2\xc3wuv\xc5\x22\xe7\xfe\xbb\xb8\x93\x08y\
-\xef;Tc\xfe\xde\xdb:\xd6\xbd\x157\x1a\x0b{m\
-\x924\x1fL\x98\xfd\x905>o\x85\x08\x0d\xb9E8\
-V<\xa1\x9c\xb2\x03\xe5\xf4\x03\x80Q\x0a\xe2\xc7\xaf\xbe\
-\xef\xab\x13yh\xf0\xcd\x00\xbb+N\xeb\xe1u_\x90\
-\x81\x14\xa8\x92ZJ\xe4\x1e9\x0d\xc7{oP\xb2q\
-\xb5\xe1\x80\x0a\x91\x8f`1\xda\xc36\xaa\x9a0a\xc2\
-\x84\xf7\x13&\x02h\xc2\x84\x09\x13\x1e\x09l\xe617\
-\x0b\xb6D*\xf7\x09\x90?\xe8o\xba\xa3M\x0fqo\
-Q\xff\xb6\xd3\x87\xb6CD&\xa0\x84\x87aXQV\
-<\x80\xb6|z2\x98\xa8\x0c8\xd8\x03rT\x19\xb3\
-1\xbb\x01\x1a\xaa\xaa\x97:\xe2\xa5,\x914\x8a\xa3\x86\
-\x03\x97\xd2\xf2\x8a\xc8\xd1`z\x0b>\xa8\xd4\x8c\x1f\x0e\
-?(\x7f\xa0\xf2\xbf\xdd\xe5$o\xb3t!T\xacx\
-\x05dY\xe2\xc6\x14cT\x13\xdd\x96\xde\x06\xc0\xc6\x22\
-g\x05\x19\xa6\x13v\xbe\x04t\xac\xb2\xd8>3\x1dw\
-\xa9X\xac|\xde\x0e\xee\xe4Ul\xab]\xc2\x1dgu\
-\xd2\x98\xe4N\x92n\x93\xa0\xc7\x93+l+\xb3N,\
-L\xac\xb6\xb6\xc5H\xe4\x9d`\x10\x86\xdaH\xcc\xdbk\
-\xde\xa1p\xba+o\xb5}\x5cl]\xcc\xedf\xf8\xf1\
-\x15V\xa9\xd8\x8d\x00/\xe3\xc80\xf8E\xb9\xe8\xac\xee\
-\xec\x8e\xf1_\xbf\x9be\x0b\x07\x05\xd0\xedm\xbd\xed\x89\
-pW\x96\xf3~\xec\x9b6\xe3}\x13Uo\xaf\xc9\x87\
-i\x02-\x80\xa1\x9f\x07\xafe\x9e-\xb9%19S\
-\x0a\xa9\x0c\x86A\xed\xe4!\xab\x82GC\xcc\xa8\xa4\x10\
-\xe0Q\xcb\x88\xfem\xf3l\x8f\x22\xc4\xd1\xe4j\xfb\xcb\
-\xc3\xc9A\xfa\xe4F\xc0\xef\xa0\xaf\xdf\xe5\xf5\xdb\x16\x1d\
-m\xabp\xcc\xa0\x0c\xc9\x8b\xe7O\xea\xe1\x19*\xae\xf9\
-\xefJ\x03t\xd7-7\x0f*\x1e\x9f=\x05\x95r\xf7\
-\x91\xe4\xfb\x8c\xc7\x9c0a\xc2\x84\x87\x87\x89\x00\x9a0\
-a\xc2\x84\x87\x8aQ\x1c\x22\xdcf\xb5p\xbfH\x84e\
-\xde\x9d\x9bu\xee\x1ae\xddK\xb9\xf2\xc1F\xe9\x13n\
-\x0a\xcc\xe8\xe4\x07\xf7\xd9\x8c[\x11\xca\x1d\xd8x-\x0f\
-yV\x1a#v\x076\xc9#F\x00C\x04\xce\xc1t\
-\x97\x0e\xf08\xf6:\xdeVD\xb0A\xabp\xb7\xcbw\
-\x92T9i\xd5!`(Yu\x9c\xddp\x97\xed\x01\
-Q\xb4\xd2\x1b\x1c\xcc\x8c\xeed%\x86\x9d\xdb\x86\xc4\x1a\
->\x1aZ6np\xdc\x01\x03u\xb1\x15Lm\x1fr\
-C\x9cP\x1aS\xceN\x11Wo\xb1R\xb4-z\x81\
-CZ\xd4\x89\xdc\xa5m\xca\xc6\xdf\xe1\xb1\x8eCT\xc1\
-\xb6\xc8\xac\xdb\x98\x8e\xd2\xd1\x124\xfaa\x8f\xd7\xf1N\
-\xa3\xa6\x13;\xe7\x9d\x7fi3\x8en_\xc5J\x9e \
-\xa5\x91\xa7\xdcP0%)N\xc0}\xbc\x8aTJ\xd7\
-\xdf\xad\x19F+\xb5\xd0o;\xaf\x8d\xc4\xe3^\xcf\x8b\
-\xfb\x9e]\xe1\x7f\xe4\xbac\xebBt=4[e\x11\
-\x14L\xd1\xbc\xc9\xe8a\x82\xc6\xf49\xba\x0f\xb7!\x00\
-\xc0\x02\x86\x82S\x15P\x035\x94\x83V\x86\xfc\x80\xf3\
-\x8f\xdew\xb8M\xb1X\xaa\xa2\x1d\x8f\xca{\x10\xca\xa7\
-\x04\xb7\x9e\x15\xd8\xfa9,\xd7`\xb9]\xba;\x95t\
-0\x9d\xbc_\xb8i\xd7\xdb\xc7\xed|%\xc7\xb1\xb1\xc5\
-z\x8f\x93\x00\xe5\xe1K\xf2\x0e\x87\xfb\x09\x13&L\xf8\
-\xf0`\x22\x80&L\x980\xe1=\x02\xef\x0c-\x12\x98\
-\xcc\xcc$w\x93G3\x02\xc8\x9b\x92S\xe3\xbb\xec\xe6\
-\xed\xb4\x08\xd8\x15\x89\x08\x0f\xe8\xc7Wz\x03\xd0\xa3\xca\
-\x08\x02\xe1B\xce\x08\x1c\xde\xe6\x95\x01C\x9e\xc1\x81\xd0\
-!\xe4\xbb\xb6\xe5\xd4'5\xb6\xec-VxHp\xaa\
-\x8bI\x94y4\xb7\xe0\xa4l\xe4oL\x90[.\xaa\
-\x9c\xd2<\x02\x90\xd1a0i\x06\x8c\x81\xf6\x18\x0fk\
-\xa4\x1dF\x03\x11\x02\x910\xc0\xa5\xaa\xf08U1u\
-F\x05\xc5R\x1a\x1cpx\xa62\xd9\x03=\x99\x87K\
-As\x18\x18\x01\xa3\x07s\x04m\x93\x08\xa3R\x07(\
-\xce@\x82\x1c\x829L\xce<\xf8=\xcb\xa8\xe2\xdc\xc1\
-\xb4U\xba\x88p\xca\xc7\xb8\xcb\x059L\x08\x99LF\
-!\xcc\xfa\xdd:\xc1\xe1\x1er\x0e\xee&!\x13r\x8a\
-`p\xd8\x09\xb6\xc6A\x97\xb9\x84 \x1bY\x87\xb2J\
-pX\xa2\xc1X\xb4)V\xaa\x9dI\xa4,\x03P\x90\
-\x04v0\x18\xb6\x86\x87ct\x13*\xa7}7\x8d\x09\
-\x00\xa3G\x22:\x5c\xccb\x1e4\x0a\xc0X\xd6\xc7L\
-\xdch\x84\x88l\xeeDq\x18\xc9\x00\xe4\x0b\xd7L\xe6\
-\xce\x15\xac\x03\x93\xc1\x91\x16\xe6{\x84\x03\x19\xd6\x82k\
-\xb7^\x9a\xbb\xf6\x88d<4dG\x1c\xdf\x85\x08\xc0\
-m4cVQG\x84 Z\x22\x05\xd0\x87\x8eRp\
-\x83\xd31\xb4\xb6\x0c5\x87HES1\xdc\x11\x00'\
-Dd\xca\xcdCf\xe3\x15\x04\x85\xb5\xb3w\xed\xb8\x16\
-P\x04\x08d\xb3\x9b\xc6\xd5P\xa2Z\x0d|'\xc9\x14\
-\xd6\xb0^\x82)\x03L\xa5QQ\xbe\x15e+\x939\
-\x04\x05*\x8eO\x87\x22U\xeb\x80\x8a\xa8\x06\xeex8\
-A+\xf4\xe20\xd2O\xb0\xa5\xe5\x82\x07\x08n\xc5\xfc\
-H\xc1\x9d\x92\x1d\xcbD\x86\xeev\x98\x10\x01\xf0\x98\x9b\
-\xba\xebe}\x0fQ\x8c\xb4R\x5c\xe7\xd0\x0b\x0ez\x09\
-\xef\x0d\x16S\xedC\xa8_\x9a\x16 \x01\xc9 \xa1#\
-\x0d\x90+\x8f\x03\xea\x83\x0aj|\xc9\xbfS\xf4u\xa7\
-|\xeb\x81\x1c/\xb8\x83L6\xf8l\x134\xb1\xcaA\
-n^.\x19\xaa^]\x17\x90*u\x90#\x18\x832\
-\x1cN\x83\x85\x13\x5c\xa7$I\xf75\x1d\x17\xd0\x8f\x9c\
-V\x18\x9e\x0d\xec\x85r\xc7\xa6\xe1\xe9\xe5A-\x88\x10\
-\xaa\x06\x9e\x1a;\xaa\xe2\x9c\x98}\xf8fK&L\x98\
-0\x01\x98\x08\xa0\x09\x13&Lx\xa0\xe0\xc9\xdfo\x8f\
-.\xb2\xb1\xafB\x08\xce\x9c\xe1p\xf3 \xa0L]\x8f\
-\xc2\xfcM\x8c[&\xdb3\x00\xc1rc\xaa\xd0\x0b\x85\
-\xcd\xb1\x1e\xd6#8*\xc8\x902\xbc\xe8=J</\
-\xb8\x90\x1a\xb8\xc0~\x9c\xe3\xe6\xc9\xe6\xbd\xf5,\xebm\
-S\xfc<yF\x9b4\xa6\xad\x85\x0f\xfdu\x9ab\x86\
-\xaf\xab\xe4\xf4:\xa9be\x8a\xa3\xc4FE\x02\x90\xe9\
-nI\xa3\x1f\xaa\xc9\xac\xd4\x7f\xf6 \xc4;\x9b\xae\x13\
-\x8b6g\x171\xc6\xb8\x95Tg\x17\x90Q\x09\xb5\xbc\
-\x1a)\x8f\x14\xb4\x8epX\x87\xc2\x0e@)\x844x\
-\xb1\xc4 3W(\xc5\x8f\x81\x92\xe0s|\x5c\x08\x92\
-\xc3\xc1\x0cfX\xef\x96\x1d\x0e\xc0\xbc\x0a\xb9Q\xe1\xf7\
-(\xc1\xc6\xd1\x01\x16k\xe9Q\x9dD\x9a\x08g\xec\x0d\
-\x09\xd6\xf8\xacn\xeb\x1cr\xc7\x96\xec=\xe4\x92\xa2\xe5\
-C\xb52\x82\xb0c\x9f\x0c\x07\xfbL\x07Q\xbbGW\
-\x06\x1d\x81\x8c\x85k\xc9\x84\xd3\x80X\x22\xeb \xaf \
-s\x99\xbb\x89A\x19@\x22s\xf1\xd6)\xcc\x16\x05\x14\
-\xb5\x88\x04\xb9\xf9\xc0\x01i\x9c\xa0/\xab\xa92\xcd\xa0\
- \xc2\x99\x9d\x0e\xca7=\xa4\x08\x84H\x02\x0a*\x84\
-\x12M080$\xfb\xb8W\xf2=G\xa7\xd8\x82\x19\
-\x5c\x0b\xd9\xb0ci\x87\xcc\xb0\x16\xea`-\xd8&\xcc\
-\xe4s`M[\x13kb&\xd4\x1b%\x846\xd9^\
-$US\xc1\xc4\xcaa\x0eRDV!\xc2D@\x0e\
-\xd7pF\x10\xddr0\x81\xda8.\x97\x8aT\x12=\
-\x93\x86@\xaf)\xe5\xb8\xcc\xd6\xbb\x07\xf9\x19\xa8\x02*\
-\xf3\x04;\xa0\xb5T\x80Lh\xe0\x8b\xcc:\x13N\x0f\
-\xf0\xa0\x81>\xcbD2e\x0a\xe6E:d\x8c\x11\xc6\
-\xdc\xd0\xab\xd1]<\x81I\x14I\xa2q\xb9\xe4\x1a\x84\
-\x0f$4Z[o\x89\x81\xc6s\x1e\x87b\xca\xd6\x19\
-\xb2$C\x0eHc\xef\x04!\x00&\x06\x1a\x07\x1ap\
-\xb8i\x86\xcb\xfe\x10\x1f\x02\x14!v[\x92\xaa2Z\
-h\x08w\x13\xb68\x90\x07\xc2\x95\x10Lw<\x9f?\
-p\xd8\x5c\xd0\xdb\xf0\x9e\x5c\xa4\x226\x94\x90Mn,\
-\x03\xc5dQ\x82\xd8;H\xa3\xc5\xb5\xd8\x1br\xa5\x1e\
-\x12\x0c2\xb9\x1c2B\xee4\x1b\xbc{F\x02H\xd2\
-\xbd\xf3\x0as\x19rE\x0dV&F\xc4D\xf8\xe0e\
-^\x14~n\xca\x81\xac\xad\xaa\xe09\x84e\xb0)\xfc\
-\x990a\xc2\x87\x17\xd3\x13p\xc2\x84\x09\x13\x1e\x1eB\
-R\xed9\x040\xc4\x12\xbd\x0aF\x10Y\xe8U\xe4<\
-\x03]P\xfc+E\x83\x09\xb5\x88\x14\xb3\xc9\x8b\xbe\x02\
-\x14`Y1'!\x90\x16+3\xcb@\x1e\xcbZ\xc9\
-\xb1r\x00\xf4\xfc\x9e\x98z\xbe_ \x8aU_;Q\
-\xe5\x10<\xc6\x1c\x87\xe8\xb6\x04\x00\xf4\x88\xe0\xf0\x8d7\
-\x8d\x09C\xccNw\xeb\xdfQ\xc4\xca\xb2G\xe5\xc4\x1e\
-\x80\xc3\x85^9\xba\x11\x10\xe9PO\xf5\xa0\x8f\xf9\x06\
-\xe6(\x06C\x95\x10\x1c\x0e\xcb0Pt\x98\x09D\x18\
-'\xe3\x07J\xc6a\x80\xd1\x8d\xa4\xb9[a\xb3\x04\x03\
-\x01\xe6{\x84\xac\x1a\xb8\x16\xdb8\xdd\x9aB\x00\x88\xce\
-C\xf2\x90\x15\x92,\x83\x19L\x80\x13\x1c\x8b=\x17\xa5\
-M\x11\x15e\xa8T\xa9\x87Cy\xf0\xd05\xc8\x82L\
-4\x15B\x03i\xe8\x0d\x22\xc3Iy\x04\x81b\xaa\xe1\
-\xbc\xad\xb8\x90\xa1\x105\x83\xfed\x94>\x89\xc7\xfa\x8c\
-\xa1\x144\xc0\xde\x0a\xed\x03hP\xd1H\xe5N@2\
-\x84mjnT\xe3D\xb0\x07\xdc-;z\xb7\xe4\xc3\
-i\x0a\x14BF\xe8lPT9\xcc\x9d\x02\x13|\x05\
-9|\x0eT\xb0\x0a\xc5\x7f\xe7\xf6:h\xdc\xe4\x5cf\
-RF*\x0eYG\xc7\xa9j\xb7\x9d)7\x96#'\
-/\x0e@)d\x0f=U\xa4TNt\xd0\x0a\xca@\
-\x22\x9c\x965\x5c\x86r\x83g\x22s\xe84/~@\
-.\x8a\x16\x1c\xdb\xde-&\x8bd\xa4hc\xd0\x0b\x81\
-&\x06\xd03['$\xc7\x86\x00\xd2P\x1d\x1dcZ\
-\xcc]F\x13\x0d\xde\x00\x0e9\x94\x85\xe0\xc7*5\xf3\
-A\xaf8j\xe5\x86\xa2s[)\x8f\x0f\x15\xefH\xdc\
-\xb8\xc5\x13Mx\xcfp\xdb%\x19\xd8F\x02\xb4\x22\xa3\
-+S\x14\xd9%\xf7\xe1K\x8e\xa5P<PR\x9dI\
-\xf9\xf1\xa0=\xd5\xf1\x8buW\x19\xa4cB\xad\xb6>\
-\x9d0a\xc2\x84\x0f+&\x02h\xc2\x84\x09\x13\x1e\x16\
-\x88\xe8\x88k\x07\x88\xba\x81juFDT\x81.\xa4\
-\x1e\x14,\x95\x80\x16\x04\x15\xa9\x19\xbc\x96Y?;\xe8\
-\x9a\xa3\x1a\xac\x15\x07?\x0bU\xd9\xe3:\x81\xc9C\xac\
-ga\x879b\xdd\x8a`\x15\x89lGI\xca\x88\x07\
-\xb0\xfe\x9f\xfa\xcc\xdf+\x88\xa2\xdb\xac\xdd!\xaa\x90\x19\
-\xdc\x82\xcc\xc6XUH\x99\xbd\x87\xe0f\x0a\x1dJ\xfc\
-*YV\x10\xfa\xd0\xb71\xbb\xbd#\x17\x8c\x12\xbc\xac\
-\x89\x15\x00G\x14*y\xcc\x08\x80\x82A\x0ey\x1e]\
-i\x8c\x88\xae(\xd5\x8e\x99\x10\xddV\xb4ui\x06\x14\
-\x81h\x82m<\x7fQ\x03C\x0a\x1a\xe5!\xcb0\x16\
-rb\x92e\x816H6JhT|\x81\xe8%n\
-bq\xbd `\x94\x99G\x02\x08\xabTwn\xc9\x0b\
-\x8b`E\x01dP\x0c\x0e\x93\x19\x82y\x84G\x95\x1a\
-=\x10!\x07z\xc0\x07\x87\x8e!\xab(R6\xa4\xa4\
-eX\x06\xe0\x84\x07\xac\xc7\xaaP\x1e\x00\xb0I\x0c^\
-\xe2-\x03hN!r(\xf6\x1cB\x22\x15\xe05\x14\
-Y\x08\x1dEx\x05d\xaf/)\xde\x84\xe0,\xca\x0e\
-\xc7H-\x14\xa9\xd3\xc6;I\x94C ]\x01\x90\xe8\
-\xa0\x03\xbd\xb3u\xeb\xdd:\xb0\x03S6\x99z\x8bk\
-\x83\x13\x19\x96dY\x04p\xa8\x8a\xe8\xf7<\x9d'\x82\
-|,|\xce\x0c\xf6\x9b\xec-A2P\x92\x82+\x98\
-\x82\x15\x8d\x02@\xf5P*\x9e\xd8e@\x94\xb1\xe1\xb4\
-\x81\xd6\xda0UT1\xc6&\x1cp\xc5N\xd6*\xac\
-HY\xd8w3h\x86\x5c3d\x85\x16p\x87 \x96\
-D<x\xa6$\xca\x94k\xcf\x14\x8dU\x80\xb2\x9b\x06\
-\x97\xa7\x00\xc0h\x812\xf4\x11#K\x03B\x15\xc8u\
-\xe8Z;\xf2\xb1\x85f,\xd94\x1b\xfb\xdb{\x84\xd6\
-\xae\xbc\xc3\xfe\x0c\xe5bre\xc2Y\x94V\x94\x80\x91\
-]\xc3\xe8\xba\xed\x02B\xd1b L\xa1\xf5\x84\xbb\xc2\
-\x8c\x83\x9c\xc7\x8c\x84\xbb{\xce\x9e\x04/\x9e<c\x0a\
-\xb4\x06~\x92\xd2\xbb\xb2j\xdeP\xb1\x02H\x18\x87\x9c\
-Gb\xd0\x18=\xa8\x13\x9b0a\xc2\x84G\x0d\x13\x01\
-4a\xc2\x84\x09\x0f\x07\x02\x80\xd9\x0cF\xb5\x090V\
-\x95<\xe4\x1eHD\x08\x0c\x142M`\x09\xa0K\xae\
-\x8d\x81A`o\xea\xd83\x84`F\x9a@\x88\xc9\xe8\
-\x81}\x9f\xb4\xec\xbdnw\xfa\x84\xbe\x95\x05VV\xea\
-\xedF\x03\xcd\xf4\xc1\x8e\xc9(\xcaMN\xa3\x016z\
-%\x8bpH\xcc\xa2\xdf.\xee`\x91Z\xc8\xbc\xa4c\
-\xbd#\x0d\x10\xc9B\xf0\x0c1\xb0,ov0\xf2%\
-6\xa6\xa5\x10\xc7\xaa\x1c\x03$$\x10\xa2!\xe7A\x01\
-\xb3eD\xb2U\x97\xdc\x89\x22\xa5)F3\xc3\x14\xf6\
-]\xf4%\xc7\x0d;\xd9\xcaAx\xe2b\xd2\xf1\xe9\xdf\
-uknY\xe1\x96\xaaW(,\x11\xb6\x18\x85\xa2\xb9\
-)+\xf9\xd06H\xe66hzz\x03\xc1\x0a\xdc8\
-0a\x90\xa3\xf81+2$\xe08\xe4e\x0c\x17\x86\
-\xe4\x98R\x18\x8e\xb5\x11\x07m\x9b\x95\xf8\x98$9^\
-bl:\xf0\xb6\x1e\x18x\x98\xe1^\x1a\xd60\x15\xc7\
-e\x15F)\x0f\x0d:.[6f\xa5\x1d\xff=$\
-\xd6\x0d\xe7\xbf\x11\xbc\xdc\xe6\x5c{\xf2*\xe8\xf6%C\
-\xca\x1b\x07znS\x91\x8d(\xa5\xe5\x90\xa1Q\xb8w\
-\x5c\x0a\xad(\xadr\xe1\xe0\xc4,P,\x05\x94\xb6\x0c\
-\xa3\x01c\x19\x1d.\xcb\xd4\xe6\x12m\x8e\xeb\x1b\xd5U\
-\x11qa\x9b\x00\xba\xcbY\x08\x80\xcbp\xec(D\xa0\
-\x10\x7f\x06\xe4)l\x9e\xf0\x0e\xa1\xe1q\x02\x82\xa4\x19\
-\x9c\x10\xdc\x91r\xf2T\xaa+\xb2\xf8\xa8\x15\x8ah\xc8\
-\xff\xda<m\x1f\x00X\xeeZ\xc9)3\x0b\xc5|o\
-\xc2\x84\x09\x13>\x9c\x98\x08\xa0\x09\x13&Lx8(\
-o\x9c\x1d\x02\x15\x13c\xc2n\xb6\xddy\xdf\xc5L\x85\
-\x8a\x81\xd1=\x034D\xf3Pf-\x01I\x19P\x9e\
-w\xddL\xcc)\xae\x15d\x80C\xb5B\x801x\x08\
-\x8e\x86\xe0\xea\x10a\x09',\xc2`\x01\xa0\xac\xa8\x0a\
->\xb0\x1c\x90\x81\x8epK\x80\x83\xb9\xd8\xe0\x88\x00\xdc\
-\x0a-$\xa7D\x17\x1d\x82\x0d5\x9d<KQa7\
-5\x1b\xc5\xc7\xdbA\xe1&\xfaP\xadk90Z\xbd\
-\x0cN(\x19t\x8af\x94\x95\x1c\xabb^#\x86\x12\
-\xfagK\x0aKP\x90\x81\x810\x971\x18E\x13\x05\
-\x84\x22\xe8\x11\x88<\xf8\xf02\x03r,\xa4\xc5X\x94\
-\xeaD\x83|L\x1a\xd2\xd8\xc0b/\x14\x8bV\x85J\
-A\xceR\xfb\x19@,\xeb\x85A\xf0\xc3\xff?{\x7f\
-\xfa,\xc9u]{\x82k\xed}\xdc=\x22\xee\x90\x03\
-\x80\xc4H\x00\x9c\x04\x92\x22)\x92\x22%\x0e\x9aU\xaf\
-\xf5^WU\xbfn\xb36k\xeb\x7f\xae\xbf\xd7\x97\xb2\
-\x1e\xaa\xca\xde$=\xe9i|\x14%\x92\x1a8\x83\x98\
-\xa7\x9c\xef\x10\x83\xfb9g\xaf\xfe\xe0\x117o\x02\x09\
-\x92\x00A\x90\x00\xfcgi\x99wJ\x0fw\x8f\xe3q\
-c/_{m\x1b\x03\x86e\x12\xc3\x10\x96v\x9b\x8a\
-\xc2 \xc7\xf1\xf0 \xc3 ?3\x04\xc9c+\xb1Y\
-\x05\xab\xb3\xc2\xc3\x08\xc9\x18[\xdb\xce\xb6\xef+\x0cA\
-e\x03)\xc8D\xd9\xd6&\x22\x1b\xc7tS\x84\x8cV\
- \x1f\x83\xa55\x1aa\x80m\x84\x10\x100\xa8\x06+\
-\xe4\xe0\xa8\xa6\xd8.!h&\x08L\xa3*\x22\x11h\
-\x052\x02r1\x8d\xb9\xdad\x03\xb5\x80\xa4\x96J\xb4\
-\x12<!\xc6\xac!n\xcdF\xbb\xf1k[\xe3\xd1\xb8\
-l\xc0\xd8jT\x12\xe4\xd1\xa6\xb2w\xae\x8b\xe4L\xea\
-\x1a\xcd@w\xb7\x921\x82ATc\x81R\xc4L\x9c\
-A\x0e\xf6\xd0\x8cJ\xdb\xf2X\xa2\x1ch\xa41/\x5c\
-\xe0\x00:9\x18{q\x93Y\x00\x06\x06\x8d\xbap$\
-\xed\xc6\x18\x05k \xccj L\xdc\xcdJs\xc8<\
-x\x90\x1d\xd8\xae\x1a373\x10:\x0b:\xbf\xc7\x8b\
-B\x00\xc8\x91zu@\x18\x9d\xa8\x81\x02:P\xc54\
-\xf6\xee\xe8\xdc\xe45\xdeQ\xcd\xde\xa7\xaf1\x13?3\
-6^\xba\x8a1m\xea\xdcw\x08\x11$aF\x86\xa1\
-\x0a\xa5F\x84\xe0\x06\xdaV\xff\x15^g\xf9\xf99\x04\
-\xa0\xf3S3\x01\x22\x84\x90\x0c\xa0\x8d/\xce\x93\x09h\
-bb\xe2\x03\xca$\x00MLLL\xbc[\x08P\x81\
-\x83\x1dh\x15X\xa3K\xdd\xbc\xe9\x05OH\x8dE\xa1\
-D\x17P\xb7!\xc1\x82L\x15\x8cv\xa1\xf5\x9c^\xd0\
-\xa4\xbam\x02\x12:O\xe6\xe6d+`\x18\xc0\x8a\x86\
-\xdc\x04\xfa\x01\x01$\x98\xdd=\x08\xf8\xfd\x08%\xa4~\
-\xdb\x9a3J\x03A\x00c\x14\xaf\x08\x8di%\x148\
-6X\x09\x0a!<\x9aTg\xc0[8G\xa3\xd9\x22\
-\xc0P\x0a\x1bs\xb7\xb7\x8dI[k\x05\xb7\x19\x17&\
-'\x1c0b\x8c\xce!\x00\xb2*\x15\x01<\x0b\xd8\x81\
-\x87hc\xc4o(D\xe3\xe8\x16\xa9\x8c0lkj\
-\xa9\xa5\xc68\xd3z>bg\xe7\xea\x19ogk+\
-@\x8c\x9dn\xdb\x90\x9c\xa8v.My\xbc\xa7.\x98\
-\xc8Q\x03\x0a\x9e\xfd\xdf\xdd\x86\xb7.\x9b\xedw`\x1c\
-\xb3i\x84]\xda4 l\x9b\x9a\xc0qFV\x85\x89\
-\x0e\xa8\xb2\x86Bv6\xc5>F\xa7\x95\xce\xf2\xc9\xcf\
-\x9cF;\xbb\x0a!\x84C\x0d\xb7\x8f\x15\xf7\x1a]\x1f\
-g\xf6\xa1\xddQS\xa3\xd9\x08>v8\x09gR\xa7\
-a\xbb\x07\x0e\x9a\xb6\x99GF\x8c\x19\xc6\xbem\x5c\xb2\
-\xc2\xb3IX\xbb\xf4\x9e\xed\xf4\xe8\xed\xa7\x15,\x84\xc2\
-\x22\xa0\xd8\xfe\xb4\xdc\xe6c\x1a\xf5\xd9\xba\xb8\xf3\x5c\x8c\
-\x89%[\x07\xc3\xd9\xd4\xb3\xe08\xa3-\x1c\x00\xdc\x01\
-\x1f\xf5\xb3Q\xb7\xd4\xd8\xf1\xb6\x1dc4\x9e\xff\x0a\x03\
-X\x0d\x15\x18S\xb1!\xd4\x18c\x98x\xf64A*\
-\xb0\x12,\xa3\xf6\xb5\x1d\xf1\xa5\x06\xf0\x14m\x8a\xc4\xd0\
-\xd8OG\xd1\xc7\xbaw\xe7\xaazc\x7f\xcdh:\x0b\
-\xc0\x98\xb6\xaa1wO\xfev\xdbE\xa8:\xb3\x98m\
-\xaf\xb0s\x17\xc1\xc4\x04p\xef\xc50\xe6\xff\x88\xa3=\
-\xb3\xd6Z\x05\xd0\xe9;k\xde\xddl\x97\xdf\xdb\xee\x02\
-;\xb7\x17\xc4\xd8O&\x00\xeeN\xba\xa6%;11\
-\xf1Ae\x12\x80&&&&\xde%$)\x1at\x17\
-\x86\xbax\xf5\xb5\xe5\x8b\xaf\xdc\xba\x95y\xe2\xb3\x8d\x10\
-\xe3\x94#u\xa6d!\x07]\xe8Lnb\xd4UM\
-\xa7\xcd\xa5u[\xbb\x1a{Y\x0b\xb2A\x12\x9act\
-\x839\xa1T\xd6\xf7a\xf3\xe8a\xf7\xe1G\xaf,R\
-V\x7f\x846\x8c\xe3\xbb\xea\xe1\xfd\xfd.Wd\xc6\x0c\
-&B\xa9R\x90\x11 \x82\x90\xbc\xca\x82\x0e\x18*\xb6\
-\xb5\x87\xa4\x00\x85L\xf4\xcd\xb6f~#\xaf\xbb\xf1\xbc\
-K\xcd\x15\x85\x8a\x99\x97\x94$\xb0r;\xe5\xaa\x8e\x92\
-F\x08\xa0\x8f\xce\xa01\xb2\x87\x90!\x83\x99\x88\xa6\xa6\
-\xd8<t\xc79B@\x8a\x9d>$\x8c#\xbf\x82\xa8\
-B\xd4\xad\xd7F@\x84\xba\x9dL\x03\xd3.0\xfa\xdc\
-\xf3\xba\xf3s\x8cc\xc7A\xc9T\x09U*\x22al\
-\xbb\x00\x82\xbb~\xc0Q\xfa\x91\x88\x02\x086\x00c\x9b\
-\x1a\xcfZ\x908N=\x17\xb76\xa41\x14\x07\xdb\x0e\
-\x0e\x01\x16H\xa4\x83)\x14\x90\xacHl\xaa\xa7H\xd2\
-(:T\xc0\x0c\x1a\xe5\x0f\x00\x84b{$\xc4V\xc1\
-\x19\xd5\x0c2\xc6\xd3e\x80\xdbY\x8f\x92\xc6|\x9f8\
-s\x97\x10\xe3\xa9&\xb7\x03\x80\x0c\xea\x1c6N3\x13\
-B\xdb\x8e-\x0b\x8e\xae\xafq\xe8U#9)Cg\
-\xf2\xd1j\x14lC2TC\xd8\xf8\xe8jX\xbb\xb1\
-eJ\x00X\xc2z\xb1\x86\x17PF\x16\xb8\xe4\x01\x12\
-\x95\x88sc\xa4\x04\xf8x\x06\xb7\xc79~\xd5*\x11\
-\x86J\x0d\x8c\x0e\xf5\xd0\xc6Lg\xdb\x98\xb8\x9b\xbc.\
-\x80\x81V[\x1d\xcf\x00\x03\x05ep za6h\
-_\xa2I\x00]\x8eh$\xdfi@\x196\xc0\xd6\x95\
-=\x01\x8eaR\xb1`\xb4\x83\xe5\xdc\x0e\x10bk\xe3\
-\xe2\xd8\xf9\xa2]\x8b\xcd\x9bt\x04\x86E\xee\xeau\x80\
-\xc1\x88q\xa2\xd2\xd8\xb5\xc3\xdd\xa5\xa01D\x5c\xbb\xe0\
-k\xbc\xce\x0f51\x81\xd7\xad\x86\xedK\x80\xb6M\xaf\
-!\x05\x22\xce\xba\x15\xcf\xf4\xc6s\xff\xe9\x9d\xe9\xff\xda\
-\xedJl\x85n\xe3\xd4\x00611\xf1\x81f\x12\x80\
-&&&&\xde5\xa2\xd4Y\xd2\xc3\xab\xe1\xe27\xbe\
-\xff\xc2\xff\xfe\xdf\xd6O\xdfJ\xcf\x17\x1b8\x0eW\x02\
-a\x84\x11\x0c(\x11\x8f\xcf\xcb\x22\x95!\xf0\xdc\xaa\xdd\
-\xd4d\x84\xa0\x86z\xb2\xcb\x17`\x83\xecG\xbdV\xa8\
-c\xa2\xf0\xe7f\xfc\xb7\x9f\x8c\xfb\xfe\xf0\x81\xc5C\x0e\
-\x18X(\xd6\xba\xa42\xef\xa9p\xbc/ \x14\xe0\xc0\
-\x99\x08G\x04\x91L\x06\x89P\x18\x91*\x9a@\x038\
-\x94 G\x98\xc6\xb4\xdf\xb0\x92\xfauw\x12\x16\xbcc\
-\xb59\xbf\xe5\xbb\xd8\x9dA\x89\xf0:\xeb\xfa\x03V\xca\
-\xd7f\xb5b\x90e\x03# Se2P\xdcE\x15\
-\xa3R\xd5\xb8qf\xcb\xf7#\x1e\x04,8`\x9c\xc5\
-\xae\xb01\xbd\x05!\xd6\x88QN\x0a\xa0\x0a\x11\x94\x9f\
-9fvm|\xdcUR:k[\x1a\xe3\x9f%\x12\
-\x0ey\xcd\x09\xc50P\xca\x9ce\x9bY\xb8@\x84\x19\
-,vz\x0a%\xd3@T\xa2`\x8cI\xb2]v3\
-\xb0M\xfc\x15\xb0u\xcd\xa4\x88\x86J\x80\x83>\x9e1\
-\x08.1\x04\x8c\xd3\xb5*\x02\xaa\x8d\xa2\x91\x02\x8c@\
-\x81B\x0cX\xd58ul\x0cR\xa6\x09VA\xd2\x00\
-V\x02\x0a76\x15\x00\x82L!G\x8c\x9e#0\xef\
-\x0e_\xdb\x8e7\x8e:\x11\x80\x0a\xb4\x88\xce\xd5\x18*\
-\x95\xa5\xd8\xd9\x80\x9a\xc2\x18{\xc9BMl\xab\xcc\xe4\
-\x08\x13\x18&\xc68\xbb-08\xaa\x05=\xdcb\xcf\
-\x86C\xd2AT\x10\xcc\xe1\xa7\xc56\x86\x12\x16\x85\x1e\
-h\xc9\x08nl\x0cE\xd6N\xc6\x03\xb71G\xdb]\
-\x1c]1\x82\x05\xa3\x1a\x0a\xd1#\x0e\xac^2\xb4`\
-\xcbz\xea\xccgS\x8a\x04U\xb4\x05\xe9,\xad\x89\x90\
-,\x13=Q\xaa.\x0c\xf1\xa1\x80;z\x07Pi5\
-I\xad\x94H\x82\x19Z\x05\x8e\xc2\xd7\x04\x08\x83f\x88\
-K\x8c\xbdjG\xa5\xb9\x19\xaa\xda\x1a\xd0\xce\xe6,\x9d\
-uo\xbd\x1e\x01\x22\xf7\xcb\xb0WoT #\x01m\
-0\x89\x0c\x8e\xadp\xd26\xe3\x8ac\xba\xd0\x9d\xec\xa6\
-\xf1T\xbc\x7f_m&~*\xaf{\xf2\xcf}\xba\x0d\
-\xb7\xdf~}\x9c\x07\x18\xdb8\xfb\xed\xf7\xc7o\xbdc\
-\x02\x10\xb7R\xb70\x0e\x83\xdfv\x93J\x04\xdfIi\
-ibbb\xe2\xbd\xc6$\x00MLLL\xbc{\x08\
-\xb5zT\xac_\xbb\xbd\xfc\xcb\xd7.\xdc\xca]\xd7\xee\
-\xa6\x9e\x9c\xbdW\x1eG\xed\x08?^%\xc2%T\x11\
-\xbb\xe0\x8e\x0a\xfcp\xd58$\x22\xef\xda9\xaa\xf8\x0f\
-\xc7\x07\x9f<\xba)[a\xbeO\x84|\xa8\x88\x1a\x1b\
-?\x9b\x17\xfd\x0b\xe6\x97\xf3\x86Z\x22=\xa1\xa9!C\
-n\x19\x16%J\x8e,\xc18\xce\x08\xa7\x8d\x91([\
-o\xc5x\x12\xc3P\x07\xc3\x8a\x8c1\x89F\xe7\x0ea\
-{C\xfa|\x93\xcf\xaeq\x89\x14j\xaf!3D+\
-b\x98\x95@\xa9B\xd3y\xdb\xb494T)d\xe6\
-\x84\xa0\xec\x16\xa6P\xa9\x1a\x96(7Fy\x0e\x84\x99\
-\x04\x89AF\x8d:D\x9d/\xba\xc6\xd1\xe7\x0c\xba'\
-\xcf\xa5\x06\xe8\xe6\xdb\x08\xd3{\x186v\xcdG47\
-A\x95uP\xc99\xc7\xcc\x95\x88\xb0<\xe4\xbe\xc2\xc8\
-\x90\x14L\xa9\x9d\xb9\xf9\xdd=V|\xc3\x07g\xc5\x13\
-B\x04\xc6\xdcq\x00P\x0d\xa3\xb5\x8d\x19\x0a\x223\xc2\
-jDT\x15I9B\xa5nj\xb8Y\xb8Gb\x05\
-B\x88\xaa:ZP\xccQ\x82\xa2{\x93\xba\xd6I\x8f\
-\xb0\x86\x0eZ_\xfbAl\xbc#Y\xabB\xd6\xb8\xb9\
-Y\xad\x08\x0dFl\xf3\x98\xb7\xcf\x06\xb9\x0b9r\xf4\
-\xd1\xafr-\xc9\xc2,\x93\x83\xa0\x22\x87\x89\x88\xa2\x08\
-K\xde\xcc\x9a\xd4\x85\x8c\x11\x88Z#\x1b\x098\xdc\x12\
-+\xcaz\x18\xe4\xa5i\x10\xae\xa2l\x22\xccL\xa8\xb5\
-,\x8b\xf7\x11j\xe7mb\xd3W#\xb7\x83\xe9\xc7$\
-\xa7\xd7=\x1fqg\xb9( \xd6p\xca\x00UD^\
-G\xbe\xe6h\xdd\x96\xb4\x8d\xa2n\x07\x90Q\xbbH%\
-GJb\x8aZ\xc1B#\x99\x22zJ\x8d\x97Z\x86\
-\xd2\x1f\x95\x1a3\x98G24\xa4\x01\x08D\xd8\x1a\xbe\
-\x1e\x87\xfd\x09dTT \x96VV^O\xa1\xba\x93\
-\x0ewS\xe0\xe3^\xc5\xf6\x9dC jEd\x1b\x97\
-\x9dUyBJ[C\x1bv~\xb3;\xcbe\xdb*\
-x\xcee1\xf1n\xf0s\x0d\xc9z\x1793Y\x8e\
-\xc1i\xd8\xf50\x97\x08x\x03\x98b\xfb\x8bl\xbb \
-_\xa7\x01\xbd\xd3\xc7h\xc6\xc9\x03411\xf1Af\
-\x12\x80&&&&\xdea\xde,\xc6\x92\x80\x9a\xe8\x9b\
-a\x95\x9a\xdcy\xa4\x94\xc8y\xf7\xa6\xefo5v\xca\
-\x08\xed\x9d\x8c\x91q\xfb\x10Hb\xbe\xfbJ\x153S\
-\xdeKy?\xa3\xbd\x1dq+\xd8\x17\x82I^\x80\xba\
-\xdb\xdc;T\x9b\x8dZ\x84\xed\xd2\x93%\x810\x070\
-\xc6\x9a\xbc{5\x89 \xa3',\xeaP\x10\xc5\x9b\xea\
-e\x9d\xd7\x1b\x1b\xb6!1a\xe3\x08\xa4\xad~a\xa0\
-\x05\xb7C\xb9\xa84\xf0,\x08\x22vA@\xda\x85\x05\
-\x9d\xafC\xec\x5c\x83\x0b\xeb\xdat\xbb%\x1c\xaa\x8a\xd4\
-0G\xack$c\xd7\x1d&;\xa8\x83rU\xea:\
-\xf3\xa8\x9b\xa1\xed\x8aq\xa8C\xef}f>\xaa\xbb\xfc\
-\x1b\x03\xc2G1J5\x04Y\xbb\x98\x1bk-\xe1\xcd\
-\x81\xa5E\x84r\x98YJ\x1aR\xed\x0d\xb1\xbb\x7f=\
-\x1e\xfb\x18\xac\x8c\x10\xdc=\xb9\xca\xfa\xd4\xe3\xd4\xa4~\
-\x09\x12\xed\x0cn\xb5\x1f\x86>c6']\x1b9\x8d\
-M\xb3\x1f\x8aq \x8ePt'\xacg<\x19ck\
-\x8f\x80P0\xc0`\x0a\xb5\x92A\x16fn4\xd6T\
-V\xb6Yz\xe9SD\x1bZ\x84\xcd\xcd\xdby\xe2\x1e\
-\xd4\xe6\xd6\xd9vh\x12h^j\xdad\x0d\x05%4\
-\x94\xb8y\xbb\x9c\xac\x07\x94\x8de\xe6\xb0\x08,\xe6\xf3\
-fooP,k\x9d[\xdbX\x13UQ\xdc\xbc\xf5\
-\x86\xb5g-p\xabD&\xeb\x18`\x04\x08JF7\
-V\x0c\xb7\xf2r-\x0c\xee\xec\xc6\xb6/\xc3\xaa\xc0\x09\
-\xef\xe8Xe\xca\xb8\x98\xa5+\xa1\xb6\xca\x222\xea:\
-5\x1d\xd0\x86\x90l\x8d\xb8=\x0c\x88\x9e\x8d\xc3\xcdJ\
-\x81\xa0\x04\xd6\xd1\xe4\xe2\xb5\x12]sq\xd6^d\xd9\
-\xeb\xb5\xac\xdd\xd2|\x0c\xee\x91k\xec\x0b\x04iA\x0b\
-\x89>\xeaeU\xaa*9%5\xa8\x12\xb3\xd69?\
-\xc3\xa2\xa6\x89\xb6A\xcdQ3H\xa0\x93$\xa6\x86\x5c\
-\x00\xad\xf9,\x97e\xade\x96LMW\xd7\x05\xb5\x9a\
-\x9f2\x97\xbc\xbeVrOxGJr@@\x86H\
-\x95\x14\xe6\xbb>\xc5\xa0\x0d\x0e Hs\xdc\xb1\xb7\x9d\
-\xbd\xd0\xdcIm\xbe\x87\xa4\x18 Kv\x0fo0\x8c\
-\x03\xe5\x1d\xe2,\xac\xabh\xdd\x1aB\xe3\x9c0\x8b\xd1\
-\x8ee\x1aC\xcdI\xa1\x9c\xe9M\xef\x0e?9$\xf8\
-WP\x1f9Sm\xb63\xd1w\xb6\xac\x9f\xf1\xff\xbe\
-\xf1\x87\x7f\x95\x8eq\xeb\xff2\x18v\xd6E\x93YH\
-\xb0\x22\x06h`\x95\x09\xac\x119\xc2f3x\x8aM\
-\xb1\x86\xdcy\x0e\xefr\x03\xfd<G\x17\xb1\xdd\x89*\
-38m\xec\x85\xf4\x94h\xef\xbc\xae4111\xf1\
-^a\x12\x80&&&&\xde],D\xd0<\x99\xac\
-\xfe\xa4\x1f<\xcb\xc8}\xfd\xd7\xdf8\xbdY0\x0a\xc9\
-\xab\x1bl\x08\x1fB\x0a!\x8d9!\xe5\xfd\x1b\xcdA\
-I\xa1\x02\x97\xa7\x80\xfa~o\xa6+\x0f^\xb8\xb4\xdf\
-\xa5\x18J\xce\x95\xa3\xcbb\x1c\x01\xbe5[\x98dP\
- U\x9f\x8f:\x8c4\xe6\xf1nc{\xb7A8v\
-\xc7;u\xfe\xfc\xa9\xc2e\xf3\xc6\x93\xd5R7M\x93\
-*y2\xe4[\xab\xfe\xe5\xeb\xcb\x0dh6w\xd8Y\
-\xbfM\x94B/\xfb\x0b{\xf4\xfe\x83\xcbiV\xa2f\
-\x15OfNYd\xb02\x9ay'[<\xfd\xdc\xd5\
-\xd7n\xae\xda\xc5\xdc[\xe4Z\xba\xd9\x9eEZ\xf7\x95\
-\x11\x89\xa3\xcev\xd7\xc1\x8f\x1e\x14\x12\x92r\x1eT\xd6\
-\x97/\xcf\x1f\x7f\xe0\x00\xeb\xe5,\xfaYB\xed\xfc\xa4\
-\x8f\xe5\x80\xbd\xc3\xfbRsx\xf5\xf6\xfa\xb5k\xab\xf5\
-r9\x8eB\xc6\xd8\x8b\x01\x08\xbeU\x81\xb4-\xa9\xa3\
-\x16\x03<% e9d\xee\xc9h\x80\x0dC\x7f|\
-|\xdc\xd5\xe5\xa1\xc7A\x8b\xfb\x16x\xf4\xbe\xd9\xe3\x97\
-/\x5c\xd9\xbbp\xe1R\xba\xf8\xa14\xbb\x90\x1c\x96\x9a\
-\xe4mKx\xc96\x14\xf4\x05\xcbM\xdc:\xda\xdc<\
-\x1a^\xbd\xbez\xf5\xfa\xf1\xf5\x1b\xb7\xaf\xde\x5c\x9e\xae\
-\xa0UdY\xbb\xdf\x0d\xa6~X\x22i\xd6\xeeU\xda\
-0\xe4Zd\xa4\xa7\x0e\xec\x89\x8c\xed\x5c\xbc\xed\xb8h\
-*\xa2j\xd1\xe2\xc9'\xef\xbbt!\xb5i\x9db\xe5\
-5[\xf2M\xae\x827{\x87\xb5\xdd\xbbu\x9a_x\
-\xe5\xe8dy;\xb4\x07O\x86\xe8Z\xf7&I,\xb9\
-H\xe5\xca\xfd\xcd\xe5\xc3\xb6\xb5\xd2\x85\x9aH\x1a\xa8\x02\
- dl\xf6\xdb\xecx\xee\xb5\xa3\xd7n\x1cK\x97;\
-\x1e\xae\x87\xac\xa6\xa2%\xef\x1a\x89\xbe=\x7f$\xb1\x0d\
-\x9b\x95\x8f'9\xfa\x88\xbc?\x9f?\xf4\xd8\xc5E\x83\
-\xe8{Gm\x1by\xedk\x1d\xcc\x1dm\xbb\xca\xe9\xda\
-m\xbcv[\x9b\xa1\x1a\xab\xd1\xc3R\x91\xac\xc8m\x16\
-\x05eu\xfbp\xd6~\xf4\xd7\xee?\x9c\xd7=\x94\xa6\
-\x0ey]\x90\x1b\xc1\xd40\x12kZ\xcaWc\xf5l\
-\x01\xcfs\xd4Y8d?I]\xb8\x97\xf4`\x01\xa6\
-|t\xe0k\xb6\xd84M\xef\xb3W\x8f\xf3\xcb\xc7\xfd\
-\xc9\xc0\x08\x18@\xf9\xa8\xc0\x8d2\x06\xce\x0dTz\xf7\
-K\xea_%\xf9\xe3\x17\xc2O8\xc0_\xc1c\x7f\xf3\
-Xem{$\x81\xf17\x98\x22\x22\xa0\xb3\xfcz\xe9\
-\xddk\xcb\xba\xd3C:111\xf1Ad\x12\x80&\
-&&&\xde%\x04xe\x9b\xeb\xde\xa0.\xfb;Z\
-.I\xe0\x80f@\x1b\x94\xa2\x15r\x84T\xc7\x04\x84\
-_\xb9:\xe1\x1d\x83\x16\xb5z\xe9\x0f\xadm(\xaf\xab\
-\xa7\xee\x9f\xff\xf1\xef<\xf6\x1b\x9f|`\x91Ves\
-\x1b,\x96\x80\xed\x0c\xef\x08\x14B\x8a\x02T\x07\x9bm\
-\xd8\xaf\x9dI+\xdb\x9a\xean\x89M\xdau\xf6@\x84\
-61[\xe1r\xd7\xcd\x1b/\xc3\xb0\xa4\xa5fvx\
-2\xb4\xdf\xfa\xde\xd5\xff\xcf\x7f\xf8\xfe\x8f^>\xb2\x8e\
-M\xda\xdf\xa6.\xd3\xa3H%\xf6/\xcf\xfe\xf0w/\
-\xfd\xc1\x17\xf7\xa8\xbc\xda\x0c)\x19\xddCQ\xa5\xb0v\
-~p\xf1\xb4o\xff\x97\xff\xf5\xe6\x9f\xff\x1d\x82\xa5\xc6\
-q\x8d\xa5u\xa0\xedi\x182k\xa2\x12*\xb6\xd3\xcc\
-\x08\x18\xc7\x0c\x1d\x8d\xf9?\x15u3k\xcb\xa7\x9fz\
-\xe2\x7f\xfe\xc3\xcf=\xb8X\xcd\xf2\xed\xd6\xfa\xd2\xf4\xcb\
-\xba9\xed\xd5\xce\x9f\x84?\xf6\xed\x1f\xbc\xf6\x9f\xfe\xf4\
-\x9f\xbe\xff\xf4Mr\xe16\xaf\xd5\x02>\xc6\xeb\x04\x00\
-\x18\x8b\x8d&\x03\x0e\x83\x0b\x89\x9d\x01\xea\x07zmg\
-r\x1fr\x9f\xf3r\xb3(\xc3\x13\xf7\xe1\xd7?\xdc=\
-\xf5\xc4\xc1\xc7\x1f>\xfc\xb5\x87\xf7\x1f\xba4\xef\x9a\xd4\
-6\xcb\xc5\xde\xed\xa6-\xa0\xc3\x12<\x01\x8e\xc2\x08\x96\
-\x8au\xb1\xa1\xb88[\x0e\xb3\xab7\xe6\xaf\x5c\x9f\xbd\
-\xf4\xea\xf5\x1f=s\xf2\xfd\xef\x96g^=\xee\xd5\xd0\
-\x95J\x99\xb7\x9bY\xc3!\xdau_\x22#u\x0d\xcd\
-aV\xd5\xd8\x98\x96\xb3\x0d\xd8\xa9\xb5WR|\xf4#\
-\x8b\x7f\xffo~\xed\x13\x1f\xbf\x18\xc3u\xdb\xdcl\xb4\
-\xee\x9a.d\xb9xm\x0f\xca\xe2\xf2\x8f_\x5c\xfdo\
-\xff\xf9\x1f\xbe\xf5\xfd[C\xce@\x17^\xd4\xd4\xca\x1e\
-\x9a)\x0fi\xbe\xf9\xd4\xa7\xf6~\xff+\x97\x1e\xbbR\
-g\xca)\xab57X\xc9C\x95l6\xcb\xd6}\xf3\
-;\xcd\xff\xef\xff\xb8\xf6\xe2\xb3W\xdd\xfa\xde\xd6'\x1e\
-2Kc\x1e\x91\xc6\x14d\xe3\xd8\x986\x8eV\x83\x84\
-H\x86\xd6\x89\xcd0lb\xff\xe0\xe0\x8f~\xfb\x89\xaf\
-\xfcV\xc6p\xbc9\x8d\xc6\xd9r0n\xac\xf5h\xee\
-\xbbz\xbc\xf7\x1f\xff\xec\xf9\xff\xfa\xd7\xaf\xde^Eb\
-jfI\xe8J\xcd*\x985\x17g\xed\xba+W\x9f\
-zp\xf6\xef\xfe\xe4\x89\xcf<5\x9f\xeb\x86\x0dU\xbd\
-#\x1f\x90\xf3H^\x88\x92\x8e#\xdd\x02DT\x93[\
-\xb9de\xcf\xb9v\xae\xef\xeen\xbc\xfb\xea\xb9G\xc9\
-\x1d\x10\xcc\x0e\x22=\xb8\xe1\xa2o\x0e\x8f\xca\xc1_}\
-\xf3\xa5?\xfd\xfb\xa77\xd7\xfaM\xa0\x8474\x07|\
-\x9c\x12'(D\x8b\x10%:\x02\xefns\xcdO\x16\
-A~\x8e!\xe2\xbfB\x9c?\xc6{\x0cn\xfb\x959\
-F\x9eY\xca\xee^q\xe3K\xea\x16#\x83c\xba\x97\
-\x22\x90\x89\x96\xdb\xf6\xc1\x89\x89\x89\x89\x89w\x85I\x00\
-\x9a\x98\x98\x98x\xf7p\xc9\x22\x1a\xc9\xe3l\x9c\xf3;\
-\xc0\x18\xf1Z\x99\x0a\xad\x92\xa2CU\xa8\xf7\xce\x8dy\
-?A*\xc2s\x9e%c\xdd`\xd0\xa5\x96\x9f\xfa\xd0\
-\xc1\x97?\xf5@\xd7,c-\xb2'38\x86L\xd4\
-\x8a\x0a\x8bQE\xe8\xa2Z\x1e\xce\xb6\xb3\xfd@\xbb\xd0\
-\xd0;>+\xee\x02\x81\xc6\xd8\x99\x0at\xc7\xd6E\xd3\
-4\xd4\xd0wR\x9a\x1f^\xec\xe3\xa0\xdf\xf4\x7f\xda%\
-\x0d\xc5\xbb\x0c\x1be#\xb9\xbbz\xd5\xac6\xb5O>\
->\xff\xfcg\xcc\xa4\xe5\x1a)\x8d\x1bf\x0d\x14\xf3v\
-1+\xda\xbfq\xe3C\xd7n\xae\xbf\xf5\xfd\xa1'\xd2\
-\x9c}>\xce\xb0p\xb3\x9d\xa9\x84g\x02\x90\xb6\xd3\xb9\
-A\x98\x99%\x96\x5ce\xb8tq\xfe\xa9_{\xec\x89\
-\x0b\xd5\x97W\x1d\xb7\xa3=\xcdi\xb6*L\xdd\xe5\xf0\
-\x07W}\xfeo]\x94\xdc\x9b5\xa6Np\x81\x12\xb9\
-\x1d\xcfN\xaa1\x98\xa0\xc4\xce%\xf4f\xae6\xb1\xaf\
-\x9b\xf5\xf2\x84\xd84(\xf7\x1f6O>\xfc\xc0o\xff\
-\xfa\x95\xaf|\xf6\xfeO<\xb6w\xdf\xbc\x5c\xc0I\x8b\
-\x1e\xeaa\xb7\xa1\x97\xb1\x19v\x1e*\x00\x86B\x93\xb5\
-\xb2\xd6:\xcc\xf7\xd1\x1e\x00\xb3G.\xf0\x13O\x5c\x5c\
-\xe6\x8b/\xbd|\xfa\x83\x8f\x9d\xfc\xc3\xf7\x8e\xff\xcb\xb3\
-\xa7?\xb8\x0e\x0f\xa8l\x22\xad\x8c\xdeyS\x0c\x92\xd5\
-(F\x03}\x1cIf\xd8\xeav\x0a\xa8\xe4y\xd3\x7f\
-\xfc\xa3{_\xfa\xdc\x83\xeb\x93\xe0Js\xec\xb5M2\
-\x9b\xf5\xbd\xf5\xa9\x8d\xc3\xfb\x17{'\x7f\xfdu\x11\xb2\
-T\xcdr\xe5PQT\xe1\x145H\xf9\xfe\xfb\xbb_\
-\xff\xf5\x83\x0f?R\xda\xba\xd4\xf2\xa433\xa3)\x82\
-\xda\x94\xb5/.\xdc\xff\xc0\x03/\xbdP\xae?w\xb3\
-_\xe7\xbd\xfb\xf6W\x0d\x87\xd0\xd8\xf28.\x9aq\x9d\
-\x18\x84\x18M7\x8a\x1aaA\x84Be\xc0,\xcd?\
-\xfa\xc4\xe5/}\xfeT\x9b\xf5\xf2H\x0dS\x93\xda\xe4\
-\x8d{\x8a\xf6\xbe\x97n\xee}\xfb\x9f^J\x8c\xa8C\
-D\x05\x1b\xa3\xab\x94\x08\x13\xe7dI\xa5\x1e\xfa\xe6\xa9\
-\xc7\xf9\xdb\x9fm\x9b\xbe\xf8\xd03Z\x14\x80\x0d`9\
-\x94\x9b6\x9a\x19P\x08s\x99\x15z1W\x05V\xb0\
-7\x11\x80\xee\xfd\xe2\x10\x90\xd0\x1c\x14\x1e\x1c\xc5e\xed\
-]9\xd1\xc5\xe7\xafnf\xdf|\x9a\xa8\xc9\xc7\xd5\x02\
-\x0a\x0e\x1b\xe3\xab\x89q\xc6\x9b\x04\xca\xf4\xee\x17\xf2o\
-\xa6\x01\xfd\xea(#\xef\x14gGz\xf6\x81\xd9\xaf\x96\
-\x93\xe5M\xce\xf8\x98kn\xe3\x0b\xd7\xa81\xc784\
-\xf1N[\xe2\xa4\x01MLLL\xbcKL\x02\xd0\xc4\
-\xc4\xc4\xc4\xbb\x89\xb6~\xf77\xf7\xca\xbfm\xc6\xe8\x16\
-G\xad\xaa\x12Mf\x22\xc6i\xd9\xef[*\xd9X\xba\
-T\xad\xab\xc3\xa9\x06\xe4\x1e.r(\xb1\xba]\x86[\
-\xc0 e\x8d\x819\x16B\xd5() 6\x81\xa6\xba\
-\x01\x82\xce\x95\x8a\xdb\xb8\xdc1\xc7\x17\xd8u\xb7T\xc8\
-$\x81\xe15\xf5h\xaeF\xcf\x82\x8aZ\xa2\xb2PH\
-*\x9b\xd5\xfa$T\xe1\x9e*\x9b\xa1\xa6\xc6\xd5x\x93\
-\xc9\xa1BN\xa9\x96U\xb0\xae\x87\xd5\xa0\x86\xa6\xd1\xa3\
-E\xa0\xc9\xa7\x99\xed}\xbf\xf5\xd4\x95\xab\xbfu\xeb\xda\
-+/=\x7f\x1d\xb39\xa3 \xd7\xd4\xd8\xcc\xecT,\
-\xa1`\xf0lF\xf9\x18d\x04\x09\x0aS\xa8\xd6\xdcC\
-\xc3\xda\xe3&\xfb\xbe\x9c<\x13\xbaY|m\x0d;\xd0\
-r[\x17\x07^N\xb4\x19P\x91\x8c0\xc6Y\xfa\xf5\
-\xae]\x0d\xa8\xa0\x08K\x8dk(%o\xba6f]\
-]\x9e\xaeo\xdd>\xdd\xeb\xf0\xe9\x8f\xe3k\xbf\xf5\xc8\
-\x17?\xff\x91\x8f>\xb4\xb8\xdc\xc5\x9cKln\xac\xf3\
-QEiJ\xb5\xda35L-\xb6!\xc8\x1a\x1d%\
-\x00\xaa\x19#\xb4:\x95o\x0a\x9a\xa2d>\xbb0\xbb\
-p\xf1\xc9\xc3\xa7\x1eI\xbf\xf5\x9b\xf3'\xbf\xbb\xff\x1f\
-\xbe~\xe3\xc7?\xc8\xb7\x8f\xa2\xf6\xab\xd4\xcam\xde\xb0\
-+PE\xad\x11c\xae\x88\xd3\x04\x86$&cSj\
-=>]\xe6\xf5M\x94T\xd6/\xa4\xcdmG\xadk\
-\xc2\xe7\xcc\x9eaH\xd5\xab\x86MlV@\xd7\xc0\x1b\
-9\xe4\x9eCmYx\xdfA\x83\x0f\xde\xd697+\
-\xf5e8\xda\xa8F\x82\x9a\xd6\xc3\xac_o\x0e\xee_\
-|\xf8\x81\x87\xbe\xf6\x1b\x0f\xfe\xf8\x1fn~\xf7G=\
-\xfb\x05\xe7\x94\xa9\x0au7\xfb=\x00\x03\x03\xa6\x08\x02\
-f^\xaar?\xccSI\x86$t\xd6\xee\xb1`u\
-\x0d\xcb\x1b\xbe$I\x98\xe45\xccJ\x13\xf9\xe4\x02\xcb\
-\xd0:\x1aw\xc1jH\x0e\xb8#,\x14\xb5\xd8\xb0\xf2\
-\xcd-\x8b\x95\xab\xcf\xeb\xa3\xb5\x0f\xfd\x0c\xc2\xe6\x08\xe8\
-#-*\x9ah\x86h\x0a\x90]C\xc8TS\xd4\x08\
-\x0cF\x9ek\xbd\xb9\x0b\xe9\x8e\xb5\xed\x1cF \x86!\
-\xd7\x97\xa2\xdc4\xa2\x9b\xcf=\xfa~5\xe4\x0d\xbc5\
-2Qi\x9c}f\xa81\xb6\x9ci\x1c\xf0\x14\xe0\x1b\
-78\xf1\xf3r\xa6d\xfd\x0a\xf6|\xfd\x04^\xbf\xec\
-\xce%\xaam[&\x85\x08Aw^l'&&&\
-&\xde\x05&\x01hbbb\xe2]cT\x1b\xb2G\
-\xb5xc\x90\xcf\xcf\x0b\xb1\x0d\x841\x84d&\xb3\x18\
-\xe7\x14\xbd\x7f\xab2U\xb3=\xc7\x03%\xdaZn'\
-\x5cm\x84\xa6\xcaO\x8f\xb5y\x15q=\xb1\xa0d\x98\
-\xe0\xa0QFI\xd1\x04\xacF\xa4\x1a\x8b:f\xe9\xde\
-)\x5c\x09n#fBw\x04 \x0a1\xda\x1dd^\
-\x8f[\xdc\xb0*\x03RR\x01\xb0\xd9D\x0a/\xc7s\
-\xaf\xad\xc1\x99r4%\xdc\x9d0Wb\x16\xd6\xb9\x8f\
-\xe14e\xb3z\x92r\x9fB\x8d\x0aU\x834Z\x19\
-n-\xf3\xad+\x97?\xf5\x07\x9f}\xe2\xe5\xa7O\xff\
-\xe3\x7f;:\xbe\xcd\xd9l\x16:\x14gl7\xc5\xb3\
-$\xc2\xb9M\x82\x1e\x1dI\x89\x11\xa1\x0a\x8f\xc6\xd5V\
-\xcc\xb4\xe9\xe2j\xaa\xc7^\x9f\xe9x\xb3\xe4\xb0\xc20\
-T\xc5\x86s\xef\x8f;\xf5\x8b\x06\xd6xvW\x8c\xef\
-\x01FYi\x9c\x8e<j\x93\xac\xa3\xdf\x88\x11\xc3q\
-\xc9\xebE\xae\x0f\xde\xe7\x9f\xf9\xe4\xc1\x1f\xff\xee}_\
-\xfd\xcdG\x9fx8y~e}\xe3\x95\xcd\xc9-\xc6\
-\xd0\xcd\xd8\xce\x12\xca\x10KY\x7f?\xcbEX\x013\
-b\x00*X`\xc5\x01\xd4\x1a\xa57\x87\xd1ZX\xcd\
-\xa8\xebW\xd9\xb6\x8by:\xfc\xd0\xe5+\x8f?\xf5\xe1\
-\xc7N\xfe\xe2O\x9f\xfd\xc7o\x1d\xfd\xf8\x95\xf5\xfad\
-\xd3\xecof\xf3\xcb\xd9\xdbe\xadE\xc1\x90\x8c\x22\x0d\
-\x96H\xa2\x09\xb4dnR\xdf\xa6\x1b\x9eO=?;\
-\xd3\xb2\xab@\x06\xdc\xbc\xb6Cx\xed7-\xf6\x13*\
-9N\xd3\xb3L\x0bS\x0d\xb6\xfd\xc1\xbcv\xb3\xbaN\
-\x03lC[\xe6&\x0fm\xa9]\x19ZH\x859\x8c\
-Q\xdb\xe5\x8b\xa8\xdd\x17>\xfa\xf0\xcd\xafr\xf3\xd23\
-\xfftt;\xef\x1dj\x96\x10\xe3\xe8\xae1\x94\x9a\x01\
-\x8e\xa7\xce\xcd<y)\x16\xb5\xd2\xca\xccY\xa9\x94\xad\
-\xe9\x8ff\xab\xe7\xb4Y\xa6\x1eil&$\x8c\xd4\xec\
-\xb6\xe7+\x1c\xd6V\xd1Z\xca\xe6% \x935\x8e\xe8\
-\xfa\x82\xa6\xd8\x1c\xd6e5\x9b\xea\x9b%\xfbS\xab\x03\
-\x91\xd1\x9f\x22\x927\x97\xcc\xe6m\xedk\x19`\xbd#\
-SP\x14\xd6u5/fz\x13\xab\x0f06\xaf\xbd\
-\xe1\x92\x82%\x0e\xf3z\x9a2\x86~O\xe9b\x1b+\
-\xd6\x82Bo\xdc\xe0T\xc31Z\x8c\x95\x0c \x08\xc8\
-\xab\xb6Yd\xef\xb6\x91\xe3\xfd\xe7\xf49\xcf{\xe8\xe8\
-\xb8\x9b\xf3\xbe\xf5\x13\xde\x1d\x09\xb4U=\xc11\x9e_\
-D\x89P\xe8\xcet\xb9w\x95Io\x9a\x98\x98\xf8\xe0\
-2\x09@\x13\x13\x13\x13\xef\x1ec\xe0L\x98\xc2~\x11\
-oA\x03\x18\x80\x02\x04\x116\xeaM\xef\xf3w\xba\x06\
-j\xc3\xd5\xba\xae\xddVs\x22\x9a\x1a\xbe\xacN\xda\x86\
-V\x0d\x055\xef~\x98\x90\x05\x18\xe2VK\xd08#\
-M\xe7n\xad\x0b\x82`\xce]\x98\xc9\x99\xdb&\x04#\
-(c\xa0\x84\x05\xcc\xe0\x06\x13\xc1&WZE\x9b\x90\
-\x12\x03)\xe8B*R\x1a\xe7\xfe8r\xed\x87:H\
-s\x8aT0\xc2PM\x80\xe4V\xe1\xe8b\xc3r\xf4\
-\xe4#\x8f\xfe\xce\x97\x1e\xf9\x97\x1f\x1e\xbd\xf6tm<\
-7iY\x0da\xf9\xcdz$\x08\x18\xcd]\xd6\xb0\x03\
-\x12+\xf2\x12\xcd1b\x05F\x9b\x00W\x04\x88`\x1e\
-4dD PJ)\x88]q)0\xc0m\x126\
-d\x80r\xa9\x09l\x9a\xb2^m\xfa\xbe~\xfc1\xfc\
-\xf1\xef\xdc\xffo\xfe\xe0\x93\x9f|r\xd1\x94\x9b7_\
-|\xb6\xe5\xe9\xccb\xde\x85JX\x85m\x84\xe4\xd8\xb3\
-\xd2\x07b\xcd\x14dE\x14D%\x0aQA\xa1K\x98\
-\xcf\xa2\x14\x8b\xa0\x1b\xe1*\xcaC\x8e\x9cm8\xe9\xee\
-\xbf\xf2\xc5O=~_\xb7\xff\xe0\xe5\xef\xff\x1f\x7f\xf6\
-\xdaw\x9e\x176\xb9Y\xd4@\xa95\x07\xe1\xd8\xba\x95\
-\x00\x03\x1daU\xe6\xe6\x8b\x19\xdbFfj\x0c\xc9\xc4\
-\x18\xcfS%b\xd1\xce\xd4\xb5mc]\xcb\xa6A\x95\
-\xd5\xda\x16\xb3\x1aY\x84\x1bf]t\xad\x88\xaa<D\
-? +\xd5\xe4\x11FE\x1f\xa8u\xb6\x87\x92\xeb\xed\
-\xa3W\x0e\x0f\x1f\xfa\x83\xdf\xff\xc8K?>\xfe\xc1_\
-\xbf\xd8\x97\x0a\xa4\xf3\x06\x87\xf14\x922\x8e\xdd\x83h\
-\xdc\x8b\x19D'\x9c\x80*\x8a\x1a\x91Dc\xe6\xb4\xca\
-\x88\x1a\xe62K3kP\xa8\x02\xf7$oz\x84T\
-)\xd2\x22J\xad\x0a\xa1\x853\xcb\x825\xcdh\x05\x84\
-P\x81\xbc\xd5+\xeb\x18\x8a\x0d\x10H\x04% L\xaa\
-\xe3t\xed7\xb9x\xdeD\x5c\xa0EoB\x04\xa2\xdf\
-\xb0\xdd$\xa21k\x8c\x8d7\x88\xa4\xb0\xdd\x85\xb1m\
-\x1e$c;\xbf\xfb]\x7f\xb1y\x0f\xe9#o\x8f{\
-\x1e\xe0{\xf4\xa85\xc6\xed+\xc6\xb6ZEh\xbb>\
-m7\xabrbbbb\xe2\x17\xce$\x00MLL\
-L\xbc[H2\x95\xa6,\xdb\xb2q\x05\xed\x9d\x12g\
-\x0424O\xeb&\x9d\x90\xd9\xac\x8cI1>~\xf3\
-\xfd\x0b\x83\x91\xca\xe6\xe2\xe9\xa0<\xcbG\xa9\xc7j\xb1\
-Yv\xaf\x0c\x07\x97\x1b;a\xbf\x82\x01>\xfe(A\
-\xaf\xf4 \x0aP`\x0d\xea\x0c+\xdb\x8d\xa0\xb9\xc3.\
-\x11\xfa\xaej\x96w\xbe\x8b\xbaMJQ\x00=\x9c`\
-\xe3\xa6\x14K\xb7\x1e\xacM-{\xa5Y\x14\xb6\x8a,\
-\xd2\x8c\x981\xda\xa8\x84c\xdf\x19\x0ds\xc3\xbe%)\
-\x99@\x225\xb5kW\x15\xafx\xbb\xf8\xd4G\x17\x9f\
-\xfb\xd4\xc1\x0b\xaf\x9d\x1e\xe5[\x0dW\xe6\xdd\x1a\x91-\
-\x1b\xcc\xe1\x16N9\x94\x0c&QB\xad5\x97\x1e\xb9\
-B0\x95T\x973\x1ec\xd6\xb3@\x05,\xc0\x80f\
-\xc1\x19S\x17\xde\xcaP\x81b\xa9m\x0aRE!\x06\
-p \xb2E\x1d\x93\x92 1A\x8cM\x96T\x1f{\
-8\xfd\xc1W\xf6\xff\xa7?|\xe4s\x9fd\xd3\xffh\
-\xb8\xfd\xa2k\xd5\x18\x9b\xe2$\xd0\x00\x95\xa8m\xa9\xde\
-[^67\xab\xa1k\x90\x08V\xa0\xc2\x0a($\xc0\
-\xeaP\x07\x96\xa2d\xec\x9a\xc4n\x91\xd0Y_\x87u\
-\xbfY\x0e\xb5\xff\xe1\xa5\x8b7\xee{\xf2\xbeK\xfch\
-\x9czY^}\xe5v\xd1\xfaD\xdd\xdcL1N\xd7\
-b\x0a\x03\xc2K\xb8\x02Yh`\xaa(\x9b\xacH)\
-\xd17\xc0\x00\x10\x08b\x90C\xc3\xa0\xcd\xaa0W\x0c\
-\xe8\xb5\x1f\xba\x5cS\x09\x93y\x16\x97\xc0mh\x85\xe8\
-L\x9bFl\x86E7,\xbcV\xd8\xc08n\xd4\xbb\
-\xc3\x84\x94O\xb8y\xfa\xc9G\x1e\xfa\xbd\xaf\xfa_\xbe\
-\x98\x9e>%\x02\xc5\xd9\x04\x14\x02\x82\x92\x0bat\xf7\
-\x5cJT\x99!%g\x11kXA\xaa\xb5\xab\xad\xf7\
-\x97\xb0\x96\xadf`r;u,\x99\xe0y\xe6\xb9m\
-\x0a\xdb\x8aT\x92j\x97R\x19\xd2\xba2\x02F\xb3p\
-\xf4\xdc\xdb\xa4\x83\xa5_8\xb1\x9b\xf3\x14m\x80uL\
-X\x12`\x81Yv\xabI\xb0\x1c\xcc\x1e\xa0\x07T\x88\
-\xd2F\xfc\xcc\xe1*\xe7\xda %\x04Lh\xfa#k\
-Of\xa5t\x19>\x10\xe6\x92\x85\x0cFS%!\x8a\
-6\x84I\x16\x22T[\xaa}\x7f\xbf\xe6\xbc\xcb\xfc\xd4\
-\x84\xa3\xf7J_\xd8\xd6TI\xed\xc6,*\xa8\xca8\
-k@\x9d\x98\x98\x98\x98xw\x98\x04\xa0\x89\x89\x89\x89\
-w\x8d\xb1U\x04\xc5\x10\xef\xf4;^\x01\x9b\x8c\x88Q\
-\x9c\x18SZ\x7f\xa1\x85\xc1\x99\xbb\xff\x97\xf9\xde\xdd\xc4\
-\x0a\xf5\xb6)\x1a\x9aTK\xc6\xaa`\x88\x0d\xd3\xc6\x9a\
-A\x1b\x01@\x224z|\x22dE&Kp#\x8b\
-1c\xd7\xb0\x00\x9c\xcdA?\xf7\x00\xc2]\xf3\x82y\
-\xf67)q \xaa`\x86f\xaf\xc5\x81q\x19RT\
-\xd5 \xe0\xc6\xa4\xc8Y%9\x9a\x96\xde\x08`\x04\x10\
-\x01i;\x9e\x1e\xf41v:\x80\xa8)m\xeapt\
-\xdf\xe5\xcb\xbf\xfb\xd5\x8f\xbdt\xe3G\x7f\xf3\xed\x93\xbe\
-\xacdC\xa4\xc4\xe4\x14\xa5\xd1\xa0\xb4\x0d\xa6&\x00\xa3\
-\xbb\xd5J\xd4\xb1\xac\x0aGN^\xe0\xb1\x1d\x9b^a\
-\x01\x90\xads\x96R2\xab\x05\x91\xc3\x08P\x0c\x01!\
-T\xa2\xc2\xb2\x22\xa4H\xc6\xb6K\xabe=>\xaeO\
-=\x96\xfe\xfd\xbf\xfd\xf8\xff\xfc\xfbO<y_\xe9o\
-?_N\x9e\x991\xb73\xa0\x02\xb9\x00\x10\x11\x80\xa4\
-R]\x8ds\xe6i\x866\xb1qX\x88E\xd1\x8b\x05\
-\x0eY\x95yx\x0b\xc2\x04\xa8\xdfT\x85\xaa\xbb\xb9\x9b\
-\x899N_\xe5\x5c\x1fy\xe4c\x7f\xf2\x87\xf7\x9f\xe6\
-\xef\xfc\x87\xbfx\xfa\xc5\xdbK\xbf`\xf3\xc3\xfde\xa9\
-\x84h\xe3\xd35\xda\xb4Lb\x04kE-\xd9\xd1\xb9\
-\xef\x82\x8c\xd2(\xe9\x85\x11\xa6(\xb9\x97D\xa3\x8a\x81\
-\x89\xf41\xf5\x89\x1e\xa1u\x8d\x80\x98\x0c\xad\x9b\x85\x5c\
-F%\xa8\x92\xe6N\x14\xa5\x84\x8b{X\x95\xebn{\
-_\xfc\xdc\xc3_~\xc6\xff\xe2\xaf\xaf\xe7!#\xf9n\
-\xfe\xb9a\xdbfI#k.%\xeal\xe6\xc9\x0cR\
-)(\x01\x12\x8d5\x88\x06\xb9\xc1`0g\xb2qi\
-Q\xb4\xd8\x8e\xc3\x8e\x10 3#\x19\x8aPM\x0e\x14\
-\x14\x11>\x03\xbd\x8e?1\xaa\x90\x0d\x90\xa8A\x11\xb9\
-F\xad5h441\x86\x98\x1b)\x07\xfd']\x9f\
-\x81{\x8b5A\x18\x9a\x16\xeeM\x86'\xf3dN\x01\
-0\x92\x0a!$(\xa4\xad\x9d\xee\xceF\xce^\x13\xde\
-\x1b\xaa\xc4\xaf>\xda\xbevm\x15\x9f\xf7\x93V\xb2u\
-\xffpt\xb1\xbd\xcb\x0f\xfe\xfe9\x8d\x13\x13\x13\x13o\
-\x95I\x00\x9a\x98\x98\x98\xf8\xc5\x22i\xfb\xae\xdd\x04y\
-\xd3\xcf\xe6\xb95nd\xefX\x0c\x90\x99\x8a\xec\x1f\x9e\
-\xbbx\xf3d\x86\xc7\xfa(\x1dJo\x06\x8e\x91.o\
-x\x14\xfe,7\x8de\xdb\xb9W:+\xea|\x1c\xc0\
-\x0d\xd5\xed\x17E\xa8\x19\xbf>F[oU\x8d\xb7~\
-\x08c\x0c\xcf\xdd\xa1\xa1z\xe3~R\xdcYz\xb0\x0d\
-\x13\xad5\xf5G\x8d\xcb\x87\xbdz<kWu\xbf\xdf\
-[\xac\xc0\x01*\x00g\xb9i2\xfa\xc0 \x85e\x90\
-\x97i\x8f\xa5\xf6\xfe.\xf5(7\xc0\x1e\xf2\xdd.\x08\
-\x92\xec\xcet\xb6j\xdb\x91\xf0q^\xec\x22\x05\xd5\x10\
-\xadQe_Sw\xf8\xf8Z\x0f\x9e^\xa8\xb7\x9a\x1f\
-\xae,78i\xab;\x1a S\x91\x8a\xe5\x81\xde\xef\
-\x0b\xa9\xa4\xd7f\xb9o\x8b;\xe7`\x06\x0a\xac\x8a(\
-B\x04\x93k\xb9|y6_~\xe5\xd3{\xaf]M\
-\xcf\xbe\x88\xa7_C\x89\xc5\xbc>\xe4\xf5\xb0/\xa7y\
-x\xcdfCM\xebRA\xdbk\xfc\xb0\x16C\xcc\x9a\
-H\x1a\x0aceQ1\xbf^m\xc0\xd0\x9a2\x9cd\
-T\xc8\xdb\x15\xecZ\xb5v\xcdf\xe9\xa6Y\xdbh\x93\
-\xea\xa9[\x0ay\x8d\x85R\x1e\xb8V\x8dC\xcd\x17\xe8\
-\xf2\xba\xd7\xd1\xc9G.\xf2\xff\xfe'\x97\xfe\x9f\xffS\
-\xf3\x91\xcb/\xc7\xad\x1b\xf9\xe6\x11K\x83Y\x8b\xb5\xd0\
-\x12\x87}V9Yb\x13j\x1a\x1e\xec=\xd9\xa6\xc7\
-2\x9bM\x9f\x8f7r\x86\x19\x14\xb5\xd6\x1e\xda\xb4M\
-I]\xdf5\xc3\xccs]\x1f\xe5\xf5\xca\x86\x0d{\x91\
-\x8d{\xcb\x82\xc1mp+\xf5F\xd3\xe5\x0f\x7f\xfc\xc2\
-\x1fW\xbb\xb5l\x8e\xffj8]\x96\xd4z\x13\x9d\xac\
-\xa89\x06\x8b\x83\x9d\x19\xfd\xb0\xc9\x97=\x1b\xfd\xb6u\
-h\x0a\xb1j\x10\x8d\xbc\xa8a1\x16\xb7\x8e\xb5\xad\xb7\
-\x0fK\xb3\xe2be\xa7\xad\xdfjS\xcd\xe6K\x05\xad\
-l\xda(\xc3\xde\x02'\x8a\xe4\xe8:.\x93_\x87\x02\
-\x89\x889p1\xd8We\x95\xcc\xa6O\xec\xf3\xea\xea\
-\xfe\xfe\xe1\xbf\xff\xe2\xc5o\xbf\xf6\xda_}g\x95\x96\
-\xa9\xf3T\xca\xa2\xa4\xc30.\xcb&%\xb6\xeeM6\
-\x86\xba\xc1\x5c\xb3\xa4RY\x06\xeah\x9e\x8f\xe7\x1bX\
-\x01\x96\xc3\x8c\xd6\xba+\x98\x890\x10\x0d\xd7\xd9x\xec\
-~\xd2\x0e\xd6\x9d\x9a8\x1f\x88\xea\xd5\x83\xcd\xaa\xe6~\
-\xe3\xa8\xb6^\xe0\x99\xcb\xb9\xb7\xf5\x1e\xfa\x8e\xa9\xe6\xf9\
-Z(\xf4c\xea\x98\xaa\x0a\xa5\xd9e\xcc\xaf\xdcZm\
-L\x9b\xc5\xa2k\xd4!\xa7m\x949\x00\xc4V=;\
-\xbb\xe6\xce\xb7\x88nc\xb0\x02\x0a+s\xd6}\xb3\xd9\
-fq\xe5\xb6?xm\xffG\xb7\x0f\x9e9\x9d/\xdb\
-\xbd\xde\x04\xf6\x91\xc2\x9a\x90)\xa4\x14\xe1\x84U\xb8H\
-D\x9dzy~2g\x86\x9d\x9fQ\xd09\xfb\x81\xd7\
-\xfd\xe4\xaf\xa0\xf1G\xdc-/r\xfcm\x10\x90s\xa7\
-\xd9\x8e\xaeT\x814\xc1\x00\x18\x1a\xd7\x0c1@\x14\xde\
-^v\x94\xed\x12\xee\xde\x90t>nr|\xe1fH\
-\x15\x84\x19\xa00\xa2\xdd5HOLLL|\x00\x99\
-\x04\xa0\x89\x89\x89\x89w\x0f\x0a\xacM[\x9c\x08\xc0\xdf\
-\xc1[\xe5$\xd69\x95\xd2\x80\x01%EO\xff\xe9\xff\
-\xeb'o\xf2\xee\x1cO\x9e{\x93}\xf6\xc5\xb1\xc3\xca\
-\x81\xb1\xee\xb3\x9f\xe3\xce\xaa\xee~\x13\xaf7|\xf0\xba\
-}0\xc8$g\xa8\xd5\xc6i\x8a}\xf6\xecJ]\xd4\
-\x197\x155XQ,\xf5>\x1bR(\x0dF\xce}\
-\x8e\xf5\xfe\xf5\x9b{\xa7\xa5m=\xb7,d\x16c\x0c\
-\xbf\x11\xab\xa8j\xda\xde\x96&\x82[\xaf\xd6Xd\x8c\
-5\x0a\x0dC\x8e\x5c\x91\xe6\x11\xf4>\x8b\xfdf\xd0\xf2\
-\xa5~X7P'\xb27\x9d\x1a\x1a@n\x96\xc2\xf3\
-\x86\xe8\xf7\xc0\x84t\x1d5\x1a\x1c\xd8\xb8]\xaf D\
-Tc8klj\x1d\x9a\xe1\xf8\xe2\xc5\xfb>\xf7\xc9\
-\xf9g?\xb5z\xeef\xbf\xaa\xb3\x05\x1f\xb4|\xb1\x94\
-[C\xdc\x0a_j6\xac+Z\x1a1\xebk\x9b\x94\
-\xda\xe8\x98g\xacA\x84\x9a\xa3B\xb7\x9a\x1c\x02Bd\
-$\xb9\xad\xa1\x9b\xa1\xfb\x06yn\x1au\x9d3\xb7\xb1\
-j\xd8\x84\x0e\xa9n\x902-\xa5fV\xf6}\x85\xd3\
-\xe5\xe6\xbe\xf9\xfd\x7f\xfc\xe5+\xff\xf6\xf7\xd2\x87\xee\x7f\
-\xa9\x1c\xbd\xe4+,\x90\x80\xc3\xd1X$\x8b\xac\xcd:\
-\xa1\xec\xa3k\xd1\xf9AY]\xbeym\xf1\xc2+\xc3\
-+\xb7VG\xa7y\xbdV\xc8\xe0ai\x98-\xfa\x0b\
-\x17\xca\x95\x07\xf2\x93\x8f\xf9\x83\x87n~*\x17\xbd\xba\
-\x03\x1a\xc6\x01R\xb4.\xb5{\x85\xeb\xd5\xe6*\x16\xdd\
-\xe3\x8f?\xf4\xb5/?\xfc\xd2k\xd7\xbf\xf9\x9d2\x9c\
-\x96\xd4\xee\xa3\x19\x02\xa5be\xb0$&-R\x99\x9b\
-2I\xb6@\x156\x06%\xb0\x00\xcc\xc9\x06C\x8a\xea\
-u\xb9\xa8\x8b\x8d\xbau\xac\xf7\xb0\x9a3\x80\xc6\x00!\
-\x06k\x07\xa6V.\x10\xe1I\x83s\xbd]\xd1\xb5C\
-]\xc8\xdab}\xd45\x99-\xd5\xc8\xb7\xd1_\xfd\xf5\
-\x87\x1e\xfd\xbf|\xf1\xca\xedW\x9f\xfb\xf13\xd9;\x14\
-\xf9:\x12\xe7\x0d\x12\x0b\xc3jM\xe6\xady*\xb4*\
-O]\xf8J^VM=M\x03\x10\x159\xb7h:\
-\xb0\xb8g\xa2\x12\x92!Wpi\xa9gm\xd2:\x15\
-O\x83{\xa4\xea9\xb0)\xb6\xc9i\xafr\xe8p\xad\
-\xab\x09\xfdA\xf43\xf9PR_T\xcd6\x8d!\x19\
-6+,O\x86\xd3u\xdc8-\x9e\x86C\x97\x0ff\
-'\x84\xce\xfc\x15\x15\x8cs\xa2\xcf\xddz\xd0\xf6gB\
-\x88&f{yo\xad\xfd[\x8b\xe6j\x1a\x9e]\xe6\
-[\xc4\xba\x89\xeak\xd6a\xee\xeeh\x1c\xf0jB\xaa\
-a\x84\x83-\xe0\xe0\x12(\xbbKu\xe2\xa7\xf03\xda\
-y\xdeS\xae\x9fmp\xdan\x8f\xb5\xfb[\xe7~`\
-\xfbK\xc4\x90\xa8\x06zG&\xd9\xdf{\xd4\xdd\x99\xa3\
-S\x0a\xc0H\x8d\xf7\x10\x9a\xf1\xee\xc8;\xf1\xc0\x13\x13\
-\x13\x13\xef9&\x01hbbb\xe2\xdd\x83\xc4\x98\xdc\
-\xf2\x8b(\x90Z\x0f\xe3h\xd8y\xd7\xde\xd9\x06\x10\xbf\
-\xbc;\xa9cz\xb1\x08\x8e7\x82e\xaa\xa6b\x94\x93\
-[S\xd2`J\x9d1\x08\x92\xdet\xb7\xae\xf7\xdf\xfc\
-\xa7\xef\x7f\xe7\xd9\xa1/\xd5\xdbJ\xabc\x1f\xd4(\x00\
-\x01\x08\xd3v\xea\x17\x85;\x02\x101\x1a\x9e\x80\x06\xb0\
-\x01\xb9D\xd3\x99\xb7V\xc3\xb3]-\xbc\xf0\xfc+\xab\
-\xe5qnlf6\xabt\x01D\x81m\x82\x1by\xc8\
-\xd7`\x85\x1a \x82a\x02Pv\x05\x8a\x12\x11\x86\xcd\
-fh\x92K\xb1Z\x96G\x1e|\xe4k_\x9a\xff\xe3\
-\xf7\x9f>y\xee$7W\xe9\x03=7\x80j\xb2\x1a\
-\x1d\x0b\xc3sQ)C\xa2\xe0IV\xa0\x00\x134\x9a\
-\x96F#\x06\xb7\x1dC2\xa0\x01h\xa3\x11-\xc2S\
-\xa2\xb7\xa5V:\xcd\xbc\xe4\x8c\xa6\xcc\xda&\xf2\xe6\xe4\
-\xf4\xd8\xb1\xfc\xfcg>\xfco\xfe\xf0\xf1\xc7\x1f:]\
-\x1e=\xc3#\x1c\x12h\x84\xb2\x8ab\xd1t\xb9\xf8f\
-}\x91\xfb\xf3\x83\x8b\xb3J\xbd\xf2\x02\xbe\xf7\xedg\x7f\
-\xf0\xbd\x1f>\xfd\xf2\xf1\xb5\xe3\xf5\xd1\xa9\xd6k\xd4@\
-\x18\x92k\xbe\xc0\xe1>\x1ez\xd0\x9e\xfa\xc8\xe2\x93\x1f\
-\xb9\xfc\xe9\x8f~\xe4\xe1KM\xaco\xae\xf2+\xa8\xa7\
-\xc9#%k\xccYr\x94\xa1I(\x9b<\xf7\xf2\xc9\
-\xa7\x1e\xfe\xfcg\xea\x8f\x9e\x7f\xe9\xd5\x93u\xdb\x1d\xc0\
-\x11\xd6P\xad\xc0\xcc\x08\xd5\xc2Sb\xb9\x9d\xce\xb6\xab\
-<\xc7\xfe\xb0\xad\x15M\xc0\xd6nPG\x0f^ i\
-\xd7\xd4g\x92\xa1\x1a\x04\x98\xc0\x0a\xdb\x8d\xa7\x1eWt\
-\x1e\xd3\xa2\x88b\x10\x02\x16\xc0\xb0i\xdb\xfa\xa9O>\
-\xf0\xe9g\xae^}e\xb9\x1a\x94\xbcn\xca\xe0\xf3\xb4\
-\xbf7_\xae\x8f\x86\xd27\x89\x05\xc6\xe2P8\xaa\x07\
-,\x90*\x9b\x183\xbfhc\xcb\x94xwU\x0cJ\
-\x94\xb8\xeb\x08\xdc\xf6\x0a\x8e\x9f0#\xd9\xd8\xb6\x07\xc4\
-\xe8\xb5\xb0\xec\x06yi\xdc\x17\x89\xb3\xf5I\xfe\xe6\x0f\
-\x96\xdf}\xf9\xc7\xb7\xd7\xa5i\x8b%\x94\xe2*\x0di\
-oP|ve\xf9\x1b\x1ao\x02\x00\xb5W\x9b\xfd|\
-u\x95\xd3\xd1\xac\x1b\x0e\x0e\xbesm\xb9\xbc\xd1w\xea\
-\x1a\xcd\xb5]\xbc\x1cwB\xc8A\x86\x19-c\x5cu\
-\xef\xfa\x14\xb0\x89\xf7,q\xb76\xf4\xee1u*N\
-LL|\x90\x99\x04\xa0\x89\x89\x89\x89\x89\xb7\x0a\xb1\x8d\
-m\x18+\xc1_\xda\xbbh\x01\x18s\x94%\x83\x04V\
-z%e\x1c-<\x8e\xa0\x05\x88M @ys{\
-\x99\xff\xf1_\xae\xfe\xe97\xca\xb5\xde\xfa\xe6\x0a\xdd\x80\
-\xac1\xc7\x86\x15\x80\x18\x00\xaaJ(\xc6:\x9d\x80\xe8\
-\x18\xe5.\xe20p\xff\x90k\xadHu6GH\x9b\
-\xb8\x96ucP\xb7\x89\x83d\xfb`+\x86\x90\x81\x15\
-\xecH\x08uPw,o\xa5\x19\x04\xb1\x8a\xa0*B\
-\xf0\xf1\xb6\xb48\xa6A;\x8c\xaa5\x1f\x1e\xcc\xbf\xf4\
-\xd9\x87\xff\xf8+q\xed\xe63\xaf\x1c?\xbb8xd\
->\xebP\xbc/\xae\x9e\xd6\x22\xc6\xad d5$x\
-F\x8c\x83\xea\x1b*\x88\x82\x10\x0c\xd8F\x8d\x13H\xa0\
-\xf1\xac[\x8f&Z\x89\xda8\x01D)\xde\xc8X\xd6\
-\xab\x13i\xf3\xd4\xe3\xed\xbf\xf9\xbd\xe6+\x9f\xdf\x1cv\
-\xb7O\xaf.\xbb\x0ao\x01U\xb4U}[b\x81\xc5\
-\xa5n\xffp\xe3\xf3\x17^\xf5\x7f\xf9\xde\xc9\xdf\xfe\xcd\
-\xf3\xff\xfa\xed\xeb\xd7\xae\xe3XX\x1bj\x81%$o\
-\x82\x9e\xb3p\x03\x09l\x7f\xc0\xbf\xfc\xef\x9b\x8f~h\
-\xfd\xef\xff\xf8\xf0\xf7\x7f\xfb\xe1\xcb\x07\x0f\xaa\x9b\xa1>\
-\x1d:a\xa5\xf5%e-(\xec#{t\xe9\xf8\xe0\
-\xb1\x87\xbf\xf0\x99\xc3\xbf\xfc\xbb\x97_>:a\xd9G\
-GD\x02:\xa1V\x87R\x0c\xdd\xd26+\xa1p\x9c\
-Ku\xefz\x8e\xe7\xacew\x1cd\xda\x0eg;K\
-\x00?\x1b]\xbd\xed\x19\x012\x10\x86\x12\xac\x80\x5cp\
-\x01u\xe3\xb3\xe3\x8f~\xf8\xd2\xef|\xe5\xe1\x17\x9fy\
-\xfe\xdb\xff4\xd4R\x17\xf3E\xa0\xad\xea\xc5\x81\xb6Q\
-\x8a\xc2D\xb4\xd4\xa8I\x92B\x13h\xb6\x8a\xdc\xbd\x8b\
-Na\x0c\xd5\xd1\x18.\xbe\xd5ib\x5c\x17\x80\xad\x22\
-\x0d\xb22\xe6\x1b\x01\xa6H\x9e[\xc2\xad\xee\xb9\xae\xc0\
-\x9f(\xa7\x9b\x7f\xfc\xc6\xbf\xfe\xc7\xaf\xdf8\xcdi\xe6\
-i=\xe4\xdb\xe6\xfd\xac\xe5\x1d\xaf\xc3\xdd=_\xd09\
-=h\xfb\xf5\x00D\xdeW\x87\xfb77\xd7\x15'-\
-\x9a\xcb\xbeJi\xb3\xd6\xbcY\xb4v0`0\xe5\xf1\
-\xb2\x07\x0b\x10r\xc9 +\x84\x183`\x0a\x81\x9ex\
-3\xce4\xc7\xf3\x13\x16\x7f9;2-\xd2\x89\x89\x89\
-\x0f,\x93\x0041111\xf1\xb3\xf0\xcb~\xcb\xfe\
-&p\xdb\x90\x04\x052,\x800\x0f\xca\xc6@\x8a\x10\
-\x14T\xa8@\xcef\xbe\xd7v\xb6\xaa\xb7o\xae\xcaq\
-\xb4\xd9\x9a\xd1\xb0\x10\xdb\xca\xd7\x00\x88c\xb6\xb1\xeb\x5c\
-F\xae4N!\x17\xc8u\xe1q\xee\x88\xbe\xe4\xbc\x0e\
-\xa3qS4\xd4h\xe6\xcd\xc1\xc5\x07\x96\xd9\xd6CF\
-\x22a\x84c\xcc\x9a\xd0\x18Z\xdc\x82\x0d\x90\xc9\xd8\x16\
-B\x1c\xbf>\x06\xea\xaaIH\x16\xc99\xe4\xda\x9f\x1e\
-=p\xf1\xe1\xff\xf3\x1f}\xf6\x07\xcf\xde\xfe\xdf\xff\xe6\
-V\xbf9\x99/\xe0\x04\x82\xb5\x18\x99\x82F\x9a'#\
-\xabJ1\x8e\x02\xc3\x98\xd3\x14;\xbd\xe3\xae\xce\x0b\x82\
-\xa3\xce\x11\xd8\x8d\xbb7\xa7\xb1\x94j\xb4\xb6M\xb5\xef\
-\xfb\xd5\xe6\xb1\xd9\xec\xf7\xbe\xfc\xe8W\xbfp\xe5\xa0]\
-\xf6G\xd7\xac\x0c\xf3\x0e\x14`@\xcbP\xb2f\xd1^\
-|\xf8\xa86\xdf\xfc\xd7\x17\xff\xe2\xeb\xaf|\xe3\x1f7\
-\xcf>\x17C\xdft\x8d4\x03Hk`\xc9-\xcd\x08\
-\xaf\x1dc0\x85\x15\xea\xd6j\xfd\xad\xef\xdc:\xbe\xfe\
-\xb7?\xfc\xe1\xe2\x0f\xbf\xf6\xc8\x97\x7f\xf3\xe2b\xf6\xe0\
-\xc9\xade\x0c\x81\x81(\x89M%\xc2*JY[\xb3\
-z\xfc\xf1+\xbf\xf6\xf1\xa3\xef?\xff\xea\x907(m\
-\x00A:\x8d\x14\x12\xd1VD\xc0\xde\xae\x9bn\xab\x1b\
-\x02\xe0\xeb\xc3\xbf\xc7o+\x80*U\x93\xcc@\x12*\
-\x91\x8f\xe7\xd6\xfd\xd6g\x1ey\xf9\xcb\xf9\xa5\x1f?\xf7\
-\xf2\xf1\xb0\xef\xbe\xb6zrzdM\xa4\xc6*\xb2@\
-g\xc8\xa4\x08\x8d\xae\xab1)\xfa\xa7u\x9dH\xbbp\
-o\xedT\xbb\xf1\xcb\xdc\xbaw\xc6\x98*j\x1b\xaa\xc2\
-\x88\x9a\xfb\x88u\xd7\x9a\xb7\x8b\xd3\x0d^Y\xd5\xc0\xcc\
-\x9aEN\xb5\x18z\xf8\x18X~\xe7\xa0\xee\x91\x01t\
-\xb7\x00\x04\xae\xcd\x87.\xf7Y\x9b\xaa\xf5\xa9r\x17.\
-7\xa6:\x94\xd2\xf7&\xa3\x9b\x88\xd8\xc6\x0bE`\x97\
-O>Y+&~\x0az\x83\xfa\xf2K\x10c\xa6\xd5\
-911\xf1Af\x12\x80&&&&&\xde\x8c3\
-O\x84\xdd]\xd4\xd5{\xbc\x85\xb6\xb3\xaf\xbf\x9b\xf1\x9a\
-$\x90ji\x89\x12\xe8\xc9\xde\xd1[*d\xda\x0e\x17\
-\xaeV\x07Vx\x81\x82\xc4^\xed\xf6\xfb\xee\xda0[\
-)\xcdlaF\x0afw\x8eN\xa4\xef&l9p\
-\x97.@H\x22\xcab\xd5\x1d:P\xb5\xec\xeb\x90\x92\
-\x84P.9u\x8e\xa6\x901\xba\xa3v)\xa4\xd2J\
-e\xada/\xea\x03UU\xbc)\xf6\xbb\xd9c\x02F\
-'J\x00\xb5m\x85\x902]\x03W7\xdb\xf6\xd5\xcf\
->~\xf9O\xber\xe1G\xcf\xde\xfa\xe1\xd5\x9b\xfdr\
-\xd94\xf3\x14\x1d\xeb<\x08\x98\xc9hNq#m\x82\
-\x1b1I\x89ac\xfa\xea\xae\xc5lg~\x911H\
-\x10V\xe95\xa4\x80\xcc]`.j\xdbv\xd1\x96\xe3\
-\xd3\x8d\xe0O}\xe4\xd2\xef}\x11\x1f{\xe0\x85z{\
-\xc3\xe3\x93\x83\x06\x8d\x88,8\xd0 \x8c\xd1\x1d^\xef\
-/\xfc\xe3\x0f6\xff\xeb\x7f\x5c\xfe\x97\xbf:\xbe\xba\xf2\
-\x83\xf9\xfd{\xf7/z\xf6\xc56\x81\xc85\x02\x15\x16\
-\x15.ki\x8b\xd6:\x10i\x06,\x8f\xfe\xe9\xea\x8b\
-\xcf\xfd\xa7\xd5i]=\xf8\xe4G\x9e|R'{\xc1\
-\x0e\x9d\xe6\xa8{\xb4\x13\xe4uJ\x80\xca\xea\xf4\x95\x07\
-\xef\x7f\xf4\x8b\x9f{\xe2\x1f\xfe\xe5\xf8\xd9\xab\x83\xc2\x84\
-\x16\x91\xc2\xd7a\x15\x96k:\xadi)\x0a\xb2\xb7\xb4\
-\xe2\xc6\xa7\xd7%\x93<\xc2+\x00\x17\x92\xee\x98e*\
-\xac\x0a\x85\xca\x89\xc5\x04\xab`\x15l\x13\xf9jst\
-\xf4\xe4\x83\x8f\xfe\xe1\x17\xf6\x7f\xf4\x0f\x07\x7f\xf1\xf7\x9b\
-\xbc\xbafn*\xa7\xec\x1a5,\xb5\x9aX\x14n\x0a\
-\x86W\x99\xe0U~~X\xd6\xcf\xba\x8f[=EJ\
-\x05m\xb1Q\x05\xaa\x94\xa0b\xeae\x05\x8d\xd0\xaf\x80\
-e\xccZ\xeci\x00r\xdb\xf8a\xb7\xa9\x82k\xee\xa3\
-+l\xb7\x88\xb7K\xeeu\x0ft\x17\x01\xd5\xb2\x7f\xb3\
-v*!\xe5\xb0\x82(\x8d\xc2\x8a\x89\xa5)\xa45\x11\
-.\x8d)f\x12r\xa0P\xf6\x0b\x1e;8qo~\
-B\x1a\xf4\xafbx\xd0\xa8\xb7\x9f\x09\x85wz5'\
-&&&&\xde%&\x01hbbbb\xe2=\x8d\
-\x0c\xf2m\xf7\x0a*\x11`\xecD\x8fq28BN\
-\xd4\x8a\xc8\x5c\x17.\x07[\x15\xac\xd3(\x87\xbc~J\
-\xda8\x81\x1b\xa1{UV\x02\xa9\xca\x16\xf3\xc6R\x04\
-\x84\x14\xa8)\x09\x88\xa1\xc6\xb0\x1a`--\x111\xc6\
-\x8eB\x0d\xe4\x08 \x1aE\x07dn-8\xe7\xb6\x09\
-\x03\xc9\xb1\x01\xad \xaa<q\xde\xfa\xd0\x9fD\xe07\
-?\xfd\xf8W\xbf\x9c_\xf9\xb3\x97\x96\xcb\xb5\xc9\x9a\xe6\
-\x82{[\x88\x82\xaaP\x98\x8c\x01\x16\xb0\xecb\xc5\x7f\
-j\x147\x01H5\x14)\xa5\x1a\xaa\xa5v\x8bdF\
-\x95\xb80\x9b}\xe2\xa9\x87\x9f|\xacX\xf9a]\x0d\
-3o\xdb\xa6C\xbf\xc6 \xccY!o\xbd4\xcdw\
-~\xf0\xe2\x7f\xfa\xaf\xaf}\xe3[7o\xaeZ\xf7K\
-\xcd\xc1\xfe\x00\x1d/\x8bR4-\xab9\xcc\xe4V\x99\
- \x8f\xd2D4\x9b<\xa0\xaf\xfb6;8\xb8_\xfd\
-\xado\x7fg\xf5\x9f\xff\xfc\x99?\xf9\x13\x5c\xb8b\xeb\
-\xa3\x98\xad\xa3\xad\x90,`~\x81{-J\xcd\x8b\xfd\
-\xe6\xa3\x1fy\xec\x91\x87^~\xe1\xda\xcdJ#\x1b \
-\x80M\x95\xa4\x92\xa3X\xf4\x1a-@o\xb7\xd4\xbd\xbb\
-;\xec\xfc\x13=:\x80b\x9b0\xb4}\xc6\x82\x08\xe6\
-\xc2|\xe3\xc9\x87\x9f\xfa\xed\xcf\x7f\xfcG?~\xfa\xfb\
-7\x8e\xa2\xef\xf6\xf6\x9b\x81(QD\x89\xa1\xb1\x01l\
-g\xfa\xf9\x19\xd3\xd1\xc7\xbe\xc51\xba\x08w\x09F\x8c\
-;\xdb\x18\x0b\xe6 *\x80\x94\x80J\xa8\x06\xe8\xb36\
-\xb5\xdc\xa4f\xc3\xd9`\x01\xcb5\xf2\x1b\xe6+\xbd\x89\
-=g+\x16D@\xb5\xb6\x81\x0bMC\xe3F\xda\xb0\
-\xac\x18Y%hh\xcc\xc41\xc6\x8c;\xab\xd2\x1b\x83\
-\xdb'&~\xb5\x99\x96\xea\xc4\xc4\xc4\x07\x98I\x00\x9a\
-\x98\x98\x98\x98x#cQw\xe6\xf4\x11X\xdf\xa4\x8c\
-%\xc6A\xbf\xbf\xbc\xb7\xd4I\xf2\x8a\x0c\x8dY\xc0\x95\
-\xacv'\xd4E\xb5R\xf4\x84\x94hp\xd8\xfe\xd0>\
-\xd0\xcf\x8a{\xc2\x90A\xf2N\x16i\x05D\x93m\xfb\
-o\xeed\xe4\xda\xae\x8860\xdb\xd0\xb77\x06\x97\xd5\
-\x9eu\xa8\xa6\xd6\xc9\x86Qj.k\xb7\x85Y#\x11\
-\x12\x22$Z\xb4\xa6\x0e\xb1\x88\xd8\x97N\xb7\x19\xcdw\
-\xcapjtR\xd0r\xa9\x16\xf0\x00kx7X\x7f\
-sX\xdf\xf8\xd8CO\xfc\x9f~\xf7\xc2\xd3\xaf\xbc\xfa\
-\x8f\xdf\xac\x18\x86\xaeS\xb0\x01\xcc#\x17d\xd4\x81\x5c\
-\xcb2H\xd1\x05\x13Lp\xcavw\xdbC\x04@\x86\
-Q\x89\xe3\x8e\xa1\x02&\xb2\x82\xa5\xc0\xacI\x18\xeaz\
-\xe8\x80\xa7>\x94>\xff\x89\xbd\x07\xf6\xd7q\x1c\xccM\
-3\xdbGH\xb9\x10Ej\xfa0\xee]\xb9\xb6N\x7f\
-\xfe\xf7?\xfaO\x7f}\xeb\xea\xaa\xe9\xee{0lo\
-\xcd\xaa\xb4\xc1\x81w\x9b\x8bm\xdfT\x8f\xb0\x9cK\xc0\
-Hz \xc0\xd2\xcc,TV\xab\xfe\xf0B;\x9b/\
-^x\xe5\xe4?\xfd\xe9\xf2c\x1f\x7f\xf8k\x8f~\xa6\
-`U\x9b\x06\x07{\xb4\x13\xf1H\x0bWg\xf9\xb4\xb9\
-\xb9>\xac~qvxE\xe9D\x18e\x98\x80\x08%\
-\xd4Q\xac0\xe0-[kp\xd6\x11\x87\xa0F\x09\xd1\
-\xc0\xed\x1ck\x02`(\x061\x07+\x00\xca\x11D\x04\
-LN\x05\x10\xb7N/\xa5\xfe\xab\x9f;|\xf1\xe5\x83\
-\xa3\xffz|\xb5\x94Y\xb3w\x0c_\xe7V\xdeJ\x08\
-y(\xa4\x0cV\x12.z\xb5\xed\xc5rO\xf9\x05$\
-\x9d\xe0\x96q\xf7\x1c\x22!\x0b5\xa1Y\xa8\xdf\x1e\x01\
-{\xb0\x90\x80\x81(\xecN\xe1W\x07K\xeaN\xb4P\
-\xcfemJ\x1f\xea\xc4\xb6\x908\xa7\x00\xdd#\xa1\x99\
-w\x7f`\x84z\xe8\xc8J\xe3H\x1a\xbc\xf4\xce\xa1\xb1\
-\x1c!\x06\xbd\x99\x15\xa8\x8a\x15\xdd\xe8\x00\x82Z\xab\xc5\
-P\xa0\x18\xe3\xb8~\xf6\xe7b\xe2}\x85\xce\xc2\xa6\xc6\
-\xb6\xcc\xba3\xb2\x9d\x97\x08\xcf\x07?\xebn)\xfc\xdd\
-\xda\xcds\xc6\xc8\x89\x89\x89\x89\x0f \x93\x00411\
-11\xf1F\xc6\xb7\xe6\xbf\xea\xf7\xf6\x05\x98\xe0\x08\xdb\
-\xc5\xab\x88\xa8\x1c[\x9d\x88\xb1O\xaa\x04*\x99\xe0\x04\
-\xe8\xb4\xbd\xa1\xbd\xb8N\xcbN9\xdd=>\x0a\x00@\
-\xabp\x00vW\xff\x84\xcb\x01Pd\x10\x9d\x8egG\
-\x05\xb9\xf3\x9a\x18R\xcd\xa5&K\xd6%OI\xea\x03\
-\x019\xe1\x14P\x13#\x10)b\x81\xba/\x0d|C\
-\x15N\x99Q\x22K\x01\x01k\xa1Z\xeb\xe9\xed\xa4f\
-\xcf`a\x9f\xfd\xb5\x87~\xffk\x8f\xbf\xfc\xfc\xb3W\
-_\xceM\xd5 #\x92\x99h\x15\xac\xe0\x00\x14\x10\xbb\
-\xa8\x99\x9d\x09\xe8\xecq\x08\x88\x84\xd9V\x15\x0a\xa8\xd2\
-\x1dfC.\xb5\xc4,\xcdT7\xab\xe5\xea\xb0\xc1S\
-\x1f\xbe\xf0\xf1\x0f/\x0eg\xa7\xf5$\xac4\xd6\x03\x0a\
-\xb0E\xd7\xd6\x90\xa5\x83%\xe6\xdf\xfc\xde\xb5\xbf\xfe\xd6\
-\xd1\xb3\xb7\xd0]\xb8\xd0\x1d\xde\xb7\xde(\xd7Mj\x01\
-\xd1\xd7\x07\xddpP\xd2:\xb3\xaf\x1c`E\x894\xc1\
-\xaa5Mg\x8b\x5cb\xb99ESs\xe0\x85\x97\xf0\
-\xcdo5O=\xf5\xd8\x13\x97.&m\xfaaY\x80\
-\x9b\xcb\xe5\xab/\xd7\xdb+^;\xe9\xaf\x1d\x7f\xf7\xc5\
-\xab\xed\xabWo\x89IF(\xa4\x80\x99\xc3IV\x16\
-\x9aq;\xe1\xeb\xad\xc2\xdd\x0c;@g\xe3\xbf\xce\xce\
-X\x80Y\xc8\xe0Yt\xb3\x03\x80\x15\x10MA\xf4=\
-\xd3\xcb\x1fy\xf8\x13\x7f\xf2\xfb\x1fz\xf9\xc6\xf2\xcf\xfe\
-\xe1V\xeeO\xac\xdb\x07\x0e \x13Jl\xd3\xd1\xfbQ\
-t1\xd1\x84\x9fp\x1dq\xec\xd7\x19\xd7#1\xf6m\
-\x11fVI\x13\xda\x8a.\xe0B!\x04d\xa0r|\
-\x92\x15lVh\xaf\x0f\xac%\x1d\x0f\x0dV\x5cY\xbb\
-*\x01\xcf\xed\x01\xf6\x0d\xacw\x95\xd9\xaf\xf3:\xed>\
-\x95\x01$\xc4P\xdf\xf82\x111\xa4\xd8\xcccs\xc1\
-J\xe7\x1a\x86\x8c\xca\xa4YP\x05\x04\xba@\x03\x08\xaa\
-De-@\x80\x838L\xb5\xf5\x07\x18\x9e\xfb\xfbu\
-\x9c-\xc2\x9d\x00\xa4\xb3<\xa0i\xc1LLLL\xbc\
-{L\x02\xd0\xc4\xc4\xc4\xc4\xfb\x0c\xf2\xed\xe7\xe2\xfed\
-\xeeY\xbe\xfe\xb2\x13\x1c\x08\x80\xda\xceO\x02^\xdf\xd2\
-E\xa6D\x095 \xa8\xd4Z\xd6\x91\x8f\xea\xe6V\xef\
-\xce\xc5\x824\xa8n5\x92\xf1X\x84\xba\xed\xdc\xd1Y\
-dJ=\xbbgLT\x81\xd5\x10$\x9ctT\xa8H\
-F\xeb\x92[\x97\xb3\x22\x06\xd2\x08\xc1\x02\x0c\x94\x22\xcb\
-\xb4\x15}=6\x91\xdd\x1d\xcd<\xb6\x15y`!\x16\
-:\xe0YC\x8e>{\xc3\xd46\xfd\xea\xe8\xe0\xe2\x95\
-/\xfd\xc6C\xdf\xfb\xe7\x9b\x7fs\xfd\xa8\xae\xd7j\xdb\
-*W\x87\xc6\x19\x1ag\x94\x8f\xb3\xcd\xa5\xed\xe8\xaf3\
-\x1f\xc6\xb9s!\x83h\xe2\x98\x09L\x82\xa2\xa4\xa8\x82\
-{)\x18z]\xbe\xe8\x1f\xff\xc8\xc5\xfb.\x12E\xe0\
-,\x94k^z26\xc8\x88\xb0\xae\x99\xdf\xf7\xf2+\
-\xe5\xbf\xfd\xf5\x0b/\xbc\x1a\xf3\x85\xf9\x9c\xb9\x9c\xd6\x90\
-\xa5\x88Z\xf2z\xd3\x0eiaF\xabf\xb5!\xc2\xad\
-\x98\x82\xb9j\xd8\xf4\xcb\x0a\xef\x16\xccC9\xc9\xb9Y\
-X\x95\xfe\xfe\x9fo]z\xf0\xc5/|j\xb6\xbev\
-\xed\xea+\xcfl\xca\xcd\xab\xb7o?\xfbR\xdc8\xe6\
-2\xeb\xc6q\x1c\xad8\xc4>\xd3\x85\xed\x083\x0a\x02\
-\x03&o\xe4\x88\xca\xbb\x94\xca\xb7\xc4]\xa1\xc5D\x10\
-\xbb c\x8a\x0d\x11^\xa3P\x96\xeb\xac\xe1\xcc|\x0d\
-T\x14\xa16\xf4\x94\x87M3?z\xea\x13\x17\xbe\xfa\
-\xe5\xc3\x7f}\xee\xd6\xd37#ym\xdcJ\x99%\x07\
-\xa1\xd0\x06\x90\x19h\x10\x10ge/\xc6\x1c\xe7\xf1\xa1\
-\xed\x8d\xbbeF3S\x0dEP\xa3-)\x88l\xa8\
-;\xf3\x98\x03\x80\x02@T\x98\xcd\x81\x8b\x16\x11ye\
-1\xb4\xde\xfa\xd8\x17(\xef\x15\xe7\xedyc?\xe4Y\
-\x95~\xf7Y\xdbe`\x01b\xb8\xf5\xd2\xd0Xi\x12\
-,`\xb4\xe4\xa9\x02B\x15\x1c\x0c\xa0\x9e;\x87\x15\x0c\
-2\x82S1?\xf1\xe6\xf0\x8e\xdaC\x12\x86P\x86*\
-\x08\xde\xc3\x9b\xf6\xf3\xb1\xbd\xb2\xeflv{\xc5\x91\xdb\
-\xcb|bbb\xe2\x83\xca$\x00MLLL\xbcO\
-\xd08\xd8\x89\xa0\x91\xa3\xff\x85|\xc7f\xb4\x8f\xae~\
-\xee\x86\x13\x9d\xe5x\xee\xda\xc4h\xa3\xe7f\xdbb\xf4\
-\xaeU\x81$\x9d\x06\x86T\x85*\xba\xc6Q\xe7c\x1f\
-W.L-\xc8(\x80\x05%\xb04<n\xfc8\xb7\
-\x97\xd7)\x8dB\x0d\xce\xa6\xa5\xef\xda\x18\x18[\xc5g\
-7\xad\xcb\xb7\xdf\x04\xc3\xe0\xd5L\x9e\x8c^\xabjr\
-\x93\x19K\xa9d\x0e\x8b\x8a\xea\x840\x88E\xa0L\xec\
-\xc5t\x1bi\x1f\xd6\xa0\xd8.\xa3\x08p\xc8P\x84,\
-7t\xa9KD\x1f\xab#d4\x0d\xe8\x19Q\x1a\xaa\
-\x19^\xfe\xe8CO\xfe\xe1\xd7\x1e{\xe5G\x9b\xef>\
-}\xe4l\xddZ\x93\xdc\xdaZ\x0d\xb2 \xe8\x80W\xa9\
-\x0a\xc9i\xdb\xdb\xedv6\xf4\x8bPr\x99ilu\
-\xaa\xc10\xd2\xdd\x0b\xbdV\x13\x98\x88\x87\x1fh>\xf6\
-a;h\x8f\xcaIQ\xbd$\xbbQl\xe3\xf3Y\x8d\
-\xdc\x97\xdc\xec\xdd\xb7\xc1\xa5\xef\xfd\xe8\xda\xbf|/\xd6\
-\x81\xeebZ\xc5f\xc8\x03\xdci\x94j\x9b4\x9f\x0f\
-M]\x11(\xd1\x9b\xc1\x98H\x0c\xea\x0d9\x94{\xe4\
-\x9aR\x9b\x18CS2J\xd8\xb3\xaf4\xff\xdf\xffp\
-\xfb/\xff\xfb\x0fV\xf9\x95[\xc7/\xae\x96Z\xaf\xd0\
-\x0f\x08@\x8e\x22\x94\xbag\xed>\xdb\x8e&\xf3j(\
-\x1a\xe0\x85\xce\x84\xdc\xaa/\xa8\x83\xdev#\x09GY\
-\xc6\x09R\xb1M\xa4\x0d\xc8*\x18H\xa6\x0c\xb0Q\xbd\
-\xac\xba\x8ft\x15\x5c\xa2\x00y\x9f\x5c4\xbeA~\xfa\
-`\xef\xe0\x0b\x9f\xd5\xe7\xbf3{\xfe/6\xfdz\xf0\
-\xce\xa5\x8b-Tb(!\xb8\xb3\x01\x0c\x11T\x8cF\
-,\x91\x80\xa4\x1a\x08m\x87t\xed\x94!IcL7\
-i@D\x88\x01!\xc0>\x11\xc63\xa1/AD\x14\
-R\x06\xa8\x9f\xb1}\xa8C\x13\xab\x13lnu\xb3K\
-V\x0fQ\x82\xd8\xac\x9b\x15\x05\xd0\xcf.\x961\x0e|\
-\xf7\x99\xdd\xed\x00\x1aMP\x8a$\xfa\x8a\xe8\x1b\x8bF\
-Q\xd7\xc3\xa6\xd4\x94RC\xaf(\x80\x91IV\x02\xc1\
-q\x89\x05h\x22\x82\xe3e3\xf1.\xf2\xab\x98\xf4|\
-\x17;3\xe9\x98lE\xc3\xa8i\x92\x96\x181 *\
-\xdd\xc7\xb9\x85o\xccc\x03\xf0\xf6\x7f\x85\x090\xee\xf4\
-\xcf1\x94K0\xd38RoZ\xa9\x13\x13\x13\x1fT\
-&\x01hbbbb\xe2\xa7\xf2+\x5cc\x08oH\
-r\xbe\xa3N\x81\x0e$!\xa2B\xa0\xa2\x1arK\xb5\
-\xb4\xaa\x902\xeb\x1d\x81D\xbb\x0fpN\xe9\xda~\xb0\
-S\x18H*\x90$ws@E\x80\x1aw\xbam\xfa\
-\x92ko\x8d\x99s\x0c\x0f\xdef\x09o[\xb2*T\
-8\xc6\xa6l\xb7\xbd\xdbIc.\xcck\x1c\x1c\xee\xc5\
-\xa6Do\x8bvF\x0c\x88\x00eBlN\xe6\x8b\xfa\
-\x1b\x9fz\xf8\x87\x9f\xbb\xfd\xd2\x8b/\xad\xea0\x9fu\
-\x855\xd7\x9a\xccE\x1fv\x99\xc5o\xa1V\x12\x84\x90\
-l\xcc\x9d\x91\xd8\xb5\xb8\xff2\xee\xbf\xa8Y\x9bc]\
-\x08\xf7&\xc1\x14(U\xd5\x92Y\xdb]\xbf\xb5\xfa\xf1\
-\xf37o\x9d(\x07I\x1b\x1dSd%\xc8\x8011\
-\xa9`SB\xa5\x0e\xa29\x0d\xa4$\xa1\x9a\x85L\xb2\
-\x12r\xbaG\x84\x82\xb77q\xfc\xfcM\xbdp]\xcd\
-I\x98\x22\x1bD\xf7Q\xb2\xa0\xd4\x82\xf3\xb0\x96\xa4j\
-\x15\x8aPL\xd5dn.6\x81\xf4\xfa\xa2\xf1-r\
-\x8f\x13F(4\xacz\xce\xdav6\xdf\xac\x95\xd2\xbe\
-\xc5\xa5\x92\x8f\xe9\xf4\xa6E] \x1b\xad\xf6\xe5$V\
-\xe5C\x0f_\xf9\xbd\xaf]\xfe\xce\xb3/\x7f\xeb\xd9,\
-)\xb5V\xfa\xbeB)\xb5)\xb51\xa0/\x80[j\
-}\x17\x09\xfd\x96\xd8f3o\x0dJ[\xee\x0c\xda\x13\
-\xb6\x0e!UPJU\xde\xcbg\x80\x8cc\xc4\xd1v\
-\xb6<\x00\xdb&L\xeb\xac\xaf\xed\x9cT;Z0\x04\
-B\xad\xb7t\xd4\x12^\xb3I@\x94Rj\x8d\xb6\x99\
-m\xadm\xdb\xc0\xacz\xae\x812\xee=\x1cpbb\
-\x84:S]\xee,\xc7\xd1c\xf9N\xdd\xa5\xb8':\
-w\xadl\xb5N\xbd\xab\xf7(&&&&~\xc5\x98\
-\x04\xa0\x89\x89\x89\x89\x89{A\x9d\x7f\xef\x0c\x04xf\
-\x16\x18\x7f\xe0\xfc\x1b\xeb_N\xe1G@\xe0`\xee\x8c\
-\xb0\xd1\x9d\x13\x86\xc1P1z\x11\xacS\x9a\xc3rc\
-\x99\xde\xd0W\xb3(\x87qzPU\xfb\x93X\xf7\xa3\
-%f\xd4}\xeeJF\xd9\xe5\xc1\x9c)A\x00\x00Q\
-\xf4\x10\x0d\x8d\xb3*\xf2\xba\x9a[\xb3\xb7g\xcd\x1e\xe3\
-\x80(ER\x18PE7m\x80\x0cA\x01\x86%f\
-\xb3\x01\x00\xa2\x03\x0b<@\xc9*[\xf5e\xf6\xec+\
-\xd6\xddHW\x0e\x1f\xbc\xd0^D\xba\xa9|\x0d\x0e\x1a\
-P`e=[\xbf\xfc\xd1\xcb\xdd\x1f\xfd\xd6}/\xfd\
-\xf8\xda7\xbe{\xdc\x97a\x96\xba\x08\xd1(4\x8c\x8c\
-( \xc0\x0a\x8e\xd3\xdfm4glS\x8ed\x88\x84\
-H\x1c;\xa9\xac\x90mHU\x825f)z\xdb[\
-\xe0\xd1\xfb\xca\x83{7;5\x95\x83%\x86\x1b\x12\x02\
-\xc3 \xf9\xa2-]\xf3\xcc\xab\xfd\xf7\x9f9>>E\
-f\x87:3z+ \x0ad)f\x14Nq\xb2\x9a\
-\xdd\xf4\xc4Z\x92\xa2\xc9VKe\xa8Z\x93\xbci\x89\
-A\xca\x15\xc1\x86\x98\xcd\xa2\xa4\xa1\xa4\x5c\x90+`\x87\
-\xdeX\xb7h;o\x18\x8e\x8a\x90T\x08\xd1\x0c\xb2(\
-*\xa8\xd9 \x86\x03n\xd1:\x92\xc1\xc9\xb7v7\x9f\
-g\xf1?T5\x85A\xe1\x08#\x0a\xb5S\xedHR\
-t\x225\xaf\xdc\x5c\x0eG\xb8r\xdf\x95\xd9\xde\xc0\xf6\
-d\xa6\xae\xc5\x1c(PV\x09n\x86\xc3K\xab\xaf\xfd\
-f\xfa\xe1\xd3\xcd\xd5\xd7\xf2\xb5\xd5mO\xed\x10s\xb2\
-Kl\x88&\x87\x15EiJm\x86m\xab\xd9[\xd8\
-\xdb\xf1\xd0\x22\x09\x0d\x8a) \x07\x0dt\x91\x95\x14a\
-\xd6\x113D\xb5\xbe\xdf\x8b\xe1\xb0D\xdd\xdc`>r\
-\x11\x8d\xaa\xd5\xbb\x0e]|C\xe9{\xb7\x00\x04P\xe2\
-\x8a\x8dCQ\xa00o\x1a\x9bW\x9b\x0f\xb5\xf4j\xad\
-i\x0b\xaa\xb4\xa6\xad\x8c\x95\x90)hc47\x15-\
-\xd0\x8d\x9b\xfb\xd9\x9f\x91\x89\xf7;\xdcI\x84\xdb?\x84\
-\xb6\x11\xe66:\xee\xe2\xdc\x8f\xbd\x83\x0f\x1ac;\xe7\
-v\xb3\xe7\xfdD\xbfP\xc9ibbb\xe2W\x9bI\
-\x00\x9a\x98\x98\x98\x98\xf8\xa9\xfc\xea\xde0\x15\x19\xb4\xdd\
-\xd0\xec h\xe3,x\x08B\xaeU\xb5zS\xc7\xd4\
-\x92\xc8\xcb\x18\xd6\x87m\xff\xc0\x818\xd4\x8a\xce\xe8;\
-\xc5\xe4\xce\x0c\x1b\xdc%\x00m#+\xc6\xcf\x18\xee\xda\
-$\xac\xcd\x90+J\xe7M3/\xd6\x9c\xaeKE\xf2\
-\xb6\x09(4\xb6e\xf8\xd9I\xdb\xd5\x1f\x99\x0a\x08P\
-\xdav\xce\x00\x90Rc\xf2\xf4\xf4\xb3\xb7n^?\xfa\
-\xc3\xaf~\xf2\xd1\x8f\xddW\x8e\x8f\xea\x10\xdd\xfe6\xd0\
-\xb9Ql\xd67\x1a\xbf\xf8\x89'\x1f\xfc\xbd\xaf>\xf5\
-\xe3W\xbf\xf7\xf4+\xeb4\xb3&\xcdr\x14p\xecP\
-\xab\xe0\x98^\xbc\xabp\xce\x04;`\x9b\x09\xad\xb39\
-n\xb1\x1dv\x057K\x82\xd5\xa2Y\xcb+\x97\xda\x0b\
-\xb3\x8c\xb2\x12H\xeb\xc0`\x12\xa0\x10\xbcC1\xbez\
-=\xbf\xf4J^\xf7\xa83\x03\x13\xcd<j\x04 4\
-5\x81\x18\x9a\x1c\xf3\xec\x0dP\xa8lQK-*R\
-\x92Q\x90J\x8d!Xa\xee\xd6y\x9b\xd4\xccU]\
-UC\x0d\xd0*SV\xf2\xd2X\x19-Ja\x04\x18\
-\xb4\x81\x22\xe9\x0d\x8c%T\xa9mS\xd5=2t~\
-F\x82\xb2\xed\x14s;\x17\x02\x05\x08453\xb3\xd6\
-\x97U/\xbfZ\x7f\xf8\xcf/~\xe2\xe3\x0f~\xe6K\
-\x07i~\xb0\xbe9\xf8\xa6z\xd7\x05\xcc\x09O\x05\xf9\
-\xd6\xe5\x83\xfb\xbe\xfa\xc5'\xbe\xf3\xbd\x17\xff\xfa[G\
-\xfdzo\xbe\x7f\xb1\xfa\xa2\x94u\x9fkK\xb53\xc0\
-\xf3P{(\xde^\x91\xcbQ\xad\x8a\xb3\xd8\xa0\xb1\xc5\
-\x91\x12\x14\x8c\x1cP_\x87\xd8O\xf6\xc0aJ\x03+\
-K\x09\xd4\xb6\x8d&\x9d\xad\xbf\xed1\xbfq\xdb#\xdb\
-\xbe0Ht\xeb\xe7mu\xef\xfa\x1c\xcb>\x88\x94\xda\
-\xb6\xe4Af\xd5L\xa8\x88\x0cVc\xc1\xf6Z\xa3(\
-\xc1\xa14)?\x13\xaf\x83\xd0\xb8V\xc7\x16\xc8\x90$\
-q\xcc\xd9\x1f\xfb!\xef5\x9d\xee\x1dz\xec3I\x17\
-f\xe3\x0c>E\xd4\xb7\xe4\x95\x9c\x98\x98\x98x\x9f1\
-\x09@\x13\x13\x13\x13\x13?\x0f\xbf\xd4\x10h\x09D\xa5\
-\xc9\x14\x06\xa2z\xc8#{l\xef\xfe\xc2\x129\x93\x14\
-\x04\x22<V\x17\x17\xb3/|\xaaM\x87\xb5\x8f\x16\xd6\
-\xee&g\x8d\x02\xd0x#:pnT\xd2n\x9e\xfa\
-\xee\x8f\xdcD\x87h>\xc4>pQv\xe9G/\x1c\
-\x7f\xfb\xfb\xcf\xdf^\x87\xe2\x82\xa9\x83@\x8e3\xba\x5c\
-\x1a\x10\x83\xd5`9d\xcc\xc8\x9b@\xcf\xda\x82\x0d|\
-\x09d\x01j\x80\xae\xb9vK_\xff\xfa\xc9c\x8f\xd4\
-O>\xf5\x80\xba\x97ry\xb9!(\xa75\x8d\xd7\xa1\
-\x1fJ\xb9vyq\xe9K\x9f\xbf\xf2\x8d\xef<\xf7\xc2\
-\x8d<\xf4\xb5i\x15b\xad\x89 #$\x05\x0a`\xda\
-&\xc5\xd8V\xdc\xd8\xf6\xaf\x19w\x114c\xd7\x90D\
-\x8d\x19Jb\xd4\xba\xe8\xd2\xe5\x8b\xf3\xae-\xca+\xd5\
-N\xe6\xaa\x835B\x82; \xdf\x0c8>\x1dNW\
-\x12ff\x8b\xd0\x5c\xe1\x88\x8d\x10.\x18\xab1\x91\x8b\
-M\xb6~\xa0z8S\xd7\xcc\xdb\xd6bSc\xa3\x94\
-a\x9c\xd5H\x15\xa5\x12fn\x1e\xb0>\xc1Z\xf39\
-)U+\x03\x15V\xc2\xb7\xa6\x80mlM\xad4(\
-\x99'6U9\xa2\xf4(ab\xeaE\xbd\xbd\xccs\
-\x01a;7\x82\xc1\xacnUDB\x05\xe6\x80\x93\xd6\
-\xf6\xb5\xfd\xe7\xef\x1f/\xd7\xaf=\xf2\xc9\x8f]\xbe\xf4\
-\xe8\x92O\xd3n\x1c\xb6{\x11\xd5\x92\xc1\xd2\xfa\xe6\x80\
-\xc5\xe6\x13\x1f\xbe\xf2;\xbf=\x7f\xe6\xc5\xcd\x0f_\xb9\
-\xdd\xee\xef'K\xaa\xb9dZ\xd3\xa2\xe9k\xb3\x19\xb8\
-\x12D\xd9.>\xf9g\xdcGB\xc6`*\x8dE\x01\
-\x08\x9ah`\xad\x86\x00\x12{\xfa-6~x\xa1\xf9\
-\xf4S\xe0b\xbf\xb7\x99[\x8d(J\x90K\xbb\xf4[\
-\x80\x88\xf1\x13\xdbn\xfc\xbcD\xa83)M\xc6\x0b]\
-{\xa9h\xef\xc7/\x5c\xff\xd6w_\xb9\xb5\xea\xa3k\
-\xaa7\xb2DP\xaa\x80\xb9\xca\xb8]\x8e\x82\x94\x5cH\
-Tz\x1bMn\x13\x1f\x14\xb8\xfdk\xd4d\xcc\xcc\xc6\
-\x8c\x9e\x80\xf8Ng\x19\xdd\xeb\x9e\x85@H5v\xfe\
-\xd0\x89\x89\x89\x89\x0f$\x93\x0041111\xf1\xf3\
-p\xd6\x0f\xf6K{\xf8J\x03Y\x18\x84\x12k\x83\xc1\
-#A\xa2\xe0>\x0b\xdb\x0b\x96:\x86\x97\xc4\xfa\x81}\
-\xfb\x9d\xcf?\xf0\xe9\xdf\xe8\x9a\x14\xc4\x1a*@\x03\xe0\
-L&\xe1\xdd\x89\xc2$\x11c\x86\xee\x98\x03\x0da?\
-\xe1\x12\xd8e\xdd\xef\xb3\xc7\xd6q\xff\x7f\xfc\xf3\xef<\
-\xff\xdc\x0fN\x97%\xe2\x02\xa3%\x09D\x04\x5c\x02\x06\
-\xd4\x95\xf2\x1a\xe5\x02aLk\xa0\xa0.\xc0\x84\xd4\x03\
-9\x880\xd9lV\xfc\xca\xd3/-\xff\xec/_y\
-\xea\xe3\x0f}\xea\xa9K\x91\x9aa\x93]Mbk\xb5\
-_\xd4\xacr3\xcd\xaf>r\xe5\xc1?\xfa\xdd\x87\x9e\
-\xbb\xbe\xfe\xfa\xf7{K\xcb4[Dt\xa8\x15\xc8\xd0\
-\x18\xcb\xd2\x03\xcd9\xd1jwX\xb0;F&@P\
-\xd5\xa8\x08Y\x14B\xf5\xc2\xc1\xfc\xca\xe5\xc5l~\x93\
-up\x19JHC\x08\xe6p!\x87\x96\xebr\xba*\
-\xb9\x9a\xa5=K\x17\x82\x8d\x84\x8aJ\x0d&k\x14\x04\
-C\xfb\x9b\xd8\xf7\x80\xd5ja\xf4&\x91\xae@\xc8\xb7\
-E\x9e\x89Q\x14UQc\xa8\xd6\x8b\xe1L\xad\xcf\x09\
-S\xcdT\x9f,7V\xc6\x9d,*9<j\x17l\
-\x1c{H\x06\xa6\xc2\x00\xaa\xbcz\x1a\xc4\xfa6\x8a\xb9\
-\xb1\x0a-\xb6\x0b\x9f\x1d\x9f\xdas\xad*5\xcb\x82\xdd\
-bov\xc1_\xbd}\xf5\x85\x97^y\xf0\xa9\x07\xbf\
-\xfa\xc8\xfd\xdd\x03\xb7\xd8\xbcT\x86\xeb\xa1H\xde\xd6\x01\
-y\x8d\x8e\xa7\x0f\xdcw\xfa;_|\xe0\xfb?\xec_\
-\xbb\xb9:=~\xa5\x997\xad\xb5%u}\xf5uF\
-NU\xf3<\xce_{\x1b\xfbjr/\xee\xdbv>\
-\x0a&\xb2$\x09@\x09p\x93\xd2k\x97/\xcf\xbe\xf8\
-\x99\xd9\xc7?u\xfflq\xd8y/nh\x1b\xc5p\
-N\x00\x02\x14\xa3\xf7b\xdc\xec]5\xf7\xf6\xc3\x90\x84\
-z\xa5m>}:\x1c\xfe\xd7\xaf\x7f\xe7\xf9g_y\
-\xed\xd6*|/\xa7NH(A3\x87\xb9\xb6\xa1?\
-\x22 \xab4\xa0!}\xd2\x7f&\xde\x9c;\xafH$\
-\xdc\xe8\xf6\xae\xfe\xe2\xd8^\xe7\xb1k\xf5\x9c\x98\x98\x98\
-\xf8@2\x09@\x13\x13\x13\x13\x13?;\xe7C<\xef\
-\xf9\xddw\xfb]5\xc1\xa0\xc1B\xe3\x0c2UW1\
-\x18H\x11\xa5*D%\x979\x9d\xb1\x1a\xdc\xec\xd2\xe2\
-\xc2^\xdb%\x1b\xa2\xdaN\xfd\xc19\x01H\xaf\x7f\x84\
-q\x04\xd8V6\x01`\xc9\x0d\x81M\xed\xd3\xbc\x0c\xb4\
-\xfd.\xeaP\x22#u\xb5\xb2V\x8c\xadX\x84*T\
-\xc0\x0a\x0b\x22c\x9c\x9fMA\x0e4\xa0a\xebC\x91\
-5\xed\xde\xfeA\xd8\xf5\xff\xfe\xad\x97>\xf9\x97\xfe\xd8\
-#\x87\x87\xfb\xbe\xea3j\x82\xdc\xab\x1c\x80\xc7\xb09\
-\xca\xec>\xf3\x99\x87\x7f\xe7Z\xff\xfdW\x9e\xbbz\xb2\
-\x9e5\x0bZ\x02\xa8p\xa8\x92\x811\xa9\xe8\xdeO\x04\
-\xcf\xfe\x0d\x95\x08\x07H2G\xd0\xe2\xf0B\xbaxa\
-\xdfx\x0c\x87Q\xc8n\x9e\x98+\x13\x5c\xcc\x91\xd6\x9b\
-z\xba\xca\xb9\xd2\x9a\xc6R#x\x85\x8cnJ\xc6\x0a\
-l\x82%\xb4\xd7\xf8b\xde\xc9|\xa5u\x9fW\xab<\
-\xd4\x94\xb1H\x8d\x81e(f\xa4\xb3!\xc0\xa8\xcaa\
-\xc38E\xaah\xcd Q\x93J$\x86\x8bPQ\xed\
-k\xd0k\xd3X\xaeV\x10\xe3\x5c;\xc1`\xaaM\x01\
-3\xec\x0d\xc3\x83~\x06\xc6\xf8j\x99b\xeb\x82\xd1v\
-\x01\x8c\xddz\x0d\xc3\x15\x11\xc9\x9a\xb6M\xb0\xe3\x7f=\
-\xba\xf5\xa7\x7f\xf3\xcdG>\xfb\xf1\xcf~\xea`\xc6f\
-su\xd9\xfa\xdc\xd4\x0d\xfd\xbaa\x9b\xd8\x95\xcd\xf2\xd1\
-\x87\x1e\xf8\xdaW\x0f~\xf8\xf2\xea\x1b\xdfY\xaf\x97\xa7\
-{\x17\x0e\x9b\xa6]\x9f\xa6\xcd\x06\x05L\x8d\x83|\x1b\
-\xcd\x94\xdc\xb9\xd4\xc6\xcf\x82&3\x11\x02\x830\xa2\x06\
-\xd8g\x03/\xcc\xe7{\xb3y;k=\x06\x84\xe8\x06\
-\xa63\xf5Gc\xfa\xedY\xd6\xcf\xbd=\x17\x02\x10C\
-tm\x7fQ\xe5\xd2^eH!k\xaah\x05\x0e!\
-\xc9H\x87\x92!\x00\x86\x0cj\xc4\x85\xd0\x12A\x94_\
-\xe5\x8e\xd1\x89w\x9d\xb3\xe4\xb8\xb345\x01A3\x9a\
-\x8d\xfda\x1a#\x81~Ah\x1b\x89vgT\x80\xa0\
-\xf1\xd7\xc5\xa4\x01MLL| \x99\x04\xa0\x89\x89\x89\
-\x89\xf7<\xbbX\x97;\xefg\x7f1o\xa7\xf5\x86\x0f\
-\xee\xc6\xde\xed\xba\x8fP\x80\x85I\x1c#\x90\xc3\xd87\
-R\xdaJ6\x90\xa5\xe0\x8c(\xd6\xccR[\xb1\x09\x94\
-\xa5\xe7\x97\xda\xfaZ-\xc5\xa2\x9eK\x1e\xfdi\xc5\xc0\
-\xaeG\xc6\x08:\x14\xc1\x81\xd1\xdf@{\x92\xf2\xf56\
-0OP\x9b\xab\xads\x9ce\x08\x15\xc4\x00m`\x03\
-m\xe94\xa2\x02 \x12\xd4\x8dE}\x08\xe1Q\xd9\x12\
-\xf77\xb6\xb8Z\x8f\xbe\xfe\xf7W?\xfb\xeb'_\xf9\
-r\xdf\xcc\xb19I\xaa\x07\x1e\x05\x1c\xa0\xf0z\xdb\xd8\
-\x5c\xb8|\xf0\xf9/>\xf0\xc9\xef\xdc~\xed\xefN\xd7\
-k\xb5\xf3\x0e\x82\xc5\x00e\xa1\x87\xb7\x80\xaa\xaaK\x08\
-\xc2w5\x97\x8c0\xdb\xc6ZK\xa8\x0a3\x9a\xb1)\
-\x99\xa8\x9a\xb5\xe8\x1a \x8f\xf3\x9d\x0c\xda36\x18\xb2\
-\x14h\x93\xfb^\x19\xd2\xc92\x96=\x8a\x9bh\x11.\
-\x18\x18\xee\x83\xab\x87N\x22\x84\xd2A]\xe1\x89\xc7\xad\
-\xce\xd7\x9dYr6\x9d\x1fX\xed\xaa\x15\x18\xb7\x92\x8b\
-\xaa\xa38\x86\x94\xc2\xa1P\xd9$)5I\x89\xa14\
-\x1a\x9aP\xac\x99\x11hC\x8e\xd5\x9a}\xb6\x92\x0d\xc9\
-\x95\x12\xac\xef\xb5\x0c\xeb\xb39\xc3\x11o-\x0c\x88\x90\
-\xbcfF\xa5\x0b\x09 \x98\xef\xac\x02\xd2\x92U\xc3\xb2\
-\xc4PgMs8`\xf8\xf6\xf7o\x7f\xe4\x1b\xcf]\
-yb\xd1\xed\x9fb\x0d\xeb\xf7\xd4\xcfR1o;U\
-\xe6\xe5M\xbft\xf2\x1b\x9f\xdb\xfb\xf2K\x8bg_)\
-/]\x1brY7\xc9\x8c\x17\xe8\xfd`}\xaf\xd56\
-\xed\xe4\xad\x5c#\x02 \xb8\x94\xa41\x03(\xe8\xc1F\
-,\x15\x08\xa0m\xd1\x19X\x80248J\xd1b\x95\
-\xb0\xb9\xc1\xb2fK$\xed\xa2\x8dv\xa6\x87\xf3\xaf\x11\
-o\xd8\x931\x09\xa9n^V\xba\xe1\xe9\x01\xdf\xbc\xe6\
-%\xcfZ\xa8+'\x03z\xa6\xe4\xc9\xc0\xa8H1\x06\
-Y%SW\xb4/^\x08$\xb3[\xe0\xcd{oz\
-\xe2\x03\xc1=\x9fwb\xb4\x96Qf\xa3\x0bM w\
-\x92\xccn\xac\xdc;\xb9d\xce\xab\x9e\xdb\x7f\x09\x13\x80\
-\x80Tp\xb7\xcdsbbb\xe2\x03\xc5$\x00ML\
-LL\xbc\xe79\xeb\xc2:k\xf0\xf9@qw\xf9 \
-\x80gE6\x89`\xd4\x92\xbd\xe4\x06\x119Lp\x16\
-S\xa8\x0e\x8e\xbbN\x16\xdf\xb0\xd9{\x16\xc8\xdb\x04\x8b\
-\x84\xa6\x02\xea\x81!\xa5H\x89\x92\x86~S\xdb\xc6,\
-\xc5]b\x99\xee\x04_l\xb1\xf3j\x99\x81Pl\x86\
-<(\x12\xf0\xc2K\x9b\xbf\xfb\x87\xe1\xe3\x9f\xf4\x07/\
-q\xb3rU\xb7\xd4\x8c\xd3\xa3\xdcb\xd1b\xa9\xcd\x13\
-\x8f<\xf4\xa5\xdf\xf0\x7f\xfe\xde\xf7^\xbd9x\xaa\xa4\
-\x85\x00\x9a\xd1\x22T\x156Ze^/\x09\xde5\xa8\
-[\xa49\x09\x84\xaa\xa3\xba\x13\x01\xf4\xc2\x00\xd4\x00I\
-wU\xd4\x0c$6\xd6B\xbeY\xa9_#\x16\x92\x22\
-\xee\x0c\x91'\xc8\xc8\x92\xd0\xb6M\x86\xf5\xcbu\x8b\xf5\
-c\x8f\xb4\x9f\xf9\xe8\xc3\x8f_\xb9\xbcg\x9e\xfaM\x1a\
-h\xda\x03\x92\x82\x80\xaa\x97\xda\x94\xda\xf4\xb59E$\
-\xad\x1fE\x5cj\xd2\xc6l\x99u\x5c\xebqUM\xdd\
-\xbc]\x1c\xfe\xf8\xb5\xa3\x7f\xfa\xd7\x17\x86\xde\x07x\x08\
-\x84\xe8\x1cceKlc\x9c\xdf\xca\xaa\xbf\xf3,\x88\
-\x06n\xb3\x9f\xee\x12frxr\x101di\xde\xcc\
-g\xfb\xdc\xbbq\xbc\xfa\xab\xbf\xbf\xf1\xf1O\x1d=\xf0\
-\x19]\xde7\xd4\xc8\xabpk\xc8\x96e\x106y\x83\
-G\x1e|\xe4\x0b\xbfq\xf1o\xfe\xfb\xab\xd7n\x94\xd2\
-\xaf\xcdR\xd3\xa4\x19Z\xe0\xb4\xcfYH\xe4\xdb\x09\xc9\
-!`\x10wa\xd5\xe7\x8fd\x9c\xea5\x1a(\x0cE\
-\xc8P86\xf0r.\x85\xfc\x1e\x07\xff\x13H-\xd8\
-\x15\xa8\x18\x8b\x9b\xdc\x91\x15C)\x91\xe0\xa9a-w\
-\xa5b\xc1\x01\x03Z\xdc\xf3\xf1&>\x88\xbc\x99\xb9\xe6\
-\xdcK5A\x8e&\xc8\x9f\xdf\x88s\xfeU\xee,(\
-=\xb6v#\x89;\xb7\xcf6\x05\x1ao\x8cB\x9f\x98\
-\x98\x98\xf8\x001\x09@\x13\x13\x13\x13\xef&\xc4nJ\
-\xd3;\xbb]\x01shQ\x04iH!\xc9\x1d\x06X\
-yg\x07\xeb\x02\xdb \x19Elm.cM[\xeb\
-\xd9\xf7\xde=k\xfdx&\x9b\x1a\x00\xc6YT\xac\x17\
-j\xb9\xbf\x869\x8f\xe8p?5\xe6\xc8+\x0e=\x04\
-\xf7\xb1\xde\x9f\x07g\xa15\xb4\x01ew\xdak86\
-\x02\x910\x90g3\xd4\xef\x08k\x04\x80\xc8\xd4\x00B\
-\xd6\xc1fa.P\x86\x10\xaa\x22\xc0@\x1ae\x0a \
-C\x82\x02\xa8\xd5X\xd9HD\x08V\xa1\x1eC\xa7\xf6\
-\xb2\xb3\xa4\xben\xf4\xca\x8d\xf6\xe6\xab\xf3e\x1d\xbcd\
-\xfe\xc7o\xce.~\xe2\xc3\xff\xe3\xef\xdd\xff\xc0\xc1K\
-\xba\xfdrQ\xa44S\xcd\x81\xda57}\xa3\xc3\xb8\
-\xfc\x7f}\xea\xbe\xdb_\xb8\xf8\xff\xfe\x8b\x97\x8e6}\
-\x9a\xd9\xa6\x0c\xb1\xb8T\xe6\xdd\xb2\x1c\xf7\x8d/\xba\x16\
-93\xaa\x15W\x15,\xc0\xa5\xac\x04K\x00R\x13H\
-A\x8b\x14C\xdcPB;\xeb\xadik5\xd5v;\
-\x15\x0d\xa7\xa8\x99\x8d\x10\xc0`iq\xd0\xd4\x99V\xd5\
-kA]\x16$\xa6\x0eBE\xde\x84j\xcc\x9a\xda\x91\
-\x0e\x07\xf8j\xdb\xdd\xdc\xef\xcb\xc3\xa9\xfb\x1f>y\xf0\
-G_\xb8\xefp\xb1V\x7f+\xd6K\xe8\x9a7\x0b\xfa\
-E \x15l23\xec\x14\xcd\x91+\xd9\xa6C\xcd\xe6\
-\xa7h\x8e\xa5\xac\x1aQ\xcd\xda\xda^h\xbf\xf5\xed\xfd\
-\xff\xd7\x8b\xbc\xfd\xf2\xeaD\x87\x91\x5cv+|\xd9\xd4\
-\xc5bu\xd17\xd6\xe6U\x1d\x13\xbfE\xd88\xffM\
-\xaaU\xb0\xdd\x04h\x9d\xcf\xf0\x86\xd2\xa8\xa6\xa5\xd2x\
-\xcfTO\xe5'^\x0f\xad\xbf \xad\xa3\xa9\xe6b\x11\
-\x86\xea\xa9\x1e4\xd6\x12W\xf77W/dD\xfb\xcd\
-g\xe3\x81\xff\xbc\xf7\xd1\xc3\x07\x0e\x1e9Us\xbb\xcc\
-N\x9b\x95{m\xd44\xb6J\xb3\xa8\xf3E\xf9\xc2#\
-\x8b\x7f\xf7\x9b{\xeb\x97O^\xb8q\xc2\x19\xaas\xd0\
-`\xba\x18\xf5\x8a\xd2qt\xaaB8S\xe5\xd6\x9cC\
-\x91\xa4\xc4\xa8&\xa3\x08I\x8a\xb1_k\xd4\xb7\x06\xd7\
-2\xa5\x0d/dz0\xc2OhCBxE\x1av\
-+4\xc0\xe2\x91[\xc0\xe5\xce\x94#<\xa2\xb9K\xe2\
-<g\xcd!\xce\x22\xa1\xee\xba\xa0\x88\xb06a~\xb0\
-\x1e\x9a\xa1\xe9\xd4\xda\xbaD\xde\x0c\x1e\xa5s&\x15\xaa\
-'z\xdaZ\x18\x84$\x09ArF4D\x9e\xec?\
-\xefotw\x8c\xd5\x9d6B\x9a\xa3\x1a\xb2\x00\xd0E\
-r'\xb5\x88\xaca\x82\xc3\x9a\x10!&zc\xe8\x1c\
-\xa65\xea\x86\x06\x8c/\x98\xaf\xff\xbd1\xf6\x8e\xfd\x84\
-\xdd!\xe0`\x15\xb5u\xf0\xc1\xa0\x86\xe1\x80\xa0\x0ce\
-:`\x15\xa6\xaa\x1a\xa4\xfb\xde\xa6\xb4\xeb\xea\xe3\xe8\xb1\
-I\x09\x9a\x98\x98\xf8\x002\x09@\x13\x13\x13\x13\xef&\
-\xbf\xc0\xd2\xa8!\x1a\x11@\xa5\xc2@\x03\xa5wZ\x8d\
-9\xdb\x7f\xbd~\xb3\xfa\xe5\xd8\xea\x098D!+ \
-Ps\xc5EE\x01M\x80\xb81\xef\x1bU'\xcc\xc1\
-\x19P\x10\x95\x05I\xd1\x12\xc5B\xb2\xdd\x00\xec \xa8\
-\x00\x8d\xac\xd86(\xc4\x1d{\xc9VG`\xd0A\x84\
-j\xa9\xb2ZJ\x1eJ\xa9E)\x81\x8b\xae2\xe5\x0a\
-\xd1\xb7\xa1\xd1\xa8\x80o\xa3'\xc8\x00!\xc1\x04U\xd5\
-\x14u\x0f\xb6a9!\x8eN[,\xe7\x1b\x96\x0e5\
-}\xf7\xd5\xfa\x1f\xfe\xb6~\xe8C\x8b?z\xaak\xba\
-\xcd\xe6\x94\x11\x0d\x02\xd6\x86\xfb\xaa=\xa9X\xdd\xfa\xf5\
-+\x1f\xfd\xbf\xfd\xeec\xcf\xbdx\xf5\xaf~\xb8N\xc0\
-\x85=V\xe3R\x09\xed^j\x0d\x11\x90 cuh\
-\xd4\xeaz\x90@\xd5\xd8T\x84\x043x\xadX\xca\x81\
-\xb6V\x80rz\x03%8\xa1\x1e*p#k\x0c`\
-4^\xdb\x14\x91 \xd4M\xc5\xdc\xe8\x95\x11Q\x15@\
-\xb4\xe4\xdc`\xfdp<\xf8\xf5\xfd\xb6o7\xe86\xf9\
->\xdb<\xd6\x9d4\xedk\xf0\x17\xb1X\xc3\xc7ur\
-\x11\x9c\xc3\x06\xa8\x80+\xa4\x0c\x00~\x84\xa1CZ\xa1\
-\xcd0\xa0\xb6\xc8-\xda\x19f|r\xcf\xae\xb49\x95\
->\x12\xe4,\xd8\x04O\x13R7\x5cl\x87pm\x02\
-\xda9a\xceBF\xf0\x86D\xaa3\xc7\xca8\x19]\
-\x94{\x09r)\x1b\x0c\x15e.\xb5\xe1k\xba\xc6\xee\
-=\x141\x99I\xd7mu\xbd\xdd\x1cx;\x9c\xce\xbf\
-\xf9/\xf6\x8f\x1f\xdb<2o.]\x04c\xd0\xa6A\
-\x05\x13\xbbv\xc6\xda\xc7\xab\xd7\xae\x5c|\xf8\x7f\xf8\xad\
-\x0f\xbf\xf6\xfc\x8d\xff\xfcwO\x1f\xe5\x92Z4\x15\x8c\
-\x05p\x00[\xc2UE\x1a\x9d\xe3\xac\xb6\xada\x8d\x02\
-uN\xb0\xd2\xa8\xffl\xdb\x0e35\xb8g\xce\xab(\
-\xae\xab\x0dn\x83K\xa8\xf0:6\xd8@\x19\x04\xbdz\
-\x04\xa3\x19/G\x82\x0e\x18w\x0a\xe7\xeb_\x09\xee\xf1\
-\xca@ \x86\x02`\xb3\x8e\xb6\x80A/\x11Qb\xd1\
-&\xba\xd5\xb2\x81\x06c\x062P\x00\x09.\x16\xa0\x8c\
-\xe2\xe8\xa4\xfe\xbc\xbf\xd9\x8e~{\xbdt8j7c\
-\xd2\x19\xb6\xa1;\xbb\x8f\xc6\xec\x9f*39X\x01\x1a\
-\xe1\xb4\x94\x8c\xea\xc1\xc2;\xc1kwo\xf6\x9e_\xbc\
-\xeb\x07\xb8}\x99e\xde\x85\xb8\x13p*\x01\x82\xca\xf6\
-5\xdb\x00\x0b)*j\xd0K4%v\x03\xff&&\
-&&>xL\x02\xd0\xc4\xc4\xc4\xc4\xfb\x843\x05\xc6\
-~)76\x7fy\xef\xa5\x05\x00!JV\xc2\x06r\
-\x18Kb\x04T\x13\xd0\x18\x03\xac\x15H\x14\xc8\xb0\x8b\
-\xf0\x07S\xb7q]\x07\x0a\xb8\x0b\x0c\x22 9\x00R\
-w\xdf\xe9\x8e\xbb\x8en\x0ft1\x95:\xb7\xd9c\xd5\
-\x1f\x19\xd2jC\xf4\x80\xb3\x13\x13\x00Jb\x85*Q\
-\xc8\x02(!l\xcc\xc7\xf5\xf1fu\xc0\x82\x149\x00\
-\x22\x98\xaa\xcf\x0c0_p\xbe\x5c\xdf\xfe\xc1\x0f~\xf0\
-\xf5o.?\xf9\xc0}\x8f\xef=QN\xaf\xd5a\x98\
-\xcf\xe8\xce\xd8(\x86\xd6\x19\xb4\xcd\x93\x1f\x9e}\xf5\xcb\
-\x17\xbfwm}\xe3\x08\x87{\xe9xy<\x1c\xdb^\
-{\xdfb\xbe\xce\xe5\xaa009\xa0(\xda\x0dgr\
-\xc8)@ft8)0\x0c\x81\xbcQDJm\x8b\
-1)H-\x90\x90\x06\xa4\xb5*\x8a\x17\xe2\xb88|\
-fF\xab\x5c\x84:S\x88\xc5l\x00\x87\x04oJ\x01\
-g\x0d\xe6s>\xd2\xc62\x86\x9bQ\xa8:_\x0f\x1d\
-\xfb\x1aCo-\xbcMy]\x87\xf5\x9aI\xcd,\xc1\
-\x1a\xb1\x85g\x07\xbdO\x1aP\x12\xd4\x82\x06\xd4Zs\
-\xf1\xa6\xb4\x91\x8f66\x84Dr4\xc4\x98\x19\xc7\xc4\
-\xef\x08\x84\xf0VGk\x9d\xc9CU\xac\xe0\xaeA\x8f\
-\x15V\x818;U\xe3\x97K\x053\xb0Amk\xeb\
-\xf9\xf8\xf6\xe9\xdf\xfd\xfd\x8d_\x7f\xf8\xc3\x17/>A\
-\xbf\x8an\x19\xfd\xb1\x05m?i]6\xa7\xa7\xdd\xfe\
-\xf0\xe1\x0f\xdf\xf7\x95\xaf\xf9\x8f^y\xfe\xdb?(\x1c\
-\xd0T\xa4\xec)\x12\x05\x84\x0c\xe7t\xaa\x9fr\xd5l\
-[\x0e\x93\xa2\x89\xecJ&\x93B\x02Ce\xd7\x18\x86\
-\x8cZA'\xbbKLOV\xb4\x85{a'\xc9r\
-\x83\xc0hu\xb8\xb3\xc1\xdd\x92\x8e\xd0\xbd\xce\x1c\x11Q\
-fL\x8f\x19\xee\xb3\xf6%\xf8\x0d(\x9b\xb5Hm\x08\
-\xb5\xc0a\xb4\x06\xdb\xb0\xe7$\x98LB\x16BS\xb4\
-\xca\xfb\x1d\xde\x1d\x1e~g\x09Q\x01&\x8d\xba\xa6o\
-=i\xe3\xcf\x00\xd8\xaa\xe0\xb1{\xb1\x1eU\xa4\xf16\
-\xc5\xcf\xf9\x9b\xe3\x8dk\xf8\x5c\xd8\xd5Y\x16\xd0v\xd2\
-\xbcS\x14\x02\x04\xf8\xd6R\xc3&&&&\xde7L\
-\x02\xd0\xc4\xc4\xc4\xc4\xc4{\x1cB\x16\xa0\xc4\x08\x16\xb1\
-\x02\xb6\x1d\x03\x8f\x04v\x11\xb5\xd4lA\xf7J\xaa\x94\
-n\xe0}\x8b\xd9)\xfd\xfa\xb6\x0a\x97\xb6A*c\xcd\
-B\xbd\xce\xe0tN\x00RUZ\xe90\xdb%\xe9\xb0\
-\xd9{d\x88\xfbKz1\x1a\xf4\x01\x0e(\xad\x8f\xce\
-!!F\x1b\x09Q\x09\x18\xc2Pw6\x94\x0a\xc48\
-\x1d\x0c,@5\xce\x9a\xd4!\xbc\xae\xe5\x8b\xc6S\xf7\
-\xeak\xc7\xff\xfd\x1f_\xf9\xd2G\xf6\x1e\xff\xfc\xa5\xd4\
-\xae+\x8e\x9b=c\xa9\xc3\x89\x1a\x1e\xb0kNO_\
-m\x16\xfc\xad\xdf|\xe4\x1b?\x5c\xff\xe9\x7f\xbb}\x5c\
-\x0b\x83\x8d:\xd6\x99\xeaRiMT\x98\xc7\xb6\xfa?\
-\xcb\x89\x02\xc4m1$\x1b\xddL\x02jF\x0d\xa6\xe4\
-\xa0@\x0a\x0e\xb5\xc48\xbf\x0c\xb5\xa9aK\xa5\xbd4\
-O\xd6\xa6\xd0B\x91`\xbda\x90\xad\x8d\xeb\x14\xee\x02\
-\xe1m\xdc\xcf\xba`\x7f<lN\xca\xa0\xd6\x0f\xdbt\
-\x89\x9b\x97kO\x04\x98kd'f\xc9\xe6\x8d\x1c\xc5\
-%\xc1V42\x1a1\x09\xb9*{\x98\x94\x02nr\
-\x90\x15\xa8\xda\x05\x1a\x9d\xdd\xd2\xdf\x19e\xde\xfar9\
-\xd3]\x02<\x1f\x8a\x14\xf7(&\xc7\x0e\x16\x8c\xadZ\
-j\x926\xab\xfa/\xdf\xc57?\x92\x9fx\xe2\xe1\xcb\
-\x87\x0a[V\x1e\x9b\x1b4#H\xdazy2\xdf\xbb\
-\xf9\x99\xcf\xee\xfd\xf6s\x0f>\xff\xf2s\xaf\x1c\xa9\x18\
-\x1au\xad\xe6\x04@\xf1-\x8f<\x92)\x5c\xd5P\x0c\
-\x1e\x881\xb4H\x00\x08\x1aa\x80\xc9\x92\xc3\x17\x1b\xbf\
-\xbf\xf7\xfd\x9a\x9a\xf0\xdbs\xbf6\xd3\x11$\xe9,\xf4\
-\xe4\xce\x012t/\x01(\xc4\xf02\x87?Q\x87\xcb\
-\x85K\x99\xd5\x80\xaa3\xb6\x13\xe6\xc8\x04\x05\x90\xb6F\
-\x0f\x02\x0ca\x10\x0c\xa8\xe7\xd5\xa6\x89\xf7\x1fo2:\
-N\xbb\x8b\xf3,\x07\xea\xee\xa55J\xac\xdb\xbc.\x0b\
-\xc1\x80\x86N\xda/\xf6\xce\xc1]\xfd\x88\xdbl\xb8\x88\
-Pp\xca\x01\x9a\x98\x98\xf8\xc02\x09@\x13\x13\x13\x13\
-\x13\xefmv\x8e\x0emm?\xdb>\x94\xb1\xad\x80\x84\
-\xdbX\xed\x861\xb5\xab\xcd\xea\xfb\xcf\xbd\xfa\xd2\xed!\
-\xb5}\xean\x11!\xd9x#{L_\xd9n\xf3\xee\
-$\x93su3j`\xad\x93\xe0mb\xdf\xba[\x05\
-\xf7}\xff\xb9\xeb\xab\x8cJ\xa2Rc\xa00HT\xa2\
-\x12\xb1\x1brs\xae%\x89c`R\x00\x84*\x22\x9a\
-F\x8bYWKs2\x94\xc3\x85-\x0e\x0en\x1f\xad\
-\xbf\xf7\xf4\xf0\xe7\x7f\xfb\xe3O<\xfc\xe4\x13W\x1e\x8a\
-\xa5\xe5\xe1\xbaG\x88\x94\x01e\x1d\xfd\x8a\x9d\x7f\xec\x89\
-+\x7f\xf2\x07\x0f\xfd\xf8\x99\x93\xef>W/zsq\
->\xaf\xeb\xb2\xe2\xb2m\x02\x01i\xd7\x92\xc3\xbb| \
-\x02M\x1c\x9b\x8cHsg\x19\x98\x07\x94\xaaq\x7f\x05\
-\x8bJ\x1a\xacB\x06kD\xcf\xdeb6OMC\xf4\
-\xa6\xa0\xc6|\x0f\x04\x15\x0eK\x1e\x91K\x89U4\x96\
-\xa2\x06J\x84\x97\xc89V\x8c\x0d[5\x1d\xe8\xb2\x05\
-\xc1\x19\xa3Q\xce\xa8\x95\x96\x011\x00\x8a\xc9\x92\x91n\
-F\x03\x9drw\x87'c\x8ca\xc7gi\xcf\xefP\
-\xed\xf6\x13\xb7\xb4}L\x190\xba\xa5\xbcI\x8d\xb9\xe5\
-\xbd[G\xeb\xbf\xf9\xfak\x8f?>\xfb\xdao\x1d\xb6\
-\xe9ph6\xa9\x15\xd7\x1b\xa8\xe9\x16\xdd\xf1\xe6\xf4\xe8\
-\xfa\xf3\x0f\x5c\xf9\xd8\x1f\xfe\xde\xe3\xcf<\xbb\xfa\x0f\x7f\
-~\xf5\xb8\xa0\x0d\xce\xfcl\x1e\xdb\xdb+y+P\x09\
-\xe76.e\xe7|\xa3Yj\xdd\x9b\xe5zx\xf6\x95\
-\x1b?\xbe\xfe\xdd%g\xe8\x8e\x8b\x9f,x\xba\x8f5\
-`qN(\x8b3\xc7\x06tO%\x8a\x08\xd6p\xfd\
-\xf0\xa4^\xf8\xce\xd3\xaf\x9e\xac\x8a5V\xe9\x92\xa0p\
-\xa7\xcb!\x03\xfd\xee\x9e\xcf\x0c\x12\x9a\x1c@\xefsF\
-\x01\xe8\xf5I@\xdb\xcbE\xdbO\xb6\xff\xbc\xee\xe2\x0a\
-E\x98\x8f\xf6\xca ,5)%Cygw\xf0\xee\
-\xc6O\x9e\x0b\x01\xdbJ\xfd\x8az\xe7*\x98\x98\x98\x98\
-\xf8\x002\x09@\x13\x13\x13\x13\x13\xefU\xc6\xc2#\x08\
-\x98\xc2\x02\x16\xb0\x0c\xcb\xbb0\x150\x0br6\x9d\xb1\
-\x13[\xa4\xf6\xea\xf1\xd5?\xff\xfb\xdb\x7f\xfbO'7\
-\x0b\x8f\xd3\x9eh&mk}\x22B\xdbV0\xbb\xab\
-6\xbe\xd3\xe7\x00\x92}\xd3\x9d\xa6tZ3B\x9e\xd2\
-\xde\xc9\xd2\xaf\xaf\xf7J;\xf7f\x1e\xa4\x04P\xa6H\
-Q\x9c\xd5T\xc7f\x83\xb0\x08\x83L\xb2\x9e\x0aP6\
-v\x9f\xa9&D\x0b\xa1\x22\xe0\x11\xcdl\xbe?\xbfP\
-o\xaf^\xfb\xb3\x7f\xd8|\xf8\xb1\xf5\xff\xe3\x7f\xfc\xb5\
-\xbd\xbd\xf6\xf6+\xd7\xe63\xec\x1d&\x1d\xad\xea\xa6\xee\
--j\xd7\xae\xd1\xad~\xef\x8b\x0f\xbc\xf0\xf4\xa5\x93\xff\
-\xe5\xfa0\xf4\xb32x\x9e\xab\xca|\xcc\xa1\x16Ba\
-\x80\x05B\x22\x83\x02\x8cJ\x0cR\x152\x93%w\xc1\
-\xf2\xba\x9c\x9c\xf68\x10`\x05\x8d4\x8b\x18(\xc8\xc0\
-\x04\xb6\xcb\xa6\xdd\xccf\x8d{\xa3H\x88\x0610\x05\
-Y\x0c0\xd6\xa4\xb5@\xb7\xc6Z\xdfkz\xad\xd4\xcd\
-\xa2\xd8\xf1:\xfaH7\xe7M\xb0\x83\x04\xa6\x82r\x9c\
-7\x8c\x9a\x1bo\xd8\x04\x01d!BPp\x1b}\xcc\
-q\xd8\x9a4\xa6\xe1DH\xb15\xfe\x8c\xe3\x83\xc8q\
-\xa0\x8fvN\x98\xb7\xb1z\x02\x8cmt\xc8\x1d\xe9p\
-\xf7|k\xa7\x02\xd2\xc8d\xd6\x18\x1b\xa77\x9d\xd5\x8d\
-}\xf3\x07\xc3\xc5\xff\xb6|\xf8C\x8f|\xe2\xc3\x0f\xd8\
-\xfc\x06J\xd1\x0aP\xd8\x0c\x0b\xcb\xab\xfc\x12\xf2\xedO\
-|\xf4\xd1\x7f\xfb\xbb\x8f>\xff\xa3\xf5\x7f\x7f\xfe\xa49\
--\xb3Z\x01H\xf7\x8a\xfb\xd9\xba\xb2\xeex\x90\xc6\xef\
-\xda\xf8\x070\x06\x99\x1d\xc9dP\xa1B\x82\xc1JD\
-_\x12y\xe8\xe9\xf0\xc5\x93[\xff\xdb7\xae\xff\x97o\
-\x1c_\xcf\xc0\x81\xb2\xc0\x82.Z`\x9b\x8f4\x1e\x97\
-\x14w\xc2\xdc\xdf \x00\x05 \xf9A\x9c^\xb6\x7fF\
-\xd3]_\xe3\xea\x09\xd3\xde\x056\xfb\xa5\xc8X\xcci\
-\xd9,\x129\x13\x5c\xa8r\x05#|-\x02\xd5Q\xfd\
-\xad?\x13\x13\xef#4j\xcdg\x11\xec\xc0\xee\x9a\xad\
-\x08R\x0c!\xc2\x5cmk\xc6\x80\xee\xe5\xbc\xfb9\x1e\
-\x1e\x080\xee\x08\xad\x84\xb6\x11a$\x0d\xb0\xa8RL\
-N\xb5\x89\x89\x89\x0f.\x93\x0041111\xf1^\
-g[\xdd\xeeL@w\x02 \xa4P\x08b\x08@B\
-;\xcbH/\xbe\x8a\x7f}\x167\xc0\xbeKpc\xdd\
-V g}^zCEr\x97\x00d\xb5m\x86\x94\
-P\x0a\xf2\xba&?\x9e\xcd\xe7\xa9\xbb\x98\xd2^5/\
-\xb5J1\xde&\xe79!\xe1nb\xb7\x9f[O\x8b\
-jD?4V\x17\xb6\x08y\xdf\x974\xeb\x92\xf6^\
-x\xf5\xf4\xaf\xbe\xfe\xeao~\xf6\xe1\xdf\xfc\xe8\xc1l\
-q(\x5c\x1bg'\x8bA\xcb\xc0r\x18p\xe9\xf0\xa1\
-\xaf~\xe9\x89\xef|c\xf9\x8f\xdf]\xafn/\x0d\x17\
-g\xb3Y\xac\xddT-!\xc6G\xbb\xfb\x80\xb6\xe7k\
-l\xe9\x01\x8dn\x9eV\xeb\xcd\xad[\xb7\xf3\xfd\xd1X\
-\xc3p6\x09na\xdb\x96+1[\x13{{\xf3\xd9\
-\xac\xd1)j\xbd\xe3\xb0\xb2\xd1m\xa5jV\xdb\x84M\
-\x94\xbe?A-\xe0\xbc\x9du\xb3\xfdE\x87y\xc3\x13\
-\x00\xb5\xd0\x02cbM3k,u\xf0\xc0f\xa8\x85\
-\xa4\x8d\x81\xc5$i\x1c\xc7`\xd1\x08\x8e\x0a\x90\xb4\x93\
-z\xb0\x93\x7f\xee!`\xfc\x5c\xdcm\x1c\xb0\xbb\xa2\xbf\
-%\xd4R3\x95\xd4Z;;\xea\xeb?|\xeb\xfao\
-}\xe1\xc2\x87\x9f\xc4\x85\x8e\xccD7\x8fM\x89u\xdf\
-^\xec\x02qr|r`\xb7>\xfd\xc9\x8f}\xf1\xf3\
-\xcb\x1f\xbdpRV}Yo \xf0m\xfa\x97\x04\x04\
-\xb72\xd1\xceP\x16c7\x99Y\xb3\x87\xc5%4\xe5\
-\xb5[7\xbe\xf7\x8c\xae\x0b\xcd\xfd\xa8\x00zO[\xed\
-\xf1\x8eaC\xf7\x0c\x04\xda1\xda\xd7\xf63\x0es\x86\
-\xe7\xc1\xad\xcc;\x9f\xb7\x95VC\x96\x8b\xa7D\x8e\xf5\
-\xfc\x18\xf52\xd6\xdb\xda\xa9iS\xae\xca\xfb\x9c{\xe6\
-Fikz\xe4O\xca\xe3\x22\x10\x1a\x03\xe9%\x98Y\
-j\x92\xbd\xdd\xeb\xe1\xa7\xc0\xdd\x92\x1f_\xbbb\xcc\x0e\
-\x03\x8c\x02j\x8d{\x9b\xdf&&&&>\x18L\x02\
-\xd0\xc4\xc4\xc4\xc4\xc4{\x97\xb1\xb5*A!UQa\
-\x00\xebn\x9e;\x0c\x062\x10C\x19\x82\x98\xfbB\xf3\
-\xc3\xdc\x1d\x97fH\xcd\xdc\xe6N\x03\xea\xd8\xb1\xb5\xdb\
-\xe2\xae\xc7!(\xe0\x8d\x15\x8d*\x93\xd2\x02\xeeM\xeb\
-\xb0P\x81lN\xeb\x86\xa1\xe6(p\xa4D)l\x0c\
-\xbd\xa0\x82\x08\x22h\xa1\xb4k\x08\x1be\x8c\x80i\x9b\
-EQ\xa8\xbe\xb4\xcehZ\x89\xcb\xdc\xfb,\xa9\xbb\xb4\
-N\x9bo?\xd7\xff\xf9\xdf\xbd\xf4\xc8\x85\xcf=r\xe9\
-3\xcb\x93o\x1f\x9f\xde\xdc\xeb\xe8M\xady\xad\x81\xb4\
-\x8d\xc5\xd5\x8f>\xf4\xf0\xef\xfe\xe6\xa5\xeb\xcf\xad\xcb\xea\
-\x94y\x99\x92\x0d\xb2`u\x07\xea\xa8e\x080\xc0\x05\
-\x97haF\x0aF\xb8\xc3Lf\xb0\x93\xe5\xfa\xd5\x9b\
-\xa7':\xb8\x9c\x1a\xcb0n\x94\xfa\x80j\xa0\x16D\
-F\x97x\xff\xe5\xe6\xc2\x05\xd8\xf5U\x04\xa9\x86\xb1O\
-RZV\xd4bf\x92,\x95\xe2\xb97\x0f\xaf\xbe\xaf\
-\xeeI\x9b=L\xee\xaf\xf3\x8b\x92c\xe6\x110\xee\xb1\
-\x9b\x83\xaa\xb5\xaf\xe58\xec\xd4\xbb\xa1\xad\x03\xd1\x1bJ\
-p4\xc9\xc0\x88]B\xf3(\xc6l\xa7\xa8\xe1N\xc9\
-\x18ww!\xfd\xec\xf0\x8eS`\xfb\x85s\x1f\x9f_\
-\x5c[C\x0e\xb7\xfd\x81\xca9\xe6\xe4}\x19{/\x1d\
-\xbd\xf0\xb7\xdf|\xe6\xa3\x1f\x7f\xe43\x1f~\xb8\xd3\xb2\
-3'Oj\x0fGM\x1d\xfd\x18\xe5V\xff\xc0~\xfd\
-\xcao\x1c\xfe\xe0\xbbv\xb2\xb9\x1e\xeb\x16Q\xc9d\xa8\
-\xe3q\xfcL5\xe8\xe8\x0c\x22\xc2,\x08@\xa6\x1aQ\
-\x19p\x80\x8a(%c\xe8\x0a\x84.8\xafV\x94f\
-\xb6\x9f\x90\xd8\xacK\xbb\xc9\xc4\xebB\x87\xb6\xed`\xba\
-W\xb5.\x84\xa4\xf9\xfc\xa0\xd1|(Y\xe8\xd9\xb2R\
-%V\x15\x82\x1c13\x99\x89\x90\x01\xadh\x81\x1c\xd8\
-eZ\xdd\xf1]L=6\xefO\xee9\x06~\xb7\xbc\
-\x18\xdb\xd9s\xb6\x1dE l\xafP\x0b*\x14$d\
-\x14\x05\x82\xc9\x00\x0f\xa0Bz\xbbQ\xd0|]\xcc\xcf\
-\xdd\xc4]\xdf\xd9.ZF(4E\x00MLL|\
-p\x99\x04\xa0\x89\x89\x89\x89\x89\xf74\x04\x12Pp\xa7\
-\x82?\x9f\xec\x0b\x03\xc7\x1b\xbf\x05\xb5\xbaW\x9b\x0f)\
-\x95Yf\xe7A\x07H\xdf\xfe\xb0m#\x92\x0d@\xe8\
-\x5c\x13\xc1\xeb\x1fP\xb9I\x95\xde\xa2\xb5\x19\xea\x869\
-\x1a\xc2kT\x87\x93\x90*\xa1\xf3\xbb\xc1mC\xcf\x1d\
-\x95i\xf7A\x1d\x1f\x12\x01C$\xda\xe8X\x8a\xe4\x9b\
-BXg\x17\x16\xd7V\xc7\x7f\xfewW\x9fz\xe4\xb5\
-\x07\xbe\xf6(\x9b\xfb7'\xb7fM\xefM\xd0\x066\
-H\xa5\xa2\xde\xbeo\xfe\xc0W\xbf\xf0\xe1\x17\x7f\xb4\xb1\
-\xe6\xb8\xf4K\x14\x81\xdb\x96\xa9]au.<y\xfb\
-\x904\xba1\xb1\x1a\xaa\x18\x5c\xae\xe2\xda\xd1f\xc0\x15\
-\xa4`=!\x0b-s\x1c(\x0fDh1\xf3\x07\xae\
-\xec_\xbc0\x836\xb5fG\xc7\x98\x83\x02\x87\x00\x03\
-\x11\x8cR#\x22u\xddAS\xfb\xe3e\xfe\xa7\xef\xbc\
-\x14\x9b\x13\xab\xd7\x8b\x063\x17\xac\x1fdR\x97\x06\x85\
-\xf2j\xdd\xf9\xe9C\x0f\xc7\xe3W\xfcJ\xe7\x8cA\xca\
-c\xc3\x17B\x11\xc1\x88\xf1\xf6\xfd\xb9jm\x8c\xeb\xe6\
-\xb9q\xefo\x1b\xfd$\xfd\xe8\x5cj\x13if\x9e\x18\
-\x89\xa6\xdal\xe2\x82/.(n\xfc\xed\xb7O\x1e~\
-\xf8\xe4\xe1\x07\x1exh\x8e\xcd\xe9z\xee\xf49\xcb\xaa\
-x\xc1A\x8b\x8a\xd3\x14G\x9f\xf9\xe8\x83\x7f\xf4\xb5G\
-\xbe\xf3\xfd\x17YoE]\x10\xc9T\xdfb\xc3\x9a4\
-\x8a\x85\xbb\x94+\x22\x04s\x81\x04\x93\xa3@\x9b\x9a\xa3\
-Q\xda\xc7\xac\xd4\xd4\xad\xdd\x8a4\xa3%\x1b\x85\xc6;\
-^\xa9;\x1fIo<\x81c\x0aV\xb6\xd9\x80\xbdb\
-%#\x85\x95\x12U\x88\xa6\x05\xaa\xaa\x06Sk \xe0\
-\xbb\xe5T\x81\xd8\xfd=\x95\xd5\xefs\xded\x0c<@\
-\xf2\x1e\xaa\xcaY\xfa\xce\xc8\xb8Bb\xec\xfar\xdfI\
-F\xc0;\x19\xedu\x8f}\x1e%&\x92\xbby\xf3\xd3\
-:\x9d\x98\x98\xf8\x003\x09@\x13\x13\x13\x13\x13\xefY\
-\xc6\xdb\xcfA\xb03F\xe5z[`p\xdb\xc0#\x04\
-\x91\x0d\xb5i\x0a<\x80uA\xdd \xd6Ea\x15\x8d\
-\x93\xc6;\xe3\x8a\xef\x88\x0a\xc4n<\xcd\x1b*\x1d\xa3\
-\x5c\x86\x80B\x06\xdbyi\xd4\xb6\xc9\xdd7\xb5/\x91\
-ic\x95\xae\x00\x09n}@\x9a\x01\x0bj\x83q^\
-\x12\xc7\x94\x1bQF$c\x83\xd8D]\xd3fH\x9e\
-!\x12\xf3\xae\x8b\xc1~\xf8|\xffg\x7f\xfd\xec\xc3\x0f\
-\xec}\xec\xa3\x17\xe7\x17\xefC=\x96\x06:\xc7\xf1N\
-\x8c\x8a~\xf9\xd0\x95\x83?\xfc\xbd+\xcbU\xdf\xe08\
-\xaf@\x00\x151\xdc\xd5~\x16\xbb>\x22\x10\xa4\x88@\
-\x80\x91\x8c)\xb5\xdcl\xf0\xf2U\xdc\xea\x17\x0f\x1eR\
-~\xa2X#g\x09\x9e\xa0\x00{\xa4\xb6>|\x1f\x1f\
-\xb9\xe2\xb3n\xb3\xaa\xd6`\x16l\x22:i\xdf4\x98\
-\xf74\xe4X\x89\xf0\xc4\xc4\xee\xc6\xf2\xf8\xbf\xfc\xe5?\
-\xfe\xed\xd7Kd\xd1HG\x09l6\x82\xd4& \xa8\
-\x9e\x07\x8b\xf8\xf5\xcf\xb6\xff\xee\xf7\x1f\xbc\xffQ\x1b\xb3\
-\xb8\xc7D&E\xd4\x08\xd6@DPw?\x0bo\x94\
--v\xff\x9c\x05\xbe\x9eUz?\xd7\xea\x1a'\xc3\x8d\
-N\x19\x8d\xb2\x93\x0c\xd1DCk\x9b\xee\xda\xf5\x93\xbf\
-\xfa\xfa\xcdO|\xe4\xe0\xf7>\xf7\xc8~:\x19x\xad\
-\xb5\x8c\x9c\xd1#5\xa6\xe2u}t\xf1p\xf1[\x9f\
-\x9b\xcd\xe7~a?\xd7>\x9b\xc5\x9d\xfd<\xb33I\
-\xe2\xb9gj\x9bl\xc4\xedQ\x04\x83\x96\xd9T6g\
-\xb2\x94\x18\x880\xa2m\x92\xd1A5\xc6\xd6\xe9p\x0b\
-\x8f\xac\x88\x12\xd5\x80\xf9\xd9\x13\xbe;I\xe7U\xc8{\
-\x9c\xa3d\xcc9\x86\xba\xa2\xa9z\x11\x0a\x90\xddat\
-Q\xac\x03D0\x01\xb6+\xdd\x1d\xa8\x84ME\xf5\x07\
-\x81\x9f\xd6v\xf9\xfa\x1e\xc0\xed\x8b\xa8\x04\x89\xe6P\x95\
-\xc2\x1dm\x03\xdfF\xa3\x05\xf4\xb62\xbc\xde\x14\xbd\xee\
-C\x1a(T\xc9afM-Y\x11\xfc\x05u\x9fM\
-LLL\xfc\xca3\x09@\x13\x13\x13\x13\x13\xef-\xb4\
-\xed/\xd8~F\x14'[BF\x0bFeh\xecF\
-\x19\x07\x9a\xabW\x0do\xb2\x92\x07\x965\xa5<\xf3\x8d\
-\xc1jJ\xa9\xd9\x05I\x8f\xdb\xbd3\xe0\xe6'T$\
-\x92l\x0c\xa4\x91A\xf0\xb1L\x8f\x02\xa0\x06\x19\xd9\x99\
-\xa9\x00\x8a \xc1\x82\x9eY+=4C\x1c\x80\x89*\
-\xc0@\xa3P\x15\x01$\xa2\xf1\xda j\xf2\xf0\xd4\x17\
-v\xa5i\x9a\xc67\xd5\x92\xe3\xa4\xe2\x1f\xbes\xfc\xe4\
-c7\x1f\xfc\xd0}\x0f]\xbePo\xdf\xa8U^\xa1\
-\x02$\xb0\x16\xd6\xa3\x16\xfc\xf4Sm\x8e\x83\xb6{\xad\
-\xf4\xde(\xa9\x06\x14~\xf6{~\xdb\x89\x06\xedj4\
-\x95\xa2Z\xdd\xf6\xcc[7\xeb\x07\xbc\xf0\x1a_\xb9\xdd\
-|\xe4\xfe\xb6M\xc6\xbaV-\x0cX\x82\x15\x94\x0c\xb6\
-\xab\xcb\x07\xfd\x93\x8f6\xf7_\x1a\x967\x19\xf5\x01b\
-\x1e`.MJ\xebh$\xe5\xca\x8d\xbcd%K\x89\
-X\xbcp\xf3\xa4\xd6Z+$\x84#\x07rF\xb2y\
-\xd35\x8c56\xd9\x0c\xfd\x95\xf4\x95\xe6!\x9b\xad\xb0\
-\xba\xce\xedmz\xc49\xd7\xc0\xb6[j\x94t4\x06\
-;\xd5q\xc0\xd9X\xc5\x91\x84\xf96\xeeu\x0c#1\
-r\xec\xb6\xe3]2\xcb\xb6\xc9\xc9\x02\xc0\xd9c\xedt\
-\x9e\xf1$\xed>\xe6\xd9'\xacQk\xada\x14(C\
-\xb52\x88Jf\x07x\xe6\xa5\xfa\x9f\xfel\xfd\xa1\xfb\
-\xee\xff\xdc'\xee\x8f~U\xf3uo\x0006\x86\xbe\
-a\xba\xed\x9e\x1f\xbd\xb2\xf1\xd45\x88\xd8\xf4L\xf0\x96\
-\xa1s\xf3\xebU\xc7c\x10\x8d\xe2\xd8i\x06\xc1\x08\x1a\
-\x05(\x14J\x95ma\x0a\x16\xa3\x08\xb9\xb4=\xdcR\
-\x11\x01\xc2$\xd6\xd0 \xefZ#\xc2\x9aFf\xa3X\
-t\xae\xd4\xfdYJ\xde0e\xc2,\xe4\x90W\xda\x00\
-\x06\xc2M0\x18\xc9:\x86\x97\xc3\x80\xb1\xd3\xb1r\x5c\
-U\x9a\xfa\xbf\xde\xe7\xbc\xa9\x00\xa4\xdd$E\x8c\xfe\xc2\
-]`\x97\xe0\x82 B)\xb9TK\x8d\xb6\xc1\xbc\x1d\
-\xb5\xa2\x00\xe2\xceK\xd2[\xdf\x9d]\x10\xd5\xb8\x0f[\
-\xf98\xa2\x8e\xebr4bZ\x03\x01\x91\xc1jlS\
-\xad*\xf1v{\xce&&&&\xde\xfbL\x02\xd0\xc4\
-\xc4\xc4\xc4\xc4{\x1aB\x1c\xc3\x8a\xcf\xec\x1aww\x0c\
-\x8d1\x13\x19\x90\xa2`L\x16&a\x10\x8b\xee\x18\x19\
-\xde4\xdf\xf4\xf5\x8f6:*\xb6\x1a\xd08\xd7\x89P\
-\x95\xc6\x0c\xdd\xca{w'\x19\xe0\x08?w\x93\xfc.\
-\xcb\xcaV\xa8\xb0\xed0(\x8e\xde\x1e\xc9h\xed\x9e]\
-?\x1e\xfe\xfe\xdb\xcf~\xfeKqx\x81@\xcb\xbaI\
-47\xd4!\x0cF\x870\xd0\xd0\x02\xf4qH\x96\xc3\
-\x9c\x16\xbbc\x18]4\xe3\xf8)\xed\x06O\x01\xb4\xb1\
--\xa2\x8a\xb9\xe2\xe6q~\xf9\xb5\xd5\xea\x89YgI\
-!6\x8e\x22d\x91PUYm\xf6f\xf6k\x1f;\
-\xf8\xc8\x13\xf6\xea\xd1p\xb2^\xa6\xbd\xd6i9@6\
-\xb4f\xe8\xd7\x85D\xa3\x5c\xab\x1bR2p\xceh\x0c\
-\x83T\x02\x06y\xd3\xcd\x1a?h\x9a\x86qTx\xb3\
-d(5\xedb\xcf\xda\x8c\xd5\xd6\x82\xb5uF\xe9\xec\
-\xe4\xfc\xe2\x04\x85\xb7V\x05\x8e\xf2LQ\x1eB\xa9\xe6\
-\x839\xd6\xa7\xf8\xf6\xbf\xde\xf8\xe6S\xaf}\xfc\x89G\
-/\xb4\x87%\xb7\x88\x8d\xc9X[\xaaU\x94\xc8\xa7\x9d\
-\xd7+\xf7\xb7\x16a!U\xb8\x18o\xfd\x88\xb4\x8b\xbf\
-~\xc3\xaeo7\xe5\x1cG\x86\xc9\x11\x01\xb3m\xfa\xed\
-\xf9\x11\xf0?\xebC\x85\x81\xe68\xeb\xb3\x93B\x15%\
- 2\xd2\x18\xc6$\xf9\xee\xd1\x05m\x05(\xca&\xf5\
-g\xe2M\xd8\xe9\x90\x12\x01\xf7\xd13\xa6\x9f\x94\xe1\xf3\
-N#\x11\xda\xa6\xa7\xbfK\x0f9111\xf1\xab\xc7\
-$\x00MLLLL\xbc\x17\x19\x07\xbd\x10b\x8a\xc6\
-\xe9Q\x91\x05\x11\x95\xa8D3\xfe\x94\x02\x0a\xaa\xba\x14\
-\xa8\xe4\xca\x91\xbaZ[q\xd3\xf4\xb5\xbdG\xcc\xcf\xeb\
-\xea\xd7\xd7U\x0a\xa2R\xf5Yil\x1c\xa1\xa5\xd1+\
-\xb4\x93|\x88\xea\x05\x18g\xc1k\x0c!\xb5\xadB\xe4\
-\xac\x9d\xd7\x0e\xe8\xc7R(L\x95\x1e\x84\x93`\x12\x92\
-D \x93\x99p)BN\x81\xe8\xd0u'\x9b\xfa\xf7\
-?>y\xec\xaf_8x\xe0\xb1'\xee{\xb4\xf2f\
-\xe97^\x0b\xd0\xb85\xb4\xe2\xe98k\xa8u\x03\x8a\
-\x0cUC\x9d\x83\x01U\x0a\x10E\x8a\xaeq\x0e3s\
- \xdc*\xc1\x08\x94\xb0\x08\xcf\xc4k'\xc3??\xd7\
-\x7f\xf1S\xfb\x17\xe6\x1eCM<\x80*z\xa1\xa5\x97\
-M\x1c\x9f\x1c\xcco~\xf6\xd7\x16_\xfat\xf7\xc3\x1f\
-\x9f\x9e\xbe\xf6j\xd3\x16\xce.\x0f\x01e\xca:\xc9j\
-ZG\x1a\xc7Am\x846\xb1%\xda\xb0\xbd\x80*f\
-a\x0bzZ\x0dP\xce\xadu\xcd\xa2I\xc8\x9a\x95M\
-,\xab\xb2\x93wFGSR\x01\xea\xce\x86sOY\
-\xa1\xbe}\xb9\x81\x00\x1c\xa3\x8a\xa1\xb3\xd6\xb8{2\x96\
-\xa9\xa3\x8aF\xa0 \xad\x12U\xd9gC\xcc\xd3\xb3\xc7\
-\xf6\x9f\xff\xfa\xd6\x87?r\xf9\xcb\x9f\x7ft~p\xdc\
-\x9f<\x97V\xb3F\x0f\xa4\xe4\x19\xb7Un[\x13\x8b\
-\x16&\xe7\xaa\xa9\xc5\xa0\xdd\xb8\xb9\xdd\x03\xd63O\xd6\
-\xd8\xcex.\xe8z\x0c\x8e\x12)\xa4\x0a\x17\xea\xb6_\
-fgQ#\x0a0 \x866r\xab\xa1QM\xd1\xa0\
-\x18\x140\x0cm \xde\x86\xd8d\x82\x13\xd5\x94\xbdT\
-Xl{\x06\xc3\xc2H\x85\xa1j\x1b)% \x5cn\
-\xa5\x15d\xd3\x14\xb0\x0f4\xe7\xbdsv\xa6\xdenW\
-\xf2\xd6^YY5\x06\x00\x99\x01\xa3j\xbeml|\
-Gv\xe1\x0d\x8d\x8d\xe3N\x05 '\x08\xb1\x14\xc6\xdb\
-\xcb\x8e\x9f\x98\x98\x98x_0\xfd\xaa\x9e\x98\x98\x98\x98\
-xoC\xd0F\xbb\xc2\xb9I\xe1g\xdf\xdb5\x06@\
-\x90\x94\x85\x81\x14I2\xe4E^\xe4\xf5g\xfc\x13^\
-\xc3\x0b\xbc:\x95\x00\xa7\xb6\x7fLnr\x8e\xa9\x161\
-\xce\xae\xe2\xd6]36\xa210\x0e\xb6\xb2\xf3\x92\x93\
-8\x0e\x1d3\xc09\xdas\x22\xa0:\x06c\x08\x22A\
-k\xfb\xeaio\xffx8\xfc\xb3\xbf9\xfa\xc7o\xbf\
-\x86\xb4\x98\x1f^\x1e\x06l\x06\xb1\x9d\x09T\x19\x8c\x9b\
-&\xadR\xea\xcd\x04D\x04BI\xf2s9\xd4\xdc\xe5\
-\x9fJ\x0cq\xac\xbd\xa2FD\x80\xdex\xe7'\x1b\xfd\
-\xf0\xd9\x9b/_[\x16KNb\x10\xaaC\x09J\x8e\
-\x84\xa1hs\xf3\xca\xa5\xf4\xb9O?\xf2\xf1'\xd2\xdc\
-r\xf4\xa7\xaa\xa5q7\x98\xaa\x99\xb9\xb9\xc4\x90E\xd5\
-\x90\x15Y\xca\xf2\xac4p\xbe\xc1\xa2\xc7bS\x9b\xe3\
->N\x07Vk\xd1\xa40\x84\xa1r\x8cK\xda\x9d\x13\
-Aq\xe6\xe4\xfa\xc9\x0e\x817K\xea~\xeb\x8b\xe8g\
-\xd8\x8e@\x11\xa9U7\xf7 7\x15\xdd\xfe\x1e\xd3\x85\
-o\xff\xe8\xda\x9f\xfe\xd5?\xbftum\xcd\x05k\xbb\
-\x5c\xad\xd4\x16l\xddB\xd13\xb2!3\x06\x22\xde\xac\
-\x83\xe6'\x94\xbf\x04v\x06\xae7\xec\xb1\x80\xa8\x88\x82\
-\xa8\x16\x95\x0a\xaa\xb0\x16\x8fj\xa8@\x88!\x7f\xab\x7f\
-$F\x8d\xa1FQTD(@\xc1\xcc-\x99\x99\x8d\
-\xcf\x8f(\xb1j\x1b\xbcN\xcaLS\x0c\xd0\x04\xdf\xec\
-Rr\x92\xa4\xed,\x94)\xc1\x0c\x883\x07\xd0/\xd2\
-\x92\x13\xe3\xab0\xcc,\xa4\x9ck\xc4O\x0d3\x9a\x98\
-\x98\x98x\xdf29\x80&&&&&\xde\xa3p+\
-\xa1\xa8\xa6\x90\x100\x88\x0aFe\x831\xa6D\x09\xd1\
-\xc2\xc0ZRQ*\xf2\xca\xa8\x0d\xc3\xe7\xd9\x0c\xfe\xc6\
-\x0e\xa3\x9f\xe2\x00\x82\x93\x0c\x950R\xc2\x18\x0b\x0c\x02\
-\x082\x88\xd8&\xca\xc4\xe8\x0f2\xc1B\x16j\x22<\
-\x8a\xa9\x02\x19\xdc\x00U\x86j\x0a\x04h\xff\x7f\xf6\xfe\
-\xf4K\x92\xec\xba\xee\x05\xf7>\xf7\x9a\x99\xbbG\xe4P\
-\x955\xa3\x00\x14\x00\x91 (p\x94HjhQ\xc3\
-\x93\xd8\xaf\xdf\xeb^\xabW\xffk\xfd?t\xaf\xee\x0f\
-\xbd\xde\x07uKz\x12%N \x00\x82$H\x10\x00\
-A\x10\xc4\x5csN\x911\xb8\x9b\xd9=g\xf7\x87k\
-\xee\x11\x91\x19\x91U\x95\x95(TU\xdao\xd5\xca\x8a\
-\xf0\xc1&7\xb7\xb0\xbb\xef>\xfb\x88\xd9\x99%\x03\x83\
-\xf4,\xcf\x91\xcc\x95=g\xd8\xe0\x9e\x17\xd4\xd5\xe5\x0f\
-\xdf8\xf8\x1f\x7f\xfa\xf6o\xfe\xe3\xcf\x5c\xfb\xf4\xb3=\
-{\xf2\xa81\x8b81z\x06I%#\x8bP2\xc3\
-\xc0\xa9\xcb<\x03[\x1fR\x1d\xb7C\x0c0\x92\x05\xa1\
-A\x14\xac\xcd\xab\x94\xaf\xf4\xfd\xdd\x1f\xbez\xf7\xbb?\
->\xfc'\x9f}\xb6\xdd;\x1aOz3\x1a\x0bc\x04\
-\x91\x0c~|\xd8.\xef\xfc\xe3W\xf6\xff\xcdo\xafn\
-\xdd\xbc\xf7\xddWO\x86\x93\xd7W\xcbe\xce\x9d\x17\x1f\
-J;\xd8\x950$o8\xb6\xe6\x99\xcad2\x83\x8c\
-\x09\x8c\x12\x1e\xa5\x1d\xc7\xeb\x8b\xe6\xa9\x96\xc7w\xc7\x93\
-C,\xee\xf19\xa4\x94\x12$P\xd4\xd6\xe3\xb2\x8b\x03\
-:\xf7\x99k[7\xf7\xbe\xc5\x86m[\xe8\xed\xb9t\
-\xd1\xc0u\xb2/\x04\xe8\xa8\xc9\xe2\x0c\x84\xe0\x92\xe7\x12\
-\x19\xcbUwuy\xe7\xf6\xad\xaf|\xfd\xe0\x1f\x7f\xe1\
-\x99\x1bO?\xfbt\xf7\x8aw\xb7\xfa\xe1^\xb2df\
-R\x03\x8c\x0c`4\xf8\xe4\x0c\x9b\x0ccg\xf7\x80\xb5\
-\xf0\xed\xec\x03\xa7\xd9T\x1609\x85\x1aX\xae\xdd\xe6\
-\x13\xac=\xee\xa8\x11\xe1U\xe2KRv\xc0\xdb1-\
-\x86S\xe1\xef\xddP\xc5\xa6\x1e\xbe\x86O\xa2)\x13\xbc\
-\xb6}7\x18\x11\x14\x0d\x16\xc2X\xdfba\x16\xb5Z\
-\xac\x86\x9d\xcf\x22\xd0\x93\x0c!\xdb^4m\xdb\xf6K\
-\x00c\x12\x0d\xe5Bch[\xa4\xbc\x8d\xe9\x01\x1e\xf1\
-\xeb\xcc)\x22\xec\xbc\x0e|j\xd9\xab\x19@\xdb\xaf\xb8\
-\x81\x16B\xf1\x12s\x09\xd8\xcc\xcc\xcc\x13\xcc,\x00\xcd\
-\xcc\xcc\xcc\xcc|\xb41E\x96\x1cA\x08\x93\xc0\xb1\x1b\
-\xd8\x1b\x90!O\x00\x1c\x06Y@2\x15\xae\xc2:\xe5\
-\x07\x87\x1d\x0f(>gV\x04\x00\x1cRl\x1a\xdf\xb6\
-c\xb2][\xe10\x05k@\xd0T\xc33\xd5B\x08\
-\x94R(;(\x81\x056@\x92\xa5\xb0\x88\xea\x16B\
-\x16r\x95\x00\x0c\x9eX\x88\x8c\xc2T\x98\xd0\x04\xec\xb0\
-D\xbbr\xf6\xe9\x1b\xdf.\xbf\xff\xc7o?w\xe5\xca\
-\xb37>5\x1c\xbeQ\xc6\xbb\xa6Q\xe6u3Rm\
-{_\x03aH\xda.\x00\x99 \xa7\xc8\x0d\x02\x0c2\
-\xb2\xd5\x02#\x06,\xd0\xc2\x16\x83\xec'o\x8e\x7f\xfd\
-\x9d\xb7\xff\xc3o\xbfr\xed\xf9\x179\xdc\x92\x07c\x83\
-\xb2F\x8a\xdcY\x94\xb2\xb9\xfd\xea\xd5\xeb/\xfd\xfb\x7f\
-\xf9\x99\xde\xef\xfc\x7f\xfe\xf3k\x7f\xfb\x83{e8\xde\
-\xdb[e,\x88n\xd4B\xce\xec\x8b\xac\xc5$\x8d\xc9\
- !\xc2`MZ\x86a\x18\xa4\xf50l\x0e\xcbQ\
-\xd9\x07^\xdco\x9ei;\xc4\x1aSW3\x18\xa8\x04\
-:\xce\xca \x0f~P\xef\xcf5P\xa3\xc4\xcf.\xe1\
-2\x13\x90\xa6\xa8Z\x00\xa4QQ\x86\xa1\xf7&\xe7\xdc\
-\xee\xaf\x07YJ\xb9}\xfa\x8d\xbb\xb7\xfe\xf0\xab\xaf\xbd\
-\xf2\xe9\xab\xff\xf2\xd7^\xea\xf65\xdc\xbb\xed\x1aLQ\
-\xd3\xa6\xb8\x0dG\xae!L\x17\xaeG\xdb\x8dx\x00r\
-\x12\xab\xee?[\xab\x00T7\x5cI4YR6!\
-)!\x16%]\x1d\x12\x84x\xd7no\x03 \x1d\xe7\
-\xa4V\x92,\x08Q2\x04\x10\x0a\x92\xa42D?\xb3\
-\xa5\xa2R\x82Q(\x16\xefEn\x9a\xf9Xr\xd6~\
-y*\xafo\xa3\xc7 \x80\x86\xaeCJ85\xf9=\
-\x0ag\xd3\xd3\xce\xea\xf8S6\xdb}\xcfTM9\xbc\
-&\xc1\xa59\x05zff\xe6\x89e\x16\x80fff\
-ff>\x8a\xec\xee\xfe5\x85\x89\x22x:\xf3K\xa0\
-\x812P\xff\x1bI$\x00HI\x96\x07\xda\xa8\xb1\x13\
-\x92h\xbc/$\xe5\xbe\x8e4q\xff\x08E%\xc1i\
-\x02\x12\x00&\xc90\xa5\xb708E\x8c\xa2\xca-\x08\
-\x01&4b\x0a\x99\x0a1\x00\xa5.Q\xd4n\x18\x1d\
-5ge\x9a\xba\xa6\xc1X\x9d\x22\x91\x8c\x19\xa9\xdfh\
-m\xa6k\xd7\xf7\x8en\x9d\xfc\xd7\xdf\xff\xd1\xe7_\xec\
-\xfe\xcf\xff\xe6\xb39\xd6\xfd\xbd\xdbh\x94\x0c\xaaN\x9f\
-0\xa2CjP\x9b`\x91\xaaG\xe5\xbe1\x16]H\
-\x81\x00\x93%F\xe1(I&k\x8f\xd6\x9bo|\xeb\
-\xd5o|\xa7\xfd\xc4\xf5\xa7\xad]q\xe8#N\x0c\x05\
-rf\x1apr02\x0e>\xf3\xca\xa7\xff\xd7\xff\xe3\
-\xd5{\xeb\xbbc\xdc\xfb\xf1k>\x1c\x1d.\x92u\x8b\
-\xc5H\x8e\xf0\x84HVLF\x85P\x82\x05\xf0R\x08\
--\x16\xad\x85\x1flN\xee\xae\xd2\xfa\x8b\x9f\xc2o\xfd\
-J\xfe\x97\xbf\xb3|\xf6\xfa\x06\xc3\xb1\x8a\xd0\x18\x10 \
-i\xc6\xa9\xd5\xd4\xbb\xe4\x11\x86s<\xd5\x80\xa6B\xbc\
-\x0b\x17s\xbfW\x87\xc1\x18\x95\x17\x8b\xb6\xc5\xf1\xe1\xb1\
-\x85_\x7fz\x91\xd7\xfb\x7f\xfd77\xbf\xfc\xe9\xef\x7f\
-\xe1\xd3\x9f{\xf1\xda\x12\xee\xda\xac#\xda\x88\xc6\x06\x87\
-Bn\x8f\xda\x9a^\x80\xb2<i;f\x15\x00D\xb5\
-\x03\x91F\x02\x16\x96\x0a\xe8R\x01\x10,\xc0H\xf5\xad\
-Sz\xb0|\xec\x1dV\xd7\xb0\xb5\x16\xa1z\xa2@i\
-\xaa6c\x80\x0e\xf8\xa9\x226a\x98Z\xd6\xcf\xcc\x5c\
-\x8c\xa2J@\x01)\x11\x8b\xd6r\xfa\x19\x9d2\x17\xd9\
-\x03'\x9d\x9dr\x95\xbeD\xb4?\x8b\x15\xcf\xcc\xcc\xcc\
-|$\x98\x05\xa0\x99\x99\x99\x99\x99\x8f\x16\xbb\x9a\x1d\x13\
-aB\x8eB\x1a\xe9a\xe1V\x8d@\x0db\x81(@\
-\x0b6\xb0\x015\xc17\xda\x5c\xbatl.\xdd\xed\xd7\
-\xa5\xddL\xcd\xc2\xcf\xa0\x8b\x1c'g_\x22'h\x9c\
-4\x9a\xa9wX\x10\x01\xb5\xd9\xba.3\x15\x0a\xad<\
-\xa94\x119\xbc\xf1\xc8\x9e\xb2F\xb3Ch\x0dJ\x06\
-O\xe1\x19\x12@\x04\x92\xb3q\x1a\x84\x14l\x02f\x12\
-\xc8\xe8\xcc\x96\xd1\x961\x97\x93\x94\x9a>\xedq\xf1\xd3\
-\x9f\x1e\xfe\xc9\x9f\xdc\xfc\xe2\xa7_\xfa\xcc\xcb\xcb\xa65\
-0@D\xd5\x90\x22!\x96 \xa0\x13\x00\xa0A\x19\x0a\
-\xc8j\x0a\xb4\xc00\xc8\x8a3F\x8f\x04\x98\xe5\xb0v\
-\x88\xe2\xd1Yw%w\xfe\xd3\xd7\xc6?\xf8\xca\xeb\x9f\
-\xfeD\xfb\x8b/\xb6(\xeb\xa4~\x99\xbd\xd6=Q\xd8\
-K\xd8\xf4\xc7\xc3\xdd\xef=s\xe5\xda\xef\xfd\xdbg\xaf\
-=\xbd\xf7\xa7\x7fv\xfc\xed\xbf\x19\x8f\x0e\xf2f(\xc7\
-\xf2~Qk\xb9F\x82@/\x1c\x87\xd6\x1e\x1a{J\
-4a\xaf\xd5\x8b\xd7\x96\xbf\xfa\xca3\xff\xfe\xb7\xae\xfc\
-\xbb\x7f\xda>s\xe38\xc5O\xe2h\xa3\x92\x9420\
-\x00\xa2\xcc`VK\x8b\xa6\xb1#\xc4\xd3,#AI\
-L2\xee\xc2\x82\xb6O\x83\x10][m\x90\x81m\x19\
-\xd4T5\x05\xd4\xa7\x0c\xcaS!\xe1$!\x1a\xcc\xee\
-\xcb\x91\xe56\xeb\xbb\xaa\x1e\x16\xd1`\xc1v/|\x5c\
-o\xfah\x1c8\x1e\xd9\xd1\xda\xf5q\xf7\xe5\xaf\xde\xf9\
-\x8d_\xbc\xfd\xcc\xefz\xb7\x7f\xb7\xc89,c\x5c\x82\
-L\x1c\x10\x89\x22\xe5\xdb\xcd\xd8\x9dY$L\xac\xd9I\
-\x12\xb7\x99\xb9R\xdd51\x084Q\x9a\x00c\x9b\x97\
-k\xf0\x84\x08\x08fh\xcc\xdaQ8\x1axs\xd4=\
-\x05O\xa0\xd0\x1a\xc3]\x1fm\x97\xae\xf4nQ\xeas\
-*Kz\x830\x96Vhs\xce\xed\x12\x96\x8b\xf3$\
-\xb8\x91U\x19\xa8\x0e\xa9\x832sP\x06\xfb9\x84\xeb\
-NJ\xf0\xd4\xd9\xe9\xec\x07' $\x81\x09\xa4DU\
-\xadL\x0f5\x8fm\xbdZ\x1fg\xce\xee\xfc\xd6\xc1H\
-NuZ\xefp|\x1e\xbaPN?\xec\x0eb\xcdd\
-#\x00\xb8\xd7/QD\x88hr\x93\xad9\xbf\x11\x8f\
-\x01\x01\x04\xadv\xa3\xb3\xd3/\xb2\x00\xc0\xc0\x94\x80\xef\
-\xdcZ\xbc}\x92\xbbta\xd7\xc7\x99\x99\x99\x99\x8f?\
-\xb3\x004333\xf3\x04\xf2\x18\xdd\xef\x1f\xbc\x91^\
-\xdb\xfa\x1dQ\x10\xe4\xa41\x042\x98\xb4\xd5\x07\xcca\
-1\x8d\x95A8\x90\x0c\x92\xe4\xcb\x1c{(#7\x83\
-6S\xe3\xa9\xf3K\xc7\x99\x11\xc9}\xe3\xc1\xd3\xe1\x92\
-\x8c\xc1\xa9\xe8\x0a\x0ac\x814\x9a\x9a\xa5\xa5\xc4\x1a\x93\
-\x0b\x06J\xd0\x03 FP\xaaE65LF\xdb\x0d\
-$@\xd4\x02\xb2\xe0T\xc9V\xcb{\x88 \x0bU\x9a\
-,x\x1c\x1f\x97\x053\xda\xf6\xeb\x7fw\xeb+_\xff\
-\xe1\x8b\xcf?\xdb.\xbbpR\xa2C\x0e1Q\x86\x10\
-,IE\xb1m8\x85$\x9a\xa6\x812\xaa\xf0\xe1.\
-\x22'\xc2R\xa9/\xceMN\xfb\xfb\xc7\xb7\x8e\xfe\xe2\
-\x9bG\xff\xe4\x1f\xbf\xf9\xd2\x8d\x97\x96h\x5cMN]\
-c\xa3\x06\x07\xd0\xad\x92%\xdd~\xfb\xb5\xbe=\xfa\xe4\
-\xf3\xbf\xf8\xd4\xbf\xfe\xc5\xe7\x9f>zv\xef\xe67\xff\
-\xf2\xe0\xc7o\xdf\x89\x93\x91\xd1\xba\xa7Q&\xc00\x80\
-k\x19\x98\xb0\xdf`\xb1\xc0S\xd7\xf0\x99\x17\x9e\xfa\xe7\
-\xbf\xfc\xf9\xdf\xfe\xc2s\xbf\xfcI=w\xe5-ln\
-\xfa\xd1\xb1\xc6TGlF\xa4\x04Wx\x8a\x80 \xa3\
-\x99\x81\x14\xe8B\x000&#\xad\xa4@*\xaaIP\
-\x88\xe9\xe9\x10d\x16\xcd$\x87e\x86\x89\x80Ib\x12\
--\x88\xfa\x06!\xc0R\xcf\x10\xd1P\x1b]\xe9\x8c\xb5\
-\x85\x84A\xe66\x15\xaf0HI4-\xdb\xee\xde\xc9\
-\xc9f<\xde\xbb\xd6\xe4\xac\xe3\x83u\xe9\xd5\xa5\xee{\
-?<\xf9\xd2\xd7^\xff\xc2\x17V\x9fzv\xa5f\x0c\
-o\xcd\x88 eL\x08\x05\xa3~\xfcS\xe0\x0f\xeb\x90\
-\x98\xce\xa0M\x0a\x11\x09\x88\x11<\x93&\x1e\xa0B\x8c\
-\xa9\xe6+a\xab\xe4U+Y\x84\xfa\xe2}N\xc3*\
-\x8f=\x8f)\x8cP\x8bh\x15\xd0\xe5\xfd\xcd.\x84H\
-\xde7\xe3\x06\xde8Zcg\xa9cjP\x0c)\xb1\
-i\x80\x22\x15\xb2\x9a\x80x\xc6pqY\x0d\xdd\xcf\x90\
-\xa9\x9f\xb7!ju\xa3\xb6=\xd2\xa6z\xc2\xc6\xcc\x80\
-\x08\x95\x18U\x93_\x8c\xf5\xe0_2\xfa\xbf\xbc\x12\xef\
-\xbe\x97\x5c\xb01\xef}\xfb\xef\xbb\xce\xbc\xe3\x8by\xe6\
-\xe7w\x84\xa7/?\xfb\xbe\x9d%\xacv\xb6\x9b\xd2\x90\
-=\x02\x0aK4f\xb3\xa9vT<\xf3\xde\xb3\xdd\xe9\
-\xb6\xe7\xd4\x99\x08\x9f\x9a\xe0U\xaf|\xdb\xcb\xa6L\x88\
-\x1a\xeb\x15\xb5XQD\xb0!\x9a\x5cOk\xde\xb7_\
-\xef\x85\xb3\xe7\xde\x94\xf8S\x97\x17UP\xdd\x0a\xad\xf5\
-\x837\xca \x18n\xf5\xcdq\xc9\xc9f\xf9gff\
-\xe6\x09e\x16\x80ffff>H\xb4\xbdu\xfe\xc0\
-FJ\x17\xae\xe8|\xf4\xc9\xc5\x03DM\xb7\xf7\xda\x16\
-A\xed\xee\xa7!\xa8\xb6\xf5\xad\xa5ND\xad\x00\xa9w\
-\xdd\x8fZ\x8ds~;v\x0d\xbd\xce\xbdj\x1a\xa0K\
-@\x0d\xe5\x05\xa8\xbe\xe3h\x89\x1b\xed\x9f\xd8\xb55\x16\
-\x11\x99GX\x1dJ#\x87\x0e%\x10Y\xbc\xaa\x14\xc5\
-O\x9a\xa5\xfe\xd5o\xf1\x99U\x1c\x84\xb8o\x9c\xb2f\
-\xce\xac\xf8\x1d\xb6\x9e\x82F\x03\x5cM(O\x99?\xca\
-\x8bv\xc3\xe57\x7ft\xf2\xad\x9f\x1e\x1c\x1c?\x15\xf9\
-F\x8fv\xc4\xe8v\xd8\xe4{}w\xe8\xab[e\xb1\
-\xea\xed\xd9\x14'\xd1m\x1aG\x1e\xb0gS\x86\xe9\x98\
-c\x81~\xa5\xfe0\xe1^K\xa9mcE\x22\xe3\xc0\
-0,\xcb\x90\xfb\xdeK\x17|\xd6\x97W\x8fp\xef\x9b\
-\xb7_\xfd\xdf\xbe\xf5\xea\xf3\xbf\xd9\xfe\xfa/\xee\xb7C\
-\xd3\x1c\x0em\x9f\x81\x05\xd3\xbe6\x19\x08\x5c\xcf}\xdc\
-\xb3\xf5\xa6\xad\x1a\x995\x87y\xff\xa4)\xa5]S\x8b\
-\xd4\xbf\x98`t\x89Iv\x92xoi\x1e\x18P\x92\
-\xd2\xd3\x9b\xe5S\x7f\x7f\xeb\xa7\x7f\xf0\xe7\xb7\x9e{\xe1\
-\xa9\xcf\x7f\xf6\x93{W\xae)^\xebt+s\x9d\x1c\
-d\xe4\xe0\x95\x8c\x95\x1f\xda\x9d\xef\xaf\xda\x83\xff\xe9\x97\
-o\xfc\xda\x8b\xd7\xbe\xf3\x1b\x87\xdf\xf8\xce\xf8\xdd\x1f\xe4\
-\xdbw\xec\xe4\xa4\xdf\x9c\xd0\x03))\xb7i\xb5\x8fk\
-\xd7\xf0\xcc\xd3x\xf1\x05\xbc\xf2\xa9+\xbf\xf8\x99g^\
-~~\xbc\xba\xf8q\x83\x83\xf1\xe4\x0e\xfd\x90\xad\xcc\xf6\
-\xca&\x801g\x80bS\xc4\xd2\xc7\x90\xf8\x5c\xce\xd7\
-\xf7\xd2\x9bW\xc6\xc3\xbew\x22\xf5\xb6?\x94\xd6\xf7\xf2\
-\xed\x1bG8\xb9w\xd4\xa6\xc1\x97'\xed8^\xbd\xdb\
-m\xc6\xc5\x06\x1cR\xbb~\xb6-\x0b,\xd6\xfd\x95\xe1\
-\xce\xd2\x17eX\x96\x18\x9b\xbd\x93\xbc\xe8s\x00.\x95\
-1\x95\xe8\x8e\x17\x8a`w\x92\xbbuk]q+A\
-\xedNG\xf3\x85\xf5]\xec\x15-7\xf0\xfd\xee\xb8Y\
- l\x81#\xc6:sX\xa6\x94\xbdK\xb1\x04\x17j\
-Q\xb2\xde:\xc4\x7f\xfd\x9b\xdb\x9f\xf8\xda\x8d\xff\xf5\xdf\
-\xfe\xc6\xb5\xf6\xd06?^\xe67\xf3\xb8\xc1(\xef\xb8\
-^&F\xdbD\xcaNp\x08[\xd3\xa4\xe6\xa8\xef{\
-\x1b\xae^9\xbe\xda\xdbh\xab\xec\x88\xb19D\x1eS\
-Z\xe4\xd46\xcaMqs[\xb7~\xb2\xa7\x0eb\x0f\
-\xc6\x22\x1f\xdeH \x16\xb7\xb188\xc6\x9a\xcd\xf8O\
-\xbf8\xaeZ\x1enJn\xc8\xa4\x86\xa4\x9b.\xf9B\
-\x9e\x1d\xda\xdfw\xfe7\x03\x97\x1bs\xfa=;\xf1e\
-\x9f\xf6\xdbW\xdf\xd6\xd7\xff\x1a\xb7\x8fn\xd8\xf5=0\
-\x87w\x96\x0eaG\xa6]\xc8J\x82\x12\xe4\xef;\x9b\
-\xe9\xbd\x91\xc4\x1c6p\x5c\xb7k\x03\x9b\xb1e4\xb5\
-\xd7\xde\xc9\xd8l\xd2\xd5\xd5b\x0f\xc3=\xad\xdf\xda\xf3\
-\x03+1\x0cHD\xce(\xa4\x87\xed< \xa7aY\
-S\xd6\xd3\xa5k\x9c\xd2\xdd/\xe2lc\xa9sK\xd8\
-\xad\x86\xbc\xcfuR=^\xe0N\x87y\x90\xe9xn\
-\xad_\xf7/\xf22\x085\xd3\x06S\xa6j\xefA\x80\
-R\x12T\xd5\xe8\x04&\x86AY\xe3F\x9b\xd2\xe5f\
-\xb5\xb7\xb0.\x07\xa8B\x85!,M\xba\x8a\x19\x00\xc6\
-\xe48\xdc\x96\xce\xba\xaa^\x09\x17sX\x82\xa6\xdaD\
-\xa8\x85\xda\x02\x0ey\x00\x08\xdfG\xb4\x1c\x8f\xdbrr\
-\x9d\xd8_\x1c#\xdd\x02\x9b\xe0\x8a\xda<bt\x94\x02\
-t\x08\x1c; ,\x17Y\x8c\xa6\xa1\x19,r\xf2e\
-rZ9\x81\x8a\x91\xcan\xdc\x0c\xe9\xca\x91\xd2\xa8\xb9\
-\x0b\xf2\xcc\xcc\xcc\x93\xcb,\x00\xcd\xcc\xcc\xcc|\x90|\
-xf\x1d\xcfN\x0e?|\xc0vv\x96z7N\xda\
-\xcd\xbfV7\xcbv\x11\xefc\xff\xce\xce/_\xb4\x9d\
-\xa7\xdb\xa3i\x0b\xa6\x17\x8f\xc9\xcc\xbc\x03Z\xb7\xae(\
-\x87\xc0\x01iD\x0e\x94\x00<\x0aJ\xb4\xb0R\xe2\xe4\
-\xe9\xa7\xe2\x7f\xfa\xd7\xcf\xfc\xeb\x7frc=\x02\xed\xc5\
-\xd1%$\xc8t\xd9\xb09\x907\x5c0|\x19\xc7\x1d\
-\x1c\x04#\xf2\xeajY|\xe2?}\xe5\xe6\xff\xfd\xff\
-\xf5\xf5\x9b\xaf\xf6\xdc\xeb<]ul\x8c#l]\x1a\
-F\xb7Q.c\x5c\x1d\x22\xc9`\x8e4\x22\x01\xca\x08\
-a\xa4g\xf5Y^\x0cCF*9EG\x8c\xc6\x0d\
-t\x98\x89F(\xc4\xda\x96\xbd\x96M\x8b\xe3|\xef\xab\
-\xdf\xbb\xfb\xa9\xaf\xfd\xf4\xfa\xf3{\x9f\xda\x83\xf7HC\
-\xce\xb9\x83'\xa8\x89\xa4~8F\xab\xdc\x00kIp\
-\xda\xc6r\x9f\x07O\xa3\xd0\xd8x\xd5,K&\xb8p\
-\x94x`L\xa2\x17\xefF-b\xd5\xf6'\xb7\xff\xea\
-[w\xaf\xee\xbf\x9eV\xcf\xfc\xda\x17\x9e\x89\xcd\xc9\xe1\
-\xbd\xb7\xaf$4+\xa0\x88\x1b\xad\x1a\xc0\x14\xe3m\x1f\
-6h\xfa\xfdg\x96/>\xdb\xfc\xd6\xaf\x7f\xe1\xd5\x1f\
-\x7f\xea\x8dW\xdb\xe3\xe3\xbb\xeb\xbe\x0f8\x13R.{\
-\xfb~\xe3\xban\x5c\xd7\xd3O\xe3\xd9\xeblV\x83\x86\
-W\xd7\xeb\xb7\xc7\xe2\x8d\xc1Z$\x10BN\x19\x96\xe0\
-e,\x18\x09\xcfP\x0a'6C\xf80,eW\xa3\
-\x8dh\x85\xc58\xb6#\xc6\xb1Yc\xe5%5\xf0n\
-\xccG\x9b\xc5\x90\x06\x80@Ii\x5c\xa1\xbf\xe2\xad\x86\
-&\x86<414\xa1\x016\x9a\x85U\x013\x82\x1b\
-\xcf\xa3\x07\x9d6\xb0\x19\x123\xd5\x9c9\x19\x82\xb9o\
-\x18\x09\xad\xd4:\x0asI+r\xf0\xe8\x19j,\xb5\
-\xd6\x84\x1b\xa2i-G\x1eK\x94\xe2\xf6\xf7o\xe2\xbf\
-|\xe9\xe0\xc5O\xd8?\xff\xe5Ot\xe9\xad(=[\
-\x07\x11\x19%\x03\xb2\xd4\xb7T\x03s%!CM\x89\
-\x8c\x1c\xb9+\xec\x12\xe0\xa6\xe4\xc5\xfa`!\x1a\xd4d\
-\xe7p\x13\x8bE\xdfF\x1a#\x0f`$\xf6W\x01\x8c\
-\xcd\x1do{O\xc3\xf5\x1b\xf8\x17\xbf\xbd\xff;\xbf\xfa\
-\x9c\xc6\xb6\xb5\xd2e\x91M\xc0pI\x02\xd0eB\xa7\
-\x18m\xbf\x5cl\xaeF\xd3\x1fuo\x96\xab\x1a\x16O\
-\xff\xe9_\x1c\xdfz\xf3\xad\x83\xbf\xd78\xc8\x17\x8d\x90\
-\x845\x11\xd5\xfe\xb6\xfdf\xd8\x07)\xfdTLLa\
-\x90\x8a\x15\x832\x1b\xcaX\x0dz\x5c\x16\xbbzT\xb2\
-6|\xa6\xdd\xff\xe5\x17\xe2\xe9\xe5\xbd\x93\x13\x94\xb1#\
-\x17J\xcb`\x0eU5\xf9T\x00\x8ax\x87\xcc\xa42\
-\xbd\xf0\x02\xa6\xcc\xf5\xfa\xf3e\x87\xf7\xac_\xaa^\xcb\
-\xa4d4\xbb\xf8\x0d\xd2\xb9J\xa5wY\xb5$\xc0\xa4\
-FA\xc0\xad\xc8BT\x88\xf0\xd6\xa2\xc9\x00\xe1d\xb1\
-\xc6]\xc3\x98\x81\xa6\xd9l\x96c<_xe}\xf8\
-\xe6\xe6\xf0\xcd\x80[NumA\x19\x8c[\xdb\x90M\
-\xc7G\x04|[<\x09\x84\xcck\xceUR!\x005\
-P*\xa6b\x03\xc0\x84\xce\xb0\x00\xfa\x1c\x5c\x12\x8bv\
-Ly-[\xc8\x96\xf0\x81\x93\x9b\xec\xbd\x12`@\x06\
-O\x00\x99\x8a\x00%\x15\x13\x19P\x9b\xdc\x10\x9bj\xa4\
-3\x05\x18\x858)\xe6\x81\x94?D\x7f\x8cgff\
-f>Hf\x01hffff\xe6\xa3\xc8\xae6+\
-Y,\x0d\x99\xea\x811\x84\xd0\x9e\x02\xd0\x01\xc6\x80\x13\
-\xca\xa0L=\x86\xbe3\xa5\x05\xd1-\xb0\xbc\x8eT\xa4\
-\xc33]\x82\xcf-Z\x8c\x8b\x06[\x22\xe4X\x0cJ\
-Ft\x0c\xc0\x81\x84\x10\xda\x06\x8b\xbd\x1bO\x0f\xcb\xa6\
-\xa16\x09\x874(\xc6\x84\xc1\x14\x16\x80\xd3\xc6\xdc\xf6\
-\x8b\xd6\x97QN,\x88\x22\xa0\x09\x99\x95\x8e\xec\xa4\x12\
-0\xc8\x19\xb5\x02\xa8\x90\xee&\x12L\x1d\x99\x90Va\
-\xfdPnv\x0b[\xae\xd2\xed\xb7\xf1g\x7f|\xf4+\
-/4\xcf\xfd\xe6\xa7\x1a\x1eG^\x03\x03|\xcde#\
-\xdax|\xdc\xc1s6\xc0\x11H\xde\xb7q\xd4ih\
-\x029J\xc2\x81\xb1s$2H\xaf!9\x22\x83*\
-\x1a\xcd\xd8-\xec\xf6!\xbe\xf4\xe7G\xfb\xd7\xbe\xf7\xd4\
-\xfe\xaf\xbe\xf2\xc2'\xd5\x95\xe3\xcdk\x1a\xd6\xcb$6\
-\x8a\xde\x03HmnR\xde\x8c\x87\x9b\x93C\xeb\xbag\
-\xae\xed=\xfb\x1bG\xc3\x179\x8c\x1b`L\xc9AE\
-\x8c\xa6h\xdb\xd4& J\x0c\xeb\xcd\xdd\xe32\x9c\x10\
-)\xb7M6\x8bM\xdf\xf7\x91\x18\xb9Y\xc0\xcc\xc7~\
-\xed\x18r'\xae\xd8<u\xd8\xbf\xf0\xb7\xaf\xbf\xf9\xdd\
-[\x9b\x83\xd4FK\xefF\xd7\x98\xe8\x8bu\x09\x92\xc2\
-\xd5Q+\xf7e\x91\x8dh&\x03J\x81\xddS\xea\xc9\
-u\xd6:\xb30\x15RInQ\x10&4!\xa6\x92\
-r\x8f.J.M.9\x97\x94\xca\xb6\xfe\x8b\x80\xd1\
-\xc4\xa6X.9;\x1bg*\xcbf\x5c*r\xc2\x06\
-*\x81 \x9d\xa4\xac\x8a\x06a\x88U\xdb\x96a\xfc\xfb\
-\xef\xbe\xf5\xd5\xaf\xfc\xe5go\xfc\xea\xa7\x9fz\xda\xcb\
-3\xca\xb7\xc9\xc1\x88\xb6\xc8\xe4\xad;\x83@X\xad\x99\
-\x89\xc6\xa25f\x03%I\x9d\x22\x03\xd7\xc4!\xb07\
-b\xc9\xb0\x05\x0e\x12OR\xb4\xe6\xc9|d\x01\x8aC\
-\x1b\x00\xb6)\x12\xba\x855\x0d,'[\xad\xb2\xed%\
-\xac\x11\xc3T\x05\xf90%\xe2\x82!\xb0\xe8\xd6g\x8c\
-@\x97\xae.=\xae\xf2\xc4\xae>\xb5\xdf\xac\xba\xdb(\
-\xfdp\x9c\x9a\xb4\xe4\xd4\x97\xac\x91,h$\x82\x85\x16\
-\xe0\xa3\x0d\xe3\x1f\x0d\x01\x08\xa4\x82&P\x04\x9bR\x94\
-\x10\x06'|\xd9\x02mZ\x9f\x9cX\xb9\xf3\x0b\x9f\xdb\
-\xff\xbf\xfd\x87g\xbf\xf8\xca\xfe\xf1\xb1\x1d\x9d\xec\xc1\x9b\
-=;N6(\x18\x93\x81q\xab`G<\x5cdq\
-\xe2\xd2\xf2\xb13\xfbng\xdd@\xb6[\xb8\xc0)5\
-l2V\xb2\x0a@)\xd9\xc5\x1e\x18\x9dW\x80\xde}\
-n\x0d\xc5\xe4\x99@\xd8Z\x1cE\x932bi\xea(\
-\x18\xc6\x9c\x0ar?\x94a4Dj\x81\xab\xab\xe53\
-\xb7\xef5\xff\xedO\xde\xfa\xef\x7f\x11\x9b\x82\xa6!\x01\
-)HJ\x90\xa6\xeb\x84\xb1\xa6\xdb\x13\x10jL\x17i\
-\xa0\xc4\x9a\x01\xc53\xf6\x1aC\x98\x020\x22\xa8Z\xad\
-\x0af\xb4\x8d%&\x22\x12B\x0f1\x5c\xbd\x03\xdb\x99\
-\x80\xb3\x01\xeb\x82\xa1\xb6\xdb\x0bp+\xc5\x19AB\xe6\
-\x0e\xc5;\xfb<gfff>\xc6\xcc\x02\xd0\xcc\xcc\
-\xcc\xcc\xccG\x97\x00\xda\xa4=\x8b\x8e\xb1\x06\x06\x04\x10\
-\xfb(\x0e380\x08a\x96[K\x0emP\xa4#\
-h<B\xdcR{R\x9a\xb7D\xa7\xee\xaf\x06\xd8\x0e\
-\xb2.\x10\x80\x00\x85\x16\x83\xae\x19\xc3x\x98\xcd\x85\xac\
-\x024\xc3q\xceGw\x0f\xcd\xfb\xceB\xd6\x13\x0d\xe0\
-\x067\x08\x01\x17\xac,\xba\xfe\xe9\x06oG\xb9g!\
-8\x81\x15\xd1\xd2\xf7\x8c+*\x08\xe36\xd6$\xe8\xa4\
-\x03NC\xb24\x8cm \xe7E\x8aa\x5c\xf7\xebd\
-%\x93\xaf\xfeP\x7f\xf1\x15\xfd\xe6'o\xbc\xfc\xf2\x0d\
-\xe8\x07~t\x0b\xe6\xa9\x859\x1a\xc0\xc6\xc9\xa7\x95\x08\
-ph\xb0nUZD\xc3\x92lc\x04\x90\x01\x09\x85\
-t\x11\xc1\x08d!\x84\xc2F\xb9\xc3\x9dC\xfc\xe1\x97\
-n\xad\xf2\x8f\xfe/\xbf\xf7\xb9W>\xf1\x8a\xdfS\x7f\
-\xef'\x86\x93&\x81^\x03j\x0a\xb0^\xe4\xb61\x0e\
-\x1e\x9b{?h\xaf}\xbb]Er\x1a\x992\x10\x8a\
-\x11\x1ae2\x8d\x8cA\xde\x07\x0b\x16L\xb9\xe9\xc0\x16\
-\x85\x18\x93\xbb\x8b@\x1aK\x89\x8d\x87\xed/\xf6\xae\xdd\
-\xe8\xf5\xf4[w\x96\x7f\xf5\xb7\xc7\xff\xfd\xcfn\xfe\xc3\
-[8\xa1R3x(Pr\xf2<\x86\x8b\xc9\xb0\x0c\
-u^\xda\x12*\xc85\x9bX\x05:\x22\xd7@\x9f1\
-$\xca\x08\x03\x0d%\x85{\x18i\xa6l\xd1\xb6=:\
-\x1d7c\x97\xc7.y67\xd4z@\x02Af\x9a\
-\xe7\xecM*h<E\xd9\xd3xE\xda\xd0\x8a\x18[\
-\xe3CA\xed\xfe\x16\x04\xd0\xb4M\xb7\xca\xeb\xe3\xf1\xaf\
-\xbe\xfe\xc6/\x7f\xea\xea\xcb\xbf\xfb\x89n\xefF\xdc\xbb\
-\x95\x04\xcbhL\x8cbc\x9e\x8c3#\x10di\xcd\
-\x17\x8c\x06LD\x86/\x84p@,\x81\x15\xb0\x97\x22\
-\x1b\xeee\x0e\x86d\x91\xacf\xef\xb8P60\xa6\x8c\
-\x94P\xdc\x8b\x90|\x8d8\x10z\xf8Z\xe5x\xb4c\
-4\xe5\xb2\xd1\xb5jK\xa6\xfb!\x10\x1c\xf6r\xb9\x8d\
-\xde\xd7\x9b\x9b\xeei\x93V\x9bciXg-:\xcb\
-T\xa3\x08X\x02\xb2\xc0\x80\x91\x8c\xe4\x94_V\x1b\xf5\
-3\x83\x81\x044\x8eAH\x82\x05\x0c\x001$\x0ed\
-$\x8d(\x87]>~\xf9\xf9\xf6\x9f\xfe\xda\xb3\xff\xe4\
-\xf3{\x87\x078\xe9\xaf6*O\xe1u\xd3-D\x9a\
-\xa2rvG)\x02\xe0\xc3j\xc0\xdee\xd2\xd1\xd9%\
-\xec~>'\xdf\x9c\xd1\x91\x8cSA\xeb\x83\x9cK+\
-\xbaPz\xbaX8\x02\x12\xc6}\x04\x91\xd6\xe0\x00&\
- \xc3\x03\x1a!!\x0a\x1a\x87m0\xdeCJN\x22\
-w\xe9\xe9\xc3\xc3W\xc7\x1f~\xfb\xce\x1f0\x0aR6\
-\xd1`\xb0\xa23+\x91\x14\xdc\xaa\xef\x9cz\xe7AU\
-\x13\xd4\xa9\xbbizC-\xa6\xac\x19A5\xa7\x9b`\
-\xcehZ\x98A\x11\xd4\xfb\x11cx\xc9\xeeoW\xbd\
-\xabP\xc4\xd4\x07\xb2x\x14W\xe8\xd2\x8a\xbb\x99\x99\x99\
-\x99\x8f=\xb3\x0043333\xf3\xd1\x85\xa0\xc0\x02\
-3\xd8\x08\x8c2\x08Q\x83y@@#b\x0d\x11\x18\
-\x91\x04\x83\x04g\x0f\xdcS)PM\xdc\xbd\x7f\x08A\
-\x92\xb4\x0b\x07\x815\x9c\xb9\xc5\x06\x08\xa2\x10\x02F\x81\
-Ddz\xa2\x1b\x94P\xd5\x1d\x17\x0a\xab0\x00\x09\x09\
-tK\x07\xc0\x06\x10\xa6<\xe3Q\x06X\x07:0n\
-'\xa6]\xac[f\x81$&E.#\x03\xb1\xbc\x22\
-d;\xb9\xd77YO\xdd\xb8\x1a\xf7\xfa\xaf\xff\xd5\xc9\
-\x9f\x7f\xf6\xf6\xe7\x9e{y\xd9>U\xe2\xb65S*\
-\xf5rI\x0f\xc4\xa0\x04L\x83b\xb0N\xcd'D\x82\
-W\x03R\x10\xe0iKoA`\x81\xb2\xb8g\x0b/\
-\x9b\xf1G\xaf\xf7\xff\xe5\x0f\xbfO\xbb\xf7{\xbf\xfb\x99\
-\xcf\x7f\xea\xe5e\xb7\xe7Go\x0e\x9b{\xc6!\xa5\x90\
-\xd5\xdej\x9e\xc0\xd6b\xc8\xc5\x07+}\xaam\xbbh\
-D\x08\x0eA\x894\x00\x01\x93\xb1i\x122\x1c\xbe\xe9\
-#\x94\x9ae\xb3Z\x8e\x9b\xa1\x94\x06\xa9Cciq\
-\xe3hX\xfe\xf0\xb5\xf5_|\xeb\xb5\xff\xf4\x07\xb7\xfe\
-\xf2\xdb\x1b\xb7\xdc\xac\x16A\x1f#Ho\x98\xe4\xca\xc5\
-2S\x13l\x91\x80\x94`D\xc0\xea^\xa9z\x00\xce\
-DI\xd5\xdd\x15\x91\xa8$\x95\xac1sLp\x93\x13\
-\x05(\xa7~\x19\xd6P\xdb\x12\x18\xb6\x96 %\xf5\xd4\
-\xc6U\x02\x84\xac\xca0\xdb\xe0Y\x81&\x99\x87u\x8b\
-%\x85\xef\xffd\xfc\xc3/\xfd\xc3o|\xe1\xa9\x1b\x9f\
-{vs|\xb3_\xdfn\xacX\x12Y`#\xa0i\
-]\x06XUQF`PMT\x81h\x05tV\xa5\
-\xc7|{b$\xa1\x11\xfa\xed\x99_G\xb5DFr\
-h\x84\xdc\x11k\x22\xa0\x01,F*\xf2\xe5\xe3\x5c\x09\
-\xe9\xc1GM\xa2\xc9\xf2F\xac\xd1\xe0\x08\x8e\x0a\x01%\
-%\xb4)mw\xfb\xcc\x17\xa2:\xe6\xa6\x88\xae\x0f\x16\
-n\x9b\xbfMg8Q\x93\xd3I\x85k\xe83\xa2K\
-X%\xefp\x82u\x89\xa3\x92\xa3\xef\x0c\xa6\x1e\xa1\xc9\
-\x00(\x9c\x13\x80\xc8\x87I<\xc4\xc3\xe4\xa1\x09\x9dn\
-\xd2\xe9\xcf\xbbK\x0d\xa7Z\xd2\xd3+\xcfC%\xa7\xd3\
-]=_?6\xad\xea\xc2\xcek\x82\x04\xdf@\x84\x06\
-\xd0\xa7\xaf\xb9\xa3f\xc5#\x0aT\xc0\x0dBHD\x8c\
-1\xf6\xc9\xc7as\xbc9>\x04\xcc\xee\xaf\xe7\x93\x04\
-\xf2\xac\x02u.\xe5\x08\xb03\x0f<\xb8I:\xddx\
-!\x19\x16-\xcc\xa4\x22\xa8^!\x1f\x87\x1esA\x80\
-\xf7N!\x9a\xa2\xf7\xdc9\x96\x0f\xfe4\x9d\x99\x99\x99\
-\xf9\x101\x0b@33333\x1f](8\xd2\x09\
-\xac\x8f\xb4\x11\x0f\x95R\xa4\xb1\x18\x0bd\x04\x9b\x11v\
-\x04\x8cp\x07\x00\x835`\xb3\x86\x0f\xf0\x05\xcb\xde\xae\
--\xf8\xfd\x8b\xbdx\x0cXc\xa7\xc7\xc8\xc70Y\x04\
-|;\xb3l\xfd\x22\x0f\x8bf\xccDR@\xc7\x8e$\
-x\xc2\x08\xb8`\xd0\x92\xe9\x10\xcd\xdb\xd0\x1d\xb2l\x8b\
-$F\x1a\x94\x15\xdaC:\x04\x9d\x02\xd2\x10\x1a\xa5\x04\
-\x1a\xd0\x05\xe0\xa5#\x16)k\x13\xf7\x98\x98\xf6rx\
-\xabf/w\xfe\xe37o\xfd\x7f\xff\xf3\xc1\xa7\x9ey\
-\xfe_\xfc\xc6\xb3\xcd\x8d\xb78\xde\xa9\xc1,LJ\xeb\
-\xed\xf0\xf641\xa9@\x91\xe4)\x8e\xc5 \x9aD\x08\
-\xbd\xe8\x9e\x22H\xa1(6@7\xe8\xc6]\x7f\xcal\
-c\xcb[\xdf{\xeb\xf6\xff\xfb?\xbf\xf5\xc6M\xfe_\
-\x7f\xefW\x7f\xfd\x17>\xb7w\xf5\x85\xd4\xdd\xf1\x937\
-K9hTZ\x8c\x88\x1e\x1e\xa9\xd1\x22g\x0c\xcfF\
-\x7f\x05\xd1#\xc6mW\xe9\x82\x14\xc8\xc6\x08x1\x03\
-\x9a\x04\x98\xc2\xc7\xd2\xbb\xd4ee\xa3\xa5U\xee\x9e\xc3\
-\xe2\xe9\x18\xbb\x9f\xbe\xd5}\xf9[7\xbf\xf4\xf5;\xdf\
-\xfa\xd1\xcd\xef\xbc\xba\xb9W\xf2\xf5g\xae\xa5\xd5\xa2\x0c\
-c\xe9\x87\x96\xa9\x93\xc9M\xfd\xaau-7c'C\
-\xe4<\xee\x06\x9e\x01\x0b\xd4\xca\x95\xed\xe0\x92\x00\xaa\x1e\
-\xe7-\xd1\xa4\x18Z\x9d\xb4:L\x88dk\xe3!\xec\
-\x04\xa9L\xaf\x16\x14\x12O\xc4\x03\xa2K(\x09\xde\xf8\
-m\x94\xd2\xa7El[\xbfA\x03\xb6\xbd\xba`\xad\xc4\
-\xa1\x90\xbe\xd7\xa6|<\xdc\xfe\xda\xb76\x7f\xf4\xb5[\
-\xcf>\xfb\xb9\xfd\xeb\xbf46\xdfWym\x05'\x1d\
-y\x0d\x12\x14\x1b \x07\x9a\x1e\x192\x15\xeb#\x02X\
-*\x19\xb3H\x10&By\x9dPR\x90ZB\xab\xd0\
-`\xe8\xc1\x04f@(B\x80@&\x22\xc2\xfc\x04\xb1\
-\x06\x0bSd4(\xddt@.\xfa\xee\x5c\xe4\x9e0\
-@\xc2\x86v@S\x9b\xa0\xc6\x94\xbc\xa3\xd3\xfb(\x09\
-\xecSnr\xaazj\xaeq\xcb5\x17\x99\x08\xf0\xb2\
-D\xf9\x9f\x15A\xc2\xe0f\x0e\xab\x9a\x1f\x80$%\x85\
-\x22\x1a+9q_\xb9\x1b\x0f\xd3\xf11\x0eJw\x12\
-\x0bX\xa2\x85\x9bE\x1b[\xf5\x84\xdbvT\x08H\x97\
-\xf7\x08\xab^\x97Kv\xf1\xac\xe7gj\xb1\x05\x00\xbc\
-hi\xda\xfd3\xfdz\xa9(1\xc9QB\xec^\xaf\
-)e\xf9\xfc2\xcea\x94\x9b\x0eA\x88\x93\xc4\x22\x00\
-\xea-\x1aS\x82\xc28H\xc5;Z\x13>l\x86\xd2\
-4\x8b\xe3\xb2\xde\xa0\x0cb\x03\xab\xf2m\xda\xf6z\x8b\
-\xc9\x7f\xb4\xd5\xdb\xce\x0b-i{:\xc5\xa5[\xa4\x02\
-ojh\xb4\x19\xba\x0e\xc6\x80\x07T\x1e1\x01z\xda\
-\xa7\xcb\xdf;\xf9\x94&\x01H\x04\xd0\x8cc;\x945\
-\xde\x97\xedhfff\xe6\xa3\xcd,\x00\xcd\xcc\xcc\xcc\
-\xcc|t!!W!\x02\x18\xc2\xc6Z\x06\x12J^\
-\x1b{7\x19\xa9\xc1X\xea0\x80u\xb6?\x80\xd1\xe5\
-=l\x1fL\x17\x97z\xe9\xc2(\x90\x00\x00s\xa9@\
-P\x80B\x00\x1e\xcc\x0dC\x9a\xea5\x02\x08\x87\xbc\xfe\
-4\xf9\x89\x90T%\x03\x94\xda\x98I\x06FmI\xad\
-\x90\xa6T\x8di\x1czZ\x1c\x22\x99\x8b]\xbbD\xe3\
-w\xd6o\xe7.]\xbb\xf2\x5c\xbf\xc6\xc1\xd1p\xcd[\
-\xe1\xca7\x7fp\xeb\x0f\xbe\xf4w\x9f\xff\xec+\x9f\xf8\
-\xf43~p\xd4o\xc6\xdc2\x06Z\xc0\x12\xe5\x11\xa2\
-\xd0:,\x02\x12#\xc0(\xa0\xd3\xd24\x84d\x00\xa9\
-V\x9b\xd0$\x0f\x97)\xba6Y\xd7\xae\xd1\x9c\xbc}\
-\xd0\xff\x8f/\xbd}t\xf7\xcf~\xf4[W~\xfd\xf3\
-\xcf\x7f\xf6\x85\xab\xab\xbdgU:\x96#\x95Ci\xb0\
-\x0c\x00~\x18\xf2\x92\xe4PP\xc1\xa9\xa7z \x02\xa3\
- \xc7X`\x8c\xe2\xc8\x0drn\xae,Z\x99Y\x80\
-\xa9\xd9\xbb6\x94\xc5\x1bo\x1c\xfd\xfdO\xdf\xf8\xfaw\
-\x8f\xfe\xf8\xeb\x07\xdf\xf8\xfe\xfa\x08\xb1|\xfaZ\xdb,\
-\x8aT\x80>\x8a\xe0\x1d\xcc 1\xb5H\xc9\xd7\x0a\x14\
-\x07Jr\xcf\x8c\xb1\xb6\x81\xa7\x12\x94BYP\xc0C\
-\x00d\xb5\x83\xd1\xe4\x09\xe2\xf6T\x90\x10558\x8c\
-\xac\x8e\x9e\xa8&.\x8bm/i\x02\x16E\x1a\xa1\x86\
-h\xa7\x1e\xee\x93\xfa\xe1@\x92$P\xb0\xde\x0dJ\xed\
-\xa29\xdc\x8c\x7f\xf0\xe5\xef\x7f\xe6S\xed?\xfb\xad\x17\
-\xd2\xdeS\xc3\xc1\xad\xec'-\x88\x98\x94\x8a\xda.)\
-\x82c (X\x81\x02,\xd5\x14DP\xf0\xc0H\x15\
-\xb1\xe6\x1de!\x07\x1a\x22\x07\x13S\x02BN\x10H\
-@\x03\x0b\xa2'B\xa1\x91\x11\x08\x83|;z\xbf\xe4\
-\xdbs\xc1\x19N\x97\x02\x05\xe2H \xa4L\xd0\x08f\
-\x90f\x82j\x8bu\xc9 \x02\x16\x84\xc1\xf1\xd8\x8c\x1c\
-\xef\x89\xed\x97\x85;\xc5\x85$)*$9\xdc\xbcW\
-9\x1e\xd4\x8b\xc02\x13\x14\x8a\x83\x0d\x92Y\x08\xa7\xdf\
-\xbb\xadK\xe7\xe19;|w\x915\xbb2\xa9\xd3\xed\
-\xdc>x\xd6\xf8s\xe6\x0d\x97\xee\xe0\xae$\xf5\xbc\x94\
-\xf4p\xbf\x15!\xca'\xcb\xe2.!G e\xa1*\
-t\x11\xc8YH2\x1a\xe1\x88\xa15-\xba\x96\x0c!\
- n\x0dnu\xdb)i\xca\x82\xde\x09\xab;M\x8a\
-\xba<=\x9b\x80\x14B\x04\x05!\x92\xa1\xedr2*\
-\x0a\x22x\x81\x11\xed]Q\x8be\xa7\xa2\xd9\xed\x0e\x9e\
-\xee\xaab\xaa\x01\x13\x00\xd1,\x90Fg)\x08<\xd4\
-\xe45333\xf3\xb1f\x16\x80fffff>\
-\xc2\x08r\xebad\x1a\x8ba\xb4\xc6\xf35\xef\x96\x85\
-}\xf1#\x8e+z\x9b\xd3\xc8\xd4[3\xb2\x19\x80\xd0\
-\xb8\x0cv\x8e5\x9a#0\xa0\x07\xc6\x1fD\xe2\xb9(\
-\xd3\xd3\xb5!\x84\xa5\xe3Y\x05M\xa3)\x00z\xb4\xe8\
-\x9e\xd3\xe2%\xe5\xb7F\xfd\xc45R\x16a\x10`\x19\
-\xa2`L\x8d\x9a\xa7\xcbb?\x85\x8d\xb66\x12\xb9a\
-\xd9s&\xb6{\xa1\x1b\xca\x16|\xdb\xcd\x9b]\xac0\
-D\x19#7\xb4LW\x94,\x85GH0\xebG;\
-\x89\xd5\xaa[\xdd\xeb\xef\xfd\xc5\xf7n\xfe\xd9?\xdc\xf8\
-w/\xbd\xb0\xd8\xb3\x0d\xdeJ\xd6 \xae\x02\xb9M\x85\
-\x11C\x04\x96\xcf\x95\xf6\xc5ho9_sl\xc0\xc6\
-\xccD\x13$\xb2\xf6\x0c\x02\xcc\xc0\xa4\x08\xb9 v)\
-\xd8\x1e\xc7b\xd1=\xd5v\xc3\xcd\xbbw\xff\xd3\x97\x0f\
-\xbe\xfb\xe3\x83\x7f\xf6\xeb\xb7\xfe\xe9\x17>\xf3\xeb\x9f\xff\
-\xc4\xcb\x9f\xf8D\xcb\xf5\xfa\xf0\xad(\xb7\x97\xedh\xf2\
-\xe2\x9b\xe0a\xb1\x03R\x860!i\xdbU=\x043\
-\xac2d\xa5\xb0\x87\xaci\xda\xbdkl\xba\xf5\xb89\
-\xd9\xf0\xe0\xee\xea\xef\xbes\xf8g\x7f\xfd\xea\xb7\xbf{\
-\xf7\x07o\xe1\xce\x88\xa1\xb9\x9e\xba\x95u\x8b\x02\xef\x87\
-\xa31J\x196\x1d)h,\xc5\xd4$k\x80\xbc\x91\
-\x1d\xe7\x1b\xd1\xb4'\xa5$\x0dm)\x90\x85\xae\x14\xcb\
-\xde\x0e\xc8cpt\xdd-\xba\x1bT67l\xac$\
-`t\xeb-\xab\xc0J\xb3\xf0\xeei\xefN\xc6\x18S\
-\x14\x02!\x0e\x9e\xb4Xa\xf1\x94\xba\xc1\xedv\x01r\
-\x0e\xe4^h\xa1\x05D\xd6\x8a3\x06(!\xc4\x12h\
---\xc5v(y\xb9H\x18\x8e\xbe\xf5\x83\xa3\xff\xf6\
-\x95\x9f\x5c\x7f\xe9\xd9O\xbf\xfc\xc9\xdc\x8di|\x83L\
-R&\x93\xc0\x11\x81\x9c-7\xde*\xda\x01Mo,\
-\xb2b\xb4Zs\x06\x14A\x85\xeb\xb1\x89~a\xb1h\
-b\xb9\x1aQ\x8a@\xefr,\xa5\x18\xd5\x056ja\
--\x12[\xb6K\x15 \x98\xcce\x94\x95\x87}y.\
-\x16\x80\xa4\xb8\x0a\xff\xd4\xa8\xb2\xe1\x1d\xb2+x\xa1\xc7\
-\xf1\xa0\xec\x0c4\x8e<\x10\x0e\x94\xe9\x9cQ\xad0\xf4\
-\xa9\x0e\xe8\x83\xa3\x16V\x0d\xa0\x93=1\x18\x0cZ\x22\
-\xb2b\x11\xde\xa4d\xabf9DQy+\xf9~g\
-+\xf8Q\xf4A\xec\xb1\x0c\xe3\xf20:\xc1\xa5\x1a\x07\
-\xc3\xea\x94\xab=\xd9\x1f\x96\x10\xa3\xe9\x84\xbe\xe8\xa93\
-\x82\xcc\x85\x11@;S\xca}/\xc6\xd6\x82t\xf1\x0a\
-\xb7/\xd1\xfd\x19@\xc2\xe5\x06\x18\x86QK@b\x09\
-+\x82A\x09Z0\xba$C\x8crc\x1a\xadUq\
-\xad\xd1\x94v\xd5\xda\xe2\xc44\xb6K\xe9X\xee\x82\x09\
-\x11J$A\x93D$\xd2\xa8II\xa7\xe0\x88\xc9_\
-X\x95Fn%\xe5\xedF\x00a\xaa\xce*\x00a\x90\
-\x19rF\xdb4\x0d\xc9\x18\xc9\x80\xf1\xdd\xb67\xbb\x7f\
-'5\xe5\x8eo\x13\x94Xk+\xa7\xfa\xdd\x00X\x85\
-w\x10\x01s5^r\xf1T\x03\xd8ffff\x9e\
-Lf\x01hffff\xe6#\x8d\x80\x22J\x1c\x1d\
-\xf0li\xb9\xd7\xec_K8&[+{)\x16\xc6\
-\x11i\x8d\xb4\x86\xdd\x05\x8b\xf9\x15[>\x9d\xed\x00\xf9\
-xj\xe3\xf5 \x17we\xae\x09-\x8b\xec\xcf#\x12\
-T\x8b\xac,\x97\x05\x16/`\xf9\x9cu}\xc0\xc2\x91\
-\xa6`\x98\xad\xed\x08\x94\xb5\xcd\xe2Jwe\xb48j\
-\x0bI\xa0,\xe1\xd7\x13[\xec/;\x5c\xb3v]c\
-\x9f\xb7C\xbe:J$\x90\xda\xd4\x96\xb18\xfa\xfd+\
-\xfb\xbd\x86\xbbwnZ\xba\xba\xd8{\x1e\xc3\x9eGo\
-\xb8\xfe\xe3\x9b\xfd\x7f\xfb\xeak/\xbe\xbc\xfa\xcd/>\
-\xdd\xa6\xb1\xf4\xb6w\xe53\xde'+\xc7)\x05\xc2\xe3\
-\xcasm\xf3\x5c\xb7\x17\xa9ij\xd3\x1e\x1ac\xd7C\
-g\x0b\x01\xab\xf5/\x96\x0a\x9a\x11n\xec\xa8\x08\x86\x16\
-9\xe4?|\x0bw\xfeh\xfd\xcdo\xfe\xe8\x9f|a\
-\xfd[\xbfy\xfd\xf3\x9f^\xdd\xb8\xb2we\x95S\xee\
-\x91\xc6\xc5\xfe1\x86M\xd1@@U\x1b\xd95\xd5\x0a\
-\xc0\x02\x9d\xa3]\xb4X$\xcf#\xf2\x89\x86[\xb7\x8e\
-\x7f\xfa\xfa\xe6\xc7?\xc5\xb7\xff\xe6\xee\xdf~\xfb\xe4\x8d\
-[\x87G\x1b\x1c8\xb4\xba\x96\xf7\xaeo\x22\x9d\x9c$\
-\xb4Rj\x8aF&\xb5)g\x99\xf7\x8e\xa2\x1c&\x98\
-\xe5\xae\xbb\xfa\xac]]\xb5yH\xc3\x98K\x01\x0c\xb8\
-\xca\xd2\xa2;\xd6b\x93\xda\x1e6@\x07\xdb\x18\xa0\x98\
-\xa2\x898\x06!\xc0\xda\xa6Y]iVOe;I\
-\x1a\x00%YD\xa3\xf6\x8a]\xbd\xde\xee\xddc&\x08\
-&\xd1\x06\xaa\xf6>\xb73\xa7\xc4\xd4\xfa\x08\x80\x90\x99\
-\x97B3\x16\x22\x0d\x87\x1b|\xedo\x0e^\xf9\xfc\xed\
-g_\xfa\xfcK7^\xee\xd6%\x0bBG\xb6\x001\
-:r\x93\xafvK\x0e\xcd\xf2\xae\xa5\xdbP\xd0\x86Z\
-PS\x0deN\x12\xbd'D\x1by\x95\x9b\xbd\x95\xa5\
-\x91\xa6\xc6\x1bxG\xa9\xcbWA\x0f\xf4\xcc\xa4\xb5\xd0\
-\x02\x05\x08!\x05\x92\xc3\xfc=\x7f\x9f(\x8cK\x8c\xcf\
-\xa7\x18\xc2,]]\x96\xfc\x5c\xd3\xdd\x06\xadhd\x0c\
-\x06\x03\xfd\x8c\xab\x88\xf7\xbbA>P\xaa\xfb\xcf\xcf\xb4\
-\xf3#\xa2\x05\x022\xc6\x92\xbe\xa1\xb8\xcc{\x8b\xe6\x1a\
-|\xd4\xc9\x86\xd6)\xa5\x92\xeey\x0e\xd8\xd4W\xab~\
-]AD\xc0\x0c\x97\xb4\xe4\x02\x00\x7f@\x86\xd9\xa1s\
-_\xa63\xb1\xceg$\x9c\xd3\x17\x9f\x7f\xefC\xf4\x08\
-\xb3\xd3\xb3-.\xf1r=\x08\x15P\x86 \x96\xaaE\
-C\x86\xc8\xb46D:\x04\xcf\xadE\xf6\x93u\xbfv\
-\xe4\xbd\xd5h\xed\x1a\xa5X\xc2dz\xd3vK\xa7\x10\
-#\x81\xb5#\x18t\xbf\x85f2\xc0]\xcc\x94\xb1D\
-\xc2\xc8\x00\x92q\x91R\x22\xad\x96/\xd2p\xa6\xc0\xed\
-\xbd\xb1-\xdd\xbb\xfc\xd9\xdd\xcf\x14\xcd\xc3\xe2\xa1uc\
-3333\x1f{f\x01hffff\xe6\xa3J\
-\xad~QI\xa5\x84\x86\xb4\xc8\xf9h\xb3\xffW\xdf:\
-\x1e\xd6\xb1l\xd7\x18K\x0a\xb7p!\xc2\x04\xd5\xd8\x15\
-\x9a\x92\x09\xb0\x05\xec\xd9\xcb\x04 \x9d\xa9\xbc\xb8\xef\x19\
-\xa1s\xadij\xe4uAep\xe7\x9b\xa5\x1d\xbf\xf9\
-\xfd\xc3#o\xbcIL\x0b \x83\x16tZ4\x8b\xb4\
-\xde\xac\xbf\xf1\x9d\xfe\xb9\xd5\xb3\xadR\xd1\x1dC\xe1\xb8\
-\xa0\xefyv^\xd9\x1c\x8c\xfa\xd6w\x87\xb1\xec/\xda\
-5\x05E@\x03\x05j \x0bX{0{\xb66\x9c\
-'emP\xd3IZ\xf7e\x93\xf6\xe2\xe6\xa0\xaf~\
-\xfb\xde\xb5\x17~|s\xf3B\x8b\xbc>\xda,\xbb\xbb\
-\xa6\x0e\xe58\xa5MX\xf2\x85\xdd\x1b\x8f\xbf\xfd\x0fw\
-\xef\xace\xdd\x9ecO\xb2`\x0d\xf8H\x98Bm`\
-\x00a\x069\x8f\xc6\xd8\x08CN\xee\xd1\x972tM\
-\xb3\xb72_\xeb\xe6A\xdc:8\xfe\xd1\xeb?\xf8\xf3\
-\xbf\xc5/\xbe\xb2\xf8\x85O]\xff\xe4'V\xcf\x5c\xef\
-\x9e\xbe\xbe\xb8~m\xd9\xad\xaeX\xee\x13,Y\xce\xb4\
-\x90Y\x08E\xeeV\x02e\xcd\xcda:X\xdb\xcd{\
-\xe3\xdbw\x8e_}\xfb\xce\xf7\x7fr\xf7\xc7\xaf\x8eo\
-\xbc\x8d\xd7_O'cZ\xb4\xdd\xe2\x1a\x17\xb4\x9e\x8d\
-\xa3\x8f\x08\xd0\xda\x90R\x84d\xa9I\xd6(R\x98)\
-\x85\xab\xe4\xae9h\x16_\xfe\xde\xcd\x9b!\xc4m+\
-\x91\x86\x80'(\x03\x8aE\xdf/\xee\xfc\xe0\xd5\xf1\xd6\
-\xbd\xfd\xd4>C\xbb\x17\x18\xc5\x1e)\xd3\xa3p\xb5v\
-\x17\xec\x87o\xf2+\xdf8\xfc\xe9k\x87\xdc\x8c6D\
-JI\xd6\x0e\xd1\x94\x84X\x1c}\xe7\x87\xc7\x07\xe5)\
-.\x9aM\x8c*\x16\x96\xb6cN\xde?l\x17\x5c\xc8\
-H\xb9\xb1\x90o\xa2I)\xbfv\xab|\xf9/\xbf\xb7\
-\xba\xea\xaf<\xb3\x97\x8e\xf7X\x04\xd0\x08\xc1F'\xb3\
-xe}gS~\xfcZ3\xc4\xd3d\x1b!\xc8\x92\
-rb\x0aI*,\xfbP\xbaw\xb8\xf7\xf5o\xec\x0f\
-#\x17Z\xe6\xd1\x9a!\xd3;\xd0r\x17am\xf1\xc1\
-)ZC\xed#(-iE\x94\xf40\x01\xe8\xe2l\
-\x1a\x22i\x95|(:\x19\xda>]A\xefo~\xf3\
-\xfb\xc7\xc7\x5c\xda*<\xbb\xec\x18\xac\xa5j\x02\x0c2\
-B\x84m\x93\xb3?Pk\x85\x01\x09^P\xec4r\
-\x19\x22\x04+b_\xca\xe8e\x05\x0cT\x01ai0\
-$\x8eM\x93\x9a\xb2\xb2\x93\xbe\xd6$Q\xb0d5\xb6\
-'\x22X\xdb\x9a_\xbe\xc6K\xdd*\xf7)\x0bgE\
-\xc2\x0a/\x88)\x9e^rq\x963\xaa\x11\x91\xa7\xbf\
-\xbd\x1b\xac\x1e\x03\xd3\x00\x93X\xe3\xbd$\x8c\x88\x0dE\
-\x0b\xa6\x18\x81\x91.\xc0\x9b\x08 \x9a\x18\xbb\x18\xba\x18\
-\x1b\xf7\xed\x81\xdc\xe9>\xefe\xe5\x97\xecF6@\x88\
-\x08\xc2\xdb\xcc\x9c\xb9m%\xf8\xb8\xb8o\xf3\x84\xa9\xa5\
-\x9f\xea\x99A&\xc3b\xf4\xc65\xd5\x0b\xce\xcc\xcc\xcc\
-<\x99\xcc\x02\xd0\xcc\xcc\xcc\xcc\xccG\x8c]\xb9\x04!\
- \xd3\x17\xc3(\x1f\x87\xd6\xd2\xebo\xe3\xff\xf7\xbf\xff\
-\xf0O\x97\xb1l#\x88(\x07\xf0\xe4\x94\xac\xda4\x0a\
-\x10\xf4\xbb\xd4\xf1\x99a\xd9\x05e2\x97\x8c\xc7\x08P\
-<t\xbbi9\x16\xa0\x19\x05z\x89aP\x8ff\xed\
-\xcd[\xc7\xc0\xe2j`\x01f \xaa_ u\xf9d\
-\xbd\xfe\xfd?~\xe3\x9b_\xcf\x0byp0\x14\x16\xb7\
-8\x89<z\xbb9t\xbcys)\xbb\xbe\xec\xba!\
-N\xc2I\x0d\x06%\x8efc\xc4\x98S\x12l<\xe9\
-\x85\xbcZ^\x13\xda\xbe?\x84\x12\x97\x0aI=_[\
-\xe3\xbf|\xf5\xee_\x7f?Z\xb3\xfe\xee\x1aq{\xb5\
-\x5cy\x0ccl\xda\xb6UNw{\xbfs4\xdc;\
-!\xbak\x11W\xc0\x90(8\xd0\x10\x03d\x94\x08\x22\
-L\xf2b\x870\x9a\x85#d\x02\xf3\xa0\x1c\x1e\x96#\
-?EF\xb9}x|\xf3\x07\xfe\xb7?\xda<u\xe5\
-\x8d\xe7\xae\xa7\x17\x9f\xbd\xf2\xfc\xb3\xd7\x9fyf\xf5\xcc\
-\xf3\xcdj\xefJ\x9bS\xd7v\x8b\x9cL\xa6\x82q#\
-\x1f\xd9\x0f\xb8{\xe4\xb7\x0e\xfa7on\xde\xbcs\xf4\
-\xe6\x9d\xa3\xd7o\xafo\xdeA\xaf\x8e\xccy/\xe7\xfd\
-\xb46n\x92\xd5\x8fD\x18\x9b\xec\xed\xd4.I\x09A\
-Z8\xfb@\xca\x99\x96\x90@k\xff\xee\xed\xcdk\xff\
-\xf1\xaf\xae^\x1d\xf6\x17\xc8N\xad\x15\x03\xe9\x8b&/\
-\xdb}\x1f\xf2\xc1\xdb\xb7\xf5\xf6\x9b/9\xae\xc96\x81\
-\x81\xa97\x1a\xd9\x81\xd7z\xcb^\xca\xd7\xff\xee\xe8\xe6\
-\xdd\xbf\xbb\xb6w\x1bG\x9b\xf1X9e\xa6\x5c\x98<\
-\xd9\x86\xfd\xc1z\xbcs\xef\xe9\xc8Wz\x1d\x13\xd1\xb0\
-\xa9q($\x04S\x18\xe8Bh:=r\x09\x22\xd1\
-\xf2J!\xc7q\xc9G\xdf\xfe\xfe\xbd\x9b\xf7\xbey\xb5\
-\xb9\xce\xe3%\x0b\xaa\xcd+@\x81dx7\x0c\xe4[\
-\xaf=3\xf8\xf3\xcc\xfb1\x1e\x91fi\x91\xcc\x02#\
-\xa3\x87Z\xc5\xb3o\xbc\xd9\xfe\xc7\xff\xf4\xf6\x1f\xfe\xc9\
-\xdd\x05sv\xb1\x90~\x22\xc8\xf2(\x86\x087\x04\x8a\
-t\x08P\xf4`\x98\xb0mk\x7f\xa1\x9cqY\xd8\x0d\
-3\x0e\x88\xbb\xa3\xd6\xea6y\xc9\xbe\xbcq\xfb\xc0o\
-\xdf\xcb\xde\xad\x8a9\xd2\x06\x08\xab\xe2\x80\x12e\x94\x0c\
-\x09d0>\xe0p\xdd$e\x8dI\xc5j\xde\x16\x82\
-`\x90\x04\x02m\xa4E\xe4\x88b\x1b\xc7P\x12\xf2R\
-\xb9\x14\x8fF9\x0f\xfb\x16m\x89P\xc8\x88\x94\x1b3\
-\x8b\x88\x88\xe0\xc3\x0a\xb2\x00<\xbajq\xf6}<\xff\
-\xf8e\xc1C\x97\xa4\xd1?\x9c\xea\xb6\xe9\xcd\x0e\x91 \
-\x22\xb6\x9d\xd8\xa1\x0d%\x0bZ8\x18\x90\xc3\xb4\x9fP\
-\x00\x8d\x9b4\xaeW\x11)\x06)BI\x10iDM\
-\xbd\xae\x95o\x944\x1d\x1fa:\x85\x01\x10V5\xa6\
-3\x81\xf3\xbb=\xae%c\xc9\x0c\xa2\xc23|\xb9`\
-\xca&U\x01H\xf0G\x94\x0di\x08\x03\x83\x90\xd5\xfc\
-5m\xeb\xe2$\xd5\xe5\x12@\xcd\xaab\x12\xdb~H\
-c\xa9\x19\xff\xb3\x06433\xf3\x842\x0b@33\
-333\x1f](\x84,,\xc3\xc2\xa2\xf8\xbd\xc3\x93\
-\xe3\x83\xc3\xd7\xe1F\x0bq\x8a=f\x1d\xb0\xb2\xce\x8d\
-\x9bo8\x05\xec\x5c\xb2\xd0s\xff\xbb\x1fQan\x89\
-ML\xb1\x1c&\x8c\xa1!N\x22%-:Z\xe7\xaa\
-\x93\xf0\x90\xa4\x1a\x87L{\xf3\xd6\xe1\xab?\xf9\x87\x06\
-J86D\xcd\x18\x12b@_,\xb5\xcb\xe7\xb9\xea\
-\x02\x90D\xd6\xe4V$K\x89\x1e5t\x17R-z\
-2sAr\xb0Xb\xce\xb4\xd4\x96!^}+^\
-{\xeb \xb9\xa1G\xa2\xdav3\x8c\xea\xc7\xc8\xdd\x86\
-\x0d\x0aQ\x00\xe6\x96\xc6\xc4\x0c*\xe4\xda\x0e\xdf\xa6\xd9\
-\xfe:X\x04\x0dnt\x03j\x14\xb6\x91\x22\x8b[\x0a\
-\xe6\x9c\xdb\xd4\x19R9YG\xd1\xed\xe38<\x8a\x9f\
-\xbcv\xafk\x0f\x17\x0b\xae\xf6\x9b\xa6cNhsj\
-k8\xab3\x8a\xc2\xd1\xf78\xdc\xe0x\xe3'C\x8c\
-\x8a\x01\xea\x85h\xbb\xaeY6\x8bN\xc6\x02\x85\xa4p\
-2du0\xefFI\x94jN\xd1\xd4\xf4;H\x12\
-\x965F9\xb8}\xf8\xda\xdb\xc7]\x17\x8b\x86\x8d\x13\
-\x035\x1aJO\x1c4K\xe7\xc27c\xe7}\x89\xd4\
-\x9a5\xb4a\xca\xea\x86D\xe5.C\xb8y\xf7\xe0\xf0\
-\xe0\xa4\xb1C\xac\x15\x9ej\x00T\xd0\x22{\xb1\xc1\x93\
-\x91+qe9\xe7\xd6\x93\xb1x\x08\xdb\xe6_\xd5\x02\
-S\x13\xa3,1\xe01\x0e\xa1D\xb4\xb9i\xbb+\x0d\
-\x87\xa3\x93\xe1\xe0\x1f\x1c\xfd\xad<.-&\xe3\x83\x04\
- \x81Q\xf2\xe09e]e\xbeZS\xa5m\xd2\xe1\
-(\x06\xcd-#\x09'\xbe>x\xfb\xedx\xfd\xb6\x06\
-\x83,\x83-hd\xd4*\xbb\xfa\x81\xed\x8av\xa8 \
-,\x98\xea)~\x89\x9cq\x81\xe8PG\xfa\xc5\xc2\x19\
-\x084%-\x82\xa6\x228\x96L\xb0l\xce\x00\x0a\x90\
- 2\xa6\xb6_\x93\xc2\xf0\x01\x16\x82i\xbb\xb1\x94\xd5\
-\x5c\xe6m<\xb1D\x04 \x16\xa5Q)\x94\xe0V\x0a\
-\xd7\xb0\x1e6J!\x82t\xca\x8d!\x861\x91\x05\x98\
-\xe4\x5c\xbc\x93\x00\xf4\xc8\x9c\xbd\xde\xdcg\x15\xba\xd4T\
-\xf4\x88\x1bB\xd4\xea*\x00\xdb\xdel\x0e\x004\x99\xe9\
-|.\xf8\x14%T\xe3{8\x95\xacN\x89N<\xf3\
-\xdf}\xdbx\x7f\x01\xe9E[\xbf\xbb\x8a\xee\xfcD\xb2\
-\xa4\xaec\xd7\xe6\x94\x0c\x14\x22\xcey\x9c\xde\x13\xd3I\
-\xb7\xf3U\xf1\xf4\x7f\xf5'M\xc2lut\x96P?\
-\x84\xfb\x1c\x01=33\xf3D3\x0b@3333\
-3\x1fi\x02X\xe7&\xb7\xa9i#\xd3%\xe7\xa0R\
-\xc7\x82a\xa9 9\x19\xe4\xb6W\xb1\x99g*\x03\xae\
-4^6\x80!\xc9\x8bc\x80j\xe8\x0b\x09\xf4\x11\x08\
-7(\x01\x22i\x09\xac\xc9\xca\x16f0\x02\xc5\xc2\x80\
-\x04\xe40\xfa\xe2j\x89\xeb\x0eO\xf9 Ga,\x84\
-\x96v\xac|\xdb\x98\x9d\x0b/\xb9\xd0@\xc0ha&\
-&5\x84\x93E\xe8\x81\x9c\xb4\x00\xdap&@6\xca\
-\x8e\x03\xd1\xbb[\x06\xed\xea\xb8i\xbc\xa7!u\xcb\xa6\
-0Nb\xc3\x0e\x5ca\xadu`@\x22\x99\xc9%\xb5\
-*\x9ej{\xb2\x1a\xa1*\xf0t\x08-\xa3,\xa7\xc1\
-x,0\xd5\xea0&!\x81M\xb16\xa2\x1d\xdc\x88\
-\xbd\xb4\x0aC\x02\xbc\xf8f\xd3\x1f\xfa\xb0\xe1\x10<\xa0\
-\x90\x890:Q\x8cA\x05,\xea4\xbf\x0b^\xd3\x8d\
-\x17\xad5-\x8cJ\xb9\xa4pj\x18\xae\x17_$\xae\
-\xcd\x8e\x12O\x8c\x1b\xa2\x10ar*\x01\x09j\x1d&\
-Xm;\xe5\xd9e\x0e\x89y?a\xaf`}\xa2\x8d\
-\x99\xa5\xb4\xb2\xb6CiQ\xb0\xc1\xa1\xe9\xc8\xdak)\
-?\x9f\xd8xw\xe8<\x94\x17\xc50\xc2\x07\x82\xdd\xb2\
-IW\xcaI\x94aH\x81\xc5\xaaIq=bAk\
-\xdd\xd2\xc0u\xf0\x18f\x88\x85\xb8\xb0\xec\xc1\xe3\x90\x05\
-\x1b\x00I\x01\x92\xaa'\x15\x13\xb2\x13\x96]^J)\
-\x1e\x02-7\x9d\xf3\x1a\xe3\x9e{?\xa0k\xba\x17\x8d\
-\x0dx\x0c\x16)\x83\x1d0*\xdf\x86E\xf1\x8c\x22\x87\
-\x93\x03i\xa6lD\xd8`Z\xe7\x04\xa5\x83\x82\x11\x0c\
-E\xe3E\x94F\x03\x99\x13\xdbQ\x11p\x01A\x06\x11\
-Ha\x94\x8d\x82[\xac\xd2\xb8\x82\x08\xbb\xe4$\x7fp\
-\x18L\x08\x91\xb5l\xcb\x1em\xe3\xe9\xd6\xc0\x1e\xa0,\
-I\x19\xa9M\xa9\x88\x1e\x18\x93\x9c\xea\xa84\x95\x80M\
-\x091\x8f\xfc-~D(37K\xa2\xca\xa4` \
-dc@N\x95\xbc\x19bl\xdb2v\x87\xa5\xdb\xa0\
-\xed\xc7\xa6D\xb6.\xd3\x5cD$\x02\x06\x92HU'\
-\x81UA\xed\xe1{\xf284\xae\xfbVp\x99\xab\xe8\
-\x91\x0f\xa9  C$\xca.\xa5\x09h\xa9\xb6\xf6n\
-\x83\x86I\x14\x0a\x800%D\xa6\xc2\x94\xa6\x8b\x81\xd2\
-\xa9\x06\xa4\xea\x98\x89\xad\x8a\xa5m!\xe4\xc5\xf5aS\
-\x03\xc0\xfa.\x86`\xaa\xbfHfX4\xcd\xb2i\xad\
-&I\xc9\x11\x84=Z|\xf86\xb7{R~\x8cr\
-NaD\x22\xc5\x9aL4\xf5f\xe4Xl\xb3Q\xf1\
-Y\xfe\x99\x99\x99y\xa2\x99\x05\xa0\x99\x99\x99\x99\x99\x8f\
-*u\xf0a\x09\xc9\xd8\xe5\x94\xcdl$\x86\xe4\x18\xea\
-\x80\x22\x90\xc4\x1c\xb4*\x00\x11\x02R\x94\x8e\xd1\xc0F\
-\xd8p\xd9`.\xf8\x90Yb\x8a\xd5\xac\xe2\x8c`m\
-\x80c\xc6\x9c\x8d)\x8a\x00\xb0\x16\x1d(hd\xd5,\
-\x10\x91[,\xaf\x8a\x05id\x14\xc6\x8aZ\x22!\xb7\
-\xc7\x0a\xebG\xbaSA4b0\xd5\x0c\xd9\xba N\
-\x93\xed\xd4$,\x09t\xb8lT\x8c\xa3{\xd3.\x9b\
-vi\x5c\x22\xb5\x19\xa9I\xc9\xcbf\xec\xd5\xadR\xb7\
-\xcc6\xa6\xc1O\x5c04\x09KD[\x0a\x05\xd8\xa9\
-\xcfa;\xc3\xaf\xbao0\x16\xb0\xa8z\x98P\xbb\xc5\
-\x9b@!\x95\xb0\xb1\xe4L\x0b\x1a\xcc\x92\x05\x93\xa5,\
-ccB\x8c\x0by\x0a\xc8\xa3\x00\xc5\xe8\xa4\x9b\x15\x22\
-\xcc\xcc\x0cf*\xc9\x94\x1a!\x8d\xa1!\xa2\xf8Z\x0a\
-\xe3\x0d\xb3\x85P\x12\x93\xb1\xfa\x15J-^1\x00J\
-5\xaa\xc59\x8d;\x83\x0a\x06\x8d\xb9\xeb<\xcc}\x0c\
-YB&Z\x94\x05\xf3\x8a%\x05\x8al\xc3\x94\x85\x05\
-\x98\x5c\xf2(\xd3gB\x16\x8cMR\x9b\x97\x89\x16M\
-1[\xb7m\x9bu5\xc6\xa5\xac3&W\xb7\xf5F\
-,\x12\xda\xe0Ih\xd4\x14\x9cC\xab\xe7\x08\x0c0N\
-\xffBr\xa3\xa5\x8cpD\xc40\x16%[\xa4\xe5\x95\
-k\x18\xfc\xdaI\xbf\xef2Z\x01\x13\xd4\x11+p\x8d\
-\x9c\x08z((\x22@\xe7v\xa8\x5c-*\xce\xa1\x0c\
-\xf7d\xcaMb\xb3l\x16\xa0\x14\x8a\xd19\x04\x90\xb3\
-\xd8( 0L\x8e\x14\x89A\xc2\x8aJ\x0b,k\xe1\
-\xce\xc5\xe7\xf1\x05\xea\x82D\x98/\x80\xbd\xdc$\xb4G\
-^\x8a\xbb\x01\x99\xb9\x19=\x86q\x93\xba\xb0F\xaa&\
-\xad)\x0f;j\xc2\xf0\x07?\xb2\x9e\xd2]\xb4\x0du\
-\x11A\x09\x0e\xb8\x0c\xa2dC\x98dEV`\x05\x06\
-(\xaa\x00\x82\xc0\x94\x82\xb5\xf3\xb8\xec\xac(\x0f\xdf\x8f\
-\x9f\x85\xc9\xe9\xb2e>\xea\x11\xa5\xa6o\xcd\xce\xbc\xb3\
-;]Ow\x98V\xfba\xf1\x8c}f\x9b\x0c\xc5\xf7\
-\xb8n\xbd\xe3\xeb\x09\x96\x08Bm\xdb\xb4M\x0b\x9d@\
-\xf1.\xdew\xf9*\xef\x0f\x9d:o7\x82j\xf9Y\
-\xd5\xa9\xc8\x14\xb2M\xbf)\x1e\x1f\xf8y:333\
-\xf3!b\x16\x80fffff>\xaaP\x94\x05m\
-\x13\xb6\x19t\xe2\x05\xa9N\x00\x0b\xe1\x10\x81\x14\x9eJ\
-\x10Q\xbb\xd0(\x99\xc8\xbc\xa6\x08\x840^\xba\xe4K\
-G\x08\x92\x1a\xc5\x12@]j\xad\xce\xa2\x04w\xd1C\
-\xae*\xa2\x08\x80\x87\xc6@\x04d\xb2\xc0\x817G\xa4\
-\x83kO\xce\xb8b\xb1\x87t\x0c\x1e\xc9\xe8\xb6\x14\xc5\
-\xb4f\x1a\xc0\x142\x05C\x0dUM9\x002H\x0b\
-I\x06\xc8\x80\xa0\x09M\xc3\x06a1x\x14W\xb8\x0b\
-\x83\x17b\xc8\xa6\xb1p<2\xa0\x11s\x96\x8cf\x1c\
-\xa9uJ\x9dC\xb5\x13\x16\xa8:QN\xc0\xb6\xf5\x14\
-\x8c\xb6\x16\x83M#G\x98\x00\xa9@\x03\x00%\x10\x06\
-qt\x8d^\xcc\x0a-\x91\x0dk'\xf9\xfaF$\x80\
-B\x86TX\xf549 \xa3v\xd3\xf5\x86V\xcaj\
-\x04C\x9c@A\xf6\x09\x85\x90\xd0HY\x08\xc9\x1d\x19\
-h\xc0\x5c\xcb\xae\xc4 \x95\x14)$@cN\x82Y\
-+\x82HRr\x8a\xa9T\x8dH\x8c\xd1\x07\xf5\x87\x80\
-\x05\xd6he)\x9b\xede\xb2\xd3@?\x0a\xa6\x84\xce\
-\x9a\x9e,kw\x95;Q\x8e\x03m0\x85\xf5\xb2\x03\
-\x92Y\x84\xfa\xcc\xc3\x9cN\x0a\xd8S\x88\x1c\x84\xa1\xb1\
-\x80\xd5r\xbd\xa9Jn\x13\xec\x9b\x9c\x99\x93\x14*\xa5\
-\x8c\x1am\xd1\xe2\x8aYR\xbaW4\xc26\xe0\x08\xac\
-\xe0\x007\xb0\x9er\xb3#d\x09\x87\xc8\xc7\x92\xb9(\
-dX\x0f+\x04\x94\x13\x95\x8a'F\xa2j\xcbr\x85\
-\xdc\xa5\xec\x0d\x99w'!\xe9D\xc02d\xd0\x08\xbb\
-\xfb\x10\x01\xe8\xa2\xb3\x9cd\xf4}7\x0c\xa55\xd1#\
-\xc2\xa86\xe5\x85\xa5\xa4\x88\x82B%s \xb2\x94\xeb\
-\x1b\x04\x84\x8d\xc2(\xb6\x1fl'xH\x8d\x22\x0b\x10\
-\x06\xc8\x04MV\x95\xe9{)\x93')G\xb2\x00\x82\
-]\x08\x8eL\xb8\x99\xe7\x80&_ w5d\xef\xb4\
-\xf9\x09?\x13\x01\xe8!\x19@\xef\x83\x02\xd4\xb2+`\
-\xca\x00\xea\xa7\xce\xe9Q\x88\x82,\xafM\xd48\x8aG\
-{]3,4\xe6\x9eaP>_\xffu\xdfvT\
-\x15t\xdb\xf9\x8b\xbb\x02\xc0\x0c\xa8~\xd1w\xef\xa8~\
-\x9cDP\x81R@\xb5-S\x0e\xf88i\x86\x8f\xee\
-r\x9a\x04.U\xbd\xbe\xaa\xfc\x0aB\x9ab\x80\x82&\
-\x08\x06\xd2\xb2\xdc\xd6cx\xe8gT\xe27333\
-\xf3\x91`\x16\x80fffff>\xaa\xd4\xe9]\xd9\
-:P\xa2\x90\xc1\x06mN\x0b\xa2\xad\x85BaCX\
-\x94I\x93\xa0\xa9\xb1@bP\x02\x22xi\x8f$\xf2\
-\xc21\x82\x00(L\x9e\x00\x83\x89\xbb\xe4Q\x09\x11B\
-\x84\x02\xa9\xd8\xd6K\x13\x1c\x15\x00\x0c\xc8n'\xc5\x8e\
-\x00\xd4\xae\xcc\xa4\x12\x03i=\xf5\xea\x8e\x91\xca\xb0\x02\
-\xd5>\xde\x00\x800\xa9\x11G\x90\x90\x11S\xdcIm\
-\xa8\x83\x08$\xd2\xf2\x10e\x18\xc7\x88\x85\xd1\x14I\x88\
-6\xa7e\xb7\xbf\xf6\xb4\x1e\x91\x1a\xb4\x16I\x01\x87\xdc\
-C\x03e$\xea@p\x0a0\xe6\x99=$ \x9al\
-\x1b\x0e\x82\xed\x08\xaf\xee\xa8\x02!\x1aa!\x00\x91R\
-\x86%2+\x82\xa8c?\xd3TW\x83\x90b\x1b\x0d\
-\x1bf\xac\xea\x85B\x82\xc1` \xd3\xb6\xaen\x04\x9c\
-(\x04\x00\xabG\xb6\x9a\x8fj\xbb\xa7\xed\x98R\x98Z\
-\xb9\x07@\x84\x88d\xb6\x14;IE\x0c\x1a\x03\x066\
-M\xdb\xe4\xa5J\xe3\xc5\x10f\x89\xcc`$\xf7\xe4V\
-r\xf6\xa1l\xd6C\x09\xec\xe7\xbca\x1a\xc7\x02im\
-9\xb9\xdc\xe1L#\x9b\x22)\xc6c\xf8@\xde\x83\xf5\
-F\x9a\xe5\xc0\xe4\xad\xa02u\xda\x05\x8bt\xd2!\x97\
-\x19 Kd\xe4R\xech\xb0H\xe1M\x89<\x88=\
-8JM5\xaa \x85\xa1\xa4\xd8\x18 ;Ii\x90\
-\xa0H\x81F\xb6\xa1\x8d\x84\x0cm\x94&\x90\x10\x00\xc9\
-lfd#S`dD\x9e\x1c0\x128\x0a\x1e$\
-\x14\xe0\x86\xcd\xa5\x12'.M\xba\x89h2\x95\x95\x09\
-\xcb\xe1.4Dk0\x83\x92\x8d\xa6\x84\x00#\x9d5\
-\x5c\x04\x83pMM\xe5>\x98\x18\xa0\xaa\xf3\x18\xa2\x01\
-\xca\x19oK}.\xb65He\x12j\x19\xa0L\x93\
-\x93\xad \x8a\x9dzENe\xc9wR\x5c\xb6\xaa\xe8\
-\xe3\xdf\x95\x8b\x9f\xd9\xa6+\xbdg\x08&MK\xb0\xfa\
-\x05\x03\xe4\xa6\xde\x02\x16\x0e@\x06'\x8a\xa1(\x946\
-\x8b\xe6\xa4o\x22\xd2H.\xceX\xa1.\x14\x80p>\
-\x03(P+\xce.\xd2r\xea\xf5J\x0a\x84)\xc4\xa4\
-&\x9b\x19\xc3G\xb9\xa7\xf7!\x00\xd5\xe8\xa93\xa1?\
-\xd3\x8f[\x9b\x9evAH$\x91S\xb8\x8dE\xa1\xe0\
-E\x9d\x1fgfff\x9e\x10f\x01hffff\
-\xe6\xa3K\x00\xd6\xd8~\xa8h\xea8\xd3\x11K23\
-\xa6j\x06i\xc0\xb6D\x84r\x06\x0c\xb5\xd4\x8a\x9c\xfe\
-\x08>8\xbc\xe2\xe5\x02Pm\xa8|\x84\x1a\x1e\x82\x9a\
-\xd9\xc3@\x04\x82\x8adb\x9d\x18\xa7T\xeb\x82\x12\xeb\
-\xdc\xb4\xa1M\xbeOz\xf5(\xd0W\x8c\x15@p\x00\
-Ll\xa0,&`j\xa83\x85\xb1\x22\x02)\xd0\x91\
-\x96jC\x9d\x00\x09\xca\xe8-@\xca<\x98\x01\xcb\x9e\
-S \xfa2\xf6\xf2^f\xa6e\xb6.\x13-e\x08\
-\xd1k\x11S\x8aFI>-\x5c`mV\xc6\xa0h\
-B\x88\xd12\x0c\x9c<7`p\x8a\x8dub\xa4D\
-\x83Y\x84)P\xcc\x9c\x8c@q\x15J\x93|\xc3\xb4\
-\xad\x1a\x9b\x06\x7f\x14\xcd\xcc@\x00\x11\x8a\x08Z\xe4j\
-3\x8a\x1aa\xcc\xaa\x17\x11\x04\x1a\xa0\xa6\x1ak[\x9c\
-c \xa8\x10E\x84)\x82\xc1\xa0\x09&\xd5\xa0\x8f\xa2\
-\x12*\x08j\x8a/\x19\x03#@\xda\x00fK\xa4A\
-\x82\x17C\xcaM\xb3\x07\xa4\xb1dE\xa6e\x93%\x04\
-\xac\xc9\xa9+J\x08\xa5\x94\x99\x16\x88\xa0:\x8b\xd60\
-&\x15\xe6\x9a\xfb\xec\x88\xcc\xb0\xba\x8f[Y\xc0\xbb\xcc\
- \xc7\xe8\xcbPHv\x5c\xa6\xb404\x08\x93\x17\xa6\
-\x9e\x1ca5\xcd\x87\x08\x033\xa2\x8eE3\x90\x0d\x19\
-JTR\xacB\x8d\x98\xa8\x02\x89^\x8c\x09\xecH\x0b\
-BP\x84{\x19\x10A\xb5\x99\xdb\x03\x00A\xa3\xa9X\
-H\x08\x13l\xf2q\xbc\xb7\x80\x99DYs\x9cP\x22\
-\x0e\x85A\x1e\x11\xc9S\x06\xcc\x98\x89\x86\xd3h\xbf\xad\
-\xae\xb4\xba\xef\xb2\x01j> \xf1\x07\xc0\xd6\x00\x22\x93\
-jo*\x10Fy\xcd\x99I\xf5H2\x06\x96\xd1\xc6\
-6\x97\x05\xc6\xc1\x86\xc2\xd2\x004\xeb\x13J]\x04\xa7\
-\xffMUQ\x93\xc0z\x09\xf6\x88z\xcc;\xee\xc9%\
-\xcf<\xa2\x00$\xd2&\xbb\x12\x8bT-~\xb5k[\
-\xb6@U\xc5\x85b\x8c\xe4\x10),\xcdW\x8dGR\
-\xa8Ji\xf5\xf8\xf2\xdd\xf5\xcb\xdaI\xc4\xf7\xef\xd8\x94\
-6\x1d\x08\x83H\xa4\x9c\xban\xd9\xe6\x14\x11\x8f\xb9\x0b\
-<\xab\x1f\x8d\xd8\xda\xa9&Qo\xfa\x85\x11(\xfd\xa8\
-\xf8y\xa4U\xcd\xcc\xcc\xcc|h\x98\x05\xa0\x99\x99\x99\
-\x99\x99\xc7C\x9d\xfd\xff\x80!L\xbe \xcc\x18\xc9\xc0\
-q!_\xba&=\x06mN\xc9\x0c\x83,\x00\xe5\x22\
-\x13\x1bx\xc2 \xb4\x11\xcb\xcb\x87\xc7\x97\x0e\x11\xc4A\
-\xe9\x00S\xf5H\x022\x91\x0c\xae\x04\x0aA\x07kt\
-\x8f\x02p\x91H4\x12H\xbeJ\xb8\xcaph\x10@\
-\xed\x13W\x80{\xc2\x89d\x8aF\x91!\x0b\x0b\xc0k\
-\xf7&\x19\xc9\x14\xc6\x01\x89\xc0\xa2v1\x83\x92\x83\xc8\
-\x0c\xaa@&X\xce\xc9\xc1\x8d\xa1\x0f\x16\xd9\x88\xb2\x19\
-\xfbp<\x0d>\x8d\x18\xc0\x13bLr@\x84\x19\x8a\
-\xa4AQ\x18\xc0\x08\x8c\x00#Y0\x11b\xa46\xb2\
-\x85\x01\x8e4\xc0F\xa0\x00Q;mcJw. \
-F\x95\x881\xe8\xc6\x08\x8d\x8aB\x1a\xad\x11h01\
-\x07\x92,\x87\x11\xb2\x90\x910c\x92)\x14\x16\x0d\xd1\
-%\x93\x80(\xa1{`\x0f4\x05\x0b\x8f\x85\xd0\x05\xdb\
-\xb2+\xc8a\x80\xc58\xe6(@\xa1\x90\x18I\x9e\x22\
-\xb5\x92\xb9\xbcw\xb7Q\xa9\x0f+FL\x06'\xf5^\
-6\xa94\xf45\xd9 \x86\xea\x9a\x82-\x18\xc0`m\
-,2[\xa2\xb3r\x8f\xbc\x9b\x85\x12V\x10\xbeU\x0b\
-\x05\xcb\x91\xb2\xefe_\xb5J\x0d\xd0\xa3W\x17a\x03\
-\xc6\x04\xcf\x88\xa6*8\x92\x1b\x0bl\x00\x07\xda`(\
-\xa4!2\xb04,\xc8%\xb1&\x8e\x88^\x1a\xab\x0c\
-\x09o\x01A\x1d\x10\xd0\x82X\xa4(\xc0F\xd1b\xb8\
-.t\xce!068jlMBX\xba\xb5\xc2\x18\
-\xa1\xf0\x12\xd1\xa7P\xb2\xb6!,\x020\xd1\xa1\x11\xd1\
-\x17\xb9\x1b,\x16\x16\xddCzL=8^\xc7$:\
-\xf6\x91\xde\x0cl\x00o\x13\xa1N\x0e8\x8c$S \
-#\x02j\x80\x15\x94\x85\x04\x84\xd2\x804\xa2\x14\xaa{\
-\x98\xe4\xf4X\xa9\xbd\xd7d\x8a$g\x82RF\x22\x12\
-j,\x17\xcc|\xc1\xd2\xe7r\xd2\x8d{]\x7f\x03\x9b\
-u\xdel0\xec!R\xb2\xb7R:b\xe4I\xd2\xd5\
-$\x00\xd1\xdeA\x00zTC\xceCy\xc8\x02\x1fQ\
-\xa9\x10\x94\x81=\x80\xe2Z6\x08\x04\x12\xb4\xa2:\x8b\
-\x80\x17\xa0 \x1d\x99\xf5.\x90M\xa4\x95\xf5\xd7\xda\x1e\
-i4\xc4fk\xac\xd9\xe5\x01=\xb8\x89q\xe6X\xf8\
-\x99|\xe8\xd3\x8d\x8e\xed{\x05w/&\xa6\x84\xae\xe9\
-\x16\xdd~\xd3-\x18\xbb\xba\xb7\xf7\x7f@\xeb\xd6&`\
-\x12\x8d\x0d\xa0\xf96\xbb\x1a\x90\x10R\x89o\xbc\x1eo\
-\x1c\xa2\x99\x0d@333O0\xb3\x004333\
-\xf3\xf1\xe6\xc2\x01\xc4E\x81\x0e\xb8\xf41Mm~N\
-\xfd\xf6g\xea 4-OH\xb5\x16F\x17x\xfa\xf5\
-\xd0_/}\xec\x9d \x11\xd2\xd8\x07\xe0\xd9\x8c0\x1a\
-!ZU \x12\xc3(\x11f5\xcf\xb8\xce\xef\x13\x06\
-d\xc0\xc0Z3\x12\x17,\xfa\xa2\xc1\xf1\xf9\xfd\xaa=\
-\xe6\xb5=<Vc($\x97\x82\xb0\xea\x00\x82\xa8\xdd\
-(Iau|R\x13\xa2!\xc9\x11\x82'\xb1\xc6\x97\
-8\x04\xd4\xe2\x1a\x96\x00\x8dE\x04I\xab\x81GP@\
-\xc6)\x7f\x98\xac\xb6\x17IP\xc0Q\xe02*'\xb3\
-\xb4\x84\x0a\xdc\xea<\xbeO\xfb\xc4d&1\x10:\xad\
-\xe0\xa8}\xccj\xdbw\x83D\xba\x98\xc48\xfdP\x84\
-\x9d\x8e \x85dP\x09 \xbc\xa8\x86*3\xe5\x043\
-\x8bP\xcdu\xdd\xc6 \xd5V\xe1\x04\x0d\x88\xf0:\xfb\
-N\xc8)\x09\x1a\x03p\xc0\x83F0\xd5@eB\xaa\
-\xed\xbcw\x0e\x01\xaaf\xfa\xd49}R\x9a\x9aO\x19\
-\x00\xb1\x14\x95\x12\xc5\x11\xb4\x1a\xf1L\x80\xc9@Z2\
-S\xcd\xcc\x11\xbdPN\x93\x03*\xc3\x90\x88\x9c\xc1i\
-4\x98\xc1D\x9a\x87\xc3,\xd7v\xd8u\x0fLH\x1e\
-\x92\x0b\x0eC-\x00\xd3\xb4U5\xad[p \xc6R\
-d\x9eR\xcam\x03\x80\xa3\xc5\xe8\xa3\x0f\x94!\x95\x9a\
-R\x04fSH\x10J\x1d6[\x90\x10\x18\x12Y-\
-F\x16\x94\xb3\x16\x0b\x8a.Q!\x0d\xc5\xc3Y $\
-C\xdbt\x99d\xa1\xc2\x03\xe2\xae\xf0\x05\x06\xa86\xb3\
-\x12\xab\x1b\xe22{\xc9CrgD\x18\xc1\x94\x92\xd8\
-\x04\xe0^\x14\x0e:j\xc3\xbb\xa9\x95x\x88\x0e\xf8\x94\
-4\xf3\xfe\x12k\xde\x13uM\xb5\xd0\x8b\xa2I\xb5\xf4\
-\xc7-\xe0HB=\x17\x80\xda\xaa~W\x22\x170\x87\
-\x09\x0a\xc4\xf6[\xae\xe9I\xe3i\x82\x10.\x97\xcd\x1e\
-\xa7o\xe5\xbe\xfdylhj\xb0\x05\x02\x0e\xc5d\xa3\
-S\x99\xea\xc1\xe8@\xd9\x1af(%\xa9\xf6\x00\x8cH\
-\x05S\xc1\xdc\xee\x08\x04P/\x9bg\x97?\xfd9\xd0\
-tH\xeaQ\xde=\x10\x16aA7\xa2\x86\xb2!\xdc\
-`\xc6&\xa7\xbd\x96\x0b\x0bs\x15=Di\x7f7{\
-\xb9\xb5\xf80\xa6\x13\x92\xd3y@\x90S\x11kL\xbb\
-\x91$\xc6\x0f\xee\xeaN\xcf\xab\xabG_\xe7\xcc\xcc\xcc\
-\xccG\x9dY\x00\x9a\x99\x99\x99\xf9\x980\x0db\x04\xc9\
-j{\x94m\x93\x94\x87\xdfa\xeb\xc2\xe7Y\x02!\x18\
-\x95Q\xcc\x0a3\xc0:\x16d\x00\xdaN\xee&\xf7\xe4\
-Nea\xaf\xe4\xe2\x8d\xd3\x0a\xa2\x1a\x09\x88i\xe8\xb5\
-M\xe6\xd8\x0e\xb8\x1e\x9cQ\xbed,\xfa\xce\xbb\x5c\x1b\
-r\x03\x0c:\x8c(HG\xb5|\x8b5v\xd4\x01\xaf\
-C|\xd6\xed\x1e\x90\xeb\xc0{{d.\xca}}\xd8\
-1k\x15\xd7\xa6\x17Mn\x01\x02\xa8)\x22B\x06\xa4\
-\xad\xa6d\xf5\x9f\xaa\x9fq\x10\x07\x18\x04\x83\x92p\x22\
-\x1b\x01I\xfb\x10A\x07\x05dh\x1fpOwa\x12\
-\x0b\x18\xe6\xcb\xb6\xacP\x03o\x12F\x01i\x9b\xac1\
-\x1d\x07\x81\xa6hP\x0f\xb8\xe8$\x19L\x96p\x0c\x09\
-h\x1dM@\x05\x00\xad~\x84u\xf4\x94b\x05,\xb6\
-2\x1e\xa9\x00\xfbHSp\xec6\xde\xf5\xf4\x10U%\
--\xea\x87\xc9l)U\xb9\x80!\x03(i\x1a<s\
-:@QW\xe4\xd5j\xc1\x18w[\xee\x90\xbb\x03\x80\
-\x99\xd9j{\xdc)\x92(Di\xceE\x13\xd5\xc1y\
-\x02,\xb6/\x0dbL\x05\xa9\x9a\x09(\xb4\xdce\x92\
-\x00\xb4=r\x19J\xc8'\x10\x84\x8e\x9e\x88\x0c\x1e\x01\
-A:I1\xc4\x13\xc0\xa5=\x92dJ\x14PjV\
-\x11\x94\x01\xb8\x9dxs2\x22\x08\x0am*ucL\
-(\x9e\x9c\x18\xb6\x1fAP-\xd10\xc0\xd1\x00( \
-\x8eH\x85\xe9\x18&\x91\xd0\x12\xb1`(\xc9\xc0C@\
-\xf0D\x00\x18Ew:\xd5\xc9\x0c\xcd1\xb1N\x8c\xfa\
-)\x09\x8b\x00\x80Bx\x96@\x18i\xaa\xeaFqj\
-\xb2\xdeq:>5\x03\x17\xf5\xeb\xc0K\xfd8\x97\xc8\
-5\x04\x0c\xb1W\xc7\xf5.J\x14{ZL\xa7\x02\x09\
-e\x10@\x0f\x0e\xd3w\xc0W\x88\x05\xf4\x81\x05\x00M\
-\x04\xe0\x04\x15\xcb2\x0a\xbe\xb1\x5c\x98\xf6<Z\xf70\
-\xab\x9e\xc4!\xf1\xb0+=\xd7\x88\xa3\xc8Gj\x8e\xd3\
-\x22\xd1z\x17$G\xfdB\x90\xdb/s\xecv\xe0\xd2\
-\xc3\xf3\x91\xa8\x1fb\x00\x07\x00\x88\x80\x0c 8\x82\x85\
-8DU,!P\x929\xdb`\x1bfJ\xc3\xd8\x1d\
-z\xbe\x83X\x98\x12\x058\x98x\xf6K\x88\xaa\xa3\x03\
-\x90M\xa2\x1a!\x98\x04*S\x0d0*o\xa8\x92\x95\
-\x92\xcb\x83\xcev$\xc6\xcc\x0d\xd1\x9e\xc42\xfb3\x8b\
-\x93\xd5\xd0s\xe8\x19\xa6\xa6\xa1\xa1^\x99\xde\xf3.\x8a\
-\xc9\x8d\x02X\x80\x11,\xce\x10\x08\xa5\x08SU\xb49\
-\x82% [h<\x8e\xc1u\xfez6333\xf3\
-\xc41\x0b@33333\x17!\xa1\x96\x95\x10\x22\
-\x82T5\xcc\xe8\x8c\x85\x85\x00U\x13\x95\x09\xe4`\x04\
-G\xf0|\xc4\xc2\xcfv\xb4D \xf14\xcaG\x08\xd4\
-\xcc\x99\xe9\x81:J\xa9e\x1d\xbb\xc9{N\xc5j\x8f\
-8\x95_\x13j\xb0[\xe9n>\x1c\xc0\xd4U\x08\xbb\
-\xa9\xed\xf3\xc3I\xd6qN\x0b\x10S\x04u\x16:\x00\
-\xc4\xb8-\xa3h\x00\x01\x1b\xd0e\x0e@*\xb6\x9dk\
-\x17\xa6t\x0e\x9c_.\x00\xb3)\x047j\x0b\x1cT\
-\xfb\xcf\xb8\x0d\xc7\xdd\xa5\x97h\x12\xab\xa6=\xa8Ul\
-\xbbE\x0ap\x9c\xaa\x03<\xf3\xef\xe9*\xa7\xca\x10\x9b\
-\x9eRm\xbf4\xf9svo\x98\x0e\xf6v\xb4U\xc7\
-\x8b\xd3\x8a\xb8\x15\x88\xb6\x0b\xdc\xa5\xd5\xec\x0e\xa9\xee_\
-\xeb\xf9\x1f\xa6\x80\xa1\xfa\xcfn\xcdg\x9dk\x91\xb7]\
-\xa0{@@&2\xa6c2\x85\xbd\x08ekeh\
-&\xcb\x16\x00\x04bgw\x830\xa2\xba\x8fh\xa7\x1d\
-\xc7\xb7N\x07\x9d\xd9*\xabn\x22!\xea\xe7\x5c\xd3\xa0\
-r\x08e\xeb\x8cK[\xdbB\x00\xc3d\x9c\x99\x96V\
-P\xfb\xa6A\xd5\xa0qzt\x98\x89*\xe5\xee<Y\
-5Z\xfb\xfc\xf1\x98~\xe1v\x80+\x9d>\xfe\xee\xd9\
-\xd9\x88&\x05y\xda\xb6\x1avu\xee|\xd0\xb6\x0e\xc8\
-\x80\x0c\x9d\xfd\xf8>8\xc4z\x8c\xc3\x09%\x85j\xea\
-\xf1\xe4\xd0\xa2\x18\xc4h\x08\x06T\xc0Q\xa9 \xa5\xed\
-I\xbc;h\xdb}{$%\xfaC\x89v\xde\xc6m\
-\x97w\x01A\x963\x1f\x11\xb7\xe1\xd9V\x8du\xb0A\
-\xec\x81n\xbb\x84\xb3\xea\xe1\x03W\x9ds?\x9c]\x9a\
-\x83\xa3II\xf5j\x92@\x89V\xa8\x84\xe8\x12\xf7\x1b\
-7_\xc3\x83H`\x82\x09\x97\xc6\xf1\xbf\x03\xd3\x95\xac\
-\x8aU\xa7^N\x02\xd5\x8bj\xd3\x85&\x01\x09\x05\x1a\
-\xfc\xe3\xf3\x01\xcf\xcc\xcc\xcc<\x1a\xb3\x004333\
-3s!vv\x10_\x07\x94I\xa8\x15;\xd3K\x08\
-\x98\xaa\xd7\xbf\x186\xa9D\xda\x18\xad\xde\x88O\xe9\xb8\
-\xe44\x1e\xad=\x9d\xb6\xea\xc0Y]D\x00\x1fQ\x8b\
-\xb9\x8c3\x8b?3\xd9{\xbf\x16\xf5\x88\xeb|\x1f\xa3\
-\x5c-\x01L\xc3\xadi{\x9cg|< \x81\x86H\
-\xc4\x02e;\x84#\xa7*\x9b-\x97\x8bjg\xc7v\
-\xa7#\xf9\xddS\x17\xbd\xf1\xc1\xddyd\xcd\xee\x12\xa7\
-\xc9\xbb}\xef{\xdd\x8c\xcb\xf6\xe8\xc1e\xda\xf9_\xef\
-\x1b\xb5\xee\xe4\x8c\xcb\xd6\xce3\xea\xd2\xc37R\x17<\
-|\xae(\xf2\xecn\xda\xb9\xb7\x9c\xdb\x8c\xfb|&\xef\
-\xe6\x10\xbe\xd7\xd7?\x9cw\xf9Y\x9c=z?\xb7\x91\
-\xb5\xce\x7f\xb4\x0fnz-t\x9a\xbesJP\x02/\
-*\xfc\xfc\xf8\xc3\x8b\x8e\xd0\x99\xcfN\xf6\xfe\xec1\xb5\
-\xc4\x95BM+?]\xbeQ5\x9b\xbd\xc9H\x99\xb0\
-\x84\x94\x90 \x04\xe2\xb1\x94\x0e\xdaV\x8e\xc4V\xfc\xb2\
-S\xfb\x1b\x01\xb7\xa1\x97\xc7;^4ffff>\
-\xe6\xcc\x02\xd0\xcc\xcc\xcc\xcc\xccEp{\xf7,\xedZ\
-\x8fs\x12\x80\xb6c'\x02\x9cruExR\xa4\xd1\
-\x18\xac\x99\x11\x9c\x0c!g\xc6\xb2\xe7\x07\x1e\xf7\xdb\x84\
-\x1e\xe3\x18\xf2\xecx\xfb]\xbc\xea\xbd\xf1\x08\xdbY_\
-\xbf\x90\x16\x98\xda\xea\x9c\xfeg\x93\xacP\x1fN5\x91\
-\xc7`\x88\xc9\xd1\xa3\xb4\x0e\xdbl'\xe4gff\xde\
-\x0fO\xf8\x97\xe8A\x01\xe8\xc1\x17<\xc22\xb7n9\
-HSd\xd9\xa4\xbdUa\xdbh\x162F\xbbH\xed\
-\x22\xd7\xd0*\xb3\x14 \xc2\x1fwW\xae]\x0e\x18k\
-\xc5\x1a\xcd \xf5\xfdX\xc6\x98[\x80\xcd\xcc\xcc<\xe1\
-\xcc\x02\xd0\xcc\xcc\xcc\xcc\xcc}\xd4\xa4\x9e\x04#\x18b\
-L\xb7\xf1\xd5h\x1f\xdb\x09UL\xc6\x087\xba\xb1$\
-\xb8\x85!\x11m(j\xb9\xd1\xeeMU\xe2\xd0\x19\xf7\
-\xfdY\x11E\x17<\xf6!\xe7\xd1\xb63\x9f\x99}\xae\
-s\xd4a\x10wM\x97i\xa8\xcd\xd9O{/\x1b`\
-\x92\x89\xdbC9333\xf3ad\xdb\xb3>L\xcc\
-\x22\x83!\xa2v\xa0'\x08\x851\xf6\x16\x8b\xbdE\x07\
-\x00!\x90z?\x97\xfd3e|\xd3\x05T\xdaJN\
-\xdb\x8c\xff*\x9b\x1b\x01\xf6c\xf1\x88']\x00\x9c\x99\
-\x99y\xe2\x99\x05\xa0\x99\x99\x99\x99\x99\x07 a\x06%\
-Y\x11\x9c\x82\xb16\x82\xb9\xffN]T\xa1\x8aa\xd3\
-b\xd3D\xc7l~e\xaa\x03\xd8.k\xfb\xd2\x07\xf2\
-5\xce\xe6HL7\xf2\x8f_\xe1x\xc8t\xef\xa3\xa6\
-A<\xea\x00\x82.+@uH9\x18@\x81\x02\x94\
-\x89\xb5\xa3\xfc\xd4HI\x89aP\x83X\x1066\xbd\
-_P\xbb4333\xf3\xa1\x22\xb6Af\x19\x00\xe8\
-0m+(%E\x22\xf6W\xed\xde\xaaC\x085\xaf\
-\xf9}\xe8\xdaz\x98+\x92\xdb\xec3\x00\x80\x11\xe20\
-\x96Pmo7333\xf3\xe42\x0b@333\
-33\x0f\xc2\xf3)$\x9az\x80?\xa0\xd1\x04L5\
-]x\x17\x03,\xed\xd2\x8fU\x93\x87\xb7m\x84w\xa6\
-\xa0\xa9\x8f\xcc\x19\x01H:\x938t\xca\xd9_\x1fY\
-vy\x88\x02\xf4`\x0e\xc8\xbb\x5c\xcb\xa3\xc4dT\xe1\
-\x87\xbby\xf2\xd3\xc1K5\x06\xc54'\x0e\x17\x1dL\
-\x80\xc3F\xe0\x89\xcd+\x99\x99\x99\xf9\x08\xb1\xfb\xeb\x90\
-\xa0\xea\xc3\xd9\xf5\xeb\x83\x22\x10\xde\xe6\xb8\xb2\x9f\xf7\x96\
-\x1d\x5c(\xceF0\xe2}_\xde\x1ev\xd5\xae\xcfe\
-\x93\xe9/\x7fP^\xbf\x1b\x8bf\xd6\x7ffff\x9e\
-hf\x01hffff\xe6\x02\xa2\x8a9\x16b\xd4\
-\xf9[S\xed\x1e\xceI\xd4\x11\x02pu\xc1\x85p\x9c\
-\x0a\x9a\xd2\x88>\xb6\x07\xa1\x98\xbam\x09\xdaN\x01\x03\
-\x80b'\x00\x09\xe7\x9b<\xa9f\xb4\x9em\xe3\x02\x9c\
-\x1b\x19\x5c\xa6\xb9\xbc\xc3\xf41y\xa9XS\x9b@\xdf\
-\xf7\xf2Kc}O\xb7\x0a\xc0C\xda]?8\xba\x98\
-^\x19\xb0@\x06D\x06\x85\x1aK\xabH\x9c2j\x05\
-\x14 \x90\x0a1Bk\x89\x94\x81\x14\x83\x9a\x1b\x17\xcf\
-\xcc\xcc|H\x11`\x93\xc4\x8dP\x12\x92\xa0\xb0\x12f\
-\xa2A\xa0{\x8a\xb1i|oe{\x8b\x06A\x8c@\
-\x1b4\xc2T\xa5\xf1\xc7\xba9$\x13ipB@\xb2\
-@\xfe\xde\xeb\xb8s\x8c\xd5b\x16\x80fff\x9eh\
-f\x01hffff\xe6\x22x\x9f\xdbG\xdb.H\
-g1\xb1\x15r\x80\x14\x08Sm$\xac\x08L-\xb0\
-y\xd6\xe0\xaf\xad\xed\xdf\xce/\x9c;\xa9\xe7\x81\x5c\xa0\
-w\xb3\xa1\x8f\xfa\xbc.\xa8\x01{7c\x03\xe2\xf2`\
-\xeb\x87\x08@B\x0e%@\xa2\xd2\xb9\x9eO\x9c\x145\
-\x13\x10\xd0\x94\x9a\xa1\xadc\x08j\x80\xf6\xc2\x95\xcd\xcc\
-\xcc\xcc\xfc\xdc9\x93\xe3FU}\x9c>\x19C\xeb3\
-\x11\xf4H)\x16\x9d\xb5\x0d\x11\xae\xfa</R\xdd\x1f\
-\x0f\x9c\x8c\x95\x86\x9a\xa4\x96L\xf6`\x19\xf3\xcc\xcc\xcc\
-\xcc\x13\xc6,\x00\xcd\xcc\xcc\xcc|\x90|T\xe6\x1e%\
-F\xad\xdb\xe2dP\xa9\x18`\xf0\x00\x05k\xc0\xec%\
-K)\xb9\xb5B3\x96\xb2\x19\x95\x93,M\xea\x8fj\
-\xb3\x97mf\xb4.i\xf6\xc5\x9a\xc7\x13\x0f>|\xba\
-A\x8f\xbc'\x0f}\xf6\x02\xb7\x8fv\xb9\xa2\xc0\xd4\xc4\
-l\xfbl\x0d\xb5\x86\x91\xa7\x7f=\xef[B< *\
-\x9dY\xc0\xd4\x93\x86\xc8\x0c\x03i0\x03\xa1\x90D\x83\
-Y\x88^\xca0j0*g\xca\xbc\x84\xd2hy\x1e\
-\xb5\xcc\xcc\xcc|\xa8\x91\xc1\xc5\x04f\x80\xe2f\xd2\xfb\
-A\x92\xf2q\x1c\xfa\xc5R\xd7\xf6\xa2I\x0e$d:\
-\xe0\xf0\xc4\xf7\xdd\xdf\xb0\xe6>o\xa9=\xc0\x8cDJ\
-\xe3@\x0b$K.\xae\x87p\xcdM\xc0fff\x9e\
-tf\x01hfff\xe6\x83\x84\xa7v\x8f\x9f\xc9\xe2\
-\x09\x1a'\xa6\xec\xcd\xf7\xbe*\x02\x08x0\xc8\x00\xc1\
-)\xddg\xdb\xa4<\x1c\x0a\xb4\x06v\xd4\x02\xde\x99\xa7\
-$t\xe1r+\xd1T\xfbO\xaa\x0dax\xbe\x90\xeb\
-L\x13\xacS\xb7\x0f\xebD\xedYK\x10Q\x93\x87v\
-\x5c\x92\x13\xa1w\xde\xbd\x87\xdc\xef\x8b\xe7G\x03\x92\xee\
-\xb3\x05= \x00\x89\xa8\x9d\xdaw\xbd\x8f\xb7/\xe0\xf6\
-5\xe7\x873\xbb%\x04\x00\xa3\xa5\xc6je\x9d\x1b\x98\
-\xc0\x04\x97+(\x19F\xa4\xb1X\x84\x06\xb7\x11\x8dG\
-F\x11\xa8\x86\x03\x00jn\x03633\xf3!c\xca\
-y\x86H'\x00X \x05M\x08\xc1\xa6\x16\x5c\xa0\xc6\
-q\xd9\xe1\xea\x15\x19\x0b,\xb1\xc9Aw\x0f\xabM'\
-\xdf\xd7\x16\xd4fb\xaa\x95\xcb$M\x06\x1ah\x02\x15\
-@J\xe3\xa8\x93\x8d\xfb\xdc\x05~ff\xe6\x89g\x16\
-\x80fffff.\xa0\xaa\x19\x84N\x1d\xfaS\x0f\
-s\xc2\x12\x5c\x1a=Rt\x8d\xadL\x0d<\x15\xac2\
-\xf7\x96\xe9$\xa7>d\xdcZ\xfb\x09r\xca\xefQ\x9c\
-\xaa<g\xf5\x9cZ\x06e<\x15[\xf8\xe0M\xfa%\
-\x198\x92\x1e4\xdd\x9c\xeeE\x9d\x07\xbe\x04\x8f\xd3,\
-\x1eL\x09\xd5\x93<GN\x9db\xce\x09@\xd5!\x14\
-\x8c\x10 \x18\xa13\x9d\xd1\x8c\xb8\xbf\xa3\xcd\xf6\x11\x12\
-\x80\xe8\xb0H&\xf3\x5c\x84\xe2\x00RN\x0d\xc1 $\
-\x95\xd1\xc7adV\x93\xdbH(e\x08\x89-,\xd9\
-C\xba\xdd\xcc\xcc\xcc\xcc\xfc\x1c!P\x9b\xab\x1b\xe4\x8a\
-Pm\x0e\xa0`H\x8a\x10-\x19\xad\xc9\xb6\xe8\xbck\
-i\xe6\x08V\xcfg\x18\xf4\xa8\x92\xccn\x16\xe1\xec\xd5\
-\xb1\xfe\x89\xa2\x14\xee\x94\xa5\x048\xe0\xe8\xc7a\x18\x05\
-\x91\xe4#7\x80\x9c\x99\x99\x99\xf9\x180\x0b@33\
-333\xf7#\x80\x93\xcb\xe5\x8c\xfaS\xe3\x1d\x94`\
-\x04-F)hI\xad\xd6\xb6\xde\xe0\x10\x1cK::\
-\xc6f?\xdcX\xd5\x92\xd3(\xe8\x09\x9e.\xffl\x99\
-\x15\xb6\xe5Q\xdb\xc7X\xd5\xa6\xfb\xc5\x97\x07\xa1\xa6L\
-\xea\x8b\xa1\x1e\xd2d\xd8\xb6=jx\xe6\xe5\x92\x04q\
-\xd7x\xeb\xec\xe0d*\x01C\x9a\xbcI\xf7\x19\x88j\
-\x01\xd9i\xbf\xf6\xed\xb3\xaa\xf2\x95\xb8\x8e\xb4f\xa2\x22\
-\x87g:\x89\xceR\x17H\xb4\xd4-\x1b\xd9\xa2\x0fs\
-/\xc1\x22\x9a,\xb9F\x8c\x91J\xca\xc4\x1c^13\
-3\xf3\xa1d{\xa1S\x01\x12\x94\x029\xa8\xa2Q0\
-\xc9\x00\x18\xd1&,;\xee-\x22\xd3!C(\xa8x\
-\x1f\xd7\xb5\xfb\xdd\xa5\xf5Am\xe7\x1b<$O9\xd5\
-\xeb\xf2\xba\xf7\xcd(\xa1y\x14S\xec\xcc\xcc\xcc\xcc\xc7\
-\x88Y\x00\x9a\x99\x99\x99\x99y\x8f\xd0`D8\x22\xe4\
-\x9b\xa1\xbf\xab\xe1hah\x81\xb2\xd9 \x8fI\xd9\xa0\
-\xaa\xbd\x98N\xbd;\xa4\xd5v\xf2\xb5\x0d\xfc\xae\x05\xd7\
-\xe4\xb5\xc1.\x22h\xf7\xfa\xfb\xf3w.\xdc\x9a\x87O\
-\x1f?\xa4FlR~\xce\xe84gj\xc0\xa6\xff\x93\
-\xdb\x01\x0a\xb7\xdb@r[\xb0p\x81Si\xfb\x9a\xdd\
-~\xed~ul\xc2\x03\x005\x9a@ Y\xc7\xd2\x96\
-\x12#\xe8\xc3jqe\x7fo\xd1\xb8\xd9\xc6\xc3\x83\xc6\
-&\xc1J)\x0a`\xb6\x00\xcd\xcc\xcc|\x98\x11\xa0\xa8\
-e\xc8\x90\xd5\x0a`h\xd2\xfa#d\x8c\xbde^-\
-\x92!\xe0\xb1\xbb\xd8>\xde\xeb\xda4UQ+\xc1\xaa\
-ES\xa0\xd8\x97\x18\xcac]\xd3\xcc\xcc\xcc\xccG\x93\
-Y\x00\x9a\x99\x99\x99\x99\xb9\x10\x83\xb6*\xcd\xe9\x9ci\
-\x02\x84\x18\xc10+\x024x\xc3\xf5g?1\xfc\x9b\
-\xdf\xc6[oc\xccX7\x1epl\xcd7g\x05 \
-\xa0\xb6\x97\xbf\xa0\x0d<\xa1\xf4@/\x98\x07\xcc7\x17\
-\xf0\x8e\xd5\x03\x0f1\xfb\xd3\xb61>\xa7/\xde\x0aM\
-B-\xf3\xa2q\xa7\xe9(\xaa$\x04q\xdc\xae\xfd\xfe\
-\xd5\xdb\x03\xa5j<\x93\xc3$Y\x04\x8a\x07\x04\x92\xa4\
-F\x1fO\xfa\xe1\xe6A\xfc\xf0''\xc3\xc1afj\
-;&$+i(mX\xbb\xa0\x99Fr\x9c\xe7\xad\
-gff>\x84lE\x1c\x17\x8aT/\xf9\xc9\x01\x98\
-\xe8\x02$7\xf7hB{]Zvf*(\x01L\
-\xaa\xbf\x1e\x9f\x02\xc4\xe9\x8f\x95\x8c$s\x00&\xb8`\
-\xb0a\xd4\xe85\x19o\xbe\x90\xce\xcc\xcc<\xd1\xcc\x02\
-\xd0\xcc\xcc\xcc\xcc\xcc\xfd\x10\xa4\xacZ\xec\xcf\x94\x80q\
-\xaa\x0d\x0b\x07\x0a\xcc% \xcaj\xd9\xfc\xca\x17\xae?\
-\xff\xf4K\xfd\xc9~\xc9\x1c\xba\x10\x0dg\x1c@\xa7\x8b\
-\xd5d\xd9\x9f\xda\xc0\xef\x1a\xa9\x0b\x04\x8c\xe0\xb9r-\
-\xbe\x1b\x01\xe8]\xdc\xcd_<\xbc  \x8a\xe7\x9f=\
-\x1b\x02-M[P\xff=\xf3xTW\xd1E.\x9f\
-sv\xa2\xed\xe3\x06\x04 cK4>b\x0c\x87H\
-k\xc0\xb6/<\xe9\xcbk7\xfb?\xfc\xd2\x0f\xbe\xf1\
-\xed7n\xde\xc1h\xe8V\xddbq\x0d\xbe\x18K\x9b\
-r\xc7t\x1c\x1a\x1e\xb2/3333?/\xa6R\
-,\x02\xf5\x8a\x1a&\x18\xccd\xa4\x08\x18C*\x0ei\
-o\x91W\xcbLzm\x10/a{u|\x7f\xd7\xb6\
-\xedE\xf74\xb1\xcehf\x11\x8aPu\x02\xf5\xbd\xc6\
-1\xc9\xe6\x04\xa0\x99\x99\x99'\x9dY\x00\x9a\x99\x99\x99\
-\x99\xb9\x0f\x01\xa4\x12`@\xb0z\xe8E\xd0`\x80\x84\
-,$\x81DQ\x19\x91\xf2\xb0\xbf\x1a\xf6>\xf9\x14\xf5\
-\x8c\x9b\xa2;\x12\x83\x98Z\xfb\x9aNsxl\xab\x8e\
-\xc46b\x1a\xbb\x14\xcf\x10\x10\xd4i\xa4\x83\xf1\x5c\xb6\
-\xcfe\xa3\x03I\x0f-\xf2\xaa\xfa\xcb\x85;)\x85\xcc\
-\xec4\xb3\x07\x88)QZ\x00hV'\x8bk\x8ct\
-H\xac\xddf\x18\xd04\xde9\xd7\xe3\xfd\xdc\xc2yf\
-\x03 TE\xcc\x12\x18\xc1\x22\x91f\x99\xc8\xea\x9d'\
-c\xfb\x8b'\xddK/<\xf7\xe2\x8bw\xfe\xe8\xcb\xfd\
-\x0f\xdf\xc4x\xd2\xaf\xf2z\x81\x05K\xf2\xa0\x9a\xda$\
-G\x8fs\xae|fff\xe6q\xb0\xed\x02F\x03%\
-\x01F$\x12F\x19\xa9\xa9\x16+R\xc2j\xd9\xae\x96\
-\xcdd,\xad\xa5\xb6\xf6\xd8\xdbrq\x97\xc5_\xaf\xd8\
-\xc9\x12\xa02\xf61\xcdj\xcc\xfa\xcf\xcc\xcc\xcc\x13\xcd\
-,\x00\xcd\xcc\xcc<\xa9\x10`\x00\xf1~\x1b\xd0>\x0a\
-\xf1\xb3\xb8\x07\xdd\xea\x1c\xd5v\xb3\xcb\xc7|\xe4\x9b\xeb\
-Le\xa2\x9c\x0dk\x9e\x1a\xc4\x13Hb\x96\x81A\xf9\
-x\xe2\xbe&\xfaF%q\xb4\xf2:8\x10\xc6\xad\xc4\
-\x93|w?\xces\x9b\xba\xddb\xd59\xd9\x88\xb3S\
-\xb3\x0f\xe9\xdeu\x96wl\x03\xcf\xcb\x8f\x80\xa6\x14\xe7\
-\xd3\x1d\x9c\xfc?\xb5\xed\xfd\xb6B\xec4\xb9zr\xfe\
-\x9c\x0d\xab\xbe\x7f\xe1\xf7g\x15\x9d\xed\x12_\x84@\xca\
-H\xb6\xed&\xdf\xb0Il\xc5k\x8b+\xbf\xf9\xc5\xe7\
-\x9e~\xfa\xf3/\xbdp\xfc\xa5\xaf\x1d|\xe3;\xb7\xee\
-\xde=\xb2\xe6J\xb6=c7\xf0D\xa9\x10\xbc\xb4\x17\
-\xda\x83;}v\xa3/\xdb\xfb\xfb\xb3\xb9w\xff\xce\x03\
-\xa4\x99\x99wD\xa7\x813\xef\xf6\x8b\xf9\x8eK;\xfb\
-\xfd{\xa0&\xf6\xf1\xf0`n2\xcel\x7f\x5c\xf2\x82\
-w\x83\x0c\x1e\x08\xa0\x03VD6\xc4t\xd5\xb3d\xb9\
-1\xa4\xb6\xb5U\x9bA\xa04U\xa6qb\x1b\xa9\xff\
-\x18vw\xab\xbbK\x1e\xc5\xc3\x98\x84L\x13\xe0\xdf}\
-\x8d\xb7\x0e\xd9\xe5\xf9\xea633\xf3\xa43\x0b@3\
-33O(!\x862$\x80b\xe8T{\xe0\xb9;\
-\xef\xa9\xfc\x09\xc0\xb6\x0f\xba\xaa\xbb\xe5\xd1n#\x05\x19\
-\x90\x7f\x16\x97\xdf\xad\xcc\xe2\x86Q\x10\x90\xb6=\xca\x1f\
-mSkF\xf3}\xed\xda\x03\x80\x220\x02\x02\xa9&\
-A\x04\x8a\x226\xc2\x81T\x14\xbd0\xf2\xec@&\xb6\
-G\xf3\xfc\x86\xec\x1c@\xd3\x11}`\xf5g\x07U\x97\
-\x0dJ\xec\x9d\xc6\x0cqYx\x10P\xbdA<\xdd\xba\
-\xad\x9a\xa4\x8b\x86`:3D9\xfb \xce?r\xe1\
-\xba\x08\x00\x11\x88`\x16\x98\xe4\x0e\x09\x9e\xa1\x0c\x06(\
-6\xcd\xea\x1f\xbd\xf4\xd2\xf3\xff\xe1\xc5\x7f\xf4\xe9{\xff\
-\xf5\x0f\xf1\xe5\xbf\xbc\xf9\xe6\xad\x03\x0c{M\xb7\xb4\x14\
-\x83u\xd5\x1d%\x9c3I\x01S-\x050M{S\
-\x82\xedN\xe7\xd3\xc9\xf0\xfb\xb6\x170l]Z\xdc\xed\
-6`\x88Z\xfd\xa6\x9f\xc9\xe0sf\xe6#\x8c\xb6_\
-\xa6Z\xd94\x05\xa5\x11@\x01b\xba\x18\xc5\x14\x85,\
-\xd6\xcb}\x12(\x89\x08\x12g\xaej:\xdb\x1fQ \
-\xd9( \x17\x8d4\x81!\x85\x04{\xc4ob\xdd\xc2\
-\x00\x08\x0a\x8a3\x0fn\xd7\x89\x1a\xd5\xe6`\x01B\x90\
-\x94\xa1\xe6]\xeaYg/~\xd5\xe2\x09\xb4dc\xe8\
-E\x80\xc5\x91\x8d\x99\xcc\x0c6\xa3\xef/xe\xd5\xa6\
-\x96H\x83r/)\x89M\xa1\xf9#J?\x14M\xac\
-\x85\xc32\xd5\xcfD2\xfa\x02n\x88^4\xcb\x8e\xc6\
-\x5c\xed7~\xd8\xbc}/w\xdd;N\x19\xcc\xcc\xcc\
-\xcc|\xcc\x99\x05\xa0\x99\x99\x99'\x11\xa3\x22\xd8\x97E\
- \x81CX\x09\x85\xd5\xc2\x9d\x92\x14\x0b\x82\xc1\x00\x1c\
-y\x14\xa7\x917@\x94\x062\xd8\x08\xfae\x0b\xe76\
-\x0c\xe6\xccc\xaa\xc3t@@\x13\xba\xe6\x1a\xc4\x93\xe9\
-\xee\xfc11\xd2F\x1ab\xdd\xc4&\x0b\xee{\x01\x0b\
-\xac\x89\xe1\xbe\xc9\xe4\x07\x5c+\xf7\xef\x01 r\xb3\x15\
-\xbfvA\xc9Qk\x9bX\xb3\x90\xcb\x14nC\xa2\xa9\
-\xbf\xe3\xe6\x14\xeay\xe6\x8fK\xd5Y4\x09Q\xbb5\
-\xe9\xbe\xcd /\x9c\xee>}\xc4.\xbbm\x7f\xb8Q\
-H\xb0\xcb\xdb\xc0\xdf\x97\xe23m\xd3}\x13\xd1<\xf3\
-\xc36\x05\xe8\xa1[z\xd1z\x00@a\x8d\xa7\xa5\xa0\
-\xa4!q\x80\x22\xb9\xe0h\x99\xa0\xd1\xfb\xd7\xc8;\xd7\
-\x96W^\xfa\x95g>\xff\xecK_|\x19\x7f\xf8'\
-w\xff\xfe{?8\xee\xf3Q\xf7\xf4\xa6}V(\xd0\
-I\xc8\x8dc\x0d\xe86\x08\x91NcT\xeb@\x8eE\
-\x18\x91z@\xf0=\xfa^P\xf5\x1c\x16\x11\x86\x00\x85\
-\x04%\xca(\x902\xc9\x10\xc4h\x1a\x13\x0a\xa0\xc2\xb6\
-0\xcf\x8d\xe7gf\xee#,\x00XdD\x87X2\
-:0\x90n#\xf5H\x02\x80\x11\x11`\x06Z\x06E\
-\x98\xc6\xe4\xa5O\x16\xacM\x10\x91&\xb9~\xa7\xb2:\
-\xc8F\xdc\x1b\x87\x1cc4\x9d\xa5\x1c\xb0CE\xf1\x11\
-@z\xb0\x8c\xf5|t\xd9%\xdb\xaa\x0c\x00t\x98o\
-\xaf\x93\x06\xef\xb6\xe9\xfe\x05V7c\x00CL\x11W\
-\xa2\xec)J\x95U\x8c\x94\x9d*\xec\xb1\xf5'\xd9\x99\
-\xe9\x8f\xda\x9f\x90\x90\x11\x8c&\xe2:\xa8\x94\xdf\x88\xe4\
-n\x0at\x86\xbdE\xac\xf2Pp\xb2yi\xbf\xbct\
-e\x91\xb3{\xba\xe9\xab{t-\xac\xd3\xc6\xe8\x03L\
-\x8fP\x09\xc6\xa0\xb9\x91R\x1e\xc7,\xaf\x0ax,\x9a\
-\xf1\x19\xaa\x07n\xd2\x0b\x93\xa1\xcb'~\xed\xdeIv\
-\xef\x8ds\x00\xd0\xcc\xcc\xcc\x93\xce,\x00\xcd\xcc\xcc<\
-\xa1\x08\x08\x18\x98\x81~\xfb\xc0\x8e\xb4\x9d;\xbd\xbf\x9c\
-\x07\xa8\x86\xf5\xf7\xa1\xda\xd0\x84\x1cJ\x17\xca\x08\xef\x87\
-\x22\x15\x01\x11\xf4\x90\x9bR\x82\xd9\xfb(\xe8\xb90\x99\
-\xb3\x86\xe3\x9c\xf9\xad\x8e\x0a\xa69\xf0\x02\x80\xb2\x07\xab\
-\xae\x1e\xe8\xfau\xe16=x<\xde\xc5\xa6\xbf\x9f\xfb\
-\xf9\xf3\xef\xbd\xf8\xe3\xb8p\xf1\x0f>\xf8\x0e[Q\x0f\
-\x93\x01)\xa0\xa4L\x15\xc0'mJ\x0ex\x22\x10\x83\
-\x1f\x1fd\xf9g_\xfc\xf4\xea_\xff\xd2K\xcf\xdd\xfd\
-\xea\x9f}\xef\xcf\xbf\xb1\xf9\xab;w\x0e\xfaEn\xb8\
-hd\x995\xc64\x22\x22D)Ys\xda\xda\x86\xd2\
-dO\x8bI\xa3\xe4\xfd\x865\x9d\x86\xa5\xd6O*v\
-\xee&N\x0e\xa0m\xc2\xd1\xcc\xcc\xcc\x19xz\x0d\x13\
-`\xa82\x10\x0b\x1a\x03!\x07\x03 \xacMh\x0c\xad\
-C\x0a'\xad\xa5AZG\xfdb\xa9\x0a\xe7\xb1\xb3\xe3\
-D\xb5\xfb\x08\x11-\xcd\x8c@l\x84\xa0\xc12\xf8\xc8\
-%Y\xa8\x7f\xaa|\xbb\xc1\xbb\x07\xed\xf4\xd7Ix/\
-\xdb|\xfe\x0ce`|WG\xe3\xc1\xd5\xa9\x01\x06`\
--+\x81\xc6\xd1\x01\x99\xc8\xf4\xa0\xfcJcW\x97]\
-\xceP\xea\xa3Q&\x0d\x09\x0e\xbd\x8f:l\x8a\x80`\
-\x92M\x1e\xa7\x84L\xb5\x16\x0e\xab\xaa\x95\xc3R?\xa4\
-\xcd\x904\xdb\x1agffff\x01hff\xe6I\
-\x86\x90\xc9q\xae\x0a\x06\x80\x80\x11\xb0\xaaY\xe8\xfe>\
-Qx\xef\x82\xca}ED\x058!z\x9e{\xea\xfd\
-B`3\xb2\x88\xa0\x05\xe0\x125 j\xe9\xc1#/\
-\xf2=\xbdj\xbe\xb5~G\x9c8\xde\xfe\xaci\xd0S\
-\xcb\xadj\x92uc\x88\xf6\xde\xf1\x9a~\xe7\xc63/\
-\xff\xab\xdf\xfd\xe4\xcb\x9f\x1e^\xf8\xd4\x0f\xe3K\xeb\xaf\
-\x7f\xff'\xeb\xa3\xd4\xb4\xb6\xdc\xcf\xa9]\xae\x8bm\xc6\
-\x82&\xe7\xb6\x1d\xd1\x87\x06R\xa0\xcci\xca\x8c=\x1b\
-\x9f\x22\xe8i\x18\xd3fwn\xd7\xec\xed\xad(\x98\x00\
-\x03\xd3vc\x02`\xa0)\x10\x10z\x0c\x99&33\
-\x1fC\xb6\xdaI\x00#8\x82\x03\xe8\xdb@c\x00@\
-\xd3\x92\x0b9\x86\x93\xe3Q0.\x1a}*\xa5\x02\x7f\
-C\xd1\x8b\x1d\x94\x81\x00\x8a0J\x05\x10\xcc\xa4F\x9e\
-r\x93Sn\xc9\x1e\xe5\x18\xa5\xb0\x83\xb5@\xff\xc8\x22\
-\xfee\xea\xf5\x83\xe2\xfe\xae4l\x9a\xf6\xb8\xaf\xc8y\
-\xf7\xeby_\xeb\xe9\xfc\x82\xce\x1d\x82\x0c\x91\xc8\x86d\
-\x02TB%C\xdd*-\x96lR\xce\xd6E\xac\xe1\
-\xaa\x8eQ\xd8\xfb\xcd\x1d\xab\x17Qc-w\x934\xc2\
-b;\xffa\x88v3z_$\xa8f\xf2\xcf\xcc\xcc\
-\xcc<\xc9\xcc\x02\xd0\xcc\xcc\xcc\x93\x0b\x05JPp\xaa\
-\xa2\x11j\xca\x03\xe34\xa0F\xba\xef\x0e\xf7\xbd\xae\xe4\
-\xbcFB\xc0\xc1\x01\xf0G\x8e\x11\xbal5\x9f\xbe^\
-\xf6:L\xf5\x02\x14T\x08\xf2\xfe,\x9d\x99\x9f\x0b5\
-\xfc\xc3\xc9\x11\x00Y\x93\x93\xb8=\xbb\x84\x80\x17\x10\xc9\
-\xda\xa65\x8eq\xd8\xf7o\xe7\xc5\xd5\xcf\xbe\xf2\xcc\xd5\
-\x1bW\x9f~9>\xf5\xd5\xf5_\xff\xcd[\xaf\xbe~\
-\xcb\xef1]k\xba\xb4\xe7\x8d\xf5In\xe1\xec\x1dk\
-R\x84\xb2\x1az\xc3\xe88^Oj\xbd};\xf2\x89\
-My%\x93\x16\xc8I\xed\x9c\x9cAT-\xbd\x90@\
-\xd1\xb6\xfd\xc6\xf0XO\xcf\x99\x99\x8f\x09\xbb\x98a0\
-N\xff\xab\xdf\xa8\xaae\xc84X\x89\x18\xe5\xec`\x5c\
-B\xcfZ\x0a,\x0b\xb8\x86w@\x03\x006\xc26\xe0\
-\x06\x0c #\x12\x86\x06j\xc1\x8c8\x86\xd6\xa4 0\
-\xb6z\xcc\x07(\xb0OvMN\xf1\xfc:c\xe0T\
-\xbdR\xf0\xb4\x10VDl\xb3\xe6(\x08VE\x16\x82\
-\x84I\xf2pS1`o\xd5\xaeVMN&\x91u\
-\x81\x0a\x22\xe1\xe2\xfa\xdf\xf7\xb2\xb5\x00\xb6y}\x94X\
-\x05\xa1\xc9\xe9H1oz\xef\xc7\xdd\x86\xcf\xcc\xcc\xcc\
-<\xd1\xcc\x02\xd0\xcc\xcc\xcc\x13\xca\xb6ti2\xfa\xec\
-\x0a\x948M\x90\x1a\x05\x98b\x9b \xa3\xdd-\xef\xbb\
-\xbdS\xbd/.\x18\x10a\x06+P\xe1\xa4:=\xa6\
-}\x09\x90\xfa\xc5g\xd6W\xbbk`K\xb3\xc4\x08\xba\
-\xfc>\x01j\xe6\xe7\x09)\x12\x12\x08\x89\xb5\xfcj\x9a\
-\xb3\x06\x05\xab\x8d\xe6\xbdm\x0d>\x9c\xac\xdf8Y\xdf\
-j\xba\xc5sW\xaf\xfd\xde\xef>\xf3\x0b\x9f\xd3\x9f|\
-\xf9\xe4\xf7\xff\xe0\xd6w\xbe\xaf\x93\x83\x83v_\xfb\xcb\
-}\x8e<Y\x0fj\x16\x96Z\xb0\x10.B&\xc4\xa8\
-|\x1cZ+\x8d\xa2E\x8dF\x05Dm\xe3\xa1\xb5\xcb\
-\x9f\xe2N\x11B\x95\x83\xaa|8\x9f433\x17Q\
-\x03\x9e\x050D\x07\x82\x0cQ\x14\xe4\x80\x04\x97\x07\x94\
-\xdb\xae\xb9\x96\xf7\xe2\xf8\xa8{\xf5\xd5\xbb1\xa6\xb4\xda\
-\x8b\xbcG\xef\x84\x04\x086\xca\xfaHk\xd1\x93u\x0a\
-\xf3\x91)rW\x0a\xc5\xbdk\xcf]\xbdZ\x10'\x1c\
-\xfb$M\x8a\xca\x07\x82\xb6\x02\xd0nVD\xbb?\x92\
-8U\x82\xee\x7f1 n/hu\xa6#8\xcd\xa0\
-D\xa8\x04\xc1\xbd\xbdv\xb9\xca\xc0\x18\xee\x11\xc8\x02\x22\
-@C\x0d\x93{4\xa8z]\xdd]\xb3\x08\x91\xd3z\
-\x01 %\xa6n\xdd\xb3\x1f\x9c\x8f\xbb\xe1\xfc\xcc\xcc\xcc\
-\xccG\x91Y\x00\x9a\x99\x99yB\xd1\x14\x8d \xa0$\
-\xb8\x9d{\xa6\x00\xf9q\x18g\xee\xbb\xddL\x00\xc0\xd1\
-l\x03\x8c\xaa]\xba\x1e\xc7|du\xb5\xff\xed\x9b\xe9\
-\xee\xc6\xd0&$\x98\xc1\xc2K\x91\x921o\xa7ng\
-~\xde\xa4:r\x9clY\x0d\xd0L\x92#\x99\x16\x90\
-J\xf8\x06\xec\x9b\x8cU\xf2\xa1 \x06\x0e\x07M\xb7\x5c\
-\xfe\xca\xf3\xcbO\xfe;\xfe\xc2\xb3/\xfc\xd7/\x95?\
-\xfb\xe6\xe1Oo\x1d\x0c\xc7\x89\xab\x1b\xb9\xdb\x1b\xc8\xe2\
-A\xdb\xc0\xd6\x86\x11\x0c\xa4\xc1\xe0\x11p+\x0e\x9d)\
-z\x88\xba\x0d[\x01\xc8\xb6\xa5\x1f\xbb\x7f\xe1\xd5\x9e\x00\
-\xe7\xa3w\x83\x9e\x99\xf9\xf8rz!-\xb4!\xd0l\
-\xd5\x92*{di\x01\xacRZ\xa6\x85\x95\xe8\xbf\xfb\
-\x0f\x9b?\xfd\xfd\xef\x7f\xf3\xe6\xfe\x9b{\xd7\xcc21\
-\xec\x84\x940\x84e\x80\xc9\x8c4(,F\x8c\xe5\xd3\
-+\xfd/\xbfu\xe3\xd7~m\x7f\x91\xdfJ\xe5\xed\xc4\
-\xe3\x9f\x8b\x8a\x1f\xdb\xdd\xbd\xefO\xc7n.\xe4\xf4\xa9\
-\x07\x93\xe2\x04\x11\x0831At\xcf\x86\xfd\xab\xed\xb2\
-CD\x1f%&\x8f\xcec\xf9\xb3T\xa5\xf4s\x02\x90\
-#|\xaad\xcdM\xa8;<\xc2\xd0\x07\xf9\xa8QC\
-3333\x1f#f\x01hff\xe6I\xe6t\xdc\
-\xfb\x00?#\xbd\x84\xdb\xb1\xf7c](!\xe1\xef\xdf\
-n\xde>\xe6\xd4N\xa5\xba\xe1\x1fo\x99\xd9\xcc\xe3\x80\
-\xf7\xffV=f\x84\x91F\x16\x94\xd1\xe5H\x0d\xf6\x16\
-(\xae\x93\xcdppkX4\x07O]}\xf1w\x7f\
-\xe7S\xcf\xbe\xd8|\xf2\x95\xb7\xff\xdb\x9f\xfe\xf4o\xbe\
-{\xfb\xf0\xa0\xe8\xea\x95f\xb9\x08\x98\x04E\x02\xa2\xce\
-\xd4\x07\x0b\x8d\xa2\xde\x85\x8e\xa93\xff\x1a\x1e\x93(9\
-3\xf3\x04\xb0\xcd\xd3\xa9%Z\x19`\x82\xc8R\x8du\
-i(x\xfd\xd5\xc3?\xf8v\xf9\x93\xa3\xc5\xd1\xf2\xa4\
-\x85\xef\xbe\xff\x9a\x8a\xc6\xea\xef\xa3&]\x05\x1b\xb7_\
-jN~\xf9\xa5\xf4\xc5_\xbfn\x8b\x05\x94Q\xf0A\
-\xd7\x80=*\xf7E\xcd\x03\xa6\x10\xe5@i[\x5c\xbb\
-\xda\xad\x96IQ\xa2\xc4te\xf2]E\xd9\xfb\xc4\xb6\
-Y\xd7u\xed\x82\xa2\xa6h\xc3\x9a!\xec\xde\xbdM\xdf\
-s\x16\x80ffff0\x0b@333O0\x22\
-2\xd5A\xa9\xde]\x9f7\xb6\xfb\x14\x81\xb0}xJ\
-\x19\xb0\xa9\xfd\xcbC\xb1\xed\xfd\xfa\x83\xf7\xb5\x04M\x80\
-\xc4)\x81\xe8q\xa2\xa3\x811\xda\x10h\xeb\xf8\xe3}\
-\xb5\xc8\x9ay\xdc\x08\x16\xa7?\x0b6I/\x04 y\
-\x9f\xe0\x96d\x812BbJ4*e\x8d\x06\x09~\
-r\xa7[\xe8\x1f\x7f\xf6\x85go<\xfd\xe9O\xda\xff\
-\xfe\xc7o|\xe5\xaf\x8f_\xbbs\xac\xa1\xb5\xe55\xe5\
-NX\x06\x9a\xb0!\xac\x8f\xd4\x03\xeeZ\x02\x8bP@\
-\xb5\xe3\x17\x19\xb5\x06\xcc\xa7\x1ea\xa7\x1a\xe1d\x08\x12\
-\x1b\x09\x06\xff\xa8\x8c9gf>h\xb6\xdf\x8c\xe0\xd4\
-kO\xd4\xd47\x12.\x8e\x81\xde\xd4\x04\xb3u\xfb\xb9\
-=\xb9\xbd\xd2\xa0\xbd\x1b\xcb\xb0\x875\xbb\x9a\xbek\x83\
-'1\x8e\xbb\xe4\xfb\xcb\xa1\xcd\xd6\xab\x05\xf9a\xfa.\
-\xea\xfc\xbf\x01\xecr\x8a\x02&\x04 \x83\x18\xc9#\x1b\
-\xc82\x98\xc6U\xa7\xebWm\xb5rjTQ\x12\x98\
-\x93\x02\xf0\xe0#\x97\x9cR\xb0\x00\x85\xa01\xc3j\x1b\
-J\x01Et\x81LI\xc8\x9b!\xad\xd7Q\x0a\xcf\xb5\
-?\x9b\x99\x99\x99yR\x99\x05\xa0\x99\x99\x99'\x95\x1a\
-\xcb{\xb6\xa7\xfb\xe9\xcd\xa1v\x0e\x1aj\xab\xa1L\x99\
-\x08\xaa\xb9)\x0f\xb9\x8b\xaci+\xc6mM\x00\x08A\
-\x88:\xe3K\x93\xf03hGK\xb8\xac/8\x19\x15\
-\x8e\x1c\xcc\xe4$T\xcdw\xbc\x1f\x0e\xb6M\xdf!\x12\
-\xa4T\x13\xc7!\x1a\x14\x92\x17\x1f,Ej`\x89\x08\
-a-\x02\xd9\x90\x13\x90\x00n\xfa\xfe\x8d\xfed|j\
-\xff\x95\x7f\xfb\x7f\xf8\xfc\x8b\x9f\xfe\xc2'_y\xeb\x8f\
-\xbe\xf2\xc3o\xff\xc3\x9b'\xc7)-[\xe6d\x06\xa1\
-\x84\x14V\x88\x00\x0d\x91\xc1\xd0d;\x13\xc2\xa8 %\
-\xf8\xe9\xe9Nm\x1b\xc3K\xa2\x08\xd51\xe7\xcc\xcc\xcc\
-9\x04\xa0~\xb1\xc4\xe9/\x04\x80\xfaw\x82.\xc1)\
-'B\x90\x04\xa465\x8b\xce\x8e[\xf8\xb6\xb3\xe4;\
-@\xc8\xda\x94V\x0bO\xb9w\xcf\xe1\xef5|\xee\xb1\
-3\x85\xfe\x5c\xb8\xedg\x02\x7f\xc4\x9agfb\x8d\xa4\
-ODb\x14\x86\x9bJ\xd7j\xb5Jm\x07\x93l\x12\
-\x8c\x0c\x02\xc2y\x99\x0d\xf7\x1d\xa9\xe9iD\xcd\xec3\
-Q8M\x80\x16\x0dL\x22K\xd1w_\xcf\xb7N\xd0\
-4\xf3_\xc3\x99\x99\x99\x99Y\x00\x9a\x99\x99y\x22\xa9\
-\x96\x8bR\xd8\x8f\xd6\xee\xef\x91\x18\x8e\x0f-\x95\xb6\xdb\
-\x1a\xc9\xb9\xb5\xffh\x1b\xd3[\x93\x1b( \xa08\x7f\
-\xc3\xba\xb3\xf5S\x80<j\xde/\x91\xb6\x8dR\x02;\
-\xbb\x8f\x9a\xc2%R\x88\xf1\xd8R\xa0\x01\x03\xc7\xb0{\
-\xbd\x1f\x97f\xd9]\xb7r\x82\x93\x1e\x90R\x15\xba&\
-\x83\x93$I O\xe30g\x93\xd0\x07\x07\xeb\xd4\xf8\
-\xa4<\xb2L=\xc0j#!+\x86\xa0D\x82\x06\xb8\
-\xa1L\xaf\x172\x9a\xcc\x05\xb2\xd4\x8f\x9b8\xf9\xf1^\
-\xdb\xff\xea\xa7\xae=\xff\xbf\xf0W\x7f\xe1\xca\xef\xff\xc9\
-\xdb\x7f\xfe\xcd{?\xbd\xe5'}j\xf6\x98,\x9f\x0c\
-M\xc1\x0b\x8bE\xc7\x18\x19c\xd3t4\x8c\x1b\xf7\x08\
-21\x19\xd9@\x9b`\x01\x02\x8c\xad\x00TO\xfb\xc2\
-m.\xd1\xcf\xf9h\xcd\xfc,\xd1\xf9/\xfe\xee\x82@\
-R\x0f\xbd&\xd4W\xd6\xd7<\xb8\x90\xddr\xa6K\xcd\
-\x99\xc7\x1f\xbe\xd8\x8f\x0c\x9e\x81\x1a\xbc\x1f`\x04\x1c\xd5\
-\x12Z\xfd%\x01\xb2X^\x07\x19\x8cb\xda\xc8zu\
-\xb2w\xd5~\xbc\xfa\xf1\x9a\x82\xbda\xd8\xdf\xbc\xd9\xe9\
-u\x96\x1e2q:\x98?\xb3\x18c\xde\xcf\xd9ZP\
-\x9d{\xa1mSwv\xcfh'\x17\x13\x96\x0c\x11\x82\
-\x1b\x0cLT(\x0a\xd0/\x97\xb8vMM>\xf2\xcd\
-Q\x92i\xcc\x92\x99\x01\xd9\xb7V\xc8\xf7\x8e\x00\xd6\x8e\
-\x0dV\xb7\x03\x10\x15\x90\x13 \xad\xc8\x03\x1a\xa3\xf9\x9b\
-\xd7\xf4\xd6q\xb9\xb2\xf7\xf18\x05gfff\xde\x17\
-\xb3\x00433\xf3\xa4B\x14\xc70&(\xc9Z\xc1\
-tv\xcc+\x9c649\xc7Cbu\xb85\xfb\xc0\
-h\xac\xddpI\x84BS;y\x0a`\xe3\xcc\x82o\
-\xe7\x8e\x1f\x0f9\xb1\x1f\xf8\xc7\xdf^\xff\xb3_o\x7f\
-\xe9\xa5=?\xe8\xad\xc4\xe9\xbc\xf1<\x96\xff\x90 \x83\
-\xd2\xd6l&\xd0\x05\x89\x05tK\x22a\xd5\x97\xe3D\
-\xa9\x1e\x83\x06\xdeH\x0d\xb4D\xd0\xf2\xc9\x95\xf6\xb0\xe0\
-\xed\xf1\xce\xdbLx\xf9\xca\xb5\xe7\x7f\xfb\xc6\xa7^x\
-\xe9\x95O\x9e\xfc\xe1W\xee}\xf3\xfbG\x07\xc7\x88n\
-\xbfi_\xa6=\xe7J\x18\xdeH>\x18\x98\xac%Q\
-\x14R\xad\xf52\xd0\xb7bg\xdd\x92:\xa0w\xa0\xa0\
-v)\x9a\xf9X\xf33\x16\x14>\xae\x10H\x08\x03\x87\
-\xfa{0N3\xf6m\xaa?\x22\x0a\x09$\x22wn\
-\xedXK\xb8\xde\x9d\xa6\x1aD+\xed\xfbp\xa5\xdcJ\
-\xbc\x03\xb0&|}`\xd4\x8e^\xa1\xeab\xaayu\
-\x8a\xda\xdf\x1d\xc0\xd6\x10\xc4\xb3\x11s\x02\x81p\x95\xe2\
-\x89\x10\x83DNIh\xe54\x9d\x18\xc6\xfd\xfd|\xe3\
-iuy\xed\xb11\xa6\x88\x06N\xe6\xc0\xfb\xe8\x00v\
-n\xab\xa7R\xdaz\x8c\x1d\x14HW\x09\xb0/\xa9\x14\
-r\xfe+8333\x03`\x16\x80fff\x9eP\
-j\x1f_\x18\xad\xeb\xd7G\xb2\xc8]J \x06\xa9f\
-\xe7\x14\x11@\xdai@\xbb\x1b\xf0w\xc8U&\x91R\
-\xa2Y]\x87\x02\x8aZ\x0e@RBBZ\x1d\xac\xbb\
-o\xfdD\xc5\xd1\xa4\xc7\x16\xb8\xdb$n\x80/\x7f\xab\
-\xff\xe1[\xed/\xbc\xdc\xad7\xb8\xa2&'\x03\xcac\
-Y\xfe\xcc\xe3`\xa7'\xee>\xf4\x00|\xca\x91\xadC\
-\xc433\xe9\xf0\x04-\x81\xa4\x14\x91O\xcch(\x90\
-\x99,+\x220\xde\xdbpq\xfc\xb9\x17\xae\xef\xfd\x9b\
-\xbdO\xbc\x98\xff\xe8\xabo\xfc\xe9_\xc5Oo\x1f\x1b\
-\x0f\xdbn1\x16\x10k\xe3\xa6l\xfa\xb0E\x9b\xf7r\
-\xdb\x16\x0fW\xf1\x08&\x0a\xa9j@\xbb\xad\xa1\x1eT\
-<g>\x9e<\xc4\x92\xf3\xf1q\xeb\xfc,\xd0\xf9\xc2\
-\xe1\xfaX\xfd\xdf9!\xa3j\xa9E\x04\xe9\xef\xbe\xa7\
-dC\xdd\x1c\x9a7\x87\x85,\x01Kax,[\xfd\
-.\xa9\x9d\xdb!q\xaa\xa3\x9a\x1e\xd9u\xec\x22vA\
-\xf3\xa71@\x9a4d\x8f\xa0<\xac\x112\xab\x08\xd3\
-\x18\x13\x91\x0dO_\xd7\xd5kj\x1b\x94$+AK\
- !\x97\x1c\xe2\xfb\x10\x22\xb5\xdd\xf0\xb3\x8f\x04\x14P\
-Xn\x90\xdbM\xaf\xb1\xdc\x9f\xf37333\xf3\xc4\
-2\x0b@333O(M\xe2\x1b\xf7\xf4\x9d7\xec\
-\xd7>\xb3W\xca\xb8Zt\x86\xa2a\xac\xfd\xdf5\x80\
-F\x90\x9aR-'\xc3;\x11@\x04\x1e\xb8\xe1\xac\x10\
-\x00\x8c\xb5\xaa\x07\x90\xa6\xc8]$3#\xbc\xd0\xe8\xdd\
-\x1bw\x16_\xffQ\x1e\xdcW\xed\xe3\x1bg\x11\x04K\
-\xe0\xde\xd0\x9c`I\x1eN\xc3{9\x18\xa7\x1b7\xf3\
-sD\x09\xca\x008)>\x22\x06R\xb5&\x8c\xd8~\
-P\x22\x94\xa0\x16Z\xa2\xecA\xc9\xf3\xdd1\x1f\x98Y\
-\xab6\xb9Y\xb4\x09\x03,\xa2\xf48y\xcb\xda[\x9f\
-\xbd\xb1\xf7\xfc\xbf\xb8\xf6\xb9\x97_\xfa\xcc'6\xff\xe5\
-O6\xdf\xfa\xc1\xed{w7m\xdb\xed\xef\x0f9o\
-\x86\x91c\x91{J9\xb7\xa9qK\xa3\xac\x00\xa2\x83\
-\x04\xa3\xce\xe6\x1b\x90\xa4\xdd\xc9\xfc\x18\xeb\x13\x9f\x1c\xde\
-M\xf1\xd4{}\xe3\xcf\xc8\xa4s\xd9b?\x84\xd2\xcf\
-%\x9b\xb4\xd5$>\xb0K\x1b\x05\x19\x22#2\xa2D\
-Sb\xd2Kj\xcb\xf3S5\x95\x84\xd9\x18<\x91\xb5\
-\xa5AX\x22\xdaw\xa3\xf5\x13h\x0d\xaf\x0f\xed\xab\xfd\
-Uj\x898\x22n\x0b\x9b\x0f,\x91]\x00aF\xcb\
-d\xaeEk\x86r\xda\x22\x10U6\xdei\xd9U1\
-\x0e\x01D\xcef\xb2\x80\x93\x00c,c\xf2B+\x92\
-'\xe2\xfaS\xdc[\x0d\xa6\x11>\x00\x89i\x9f\x04\xac\
-\x87?z\xc2\x91\xacj=\x84\x8cA\xa0\xaf\xd5\x89`\
-Q(\x08k\x9b\xc8\xed\xd1\x1a'\x834\xbb\xddff\
-ff\x00\xcc\x02\xd0\xcc\xcc\xcc\x93\x89\x84e\xcb\x1f\xbd\
-\xbd\xfe\xea\xf7\xf2\xef\xfc\xf2\xb5\x93a,\xb1N\x80\x08\
-c\xb5_\xec\x82ZNguy\xe6\x87K\xee\xe5\x09\
-\xc8\xa3\x16\x05\xa4\xf3\x8f\x83D\xb2f=\xda\xed\x83\x8d\
-{1\x18\xf9\x18\x13x\xd44\x1c\xdd\xfe\xe8/\x8f\x7f\
-\xe3\xf3O\xfd\xe2\xb5\xeb\xe9\x8d\x82qD;\x0b?\x1f\
-\x1e\xf4\xc0\x0f\xdbSi\xfb\xcf\xb6\x9c\xa4\xceWo\xa7\
-\xacMa\x0eD\x84\x99H\x10\xccP\xb1:\x1d?\x14\
-?>hW\xcd/}\xe6\x93\xd7\xae]{\xe6\xb9\xf5\
-\x7f\xfb\xd3\xd7\xbe\xfe7\x87o\xdf\xba\xbb9\x18V+\
-[-\x16a\xb6\x1e\xc6\xb1\xacCBc4\x13,j\
-\xd6\x87\x91\x88jj\x10\xb7}\xcaH\xbd\x8b\xf1\xea\xcc\
-\xcc\x93JM\xefz\x98\xaaCT\xf1=\xbd'uC\
-@\xa2\x088XU\x8d\xc7f\x13}Gv\xf6\xc4\x07\
-\x0d\xaf;\x01J:\xf7\x823\xa4\x94\x12r?\xf6\x92\
-\xab\xb8\x177\x81$\xc2\x9b\x06W\xaf\xaa\xeb\xfaq\x1c\
-K\x09sd\x11\xd5'\xfb>J\xc0\xce\x1c\x99m`\
-\xdf\xa4\x0aF\xdd\xd0\xdc\xb4\x9e\xda\x83\xa3\x93M?\x1a\
-\xdb\xf9O\xe1\xcc\xcc\xcc\x0cf\x01hff\xe6\x09E\
-H\x86u_n\x1e\x88\xf6L\xbb\xc0\xfa\xf8\x8eR4\
-\x19V\xe7s\xdb\x16c\x86X3&\xb7\xf7\x94\xf5\xad\
-\x0f\x87\xdb\x7f\xa7\x09\xc7\x1a-\x14\xe1\x80\xac{jS\
-\xae\xbdy\xe7\xd6P\xf0x\xa7#%\xb4\x19\x9b\xb0\xff\
-\xfe\xb5\xfe\xff\xf4\xaf\xf4+\xbfqCo\xac}\x1c\xd8\
-\x8d\x1f\xd8\xec\xf1\xcc;\xe1g\xc6:\x19\x80)AT\
-\xf5\xe0\x9c-P\xa0\xc3\x0a0\xa0!\x94\x99\xc6\x94A\
-\x091\x00\x06.\xa0\x0e\x0a\x04\x91\x04\xf6q2\x0e\xeb\
-C\xb4\xaf\xbf\xb8\x8a\xff\xf9w\xae\xfe\xa3\x97\x9e\xfe\xf3\
-\xcf\x1c\x7f\xf5k\xc3\xb7\xbe_\xeem\x10D\xee\xc6E\
-6\xa8\xdf\x94M\x89\x8ce\x87\x84\x10\x05#\xcc\x10\x06\
-\xd6,\xd5$\x83\xe8\x0fiW=3\xf3D\xe3\x17<\
-\xa6m\x1dg\x9c)\x1a\xa6\x11D\xb4\xef \x14]\x80\
-\x0dy\xbc\xb7\xbc\xb5\xa7;m\x14\xfb\x80\xabx5e\
-\xff0v\xcd\x00k\xe0w\xeclc\x86\xb3\xc25\x8c\
-S\x80\x9e\x10\xc5G\xc6h\x199Y\xa3lr\x85\xef\
-\xed\xe3\xc6S\xd15\x1bw\x8f\x80\x02\x08\x22\xa5\xe9X\
-=\xaa\x00\xa4\x8b\xff\xb6E]\x22A\xe4\xa6\xa0\xbd{\
-xo3\x049\xf7\x80\x9f\x99\x99\x99\x01f\x01hf\
-f\xe6\xc9\xa4\xde\x9c\x8f\x817o\x0f\xb7\xef\x8e\xfb\xd7\
-;G.\x8a6\x03#$cnd\x19.\xc0\xa6\xa9\
-En\xefx\x1f\xd4Rj\xbc\xa7\x00\x04\x90H\x10\xc9\
-\xcc\x00D\x04I\x0f\x97\x17\x80)\xef\x9d\x1c\xdb\xdd[\
-\x07\x1e\x02\xed\xf1\xde\x8e\x920\xa2\x04o\x1d\xdc\xdb\x8c\
-]g+\xf2\x04\xec\x1f\xe7:f\xde\x0f\xdc\xca\x88\xb4\
-\x9a\xb2\xb1M\x06\x99j\x0a\xa7AT\xfd\x1f\x03Vc\
-D@s\x9a\x18\x80IA\x06\x11\x0d$\x90(\x0en\
-\x9a\x9c\x13qrr\xab\xef\xfb\xfd\xab/\xff\xca\xe7V\
-/^}\xf1s/>\xf3?\xbev\xfb\xcf\xbfs\xf3\
-\xa7o\x0d\xf7\x0e\xd1.\xd1\xae\xb2[;\x14\x97\x8f\xcc\
-\x16\xa0`\xb5\xe1\x8f\x91\x0cR4\x11\xa2\xcf\x9a\xe1\x13\
-\xc0\xd9\x9a\x98\xb3eVs\xad\xcc\xc5Tw\x09\xb7\xff\
-\x9d:P8\xa5wi\x97\x93\xa3Z<L\xa9\x16(\
-\xc5\xb6\x07\xd8\xbb:\xb2\xa23\x86f\xd3x\x9f\x0cI\
-\xdb\x95} \x90H\xa4\x9d\xd1zD\x02\x08\x11B\x22\
-\xd3dM<-\x013J\x84(E\x00H\xc9R\x0b\
-\xa2Mc\xf6\xf5\x11\xa3\xbfv\x15\xcf=\xbbZ,\xb2\
-\x8d\xa3%0\x0cL\x08\x22\xf4~\xce5I\xb5\xfd\x97\
-\xc5\xaek'\xb0\xcb0\x22d68\xee\x1e\xc4\xa6\xd6\
-t\xcf\x02\xd0\xcc\xcc\xcc\xcc,\x00\xcd\xcc\xcc<\xb1\x18\
-\x00\xa6\xdb\xb7\x8f~\xf2\x83\x1f\xbd\xf2\x85\xa7,/\x0d\
-\x8d0\x86\x98@D@\x10k\xdegm\x99\xf4pN\
-G\xcc\xbb@K\x09\x0a\x22B\x01\x09\x96\x0c>\xbc\xf5\
-\xc6\x9b_\xff\x87{\xfd\xd85\xe9\xf1U\xd9lW\x9e\
-\x8c.\xfb\xd3\xaf\xdf\xfb\xe7/\xa4_\xd9kiK\xe1\
-h')\xcc\xfc\x9c!\xa6\xceo\x0a \xa0<9\xc5\
-d\xa0D\x07\x14S\xf2jD*\x90\x90\x0b`d\xc9\
-c\x86\xc2<\xc8P\x1ah\xa5\x06\x99+D\x13hQ\
-\x98\x91\xa9\x88\xfe \xfb\xf8\xe2\x15<\xf5E]\x7f\xfa\
-\xeaS\x9f\xc4\x1f\x7f\xe5\xce\xdf~\xd7\xfb\x1e\xd6\xf5\xed\
-bQ\xdav#\x14\x8da.\x88Tu\xbdQFe\
-\x8bDYI.\xd6L\xe8\xca<pzW<\xb2t\
-\xf2\xc1k.\x97%=\x7f\x08\xbb\x83]\xbe1\xdb+\
-\xed\x07\xb5!\x00\xb6\x06\x93\xa8\xeb\x0e\x900 SQ\
-\x1f\x06\x09\x8e\x90 \x83\x9a\x85-rr\xa9>\xf1n\
-PH\xe6ve\xb4\x85\xc3B\xb2w\xd3A\xfe}R\
-\xafK\x04(\x9a\x99\x92\xd1\x8c\xc1H\xa8\xfbm$\xa1\
- \xc93\x02\xd0T\xa8\xca)\x84NDnrj2\
-\xe1$K\xc4\xb0\x1e\xae\xe5\xf4\xe2KW\x9f}\xbek\
-\xdb\xdeJ\xc9\x06\xcb\x86b\x80T\xc4\xfc>\x8a\xdc\xaa\
-\xecS;~\xedJ\xc0&\x85\x8e\x22\x04\x1f\xc6\xa1?\
-\xeaUZ\xda\x87\xe8\x94\x9e\x99\x99\x99\xf992\x0b@\
-333O.MN\xdf{k\xfdG\x7f}\xeb3\
-\xbf\xb0\xba\xfa\xd4\x95a\xb3\xf2\xfe@\xb2d\xc9\x87\x22\
-4L\xcd\xe4\xc5\xd8\x0a@\xb5\xd1\xec%\xf9\xb8\x01\xb2\
-\xde\xbeW\xc9E\xce\x08\x12\xc80K\xad\xed'\xef\x0f\
-\xfe\xe3\x97\xed\x8f\xbe\xdf5]\x93\xed1\xde\xd4\xb3\x0e\
-\xdcR\x82\xc2~\xffk\xf6\xef?u\xf8+\xff\xfc\x06\
-\x9c,~\xe6J\xbf\x9b\xa4~\xf8\xad\xf0\xac\x17\xbd\x1b\
-\x1e\xe9(\xed\xa4\xc1)v\xa76\x5c7Hd\x81\x0d\
-\x82\x8b\x10\xe1,d\x89\x04\x11\xcd\x98\x9a\xa1\x93\x5c\x18\
-db\xee\xa7\xac \x87\x0c\xb4N\x0e\x14\xb5\xcc\x96\x85\
-r\x0b\xfd\x9b\xd0\xd0f\xfd\xda/|.\xbf\xfc;\xcf\
-\x7f\xf2\xe8+_\xf9\xc1\x9f\xfd\xf5k\xaf\xdf\xdd\x94\x02\
-\xee%\xa5\xd6\xa9\xd1D\xc8\xea\xe6T\xebB\x18\xa3\xb1\
-H\xc8\x05\xb5_\xfc\xb4\xd5q_\x80\x91\x1e\xd8\xab\xf9\
-\xa4\xf9\xc8\xf1\x10\x0d\xe8C%\x00}\xc8(\xc0\xa4\xe4\
-Nb-\x98\xd1\x00;\x01H\xb0\x02\xc9\xc0\xc4\xe6\xf5\
-\xc3\xe6\xd6I4\xf7\xf7\x0d\xbb\x94\xd1\xf9\xccb\xf8d\
-\xb7Y\xf6\x91\x11\x97\xe4\xed<fD\x08\x04s\xd0\xc7\
-\xc2\xf5Z'\x83\x82\x08\xa2\x18\x9c\x00\xbc\xfa\x99(e\
-\xa0\xfa\x04Q\x8b\xde\x0cnp ! \x0a\xd2\xe0\xa5\
-x.E\xebat\xbc\xfc\xec'~\xe9\x8b\x9fz\xfa\
-\xf9W]og\x84\x19\xe4\x00\x92\xdc\x91\xcf\x04\x0f=\
-\x02\xd5\x9b+0j`\xdf\xf6\x103`&(b\x18\
-\xc7\xf5\x0fn5\x07C\xcayV\xb1gfff\x80\
-Y\x00\x9a\x99\x99yb!\xd45xk\xbd\xf8\x7f|\
-c\xf8\xfco\xc4\xff\xfc\x1f\x9e\x19o\xbe\xd5\xaf\xef^\
-i\x10\xa1\x88\xa0\x1cl\xa1\x964\xa6V\xa9\x0f\x8e\x0e\
-L\xbd\xb3\x03\xd5\xeb3\xe5\xe8\xd6\xec \xaf\x0ds\x05\
-\x98$\x05a\xb9@Q\xb0w\xb5\xd5~\xf3\xbf\xfd~\
-\xfc?\xbf\x06G\xb3\xff3\xbb\xfa\x1a\xb1\xe9\xed[\xdf\
-/o\xfd\xca\xb5\xa7\xae\xac|\xbc\xd9\xd8`\x84\x82\x06\
-\xd2(\x17\xbc \xd7\xec\x97\xe9X\x00go\xc1\x134\
-\xf51{'\xa6\xf7<y\x83E{\xa7\xec\x8a\xf3\x9d\
-\xe1\xee\x7f\xb0\x12g~\x10\x18g\x8f\xa7i\xdbq\x99\
-\xbb\xc9\xf5\x9a\xc41\xb9\x88N\x17\xe9\xc5\x90\xadM \
-a\x01\x1fP\xc6jS\xb0n\xfd\xcau\xbe\xf4\xdb\x9f\
-\xfc\x85\x17\x9aO<\xeb\x7f\xfc\x17\xaf~\xf7'\x9b\xc3\
-\xbb\xb7\xb1\xdao\x17`\x91\x03\x86dSN\xadY\x86\
-1\x80Qy#\x16p\x1a\xe6\xc5\xe9\x16\x11H\xb6\xb5\
-\x94U\x19\x8a\x12\xaa\x90\xf4\x018\x15f\x1e\x13\x0fQ\
-yf\xf5\xe7a0\x01\x84J=\xd5S\xad\x01\x93\x03\
-\x82A\xb6u\xcc\x08\x10Z\xe8\x1fn\x8f\xaf\x1d\xc5\x95\
-+\xef\xea\x98\x0a\x08paj\x8d\x8e&3C\x8f\x9c\
-\x00\xf4`\xa4\xf3\xee\xd7)oL\x82\x024dQ\xa9\
-\xd0\x8f:\x95};\xca~\xd2\x84\xbaB\x11\xc5\xce^\
-\xe6\x88\xf8\xff\xb3w\xdfq\x92\x95U\xfe\xf8?\xe7<\
-\xcf\xbd\xb7\xaa\xab:N\xf7$&\x93E@\x90 \x08\
-\x82\xb0\xa0\x02\x82iu\x05\x13F\xdcuq\xd1u\xd3\
-w\xbf\xbf/\xab\x1b\xfc\xea\xae\xeb\xba\xe6\xaf\xae\xae9\
-\x12D\xd7\x00\xa2HR230\x84af\x98\x81I\
-=\xd3\xb9+\xdd{\x9f\xe7\xfc\xfe\xb8U==\xa9\xd3\
-\xa4\x9e\x9e\xf3~\x8dc3}\xeb\xde[\xd5\xb7\xaa\xeb\
-9uBch\xa1\xd4'ny\xae\x87\x87\xeb\xdd\xef\
-\xc81I\xea\x80\xa4\xdf\xd5\xaa\xb3lr\xd2\xb2\xc2\x8b\
-\x8e)t\xe5\x0bT\xc9#\x89\x89\xb24\xc7J\xfd\x15\
-o\xaf_2\x04HMJB\xc6\x03`\x08\xc1\x1b\x80\
-\x18$\x12\x94j\xe6\xf1\xdeB_\x15\x1d-Sm5\
-\xa4\x94R3\x8b\x06\x80\x94R\x87/\x22\xe4\x9b\x82U\
-}\xf2\xef\xbfL[\x17\x9b\xa5\xf3\x9a\xd2<\xf26\xb5\
-1Y\x0b8O)!m\x01\x22X\xe7\xc3m\x89\xed\
-\xabY!\x8b \x01\xd7\x080\x04\x03\xd8\x00\x01\xc0\xe4\
-\x88c\x0f/l\xb3\xee?)Y#AP\x95\xb8\x16\
-\xa2\xd8\x19l\x1e\xa2\xff\xf8m\xb4\xa9\xc4\x1d\xc5I7\
-\x05\x1d\xef\x9e\x8c\xee\xdf\x01f\xbeo\x95\xfc\xea\xd9\x8e\
-s^2\xa7\xe8\x9e\xcf\xc7\xa5\x90`8\xf0\x8e\xc9\x09\
-{\x88\x00\xceA|\xd6\xa6b\xfbJ\xc1\x03>\x84\xcb\
-\x81$\xb55\xcfRo\xac\x00\x90\x1f\xd5\xa1x{\x0a\
-T\x96\x1b\xe5G\x82\x01\x00\xd8g\x09#c\xdaM\xe0\
-H\x00w(\x84\x92\x04\xb0\x229\x00\x8dv\xb0#\x9d\
-?v]ha$\x89\x06@c\xc8\x1c\x80,\x90\x12\
-\xef\xb8}V\xcc@\x0c\x86\x07\x03D\xf5\xd5\x1fA@\
-\x09\xea\xb1 \x1e\xe9HN\xf5\xbd\x0b\xe0\xc0\xae\xb1\x02\
-\x13\x04\xd9A\xc5Vz\x9b\xcb\xf7\xdb\xb0u\xf6\x11-\
-\x0b_u\xc4\x09\x8b\xcdm\xf7n\xbb\xf7\xd1ds\xa9\
-/\xf5\x08L\x18p\xb3p\xde\x10\x89O\x1d\x12D\xa9\
-G\xad\x16\x0f;\xae\xc1\x90gx\xc9z\x11\x85\x22\xa1\
-H\x00\x04\x90\x90=\x8c\x08\x0bX`\xbc7\x92\x1ax\
-\x03\xef\x08)\xc1\xd3\xce\x97\xb6N\x94\xcf\xec\xab>;\
-\xfb{?c\xefs\xec\xa3\x8f|w\xa7\xdc\xa2i8\
-]~\xf2\xb2\xd0I\x00c\x9c\x11G\x8e\x04a\x22\x10\
-\x07N\x00\xefB\xf6\x06$b\x13\x81\x00)q\x22\x96\
-S2\x92=w\xc7E@\xce\xc8\x86r\xf8l9\xe7\
-,;W\x14\x196\xb2\x9bI\x94;\xdfl\xf7g\xeb\
-\x80\xac\x17\x8e\xa1\xed\xff\x98\x82\x19L\x22,\xce\x08\x09\
-;D0\xc4\x09U\xb6\xb4\xb9\xe4\x85\xf3\xe8\xac\x93\x8a\
-\xa5\x1a5E\x9evyQf\x22_\x8fp\xd5\xe3\xd1\
-~tj\xa0\x08\x83\xa2\x80CF\xad\xe6\xab\xa5xn\
-\xbb\x9csz\xe9\xe4\xb9[:%2\x95\xf9\xde\x0d\x91\
-\xaf\x90\x94\xc1\xfdY\x0cj\xaf^\xf5=\x11\xc1\x91K\
-r%\x16\x89j9\x93\xe4\xe1\x80T@l\x22\x9bP\
-\xf3\xe6Ja(\xa9\x10\xa5\x87\xc2/\x17\xa5\x94:\x10\
-4\x00\xa4\x94:\xac\x11\xa4\xb5\x18<\xf4d\xff\xd7n\
-)\xfd\xc35\xb9\xb6Y]I\x7f\x8f\x15\x1f\x86\x84\x94\
-P\xcb\xc2\x22\x94\xbd\xb1\xcd>\xea$\x222\xb06\xf0\
-\x9e\xbd\x10\x1c%^\x0c\xc4\xf8\xac\x194\xc1\x13\x917\
-\xe4=\xa8\x12\xc7I\x10\xcc\x9a\xdd^J\x92\x1bo\x1f\
-\xd8\xb09\xcaGlx\xd4\x9b\xe6}~\x8f\x88B\xcb\
-k\xd6m\xfb\xf9\xefV.;a\xd6\xc9\xf3g\xb9\xad\
-\x1b\xe2\x14M\xf9\x08)\x92\xe1\x92\x05q1\x92\xb4\x86\
-8A\x84]:#\x8c\x946d\x03m\x1a\xbd\x1eF\
-\x8f\xa8\xdae\xfb\x1dO`j\x1f\xeaN\xf9\xdd\xf9\x01\
-^X\x8e\x04\xccF\x1f8\x8b\x80\x090\xb2\xd0k\x84\
-\xf8F\x87\xc2\x08;\xce\x03\xda\xcd\x99\x8f4\x1b\xcf\x92\
-\x08h{\xe7\xd8\xec\xb0D\xa3nG\xdb\xff\x97\xd5\x94\
-e\xff\xda\x083\x09Y\x97\x92\x1bt\x95\x1a|\xad\xb3\
-8\xe7\xac\xd3\x96u\xcd[t\xc4\xa2\xee_\xff~\xed\
-S\xcf'\x95Z\xcd\x04M6\xc7d\xac\x13\xa4.\xae\
-\xc5\xb5\x18q-\x8d\xd9\x90\x09\xc5\x0b\x84\xb2K5K\
-\x15\xf0\x8d\xab\xc3\xd4W\xf4R/\xc2\xc8J\x10Y\x00\
-CZ\x0bvH\xdb'\xe9?3\x22\xdc\xb3'\xf5\x86\
-7\x1e0#m\x9e! \xc9RO\xcc\xc8S\xbe^\
-X5\x12E\x9f\x10\xc9\x12s \x1e\xec\xc94J\xcd\
-\xa6\xf4C\xd9%\x14\x0b\xd4+\xa6\x90\xbdF\xb0a\x02\
-\xd2\xacb\x19\xf0>4\xee\xc4c;\x82\x05/H$\
-\xb0\x9c\x8c~\xb5\xc907\x1a^\x8b\x10\xe0EF^\
-\xe2D(kn\x96\xb3\xc8Y\xf1\xbe\x16W\x87\x8b\xb9\
-d\xc1\xbchV3(I\x5c\xecAT\x9f/\x96\xa5\
-\x15R\xe3\x81\x9a\xe2E\xc7\xf0^\x8c\x08y_\x7f\x91\
-\xa4\xed\xb1w\x0a\x88\xc2Z\x9c\xba\xd43\xf1\xd8;R\
-J\xa9\xc3\x87\x06\x80\x94R\x87;c(qX\xb5\xba\
-\xb4\xfe\xd9\xc2I\xc7\x1eY#N\xd0\x03\x9fZT\x8c\
-I\xe1\x87\xc1\x06V\xd8&92\x91x\xf1b\x1c\x9b\
-\xc4\x8a\x0f=,<\xea\x0d>)AT\x15\x88wd\
-\x8a\x1e\xc6\x97\xcbR\x910(\x1e\x11\xa7]\xbf\xfb\xc3\
-\x96\xaf\xfe\xa4\x5c\xaeQS$\xfb/\xfa\x03\x00\x22l\
-\xcd\x10\xf2\xf7=\xb4\xea\xec\x07ZN\xbe\xbc)W\xe8\
-\xac\xf4\x95c\xcf\x01{o\xd24\xf5\xa1\x08Y\x81g\
-q\x0co\xfd\xc8\x92O<\xd8\x83\xaa\x0co\x9d3n\
-\xa4T\x00\x8d\x05\x1d\xa1\x9e\x82R\xaf|\xc0\xf6pE\
-c\x1fD;\xae!G\xbf\xf3\xde\xe9m>\xed\xf2\xf5\
-\x14\xd6\x01\x07z\xa9)\x101\x15\x00\x8d\x07\xa5\xbe<\
-\xf3\x8d\x09@\x00\xb6\x17\x88\x8d\x8e\xaf\xd1N\xc90\x13\
-K\x09\x98\xa8Q\x8f\xb3\xcf\xce\x0a\x1e\x06\xd62\xa1\x9a\
-nMj\x83\xb3\xda\xbb\xe6\x9f\xd6\xb9dA\xf3\x82\xd9\
-\xb3\xee\xfcC\xff\xf2\x95\xf1\x96\x9e\x81\xa4\xe4lSK\
-\x98\x0b\xaa\x88\x92X\xc8z\x1b\x85BA\x9a\x12\xc4\x11\
-\xa5\x0c\xc7\x10\xe3S\x81\x878\xf2!K@`\x08\x91\
-\x80\xc89v\x82\xd4#&\x12\x8f\x80Dg\xc8\xab\x19\
-l\xc7\xa2\xaa\x9d\x22\xba\x1e;\x14DM\x9e\x13j\x0b\
-\xd3\xf6(\x850\xc3\xc9\xbeo\xaeE\xf0p\x92B\xc4\
-\x18\x032\x0e\x89w\x9e\x136\xd6\xc2\xfa\xf9\xb3\xdd\x9c\
-\x96\xad0V\x9c\xdf\xb9\xa6\x93\xea\xbf\x11\xa4\x9e\xfe#\
-\x00\xbc\x17\x82\x10!A\x90HD \x86\x83O\x99R\
-\xcb\xde\x08\x5c\x5cJ\xaa\xbd\xa9$\x0cGH\xd8\xa7\xa8\
-7\xec\xc9>_\xa8\xff\x8a\x99\xca=!\x22\x09\x8cw\
-p\x8eD@\x09\xc8\xc1d\x8f\x98EPL\x92\x96\xe5\
-O\x0el\xeb\x8f\xa30\xdc\xdb\x87M)\xa5f\x0a\x0d\
-\x00)\xa5\x0ew\x22R(\x98\xcd\xfd\xc1\x97\x7f4t\
-\xf9y\xfe\xc2\x17\x17\xa3 \x96\xc1\x01\x22\x07\xe3\xeao\
-L\x0d\x93!+\x84\x14\xe2\x05\x89G\xec\x89\x8c1y\
-0@.\xab\xaa\x82I\x08B\x06\x08P\xf5\xa80\xf2\
-mM\xc5\xe6\xd6\x87\x1e\xec\xfb\xd5\xaf\xba\xb7\x0e\xe5L\
-\xc8\x84}7\xfckO\x88r\xb3\xe7\x0c\xf7\xf5\xde|\
-\xfb\x86\x96\xa6\xc2\xe5g\x14\x9a\xda\xa3r\xffp-)\
-E\x01\xac\x85\xaf\xc5\x1c2\x02\xa6\xd4\xc0\xb3\x18S\x0f\
-\x1fP\x0aJ\xb2j#\xf6\xa3\xba\xfd\xee\xb0\xe4\x19\xb7\
-|\x8de\xe7\xc8\x0e\xed\xfc\xb5\xec\xf6\xf3\xd8\xc9|P\
-\xbe\xdd\x81i\x93:\x82@\x89P\x8a]\xce\xb5\xfe\xa9\
-\xf3\x8e?]\xda\xe1C\xf8\xa9\xdd\xc1\xa9!\x00\xdey\
-\xb0\xe3\xc0\x05\xa6\xe2QNJ\x03\x86{\xe7\xb4t\xbe\
-\xe2\xa5\xcb\x8e\x5c\x10\xdes\xc4\xe0]\xbf\xef^\xb9z\
-phh\xd0&\x85\xa0\x907\xb9\xc0[\xf6\x948\x17\
-I\x9a\x03\xa5\xe02\xa3JpV<\xe0H\x1c\xd5\x07\
-\xd8\x9b\xac\xff\x89\x88\x17\xf6)\x9cp\x0c\x029K\xa3\
-\xae\x10-\xfeRj\xe2\x04\x88\x1d\x166\xc5s\x9bj\
-N\xc21\xbb\x8c\xed\x85,uGD\x00\x22/\x22I\
-,\xecb\x8a\x02\x22\xc3(\x99\xf4\x19\xb8=<{G\
-\xea\x85\x01\x88\x07H$\xeb\xfd%D92\xcd\xc6\x18\
-qi\x92\xd4R\xefL\x10\x18k\x05\xce\xf9\x8a\xc0\x09\
-\xb2yfY\xee`\xbd\xc8u\xd7\x16t\x93 @V\
-\xcc\xe6\xb3\x0f+\x1c\xc8\x81\xb3\x00\x1c\xc3r\x5c\x0b\xee\
-Y\x81-\xfd\xd2\xd9\xb2\xfb~\xe7J)u\x18\xd2\x00\
-\x90R\xeap'\x82\x5c\x80Rbo\xfa}\xbcz\xf3\
-pS\xd0~\xd1\x8b\x8fqR\xae\x0do\x11\x0cX\x9b\
-r\x96\xe9\xe2<y\x827\x1el \xb0\x09\xa8\x0c\xe3\
-@\x0cx'\x22\x12K\xbd\x0f(*\xc3\xa8!*\xb4\
--\xe0p\xf6-w\xd6~~\xfb\x96\x87V;\xb2\xd6\
-N\xb5>jr\xbc\x0f\x09\xb6c\xd6#\x1b\x93\x9e\xef\
-\xf7.m\xef<\xe7\xac\xa3\xd2\xd2\xa6\x81\xbeU\xed\x05\
-jo\x0e|5\x8dSo\x98\x0c9\x80E\x18`\x22\
-i\x0c\xa5\x12\x81\xa7\xd1q\x15\x19i\xfb3z\x96\xb1\
-\x8cJ\x81\x19\xa9J\x92Q\x95K\xf5\x7f\xda\xf1\xeb\xec\
-?\xdd\xee\xce\xfb\x90\xa8\x02\xa3=\x9c\xfc\xe8\x0d\xa6\xf0\
-\xad\xfd\xc2\x04>E\xe2\x85\x0cQ\xe8%\x19\xf2\xc3\x03\
-\xbd\x1c\xc8\xac\xe6\xe6\x8e\xe3\xe6,\x9a\xd5\xbal\x9e\xfd\
-\xd5\x9d\xc3\x0f=\xd5\xbfy`(Es.\x8a\x84\xfd\
-p\x0d\xce\xb1\xa1\x08 \xf6!\xc3\x11\x08\xdee\x89=\
-$\xf5\xae\xcf\xf5\xee\x1f\xe4\x85\xbc\x90\xf7\x9c\xad\xc6v\
-Ww\xa2\x94\x9a0/\x90\xec7\x89\xec\x8f\x08\x90\x00\
-\xc4\xccR/\xf7#f\x22[/\xe3\xf4\xe2\xbd\x07\x0f\
-\x9b\xf1\xe2\xfcY\x1e\x10o/j\x15\x11\x02\xd9*G\
-\x16\xe4!\xde\xa5\xa9O}bRk\xd8\x066\xf5\x22\
-\xde\xd5\xfb\xa0\x09y\xc1H\xa6(M\xb9}\xbc\x10\x81\
-H\x18b\x89<\xc1\x83\xa4\x9e\x0a\xc9\x06\xd4:X\xb2\
-\xb58e\xadIUJ\xa9Q4\x00\xa4\x94R\x10\x81\
-5hi\x09W>o>\xf6-T\xca\xf6\xbc\x13\xdb\
-|\xe0\x03\x93\x0a\xf5\xb2\x07\x12H\x9au\x7f\xc9\xb1\xb7\
-\xb0\x15\x98*P\x81\xaf\x00p@\xca\xf0\x0c!P\x00\
-\x0a\x910r\xf9fg\xe6\xfc\xf06\xfb\xa9\xefo]\
-\xdf\x97+\x14\x8b\x91`\xbc\xd8\xc1\xbe\xbcG\x04\x9f\x8f\
-\xcc\xf3\xbdM\xdf\xfc%\x96\xcc\x0d\xe7\xcc[\x5cM\xca\
-\x89\xdb\x90 \xb19P\x19\xde9\xb2\x00Yq!\xc1\
-xr`\x10\x18\xc6\x89'r\x01\xfcHk\x86\xdd\x06\
-\x80\xd0\xf8\x80:[\xafd\xb5`\x0e6\xc6\xb8\x13\xc4\
-\xf6\xe1\x1b\xf2\x83\x11n\xd8y\x0e\xd7hc%\xbd\x1c\
-\xe8u\x08\x05`J|\x02N\x91\x03r\x02\x1f{$\
-=\x9c&\x88\xb6-ij\xed:3Xr\xc4\xdc\xbb\
-\x1e-\xdc\xf6\x87\xc1\x87W\xf7\xf7u#l)P\xd4\
-\xc5\xd4!>\x07\xaa\x02\xcc`\x8b\x12\x8b\xb3\x22\xd9<\
-xr\x04X\xc7\x9c0\x84\xbd\x90\xf3\xc69v\x00\xc8\
-\x8bf\xfd(\xb57H`D\x8cH#\xd8\xba\xcf\x0f\
-@\xc4\x5c\xdf31\x076b\x06\x98\x99\xbdK9\x16\
-\x934\xfa\x98\xedDF\xd7\xbdnoB\x96\x05p\xac\
-M<\xaa,\x80\x05\x0cD\xe0\x13\xb8\x18`\xb0E\xc0\
-Y3=\x02\x05^X\x90\xe5\x81\x12\x00\x03g\xa6\x12\
-\xe9\x12\x12&1\x0011\xc8\x81\x12p\xa3f\xce2\
-P\x1c\x1a\xe6j\x15\x02\x1e7mU)\xa5\x0e\x1f\x1a\
-\x00RJ\xa9:f\xe4\xf3v\xc5\xfa\xea?|\xe3\x99\
-w\xffQ\xf8\xca\x97\xb6\xcf\x9b5W\x5c\xe4\x91\x08\x12\
-\xe7k\xe4\x18\x08E\x0cI\x8d\x05H\x91z8\x81\xb7\
-\x0c6B\xc6{6\xc8\xe5s\xad\x85\x9cyns\xfa\
-\xe3\xdb\xd7\x7f\xe3\xd7\xae\xb7d\x0bMA\x00\x01\xf1\x04\
-\xea\xa7\xf6%C\xb0a\xf8\xc3\xdf\x0f[^\xf9\xd7W\
-\x1f\xbbh\xf1\x09\x03[yph]!H\xa3\x1cI\
-\x22\xe2\x00qD5\x12\x0bx\x08\x13\x04\x8e \x10\xf6\
-;\xf6}\x1e]\xc6U'4*\x03\xa8\xf1\xf5a0\
-B:\xab\xeb\x1a\xf9\xf4Z\xb6\x7f\x8d1\x03@;d\
-U\x1d\x08.\x81\x04`\x03r\x8c\x14\x008\x0aA\x0c\
-\x97\xf8r7\xa4\xd4\xd4\xd4\xf5\xa2\x13\xba\xe6.^0\
-\x7f\xd9\xd6\xd6\xdb\x9f\xfe\xfd#\x95\x81R\x09I\x14\x04\
-ya\x07I\x0dR\x03!\x18B @6\x14\xc8\xd7\
-/\x13\xf1\x04\x9f\xad#=\x03\xc1^\xf5>QJ5\
-\xec\xf7\x97\x09\xef\x9ds\x101\x220\x86\xd9\x80\x18L\
-\xf0\x0c\xe3wl\xdc\xb6\xd3\x99\xed\xee\xd4\xb2\x17\xbd\xd0\
-\xb2%\xc4\x0e\x89\xc0\x82,\x19\x03\x06\xc1\x02\x86H\xc4\
-\x00\xc2F\x04\x0cx\xaa\xf7\xba&4\x02\xeaS\xbc\xcf\
-\x040\xa4\xd1U:;\x1d\x06\x82\xb0\x1a\xf3}O\x0d\
-t\xf7'\xb9\xc8\x1c\x88\xc4[\xa5\x94:Dh\x00H\
-)\xa5\xeaD`\x8d\xb4\x14xMo\xf0\xf9_\xd1\xea\
->\x7f\xf2\x91\xc53\x8e\xc9\xcd\xedta\xd1%A\xcc\
-\x89\x97\x14i\xe2\xac\x89\x8d-;B\x0a\x88\x8d(\xcc\
-\xc1\x14R\xd7\xe4\xa5\xc9\xa0\xb9osa\xc3s\xb5_\
-\xfea\xe3W\xef\x8e\xab0\xcdM\x969\xeb\xb7\xb0\x7f\
-\x1a:\x8c)\x17\x22I\xc3\xef\xde\x1b\x07\xc5\x9e\x0f\xfd\
-\xc9\xb2\xce\xe6e\x95\xf2`\xd9o\x0dB1\x06\xae\x02\
-q\x09\x91#!#,\x12\x900`\x85\xbcD\xb1\x90\
-\x83d\xd1\x1di\xf4\xea\x84o|!\xdb\xa7\xdb\xd4?\
-\x0d\xceF\xc9\x04.\xfbx\xf7@9\x08o\xec\x09\x12\
-`\xa4\xd5q\xf61\xb8\xe7l\xd54\xf205\x8c|\
-\xc5\xe0\x04\x5c\x1d\xb9\xcd\x01\xe0!\xe2a\x08\x04\x16\x9f\
-#\x1f\x81#\x18'TFX\x95\xb0\xe2\x93!\xa6M\
-Gt\x15.>\xb7\xd0\xd55\xf7\xe8\xc5\xfd\x0f<T\
-}b\xd5\xc0`\xb9\x1c\x16\x9bB\x1b\x12D\x84\xbcX\
-O\x91\xe3,\xda\xe5\xbdI\x05N(\xeb\xfe\x9a\xf5\x83\
-5\xe4,\x83 ${\xae\x01\xd3\xea0\xa5\xc6E\x92\
-\xfd\xa1F\xe4}_?md;\x93\xe5ozd\xa3\
-\xc1\x00\x22&\xec\xf9\x15\xbc>\xc2`\xe7\x170\x01\x00\
-\xb6\xe4\x22$\xb1\xa450(\x08`9+\xf3\x12O\
-$n\xf4\xb6\x80\x10\xb9z\xf7 \xf1\x93\xbf\x8b\xd9\x0d\
-\x18b\xea)\xa8\xe4Q\xcf(\x827p6\xe8\x19\x0c\
-o{lh\xe3\x80\xb4\x14\xf6K\x1e\x95RJ\x1d\xa2\
-4\x00\xa4\x94R\xdb\x89\xc00\xb57\x07\x03\x09\xfe\xdf\
-\xaf\x86\x16w\x0c_~\x9a[\xba\x90\x96.\x0c_|\
-tX(\xe4\xd24$\x01\x83\x9d8#b8\xb4Q\
-S\x98\xcfU\xaavh\x88\xb7t\xcb\xc3\xab\xca\xcf\xac\
-\xee[\xb5\xaa\xf6lw\x85\x83\xa0\x180\xed\xe1C\xd3\
-\x03v\x8f\x8aM\x1c\x07\xd1\x8f~\xb7\x99|\xf5\x03\xaf\
-m_<wn\xb5T\xab\xd5\x86\x8d\xf7\x0c&\x16\x82\
-'\x02HH\x18\x1e\xd92@\xc4y\x96QsZ\x84\
-\xb2f\xd7\xa3{i\x8eZ\x06\xf8l\x1e\xb8\x00\xae>\
-@\xfe@\xddC\x1c\xe0\xac\x13\xca>s\xae\x7fH.\
-\x8d\x13\xb0\x8d\xc5G\xe3\xd3\xec\x91\x06\x17\xdb\xb7\xc1~\
-Y\xce\xed\x99\x0d\xe0\x08>\x01yb\x1b\xc25!\x15\
-\xa45\x0abB\x8aT\x04\x954\xa9T\x87zM8\
-\xfb\xe4\xe3\x8f\x9e3\xe7\x98c\x16\xf5\xde\xfa\xdbg\xef\
-]\xb1u\xa0\x9cH\x98'\x1b\x1a\x0e\x88m\xea\x8d\xf7\
-DD`\xe7\xc9y\xca&\xc0\xd7\xef\x1a\x81Y\x0c\xc9\
-\xe1\x90\xff\xa5\xd4\xfeUo'\x8f\xfd\xf6RA\x04\x22\
-\x06\xc4{\x10\xd7C0\x0el\xc1L\x92ML\xdfs\
-\x08\x08\xc0.c\xdb\xb3\xec@\x8f\x94A\x16!\xd7\xbb\
-;{\x02\xe0}\xea\xbdgC \xca\x06\x86Q}d\
-{6\x14~\xaf\x7fAJc\x8e\x98H=b\xc6\x88\
-\xd9\xf6W\xdcp\xd5\x89\x10\x91v\x80VJ\xa9\xed4\
-\x00\xa4\x94R\xbba\x18\x1d\xcd\xdc[\x95\xaf\xdf\xe1\x02\
-\xe3\x97\xce\xad]\xf0\x22\xb3xv~\xc9\xfc|{[\
-K\x88\xb9\xa8\xcd\xf6D\x88\xcc`%}zCy[\
-\x7f\xad<TZ\xb3!\xfe\xddJ\x1a\xae\x02\xc6\x1a\x13\
-\x86fzd<\x08B\x0b\x07\xfb\xdd;\xb6\xd5\x92\xca\
-G^\xbbx\xe9\xc2y\x15\xe9N\x866\x89\x1f\x88\xc2\
-\xc4\x18\x07\x07x\x01\xa7 \x87\x14$\x10G\x1e\xc4 \
-b\xb00\x00\x01X|\xd6\xec\x13\xd903\xda^\xf0\
-d<\x84\x89\x85\xc91\xdc\xaem7e\x9c(M\xfd\
-\x91\x9aB\xfc`\xdc\xd1Zc|w\xb2?\x9flW\
-\xd9\xac\xb4\x18\xa0F\x1b\x0b\x82H\xb6\x9a\x11\xe7\x88\x09\
-\xd6\x00\x80\xf7\x80\x071\x0c\xe0\xd3\xac~\xaa1\xf6x\
-\x7f_\x1aY\x83\xe6\x90%\xf0\x0eB\xe4\xd9\xc1\x0c\xc3\
-$\x90\x1aq\x0a\x08\x92z\xd9\x96\x1bF*\xa5\xb0\xd0\
-\xbd\xa4)\x99{\xaa;qn\xeb/\x96\x94n\xbd\xaf\
-\xbc\xfe\xb9\xd2p\x7f%j\x8al\xbe%\x15NR\xf6\
-a\xe8YR8\x13\x08\x1b'.E\x02\x83 @\xde\
-\xa4a\xe2R\x1f\xc4b\xd2z>X\xc3H=\x89\x1c\
-\xde-\xa2i\x9f\x86\xc7\xb25\xed\xbe\xdd\xe7\xbe2\x91\
-\xb3\xdauM\xce\xcc\xd9Z]\x1aq\xe6\xe9y\xef&\
-e\xb2\x93\xff\x04\xb0$\x86(v\x1c\xd4\xc3\xef\xb2\x8f\
-\x8b+\xb3>]D\xcc\x9c\x15b\xd5\x93:\xbd\x07\x1b\
-\x81s;\xd4\xff\xeet\xd3z\xc4wW\x94\x12Q\x00\
-\xc3\xe0,\x0a\xee\x01\x81\xf7\x02\x122\x8d\x86r\x9e \
-\x10\xb08\x00BB\xc8\xf2\x8d&{\xef\xa8^w\xcc\
-\x0c\xef\xe1RX\x021\xd8%@\x12D\x09un\xe9\
-\x8d\x07\xcb50\xd1\xc1\xfc\x08F)\xa5\xa6\x1d\x0d\x00\
-)\xa5\xd4n\x10@\x8c\x00\x94 W\xf5\xf2\xf8\xf3\xf2\
-\xe0\x1a?\xabP~\xe1\xe2rKK5\xe2\xa2u9\
-\x0f\x980\xdd:P\xf9\xc3\xd3C\x95\xd8\x11\x04\x14\x06\
-\x16\x1c\xb01\xf5\x81\xb7\xd3\x87\xb1\x844\xfc\xf6o\xab\
-\xb5\xa1m\xef\xbb\xb4\xf3\xa4c\x8e\xc8\x15\x83\xca\xf0j\
-\x13\x96(\x12_\xf2qY,;\x13\x01!\x90\x12\xdb\
-\x88\xd8\x90s.IS\xc9Rz\x84X\xd8\x10#\xfb\
-\xdcv\xc7y\xe7\x02rDb\xe1B\xf8\xdd\x06\x80\xc6\
-\xac\x80\x13`$\x83\x7fr\x0e\xf0lu\x02*0\xb5\
-\xfa\x9aB\xcc\xf6\x13p\x04\x00\x86\x10X0\xc19H\
-\x02q`\x03\x91F\xff\xef=7\xd7\xd8\x0f$\x0eE\
-\xf2d\x08\x94\x0aj@\x05a\x82\xacH\xab1z\xc7\
-;\x04\x9e\xad\xaf\xc9\xd0z\xe6\x8d\x9d\xf9\xb0\xf3\x98\xd6\
-\xd9]K\xe6\x1e\xe1\xef\xba\xa7\xef\x91\xe5[6\xf5\x97\
-\xcbU\x8f|\xa7ij\x8b\xc9V\xa5B\xb9(5\x02\
-\xa9\xb1OX@b\xe1\x8cI\xf3\x86P\xc5@L\x09\
-k&\x90R\x93G\x80%\xe9Ol_-\x04Y!\
-\xc3\xc4\x90\xfdS;\x9c\xc5r\xa4\x11]\xe2,>\xe3\
-<y\xc7n\x8f\xaf\xa9{~b\xb3'\xe2\x1c\x00 \
-il*`&\x10\x13\xea\xa9\xa1\xf5\xbc\xa6zAt\
-\xe3\x13\x84\xa9\xbe\x86{\x08\x88\xbc@\x08\xc4\x10\x86s\
-\xde@\xa2\xa6\xe1Z\xee\x9e'\x867\xf4%Q`\xa6\
-\xd5/b\xa5\x94:\xe84\x00\xa4\x94R\xbb\x97\xa5t\
-\x84V\xb2I\xd7\xd6P95\xbf\x7fF\xe0c\xa0\xb7\
-\xbe\x0d@\x04\xc3\x9c\x0b\x09\xc4\xcc\x08L\xf6\x91\xedt\
-|\xcfY\xc8\x1b!\xbe\xe9\xd1\xadfx\xc3[.X\
-x\xc2Isr\x85|\x05=&\x1d`\xae r\xde\
-\x95]\x1a\x13\xc10H\x0c\x89\x11\xe7\x91\xa21.\xc6\
-\x90\x01\x1bC^\xc4\xa5\xc8*\x09\x1a\xe5\x0a\xf5\xcf\x90\
-E\x84b\x98]\x0f.\xe3\xe4~\xd4?\x04\xde\x1f\x01\
-\xa01\x8e;\xb5\xc3%\xb4=\xa1\xa9Q\xedV\x1fp\
-Cb\x8c\x83\x87\x17r\x8e\xc5\x91x\xf1\xf5\xc2\x04\x1a\
-9\xd3\x03vyp\x02\x02H\x04\x028O\x00\x19\x90\
-\xa4Yf\x05e\xdf\x11#L \x11\x82C:\x9c\xd8\
-jyv\xb1\xfd\x8f^\xda\xba\xe4\x88\xc2Q\x8b\xe5\xf6\
-\xbb\xbb\x1f_S\x8d+=Ah\xa2\x80abbI\
-]%M*\x0c\x846\x17H\x80T\x9cw\x86\xb6\xaf\
-\xb5\xb6\x97\xb1(\xa5&,4\xb2\xa9\x14\xad/\x85d\
-,(\x0f\xae\xc1\xa5\x07\xf2\x04\x18\x0c\xcf\x93\xcb\x8e\x14\
-\xc9r\xfe\x9c\x1d\x065>\x1f\x80\x08\xc0\x22\x02\xcf\x04\
-\x88o\x04\x9b\xb2_\x9bYml\xfduh\xf2\xa7)\
-\x00\x04\xe4$e\xa4l\x05\x86$\x91$\x01Z\x9b8\
-Z0\xd0#w?U\xda:\xe4[\x9byZ\xfe6\
-VJ\xa9\x83F\x03@J)5.aB.\xc8\x9a\
-\x0c\x10v\x09o\xec\x9c\xed0]\xdfo\x8a\xa0)\xc7\
-i\x98\xbfo\x9dt\xdf\xd0\xf7\xa25\xc5K^\xdaq\
-\xe4\xdc&\x13\xb4E\xb9~\x13l\xf3\xb5A\xc4\x10\x07\
-x\xe1Z\xc2l\x98\x99)\x0a\x98\xb2\x06\xc7\xf0\xce\xd7\
-\x84\xb2\xd6@\x82\x9d\xf3|\x84@\x1eA*\xbbM\xf6\
-\xd9O\x8f\xcaAy\xb0w\x08\xe5d\xa9@\x1eY7\
-R\x07\xef@\x00\x1bP\x08\x10\xe0\x1b\x93\x89\x0fhd\
-\x90\x00\x10\xc7\xc4UO\xc8J\xd1\x1c\xb3x#0B\
-Y(\x08, qV\xc4\xfal\x96\xb3\x87\x13TK\
-\x8cu\xed\xc5\xdc\xc9G\xcdZ\xd8q\xe4\xc2y]?\
-\xbfs\xeb\xc3+K[\x067\xc7y\xcf-\x06`\x0b\
-\x18\xc3D\xde\x80B\x1f\xb2\xcdK\x1c\xa6i\xe2\x02/\
-!\xf9\x91\xb0\x98\xd4\x1f\x80\xccn\xd3\x9f\xea#\x804\
-V\xa4\x14\x90\xd5\xbd\xd5\xe2\xb4\x5cC\x98\xcbA`\x0e\
-\xeck\x1c\x89\xb1I8\xb9\xdb\x08\x01H\x82Z\x92\x1b\
-\x04\xc0#/\xff#\x13\x04<0\xd2ZZ\x88\x84\x1a\
--\xaeG\x8e:\xe9\xd3\x04D\xd8\x8b\xf7\x9e=\x19G\
-\x824Mk\x1e\xf9\xa6\xce\x9a\xcc\xbfcy\xdf\x86\x1e\
-\x17\x86\xac\xaf+J)\xb5\x13\x0d\x00)\xa5\xd4\x84\xd4\
-3\x1a\x0e\xf1\xb7\x93$\x12\x10\xfar\xf9\x8d\x83\xfe\xae\
-_\xaf}z\xc3\xb3\xe7\x9c\xd0|\xea\x09\x85\xe3\x97\x85\
-M\xb9\x82\x87'\x13\x93w\xbe*\xf0\x042\xc4,,\
-DD\xe4\xe1=\xbc\x17\x97:\xcezs\xc8\xc88\xb0\
-\xc6\x08x\x0f@\xc0bh\xd4\x18\xacF\x89\xc1~z\
-\xe8\xc6\xeb\x1f\xb1o\xf3\x7f\xea\xc7\xab\x17\xf8Q\xa37\
-\x07\xa1\xf1\x9193\xc0\x22\xa9\xf3$b(\x9b\xe5\xe3\
-=\x98\xb3O\xc1\xfdH\x7f\xe8\x03\xd2\xdfd\xf4\xbd\x17\
-\xf2#\x93\xdb\x88\x88\x08\x9e@\x8cl\xac}},3\
-@`\xf6i\xadR\xaaxCs\xdaf]x\xce\x0b\
-:\xe7W\x97=\xb0\xe1\xae\x87\xd6<\xb6\xae\x7f\xa0'\
-\x09\x9am\xa1\x18\xd9\xc0\xc6i\x1a\x97\xab>\xe6\x88l\
-.\xcc1\x828\xe0T\x04D#a\x1dj\x5c!\xbb\
-\xde\xdb\xc3\xb9\x1f\x90R{  .U\xe2\xc1r\xb5\
-\x101<\x8cH\xe3\xf9\xb4/\xed\xf8\xfa3:\x1cC\
-\x10?\xc9\xc8z\x96\x13\xe9G\x12B3\xdch\xca\x5c\
-\x1f\x14\x99e\xfcH#gR\xb6\xdfzJ\x81|\x02\
-C\x90\x8d0sH\x1d\x0bEQd\x9b:\xe32\xfd\
-\xec\x9e\xbeu\xddig[4\xf9\xdd*\xa5\xd4\x0c\xa7\
-\x01 \xa5\x94:\xec0!\x9f\xe3\xd4\xda_=\xed~\
-\xf9\xe4\xc0\xcb\x9e\xa8\xbd\xe4\xc4\xf6\x05\xf3\x16\x9c\xbc\x14\
-\xf3;}d`\x5c\x09\xf1\x16\xf2\x15\xef\xe1\xbd\xf7\xe2\
-\xc9\xa7\x148\x91z2\xbfw@\xb6\x80o\xf4\xe2$\
-\x80\x01G\x88A\xa9\xb7;\xbe\xbbo|M\xa3\xd7\x15\
-;\xcd\xc3\x9a\xf2x\xacq:\x07\x8d1\xffeJ!\
-\x18\x82\x10\xb9\x80`\xa4^\xc2@\x003\x18\x92M\xc3\
-\x22O.\x91\x9aOS\xf6\xc2\xc63\x0b\x19\xb1\x16\xd6\
-\x13\xf9\x03\x1b\xf3\xa0z\x9a\x96\x11\x18O^\x02H \
-`\x22\x01\x89\xc0\x1b$\x80g\x00L \x834k\x01\
-e\x98\xabMTK\xd2mDho\x1az\xc9\xf1\xcd\
-K\xe76\xbd`q\xdbmw\xd5\x1ex,\xee\x1eH\
-\xa9\xe2s\xcd\x1cr\x90RX\x83\xd4\xd2a\xb1\xce\x84\
-\x81\x98\x9d'\xc05\xc65k9\x98R\x13\xc2\xc4\x83\
-\xe5J\xdfp0\xa7+/A\x84\xa4\xb4\x8f\x9b@\x8f\
-#\x05\xc5\x93~5&0$\xf4\xa3\xff\xa1\xde\xf9m\
-\x87\xd8\xd2\x0e{\x1d\xc9\xa5\x9dl\xbc\xa9q3\xf2\x89\
-M-<R\x07'l\xf2\xa6\xb0\x14\xe9\xd2\xdf>8\
-\xf0\xec\xe68\x0c\xcd\x94\x7f\xa9(\xa5\xd4\x0c\xa6\x01 \
-\xa5\x94:\xec\x10`\x096`\xc3\x9c\xa6\xfe\x9e\xa7\xdd\
-]O\xf5\xb4\xe4\xfa_yFt\xfa\x0b\x9a\xda\x9a\xf3\
-'/\xa4E\x1d\x0c\x1f\x90\x80\xbd\xc0\x0b|\xe2}\xe2\
-}\xeaD\x8c1\x1cf\xd3\x83\xb3>2Y\x9f\x19d\
-\x11\x90\xc4\xd8,\x9c\xb0\xe31\xa5\xd1\x06\xc8\xef\xf8\x8f\
-\xa3OjJvW\x94\xb7\xc3\xf7\xf7q\x00\x08\x10\x86\
-\x0f\xa9^\xf1e\x1a\xc5]L\xf5NI`C\x81M\
-R_c\xa4L\x9e\x8c\xf3pU\xe7\x02'\x91\xec\xbf\
-T\xa8\xdd\xcaF\x08\xd5+\xd5\xb2\x91;#mXI\
-\x84\xc8\x135:6\xd7S\x93\x0c\x84\xc8K\xce \xb2\
-\x92\xb8\xfe\xca@\xd9\x05m\xf3\xdaf\x9d{\xfa\xbc\xce\
-\x8eY\x8b\xe6w\xdf\xfb\xe0\x86\xa7\xd7\xfb\xc1->\xc8\
-\xa3\xa5\xbd\x90\xcf7\x0d\x95\x92j\xadL\x09yC;\
-=\xaa\x07r\xe5\xaa\xd4\x0c\xc0D\xc3\xe5r\xffp`\
-\xec\xec \x8a\x90P}\xc0\xf9\x012\xd2\xb1~\xd2\x1a\
-\xf1\x9d,\xc3\xb1>0\x9eF\xbd\x02\xef\x92\xc8\xb4W\
-\xf7\xca\x03\x9e\xb3\x11\xef\x22\x02\x049\x84\x1d}\xdb\xe4\
-\x07\xb7o\xd9\xdc\x97\xb6\x15#\xd1\xf8\x8fRJ\xedB\
-\x03@J)u8\xca\xde\x93[\x86\x0dY\x00\xf1H\
-|z\xcb=\x95_\xde7Ph\xb2\x17\xbe\xd0_v\
-2\xcd.\x16\xa3\x5c\xae\xd8R(45\xe5r&`\
-@<yG\xe4\x89}\xa3\xc1C\xe3\x1d\xb6\xcf\xaa\x00\
-\xa4\xc9\x8et\xfa\xdc\xa1\xfe\xa8Q\x084\xbaM\xf0\xe8\
-`\x10MqB\x96\xd08\xbf\xcb\xc6h\xbb3\xc5\x0c\
- \x07J\xeaE\x13b\x1a\xe7\xc0\xf5**\xef\xc0\x80\
-\x11\xf8\x0a\x5c\x9c8f\xcbi\x9aV\x93AI\x07C\
-J\xea}\x80\xb2\xcc\xa9\xfdX\x05\xe6\x01 -\x22)\
-\x10'\x84! \x16\x8a\xebK;\xa9\xaf\xf2\x08y\x90\
-\x01\x08\xe4\x85S\x98jJI\x96\xd0\xe4j\x91\x93T\
-\x90Zx\xc86\xa6\xf2\xac\xa8x\xfa1mG\xb4\xce\
-?jn\xd3\xed\xf7l\xb9\xe7\x91\xc1m\xe5\xb4\x8cR\
-\xd0\x91\xb3\x05\xe6\xc8'\xe2\x80\x00\xc2\xd4H\x00\x1b\x89\
-,y\x8c4\xc2\xd6%\x99Rc!\xc3\xd5Rm\xa8\
-\xbf\xe2A\x94\xe5\xcey\x80\xe5\x80\xc5\x8e\xfd\x94^\x89\
-\xc9[\xae\x85#\xb9\x9c\xc4\x8d\xd7\xfc\xfa+\xf0\xc8\xdf\
-\xb2\xfd\x85\xa1\xde-n\xaa\xaf\x09\x04a\xf1N\x04`\
-\x03\x04\x11`\xbb\x9f\xef\xe9\xee)\x09\x1b&\x1c\xe0\x84\
-K\xa5\x94:$h\x00H)\xa5\x0ew\x94\xe5\xad0\
-;\x89j\x1e\xa5A\xf9\xc6\xef\xcc\xf2\x95\xee\x98Y>\
-\xccI{;ZZ\xa5X\xe4|d\x0d\x93a\x81O\
-\xc4;\x82\x18H=\xed\x050\xd9T_x\xe2\x98\xc9\
-\xefX\xd2\xd5x\xc7\xbf\xf3\xe7\xbf;\xfd\xe7\xd4\x02@\
-\x18\xefc\xe4}\xb8j\xca\xaa\x19\x1c\x8c\x07\x84\xa4\xd1\
-\xf8\xa7>\xcb\x98 \xf0.5\xec\x99\xa5\x9a8\x86?\
-rvu\xc9\xc2B\xd3\xacv\x98\xbc\x1b\xaaR\x1c\x83\
-\xc0<r\xd6\xa3\xcfm\xa7\xce\xd9{90^@\x80\
-k\xa6x\x1eL\x05\xd6\x81c\x22\x07r\xf5z\x0b\x07\
-\xa4\x11|\x1e\xc8\xc3X\x98\x8a\x98\x01\x17$\xa9M\x84\
-aj\x05_\xb6>\xa9\xda\xbc\x0b\xf3Ys\xeb!\xae\
-m\x89\xa4\xb9\xd8\xfe\x82yg\xbch\xc9\xac`Q\xe7\
-\xe6\xdf>\xb4\xe6\xa9M[\xfb\x92>\xee\xb4\xae%u\
-\xce\x99*\xb1\x0f\x00\xf1\xc4@\x96sDL\xf0\x00\xd5\
-\xdb\xd9\xee\xbe,\xa3\xd1&j\xcf\xe9Z\x8d\xcdF\xfd\
-\x83.\xef\xd4L#\x02k\xb0y |~[\x98\xf8\
-j\xec\xca\xd1H\xfa\x8f\x88dy\x8b\xe3\x5c\xfb#\xc1\
-\xf7\xa9\xbc\x86\x08Fr\x02',{aO\x03\xae\x15\
-\xeb\xaf\x90\x00L\xa3\xf1\x0f\xa5\x8d\xb3\x028m\xe4\x1f\
-z\xd0H\x00hJ\x04 \x9f\x12 \x8e\x04\xb0\x80\xe5\
-r\xaf\xbf\xe3\xe1\xa1\xee~\x17\x85<m\xa71(\xa5\
-\xd4\xc1\xa5\x01 \xa5\x94Ru\x86\x88\x8d\x18&f\xac\
-\xe8\xb1\x8fn\xf3,\xc3LC\x041,&[\xcdS\
-}\x84/\xb26\x9e\xf59\xbe\x8dF\xc2YS\x9c=\
-\xae\x1fv\xaa\xf9\xa2=|k\x9a\x93\xfa\x10\xf5\xc6(\
-\xe2F\xba\x8b@\xc0D\xcc\x1e\x82\xd8qd\xfc\xd9\x8b\
-\x07\x97-\x18<\xea\xb8\xfcyg\x9e2\xeb\x88\x05\xae\
-\xfb\xc1j\xa9\x97\x84\xc3\x80\x18^\xbc\x90\x07\x0c@\x06\
-\xde\xc0\x91\x80\x88\x19\x04H\x0a8@\xea\x8b8?\xaa\
-E\xeb\x8e'3\xd2Uud\x90\x96\x80\x05\x06\x04\xe6\
-\x1a\xd9^P\x0cNvHw\xca\x1e{\xeb\xe1c\x00\
-`\x03\x8e\x09\x9e\x84\x8c\x87x\x914\x85\x980\x8al\
-\x90\x90\x88\xa4\xe2S/$@\xd9\xc9\xe6\xa6\x5c\xee\xe4\
-\x93\x8e\xe8\x5c8\x7f\xf1\xf1\xf4\xeb\xfb*\xbf_\xb9i\
-c/\xa4\xc2\xb9&2\xd4\x0c\x14\xbc\x8b\x0d9b!\
-x\xe7S/\x12011\xea\x15pTo\xa54\xea\
-\xa7\xce\x22\x0c/\x10iT\x8cdWV\xe3\xfe\xd3\xf6\
-V\xb2\xf5o\xfa,d&c\x16\x00\xce`\x07\xa4\x89\
-\xf8\x816F\xc1\xe6\xb4\xe1\x81]\xa7\xa4\xd3.O\xcc\
-\xfa\xc6D\x0e\xc4\x93\xaa\x84\x0c\x8d\x7f\xbe\xd4\xfc\xc8\xc6\
-\xe2e=ES\x98g8\x09\x10\xbbX\xbcwad\
-\xc0\x84\xd4mO\xb1\x1bud\xc9f3\xd6\xb3)\x85\
-eO\xe1\x95\xb1\x1ed\xc2\xe4S\x8d\xb2'&y\xd8\
-\x18@#\x96=\x12\x00\x1a\xf9Oi\xf4{\xde]~\
-h\xe3\xf0#\xf7\xaa\xd1-Z\x90\xfd~\x91F-k\
-\xe3\xd6\xec\x11\xc6\x8eR\x89a9lC\xb0\xe8\xa6\xe5\
-\xc9\x17\xef\xeb\xeb\xa9I1o\xfc!p-)\xa5\xd4\
-A\xa0\x01 \xa5\x94R#\xea!\x9e\x5c\x00g\xe0\x84\
-!$\x22^\xc4\x09\xd2F\xc0\x03B\xbb\xa9\xe4\x91\x9d\
-v3#5V];\x0e\xbb\xd9Y\xbd\x81\x06!\x95\
-\x9bV\xe5\xab\x8f\xd5:\xef\xab\xbek\xa8\xf8G'7\
-\x1f\xd7\xbe\xcd\xe6\xb8R*U]\xb9\xc9J\x14\x01\x09\
-D@d`\x0a\xe2s\xe2\x09\x9e\x09\x0eT\x82\x94\xea\
-\x13\x95%\xab\xca\xa0\xc6\xd2n\xe4\xc0\xd2\x08\x12\x098\
-[\xfe\x01 G\xe4\x10\x00&\x0c\x86\x8c\x19hd`\
-q\xfd\x16\xd9\xadM\xd6\x93\xbb\x0c\x94\xb3\xb3%\x88u\
-\x8cT\x00J\x85\x9ce \x92Z@\x02\x12g\x90\xc2\
-T\xc1N\xb0>\xael@1\x5c\xb4\xa0\xb5c\xce\xac\
-\xa5G\x16\x8f\xb8\xa3\xe5\x8e{j\x1b\xb7\xd4\x92\x98\x92\
-(\x97r\x9bA\x89\xb9L\xbeF\xa6\x16p\x02I\x09\
-\x9e`I\xac\x97 \xeb3-R\x0f\xdc\x08\x09\xe0\x03\
-\xef\x0cb\x0fI\x0d\xb2\xb9\xf5Bpd\xa5~\xae,\
-B\xa6\x1e\x0d\x12F\xca\x92\x02)\xc0.\xeb[t(\
-\x05\x10\xf7\xd6\xcc\x08\xfd\xecz/FG\x7f\xa6\xe5}\
-$\x00`\x0f\x9f\xd6#\x93\xdb_\x07\xb2\xb0\xc9.\xc1\
-YrL\x86\xeb\xe3\xb0&z\x89\x12`,6mM\
-\xd6\xae\xedjy\xe1|\x1b\x95(\xeeI\xbd\x88\xab\x02\
-\x0c\x0f\xc4\x82\xac\xc0\x8a\x1bo\xe4\x09\x028&\x07\x82\
-\x84\x02\xcb\x92\x06\xa8\xd2\xae\x91\xa7\xdd\xcf\x13\x1b\xbd\x99\
-\xf0\xa4_\xc0\xb3HM\x8a`h\x87]\x8e\xfa\xe6.\
-\xff!;l\xb9C\xac\xca\x02\xc6\xc3\xd4\x13\x91\xc8\x81\
-\xc1\xf0$\x02\xef\xc5y\xf2\x10\x0f\x12XB\xd1!M\
-Q\x0e[\x5ctB\xbf[t\xcb\x93O=\xdb\x97\x16\
-rV\xd3\x7f\x94RjO4\x00\xa4\x94Rjg\x22\
-`\xca\xda\x05\xef\xe9\x93\xed\xc3\xd3\xa4\xd7E^(\x0a\
-s\xd5Z\xfc\xb9\xef\xdd\xfa\x9b\xbb\xf8\x9f\xaf\xaa\x9dv\
-\xc6\xec0\xef\xb7n\xdc\xe8\xe3an\xf6&d\xaax\
-\xf1\x0e9C&D\xcdI\x22\x80\x83\x05Y\x0b\x06R\
-\x81\x93\x1d\xd7M\xa3\xfec\xc7\xb4\x1e\xd4\x07\xea4~\
-jY\xfd\x85\xec\xae\x12\x84F-\x05\xeb\x81\xbdz\x0a\
-A\xbdO59\x11\x86\xe7z*\x0e{\xc0\x02\x8e!\
-$i\x1a\xa7\xaeR\x0b\x82\xe0\xe8\xc5\xf3\xc2W-\x5c\
-0\x7f\xe8\xf7\x7fX\xf5\xe0\xca\xfe5}\xdb\xc8\x98\xb6\
-\x16\x0e\xd8\xc7i\x0d>\x0d\xa3\xc0pP\x8d\xab\xa9\xf3\
-\x86\x09L\x22\xbe\xd1\x8a\x88\x1a\xe7R\x9f#'\xd8\xa1\
-'H=\x1bhTg\xd9Q\xdf\xad\xe7)h%\x98\
-:\xb0dRW\x1cMr\xfbL\x14\xf0\x86m\xc3\xcf\
-\xac\x1fx\xf1\x0b\x17X\x139\xe7\x83\xa8\x89L$\xd5\
-\x12\x92\x94\xac\xc04\x1ak\xd5\x9f\xc6\x22\x8d\x16k\xdc\
-H\x92\x99J\x1a\xcf\xde\xda\xb1Fs\x07\xbb\x14q\xee\
-\x80\x1b\xdf\x1d\xdd*\x08\x02\x11\xf1p$$$\x9eE\
-\xbc\xaf\x0f\x1c\x00\x00!2\x04Oa\xbe\xa5\x12\xb6\xde\
-}\xdf\xd6\xa7\x9e\xed\x09\x98\x03\xb3\xfb(\x97RJ)\
-h\x00H)\xa5\x94\xda\x7f\x98\x04\x04f\x8a\x93\xf4\xc9\
-\xf5\xb5\xcf\xdf4\xfc\x8aM\xf9?:\xfb\xd8\xb9K\x8e\
-*m}vh\xe0\xd9|P\xce[\xc0{W\x1e$\
-S&\xf2\xc2\xe2\x9c'\x0f\x1bD\x90\x82x/\xa8\x12\
-\xa7\xf5\xb0\x8epc\xea\xd9H\x85E\xb6\x06\xf4\xf5 \
-\x0a\x84\xc5\x0b\x5c\x16\xac\x81\xecy\x02\xfbnW\x88D\
-\x00<'\x82\x04`A(> \x10\xbc\x05\x18>e\
-\xf8\xd0J\xc0T\xabRyh\x80\x83\xa6\xe3\x8f\xe8X\
-\xd0\xd1|\xfc\x11r\xcc\x82u\xb7\xfe\xbeo\xfd\x96\xe7\
-)\xb6\x88]\xde\x90\xd8&W-T\x85S\x88\x18\x9f\
-\xb0\x03\xc5D5\x82\xb00yCb\xac7$&%\
-\xf6\xc8\x81\xc4#\xf5Y\x02\x90\xc0x\x124\xea>\x1a\
-}\xb6\xb3\xb5\xae'C`\xd4\xc7#\xe9rOMO\
-\x22S\x8a\xa1G\x16\xcf\x0f\xd3\xff\xac\xd8z\xce)\xad\
-/\x5c\xd6RJ\x00+Q!\xef\xaa\x15\xe7\xc5\x06\xc4\
-L\x10/\x94\xb5\xec1\x1eD\x02\xf2\x12\x80I\xe2Q\
-\x91\x94\x03\x1c\xbe\x9f\xc2\xe1\x04\x08 !\x00P\x0c\xa4\
-B\x1e\xe4\x09i\x96g\xea}\xe31\x14xo\xeam\
-\xe7\x0c\x1a\x0d\xe5\x0dE\xed\xb9\xd6\x05\x03\xc3\xf1w\x7f\
-\xf1\xf4\xea\x0d\xd5\x8e\x96\x9c\xbe (\xa5\xd4\x18\xcc\x9c\
-9s\xe28>\xd8\xa7\xa1\x94RJ\xcdX\x04XC\
-\x02\xfb\xf0\xba\xf0\xb7\x8f\xd6\xd2J-g\xc3\xb9]\xad\
--\xcd9\xa9\x95}Ra\x02y\x07N8L)t\
-`O\x00\xc4\x8a\x8b\xe0\x03b\x0fNA$dA,\
-0B$\x04\xc9\xca\xbe\xea\xad\x98\xa4\xd1\x98)k\xe2\
-Z/\x08\x9b\xda\xfa\xcf\x93\x87\xf1D\xc2\xc2\x04\xdb8\
-Xv<\xc7\xf0d\x98\xc8\x88\x83\xf7\x02P\xce\x86s\
-g\xb5\x1d\xb5t\xfe\xfc\xf9\xad\x81-\x0d\x0f\x0e\x0d\xf4\
-zI$\x0c\x8a\x1e\x85\x9a\xb3\xa9\x840V\x8c\xf7\x9c\
-x\x8e\xeb\x95k\xf0,d\x85\x09\xc6\x13{\xb0\xd4[\
-L\x8dt\x0d\xc7H\xd7)\x027j\xd8\xb20\x107\
-R \x0e\xd3\x1e@\x0a \x16Kb\x84\x121U!\
-J8\x048r\x12x\x08\xb1\xa3\xc09GR:r\
-A\xf8\xb2\x17\x84\xb3\x8b5\xa9\xc5B\xcc\x96@2R\
-qF#0f\x0aK\x1dCH\x8c\xf7\xc6\xb3\x90q\
-\xf5!z\x80x\x22af\x01;\x0f\x02B\x8b0\xba\
-c\x85\xbd\xff\x19\x0e,\xf1d\x9e\x8aL\xc4\xc6\xac\xdd\
-\x5c\x9e\xd7*g\x9f\x1cH\xb9o\xb8T\xc9Yf\x16\
-XO\x16\xf0\x02\x86\x18\x12\x22\x8f@`\x05D \x16\
-0\x1c\xc1\x8d<\x7f\xa6\xbd,\x00\x94\x03\x08\xe4@\xbe\
-\xde\x1f:\x0bm5\xc2\xdcL\x06bD\x18D\xc4L\
-l\xc8Z\xef)ua\xd0<\xd7\xd9\xb6\x9b\xef\xd8p\
-\xf3\xdd\x035D\xf9\xf0\x90\xb8\xd7J)up\x84a\
-\xa8\x01 \xa5\x94R\xea@`\xa6 \x08\x9c\xd0\xc3\xab\
-\x07~\xbf\xa2{iG\xee\xa8%\x8b\xd8\x14\x93\x18\xc6\
-0\x87\xa9g\x9f\x0d\xb57\x011\x90:\x11g\x0c[\
-\x04\x89\xa7$K\xf6\xf1DBR\x8f\xfb\x10\xb2\xaf\xb3\
-\xc9@4:\xd7\xa0\x9153\xc5V*\x0cb\x90\x80\
-=\xb3\x18\x88m\xd4\x91\x91\x80A\x1e>%\x82\x0d\xad\
-!\xf8\xca\xb0+\xf7\x05\xbe\xd4\xd1l\x17/\x88fw\
-\xb8\xc0\x0d\xc5\xc3\xae<$q\xec@\xce\x186Q\x08\
-+\x0e.\xeb\xeb\xe1AD\x9c\xf5%\xcaZ\xa98\xb2\
-\x8e,0\xd2c\x9c\x01\xce\x0a\xd2\xb2\xb4\xa6\x91\xae\xcf\
-h\xf4b\x11\x90`R\xcbj5\xc3\xcc\xd8\x00\x10\x00\
-\xc34T\x93\xc5-\xf1+\x8e\x09\xc2|0TIS\
-\xef\x82\x1c\xd9<\xa7>\x8d\x9d  \xcf6E\xe8%\
-\x80X\x80\x19 8\xaa\xcf\xf9;d\xaaw\x05\xd6\xc1\
-\x0a\x81\xc8e)M;\x8d\x0b`\xb1D&K\x01\x94\
-\xac\xdf\x99\x15\x18\x97\xa095K|4\x7f\xd5\xfa\xbe\
-O\xfc\xa0{\xd5\x96\xa0\xb59\xd0\xec\x1f\xa5\x94\x1aC\
-\x18\x86Z\x02\xa6\x94RJ\x1d \xa1\xf1\x81\xe1\xc45\
-=7\x98|\xe5\xa7\xdb\x9e\x7f\xde^pj~\xd9\xdc\
-E\x08\xb7\xc1\x95]9\xad\x95\xc1\x16\xf9\x9c0\x83\x0c\
-\x8b\x04\xc2\x11L5\x15\x87\xfa\xaa\x8e\x1a\xb3\xb0\xb6\x8f\
-\xfb\xa1zZ\x8c0<A R\xef\x81J\x8d\xde\xcf\
-\x93\x94\xa5\x19\x89\x00\x94\x82<`\x05\xf5a\xeed\x09\
-6\x80/Q\x12\xb3wF\xca9'\xce\x0b\xd5\xd8\xb8\
-B[\xbe\xf9\xf4%\x85\x05\xc5e/\x5c\x5c\xfd\xd5]\
-\x83\xf7.\xef\xdfX\xee\x05|\xd0\x91G\xc8\xce\x87\xe2\
-\x8d\xb0\x08{\xa2\x94!\x22^8\x15\x09\x1d\xf2\x0e\x11\
-\xc3\x93\xa4\x04&\xa4\x18Io\xca\xeeTV\xb2&\x06\
- !\x16a!\x03\xc0H\xaa\x15\x1fj\xe6!\xa0)\
-o\x9fz\xb6|\xf7\xa3t\xde\xcb:Z;\xa3\xc1\xfe\
--\x95\xb4\xda\x14\x22!\xa4\x11\x1c\x03d\x9d\xe4\x98\xac\
-!\xc3\xde\x8bTH\xfc\xf6\xa7\xc3!\x10\xff\x91,p\
-\xe6\x88\x09\xe2`\x03\xa9?\xd9G\x8a\xd8H\x00\x18\x88\
-\x01\xc4C\x5c}\x94`\x02\x82\xc9\x17\xd8\x1e\xf3\x5c\x0f\
-\xdd\xf0\xbbg\xd7nE\x98\x0f\x18{\x9c|\xa6\x94R\
-*\xa3\x01 \xa5\x94R\xea\x00\xc9Vf\x81\x81\xb0\xbd\
-}]z\xcf\xda\xd5\x1b\xd7\x0f\xbf\xe1\xfc\xd9\xcb\x8e\xe9\
-\xc8\xe5\x97\xa6Ao\x9a\xc6@j\x5c\x12Z\xb1\xc6\x88\
-O\xc5W\xc4%D\xf5\xd8\x8f\x90\xa7z\x82\x8c\x1f5\
-\x8fl\x87\x0a\xb0Q\x87\x9a\x22\xf2\xf0\xae\xb1/\x01X\
-Fz\xd9\x8a8\x11GL\x04\x88\xf3\xe2A\x86l\xce\
-@XjIR\x1a\x0a\x8b\xf9e\x0bgwu4\xb5\
-u\x0ev\xccY}\xef\xc3\xdb\xd6t\x0f\x0c\xf4\x0b|\
-\x14\xe6\x18D\xa9'!;\xd2\xb2:\x85\x17\xb0\xd0\xf6\
-\xfe>Y\x82\x0fI\xa3\x8ce\xa4\x12\x04\x00F\x86\xc4\
-\xd7\xe70I\xa3\x17\x88R3L1\xc2\xc3[\xf8\x07\
-\xbf\xef=\xf9\x05\xf9\xb6\x05s\xcbIR\xa9m\x92j\
-l\x8dX\x86\xf7B\x92Z8\x12&2Y\x9c\xb4\x9e\
-\x06x\xc84A\xce^\x06\x1c8\x86\x80\x91B\x00\x09\
-\x00\x81ot\x83\x16\x80}6\x22\xce#\xab:e\x93\
-\x0d\xfe3\xed\xb5\xb4i\xf9\xca\xb57\xdfW\xee\xad\x85\
-mEx\x0d\xff(\xa5\xd4x\xb4\x04L)\xa5\x94:\
-\xd0\x88\x88\xacI\x81M\x9b\x06\x1e_\xef\xd6\xf7\xb6\x16\
-\x0bs\xda:\xe7\x15f\xcd\x09r\xb9$I\xd2\xa4j\
-\x103\xd5\xc4UHb\xcb0\x1e\x06B\xe4\x85<\xc1\
-\x13\x5c\xa3$\x8a\x00&a\x12\x22\x18\x02a$\x0b\x80\
-v\x1dM=\xb1\xd3\x83\xb0oL\x15\x12\x03\x18p6\
-l^\x9cO\x92\xa4l|BV\xc8\x02\x06d\x00\x11\
-x!q`Oi\x8c\xda`@\xc3]s\xc3#\x8f\
-l^\xb40\x8cB\x19\xe8/U\x86\x87C*[\xa2\
-@\x22\xf6\xa1\xf7\xd6#\x10\xb6\xce\xc01<\x9a\x04\x81\
-\x87\x10@`\x02\x91xF\x16\xf8\xf2DB\xf5\xa6\xd5\
-\x84z\xf4\xc7H\xbd\x13lV\xf3r\x08d;\xa8}\
-\xed\x10(\x01\xfb\xed\x0a{\xdf3\x1c\xda\xa9\xcc\xb5g\
-B,fh\xa8\xd6Y\xe4\x05\x8b\xe6:\x13%\xe9\x00\
-0\x1c\x06\xc2\x1e\xc6# 1\x82@\x88=\x11\x89\x11\
-_\xaf\x94\xa4C\xa8\x04\x8c\xc48gc\x98\xd8H\xca\
-b\xe1\xf2py\xf8\x08.\x84\x8f\x80,\x0f\xd1\x09;\
-\xcf\xde\x11\xc5 \xb1\x14\x15[\x86\x92\xa3\x7f|\xb7\xfc\
-\xe87\xcf\xae\xe9\x8dM\x10\x04\xac\x91`\xa5\x94\x1a\x87\
-\x96\x80)\xa5\x94R\x07G\xce\xf8\x5c>\xe8N\x17\xac\
-\xdb\xe0\x7f\xbb\xa1\xe7\xb9m\xfd/?\xad\xe5\xa8\xa3\xdb\
-^\xb0\xb0\x1df`\xa8\xbf_\x8c4\xe5\x85s\x90\x14\
-\xf0\xf5\x92/\x168\x80\xb2\xe9X\xf5\x7f\x1d=\xee\x87\
-F\x1a\xe5\xec\x15i\x8c\x98\xaf\xb7c\x1e\x99\xce.&\
-\x10XCI\x8a\x14\x12\x80\x00\xa4@Z\xef\x0ed$\
-\x95\xb4\xec\xa4\x96P\x95\x0a\xb4p\xde\xbc\xb6\xce\xd9m\
-\xb3\x07\x0b\xad\xeb\xef}d\xd3\xba-\xbeV\xad\xb0\xcd\
-\x9b\x80a\xd8\x099\x9f\x0a1sv\xda\x925\x80\x16\
-\x0f\x11_omT\x1f\xf25\xb2\xb2\xf3#EmR\
-O\x83\xd2E\x9f\x9a\x99\xbcG1\x87g\x87\x0a\xdf\xbd\
-\xb7\xbcd\xd9\xe6\x13_8[\xd26J\x07!U\xf1\
-Y\x5c\x16\x02\x07r\xf0\x1e\xbe\xf1\xa4%\x02\xd5\xc7\x8f\
-\x1d\x12\x88\x84X\xb2\x17\x00x\x81g\x88it1\xf3\
- \x061\xac\x07\xc1\x0b\x1c\x0c8\x17\xe6lXh{\
-d\xc5\xe0\xe7n^\xff\xec\xb6J{s\x18\xa2\x913\
-\xa4\x94RjL\x9a\x01\xa4\x94RJ\x1d4\x86)\x08\
-\x98-=\xb19\xfd\xdd\xe3\xa5\xfb\x9f\xacFA\xf3\x0b\
-\x16\xcf\x8brE\xa9%\xe2\xcb\xcc`\xd4\xe3\x1e\x82\xfa\
-\x84\x1c32,+\xcd\xda@\x13;C\xc4\xf5p\x09\
-\xd53g\xea=\x95\xa7\xc0e\xdd\x84\x1a#\xe7I\xbc\
-I<'\xa0\x18A\x0a\xe3\xbc\x11OY[j\x82\x07\
-`!F\xd8\xc0\x18\xe2lbO*\xbe\x02W\x0ax\
-\xb8\xa3\x18\x1f\xb90:\xa2\xcbr\x5c\x1d\xda\xe6\xfb\xfb\
-cv\xd5\x96\x02\x8c\x8d\xca5[Ks\xa0<I\x12\
-Pl\x19\x02\xef\x92\x9a\xa4b\xd9\x18\xcezz\xa4\xd9\
-ZVX\x04\x22\xf5\xf5\xa2\x05, \x0cG\x8d0\x95\
-\x9a\xc1F\x12v2YF\xcd\xf4\xcf\x00\xfa\xcdr{\
-\xdf\xaa)f\x00e\xe7`,\xaf\xefq\xfde9\xe5\
-\xd8Y\x0b\xe7\xb7\xf9x\x98\xe2\xe1\x90\xc5: \x06\x8b\
-\x90\x08;Gi\x02\xf2d\x19\xd68\xc09\xe1\xc6\xa3\
-4\xdd1\x98\xc5xP\xc2\xe4\x22\xa4!\x9c\x85\x17P\
-\x0cS\xcb\xee$r\xe2-\x06+\xa8\xba\x5cs\xeb\x91\
-\xf9h\xe1C\xcb\xe9\xfao\xf5<\xb9)mk\xb6S\
-\xe9s\xa6\x94R\x87%\xcd\x00RJ)\xa5\x0e.\xe1\
-z\xd3c;\x94\xca\x03\xabk\xeb\xbf\xb1>\xad-\xfe\
-\x93\x0b\x16\xe4\xa3\xd4\xf5\x0f\xa7\xa5\xaa5 C\xa8\x82\
-\xac \x04\x0b\xbc\x03\x18\x96\xe0!^\x9cH\xf6\xdb\x9c\
-\x00\x110\x117\xe6\xac\xef\xc5\xf2O\xb8\xd1I\xc4\x83\
-\x1c\x90M\x1cs\xf0\xf0\x04\x18p\x96\x7f\xe3\x05\x0c0\
-\xc3Y\xf2\x00\x0b\xac\x83\xa4,>B\x9c\xc4%\x97\xa0\
-h\x82\xb69\x0b\x16t-8j\xc1\xfcy\xb7o\xf9\
-\xe5\xef6l\xe8C\xad?As.\x0cf9\x1f8\
-I-\xc7\xf0\x15\x97\xa6\x02\x13Xk\xad5L\xf0\xce\
-{\x01\x81F\x92~\xea\xe9H#\xcb\xf4C\xa5\xceE\
-\x1d\xb6\xf6\xb6'W` \xb9\xe8\x7f\x1e\xa8\xe4r\xeb\
-\xff\xe1]\x0b\xe6w\xcc\xael\xdc\x9a\x94k\x94#\x13\
-\x10*\x1e>\x01\xa5\x14\x85\xb0A\xeaS\x1f\xa7\xc4\xc4\
-\xc6\xd2!\xd2\x10\xd9\xa7\x10\x07k\x81\xd0BrH\x22\
-\xb8\xac\x8d\xbd\x87\xa9!\xf2\xe2\xe0jp!8\xe2\xc8\
-v\x90i}fM\xf9\x13\xdf\xed\x7fx\x8doi\xb6\
-\x86 \x9a\xfb\xa3\x94R\x13\xa6\x19@J)\xa5\xd4\xc1\
-g\x08\xd6\x90e\xea\x19N\xef{\xb27_\xee]\xd4\
-\x1a\x15\xda\xe6Z\xdb\x9e\xc4\xc6ykl\x9e\xacu\xc6\
-\x11\x01Y\x93f\x02\x1b@@\xde\x12\x99F\x06\x83\x08\
-9a/$#3\xd5'\xcd[\x88\xd9~k\xcaJ\
-KD8+\xcd\xaao%`\xc0\x08\x02A(\x08\x85\
-\xac\x98\xc4Q\xe2\xe1\xb3\x05/g\xed\x9d\x1d|\xe2\xf2\
-\x96\xe7\xcemZ\xb2$\xec\x9a\x9d\x08\xaa\xfd\xfd28\
-X\x13\xd8\x9c\x89\x22r\x11\x0f1\x95X\x92\x80Ld\
-B&\xe3}\xe2\x5c\xca\x86\xc8p\xbd\xbe\x85\xa4Q\x8c\
-\xc6$\x86\xc0\x041H\xf76\xd4\xa5\x0eA\x87P\x06\
-\xd0\xfdS\xed\x014\xc2\x1a&\xa2\x15\xab\x07\xf3\x1c\x9f\
-\xf3\xc2\x0e\xe3\xa3\xdap\x95\xc8\xd9\x00\xf0\x80\x03\x98\x10\
-\x1a0\xa5\xa9wN\xc8\x046\xc8\xe2\xc3\x87@h\xc4\
-%\xe2\x13b\x8e\x88\x9a\x90\x1a8\x07\x06B\x8f\xb0*\
-6\x91\x1c\x9c\xc5p\x8c\xb2\x98\x96\xaee\x85\x96\xe3\x97\
-/\x1f\xba\xf1G+\x7f\xfd\x94\xafE\xc5\x5cxH\xdc\
-E\xa5\x94\x9a.\xc20\xd4\x00\x90RJ)5]\x18\
-Cah\x87j\xf2\xec3[\xb7lAk\xbe\xeb\x88\
-\xf9\xb3M\xbeY<yv \x90\x17\xa6\x84\x0cH\xe0\
-A\x22`\x0f\x16[o\xffL$\x80\xb0xv\x9e\x84\
-@,\x93]w\x0a\x00\xf8\x00\xde\x82\x08\xc8z?;\
-b\x0f\x92\xac\xe0*K\xbb\x11\x90\xc0\x0a\x02\x8f\xc8#\
-/\xc8\x0b[g\xaa\xce& 0\xc0\x1e6\xdb\x82\xc4\
-\xfa\x1a%}\xe4\xb6\xb4\xb6\xa5\x8b\x96\xb6/\x98\xdf\x11\
-\x06\x85\xad\xdb\xe2M[\x07\xd3rP\x8c8\xb4\xbd\x06\
-e\xcb\xc2B\x92 \xcdR\x00\x18`\x03\x86\x90\x03y\
-a\x01\x09\x88\x08LbY,C\x884\x00t8:\
-T\x02@\xb7/\xb7\xf7?\xc3Q\xb0\xb7\xc5XA\xc0\
-\xd5\x04\xb5J\xbc\xb09\x5c2\xa73\x17\x19\x94\xfaQ\
-M\xc8\x029\x02\x8b\xab\xb9\xa4\x96P`m\xae\x08\x0a\
-\xbds,\xe9\xa1P\x1d)D\xc4\x08L\xda\xe4\xe3\xc0\
-\xd7b\xf2\x09YF\xce!\xaa\x10\xfb\xd8#1HC\
-\x98B\x9b\x89\x8e|\xe0\x89\xfc\xf7~\xda}\xdb=C\
-\x03A!,\x04\xda\xf8G)\xa5&E\x03@J)\
-\xa5\xd4\xf4\xc2@hy\x10\xf9G6\xc9\xc6\xf5\xeb(\
-\x1e\x9c7oVaV1\xad\xc6\xe5\xd8\xc3\x06\xf5\xc6\
->L\xa9\x87\x8b\x89\x85\x98\x0d`\x1b\x09;^\xc8\x83\
-\xbc\x90\x18\x99B\x00\x08\x00 \x16\xc2`\x01\xf9z\xdb\
-\xa1Q\x83\xe6\xb3\xc4\x22\x12\x221\x00g\xed\xa9I\x00\
-\xf2\xc251)\x09X\xc8d\xf3\xbb\xc0\xc8\xfa\xd22\
-R/\x03\xe5\x0a8\x9a3{\xc9\xc2\xc5G4\xb7\xe6\
-+\x83\x95\xf2@)\xa9V!Uc\x1d;H*\x22\
-\x14\x04\xf9\x5c.\x0f\xc3\x95Z\x92$5\x13\x10L}\
-&Y\xd6\x17\x85\xea1/!\xda\xebb7u\x08:\
-T\x02@\xbf\xd9G\x01 \x11\x84\x81Y\xbf\xcd\x0f\xf5\
-\xf4\x9c4/\x9d5\xaf\x8b\xc8T*U\x0f\xf1\x86=\
-\xc19\x12&\x1b\x05\xd6\x04\x92\x8aOkL\x8e\x1a\x83\
-\xf3\xa6/\x02q\xc0\x1c\xfaD\x5c\x9cz8\xb2D\x86\
-\x1c\xa7NbO\x5c\x91\xa0\x22Q\xfb\xecYMms\
-\x97?\xda\xf7\xbf\xbf\xbc\xfeW+\x93\xa4\xb5\xc8\xa1%\
-m\x00\xaf\x94R\x93\xa4\x01 \xa5\x94Rj\xda!\x80\
-\x98a\xf8\xe9\x81\xe0\x17\x8f\xa7\x9bzbB\xb1\xa9c\
-AS\xd7\xfc\x8a\xcbUc\xf2\x02\xf8\x94\x08\x01[\x86\
-i\xf4\x11\x22\x12!rB\xce\xb3\x07\xc3d\x15X\x93\
-?x=\x96\xc4\x00;\xd4#,\xf5\xef\x19\x81\xf1l\
-\xbceo\x18LB\x0c\xcf\x88\x89j\xc4U\x98\x04$\
-L0\xc2\xe4#\x92\x08\xdeB\x08\xf0 \x98\x10\xd6\xc2\
-'e\xa4C\x9d-t\xe2\xd1\x9d'-+\xcc2C\
-\xd5m\xc3\x03\x83q\xe2\x10\x90\xe4\xacD\x91!\x0a\xe3\
-\xd4\xd7R\xe7\x999\xe0z\xab[J\x01O\xf5\xa9A\
-\x86\x84\x08\x22\xf0\xd3|\x85\xab\xf6\x87C!\x00d\x10\
-F\xbfY\x1e\xdc\xff\x0cG\xc1\x14\xbb\xb1\xefp\xe0\xac\
-S\xd8`e\xd3\xd6\x1a\x82\xae\x05\x8b\x8f\x0aZ:\x87\
-\x1cj\xf0\xde l\x0a\xc3\xbc%\xe7PI\x8c\x17f\
-0\xcb\xb4\x8f\x8d\x0aH\xe0CI\x03q\x8e\xac\xb7y\
-\x8b\xd0\xd4\xb8V\x92jbsq\xd4.\x859\xd4\xb4\
-\xf4\xa9\xcdG\xdc\xf6{|\xff\x97\xdd\x7fX\x03or\
-Q8\x9d\xef\x94RJM_\xda\x04Z)\xa5\x94\x9a\
-\x8e\x18b\x0c\x10\xe5*\x89\xfb\xc1\xfd\xe5\x9f?\xbc\xfa\
-\x9aW\x14\xde|\xe9\xb2\xce\xb6\xce\x0aU\xcb\xa5\x0a\x07\
-a>\xf0&\x11\xf1~\xf4\x1aO \xfbb\x12\xbco\
-\x0c[\x1f\xbd\xab\xac\xc0L \x04\x18\x80 B\xe4\x1b\
-C\xe3\xbd@\x18\xc2\xf5\xf1cY/j\xae/A\x05\
-\x02\x10#\x10\x84\xf0\xb1\x1b\x08\x5c\xb1\xb5\xb5\xb5\xe9\xd8\
-\xd6\xce\xe8\x98c\x96\x0c\xfc\xcf\x03\xeb\x1eZ=\x5c)\
-\xc1\xa5\xdeR\xe2Q-\x95$%\x93om1\x96\xaa\
-\xc9\xa0\x17a\xda!\x9aE;\x9f\x9eR3\x99\x00\xc5\
-@\x06}\xeb\xb7\x1fMW\xf6<;P\xaa\xbe\xec\x8c\
-Ys\xe6\xcc\xafV\x99]\x7f\x9a\x96]-6\x89\xb3\
-\xb0`fC@r\xb0Oy\x02\x84\xe0\x85\x9cgb\
-\x8a\x04\x01\xa7\xde\xc7\xce9\x13D\xc5Yaq\x96 \
-|\xe0)\xff\xc9o=\x7f\xef\xca\x0a\x99|>\xc7\xcd\
-F\x0e\x91\xf6\xd6J)5\x1di\x06\x90RJ)5\
-MY\x92\x5c\x00bS\x8ae\xdb\xa6\xcd\xdd=\xfd5\
-2G\xcc\xcd\xcf\x99\x15\xd4\x92rR\xad\xd6\x8b\xbc\x84\
-\x1bs\xdf=q*\xec\x84\x05\xd4\xe8\xc1\x0cL*\x0b\
-@\x08B\xde\xb3\x08;BV\xbeE$Lb\xc9[\
-\xf2!\xf9\x00bI\x88\xc4\x139\x82#\x16\xaa7\x1c\
-2\x10\xc3\x8e\xea\x03\xc4\xe0\x84\xc4\x13\x0b\x05\xce\xdb4\
-5\xe2#C\xb9\x80C\xf6\xa9\xaf\x0d@\xfag\xb5\x95\
-\x96,\xf5-sf\xc5\xdcV\x1e\xaa\xf6\xf5%\xc3\x15\
-\xe7\xd9\x9a\xb0\xc9\x849\x0fN\xe0<\xa7\x02O\x94u\
-\xa0&\x162\xde\x1aO,\x22f\xc7\x00\x98:<\xec\
-\x92\x01T\x11\xe2Q\x19@\x22d\x1c\x05\xceyH\xe9\
-\xc8\x85\xe1\xcb\x8e\xb7\xb3\x8bU\xa9%\x07\xbc\x04l\x9f\
-e\x00\xa1^JI60\xdb\x86\xd3\xbbV\xf6n+\
-U\x17-\x08\xda\xbbL\x94\x97\xe1\xd2`\x5c\x8a\x03A\
-`\x0d\x08\xf0)\x8c\xdb7G\xdd_F\x1ek\x0fr\
-\x148\x09\xd2D\x92\x04\x89\x84\x5chi\x0f\xa2\xd9\xe5\
-J\xdb\xdd\x8f\xa6\x9f\xf8\xd6\xd6\xfb\x9e,\x99\xc0D\xa1\
-\xb1#\xc3\x09\x95RJM\x9e\x96\x80)\xa5\x94R\xd3\
-\x9da\xe4B\xee\xf7\x85G\xd6\xe3\xaeG\x06!\xc9\xec\
-\x0e\x99;\x0b\x96\xd3\xb4Z3^X,\xc0\xd9\xa0.\
-p\x22\xec\x85\x81z\xdb\x1ci,\xb4\xb2\xbf\xb7O\xf0\
-\xda\xd3\x02\x97\x00\xcf\xe2\xd9K}\xa5\x95\x15\x97\x19H\
-\x00o\xe1\x22\x88\xa5z\x05VJ\x94\x12{\x22!#\
-\xc4@j\xe0,\x09D\x04$B\x22\x06\xe0\x10\x94\x83\
-\x04.\xb1LQ`\x22\x0b\xcfn\x88\xd2A\xeb\x07,\
-\xf7Ga\xa98\xf7\xd4\xe6\xb9/\xcd75'qm\
-KO\xa9\xbf\x94\xda\xa0h\xf2\x85\xaa\xf75\x17\xc3\x08\
-\xb1'8\x86\x10\xc8\x80\xac3\xa1\xb3\x04\xa4\xece\x8a\
-\xa3\xce\xd4!l\xc7\x00P,\xa6*\x84\x94CO\x14\
-\xa5>r\x1edR\x8ab\xe7\x80\xd2\xb2\x85\xc1y\xc7\
-\x99\xd9\x85\xaa\xd4R!\xc3\x96A^$K^\xdb\xaf\
-\x01\xa0\xb0\xd1\x03h\x9f\x85b\x08\xb0\x0ccL55\
-+\xd6\xc6\xcfn\x1a.\x14\xaa\xed\xb3\xdc\x9cY\x12R\
-j\xbd\xa7\x9aG5\x9b\xac.\xa8\xdf%\xa9\x97v6\
-\xfe{\xbcs\x99r\x88e\x82w2\xdb\xbfG6\xb5\
-\xd0\x0b\xd8\x93u`\x9f\x92\xcf\x15|nN\xf3`)\
-\xff\xc0\xe3\xf1m\xf7T?\x7fK\xe9\xf1\x8d\xae\xa9\xc9\
-\xe6Bf}\x9e+\xa5\xd4\xde\xd1\x120\xa5\x94R\xea\
-\xd0\xc0l\xbc\xe1\xbe\x8a\xfb\xcf\x1f\x0f\xder\x97|\xf0\
-\xb5m\x97\x9f6/\xd7Ru\xb5>\x97\x0c\x8aT(\
-+\x92\x22\xb07\xe2,`@\xc6;\x10@\xe4\xc0N\
-\x908\xe7\x012\x01\x88 \x0e\x22\xcc\xc8&\x05m_\
-\x92\x81@B\x5c/\xb2\xa0\xc6\x82\xd1\x03)\x98A\xae\
-\xb1\xcc\x13\xc0\x81\x08Ro\xc6*\x04\x11!\xc9&\xd0\
-\xd7oG \x82\x03%\xb0\xc4\x8c\xec\xa8\x02!\x12\x97\
-\xc0\xc5\x08\x12P\xe0\x8aM\xdd\xa7\x1c1\xe7\xc8\xe6\x8e\
-S\x17\x1du\xc7\xbd\xee\xae\xfb6\xac\xdf\xb2\xa9V\xad\
-\xe4sA>ri\x22\xde0(J\xc5\x01\xf0\xc68\
-\x83\x9a\x8f!\x021$\xb4\xeb,h\xcab\x04{^\
-v\xcb\xd4\xe6\x07\x11\xc6\x087\xc9\x01\xefJ;F\x1f\
-\x5c\xd9?a\xb1)G\xdb\xa6\xfc\xe0d\xf7q\xa7\xa2\
-\x9f\xac\xd2\x90\x91\xf5\xaa\xb2\x82<\x01\xc6\x1bb#\xc6\
-\xc4\x80\x17b\xc4M\xa8\x99\xd4G5\x22i\x85\x09\xc0\
-\x9b\xc9\xa7p\x868{\xae\xd4\x83#$\xa3/\x14\xd9\
-\xe5\x8b1\xefV\xfdo_\x7f\xb2\xec\x90\xa0b\xb6W\
-A\xee;\x02\x10!\x0a9N\xe8\x9e\xe5n\xc53\xd5\
-K\xcf\xf6\xef\xbad\xd6\xd1s\x96\xb1u\xa0J:\x5c\
-J1l\x10\xb38d\xd1Xx@(\xeb\xda\xb5\xe3\
-~v\xbc\xa3\x02a \xdc\xdd\x09\xcb\x98\x0f\x08\x03)\
-\xc8\x01\x8d\xd7\x8c\x91\x1b\x8d\xbe5\xc1\x83\x09\xc6\x0b\x01\
-\x9c\x15\x95\xa6\xc40A\x14\xe5(\xc8\x81\xc3\x8a\x97\xd5\
-O\xba\xff\xfeE\xed\xaeGK\xdd\x83\xb5\xaa\x84\xf9\x88\
-\x0d\xeb\xb8w\xa5\x94\xda74\x00\xa4\x94RJ\x1d\x02\
-\x18>\xb2\x08\x8d)\xd7\xa2G\x9es\x1f\xf9J\xed\x99\
-\xb5\xd1\x95/\x9f3\xaf\xab`\xc2\xa7|Re\x0f\xa4\
-\x90\x14\x84\xbcM;\xe0\xa2\x94\x90\x82\x89\x9d\x0d\xaa\xc6\
-\x94\x85R\xc7>\x1b\xafN\x06\x00QJ\x02K\x02@\
-\x804k\xd5\x0c\x01\x83\xe1y\x87\xc3\x93\xa0>p}\
-\x87\x7f\xad\x9f\x1a\xb2\x9b\x12\x81@\x9e\x1a\xdf\x22\x01\xc4\
-\x03.kGb\x98 \xce{\x88\x88\x17/\x80e\x12\
-O\x88}\x94<\x1c\x05\xcf\xcc\xcdw\x1e\xfb\xa2\xce\x17\
--\x5c|\xca\x82\xf0\xb6\xbbz\x96\xaf\x1a\xee\x1dN|\
-b\x5c\xbeP\x93|\xcca\xca\x12#\x16N%\xa8:\
-S3\xce\xb4\x95Z\xc3\xd4z\xda]S\x10\x1a+X\
-a\xa6\xdcFd\xcf\xfb\x9cbPi/\x8c\x11U\xe1\
-\xfd\x14\x00\x9aj\x1a\xc6\x94\x1f\x9c\xec>\xf2n/=\
-'\xec\x9d7\x0c\x14\xc1b,\x9131\x99\xc4\x1a$\
-I\x93+\xb5\xfbJ\x98\xa4m\x15o\xd0\x89\xd0\xb1\xed\
-\x83\x0c\x83<|\xde\xc0\x82<\xe0!#\x07\x11\xc0\x8f\
-J\x04\x1a\xfd\xf7\xe8\xa3\x8e\xfc\xb3\x80|\x161\x05\x00\
-\xf2 \xde!\xf2&\x16b\x017\xb5;>6\x02r\
-!%i\xb0m\x88\xbf\xf2\xd3\xf4\xc9U\xf6\x9d\x17\xb6\
-\x1c\xb7\xa4u^{!j\xf7\xd6?O~\x1d\xfc0\
-\xe0\x05^\xa4\x06\x8a\x89\x84\x1a\x97\x85\xec\xe9.\x8a\x87\
-\x8f\x00\x03\xf8z|(\xdbTd\xcf1\x18\x02\x08\xd6\
-\x0b'\xa8\x97\xa2\x8e\xec\xad\xf17\xd7\xa3d\x04\xf2d\
-\xc0\xa1 \x12&\x81\x15\x9bwA\xb1\x8a|\xb9\x12n\
-\xea\xc9\xdd\xf3x\xed;\xbf\xdd\xf4\xf4\x86\x84M\xc1X\
-\xe4B\xd2\xe8\x8fRJ\xedC\x1a\x00RJ)\xa5\x0e\
-\x0d\x22\x00\xa4\x90\xe3(\xe4Z\xcd}\xf9\xb6\xb5\x9b6\
-\xcb[/\xe0\x17\x1d\x17\x84\xb3:Q\xab\x95z\xcaT\
-\x93(4\x1c\xb0x\xe7%\x851\x02\xe7|L\xdeQ\
-h\xc3\x00\xe2\xc4\xa5\xe2S\xe1,?f\x87\x85\xe0\xb8\
-k{\xda%\x064\x11\xdbo%R\xef)D\xc2\x22\
-\x8d\xfc\x22\x12B*RN\xe3\x01\x16\xd3\xd1\xd2u\xee\
-K\x8f\x9d=\xbf\xb2\xe0\x81\xb5\xb7\xdd\xb3\xfe\xb9n'\
-&\x16\xb6& \x93\xb3\xa1\xb5U\x91$\xf6l\xc4\x12\
-1\x83\xec\x1e\x12}d{\x9f\x97\xdd\x9c\x93\xe1=}\
-k\x0c2\xe6>\xe5\x80\xb7'\x19\xe3d\xf6[\xff\x97\
-\xa9\x06\x80\xf6\xf2\xc1\xd9\xedaI\x84<\xa41\xa8N\
-\x08B \x12\x10\x91\x079a\xcf\x16l8\x85\x15A\
-B\x04\x0b\x13\x82c\xa1\x14\xbb$\xec\xecscg\xcd\
-\xec\xf5\xde\x05\xd6HK\xc1\x0c'\xe1\xcagz\xff{\
-\xc3\xda\x13\x8e\x8eN;i\xde\x09\xc7-Z\xd2\x05\x9b\
-\xcb\x09H\x84-\x00\xa4@\xe2%\xf1\xae\xe6P\x0f\xd1\
-R#\xf3\x8f\x84\x80\xac\x92RD\xac\xf8\x1c\x91i\xe4\
-4!\xbb\xca\xc6l\xbcL\x80\x88a\xe1\x00\x00\x8b\xf0\
-H\x0c\xb8q\xef\x85D\xb2\xd2Qc\x8d\xc9#\xcc!\
-`\xa4\xb1\xab\xa5\x95\xc4\xf6\x0e$\xcfm\xeeyfm\
-\xff#O\xf9_=;kk-\xc8\xe7M`\x89i\
-\xec'\xb1RJ\xa9I\xd3\x00\x90RJ)u(\x11\
-\x11C\xc8\xe78q\xfe\xfb\xcb\xd3\xe7{\x87^w\xee\
-\xdc\x17\xbfh\xd1\x91s\x9d)n\xadb+\xa3d\x5c\
-\x0f\x07\xa9\x0d=Y\x86\x83\xa4N\x12\x82\x0b9\xc8\x13\
-\x81\x5c\x22i\x95\xac#J\x81\x14\x06B\xf0\x00\xf9\x10\
-\x12\x09\x98Q\xa1\xfa\x08\xa1]\x97\xddS[\xff\xd7{\
-Q\x13q\xfd\xff\x1b\xc9+\xdey\x00&$\xca9\x8f\
-\x818\x19\xac\xf9-\x1d\xed\x0bN\x9b5\xabm\xf6\xec\
-\xd6\xae\xea\x1d\xbf\x1fZ\xb56\x96\xea\x90\xafIH\xb9\
-\xc8\x16\x9d\x14*\xd5\xa6\xd4\x09\x19\xa4\xb9\xb4\x1a:\xec\
-v\xda\xfd\x98kG7\xa5\x09b\x22\xbb=R\xdd\x81\
-\x9fMt\xe0\xe3?<\xd5\x88\xc6^<8{\xbc'\
-\xd6\x11y\x16\xf6){\xc7p\xd9\xe0sb\x82\x90\xa1\
-$\xb5%\xc0\x01\xc3\xf9\xdcP\xd42\x14P9\xe8\x10\
-\xa94y\x14\x85\x0d\xf9Q\xd1\x9f]3a\xf6t7\
-\x1a5\x8f\xd9\xb0\xbbz\x15\xda\x9e\xec\x93\x91|\xe3\x92\
-\xe6\x9c\xf8\xd8\xaf\xd8\x90\xac\xebO\x96oX\xb3\xf4\xf1\
--\xc7,jz\xc1\x92\xdc\xdc\xb6(\xca\xe7\x8a\xcd\xf9\
-\xe6\xe6 \x8a\xc0\xec]Z\x83$\xcc`\xda)\x00T\
-\xbf;\xc41\xb8L\xf5{7r\x84\xac\xbes\x8cs\
-\xf0\x9e\x22\x8f<\x90\xe5\x105v'\xc8\xa2tq\x9c\
-\xa4\x9e\x80\x00\x1c\x92\x89\xca1?\xb7\xb9\xda\xd3\xdf?\
-0\x94l\xee\xae>\xb7\xd1?\xb7\xb1w\xfd\xbaJ\xf7\
-\x10\x95\xdb\x5cKSPO=\xd2\xd0\x8fRJ\xedk\
-\x1a\x00RJ)\xa5\x0eI\x81a\x09\xa2{\x9e7\x0f\
-|\xbf\xba\xf8\xf65\xef}U\xdb\xeb_\xda\xd1\xdc\xe6\
-\xab\x031Q\xd5\xda\x84\xac\x88\x01\x11H\xe0\x9c\x91\x1a\
-|\x92\xd5\x7f\x05l=PE\x96\x84S_\xe8\x91\x08\
-\x09\x02\x01\x13j\xfb\xab\xdd\xea\xf6\xb0D=-(+\
-)\x22\xf6\x90\x94\x91\x8a\x87O\xaa\xe5\xe1\x98r\xc9\xc2\
-#\xba^3\xe7\x8c\xa5G\x0d\xdf\xf5\xfb\xe7\x9e\x5c\xd5\
-\xbdj\xf5P\xdf\xb6\xe1\xf2@-\xb4EH\xc1:\xeb\
-\x90\x94\xe2\xe18H\xd9\xef\xb9\xa3\xf5\x1e\xf0\x94*\x92\
-\x04\xe01\x22+\x07\xbcI\xedX)N\xfb)\x02\xb4\
-\xbf\x1b\x04\xef\xe6\x88{\xbc%;fo\xbd\xf1)'\
-\x8e\xb2\xb2E\x81\x04$\xd6\x10\x9c\xd4\xe2R%\x15T\
-Eb\xb2T(\x04\xe8H\x93!T\xe3\xack\xf3T\
-\xcfj\xfa\xf5\x22v)\xe7\x0bna\xb1W\xb0uX\
-\x1ey\xdc\xb9\xc7dIS\xf9\x94\xaeZ\xb1=h\x9f\
-\x15\xcc\xee4m\xad\x9c\xcf\x911\x0cd\xc3\xfb\xfc\xf6\
-\x00\x90\xcfb5\x04\x10\x99\x18A\x85\xb2J\xd1\x86\xfa\
-e6F\xbf) E\x98\xfa2\x00\x03\xe1\xc6C[\
-/\xcd$#\x0eq\xea+\xb1T\xaa&NxS\xaf\
-\xfcr\x05\xb6\x0d:\xef\xa5\x96:\xe7\xe1\xa9\x8b\x02p\
-'\x05F@\xfe\x80w\xd3RJ\xa9\xc3\x85\x06\x80\x94\
-RJ\xa9CU.@\xccA%\xf6\x8fo(\xfd\x9f\
-o\x0f\xaf\xde<\xeb\x1d\x17\xb5\xcck\x0d\x9c\xeb\x8b}\
-\xbf\xa1\x01\x1f\x0b90\x11\x07\x06d$qHRX\
-\x0b\x9be\xe2\xec\x90\xc1\x90r\x96\xe1\x22\xd9:z\xdf\
-\xcb\x0a\xc0F4\xd2\x0cD UP\x15 \x84\x01\x99\
-\x90\xaai\xb5:\xb8\x01A\xb9\xb3m\xfey\xa74/\
-\x99\xdb\xf1\xd0\x8a\xa1\xbb\xee.=\xb6\xd2\x97\xaaI\x14\
-\xf4\xe5\xa2a\xf2&vn\x96I\x1d\x0bO\xbe\x9c\x8b\
-\xa6\xf4\x0e\xa8\xde(fO\xfb<\x08\x01\xa0=~k\
-\x7f\xc5\x7f\xa6zaL\xf9|\xc6\x0a\xb8y\xb0\x90\x10\
-R\x16\xef\xe1\x98@\x02\x0f\x12\x0e\x0cB\x12\xf2\xd2D\
-X`\xfbZ\xe35M\xd5\xe6\xc8\xf5\xb9\xb4f|J\
-DS\xea\x92\x945\xb31\x93\x89\x01\xed\xe3\x0e\xd0{\
-8\x06\xc103\x93\x80\x0c\xbc\xb3\xe2\xfc\x9a\x92_7\
-\x1c\xd2\xb3\xc2,\x01\xa7\x81\xf1\xd6\x80\x89\x88id8\
-\xe0\xe8gc\xbdw\x91\x08\x9b\x80 ~\xe7\xd3\x1e\xfb\
-\x07O^\xc8\xf9\x14\x00a{B\x11(\xeb\xe1\x9d\x82\
-\xc9;\xa4N\x92\xd4\xa5\x9eR\xcf5\xcfDLD\xcc\
-\xc4\x06\xc6\xb01\xc4\x00\xbc\xd3\xe8\x8fRJ\xed?\x1a\
-\x00RJ)\xa5\x0eU^\x10\xb0\x04y\xf2\xb9\xdc`\
-\xc5}\xfe\x17\x83\xc3%\xbc\xfe\xdc`\xd9\xc2|[\xa1\
-\x04/\xc6\xc0\x95\xe0S1\xd6\xc10yB\xea\x10;\
-x hd\xe1\xd4\xa7\xf3\x90#rD\xb47\x0d\x92\
-\xa7\x84\x008\x81\x071\xac\x11\x1brh\x11%\xd5R\
-\xb2qx\xeb\xd6\x5c\xb1\xf3\xc8\xb9\x1d\xc5\xb0s~[\
-\xf3)\xc7\xca\xc0\x00\xac\x09\x22\x1b\xa51jI\x22Q\
-\x0a\xb3\xa7\xc5\xe9\x98\x0b\xef\xa9\xb4\x00\x02\xf6\x22\x02\xb2\
-?\x1c\x84\x16@\x07\xdc\x18]\xa7\xc9\x0b\x81\x05\xde\x93\
-\x88\x903\xf5\x81a$l\xe1\x03\x02\xc5\x12J\xed\xe8\
-\xc5nnS\x15\xc3\x83R\xdbbQ\xb1\x04\xa2\xb0\xd1\
-\x97x\x5c\xa3\x07e\xd1\xf6?\xd9\x10\xf9z\xf1\xe44\
-\xc8\x0a\x12\x81s\x04\x04\x00\x0c\x22\x0b/&\x15\x88\x87\
-\x08j^\xaa\x09\x90d\x85\x97\xfb-\xbd/;\x911\
-\xbe\xdb\x88\x0cq\x80f\xbb\xe3OV\xfcX]\x86\x94\
-RJ\xed#\x1a\x00RJ)\xa5\x0ea\xf5aD@\
-s\xde\xc4)~t\xcf\xd0]\x8f\xc7\xef\xf8\xa3\xe4u\
-\xe7\x06\xb3g\x1f\x81\x5c\xe2\xd3$\xa9\xd4\x92Zj)\
-1\xc4\x1c\x12\xb9\x14\xd4\x18\xf1\xe3\x010H\x98`\xc8\
-\x13b\x80h?5.\xa1\xdd\xcck\x07\x01\xc4\xe0<\
-\xc0`\x8f8\xf5\x89\xf3\x01\xd9\xc06E$\xa9\xc4\xe5\
-A\xefxn[\xcb\xecS;N<ZJ%0\x15\
-\xacm\x83\xb7.\xad\x82K\xe0\x14\xbb-\x01c\x1e\xa3\
-\x0cj/z\x12\x1f\xf4\xb5\xfe(\x87A\x04h\x8c\x1f\
-\x22y\x820\xc8yr\x00<\x8b\x00\xf0LbH\xc4\
-\x0a\x91w&-7EqKS\x8cj\x19\xb5\x84\x02\
-P\x088\xd4\xeb\x1fg\x9cF\xbbu\x10$ \xc0\xec\
-\xf4\xfd\xfd\xd8\xf5z\xf4\x80\xf91\xbe;bZ\xc5R\
-\x95R\xea0\xa1\x01 \xa5\x94Rj&  \x0a(\
-N\xcc\xd3[\xa3o\xfc\xb2\xb4\xa5\xa7\xf8\xd2\x17\x1dq\
-\xe2\xc2\xa4\xab\x05\xa9\xad\x95\x066Km[!\x92\xa6\
-<#\xf5\xa8\x09R\x03\xb6\x10\x86\x10\xb13\x94\x92\x89\
-\xbd\x89\x01\x10x\xf7!\x95\x89\x18sQ\x97\xcd\x13j\
-\x8c\x97\x061\x83<\xc4\xc0w\x22)\x82b/e\xe7\
-+\x92\xc6\x9c\xfa\x5c\xe8\xc3\x08\xb5d8\xae\x0eY\xd8\
-02\x85<\x5c@@`L\xde\x9a\x10NP-C\
-\xd2\xdd\x07;vjd;\xa9\x13\x1d\xc3X%IZ\
-\x03\xb6gS>\x9f\xb1\x0eh \x0c\xf2\xa0\x04\xd2h\
-9\xe3\x19\xde@\x18\xb00\x80\xc4H\xab\xa8\xc4H\x9c\
-\xc9\x92L\x1c\x81\xb3H\xc8\xd8\xf7\x85\x1b\x87\x97F\xb2\
-\x1c\x01\x0c\xe1\x1d\x9b@c{f\xcb\x1e\xcf~\x82\xd9\
-F\x07\xc2\x01\xb8Fgb`M)\xa5f\x08\x0d\x00\
-)\xa5\x94R\x87\xb0\x1d\xe6\xb7\x8bD\x01Yk\xd6\x0e\
-u|\xf6V\xfa\xf1\x1f\x9e\x7f\xcb\x99\xc9\x9b.\x9c\xb5\
-h\xc9\x1c1\xc1`\x8fKQr\xec\xb3\xa0\x0b3g\
-\xe3\x92F\xedK\x1a\xa3\x9f\xfd\xd4K\xa4\xc6DD^\
-D\xbc\x07\xc0\xc42\x12g\x12\x0f\x1fCb\x0a\xc8F\
-\x11\x98\xbc+'\xd5\x84\x9c\x84\xa1\xd8\x00\x92\xc4\xce\xc3\
-\x18\x0a\xc8\x8aw\xaeZ\xa9:X\x0f\xeb\x1c\xb0K\xbb\
-\x92\x91\x87f\x8ch\xc5\x94\xef\xdf\x18\x0by\x0d\x00\x8d\
-a\xea\x01\xa01\x8eh\x00\x03xP\xba\xbd\xb6\xc9g\
-\xb3\xba\x18l\xc1\x06\x92\xc2\xc7B@V\xf5\xe5\x80\x18\
-\x14\x02v\x9f\xc4dh\xe7\xbd\xc8\xa8oi\x8a\x8bR\
-J\xa9iF\x03@J)\xa5\xd4!l\xe7N\xad\x22\
-\x06\x88\x22\xc3,\xdd%|\xe17~m\xef\xd0\xeb.\
-\x98\xfb\xe2\x93\x8f\x9b\xb3tv\xff\xb6g{*\x9b\x0a\
-\x1c\xe7\x0bDppN\xbc'\x00\xec\x00\xcfY&\xcd\
-\xce5#\xf5\xddn?\xe2\xde\xad\xe4\x999\xdb\x1b\x8d\
-\xd4\xa0\x91\x83\xdd\x06&@\xc8\x10\xd8\x80<\x93\xc0\x1b\
-\xf2\x82\x04\x86H\xbcHJ\xcc\x86\x88E\x00\xef\xc9\x0b\
- b\x89`v\xbf\xce\x1es\xf9=\xd68wu\xc8\
-\x18\xc9\xf2\x1a\xd5\x7f\x86\x01a\x80\x89\x18\x02/V\x0c\
-\x0b\xa5\xc4\xf0\xe4<\x84\x22\x09\x00\x92\xec\x02\xd9^\xed\
-X\xbf\xaeG\xae\x8c\xed\xc5R\xb4\xcb\x17\xbb\xc1\xc4\xa9\
-G\x9a8\x06\xd8Z\x08\x90\xa6\x22!\x11\xcf\xd4r3\
-\xa5\x94R\x87\x1c\x0d\x00)\xa5\x94R3\x8a\x00\x0c\x89\
-\x02H`\x924\x7f\xe3#\xf2\xeb'\x9ey\xf7%\x83\
-\xaf=\xaf\xb5\x98k\x8b\x9a\xcai\xd2\x97Hl\xc5\xc3\
-y\x16A@\x02P\x02d\xb3\xb1\xf6[\x0b\xa0\x11;\
-\x87\x90D`j\xdb\x03OB\x00\x13\x8c\xc9\x86{9\
-\x11d\xe3\x81\x00\xef\x01O\x22\x86`H\x00j\x0c\x9a\
-\xde\xeda\xc6Z\xb0k\x00h&\xa8Gp\x1c\x8d$\
-\xded?t\xef\xeb\xb99\x1eB$ \x11\x16\x81\x17\
-\xe7\x08d\x10H\x96/\xe4w\xcc\xdf\xd9)\xd0#;\
-\xfe#\xc6\xbe\xa4\x08$\x02\xf1\x02\x22\x10A\x00'\xf5\
-\xc8\x8f^lJ)\xa5\xa6\x07\x0d\x00)\xa5\x94R3\
-S\xd6\x15\x08D}\xe5\xe4s7?\xf7\x83\xdfn\xbc\
-\xe6\xf2#\xaez\xc5I\xec\x87\x07{\xd6K\xb5\xbb5\
-/Q\xe4\xd2ZM\xaa\xde\x02d\x19b\x01\x069\x91\
-t?U\x81\xed\xe1\x5c\xa9\x9epQ\x1f\xb4>\xd29\
-\xc5@\x08\xc2\xf5Ie\xf5-<\xe0\xb2\xfc\x0dG\xd6\
-\xb3\xec>\x0a4\xe6\xaa['\x0e\xcd\x00\xd4h\xbe\xb3\
-\xfdG\xbd}\xbe9\x09\x11\x98\x85 \xc2\x1e\xec\x01A\
-\xe0H\x18\x10q\x84t\xfc\xdd\xef\xe6_F_8;\
-t\x11\x12\x80\x89\xc1\x06\xe2\xe0S\x80\xc1\x96`\xf6\xeb\
-\xe0-\xa5\x94RjR4\x00\xa4\x94RJ\xcdX\x22\
-\xc8Y\xe4\x8aA\xa9fV>\x9f\xfc\xf07%F\xed\
-\xdcS\xda\xe7\xcf\xce'\xd5\xa68y\xceK\x99\xc5\x1b\
-\x06e[\xa7!\xc4\x88\xa9\x08c\x87v&;.\xb1\
-\xc70\xb5\x95\xae0\x81\x05\xc8\xd2|\xea\x07!\xcf@\
-\x00\x09\x1aKzWO\xeb\xa0\x14\x88\xe1\xbd\x00)\xc8\
-\xb1.\xaf\x0fS\xb4\xfd\xffw\xbd*I\x08\x00yb\
-\x01;&\x0f\x82\x18\x0f\xc3\xe2=\x86\x18\xe98W\xeb\
-\xceIbY\xa9\x99\x80<H\x1a\x07\xf4#G\x17\x01\
-\x88\xd9XJ=\xbc@\x00\xb6D\x062n\xa4I)\
-\xa5\x94:@4\x00\xa4\x94RJ\xcdd^\x00\xa0)\
-2\xb9\x90\x1f\xdbPz\xf2\x1b+\xffx\xb5\xb9\xe6\xf5\
-\x8b\x8eZ<o\xb8\xaf\xd6\xd7\xeb\x9b\x03\xdf\x14\x01I\
-\xe2j^\x84\xac\x19\xb3tj\x7f \x82\x10<\x03\xd9\
-\xa8%\x81pc]\xedA\xe9\xf6\xaf\xeb[8\x90\x03\
-{\x02\x18,{\xe8\x01=\x0e\xed\xcf{\xe8\xe3=\xfd\
-\x10\x09@v]\x08A\x04\x9e\x04\x02\x86x\x01H\xdc\
-^T9\xfa=\x8d\xf4\x12\xf1 \x10s\xbd\x8b:\x0c\
-\xc8\x00\xbc}\x8c\x98RJ)u\xb0i\x00H)\xa5\
-\x94\x9a\xf9D\x84\x00c\xa5\x16\xf3w\xeeJ\xd6my\
-\xf6\x8a\xb3g\xbf\xe8\x84\xc5\x0b;\x17\xb1\xf4\x96\xcb\xdd\
-\xe2\xca\xec`)`\x13\xb0\xf5\x225\xf8\x035\xd6J\
-\x00\xb1\xd9\x92\x9c\xb2d\x9f\xac\x85\x0a\x09\x90\x80\x12\x12\
-\x0f\x92F\xc7\x16\x01y\xa0\xdeU\xd7\x0a\xac\x9b\xd2I\
-j\x00\xe8\xd0\xd7h\xd3,;\xb4.'\x07\x06@\xe2\
-\x1b5[D\x10\x88\x07(\x9b\x10Ol\xdc\xa8\x1e\xcf\
-\x93\xe9\x08E\xbe\xde\x08\xa8\xfeG\xc0\xdb[\x06\x09\x84\
-@\xf0\x0c\x11\xc0B\xd89\xef\xa1\xd1\x1f\xa5\x94R\xd3\
-\x85\x06\x80\x94RJ\xa9\xc3E\xc0\x14\xe4l51w\
-<\xe5\xeexb\xcb\x1bN\xdf\xfcg\xaf\x9d\xb3pa\
-\x1bl5\xf1>\x1f\x1a\x13F.\xad\xf9$\xa1]\xea\
-\xaaF\xaa\xc0d\x7f\x0c\xb7\xae\x17y\xd5\xbf\xaa\x0f\xf0\
-\xaa/\xd1\xa51\xb1\xa9\x11\x00j\x9c\x11\x00\xda\xb1\x0f\
-\x8b:,\xedR\xab%R\x0f\xea\xd4\xaf \xa9\x07\x0c\
-\xb3`\x0c\x8d\xdcj\xa76\xcf{\x9d\xa8#\xe2\x05F\
-\x04`0!M+5\xf1~\xeas\xf3\x94RJ\xa9\
-}K\x03@J)\xa5\xd4\xe1B\x04\x80\xe4\x03\x18\xb6\
-\xfde\xf9\xcd}\x9b\xa8{\xf39g.;\xf3\xd49\
-\xcb\xe6v\xc2\xf5\x0cW\xb6\x12\x06B\xc4$\x00\x13e\
-i\x0d\xc0\x8es\x91\xf6=\xda\xde\xfbyTjF#\
-\xe2\xb4\xe3\xd1Y` Y\xbfj!\xb8)6t\xd6\
-\xa8\xd1\x0cP\xff!\x12\xc0@#fY\x8f\x15zP\
-Zo\xd6S\xffC\x10\x03\x18\x80 \xe9\xa8\x0c\xa0\xd1\
-3\xda\xc7\x0d\xd5\xc8\xa8\xd9a;\x07\x1f\x09DBY\
-;h\x10\xa4V\x8dk\x11\x10\xee\x83{\xaa\x94RJ\
-\xed\x0b\x1a\x00RJ)\xa5\x0e/^\x10\xb0t\xb5\xf0\
-p2\xef\x8e'7o\xdd\xb8~\xebV\x7f\xfe\xd9-\
-'\x1dE\xc59\x01\x86\x5c2\xd8X6\x93d1 \
-\x22\x0f\xa2z\xd2\x84\xec\x9cA\xb1\x0flO\xebi\xf4\
-\xfa\xd9\xa1\x13\x91\x8c\xfa\x7f\x02\x18\x12\x02\x01 \xa0\x18\
-\xe3v\xf3U3X=>\xc9\xa3\xaa\xc0\x08\xe2@\xe9\
-.\xdb\x00\x9e\xe0\x09\xb4C\xc5\xd8\x8e[L\xf0\x90\xa3\
-\x82G\xdb\x11\xc84\x9e \x0c\x0f_K\x5cj\x84B\
-\xda\xa7\xcf\x15\x05L\xf2'\xa6\x94R\xaaA\x03@J\
-)\xa5\xd4aG\x00xo,\x0f\xb5\xcf\xb9\xcf\xa5\x0f\
-\xde]\xf9\xe6\xa3\xc3o\xb9\xa8\xe9\xf2\x0b\x96\xcdj;\
-\xae\x10>\xed\x07\x9f\xf3\xa9\xf7\xceX\x13\x04l\xc4\x89\
-\x88\xb05`x\xa9A<,\x98\x84\x00\x9f\x02N\x88\
-\x00fp#\x99b{R\x8e\x81\x1f\x19\xd6\x945u\
-\xae'\xfcd\xe58Yf\x86q\xa3\x97r4\xea,\
-w{\xf6\x1e\x944\x8e1\xd5\x0c ]:\xce\x0c\xdb\
-\xd3\xc4vj\x06\xeew\x98\x12\x86\xec:\x13\xb0\xdbs\
-W\xe6\x89\x85i\x18$0\x02\x16\x80\xeb\xbd\x85 \xd6\
-0\xf98\x81#D\x06Q\xe8P\xec\xaeJ9\x16\x12\
-\x10\xed\x97\xba\xc9\xc3\x9a>\x7f\x95RjJ4\x00\xa4\
-\x94RJ\x1d\xa6X\xbc\x84\xc6\x89\xad\xc6\xae\xbf\xdf\xfd\
-\xebO\xdc\x97\x7f\xd3\xfb\xba\xcb\x8e\xbb\xf6\xd2y]\xd1\
-s\x95^\xf2q\xe8\x10\xb1\x0f\xd9[\x12q\xb1x\x8e\
-\xc9\x88 \xf6\x92\x0a\xc4x0\xc0L\xf0D\x02\x90\x83\
-i\x04d\xb2\x00\x8f7p\xa6>8\x89\x1dX\xb2\xc2\
-\x1c\x01<#ex\x06<r\x22TO,jd\xfe\
-\xecy\xc1L\xf0 \xa7K@5\xea\x12\xf0;'\xe3\
-d\x7fg\x17\xd5\xc8\x95\xb5c\xacpw\xbdy&\x10\
-\xa7\x11\x10$p\x00D8%\x01|\x00\xb1\x04g\x93\
-\x18\x8e\xd1\x14\xc69[v-\x8fm\xf3\x9b\x07\x86\x03\
-#\x93h2\xad\x94RJ\xedOf\xce\x9c9q\x1c\
-\x1f\xec\xd3PJ)\xa5\xd4A@\x22\x06\x12Y\xca\x85\
-\x5c\x8dikoe\xf9\xd3=\xa6\xb6\xe5\x84\xd9Is\
-a^T\x9c\x97$&\xae\xc4`\xb2\x11;\xa9\xba\xb4\
-l-\xd8\x90w\xe2\x1cC\xc8\x1a\xc3\x81%!\xef\x9c\
-\x18\x80\x09\xd2\xf8\x93\xb5D\x01\x83\x01\x12\x90\x80<\xa8\
-\x91%D\xd9Wd\x84\x0d\x88&\x9e\x22\xb1\xf3jZ\
-W\xd7j'\xfb\xf1\x92\x10\x86\x90\x08H\xc0$L\xc2\
-\x80\x85'\xc0\x13{2H\x0d\xaa\xb0\xce\xb4\xff\xf8n\
-\xb9\xf5\xe1Z\x14Ym\x02\xad\x94Rj:\x08\xc3P\
-3\x80\x94RJ\xa9\xc3\x9a4\x06{\x15r(\xe4\xec\
-p\xb9\xf6\xa5\x9b\xd1\xbba\xf6;^u\xe4\x0b\x8e\xeb\
-\x0c[\xb7\x0d\xc4k\xbd\xdf\xc2>\xb1\x11L\x008a\
-\xe1\xd0\x06\xd61\xe0\xc0\x06,B\xb5\x9a\x03\x9c\xb5Y\
-w\x15\x22b \xeb\xcd\xcb\xa9\x90C}j\x97lo\
-\xe4\xe3(\x00\x0b\x88@\x0c\x99d%\x97.\xa9\xd5N\
-\x0e\xc4%\xe1\x8c\xf3\x0c\x08\x890|\xc8>2\x1e$\
-\x1e\xe4\x90\xa5\xc3\x89$>M<\x89\xe4z\x06\xcb\x83\
-U\x9a\x95'\xf1Z\x00\xa6\x94RjZ\xd0\x0c \xa5\
-\x94RJm\x17\x06\x1c\xfbp\xd5&s\xfbC\x03C\
-\xc3\x03\xc7.@{3[\x1e\xf6.\xf6\x898'L\
- C\x04K\x1e\xa9K\xd3$\x11\xe78\xf0\x14\x19\x18\
-\xeb\x85\x01\x16\x22\x96lL;\xc0>K\xfc\xd99\xc9\
-\x87\x98`X,\x81F\x02CJMg\xce\x0a\x18 \
-\x86\x18\xf8\x90\x10\xb1\x18\xaaO\xafs0\xe2\xb3\x98h\
-S\xc7\x86\xbe\xf0\xa7\xbf\xaf\xad\xd9\x82\xa6\x1ci\x03 \
-\xa5\x94R\xd3A\x18\x86\x1a\x00RJ)\xa5\xd4\x0eB\
-\x8b\x14\xd82\x98\xfc\xfe\x89\xe1\x0d\x9bKs\xda\xf2m\
-\x1d\xf3\xf2\xcd\xc5\xd4\x05>\xa5\xd4!I \xde\x10\x19\
-b\x88O\xe1\x84\x03\x98\x1cA\x9a\x9ck\x82\x04D$\
-\x10a\x11v\x9eE\x18\xc2\xf5f\xd0\xd4\x18\xe9Nb\
-\xc8\x05\xf0!\xc0`\xb7C\xd7^\xa5\xa6\x1b\x81\x10\xd2\
-@\x1c\x83\xc4@\x9a\xc8\x15\xd9\xe5\xd9[ \x85\xa9\x08\
-9o\x900|\xae\x98k;\xea\x9b\xb7\xa57\xdc9\
-h\xac1\xacW\xb5RJ\xa9iA\x03@J)\xa5\
-\x94\xda\x0dk\x90\xcf\xd9\xd8\xdb\xa76\xf9\xdf-O\xab\
-U\x7f\xd2\x91\x85bg10,5\x97\xd4\xbc\x10\x07\
-Qhs\x91\x09A\x92\x92\x87\xf7p\xbe R\x00H\
-H\x84\xbd\x90\x13\xf6b\xa4\xd1\x11\x08Y\xaeOcp\
-\x93\x85\x0b\x00\x0b2@\x0a\xd2i\xeejz#\xb8P\
-\x1c\x03\xde\x92/\x90+\x92\xcb\x910Q\x0c.{\xf6\
-\x9e\xe0\x08>W\xa8a\xce\x0f~S\xbd\xff\xa9j\xb1\
-)Kp\xd3\x0b[)\xa5\xd4\xc1\xa7\x01 \xa5\x94R\
-J\xed\x81 \x0a\x88\xd8\xf4\x95d\xe5\xb3\xc3\xa5\x81\xe1\
-\xa5mQk\xeb\x5c\xdb\xd2ilS\xcd!\x15\xef$\
-!$\x86\x1d\x18\x22D>`\x10SL\x14\xb3$\x04\
-O\xf0\xc8:\x01\xa1\x1e\xfa!\x01@\x04F\x96\x17D\
-\x04\xf2\xa0\x04\xa4\x19@jz#\xf8@@`g\xc9\
-\xe5\x8c\x18\x16\x0f\xa4dJ\xa0\x1aH\x1c\xc3\x9b \xc6\
-\xac\x8d\x9b\xe9\xb6\xfbJk\xb6J\x14\x99F\xeb+\xa5\
-\x94R\xea \xd3\x00\x90RJ)\xa5\xc6b\x18Q\x88\
-\xc14X\xbbvx\xe3\xb3\xb52\xe6D\xc5\xaeBk\
-k\x94\x0bjI\xa9Z\xea#\x97D\x11\xc8\x82\x04\xc6\
-\x91\x81\x18\xd4\x98b\xc3)\x8b'\x80\x01`$\xf4\x93\
-\x15\x7f1e\xd1\x1f\x00\xe4\x81\x14\xe45\xf8\xa3\xa69\
-\x22x+\xc2`\x17Y\x973\x9eHR\xa2\x04f\x18\
-H\x05p\x16\xdc\xd4:\x10\xcf\xbf\xe7\x81\xe1\xdb\x1f)\
-\xf7W\xa3(\x80\xecn\xda\xbcRJ)u\xe0i\x00\
-H)\xa5\x94R\xe3 P\x10pE\xc2'{\xf8\xf7\
-O\x0f\xfc\xee\xd1-\xa9\xab\x1d\xb7\xb4\xd0\xdc\xdad@\
-\x8c\x98\xe0\x90\x10j\x06\xc2\xc4\x00<\xc8A\x90\xd5\xbe\
-\xd4[\xa0d\xf3\xe0A$L\xb0\x84\xac*\xac1\x15\
-\x9e5\x00\xa4\xa6=\x82\x18\x80\x89]@\xa9\xa5\xac\xe3\
-39A\x95\xd8{&\x84\xb9\xb00o\xeb\xd6\xe8+\
-\xbf\x18\xfa\xc3Zjj\xb2Lz]+\xa5\x94\x9a.\
-t\x0c\xbcRJ)\xa5\xc6!\x00\x8b\x04\x91M\x02\xbb\
-\xb5\x1aoZ[{fsy]\xaf\xbc\xf7\x8a\x05\x8b\
-:;0\xf8|\xa9\xfb\xd9 \xae\x86\xa1\xa1\xd0\xc1\xc7\
-\xf0 / \x90\x05,\x84\x89\x1d\x93Xp\x08a\xf8\
-l\xec\xbc\x03\xd7@\xae>\x1d^\x97\xc9j\x9a#\x00\
-B)\x19\x10\xa7N\xe2A\x071\x01\xc4\x89\xf3\xa9\x0d\
-\x91\x1ak\xec\xc2Z\xed\xa8\x15\x8fo]\xf5\xbc\xf7\xc6\
-\x1a\x16\x1dm\xa7\x94RjZ\xd1\x0c \xa5\x94RJ\
-\x8d\x8f \x96$\x0aL\x18\x06\xa5\x1a/_[\x1b\xe8\
-\xdd\xb6\xb0\xb5\xd2Q\xcc\xe7\x03c\x1d@\x89p-\xcb\
-\xfe\x01\x01\x11\xc0\x10\x07$\x04f\xe2\x10b!\x160\
- &\x12p\x02\xf6\x80\x08\x09e\x0d\xa2\x95\x9a\xd6\xc8\
-{\xef\x12!G,Dp\xa0\x14\xd6\x93A5\x857\
-\xb9\xa8i\xc1\xe6M\xf2\xe5\x9fw?\xf8\x9c+6Y\
-\xbd\xa0\x95RJM+Z\x02\xa6\x94RJ\xa9\xc9!\
-B\x14P\xe2d\xd5\x86\xf8\x97\x0f\x0c\xd6\xcar\xfaq\
-K\xb9}i\x92\x98Z\xb5\xc4$\x1c\xe6\x10X\x81\x80\
-\x04\xb0\xa0\x00\x1e\xe4\x09\xce\xc2g}\x7fH\xc8\x09\xa7\
-\xdexo \x00\x09i\x12\x90\x9a\xde\x04 \xef-R\
-f\x22\x0e@F\x88\x84\x02\x800\x9c6\x99\xa6\xa3\x13\
-\x1cq\xeb]\xcf\xff\xe8\xde\xbe~i\xca\x07\x9a\xfd\xa3\
-\x94Rjz\xd1\x00\x90RJ)\xa5\xa6\x22\x0a\xc8I\
-\xb0\xb6\x87{6\xd70\xe4\xc3\xb0\xa9\xbd\xb5\xd0\x94\x13\
-6\x09\x02\x0b&J<\x9c#\x80`\xc8\x01\xa9\x81\x0f\
-\xeam\x81\x88\x89\x9d\xe7\xd8\xb3\xcf\x22BF\x03@j\
-\xfa\x13\x22\x89\x8c\xcd1\x03\x92\x22\xf00p\x09b\x07\
-[\x98\x1b4\x1d\xb3|U\xed\xf3?\xdf\xfax7\xb5\
-\x16\xach\xf8G)\xa5\xd44\xa3\x01 \xa5\x94RJ\
-M\x85\x08\x8cAK\x13\x0f\xc6t\xe7\xaa\xf2\xdaM\x9b\
-\xda\xf3\xd5\x96\xf6\xd6B\xb1\x19a\x8bC\xbe\x96J\x9c\
-\xa4\x02\xb1\x10\x81\x88\x07\x91\x80\x04L \x01{!'\
-\xec\x85@\x02\xe35\x00\xa4\xa6?\x22\x0a\xc8\x86B^\
-\x5c,\x10a\xd4bN\xb89\xdfv\xec\xc6^\xfb\x99\
-\x1b\xd7\xdc\xfaX-\xcc\x85\xd6\x1c\xec3UJ)\xa5\
-v\xa1\x01 \xa5\x94RJM\x1d\x01\xc2\x5c\x05o\x1e\
-\xc2o\x9e\xac=\xdfc\xe6wt\xe4[\xe7\x06\xcds\
-*\xb1T\xd38\xcc\xd9 \x82\xa4\x89\x8fS\xb6\x1e\xdc\
-\x18\x08\xcfN\xc8\x0b{O\x22\x02\xe3\x895\x00\xa4\xa6\
-96\xa0\xc8\xc5\x22R\x11\xeb\x12\x8f\xd8\xc3\xe4\xdb\xa2\
-\xb6cK\xc9\xdc\xff\xbcy\xe3w\xef\xeca\x1b\xe4#\
-\xd6\xf4\x1f\xa5\x94R\xd3\x90\x06\x80\x94RJ)\xb5W\
-\x98\x10Y\xf2d{\xca\xbcvS\xed\x0f+\xfb\x87\xab\
-\xa5\xa3\x8f\x08\xdaZ\x9bry\x22J\xc4U}\x9a\x10\
-\x88\x19\xf5y_, \x08{a/\x10\x10\x8c\x10\x8b\
-\x06\x80\xd4\xf4\xc6\x06\x14\xc5\x95\x9a\xa0\x16\x16\xc9\x09\xe2\
-\xc4\x14g-\xe4h\xce\xbd\x0f<\xf7_\xbf\xdc\xbca\
-(ji\xd2\xe4\x1f\xa5\x94R\xd3\x94\x06\x80\x94RJ\
-)\xb5\x0f0\xa1\x18Q\x22\xb4\xb6\xd7m\xda\xd4\xe3\xe3\
-\x81bG[\xb1%\xac\xd5\xb6\x95J\xfd6GQ\x9e\
-\xe1=\xc8\x81<\xc4C\x84@B\xec\x89!l\x04\xac\
-I\x13j\xda\xf3\xe0\x94\x84C\xb0\x05\x989\xea\xf04\
-{\xc5\x13\xf1\xbf\xdd\xb0\xf9\x91\x0dh)F\xa4\xad\x9f\
-\x95RJMW\x1a\x00RJ)\xa5\xd4> \x80\x17\
-X\xc3M9;\x1c\x9bG\xd6\xf9\xdf-/\x0f\x0f\xf5\
-\x1d\xb7`hv\x17E\x91\xa0\xe6\xe1\x00\x06D \x1e\
- \x81\x11\x22\xcf\x04b#\xa2\x01 5=\x08v[\
-\x8dH\xe4\x9d\x8f\x13g\x9a\x9b(@\xb9\x14\xdb(\x8c\
-\x9a;\xd6\xae\xa9\xfe\xdb\x8f\xfb~\xb1\xd2F\xf9(0\
-z\x11+\xa5\x94\x9a\xbe4\x00\xa4\x94RJ\xa9}\x80\
-\x1a\x8bf\x86\xc0\xd8Jb7\xf7\xa4+\x9f\xad\x0d\xc7\
-\xbcpAgs\xcbb\xc7\xb3\xaa\x12\xd4\x84\x9d\x07\xb1\
-\xe1\x9c%\x02*\x09%\x8e\x19L \x0f@\x90%P\
-\x10\x81\x08l\xea;\x96\xec\x08\xdc8N\xf6\xc7\x00\x0c\
-x\xc0\x1f\xc4;\xae\x0e\xb6\xd1\xc1\x1a\xd9\xe3wv\x94\
-0R\x82g\x08\x81\x00\x22\x06,\xc4\xc03(\x00Y\
-8\xc0\x03L0\x00\x89\x08\x84 \x10P\x00\xdb\x92$\
-\x05\x8fY\x9c;\xf2W\x0f\x87\xff~\xd3\xc0\x9dO\x83\
-\x82 \x1fA[\xff(\xa5\x94\x9a\xce4\x00\xa4\x94R\
-J\xa9}\x88E\x88\x80\xc0\x22\x0a\xb9\x9c\x86+\x9f\x0f\
-o}\x90\xb7UrG\x1f5\xcb\x16\x8a\x09C\xe0\x0d\
-;\x22\xc7q\xc2\xb17^\x0c{\xcaB?\xd9\xfa\x99\
-\xb2\xa0\x0fA\x18`\x08A\xb2XO\xf6\xf7\xc8\x9f\x00\
-0\xa0T\x03@\x871\x1a3\x00$\x8d\x90\xe2\x8e\x7f\
-H\xd2H\x92P<\xd7\x03\x8e,\x86`\xe0\x03\xa4\x06\
-b\x01\x83\xd8\xc39\x90\x87\xf50B$\x02!\x03C\
-\xd6Hk\x98[h\xa3\xc5\xcb\x9f\x09\xff\xf5\xc7}\xbf\
-z\x22\x09\xa20\x1fj\xf4G)\xa5\xd4t\x17\x86\xa1\
-=\xd8\xe7\xa0\x94RJ\xa9\x19C\x88\x90-\xaa\x89P\
-\xccS-\xa1\xe5k\xc5\xd5\xd6\xb6{~\xf1I\x8b\x97\
-\xce\xeb*\x16[\x93\xf2\xd6j\xb97\x02\xa2\xa2\x07y\
-8__\xba\x1b\x02\x11\x008\xef\x01\x88g!p\x96\
-\x0a\xb4+\x07d\xcb\x7f\x1a+\xd9C\xcd`\xb2\xe3\x8f\
-\x9e&r\x19\x08\x88\x022,\x04\xe7\xe1\x84<D\x84\
-\xbc\xab\x87\x8fD\xe0\xb3>\xe5\x04fI\xe1L\xd6\xb3\
-\x9c\x84XL\x87\x09g\xa7\x92{\xfc\xa9\x8d\xdf\xff\xc9\
-\xea'\xd7F\x85BK\x148\x8d\xfe(\xa5\x94:$\
-\xd0\x89'\x9e8<<|\xb0OC)\xa5\x94R3\
-\x10\x11\x04$I\x95}\xed\xa4\xa5\xcdW_\xb8\xe8\xb4\
-\x13\xdb\x9b\xa3A\x17w\x07\xe8\x0d\xdc6H\xc2\x06\xa9\
-\x87\x10\x0c\x83\x88\x00qYN\x8f\xaf\xc7vh\x8c\xf8\
-\x0e\xe9\xca\xfb0\xb6s\x00hB\xb9`$\x08\x5c3\
-\xb9\x10\xde\xc1\xa7\xa0\x14, \x0f\xa4\xf0\x80\x08\x0c!\
-\x0cA\xc6\xa7i5Mc!\x1b\xda02a\xa1\xb5\
-b\x16\xaf\xedn~\xe0\xc1u\xb7\xfdz\xcd\xc3O\xa4\
-\xc3-\xb3\xd0<\x8b\xd2d\x7f\xddA\xa5\x94Rj\xdf\
-)\x16\x8b\x9a\x01\xa4\x94RJ\xa9\xfdE\x04\x04\xf1&\
-7\x98\xe4\xee_\xe3\xd7w?\xffG+\xb7\xbc\xfb\x95\
-\x85E\x0b\xda\xc9\xbbx\xb0\x1f.\xb5\x0c\x87F\xe6\x05\
-\x84\x08\x92E\x8e\x18D\x80\xc0\x8f1Y\xc9k\xee\xcf\
-\xe1l\xc7\x9f\xbe\x8c\x7f1\x08\xc0B\x92\x80< \x04\
-b\xb0\x05;!\x814\xaeW\x16\x88\xf7)%\x8eR\
-\x8al\xd4\x14\xe6saD^\xf8\xe9\xf5\xdd_\xbc\xa5\
-\xfb\xce\x87\xabC\xa5\x0eif\x1bEp\xe9\xfe\xbas\
-J)\xa5\xd4\xbe\xa6\x19@J)\xa5\x94\xda\xef\x08H\
-=\x86+i\x88\xe4\xbc\xe3p\xe5Em\xa7\x9c\xd8U\
-l*Wk\x83\x81\x1bjq\xbd6\x8d\xbd\x83\x170\
-\x81\xb3&?\xa8Od\xda\xf3\xba\x9e\xe0\x9a f\xe7\
-\xe6/\xea0A\xbb\x0d\x00\xed\x94\x07\x94\xb5\x15\x1f\xf9\
-O&\x08I\x15N\x00x\x88'\x02\x89\x90w\x22\x22\
-H\x05) l\xc9\xb4\x9b\xa0\xb3\xa9y6\x07\xb3\xfa\
-\x07\xe2\xad\x9b\xba\xbfw\xd7\x96_\xac\xa8n\xec\xe1J\
-\x1a\xe5\x22\x13X\x82\xf7z\xed)\xa5\x94:Th\x06\
-\x90RJ)\xa5\x0e\x04\x01\x0c\xa3\xbd9(U\xed\xcf\
-\x1fO\x9f\xef\x19x\xd3\xa6\xd2K_\xda\xde1\xbb+\
-plK\xbd\xecA\xae\xde\x09\x9aL\xbd\xc3\x8f\x08@\
-\xe0=\x06\x80\x04\x9e\xe05\x00t\xb8\x224\x22\x85\x00\
-F\xae\x02n\xc4\x80h\xf4\xbf6\xb6!\xb0\xa7\xc8#\
-pH\x01\x07\xf1 \x0bX\x98F\xe7q\x22\xf6\xa6h\
-\x82N\xe1\xd9\x83i\xeb\xd6\x8d\xc9\xca\xc77\xff\xe0\xee\
-\xbe\xdf\xacB\xc9\xe5\xdb\x0b\xdcZ\x80x/\xda|\x5c\
-)\xa5\xd4\xa1F3\x80\x94RJ)u\xe00\xa1\xe6\
-(\x8d]W\xbe\xd45\x8b_z\xfa\x9cw^\xd4\xb5\
-$\xd7\x8fx\xb0>\xedK\x00\xf2Y\xee\x0f\x04\x80\xec\
-8`i\xc7\xaf\xb3\xa0\x91:L\xf1\xee\xa3<\x8d~\
-\xce\xdb\xff\x1e\x89!\xfa\xac\x09\x10\x81\x1dD \xdeg\
-\xb1I+\x1e\xde\x0b!\x08\xc8\x14J\x95\xc2\xd6\x01\xb3\
-\xb9\xdb\xfd\xe4\x9e\xd2\xc3O\x97\xcb\xe5d]\x1f\x8b\x0d\
-\x9a\x22\x16\x11m\xf9\xac\x94R\xeaP\xa4\x19@J)\
-\xa5\x94:\xa0\xbc 4b#\xdeZm~nM\xfa\
-\xe4\xa6\xc1\xc1m\xb9\xbf\xbc\xb0yns\xe0\xb9\x89\xad\
-\x05\xc4'\x89\x13o\x98\xb2\xfft.\x1e\xb5\x03\xa9\x17\
-\x86\x81\x80\x94\xb8\x17\x1c\xefv\x0a\x98.\xd2\xa7\xd6\x1e\
-i\xba=nc4\x00\xdf!\xfdg\x97\x1b\xc9\xe8<\
- \xa2,-\x88\x05\x22\x9c$\xa17!\x19\xd8\x08 \
-v\xdeU\xd3\xea`%-\x97\xb9\x92\xe4\xca\xd5\xdc\xc6\
-M\xfe\x7f\x1e(=\xb3\xb1\xba\xa9\xd7\x0dT$\x08\xc3\
-\x5c\xc4\xd6\xc0\xfb\xe9\xf6\xf0(\xa5\x94R\x93\xa0\x01 \
-\xa5\x94RJ\x1dP\x22 B>\xa2(\xb4\x95\xaa\xbf\
-\xe1\xae-\xcf\xad\xf3G\xb49\xcf9c,A\xbcw\
-\xde{&Xc\xc1\xde\xfb\xd1\xc56BY\xab^\x10\
-\xc1\xb3\xad\x00n\xb7Q\x02\x9a\xe0X\xf0\x19Jd\x8a\
-\xa1\x1c\x1ak\xe8\xdaA0\xe5\x90\xcbn\xefH\x96U\
-&\x14\xc0\x04d\xc8\x04\xc4L\xde\xa5\x95Z2X\x92\
-\xe1*\x0fWj\xc3\x95\xe1\xa12o\x19B-ES\
-\xce\xb46\xd7\xaf#M\xfcQJ)u\xa8\xd3\x00\x90\
-RJ)\xa5\x0e\x0aaBs\x93\x89S\xf7\xdb\xb5\xc2\
-\xcc\x84\x1a\x10\x03\xa0z\x8e\x0f\x80\x04\x84\x9d\xe2;\xd4\
-\xc8R!\x80\x90\xaf\x97\x89\xed\xcea\x1e\x00\x9a\xa2i\
-\x16\x00\xda?wd\xe4{\x02\x12\x12\x16\x89\xbcP\x16\
-l\xf2\x02b\x14r\x5ch\x82\x88\xc6}\x94RJ\xcd\
-\x1c\x1a\x00RJ)\xa5\xd4A\xe3E\x02\xcb-\x85\x9c\
-\xdf9\x8e3\xba\xb7\xcb\x0e\x0by\x19\xfd=]\x9c\xab\
-)\x92\xec/\xc9\xa2A\x04\x220\x81H\x08 \x88\x17\
-xm\xf3\xac\x94Rjf\xd1\x00\x90RJ)\xa5\x0e\
-&\x11\x10\xbc\xd99[cO\x8d\x9fw4\xad\x92U\
-\xd4\xa1JF\x7f)\x1aWTJ)5C\xed\xa9y\
-\x9eRJ)\xa5\x94RJ)\xa5\x94\x9a!4\x00\xa4\
-\x94RJ)\xa5\x94RJ)5\xc3i\x00H)\xa5\
-\x94RJ)\xa5\x94Rj\x86\xd3\x00\x90RJ)\xa5\
-\x94RJ)\xa5\xd4\x0c\xa7\x01 \xa5\x94RJ)\xa5\
-\x94RJ\xa9\x19N\x03@J)\xa5\x94RJ)\xa5\
-\x94R3\x9c\x06\x80\x94RJ)\xa5\x94RJ)\xa5\
-f8\x0d\x00)\xa5\x94RJ)\xa5\x94RJ\xcdp\
-\x1a\x00RJ)\xa5\x94RJ)\xa5\x94\x9a\xe14\x00\
-\xa4\x94RJ)\xa5\x94RJ)5\xc3i\x00H)\
-\xa5\x94RJ)\xa5\x94Rj\x86\xd3\x00\x90RJ)\
-\xa5\x94RJ)\xa5\xd4\x0c\xa7\x01 \xa5\x94RJ)\
-\xa5\x94RJ\xa9\x19N\x03@J)\xa5\x94RJ)\
-\xa5\x94R3\x9c\x06\x80\x94RJ)\xa5\x94RJ)\
-\xa5f8\x0d\x00)\xa5\x94RJ)\xa5\x94RJ\xcd\
-p\x1a\x00RJ)\xa5\x94RJ)\xa5\x94\x9a\xe14\
-\x00\xa4\x94RJ)\xa5\x94RJ)5\xc3i\x00H\
-)\xa5\x94RJ)\xa5\x94Rj\x86\xd3\x00\x90RJ\
-)\xa5\x94RJ)\xa5\xd4\x0c\xa7\x01 \xa5\x94RJ\
-)\xa5\x94RJ\xa9\x19N\x03@J)\xa5\x94RJ\
-)\xa5\x94R3\x9c\x06\x80\x94RJ)\xa5\x94RJ\
-)\xa5f8\x0d\x00)\xa5\x94RJ)\xa5\x94RJ\
-\xcdp\x1a\x00RJ)\xa5\x94RJ)\xa5\x94\x9a\xe1\
-4\x00\xa4\x94RJ)\xa5\x94RJ)5\xc3i\x00\
-H)\xa5\x94RJ)\xa5\x94Rj\x86\xd3\x00\x90R\
-J)\xa5\x94RJ)\xa5\xd4\x0c\xa7\x01 \xa5\x94R\
-J)\xa5\x94RJ\xa9\x19N\x03@J)\xa5\x94R\
-J)\xa5\x94R3\x9c\x06\x80\x94RJ)\xa5\x94R\
-J)\xa5f8\x0d\x00)\xa5\x94RJ)\xa5\x94R\
-J\xcdp\x1a\x00RJ)\xa5\x94RJ)\xa5\x94\x9a\
-\xe14\x00\xa4\x94RJ)\xa5\x94RJ)5\xc3i\
-\x00H)\xa5\x94RJ)\xa5\x94Rj\x86\xd3\x00\x90\
-RJ)\xa5\x94RJ)\xa5\xd4\x0c\xa7\x01 \xa5\x94\
-RJ)\xa5\x94RJ\xa9\x19N\x03@J)\xa5\x94\
-RJ)\xa5\x94R3\x9c\x06\x80\x94RJ)\xa5\x94\
-RJ)\xa5f8\x0d\x00)\xa5\x94RJ)\xa5\x94\
-RJ\xcdp\x1a\x00RJ)\xa5\x94RJ)\xa5\x94\
-\x9a\xe14\x00\xa4\x94RJ)\xa5\x94RJ)5\xc3\
-i\x00H)\xa5\x94RJ)\xa5\x94Rj\x86\xd3\x00\
-\x90RJ)\xa5\x94RJ)\xa5\xd4\x0c\xa7\x01 \xa5\
-\x94RJ)\xa5\x94RJ\xa9\x19N\x03@J)\xa5\
-\x94RJ)\xa5\x94R3\x9c\x06\x80\x94RJ)\xa5\
-\x94RJ)\xa5f8\x0d\x00)\xa5\x94RJ)\xa5\
-\x94RJ\xcdp\x1a\x00RJ)\xa5\x94RJ)\xa5\
-\x94\x9a\xe14\x00\xa4\x94RJ)\xa5\x94RJ)5\
-\xc3i\x00H)\xa5\x94RJ)\xa5\x94Rj\x86\xd3\
-\x00\x90RJ)\xa5\x94RJ)\xa5\xd4\x0c\xa7\x01 \
-\xa5\x94RJ)\xa5\x94RJ\xa9\x19N\x03@J)\
-\xa5\x94RJ)\xa5\x94R3\x9c\x06\x80\x94RJ)\
-\xa5\x94RJ)\xa5f8\x0d\x00)\xa5\x94RJ)\
-\xa5\x94RJ\xcdp\x1a\x00RJ)\xa5\x94RJ)\
-\xa5\x94\x9a\xe14\x00\xa4\x94RJ)\xa5\x94RJ)\
-5\xc3\xd9\x83}\x02J)uX \x22\xef}\xa5R\
-\xf1\xde\x8bH\xadV\xdbu\x1bf\x0e\xc3\x10@\x10\x04\
-Q\x14\x1d\xf0s\xdc\xc7\x88\xc89W\xa9T\x008\xe7\
-\xe28\xdeu\x1bcL\x18\x86\x22\x12\x86av\xdf\x95\
-:\xb8*\x95\x8as\x0e@\xadV\x13\x91\x9d\xbe\x1b\x04\
-\x81\xb5\x96\x99\x9b\x9a\x9av\xfd\xee\x81AD\xe5r\xd9\
-9\xe7\xbd\xdf\xf5iEDa\x1823\x11555\
-\x1d\x943TJ)\xa5\xd4\xf4\xa4\x01 \xa5\x94\xda\x8f\
-\xb2 \xc8\xd0\xd0\xd0\xc0\xc0\x801f\xe9\xd2\xa5\xb9\x5c\
-\xceZ;\x7f\xfe|\x22\xdai\xe3Z\xad\xb6y\xf3f\
-f\xee\xed\xed]\xb7n\x9d\xb5\xb6\xb5\xb5\xb5\xb9\xb9\x19\
-\xc0\xc1ZjN\x01\x11\xc5q\x9c\xdd\xe5B\xa1\xb0t\
-\xe9\xd2l\xb5<{\xf6\xec]7\x1e\x1e\x1e\xee\xee\xee\
-\x0e\x82`\xe3\xc6\x8d\x1b7n\xcc\xe5r\xad\xad\xad\x07\
-qi\xad\x0eCYp\xb6T*\x0d\x0e\x0e\xa6i\xba\
-l\xd9\xb2\xa6\xa6&c\xcc\xbcy\xf3\x8c1;m\xdc\
-\xd3\xd3344T\xa9TV\xadZ\x95\xcf\xe7\x8b\xc5\
-b\xb1X<`\xa7Z\xa9T\x86\x86\x86J\xa5\xd2\xd1\
-G\x1f\xdd\xd4\xd4\x94\xcb\xe5\xe6\xcc\x99\xb3\xd36\xde\xfb\
--[\xb6\xd4j\xb58\x8e\x9fy\xe6\x19cL\xa1P\
-hnn6\xc6\xe8\xd3J)\xa5\x94:\xcci\x00H\
-)5\x8d\x10Q\xb5Z\xdd\xbcy\xf3D6nii\
-\xe9\xea\xeaJ\xd3tj\xc7b\xe6\xbe\xbe\xbe\xfe\xfe\xfe\
-q\xb7\xcc\xe7\xf3s\xe7\xce\xf5\xdeOj\xffD\x94\xa6\
-iww\xb71\xe6\x94SN9\xfe\xf8\xe3\x8f8\xe2\
-\x88\x0b/\xbc\xb0\xb5\xb55\x97\xcb\x1d}\xf4\xd1\xbb\xbd\
-\xd5\x8a\x15+\xac\xb5\xcf<\xf3\xcc=\xf7\xdc\xd3\xdd\xdd\
-\xfd\xf0\xc3\x0f?\xfa\xe8\xa3\xc5bq\xd6\xacY\x93:\
-\xfaA\x91\x85~6o\xde\xdc\xd6\xd6v\xe6\x99g.\
-[\xb6\xec\xc8#\x8f|\xf9\xcb_n\xad\x9d5k\xd6\
-\x82\x05\x0bv\xbdI\xadV{\xec\xb1\xc7\xf2\xf9\xfcC\
-\x0f=\xb4|\xf9\xf2M\x9b6\xdd{\xef\xbdk\xd6\xac\
-\xe9\xe8\xe8hmm\xdd\x9b\xf5*\x11\x89\xc8\xb6m\xdb\
-J\xa5\xd2^\xdc\xa7=\x0a\xc30\x8a\x22fnmm\
-e\xe6)\x9f*3www\xef\xdb\x934\xc6\xe4\xf3\
-y\x11\xc9\xe7\xf3---Y>\x8b\xda-f\xde\xb6\
-m[\xa5Ry\xc1\x0b^p\xe9\xa5\x97\x1eq\xc4\x11\
-\x17\x5cpAggg\x14E\xc7\x1e{\xec\xae\xdbw\
-wwo\xda\xb4\xa9\xaf\xaf\xef\x96[n\xd9\xbau\xeb\
-c\x8f=\xb6b\xc5\x8a\xd6\xd6\xd6\xd6\xd6V\xec\xb7@\
--3\x0f\x0f\x0f\xf7\xf6\xf6.]\xba\xf4\xfc\xf3\xcf\x9f\
-?\x7f\xfe\xab_\xfd\xea\x8e\x8e\x8e\xb6\xb6\xb6E\x8b\x16\
-\xed\xba\xfd\x9a5k\x86\x86\x86\x86\x87\x87\x7f\xf1\x8b_\
-l\xd8\xb0a\xd5\xaaU\x0f?\xfc0\x80Y\xb3fY\
-k\x0f@\x18\xc8\x18\xd3\xdb\xdb;\x91WWk\xed\xdc\
-\xb9s\x83 \x98\xec\x0b\xecn\x0fZ\xadV7n\xdc\
-8\xee\x96]]]\xcd\xcd\xcdS{^0s\xb5Z\
-\xdd\xb2e\xcb\x18'\x9c\xcb\xe5\xe6\xce\x9d\x8b=\x5c\x0f\
-\x87\xcay\x02\xe8\xed\xed\x1d\x1a\x1a\x9a\xc2\xd1\xf7\x12\x11\
-uuu\x15\x0a\x85\xdd\x9e|\xf6\xb1\xca\x86\x0d\x1b\xf6\
-\xfe\x9a\xd9\xad\x5c.\x97\xe5\xa5677g_\xec\x8f\
-\xa3(\xa5\xd4\xc1B'\x9ex\xe2\xf0\xf0\xf0\xc1>\x0d\
-\xa5\x94\x02\x808\x8e\x8f;\xee\xb8\xf7\xbf\xff\xfdI\x92\
-\x8c\xbb\xf1m\xb7\xdd\xf6\xdd\xef~w\xde\xbcySx\
-\x17HD\xa5R\xe9\xa2\x8b.\xba\xf4\xd2K\xc7\xde\x92\
-\x99\x9fy\xe6\x99\xcf|\xe63\x93*\xa6H\x92\xa4R\
-\xa9\x14\x0a\x85\xcb/\xbf\xfc\xa2\x8b.:\xe5\x94S\x16\
-.\x5c8\xd9\x93\x04\xf0\xe4\x93O\xfe\xeew\xbf\xbb\xeb\
-\xae\xbb~\xf6\xb3\x9fe\xab\xfa]S\x12\xa6\x03\x11\x89\
-\xe3\xb8T*\xcd\x9b7\xef\x8do|\xe39\xe7\x9cs\
-\xea\xa9\xa7N-hu\xdf}\xf7\xdd{\xef\xbd\xbf\xfe\
-\xf5\xafo\xbf\xfd\xf6\x96\x96\x96\xac\x98e\x0a\xfb\xf1\xde\
-\x13\xd1\x1b\xdf\xf8\xc6SN9e\x0a7\x1f\xd7\xb3\xcf\
->\xbb~\xfd\xfa\xa1\xa1\xa1[o\xbd\xb5V\xabEQ\
-d\xad\xcd\x8a\x83&\xb5\x9fJ\xa5r\xf5\xd5W\x9ft\
-\xd2I\xfb\xf0\xdc\x06\x06\x06V\xacX\x11\x86\xe1\xe3\x8f\
-?~\xfb\xed\xb7\xb7\xb5\xb5\xd9\x86\xbd\x89U\xed*[\
-\x89\xa5i\xea\xbdO\x92$\x0bz\xee\xbaMv\xd1\x06\
-A\xc0\xcc\xc6\x98\xa9\xfd@\xf7\xb9\xac~j``\xe0\
-\xd2K/\xbd\xe2\x8a+N=\xf5\xd4\xe3\x8f?~\xb2\
-;y\xf2\xc9'\x1f~\xf8\xe1o~\xf3\x9b\xf7\xde{\
-o\x14E\xb9\x5cn\xdf\xde;\x11I\x92\xa4\xb7\xb7\xf7\
-\x94SNy\xf3\x9b\xdf\xfc\x92\x97\xbc\xe4\xc5/~\xf1\
-\xae\xc9\x83c[\xbf~\xfd#\x8f<r\xd3M7\xdd\
-~\xfb\xedCCC\x85B\xc1\xda\xfd\xfb\xf9_\x7f\x7f\
-\xff%\x97\x5cr\xd9e\x97\x8d\xbbeOO\xcf\xe7?\
-\xff\xf9\xde\xde\xde|>\xbf\x97\x07-\x95J\xcb\x96-\
-\xfb\xe0\x07?8\xee\x96_\xfd\xeaW\x1f~\xf8\xe1\xa9\
-\x85\x98k\xb5\xda\x92%K\xde\xfd\xeew\x8fq\xc2\xab\
-V\xad\xfa\xcaW\xbe\x22\x22\xbb}\x9c\x0f\x89\xf3\xcc~\
-\xab\xbe\xf6\xb5\xaf=\xf3\xcc3'{\xe8\xbd\xe7\x9c\xfb\
-\xe67\xbf\xf9\xc8#\x8f\xec\xf6\xd7n\x9a\xa6\xc5b\xf1\
-\xaf\xff\xfa\xaf\xf7S\xa1\xf4\xd3O?\xbd~\xfdzc\
-\xcc]w\xdd\xb5n\xdd\xbaB\xa1\x10\x04A\x10\x04\x93\
-}\xde)\xa5\xd44T,\x165\x00\xa4\x94\x9aF\xe2\
-8\x9e={\xf6\xcd7\xdf<\x91p\xc9\x96-[.\
-\xbc\xf0\xc2\x8d\x1b7\xb6\xb7\xb7O\xf6\xfd\xb1sND\
-~\xf9\xcb_Nd\xc9\xf7\xe9O\x7f\xfa\x9f\xfe\xe9\x9f\
-\xb2R\xac\xb1\x8dT?utt\xbc\xf6\xb5\xaf}\xdf\
-\xfb\xdew\xcc1\xc7L\xea\xc4v+I\x92\xe5\xcb\x97\
-\x7f\xfe\xf3\x9f\xbf\xf9\xe6\x9b\x89\xa8X,N\x9fw\xa2\
-DT\xa9T*\x95\xca\xc2\x85\x0b\xdf\xf2\x96\xb7\xfc\xf1\
-\x1f\xff\xf1\xd2\xa5K\xf7~\xb7\x83\x83\x83\xf7\xdf\x7f\xff\
-\xa7>\xf5\xa9\xbb\xef\xbe;\x8a\xa2b\xb18\xd9\x1fq\
-\x92$\xd6\xdao|\xe3\x1b\xe7\x9e{\xee\xde\x9f\xcfn\
-ea\xaf\xd5\xabW\xaf\x5c\xb9\xf2\xd6[o\xbd\xfb\xee\
-\xbb\xb7l\xd9\x02\xa0\xb9\xb99\xcb?\x9a\xc8N\xfa\xfa\
-\xfa\xfe\xe7\x7f\xfe\xe7\xac\xb3\xce\xda\x1fg\xd8\xdb\xdb\xbb\
-v\xed\xda\x15+V\xdcv\xdbm\xbf\xff\xfd\xef\xfb\xfb\
-\xfb\x89h\x22W\xf2\xb8\xb2XO\x7f\x7f\x7fSSS\
-\xa1PX\xb4h\xd1\xeb^\xf7\xba4M\xcf:\xeb\xac\
-\x9d\xd6l\xdd\xdd\xdd\x8f<\xf2H\x1c\xc7?\xfe\xf1\x8f\
-\x07\x07\x07\x87\x86\x86j\xb5Z>\x9f\xcf\xe5r\x07\xb7\
-\x87N\xb9\x5c>\xe3\x8c3\xae\xbb\xee\xba\x0b.\xb8 \
-\x97\xcb\xed\xcd\x0e\x07\x06\x06\xee\xba\xeb\xae\x7f\xfa\xa7\x7f\
-z\xea\xa9\xa7\x8c1\xcd\xcd\xcd{\x7f\xd7\x98\xb9\x5c.\
-\x97J\xa5\xa3\x8e:\xea\x9ak\xae\xb9\xfc\xf2\xcbw\xad\
-\xf6\x9a\x14\x11Y\xb1b\xc5\x97\xbe\xf4\xa5\x9f\xfe\xf4\xa7\
-\xfd\xfd\xfdYXp\x7f\xfc\x08*\x95J\x10\x047\xdc\
-p\xc3i\xa7\x9d6\x91\xed\xaf\xbc\xf2\xca\x9f\xff\xfc\xe7\
-mmm{\xf9\xb2\xb6m\xdb\xb6\xf3\xce;\xef\x96[\
-n\x19w\xcb_\xfc\xe2\x17oy\xcb[\xc20\xcc\x12\
-\xe5&u\x94\xc1\xc1\xc1s\xcf=\xf7\xc6\x1bo\x1cc\
-\x9b\xa7\x9ez\xea\xc2\x0b/\xf4\xde\xef\xf6\xba:$\xce\
-3K;\xfa\xc2\x17\xbep\xc9%\x97L\xea\xb8\xfb\xca\
-\xfb\xdf\xff\xfe\xef~\xf7\xbb\x1d\x1d\x1d\xbb~\xabZ\xad\
-\xce\x993'Kj\xdbO\x9csD\xb4~\xfd\xfa\x95\
-+W\xfe\xf6\xb7\xbf\xfd\x9f\xff\xf9\x9f\xcd\x9b7\x1bc\
-\xa6\xf0\x9bH)\xa5\xa6\x95b\xb1h\xe6\xcc\x99\xb3\xdb\
-\xc6\x9cJ)u\xe01\xf3\xc6\x8d\x1b\xd7\xaf_\xff\xfa\
-\xd7\xbf~\xdc\x8d\x8b\xc5\xe2s\xcf=w\xe7\x9dwN\
-6 \xc2\xcc\x9b6m\xba\xec\xb2\xcb\xde\xfd\xeew\x8f\
-{\xc3\xc7\x1e{\xec\xba\xeb\xae\x1b\xc9b\x18CV\xbf\
-644t\xd6Yg}\xf6\xb3\x9f}\xe7;\xdf\xb9\
-\xaf\xea\xb6\x8c1Y\xd1\xc7\xb1\xc7\x1e\xfb\xf8\xe3\x8f\xaf\
-Z\xb5\xaaX,N\x874\x0a\x22\x1a\x1a\x1a\xaaV\xab\
-\xafy\xcdk\xbe\xfc\xe5/_z\xe9\xa5\xed\xed\xed\xfb\
-d\xcfQ\x14-[\xb6\xec\xf5\xaf\x7f\xfd\xacY\xb3\x1e\
-y\xe4\x91\x8d\x1b7\xb6\xb4\xb4Lj\x0f\x22\xc2\xcc\xe7\
-\x9e{\xee\x14\xd2:&\x88\x88\xac\xb5]]]Y\xf5\
-\xd0\x15W\x5cAD+W\xae\xec\xe9\xe9\x99x&H\
-\x1c\xc7\x17_|\xf1n\xab\x8d\xf6^>\x9f\x9f?\x7f\
-\xfe\x8b^\xf4\xa2\xcb/\xbf\xfc\x92K.)\x97\xcb\xab\
-V\xad\xea\xe9\xe9\xc9\xe7\xf3{s\xfd\x10Q\x7f\x7f\x7f\
-\xb5Z=\xea\xa8\xa3\xde\xf6\xb6\xb7\xfd\xc7\x7f\xfc\xc7\xbb\
-\xdf\xfd\xee\x97\xbe\xf4\xa5/y\xc9K\x16,X0g\
-G\xcb\x96-;\xfb\xec\xb3\xcf=\xf7\xdc+\xaf\xbc\xf2\
-\x95\xaf|ekkk\xd6\xf8ipp\xb0P(\x1c\
-\xf8P&3\xf7\xf7\xf7\x87a\xf8W\x7f\xf5W\x9f\xf8\
-\xc4'^\xf8\xc2\x17\xee}:L.\x97;\xe6\x98c\
-\xde\xf4\xa67\xb5\xb7\xb7?\xf0\xc0\x03\xdb\xb6m\xdb\xcb\
-G\xd8\x18\xd3\xdf\xdf\xef\xbd\x7f\xef{\xdf\xfbo\xff\xf6\
-o\x17\x5cp\xc1\xdew\x1a\x22\xa29s\xe6\x5cz\xe9\
-\xa5\xc7\x1dw\xdc\xaaU\xab\xd6\xad[\x97u\x9d\xdf\xe7\
-\x0b\xda\xe1\xe1\xe1\x17\xbe\xf0\x85\x1f\xfa\xd0\x87&\xf8\xc0\
-\x0e\x0c\x0c\xdcy\xe7\x9d\xcc\xbc\x97\xafi\xd5ju\xfe\
-\xfc\xf9oy\xcb[\xc6\xdd\xf2\xa8\xa3\x8ez\xec\xb1\xc7\
-\xb2\x04\x93\xc9^\x81I\x92\xcc\x9d;\xf7\xd2K/\x1d\
-#h\xf8\xc4\x13O\xdcp\xc3\x0d\x00v\xfb\x08\x1c\x12\
-\xe7\x99]\x15g\x9f}\xf6\xbeMN\x9c\xa08\x8eo\
-\xbc\xf1\xc6\xa7\x9f~z\xb7'\xef\x9c\xcb\xe7\xf3oy\
-\xcb[\xf6\xdf\xa8\x84\xac\x87z[[\xdb\xd1G\x1f}\
-\xd1E\x17]r\xc9%i\x9a>\xf6\xd8cCCC\
-\xb9\x5cn\xfa|\x00\xa3\x94R\x93\x15\x86\xe1\xc1_?\
-(\xa5\xd4\x88,\xbd\xe5\xb6\xdbn\xfb\xf1\x8f\x7f<\x91\
-\xed\xdf\xfe\xf6\xb7/^\xbcx\xb2M\x0aj\xb5Zk\
-k\xebUW]5\xee\xdb8\x11\xf9\xc2\x17\xbe\x90\xf5\
-o\x1e{\xcb\xac\xe1B\xb5Z\xfd\xdb\xbf\xfd\xdb\x1bo\
-\xbcq\x7f\xa4\xcd3\xf3k^\xf3\x9a\xef}\xef{W\
-\x5cqEooo\xf6\x11\xe5>?\xca\xa4\xcegx\
-x8\x9f\xcf\x7f\xe63\x9f\xf9\xfa\xd7\xbf\xbex\xf1\xe2\
-}~\x88\x5c.\xf7\xfe\xf7\xbf\xff\x9b\xdf\xfc\xe6\xc9'\
-\x9f\x9c5\xb3\x98\xb6\xef\xbc\x99y\xc1\x82\x05\x1f\xfb\xd8\
-\xc7~\xf8\xc3\x1f\x9ew\xdey\xbd\xbd\xbd\xd3\xea\x83b\
-k\xed1\xc7\x1c\xf3\x9f\xff\xf9\x9f?\xfc\xe1\x0f_\xf1\
-\x8aWtww'I2\xb5\xf5\xb61f\xeb\xd6\xad\
-s\xe7\xce\xbd\xfe\xfa\xeb\xef\xbc\xf3\xce\xbf\xff\xfb\xbf?\
-\xe2\x88#&R\xbfS,\x16O8\xe1\x84\xbf\xfb\xbb\
-\xbf\xfb\xd9\xcf~\xf6\xe9O\x7f\xfa\x05/x\xc1\xc6\x8d\
-\x1b\x0f\xf0e\x9cE\x7f:::\xbe\xf8\xc5/~\xe4\
-#\x1f\x99lTql\xc5b\xf1\x03\x1f\xf8\xc0\xb7\xbf\
-\xfd\xed\x17\xbd\xe8E===Sn\xbd\xc4\xcc[\xb6\
-la\xe6\xcf}\xees\x1f\xff\xf8\xc7w\xdb\xe5go\
-\xbc\xeaU\xaf\xba\xe5\x96[\xae\xbd\xf6\xdaR\xa9T*\
-\x95\xf6\xed\xe3\x9f\xa5\x93\x5c|\xf1\xc5\x13_\x9c_p\
-\xc1\x05mmm\x07\xb8S\xd5G>\xf2\x91\xce\xce\xce\
-\x83\xd2\xe0fR\x0e\x95\xf3\x9c\xd9\x96,Y\xf2\x89O\
-|\xe2\x9b\xdf\xfc\xe6QG\x1d5\x91\xceVJ)5\
-\x9di\x00H)5\xbd\xe4\xf3\xf9\xbe\xbe\xbe\xff\xf7\xff\
-\xfe\xdfn\x07\xa5\xef\xe4\xb8\xe3\x8e\xbb\xe8\xa2\x8bDd\
-\xe2m\x80\x88h\xeb\xd6\xad\xe7\x9dw\xde\xc5\x17_<\
-\xee\xc6\xb7\xdez\xeb\x0f\x7f\xf8\xc3\xacw\xc9\xd8\xfb\x1c\
-\x1a\x1a\xf2\xde\x7f\xe2\x13\x9f\xf8\x9b\xbf\xf9\x9b\xbdof\
-1\x86\xa5K\x97~\xfb\xdb\xdf~\xcf{\xde3<<\
-\x5c\xab\xd5\x0eV@\x84\x88\x06\x06\x06:;;\xbf\xfe\
-\xf5\xaf\xbf\xedmo\xdb\xaf\xc7:\xe3\x8c3n\xbe\xf9\
-\xe6\x8b.\xba\xa8\xaf\xafo\x22\xcd\xa1\x0e\xae3\xce8\
-\xe3{\xdf\xfb\xde\xab_\xfd\xea\x9e\x9e\x9e\x83}.\xbb\
-q\xd6Yg}\xef{\xdf\xbb\xfe\xfa\xeb\x01\x0c\x0d\x0d\
-M\xe1\xfay\xfe\xf9\xe7\xcf?\xff\xfc\x1f\xff\xf8\xc7\x1f\
-\xfc\xe0\x07\xa7v\xa9\x17\x0a\x857\xbf\xf9\xcd?\xfe\xf1\
-\x8f\xdf\xf5\xaew\x0d\x0d\x0d\x95\xcb\xe5\x03s\x19g\x17\
-m\xa1P\xf8\xd2\x97\xbe4\x91\xf64Ss\xf6\xd9g\
-\xdfp\xc3\x0d\xafz\xd5\xab\xb2\xd7\x84)\xec\xa1\xaf\xaf\
-o\xe1\xc2\x857\xddt\xd3\x1b\xdf\xf8\xc6}~z\x99\
-\xd6\xd6\xd6\x8f}\xecc\xd7_\x7f}\x92$\xe5ry\
-\x1f\xee9\xcb\xcex\xc5+^1\xf1\x9b,Y\xb2\xe4\
-\xbc\xf3\xce;\xc0\xd9\xe8'\x9ex\xe2UW]\x85i\
-?`\xf1P9\xcf\xc3\xc1\x85\x17^\xf8\xe3\x1f\xff\xf8\
-\xc5/~\xf1\xe0\xe0\xe0\xb4\xfd(B)\xa5\xc6\xa5\x01\
- \xa5\xd4\xf4\xe2\xbd\x9f?\x7f\xfe\xddw\xdf\xfd\x8do\
-|c\x22\xdb\xbf\xef}\xefkoo\x9f\xf8\xa7\xc7\xd5\
-j\xb5\xb5\xb5\xf5\x0dox\xc3D6\xfe\xaf\xff\xfa\xaf\
-\xa1\xa1\xa1q\xdb?\x0f\x0e\x0e2\xf3\xbf\xfc\xcb\xbf\xbc\
-\xeb]\xef\x9a\xe0i\xec\x8d \x08\xfe\xed\xdf\xfe\xed\x03\
-\x1f\xf8@\xa9T\xaaV\xab\x07\xe0\x88\xbb\xea\xe9\xe9\xe9\
-\xea\xea\xfa\xe2\x17\xbf\xf8\xf2\x97\xbf\xfc\x00\x1c\xae\xab\xab\
-\xeb;\xdf\xf9\xce\x15W\x5c1\xe5E\xf5\x81T,\x16\
-\xbf\xf2\x95\xaf\x5cv\xd9e\xbd\xbd\xbd\x07\xfb\x5cv#\
-\x08\x82\xbf\xfa\xab\xbf\xfa\xe8G?\xca\xcc\x83\x83\x83\x13\
-\xbf\xa1\xf7~\xc3\x86\x0d\x97\x5cr\xc9\xf7\xbe\xf7\xbd\xe3\
-\x8e;n/Oc\xfe\xfc\xf9\x9f\xfd\xecg\xff\xe9\x9f\
-\xfe)K%;\x00%\x8d\xe5r9\x0c\xc3O\x7f\xfa\
-\xd3\x17\x5cp\xc1~=Pgg\xe7\x97\xbe\xf4\xa5\xf3\
-\xcf??{e\x98\xf8\x0d\xb3\x9f\xc8\x91G\x1e\xf9\x9d\
-\xef|\xe7\xec\xb3\xcf\xde\x7fg\x98\xf9\x8b\xbf\xf8\x8b\xeb\
-\xaf\xbf>k\x86\xbd\xaf\x16\xb4i\x9a\x9ev\xdai'\
-\x9ex\xe2\xa4nu\xc9%\x97\xec\xc3s\x98\xa0k\xaf\
-\xbd\xf6\xe8\xa3\x8f\xaeV\xab\xd3|1\x7f\xa8\x9c\xe7\xe1\
-`\xd1\xa2E_\xfa\xd2\x97\x96.]\x9a\xf5S;\xd8\
-\xa7\xa3\x94RS\xa1\x01 \xa5\xd4\xb4c\x8c\x09\xc3\xf0\
-\xeb_\xff\xfa\xb6m\xdb\xc6\xdd\xf8\xc4\x13O\xbc\xfc\xf2\
-\xcb'\x9eDP*\x95\x8e?\xfe\xf8+\xae\xb8b\xdc\
--\x7f\xf1\x8b_\xdc~\xfb\xed\x1d\x1d\x1dc|\xf4\x9a\
-\xf5\xfd1\xc6\xfc\xf3?\xff\xf3;\xde\xf1\x8e\x89\x9c\xc0\
-\xber\xfd\xf5\xd7\xbf\xff\xfd\xef/\x95J\x07\xfe\x93\xe1\
-\xfe\xfe\xfeY\xb3f}\xf6\xb3\x9f\xdd\x7f\xfd\x95w\x95\
-\xcb\xe5\xfe\xe3?\xfe\xe3\x92K.\xe9\xeb\xeb\x9b\x0e\xfd\
-\x8f\xc6\x96\xcf\xe7?\xf9\xc9O\x1e\x7f\xfc\xf1===\
-\xd3s\x9d\xf0\x8ew\xbc\xe3\x9f\xff\xf9\x9f\xad\xb5\x13_\
-x\xf7\xf6\xf6\x9es\xce9_\xf9\xcaW&5\x11o\
-l\xd7\x5cs\xcd?\xfe\xe3?\x02(\x95J\xfb\xf5\xc7\
-*\x22CCCW_}\xf5k_\xfb\xda\xfdw\x94\
-\x11mmm\xff\xf8\x8f\xff8w\xee\xdc\xfe\xfe\xfe\x09\
-\xde/cLOO\xcf\xacY\xb3>\xff\xf9\xcf\x9f|\
-\xf2\xc9\xfb\xfb\x0c3\x1f\xf8\xc0\x07\xae\xbb\xee\xbaJ\xa5\
-\xb2O^F\x98yhh\xe8\xe2\x8b/\x9e\xec\xb0\xc2\
-\x97\xbc\xe4%\xc7\x1csL\xa5R\xd9\xfbs\x98\xb89\
-s\xe6\xbc\xedmo\x9bH\xaa\xe9\xc1u\xa8\x9c\xe7a\
-\xe2\xc8#\x8f\xfc\xd8\xc7>\x86\xa9fP*\xa5\xd4A\
-7\xdd\xdfC+\xa5\x0eC\x22\xd2\xd6\xd6\xf6\xf8\xe3\x8f\
-\x7f\xe1\x0b_\x98\xc8\xf6\x7f\xf2'\x7f\xc2\xcc\x13I\x0c\
-\xf1\xde\x07Ap\xc5\x15W\x8c\xdb\x9f\xa2Z\xad~\xfa\
-\xd3\x9fN\xd3t\xec\xf1@\xd9\x90\xe6\x8f|\xe4#W\
-_}\xf5DNu\xdf\xfa\xff\xfe\xbf\xff\xef\x8a+\xae\
-\xd8\xbau\xeb\x81\x9c\x0d\x9f\xa6iss\xf3\xbf\xfe\xeb\
-\xbf\xee\xef4\x8a]\xb5\xb5\xb5}\xf2\x93\x9f<\xf1\xc4\
-\x13\xb7l\xd9r \xef\xf2\xd4\xcc\x9f?\xff}\xef{\
-_.\x97\x9b\xb6\x93\x16\xae\xbe\xfa\xea\xeb\xae\xbbn\x82\
-\xedE\xe28^\xb2d\xc9g?\xfb\xd9}\xd5\xe7{\
-\xf4i|\xf4\xa3\x1fM\x92d\xbf.qk\xb5\xdaY\
-g\x9d\xf5\xe1\x0f\x7fx\xff\x1db'\xc7\x1f\x7f\xfc\xf5\
-\xd7_\x9f\x8d\x8a\x1bw\xe3\xac\x8c4\x08\x82O}\xea\
-S\x13\x1c\x9e\xb5\xaf\xfc\xd5_\xfd\xd5+^\xf1\x8a\xe7\
-\x9f\x7f~\xef\x9fSI\x92tuu\xbd\xf4\xa5/\x9d\
-\xec\x0d\xbb\xba\xba\xce?\xff\xfc\x03\x1f-\xbd\xea\xaa\xab\
-^\xfc\xe2\x17o\xdb\xb6m\x9a\xc7\x94\x0f\x95\xf3<L\
-\xbc\xf2\x95\xaf\xbc\xee\xba\xeb\x92$I\xd3\xf4`\x9f\x8b\
-RJM\xda\xdeN\xbePJ\xa9\xfdAD\x8a\xc5\xe2\
-\xf7\xbf\xff\xfd7\xbd\xe9M\xe3NR?\xf5\xd4S_\
-\xf1\x8aW\xfc\xe4'?\xe9\xea\xea\x1a\xfbs\xec8\x8e\
-\x8f;\xee\xb8\x89\xa4\xea\xfc\xf4\xa7?\xfd\xc3\x1f\xfe0\
-\xf6\x80y\x22z\xfe\xf9\xe7\xdf\xf5\xaew}\xe8C\x1f\
-\x1aw\x87\xa3\x0d\x0f\x0f\xaf[\xb7\xee\x81\x07\x1ex\xf8\
-\xe1\x87\xb3d\x8a\xa1\xa1\xa1\xf3\xcf?\xff\xd4SO\x9d\
-\xd4\x0c\xf5\x5c.\xf7\xa9O}j\xed\xda\xb5+W\xae\
-lmm=\x00\xa9@D\xd4\xdb\xdb\xfb\xf1\x8f\x7f|\
-\xb2i\x14[\xb7n\xdd\xb8q\xe3\x1dw\xdc\xb1f\xcd\
-\x9a\xec.\xd7j\xb5W\xbe\xf2\x95\xc7\x1cs\xcc\xa4\xba\
-GguCox\xc3\x1b\xfa\xfb\xfb[ZZ\xa6y\
-_\x8c7\xbf\xf9\xcd\xff\xf5_\xff\xb5|\xf9\xf2\xdd\x0e\
-3\x9e\x0e\xae\xbb\xee\xba\x87\x1ez\xe8\x96[n\x99;\
-w\xee\x18\x0f&3\x0f\x0c\x0c\x5c\x7f\xfd\xf5\xfbi\xa4\
-\xda\xfb\xde\xf7\xbe\x07\x1f|\xf0[\xdf\xfa\xd6\xdc\xb9s\
-\xf7\xc7\xfe\x89hpp\xf0\xdak\xaf\x9d`\xf4\xaaZ\
-\xad>\xfe\xf8\xe3O<\xf1\xc4\x8a\x15+\xb2y@\xb5\
-Z\xad\xab\xab\xeb\xe2\x8b/\xee\xe8\xe8X\xb2d\xc9\x04\
-\x8f\xfb\xc67\xbe\xf1\x86\x1bn\xb8\xe1\x86\x1b\x16.\x5c\
-8\xeeKS\xa5R\xf9\x87\x7f\xf8\x87K/\xbdt\x82\
-;\x07\xe0\x9c[\xb9r\xe5]w\xdd\xb5z\xf5\xea \
-\x08D\xc4Z{\xee\xb9\xe7\x1e}\xf4\xd1\xcb\x96-\x9b\
-\xe0N\x98\xf9\xa3\x1f\xfd\xe8\x83\x0f>\xd8\xd3\xd3\xb37\
-/#\xd9\x8b\xc3\xdb\xde\xf6\xb6\xa9]$\x17^x\xe1\
-\xd7\xbf\xfe\xf5$I\xf6~(\xdb\xc4\xb5\xb4\xb4\xfc\xe5\
-_\xfe\xe5;\xde\xf1\x8eJ\xa5\xb2\xffFJ\xed\xbdC\
-\xe5<\xf7\x950\x0c\xa7y\xa8\xeb#\x1f\xf9\xc8O\x7f\
-\xfa\xd3'\x9f|r\xda\xbe\xb6+\xa5\xd4\x9eh\x00H\
-)5M\x05A\xf0\xdcs\xcf\xfd\xfb\xbf\xff\xfb\xb8y\
-@\xd6\xda\xf7\xbc\xe7=\xbf\xfc\xe5/\xab\xd5\xea\x18o\
-\x8e\x89\xa8R\xa9\x5cv\xd9e\xe3.\x02{{{?\
-\xf9\xc9Of\xd3^\xf7\xb4\x1c\xcaV;'\x9f|\xf2\
-\xf5\xd7_?\xf1O\xad\xd7\xae]\xfbo\xff\xf6o\xf7\
-\xde{\xaf\xf7~\xe3\xc6\x8d\xdd\xdd\xdd\xd9\xdb\x5c\xef\xfd\
-M7\xdd4{\xf6\xecY\xb3f]p\xc1\x05W_\
-}\xf5\x9c9s&\xb2\xc3Y\xb3f}\xf4\xa3\x1f}\
-\xfd\xeb__*\x95\x0a\x85\xc2~\x0d\x88\x10\xd1\xb6m\
-\xdb.\xb9\xe4\x92\x0f|\xe0\x03\x13\xbc\x89\x88\xdc\x7f\xff\
-\xfd\x9f\xfe\xf4\xa7\x9f~\xfa\xe9$I\x9e}\xf6\xd9\x91\
-\xae(\xde\xfb\x9bo\xbe\xb9\xa5\xa5e\xf1\xe2\xc5\x97]\
-v\xd9UW]5v\xb2\xd5\x88\x17\xbd\xe8E\x1f\xfe\
-\xf0\x87?\xfc\xe1\x0f\xe7r\xb9 \x08\xa6~\x7f\x00\x00\
-I\x92L\xbc\x8f\x123\x17\x0a\x85\x89\xef<\x8a\xa2\xd7\
-\xbc\xe65\xabV\xad\xf2\xde\xef\xcdz\xc697\x91\x22\
-\x9dl\x88\xde\xa4\xf6\x1c\x04\xc1\xc7?\xfe\xf1'\x9f|\
-r\xfd\xfa\xf5{\x0awf\x97\xfa\xf9\xe7\x9f?\xf1n\
-\xdfY\x93\xd4,\x1e1\xc1z\xb1\xbf\xfe\xeb\xbf\xbe\xfb\
-\xee\xbb\xbb\xbb\xbb\x9b\x9b\x9b'q\x07&|>g\x9f\
-}\xf6D\xfaUm\xdc\xb8\xf1\xdb\xdf\xfe\xf6M7\xdd\
-488\xb8u\xeb\xd6\xee\xee\xee\xec\xd9\xed\xbd\xcf\xe7\
-\xf3\xdf\xf9\xcew\x82 \x98?\x7f\xfe\xbb\xdf\xfd\xee\xcb\
-.\xbbl\x22)3\xef}\xef{\xef\xbe\xfb\xeer\xb9\
-<F\xc3\xec\xac<\xed\xe5/\x7f\xf9\xb5\xd7^;\xc1\
-{T\xa9T\xbe\xfd\xedo\x7f\xfd\xeb_\x1f\x1e\x1e^\
-\xbf~}V\x17)\x22\xcc\xfc\xdd\xef~\xb7\xad\xadm\
-\xc1\x82\x05o}\xeb['\xd8\xec\xec\xa8\xa3\x8e\xfa\xf0\
-\x87?\xfc\xa1\x0f}(\x9f\xcfO\xf99\x95\xa6)3\
-O\xb9)\xd8\x99g\x9e\xf9\xc2\x17\xbe\xf0\x81\x07\x1e\x18\
-7\x8e\xbfo\xbd\xe2\x15\xaf\xb8\xe8\xa2\x8b\xbe\xff\xfd\xef\
-\x1fq\xc4\x11\x07\xec\xa0S0=\xcf\xd3{_.\x97\
-\xf7\xf9\xcf+I\x92\xbd\xef\x095\xa9\xd7v\x11\x99\xd4\
-L\xc0(\x8a\xde\xfe\xf6\xb7\xff\x9f\xff\xf3\x7f\xf6\xf2\xb5\
-])\xa5\x0e<\x0d\x00)\xa5\xa6)\x22\xca\xe7\xf3?\
-\xff\xf9\xcf\xef\xb9\xe7\x9eq\xfb\xa1\xbe\xece/\xbb\xf0\
-\xc2\x0bo\xbe\xf9\xe6\xf9\xf3\xe7\xef\xe9\xcdh\x1c\xc7\xf3\
-\xe6\xcd\x9b\xc8`\x9d\xef\x7f\xff\xfb\xcf<\xf3Lss\
-\xf3\x18\xefk\xb3\x09\x5c\x7f\xfe\xe7\x7f>{\xf6\xecq\
-w\x08`pp\xf0\x13\x9f\xf8\xc4\xb7\xbf\xfd\xed\xa1\xa1\
-\xa1$I\xa2(\x8a\xa2h\xd9\xb2e\xd9!\x98\xb9R\
-\xa9\xac[\xb7n\xf5\xea\xd5\x0f=\xf4\xd0\xcd7\xdf|\
-\xcd5\xd7\xbc\xfd\xedo\x9f\xc8\x9e\xcf?\xff\xfc+\xaf\
-\xbc\xf2k_\xfbZ>\x9f\xdf\x7f\x05\x14D4<<\
-\xdc\xd2\xd2\xf2\x91\x8f|d\x827\xd9\xbcy\xf3\xdf\xfc\
-\xcd\xdf\xfc\xeaW\xbf*\x97\xcb\xcc\x1c\x04A[[[\
-gggv\x97\x89\xa8T*\xf5\xf5\xf5\xadY\xb3\xe6\
-\xde{\xef\xfd\xd1\x8f~t\xed\xb5\xd7\xbe\xeaU\xaf\x9a\
-\xc8\x9e\xaf\xbe\xfa\xea\x9f\xfc\xe4'\xf7\xddw_kk\
-\xeb\xd4\xef\x12\x00\xe0\x86\x1bn\xc8\x1a:\x8c\xbb\x98\xcf\
-\xc6\x1b]r\xc9%\xb3g\xcf^\xb6l\xd9\xe9\xa7\x9f\
-\xde\xd9\xd99\xee\xfe/\xbe\xf8\xe2/~\xf1\x8b\x95J\
-eo\x16\x09\x0f=\xf4\xd0\x9f\xfd\xd9\x9f\xf5\xf5\xf5\x8d\
-\x11Lq\xce\x19c\xce?\xff\xfc\xc5\x8b\x17\x9fp\xc2\
-\x09g\x9eyf[[\xdbDv\xbed\xc9\x92w\xbc\
-\xe3\x1d\xff\xfb\x7f\xff\xef4Mw\xfb \x88H\xa9T\
-z\xcdk^\x13\x86\xe1\xd8\xbb\xaaT*\xbf\xfc\xe5/\
-\xef\xb9\xe7\x9e\x9bo\xbe9\x97\xcbU*\x95\xac}\xc9\
-\xf9\xe7\x9f\x7f\xf4\xd1G\x8f}\xdb#\x8f<\xf2u\xaf\
-{\xdd\xe7?\xffy\x11\xd9\xb7\x97q6\xfc\xeb\xc2\x0b\
-/\x1c7:v\xeb\xad\xb7~\xe4#\x1fY\xbf~\xbd\
-\xf7>\x8a\xa2 \x08F\x92}\x88\xc89\xb7e\xcb\x16\
-\xe7\xdc3\xcf<s\xf7\xddw\x9f{\xee\xb9_\xfe\xf2\
-\x97\xc7\x0d\xd4\x9e{\xee\xb9\xc7\x1e{\xec\x03\x0f<0\
-F\x00\xc89\xd7\xda\xdaz\xed\xb5\xd7N\xf0\x22\xb9\xef\
-\xbe\xfb>\xf8\xc1\x0f>\xfd\xf4\xd3i\x9aFQT,\
-\x16G\x07\xef*\x95\xca\xc0\xc0\xc03\xcf<s\xdf}\
-\xf7\xddx\xe3\x8d\x9f\xf8\xc4'&\x122x\xeb[\xdf\
-\xfa\x83\x1f\xfc\xe0\xa1\x87\x1e\x9a\xe0e\xb3\xab\xa1\xa1\xa1\
-\xe3\x8f?\xfe\x9cs\xce\x99\xda\xcd\xdb\xda\xdaN?\xfd\
-\xf4{\xee\xb9\xc7{\x7f\x80\x0b\xc1\xfe\xf2/\xff\xf2\xf7\
-\xbf\xff}\x7f\x7f\xffd\xe3\xa7\x07\xd84<\xcf\xcd\x9b\
-7\xbf\xeeu\xaf\x1b\x18\x18\x18\xf7\xc5aRD\xa4Z\
-\xadN*\x22\xb3\xab\x89\xbf\xb6\x03\xa8\xd5j\x17_|\
-\xf1\x09'\x9c\xf0\xb2\x97\xbdl\x82)loz\xd3\x9b\
-\xbe\xfa\xd5\xafn\xde\xbcy\xdf\xdew\xa5\x94\xda\xdf4\
-\x00\xa4\x94\x9a\xbe\x0a\x85\xc2\xbau\xeb>\xf7\xb9\xcf\x8d\
-\x1b\x00\x22\xa2w\xbe\xf3\x9dw\xdf}w\xa5R\xd9m\
-\x22\x093o\xdc\xb8\xf1/\xff\xf2/\xc7\xad\xb1\x1a\x1a\
-\x1a\xfa\xda\xd7\xbe6\xee\xc7z\xa5R\xe9\x8c3\xcex\
-\xfd\xeb_?\xee\xbd\x00\xb0n\xdd\xbak\xae\xb9\xe6\x9e\
-{\xee)\x16\x8b\xcd\xcd\xcd\xd9g\xf5\x185\xd97[\
-pf\xe9K\xde\xfb\xb5k\xd7~\xf0\x83\x1f|\xf4\xd1\
-G\xff\xe1\x1f\xfea\x22\x09\x11\xff\xeb\x7f\xfd\xaf\xdbo\
-\xbf}\xd3\xa6MS^\xbc\x8dKD\x06\x07\x07\xdf\xf5\
-\xaew\x9d~\xfa\xe9\x13\xd9\xfe\xae\xbb\xee\xba\xee\xba\xeb\
-V\xaf^],\x16G'\xc9\x8f\xdce\x11\xc9\xe7\xf3\
-\xd9\xaa\xd89\xf7\x87?\xfc\xe1\xedo\x7f\xfb\xdf\xff\xfd\
-\xdfO$\x09\x22\x97\xcb\xfd\xed\xdf\xfe\xed\x1b\xdf\xf8\xc6\
-4M\xf7\xb2`\xa4Z\xadf\xbd\xc6\xc7]$\x10Q\
-__\xdf\x17\xbf\xf8E\xef\xfd\xe0\xe0\xe0\x99g\x9e\xf9\
-\xc9O~\xf2\xcc3\xcf\x1c\xfbV\x8b\x17/njj\
-*\x95J{s\x92I\x92\xf4\xf6\xf6\xf6\xf4\xf4\x8c\x9b\
-M\xf3\xfd\xef\x7f?\xfbL\xfe%/y\xc9\x1b\xde\xf0\
-\x86\xab\xaf\xbez\x22\x05#W]u\xd5\x0f~\xf0\x83\
-\xa7\x9ezj\xb7\x01\xb5\xa1\xa1\xa1\x13O<\xf1\x8f\xfe\
-\xe8\x8f\xc6\xde\xc9\xd3O?}\xed\xb5\xd7\xdes\xcf=\
-a\x18\xe6r\xb9\xe1\xe1a\x22Z\xb3f\xcdu\xd7]\
-\xb7x\xf1\xe2,Om\xec=\xbc\xf5\xado\xfd\xd1\x8f\
-~444\xb4o\x17T\x95Je\xfe\xfc\xf9\xe3\x06\
-&~\xf1\x8b_\xbc\xf3\x9d\xef\xcc\x96\x9d\xbb>\xf7\xb3\
-\xe4\x9a\x91\xfc/\xe7\xdc\xed\xb7\xdf\xfe\xfa\xd7\xbf\xfe\x07\
-?\xf8\xc1\xfc\xf9\xf3\xc7\xd8m\x10\x04\xafx\xc5+\x1e\
-\x7f\xfc\xf1=\xbd\xa4d\x91\xd07\xbf\xf9\xcd\x13l\xaa\
-\xf5\xab_\xfd\xea=\xefy\xcf\xc0\xc0@kk\xeb\xc8\
-E;:T\x9d\xcb\xe5\xb2\xd7@\xe7\xdc\x0d7\xdc\xb0\
-|\xf9\xf2\x1bo\xbc\xf1\xa8\xa3\x8e\x1a{\xb7\xf9|\xfe\
-}\xef{\xdf\x07?\xf8\xc1,\x928\x913\xd9\xc9\xd0\
-\xd0\xd0)\xa7\x9c\xb27E|\x97]v\xd9\x8d7\xde\
-888\xb8\x0f\xbb\x8cO\xc4I'\x9d\xf4\xba\xd7\xbd\
-\xee\xcb_\xfe\xf24\xcf\xe6\x98\x86\xe7\xe9\x9c\xeb\xed\xed\
-\xed\xeb\xeb\xdb\xb7\xcfY\x22\xb2\xd6\xee\xe5}\x9c\xf8k\
-{v\xc4\x1f\xfc\xe0\x07CCC\xb3g\xcf\xfe\xd3?\
-\xfd\xd3\x0f}\xe8C\xe3\xde\xaa\xa3\xa3\xe3\xd2K/\xfd\
-\xe2\x17\xbf\xa8\x01 \xa5\xd4\xa1eZ\xfc\xfePJ\xa9\
-\xdd\x12\x91y\xf3\xe6\xddv\xdbm?\xf9\xc9O\xc6\xdd\
-\xf8\xa2\x8b.:\xe5\x94S\xca\xe5\xf2n\xbf;<<\
-\xbcd\xc9\x92\x89\xa4\xff|\xfa\xd3\x9f~\xf2\xc9'\xc7\
-N-\xc9\x92A\xde\xf1\x8ewLd\xa1\xf2\xf8\xe3\x8f\
-\xbf\xe65\xaf\xb9\xfb\xee\xbb;::\xa2(\x1a\xa3\xac\
-,\x93\xad3[ZZ>\xf3\x99\xcf\x5c{\xed\xb5\x13\
-\x99\x8c3w\xee\xdc7\xbc\xe1\x0d\xd6\xda\xfd7\x22\xbd\
-T*-X\xb0\xe0\x9d\xef|\xe7D6\xfe\xf9\xcf\x7f\
-~\xe5\x95W\xaeY\xb3\xa6\xbd\xbd}\x22\x01\x1acL\
-GG\x87\xb5\xf6#\x1f\xf9\xc8\xbf\xfc\xcb\xbfL\xe4\x10\
-\xe7\x9cs\xce\xc5\x17_\xbc\xf7m\x83\x8d1\xd1\xc4\x84\
-a\x18EQ\xa1Phnn^\xb4h\xd1\xf2\xe5\xcb\
-\xaf\xba\xea\xaaG\x1f}t\xec\xfd\x17\x0a\x85\x93O>\
-y/\x7f.\xcc\x9c\x1d}\x5cMMM\xc5bq\xce\
-\x9c9\x0f=\xf4\xd0\x9f\xff\xf9\x9f_y\xe5\x95O>\
-\xf9\xe4\xb8\xfb\xef\xea\xea\xfa\x93?\xf9\x93 \x08\x9cs\
-;}+K\x9f9\xe9\xa4\x93\xc6n\xd5\xb4f\xcd\x9a\
-+\xae\xb8\xe2\xb7\xbf\xfdmWWWkkkv\xb6\
-\xd9\xdfs\xe7\xce\xdd\xbau\xeb\x9f\xff\xf9\x9f\xdfx\xe3\
-\x8dc\x9f\xc61\xc7\x1cs\xf6\xd9g\xef\xf3\xbe\xaa\x95\
-J\xe5\x98c\x8e\x19\xfbS\xfd\xee\xee\xee\xbf\xf9\x9b\xbf\
-\xa9V\xab\x1d\x1d\x1d\x13Yv\x1ac\xe6\xce\x9d\xfb\xe8\
-\xa3\x8f\xbe\xfb\xdd\xef\xde\xd3k\xce\x88\x97\xbe\xf4\xa5\xc5\
-bq\xd7\xc76\x93\xa6iKK\xcb\xfb\xde\xf7\xbeq\
-\x0f\x0a\xe0\xb7\xbf\xfd\xed{\xdf\xfb\xder\xb9\xdc\xd9\xd9\
-9\xee\x02\xd5\x18\xb3`\xc1\x82\xd5\xabW\xbf\xf5\xado\
-\xed\xee\xee\x1ew\xe7\x97\x5cr\xc9QG\x1d5\xb5\xc7\
-\xbfV\xab\xcd\x9f?\x7f/'\xac\x9dv\xdais\xe7\
-\xce=\xc0\xb3\xc02\x7f\xf6g\x7fv\xcc1\xc7L\xff\
-I[\xd3\xed<\x89h\x82/M\x93\xb2Oz\x00M\
-\xfc\xb5=;bSS\xd3\xbcy\xf3\x92$\xf9\xbb\xbf\
-\xfb\xbb,uh\x5c\xa7\x9ezj\x92${y\x9eJ\
-)u\x80i\x00H)5\xadEQT*\x95>\xff\
-\xf9\xcf\x8f\xbb\xca\x22\xa27\xbf\xf9\xcd\xf9|~\xb7\x0b\
-\xad\xde\xde\xde\x0b/\xbc\xf0\xc5/~\xf1\xd8;Y\xbf\
-~\xfdw\xbf\xfb]f\x1e{q\x15\xc7\xf1)\xa7\x9c\
-2\x91\xfe\x1a\x9b6m\xba\xe6\x9ak\x9ez\xea\xa9\xce\
-\xce\xce\x89\xbf\xa3\x15\x91 \x08\xe6\xcd\x9b\xf7\xdd\xef~\
-\xf7\xfa\xeb\xaf\x9f\xc8M\xae\xbc\xf2\xca\xf6\xf6\xf6=-\
-2\xf7\x92\x88\xa4iz\xf1\xc5\x17\x9fz\xea\xa9\xe3n\
-|\xff\xfd\xf7_s\xcd5}}}mmm\x13\xef\
-\x0d\xe1\xbdojj\xea\xec\xec\xfc\xc4'>\xf1\xd5\xaf\
-~u\xdc\xed\x99\xf9\xcdo~\xf3\xc1\x1a\xb0\xe5\x9ck\
-oo\xdf\xb2e\xcb\x7f\xfe\xe7\x7f\x8e\xbd%3/Z\
-\xb4h\xff\x05\xe6vKD\xda\xdb\xdb\xe7\xcf\x9f\xff\xb3\
-\x9f\xfd\xec\xbd\xef}\xef\x86\x0d\x1b\xc6\xbd\xc9\x95W^\
-\xd9\xd9\xd9\xb9\xeb\xf5\x13\xc7qkk\xeby\xe7\x9d7\
-\xf6\xcd\xff\xf3?\xff\xf3\xd9g\x9f\xcdZ\x1d\xef\xf4C\
-\xf7\xde\x17\x8b\xc5r\xb9|\xfd\xf5\xd7\xafZ\xb5j\xec\
-\xfd\x5cx\xe1\x85\xfb|A\x95$I[[\xdb\xd8\x99\
-t\xb7\xddv\xdb\xda\xb5k\xdb\xdb\xdb'\xfe\x93r\xce\
-\xcd\x9a5\xeb\xde{\xef\xfd\xe9O\x7f:\xf6\x96\x0b\x17\
-.\xcc:4\xef\xfa-\x22\xea\xe9\xe99\xef\xbc\xf3N\
-<\xf1\xc4q\x8f\xb8z\xf5\xea\x0f|\xe0\x03Y\xee\xcf\
-\x04\xcf\xd397\x7f\xfe\xfc\xc7\x1e{\xecs\x9f\xfb\xdc\
-\xb8\x1b\x17\x0a\x85W\xbe\xf2\x95\x95Je\x0a\x15X\xe5\
-ry\xc9\x92%c\xa7Y\xf5\xf7\xf7?\xfb\xec\xb3c\
-l\x90\xcf\xe7/\xbf\xfc\xf2\x5c.w\x80\x9f/\x00\x16\
-.\x5c\xf8\xcew\xbes\xfa\x04V\xf6\xe4P9\xcfC\
-T\x96\x8a;{\xf6\xec\xaf|\xe5+\xf7\xde{\xef\xb8\
-\xdb/\x5c\xb8P'\xc1+\xa5\x0e9\x1a\x00RJM\
-k\xde\xfb\xd9\xb3g\xdfw\xdf}\xdf\xfe\xf6\xb7\xc7\xdd\
-\xf85\xafy\xcd\x89'\x9eX\xadVwzOV.\
-\x97\xbb\xba\xba\xde\xf4\xa67\x8d\xbb\x87\xaf|\xe5+k\
-\xd7\xae\xed\xe8\xe8\x18{\xf8W\xb9\x5c~\xd5\xab^5\
-\x91n\xa9\xff\xfe\xef\xff\xfe\xe8\xa3\x8ffe\x11\x93\xea\
-\x94)\x22a\x18vuu}\xf1\x8b_\xfc\xd6\xb7\xbe\
-5\xee\xf6\xc7\x1e{\xec\xb9\xe7\x9e\xbb\x9f>\x8dt\xce\
-\xe5r\xb9W\xbf\xfa\xd5\xe3nY\xab\xd5\xfe\xf1\x1f\xff\
-\xb1\xb7\xb7w\xf6\xec\xd9\x93\xed\x0c\xea\xbd\xcf\xe5rQ\
-\x14}\xecc\x1f\xbb\xe7\x9e{\xc6\xdd\xfe\xac\xb3\xce\x1a\
-#\xe7k\x7f#\xa2 \x08\x96/_\xbeu\xeb\xd6\xb1\
-\xb7\xcc\xe7\xf3\x07~ZY\xd6\x80y\xde\xbcy\x8f>\
-\xfa\xe8\xc7?\xfe\xf1q\xb7\xef\xec\xec\xbc\xe2\x8a+v\
-\xbd~\xe28\x9e={\xf6\x09'\x9c0\xc6m\xd7\xad\
-[\xf7\xf3\x9f\xff|\xd6\xacYc\xc4\x1f\xdb\xda\xda\x9e\
-x\xe2\x89\x1f\xfc\xe0\x07c\x9f\xc6\xb8\xd3\xb2\xa6\xc09\
-\xd7\xd2\xd22\xf6\xb3u\xfd\xfa\xf5a\x18N\xf6\xd0\xcc\
-\xec\xbd\xff\xfa\xd7\xbf>\xf6\x0dg\xcf\x9e\xbd`\xc1\x82\
-\xdd\x065\x9cs\xde\xfb\xcb.\xbbl\x22\x87\xfb\xd4\xa7\
->\xf5\xec\xb3\xcfN*J\x05\xc0{\xdf\xd2\xd2\xf2\x9d\
-\xef|g\xe5\xca\x95\xe3n|\xdey\xe7\x85a8\xd9\
-\xf8K\x16\xb0>\xeb\xac\xb3\xc6\xce\x88\xbc\xfd\xf6\xdbo\
-\xb9\xe5\x96\xb1wu\xc1\x05\x17477\xef\xa7@\xf6\
-\xd8\xde\xf2\x96\xb7\x9cq\xc6\x19#\x8d\xf9\xa7\xadC\xe5\
-<\x0fQ\xd9o\xder\xb9<n\xc6\x22\x809s\xe6\
-,^\xbcX\xe3qJ\xa9C\x8b\xfe\xf2PJ\x1d\x02\
-\xa2(\xfa\xda\xd7\xbe\xd6\xd3\xd33\xf6f\xf9|\xfe=\
-\xefyO\x1c\xc7;\xad\xc7\xe28>\xeb\xac\xb3\xc6m\
-\xb1\xb1|\xf9\xf2\xaf\x7f\xfd\xeb]]]co\x96\xa6\
-ikk\xebD\x86\xdd\xfc\xe4'?\xf9\xef\xff\xfe\xef\
-)\xf7\xe5\xc9\xde\x89\xe6\xf3\xf9\xcf~\xf6\xb3\x9b7o\
-\x1ew\xfb\x8b.\xba\xa8T*\xed\x8f\x0f$\xd34]\
-\xbat\xe9K_\xfa\xd2q\xb7\xfc\xdc\xe7>\xf7\xeb_\
-\xffz\x0a\xd1\x9f\x8c\x88455\xf5\xf7\xf7\xff\xfb\xbf\
-\xff\xfb\xb8\x03\x5c\xda\xda\xda^\xf6\xb2\x97\xf5\xf4\xf4\x1c\
-\xac\xcf`\xb3\x01\xe1\xe3V\xac\x1c\x94\xd5,\x80\xac\x9b\
-rKK\xcb\x0d7\xdc\xf0\x9b\xdf\xfcf\xdc\xed_\xf6\
-\xb2\x97\xedz\xfdd\xd1\x93\xb1\x1b\xbb<\xf8\xe0\x83\xe3\
-v\xb9\xce\xba\x80?\xf0\xc0\x03c\xc7(\x97,Yr\
-\xc4\x11G\xec\xdb\xc4\xae\xecS\xfd\xb1\xb7\xd95j<\
-AA\x10tww\xaf[\xb7n\x8cm\xc20\x5c\xb2\
-d\xc9n\xa3*\x03\x03\x03g\x9f}\xf6\xb8\xfd\x95\x00\
-\xfc\xfc\xe7?\xbf\xf1\xc6\x1b\xa7\xd6\x167\x0c\xc3\xbe\xbe\
-\xbe\xff\xfe\xef\xff\x1ew\xcb\x93O>\xf9\xf4\xd3O\x1f\
-\x1e\x1e\x9e\xd4\xfe\xb3\x00\xf1%\x97\x5c2\xf6f?\xfa\
-\xd1\x8f~\xf4\xa3\x1f\x8d\xfdt8\xf1\xc4\x13O:\xe9\
-\xa4}^\x068\x11MMM\x7f\xfa\xa7\x7f\x9a\xcb\xe5\
-&>:\xea\xa08T\xce\xf3\xd0\x95u|\xbf\xff\xfe\
-\xfb\xc7\x8d\xec\xe4\xf3\xf9\xce\xce\xce\x83r\xb9*\xa5\xd4\
-\x94i\x00H)u\x08\x88\xa2\xe8\xc9'\x9f\xfc\x8f\xff\
-\xf8\x8fq\xb7|\xf5\xab_}\xd6Yg\x0d\x0e\x0e\x8e\
-\xfcK\x9a\xa6\xf9|\xfe\xcdo~\xf3\xb8\x0b\xbc/\x7f\
-\xf9\xcb\xa5Ri\xdc\xbc\x9e\xa1\xa1\xa1l\xb2\xcf\xd8\x9b\
-\xd5j\xb5\xcf}\xees\xb5Zmo\xba\x14\x8bH.\
-\x97{\xea\xa9\xa7>\xfd\xe9O\x8f\xbb\xf1\x19g\x9c\xb1\
-p\xe1\xc2\xfdQ\x15\x95\xa6\xe9\x85\x17^8n;\xea\
-\xe7\x9f\x7f\xfe\xbf\xfe\xeb\xbf&U\xf9\xb5[\xcd\xcd\xcd\
-\xb7\xddv\xdb\xb8\xd9\x22\x00\xce9\xe7\x9c\xf6\xf6\xf6\x83\
-U\x08\x06`\xd7\x8a\xa7]7\xd8\xb2e\xcbA\xfc\xac\
-\xdeZ[\xa9T&RUw\xdcq\xc7-Z\xb4h\
-\xa7\x073M\xd3b\xb18v\x9f\xe3\x15+V\xd4j\
-\xb5q\xefc.\x97\xdb\xb6m\xdb\xd8\xa1\xcc\xd6\xd6\xd6\
-\xa3\x8e:j\xdf~\xa2\xee\xbd\x1f\xf7I](\x14\x9c\
-sS\x88\x01\x19c*\x95\xca\xd8\x11\x13\x22\xdam\x19\
- \x11\x0d\x0d\x0d\x1dy\xe4\x91\x13\x89\x11\xff\xe8G?\
-\xea\xe9\xe9\xd9m\x87\xfbq\x11Q\x9a\xa6\xb7\xddv[\
-oo\xef\xd8[\x16\x8b\xc5\xa5K\x97N\xf6\x09\x95\xa6\
-\xe9\xf1\xc7\x1f\x7f\xdai\xa7\x8d\xb1Moo\xef\xa3\x8f\
->\xbav\xed\xdag\x9eyf\x8c\xcd\x82 x\xe5+\
-_\x99\xcdX\x9c\xd49L\xd0\xc0\xc0\xc0\x18\xdf\xbd\xfc\
-\xf2\xcb\xdf\xf0\x867\xf4\xf6\xf6\x1e\xf8\x94\xbd\x9d\x1c*\
-\xe79S\x05AP\xa9T\xb2\x1e\xd2c\xb0\xd6\x1e\x94\
-\x8aE\xa5\x94\xda\x1b\x1a\x00RJ\x1d\x02\xb2\xa6<?\
-\xfc\xe1\x0f\x9fz\xea\xa9\xb1\xb7\xcc\xe5r\xd9T\xda\x91\
-\x7f\x89\xe3\xf8\xe4\x93O\x1e\xb7\xc8\xe2\xae\xbb\xee\xfa\xd9\
-\xcf~V(\x14\xc6}K=<<|\xfa\xe9\xa7\x8f\
-\x1b\xd6\xb9\xe3\x8e;\x1e\x7f\xfc\xf11f?OP\xb6\
-\xae\xbe\xfd\xf6\xdb\xc7}3\xbat\xe9\xd2s\xce9g\
-hhh/\x8f\xb8\xab4M\xc7\x1d\xc4\x06\xe0\x86\x1b\
-n\xe8\xee\xee\x9e\xda\x08\xa1\xd1\xb2\x0c\xfc\x9f\xfd\xecg\
-\xe3\xfe,^\xfc\xe2\x17\x9f|\xf2\xc9\x93MX\xd8W\
-\xd24\xcd\xca\xf4\xc6\xd8&\x8e\xe3\xa7\x9ez\xea \x06\
-\x80\xb2\x85\xf4\x8a\x15+\x9e\x7f\xfe\xf9\xb1\xb7\x5c\xb4h\
-\xd1\xae\xd7O\xd6\x9bi\xec\xf3\x7f\xe4\x91G\xca\xe5\xf2\
-\xb8\xf7\xd1\x183444\xf6\xf5\x99\xcf\xe7\xdb\xda\xda\
-\xf6m\xce\x941f\xdc:\xc1\xd3O?\xbdV\xab\xc5\
-q<\xd9\xb8C>\x9f\xafV\xab\xd7^{\xed\x15c\
-\xfa\xd9\xcf~\xb6\xebKA\x1c\xc7\xed\xed\xed\x13I\xac\
-[\xb9r\xe5]w\xdd\xb573\xfe\x8a\xc5\xe2\xc6\x8d\
-\x1b\xef\xbc\xf3\xceq\xb7\x9clIKV\x12\xfb\xeaW\
-\xbfz\xec\xfa\xaf{\xef\xbd\xb7\xbf\xbf\xbf\xbb\xbb\xfb\x97\
-\xbf\xfc\xe5\xd8;|\xf9\xcb_\xde\xda\xda\xba\x9f\xb2*\
-\xee\xba\xeb\xae\x07\x1f|p\x8c\x0d\xde\xfd\xeew\xcf\x9f\
-?\xff`\x15\x96\x8e8T\xces\xa6\xca\x02\xbb\xe3&\
-\x1d\xc7q<<<\xbc\xf7\xbf\xf2\x94R\xea@\xd21\
-\xf0J\xa9CCss\xf3\xaaU\xab>\xf7\xb9\xcf}\
-\xe63\x9f\x19{\xcb+\xae\xb8\xe2\xab_\xfd\xea\xf2\xe5\
-\xcb\xb3\xba\x95r\xb9\xfc\xc7\x7f\xfc\xc7\xe3\xd6\x80|\xfe\
-\xf3\x9f\xef\xed\xed\x1d=\xb0|\xb7\xd24mjj\x1a\
-{\xa2P\xe6\xa6\x9bn\xea\xee\xee^\xb0`\xc1\xb8[\
-\x8e\xab\xa9\xa9i\xdd\xbau\xb7\xdf~\xfb\xb8S\xcc\x8e\
-<\xf2\xc8\xac\x87\xeb>\xfcd8M\xd3\xf6\xf6\xf6\xa3\
-\x8f>z\xdc\xcd~\xf2\x93\x9f\xc4q\x5c,\x16\xf7\xf2\
-\x88Y\x0f\xe3\x07\x1f|p\xf9\xf2\xe5'\x9f|\xf2\x18\
-[f\xad\x8e+\x95J{{\xfb^\x1et\x0a\xaa\xd5\
-\xeaI'\x9d4\xf6\xba\xf7\xb9\xe7\x9e{\xee\xb9\xe7\x0e\
-n\xb7\x8eB\xa1\xb0q\xe3\xc6[o\xbd\xf5\xea\xab\xaf\
-\x1ec3\x22Z\xb2d\xc9\xe8\xebGD\xa2(\x1aw\
-\x82x6\xf1}\xdc\xd3\xc8\xf2P\xc6^\xd8\xef\x8f\x8c\
-\x06c\xcc\xf0\xf0\xf0\xd8\x93\xb3\xcf?\xff\xfck\xaf\xbd\
-\xf6\xff\xfe\xdf\xff\xdb\xda\xda\xda\xde\xde>\xf1\xd30\xc6\
-x\xef\x1f}\xf4\xd1\xb1K\xdb\x0a\x85BSS\xd3N\
-\xbb\xad\xd5j\x0b\x16,\x18;q&\xf3\x9b\xdf\xfcf\
-\xf5\xea\xd5\x8b\x17/\x9e\xf2\xe3\x13\x86\xe1\xe6\xcd\x9bo\
-\xbe\xf9\xe6e\xcb\x96\x8d\xbde\x7f\x7f\xff\xa4\x92\x16\xb3\
-\x0a\xbbq\xdb\x84\xdfv\xdbm[\xb7ne\xe6\xfb\xef\
-\xbf\x7f\xec-\x8f>\xfa\xe8\x8b.\xba\xe8;\xdf\xf9\xce\
-\x9c9s\xf6\xf9\xf5\xb0e\xcb\x96[n\xb9e\x8ci\
-\x00\xa7\x9dv\xda\xeb_\xff\xfa/|\xe1\x0bMMM\
-\x07\xb1\xbf\xef\xa1r\x9e3\x98\x88\x8c\x9b\xda388\
-\xb8v\xed\xdaq\xdf](\xa5\xd4\xb4\xa2\x01 \xa5\xd4\
-!\xa3\xb3\xb3\xf3\xa7?\xfd\xe9UW]u\xe6\x99g\
-\x8e\xb1YWW\xd7\x1b\xdf\xf8\xc6\x95+W\xa6i\x9a\
-$\xc9\x09'\x9c0n\xf7\xe2_\xfd\xeaWw\xdcq\
-G\xa1P\x18\xf7\x9dt\xb5Z=\xea\xa8\xa3&\xb2\x88\
-Z\xb3f\xcd\xde\xa7\xffdr\xb9\xdc\xbau\xeb~\xfd\
-\xeb_\x8f\x1b\x00Z\xbcxq\x9a\xa6\xfbv\xd5T\xa9\
-TN=\xf5\xd4\xd9\xb3g\x8f\xbd\xd9\x13O<\xb1u\
-\xeb\xd60\x0c\xf7\xc9A\x0b\x85\xc2\xea\xd5\xab\xef\xbc\xf3\
-\xce\xb1\x03@\x00\xe6\xcf\x9f\x7f\x80\x07\xf1\x12\x91\xf7~\
-\xf3\xe6\xcd\xa7\x9cr\xca\x87>\xf4\xa1\xb17^\xb1b\
-E\xb5Z=\xb8\x01\xa00\x0c7m\xda\xf4\xc0\x03\x0f\
-\x8c\x1d\x00\x02\x90\xcdz\xf7\xdegO\x04\xef\xbd\xb5v\
-\xdc\x00\xd0\x04\xd7\x9f\xce\xb9B\xa1P(\x14\xc6\xde\x15\
-3\xef\xdb\x0b8\xcb\x00\xaaT*c\x1f\xfa\xa3\x1f\xfd\
-h.\x97\xfb\xda\xd7\xbe\xb6~\xfd\xfa\x8e\x8e\x8e\x96\x96\
-\x96\x89$\x22e\x8d\x96Z[['\xb2\xe5N\xff\x92\
-$IKK\xcb\x92%K\xc6\xbd\xe1\xe3\x8f?>\x91\
-\xe4\xc4\xb1\xcd\x9f?\xff\x17\xbf\xf8\xc5M7\xdd4\xf6\
-f\xb9\x5cn\xee\xdc\xb9\x13\xacj!\xa2\xde\xde\xdeK\
-/\xbd\xf4\xb8\xe3\x8e\x1bc\xb3\xbe\xbe\xbe\x15+V\xe4\
-\xf3\xf9(\x8a\x1e{\xec\xb1\xd5\xabW\x1fy\xe4\x91c\
-l\x7f\xf6\xd9g\x7f\xeb[\xdf\x1a\xb9\x0e\xf7\xa1\x5c.\
-\xf7\x93\x9f\xfc\xe4\xd2K/\x1d\xe3\x97\xc2\x9f\xfd\xd9\x9f\
-\xddq\xc7\x1d\xcf=\xf7\xdcA\x5c\xd8\x1f*\xe79S\
-%IR(\x14\x16.\x5c8\xf6f\xcf=\xf7\x5c_\
-_\xdf\xb8\x9f\x1b)\xa5\xd4\xb4\xa2\x01 \xa5\xd4!\xa3\
-X,>\xff\xfc\xf3\x9f\xf9\xccg\xbe\xf9\xcdo\x8e\xbd\
-\xa2\xbe\xe6\x9ak~\xf8\xc3\x1f>\xf9\xe4\x93\x03\x03\x03\
-\x7f\xf1\x17\x7f\xd1\xd9\xd99\xc6\xc6\xd5j\xf5+_\xf9\
-J\x7f\x7f\xff\x9c9s\xc6=\x87J\xa5\xb2d\xc9\x92\
-l\x9d<\x86'\x9exb\xe5\xca\x95{\x9f\x0b\x93\xc9\
-Z#o\xd9\xb2\xa5V\xab\x8d\xfd^\xff\xf8\xe3\x8f?\
-\xf6\xd8c{{{\xff\xff\xf6\xee<\xbe\xa92\xef\xff\
-\x7fN\xb6&i\x9at_\xa0\x14\x01\x11+0\x0a\x83\
- \x03\x88\x82 \x88\x02\x22\xa0\xde\xden\x88\x0a\xe32\
-\x08\xf7\xdc.\xb72#\xa8\x8c\xf3@\x86\x9bqdQ\
-@Qp\x19\x10\x11\x10Y,{\xd9w\xd9[\xa0t\
-\xa54]\xd3f\xcf\xf9\xfeq~?\x1e<\x04\xceI\
-\xd3\xa4K\xee\xd7\xf3_\xae\x9cs%M\x0e9\xef|\
-\xae\xcf%_\x96R/N\xa7\xf3\xd6[oU|.\
-\xfb\xf7\xef/,,\x0c\xd5yEQ\x8c\x89\x899\x7f\
-\xfe\xbc\xe2\xc8\xdf\xff\xfe\xf7iiin\xb7;\xb8\xec\
-\xc9\xe7\xf3I\x0b^\x02)\xe3\x97jX\xa4\xbeN\x0f\
-?\xfc\xf0\xf4\xe9\xd3\xe5\xefcU*\xd5\x8a\x15+\xec\
-v\xbbb\xfb\xa4\xb0\x92:I]\xbe|Y\xf1Uj\
-\xd7\xae]JJ\x8a\xdb\xed\x96\xdefj\xb5:**\
-j\xdd\xbau\xf9\xf9\xf97z\x88\xcb\xe5*..\x0e\
-\xe4\x09:\x1c\x8e\xf4\xf4t\xf9\xcf\x8e\xc7\xe3\xa9\xa9\xa9\
-\x09\xed\x92\x8a\xa8\xa8\xa8\xc2\xc2\xc2K\x97.\xc9\xe7\xb6\
-Z\xadv\xea\xd4\xa9\xa3F\x8d\xda\xb8q\xe3\xea\xd5\xab\
-w\xec\xd8a\xb5Z5\x1a\x8dV\xab\x95b\xa9\xd0\xce\
-J\xea\x1e\x95\x9a\x9a\xaa\xf8\x91)..\xde\xb7o_\
-\xc3/&\xd2.{\x81t\x11\x0a\xbc\xa7\x89\xdf\xef\xf7\
-x<\x03\x06\x0c\x90\xef\xb2\xb4{\xf7\xee\xfd\xfb\xf7[\
-\xadV\xadV{\xec\xd8\xb1M\x9b6\xc9\x7fp\xee\xbb\
-\xef\xbe.]\xba\xe4\xe6\xe6\x06\x92\xac\xd5\x8b\xd1h\xac\
-\xac\xac\xfc\xf4\xd3O\x07\x0f\x1e|\xa3kiFF\xc6\
-\x1f\xff\xf8\xc7?\xfe\xf1\x8f\xe1(A\x0aPK\x99\xa7\
-(\x8an\xb7\xdb\xe5r\x85j\x02R\xb7\xf8\x90\x1c\xaa\
-!|>_jjjBB\x82\xfc\xb0S\xa7N5\
-\x87\xd9\x02@\xbd\x10\x00\x01h1\xfc~\x7fZZ\xda\
-\xa6M\x9bV\xadZ\xf5\xf0\xc3\x0f\xcb\x8c4\x1a\x8d\xc3\
-\x86\x0d\xdb\xbd{w\x97.]\xc6\x8c\x19#\x7f\xd8U\
-\xabV\xadZ\xb5J~\x9f\xa3+\xbc^\xaf\xc5bQ\
-\xcc\x1a\x0e\x1e<XXXx\xd3M7\x85\xeak\xb1\
-\xc9d:}\xfa\xf4\xc9\x93'\xef\xb8\xe3\x0e\x99am\
-\xdb\xb6\xbd\xe9\xa6\x9b\x8a\x8a\x8aB\x18\x00y\xbd\xde@\
-~\xe1\xdc\xbbwoUU\x95\xd5j\x0d\xe1S>t\
-\xe8\x90\xe2\xba\xbcN\x9d:%&&\x16\x15\x15\x05\x17\
-\x00\x19\x0c\x06)\x1f\x0c\xe4\xf6\xde\xedv\xf7\xec\xd9\xf3\
-\xf7\xbf\xff\xfd\xef\x7f\xff\xfb^\xbdz)\xae\x94\xd9\xbc\
-y\xf3/\xbf\xfc\x22%\x08A\xcc-\x84\xb4ZmU\
-U\x95\xddn\x97\x7f1322n\xba\xe9\xa6\xe3\xc7\
-\x8fK\xf7\x9cR\xf0\xb1s\xe7\xce\xb5k\xd7\xde\xe8!\
-j\xb5:---\x90N\xa8n\xb7\xbbm\xdb\xb6\xf2\
-/ZUUUnnnh+\x1a\xccf\xf3\x91#\
-G\xf6\xed\xdb\xa7X\xb8\xa7R\xa9\xbat\xe9\xd2\xa5K\
-\x97'\x9f|\xf2\xc4\x89\x13'N\x9c\xd8\xb5k\xd7\x9e\
-={|>\x9f\xc3\xe1\xa8\xac\xac\xd4h4:\x9d\xce\
-h4j4\x9a\x06\xbe\xcf\xa5\xe5u\x8a\xbd\xe4U*\
-UQQ\xd1\x993g\x12\x13\x13\x9ba\xc7_\xbb\xdd\
-\xde\xb1cG\xc5\x0d\x16\xb7l\xd9R[[+=\x05\
-\xa3\xd1x\xe4\xc8\x11\xf9\xf1\xe9\xe9\xe9\xdd\xbau;r\
-\xe4H\xc8\x03 \x95J\x95\x98\x98\xb8~\xfd\xfa\xcf?\
-\xff\xfc\xc5\x17_\xbc\xd1\x98\xb1c\xc7._\xbe|\xfb\
-\xf6\xed\xf1\xf1\xf1M\xf5\xb2\xb7\x88yj4\x9a\xf8\xf8\
-x\x8dF\x13\xaa\xdaO\xaf\xd7\xebp8\xa4\xc2\xba\x90\
-\x1c0\xb89h\xb5Z\xc5\xc2a\x95J\xb5o\xdf>\
-\x1a\x00\x01hq\x08\x80\x00\xb4$j\xb5\xda\xef\xf7/\
-X\xb0`\xd8\xb0a\xf2\xdf8\x1f{\xec\xb1\x993g\
-\x0e\x180\xa0]\xbbv2\xc3\x9cN\xe7\x97_~i\
-0\x18\xb4Z\xad\xe2\x17hA\x10\xdcnw \xd9\xca\
-\xc5\x8b\x17\x0d\x06C\x08\xbf\x91K\x01\xd0\x89\x13'\xe4\
-\x03\xa0\xa8\xa8(\x83\xc1\x10\xc2\x1e\xba\x82 \xb8\x5c.\
-\xc5\xee\xb3n\xb7\xfb\xd2\xa5KQQQ\xa1}\xca\x87\
-\x0e\x1d\xca\xcf\xcf\x97\xcf,\xa2\xa3\xa3\xf5z}\xd0\xe7\
-\x1d5j\x94\xe2\xf6\xd5W\x88\xa2\x18\x1d\x1d\x1d\xe07\
-\xfe\xca\xca\xca\xa9S\xa7:\x1c\x8e\xe6\xb0@@j\x01\
-S\x5c\x5c,?\x19\xb3\xd9l6\x9b\xafn\xd3#\x8a\
-\xa2\xd5jU\xbc\x0f\x97O\x7f\x04A\xa8\xae\xaen\xd5\
-\xaa\xd5\xd3O?-\x7f\x9c\x8b\x17/\x9e?\x7f\xbe!\
-\xdd\x8e\xaf\xa5V\xab\xf5z\xfd\xe6\xcd\x9b\x1f}\xf4\xd1\
-\x00\x1f\x92\x98\x98x\xf7\xddw\xdf}\xf7\xdd\xcf?\xff\
-|uu\xf5\xd1\xa3G\x8f\x1e=\x9a\x95\x95UZZ\
-j\xb7\xdbsss\xeb\xea\xeabbb\x8cFc\xd0\
-+\xb3\xa4\x00(\x90L\xaa\xa8\xa8\xa8\xe1yS8\x08\
-\x82PUU5t\xe8P\xf9klUUUvv\
-vbb\xa2\xf4&\xb1Z\xad\xdb\xb6m\xcb\xcf\xcf\x97\
-__3h\xd0\xa05k\xd6\x04]\xd9'C\xab\xd5\
-\x9aL\xa6\x05\x0b\x16\x8c\x181\xe2F\xb9\xbf\xc1`\x98\
-8q\xe2\xf6\xed\xdb\x9dNgh\xaf\xe4\x81k\x11\xf3\
-LMM\xdd\xb4iS\x08\xcf\xbb\x7f\xff\xfe\x97^z\
-\xa9\xa2\xa2\x22T\x0b\xa8\xebE\xadV\xbb\xdd\xee\x92\x92\
-\x92\x07\x1ex@\xf1rq\xfe\xfc\xf9\x9d;w6d\
-\x97O\x00h\x12\x5c\xb6\x00\xb4$\xd2\x1d\xf8\x81\x03\x07\
-\x16.\x5c8q\xe2D\x99\x91\xed\xdb\xb7\x9f>}\xba\
-b\x07\x99\xef\xbe\xfbn\xeb\xd6\xad)))\x81\xacz\
-\xf0\xf9|z\xbd^\xb1\xaf\xb3\xdf\xef\xaf\xa8\xa8\x08\xc7\
-}\x8b\xe2.\xceF\xa3\xd1l6\x870\x00\xf2z\xbd\
-\xd1\xd1\xd1\xf2\xbb\x80\xabT\xaa\xea\xeaj\xbb\xdd\x1e\x8e\
-bx\xc5\xbd\xcfbcc\xa3\xa2\xa2\x82\xde\x88W\xa7\
-\xd3\x85c\xda\xd5\xd5\xd5\xe3\xc6\x8d;x\xf0`jj\
-js\xb8u\xd7\xeb\xf5\x97.]\xbat\xe9R\xe7\xce\
-\x9de\x86EEE5\xe4\xc5\xbc\x11\xbf\xdf\xefv\xbb\
-\xc7\x8c\x19\xa3\xf8y\xcc\xcd\xcd\x0d\xf9/\xff\xa2(&\
-$$\xfc\xfc\xf3\xcf'O\x9e\x0c\xa4}\xfb\xd54\x1a\
-M\x5c\x5c\x5c\xff\xfe\xfd\xfb\xf7\xef\xff\xca+\xaf\x94\x97\
-\x97\xe7\xe7\xe7o\xd8\xb0!77\xb7\xa0\xa0 ''\
-\xe7\xf4\xe9\xd3F\xa31&&&\xc0\x9eAW\xcfJ\
-\xa3\xd1\x04R\xe1R\x5c\x5c\xdc<o2\xa5]\xcc\x86\
-\x0e\x1d*?l\xcf\x9e=\x87\x0f\x1fNNN\x96>\
-\x08QQQ\x05\x05\x05{\xf6\xec\x91\x0f\x80\x06\x0e\x1c\
-\x98\x96\x96\x96\x9b\x9b\x1b\xf2\x0b\xa9(\x8a\x16\x8b%7\
-7w\xc1\x82\x05S\xa7N\xbd\xd1\xb0A\x83\x06=\xfc\
-\xf0\xc3\xdf~\xfbm K\x83\xc3\xa1E\xccS\xadV\
-\x87j\xa5\xb3\xc4b\xb1\xa8\xc2\xd3\x0c^\x9e\x94fV\
-WWk\xb5\xda\xc7\x1f\x7f|\xda\xb4i\xf2-\xc3T\
-*\xd5\xe7\x9f\x7f^VV\x16\xda\xa7\x0f\x00\x8d\xa09\
-~\xa5\x00\x00\x19j\xb5\xda\xeb\xf5.Y\xb2d\xcc\x98\
-12\xcd}\x04A\x980a\x82|\xab \x9b\xcd6\
-o\xde<\x8b\xc5\x12\xe0\x1d\xaf\xdf\xef\x8f\x89\x89Ql\
-\x87\x5cWWg\xb3\xd9B^\x19\xae\xd3\xe9\x14\xd3\x10\
-\x95J\x15\x13\x13\x13\xc2\x00\xc8\xe3\xf1\xc4\xc7\xc7+\xee\
-\xb1UYY)-\x90\x09\xd5y%\x1a\x8d\xa6\xb4\xb4\
-T~\x8c\xc5b\x09d\xfdQc:z\xf4\xe8\x1bo\
-\xbc\xb1e\xcb\x96\xf4\xf4\xf40\xedf]_:\x9d\xee\
-\xf2\xe5\xcb\x8a\x01\xa2\xc1`\xa8o\x90\xa1H\x10\x04\xbb\
-\xdd\xde\xa9S\xa7\xb7\xdf~[q\xf0\xfa\xf5\xeb\xc3\x91\
-\xc7i\xb5\xda\x8a\x8a\x8a\x05\x0b\x16\xfc\xe3\x1f\xffh\xc8\
-q\xe2\xe3\xe3\xe3\xe3\xe3\xa5\x18\xab\xba\xba\xfa\xec\xd9\xb3\
-\xc7\x8f\x1f\xcf\xcd\xcd\xcd\xce\xce\xde\xbau\xab\xd5j\xd5\
-\xe9tZ\xadV\xa3\xd1(\xc6X\xa2(\xaa\xd5j\xc5\
-\x9bL\x95J\xa5\xb8\x17uS\xa9\xad\xad\xed\xd4\xa9\xd3\
-\xfd\xf7\xdf/?l\xdb\xb6mW\xef\x80&\x95>\xed\
-\xdc\xb9s\xf4\xe8\xd12\x8f\x8a\x8b\x8b\xeb\xd7\xaf_^\
-^\x9e\xfc\xf6m\xc1\x11E\xd1l6\x7f\xf3\xcd7#\
-F\x8c\xb8Q(\xa9\xd5j_}\xf5\xd5-[\xb6\xd8\
-\xed\xf6\xa6\xba\xc9o)\xf3\x0c\xa1\x10v\xf4w\xb9\x5c\
-\x15\x15\x15*\x95*\x90\xfc\xd4\xe5r\x0d\x192\xa4m\
-\xdb\xb6}\xfa\xf4y\xe4\x91G\x14\xc7\x97\x94\x94,_\
-\xbe\xdc\xe7\xf35\xf9\xf2^\x00\xa8/\x02 \x00-\x8f\
-\xc5b9x\xf0\xe0\x9c9s\xa6M\x9b&3L\xf1\
-k\xdf\xd7_\x7f}\xfa\xf4\xe9\xc0\xbf4\xfb|>\x83\
-\xc1\xa0\xb8>\xa5\xb6\xb6\xb6\xac\xac,\xe4?\xdak4\
-\x9a\xaa\xaa\xaa@\x86\x85\xf0\xe7S\x9f\xcf\x17\x1f\x1f\xaf\
-\xd8\xe2W\x0a\x80B~\xeb.\x08Bee\xa5\xfc\x18\
-\xe9~\xbb9T\xd9\xa8T*\x8f\xc73w\xee\xdc\xbf\
-\xff\xfd\xef\x97.]\x92vdk\xea\x19\xfd\x7f\xa4\xa5\
-\x0dn\xb7[~\x98 \x08\x0dYOw\xdd\x03VW\
-WGGG\xcf\x981C\xb1\x8e\xec\xc4\x89\x13\xdb\xb7\
-o\x0fG\x00$\xddH/_\xbe|\xe8\xd0\xa1\x83\x07\
-\x0f\x0e\xc91-\x16\x8b\xd4\x0dJ\xa5R\xd9l\xb6\x93\
-'O\x1e<xp\xc5\x8a\x15\x17.\x5c\xa8\xae\xae\xd6\
-\xe9t\x8akE5\x1aM \x17\x9f\x9a\x9a\x9afx\
-\x93)\x05X\xdd\xbau\x93_TXUU\xb5~\xfd\
-\xfa\xdf\x5c\x0c\xb5ZmVVVaaa\xeb\xd6\xad\
-e\x1e;t\xe8\xd0\xe5\xcb\x97\x87#\x00R\xa9Tz\
-\xbd\xfe\xe2\xc5\x8b\xd3\xa7O_\xbe|\xf9\x8d\xc6\xdcq\
-\xc7\x1d\xcf>\xfb\xec\xacY\xb3\xc24\x87@\xb4\x94y\
-6C#G\x8e\xbc\xf3\xce;U\x81mS\xe8\xf3\xf9\
-n\xbe\xf9\xe6\xc0\xbf\x0cL\x9f>=///))\
-\xa9AS\x04\x80\xa6@\x00\x04\xa0\xe5\xd1h4&\x93\
-i\xe5\xca\x95\xcf<\xf3L M4\xae\xeb\xc2\x85\x0b\
-\x9f}\xf6Y\xbd6\xf7\x91Vm(v\xa8\xf5x<\
-v\xbb=\xe4\xe50j\xb5\xda\xe9t*v\xc7\x0c\xed\
-.\xda\xa2(\xea\xf5z\xc5U\x18\x0e\x87\xc3\xe1p\x84\
-\xfc\xdeC\x10\x04\x87\xc3\x11\xc8\xb0\xd0\x9e\xb7!\xd2\xd2\
-\xd2\xda\xb7oo\xb7\xdb\xab\xab\xab\x03/.\x0b7\xe9\
-\xad\x1b\xc8\xaf\xeb\xa1\x9dpiiitt\xf4\xacY\
-\xb3\x06\x0e\x1c\xa88\xf8\xfb\xef\xbf\xb7\xdb\xed!\xec_\
-~5\xadV[]]=i\xd2\xa4E\x8b\x16\xddu\
-\xd7]\xa1=xBBB\xdf\xbe}\xfb\xf6\xed\xfb\xfc\
-\xf3\xcfo\xdd\xbau\xc9\x92%[\xb6l\xb1\xd9l\xf2\
-\x9d\x9b\xd5ju \xbb\xa7\xd5\xd6\xd66\xabw\xb8\xc4\
-\xe7\xf3EEE\x0d\x1b6L~\xd8\xaf\xbf\xfez\xf9\
-\xf2\xe5\xdf\x5c\x194\x1aMyy\xf9\xa1C\x87\xe4\x03\
-\xa0^\xbdz\xb5j\xd5\xaa\xa0\xa0 L+\xe0bb\
-b\xb6m\xdb\xb6~\xfdz\x99\x22\xa6\xf1\xe3\xc7\xaf\x5c\
-\xb9\xb2\xb8\xb8\xf8\xea\x22\xa6F\xd6R\xe6\xd9\xdc$$\
-$(n\xe3\x15\x9c\x05\x0b\x16,]\xba\xd4j\xb5\x86\
-\xf6\x7f[\x00h\x1c\xfcP\x00\xa0\xe5\x91\x9az\x9c9\
-s\xe6\xe3\x8f?\x0e\xfa _|\xf1\xc5\xe9\xd3\xa7\x03\
-Y\x82\xf1\x9bS7\x93[\xfa\x1b\x89\x8e\x8e\x0e\xed\x0c\
-\xfd~\x7f3\x7f\xca\xe1h[\x13\x1c\x9dN7f\xcc\
-\x98\x0d\x1b6\xcc\x9e=\xdbb\xb1\x84c%`\xd04\
-\x1aM]]]c\x9e\xb1\xb2\xb2\xb2u\xeb\xd6\x8b\x16\
--\x1a5j\x94\xe2\xe0\xb3g\xcf~\xf5\xd5WR]\
-I\x98\xe6c\xb5Z\x0b\x0b\x0b\x9f}\xf6\xd9m\xdb\xb6\
-\x85\xe9\x14F\xa3q\xc8\x90!\xcb\x96-[\xbcx\xf1\
-\x9dw\xdey\xf1\xe2E\x95l@\xd9r\xeb5|>\
-_FFF\xef\xde\xbd\xe5\x87\xad]\xbb\xb6\xae\xae\xee\
-7\x9f\x02\xe9\xad\xb8f\xcd\x1a\xf9\xc7Z\xad\xd6\x91#\
-G\xba\x5c\xae0\xe5_&\x93\xa9\xae\xae\xeeo\x7f\xfb\
-[uu\xf5\x8d\xc6\xa4\xa5\xa5\xfd\xe9O\x7f\x0a\xe16\
-\xe7Ah)\xf3\xfc?b\xc1\x82\x05\xef\xbd\xf7\x9e\xd9\
-ln\xaa\xee\xe0\x00\xd0@-\xf5\x9b\x07\x80\xff\xe3\xfc\
-~\x7fjj\xea\xca\x95+w\xee\xdc\x19\xc4\xc3sr\
-r\xbe\xfb\xee;\x93\xc9\xd4|\xee\xcf\x111\x0c\x06\xc3\
-3\xcf<\xf3\xcd7\xdf\xa4\xa7\xa7_\xbat\xa9\x99\x94\
-o\xf8|\xbe@\xe2\xce\x90\xcc\xd6\xef\xf7\x97\x97\x97\xff\
-\xeew\xbf[\xb1bE\x80\x9b\xac\xbd\xff\xfe\xfb\x17/\
-^\x0c\xa4\x22&h\xa2(&''\x97\x96\x96>\xfd\
-\xf4\xd3s\xe6\xcc\x09dAe\xd0\xee\xbf\xff\xfeo\xbf\
-\xfdv\xfc\xf8\xf1v\xbb]&\xc2h\xb97\x90.\x97\
-\xeb\xc1\x07\x1f\x94_\xffUSS\xf3\xcb/\xbf\xb8\x5c\
-\xae\xdf\xe4\x5c\x82 \xf8\xfd\xfe\x83\x07\x0f*6\xa5\xea\
-\xdb\xb7\xafV\xab\x0dS\xbc+\xbd\x1f\xb2\xb3\xb3\xbf\xfa\
-\xea+\x99a\xa3G\x8f\xee\xd9\xb3geeeS}\
-\x90[\xca<#^NN\xce\xc4\x89\x13_\x7f\xfdu\
-\xbf\xdf\x1f\xda-/\x01\xa01\x11\x00\x01h\xa9t:\
-]ee\xe5\x9c9s\x82x\xec\x9c9s\xf2\xf2\xf2\
-bcc\xeb\xfb\x1dN\x10\x84f\xfe\xa3}]]]\
-hg\xa8V\xab\x9b\xf9Sv\xbb\xdd\xcdp\x86=z\
-\xf4X\xbatiFF\x86b\x1b\xa3\xc6\xe1\xf7\xfb\x0d\
-\x06\x83\xfc\x18\x9f\xcf\xd7\xf0\xf7\x8f\xd4\x04}\xe4\xc8\x91\
-+V\xac\x90\xdft\xec\x8a9s\xe6,_\xbe<1\
-11\xdc\xf7\xae>\x9f/..\xae\xae\xae\xee\xed\xb7\
-\xdf\x1e9r\xe4\xbcy\xf3\x8a\x8b\x8b\xc3t\xae\x84\x84\
-\x84\xb9s\xe7N\x9c8\xb1\xb6\xb6V\xb1\xfb\x92\x8c\xe6\
-y\x9f\xe9\xf3\xf9\x06\x0d\x1a$?\xe6\xc0\x81\x036\x9b\
-\xed\xbak\xfa\x8cF\xe3\xa5K\x97v\xed\xda%\x7f\x84\
-^\xbdz\xf5\xe9\xd3G\xa6\xf2\xa5\x81\x04A\x88\x8b\x8b\
-\xfb\xf8\xe3\x8f\xa5Z\xad\xeb\x8a\x8e\x8e\xfe\xf3\x9f\xff,\
--Gm\xaal\xa5\xa5\xcc3R\x15\x14\x14L\x9d:\
-\xf5\xee\xbb\xef^\xbcx\xb1\xd9l&\xfd\x01\xd0\xa25\
-\xbbo\xcc\x00\x10 \xbf\xdfo\xb1Xv\xec\xd8\xf1\xc3\
-\x0f?\xd4\xeb\x81'N\x9cX\xb9r\xa5\xe2\xceV\xd7\
-\x92~\xb8Vl\xa4\xa2\xd3\xe9B\xbb\x17\xbbD\xba\x81\
-W\xfcf\xef\xf1xB\x98\x86\x08\x82\xe0\xf5z\x15\x9b\
-\x19\x1b\x8dF\xa3\xd1\x18\xf2\x1f\xeaEQ4\x1a\x8d\x8a\
-\xc3B\xfeR\x87\xca\xef~\xf7\xbb\x7f\xfc\xe3\x1f\xd1\xd1\
-\xd1M\xde\x0d\xda\xeb\xf5Z,\x16\xc5\x16\xa7\x1e\x8f\xc7\
-\xe9t\x06\xfd\xfe\x11\x04\xa1\xbc\xbc\xdc\xe7\xf3\xbd\xf3\xce\
-;\x8b\x17/\x0e\xb0\x01GVV\xd6\xcc\x993\xcdf\
-sh\xfbO\xdf\x88\xdf\xef7\x9b\xcdV\xab\xf5\xe8\xd1\
-\xa3\xef\xbf\xff~\xbf~\xfd\xdez\xeb\xad\xed\xdb\xb7_\
-\xbat)\x1c\xa7\xfb\xeb_\xff:r\xe4\xc8\xaa\xaa\xaa\
-k\x9f\x9a(\x8a\x81\xb4\xb8jn\xe1\xa6\xd4\xd8\xbbw\
-\xef\xde]\xbat\x91\x1f\xb9z\xf5\xea\x8b\x17/^\xf7\
-#l0\x18\x8a\x8b\x8b7n\xdc(\x7f\x04\xbd^\x1f\
-\xd6\xaa\x16Q\x14\xa3\xa3\xa3\x8b\x8a\x8a>\xfd\xf4S\x99\
-a\x03\x07\x0e|\xe0\x81\x07\xae\xfbGl\x1c-e\x9e\
-\x0d\x97\x92\x92\x22\x08Bs\x9b\x7frrrff\xe6\
--\xb7\xdc\xa2j\xc6\xff\xdd\x00@\x80h\x02\x0d\xa0\x05\
-\x936\xc6Z\xb0`\xc1\xb0a\xc3\x02\xdc<\xc8\xef\xf7\
-\x7f\xf4\xd1GN\xa7\xd3b\xb1\xd4\xf7[\xa6\xd4G\xb6\
-\xa8\xa8H~Xtttbb\xe2\xf1\xe3\xc7\xebu\
-pE>\x9f\xcfj\xb5*\x0e\xf3x<!\xbcY\x92\
-\xb6\x0f\xbf|\xf9\xb2\xfc\xb0\xd8\xd8\xd8\xd8\xd8\xd8\xf2\xf2\
-\xf2@\xf2\x9a\xc0\x89\xa2\xa8\xb8\xe7\x9a\xdb\xed\xf6z\xbd\
-A?\xe5\x9c\x9c\x9c}\xfb\xf6\xa9\x02[\xfa\xe4\xf7\xfb\
-\xf5z}\xef\xde\xbd\x93\x93\x93\x03|\xbf\x0d\x1a4h\
-\xf8\xf0\xe1_\x7f\xfdu\x10\xe5f!\xe4\xf5z\xa5-\
-\xcc\xe5\x87I\xcd\xbc\x83X\x17)\xbdz\xc5\xc5\xc5\xb7\
-\xdez\xeb{\xef\xbd\x17\xe0\xb2/\x95J\xb5}\xfb\xf6\
-I\x93&y<\x9e\x90\xf7\xae\x92!\x8a\xa2N\xa7\xb3\
-Z\xad>\x9f\xcf\xe9t~\xfa\xe9\xa7s\xe6\xcc\xe9\xd6\
-\xad\xdb\xbd\xf7\xde\xdb\xa9S\xa7\xdbo\xbf\xfd\xe6\x9bo\
-V\xac\x96\x0a\x90 \x08\xd3\xa7O?u\xea\xd4\xc5\x8b\
-\x17\x7f\xd3?\xde\xe7\xf3\xd5\xd4\xd4(\x1e!\x88+U\
-X\x89\xa2XSSs\xdf}\xf7\xc9\xb7\xebv:\x9d\
-g\xcf\x9e\x95i\x99o0\x18N\x9f>]SS#\
-\xbf\xeeo\xf0\xe0\xc1\x0b\x16,\xa8\xab\xab\x0b\xed\xb5\xe5\
-\x0aQ\x14cbb>\xff\xfc\xf3\x11#F\xf4\xe8\xd1\
-\xe3F\xc3\xdez\xeb\xad\x9d;wVWW7U\x1e\
-\xd7<\xe7Y[[\xbbn\xdd\xba\x10\xd6`\x9e?\x7f\
-\xde\xeb\xf5\x86c+\xc0\x86\xd0\xeb\xf5\x8f?\xfe\xf8\xd8\
-\xb1c\xff\xe7\x7f\xfeg\xfe\xfc\xf9Z\xadV\xa7\xd35\
-\xabO%\x00\x04\x8e\x00\x08@\xcb&\x15\x01\xcd\x9b7\
-\xef\x95W^\x09d\xfc\xf6\xed\xdb\xd7\xacYc4\x1a\
-\x83\xf8\xf6\xa6V\xab\xedv{ii\xa9\xfc0\x93\xc9\
-\x94\x90\x90\x10\xf2\xdf\x09=\x1eObb\xa2\xfc\x18\xbf\
-\xdf\x1f\xda\x0d\xc8\xa4\x00\xa8\xa2\xa2B~\x98\x14\x00\x85\
-\xfc)\xfb|\xbe\xe4\xe4d\xf91\x15\x15\x15\x0d)Z\
-\xd9\xb8q\xe3\x1f\xff\xf8GU`u\x16~\xbf_\xa7\
-\xd3\xf5\xee\xdd;66\xf6\xce;\xef|\xea\xa9\xa72\
-22\x14\x1f\xf5\xe2\x8b/\xae]\xbb\xd6\xeb\xf56a\
-\xc3)\xa7\xd3y\xcb-\xb7(\xce\xd6\xe9t\x06\xf7b\
-:\x9dN\xbb\xdd>|\xf8\xf0\x0f>\xf8 \xf0\x8d\xf9\
-\xb6n\xdd\xfa\xc2\x0b/\x94\x95\x955U:\xa6\xd1h\
-4\x1a\x8d^\xaf\xb7X,999\x07\x0e\x1cp\xbb\
-\xdd\x9d;w\xee\xd0\xa1CFFF\xa7N\x9d\xbau\
-\xebv\xf3\xcd7+~\xee\xe4\xa5\xa7\xa7\x8f\x1f?~\
-\xf2\xe4\xc9Ww\x8d\x95\xca\x09kkk\x15\x1f\x1e\x13\
-\x13\xd3\xacn5kkk;v\xec8d\xc8\x10\xf9\
-a\xdb\xb6m\xcb\xce\xce\x96)\xb4\xb4Z\xad\xfb\xf7\xef\
-\xdf\xbd{\xb7\xfcR\xb2n\xdd\xba\xf5\xea\xd5\xeb\xfb\xef\
-\xbf\x0f\xdf\xfeVR\xb2?c\xc6\x8co\xbf\xfd\xf6F\
-;\x8eeff>\xf1\xc4\x13\x9f|\xf2I\x13\xfe-\
-\x9a\xe1</_\xbe<n\xdc\xb8\x9a\x9a\x9aP\x05@\
-\x06\x83!99\xb9y\xae\xb1\xd2h4\x7f\xfb\xdb\xdf\
-\xd2\xd2\xd2>\xf8\xe0\x83\xe6\xbf2\x1a\x00n\x84\x00\x08\
-@\xcb\xa6\xd7\xeb}>\xdf\xd2\xa5K\xc7\x8e\x1d\x9b\x92\
-\x92\xa28~\xce\x9c9n\xb7\xbb\xbe\x9b\x7fI\xa4\xd2\
-t\xc54D\xadV\xc7\xc5\xc55\xa4\xeb\xc7uIE\
-\x1c\xf2c\x5c.Wmmm\x08\x83\x06\xb5Z\xed\xf5\
-z\x15{\xb5J\xcb\x8b\x02\xd9e\xbc\xbe\x14\xef\xbdk\
-jj\x1a\xf2\xfbsLL\x8c\x14\x8b\x04\xf2\xa2I7\
-\xed\xc7\x8e\x1ds\xb9\x5c\xeb\xd7\xaf_\xb9r\xe5\xbb\xef\
-\xbe\xfb\xe0\x83\x0f\xca?\xaak\xd7\xae\xf7\xdcs\xcf\xca\
-\x95+\x15\xff|\xe1\xe3\xf1x\xacV\xab\xe2\xb2\xc7\xe2\
-\xe2\xe2\xc2\xc2B\x99\xaa\x8dk\x89\xa2(\xedw\xfe_\
-\xff\xf5_/\xbf\xfcr\xe0?\xdd/[\xb6\xec\xcd7\
-\xdf\xac\xae\xae\x8e\x8b\x8bk\xf2\x9b=i\xb1\xa1Tc\
-RRRr\xee\xdc\xb9\xba\xba:\xab\xd5\x9a\x96\x96\x16\
-\x1f\x1f\x1f\x1d\x1d=d\xc8\x90\xcc\xcc\xcc\xcc\xcc\xcc\x94\
-\x94\x94z\xbd>\x92\x87\x1ezh\xfe\xfc\xf9\x05\x05\x05\
-W\x0a\x8b\x04A\x08\xb0\x02(!!\xa1\xc9_\x9f+\
-\x04A\xa8\xaa\xaa\x1a0`\xc0m\xb7\xdd&3\xcc\xef\
-\xf7\xaf\x5c\xb9\xd2f\xb3y\xbd\xde\x1b\x15v\xa9\xd5\xea\
-\xaa\xaa\xaa\xef\xbf\xff~\xe0\xc0\x81\xf2\x9f\xdf\xde\xbd{\
-\xff\xf4\xd3O\xe1\x8bP\x05A0\x18\x0c\x9b6mZ\
-\xbe|\xf9c\x8f=v\xa3a/\xbf\xfc\xf2\xc6\x8d\x1b\
-\x8f\x1f?\xde\x84\x9d\x80\x9a\xdb<\xb5Z\xad\xd4\xe6L\
-\xaf\xd7\x87\xf0\xb0\xcd\xe7\x0d\x7f\xad?\xfd\xe9Oyy\
-y\xf3\xe7\xcf\x0f\xe4\xfb\x06\x004C\x04@\x00Z6\
-\xbf\xdf\x9f\x92\x92r\xe4\xc8\x91E\x8b\x16\xbd\xf9\xe6\x9b\
-\xf2\x83\xd7\xacY\x93\x9d\x9d\xdd\x90\xc5\x1dz\xbd\xbe\xb2\
-\xb2\xd2\xef\xf7\xcb\xdf\xb1ddd8\x9d\xce\x10\xf62\
-\xa8\xab\xab\xeb\xd4\xa9\x93\xfcM\x974\xcc\xe1p\x84\xf0\
-\x97IQ\x14\xa3\xa2\xa2\x14\x97\x80\xe9\xf5\xfa\x94\x94\x14\
-i\xb7\xa3\x10>\xe5n\xdd\xba\xb5i\xd3F~\x98\xdd\
-no\xb4&\xd0\xa2(\x0a\x82\x10\x1b\x1b+\xdd\xbd\x9f\
-<yr\xca\x94)\xa9\xa9\xa92+2$={\xf6\
-\x5c\xb2dIS\xdd\xc9\x0b\x82\xe0t:\xd3\xd2\xd2\x14\
-\x17\xd1\x9c={677\xb7m\xdb\xb6\x01\x1e\xd6\xe7\
-\xf3]\xbe|\xb9s\xe7\xce\xd3\xa6MS,\x09\xb9\xc2\
-\xeb\xf5~\xf8\xe1\x87\xb3g\xcf\x96\xa2\xd2\x00\x1f\xd5h\
-\xa2\xa3\xa3\xa3\xa3\xa3\x05A\xf0x<6\x9b\xad\xa4\xa4\
-\xc4\xedv\x1f;vL\xea\xc0u\xf3\xcd7\x0f\x1c8\
-\xf0\xb6\xdbn\xeb\xda\xb5k \xf5_\x92\xe4\xe4\xe4\xfe\
-\xfd\xfb\x7f\xf2\xc9'W\xd7\x1ez\xbd\xde\x92\x92\x12\xc5\
-\xc7\xa6\xa6\xa6:\x1c\x8ef\xb2\x10\xcc\xeb\xf5\x1a\x0c\x86\
->}\xfa\xc8\x0fs\xbb\xdd\x16\x8be\xe0\xc0\x81\xf2Q\
-{mm\xad\xc5bq\xbb\xdd\xf2\xd7\xe4!C\x86\xcc\
-\x9d;\xf7\xf2\xe5\xcb\xe1\xdb$\xce`0\xd8\xed\xf6\x7f\
-\xfe\xf3\x9f\x83\x07\x0f\xbeQP\x9b\x92\x922n\xdc\xb8\
-\x97_~9Ls\x08DK\x99gs`\xb3\xd9\x0a\
-\x0b\x0bUJ\xcb{\xbd^oLL\xccM7\xddt\
-\xa3\xa2\xaakM\x9a4i\xe3\xc6\x8d\x85\x85\x85\xcd!\
-\xbc\x06\x80\xfa\x22\x00\x02\x10\x09\xf4z}nn\xaet\
-\x7f.3l\xf3\xe6\xcd%%%\xed\xdb\xb7\x0f\xfaK\
-\x9bV\xab\xad\xac\xact8\x1c\xf276\xdd\xbbwo\
-\xdd\xba\xb5\xd3\xe9\x0c\xa2X\xe0\xba\xea\xea\xea\xee\xba\xeb\
-\xae\xcc\xccL\xf9a\xe7\xcf\x9f\xcf\xc9\xc9\x09m\xb3\x0c\
-\xadV\xab\x18\x00\xa9T\xaa\x9e={\xfe\xfb\xdf\xff\xf6\
-x<\x81\x7f\x8d\x96'\x05@\x8aU3\xc7\x8f\x1f\xbf\
-t\xe9R#\xf7\x8c\x10EQ\xadV\xa7\xa5\xa5\xe5\xe4\
-\xe4\xcc\x9c9\xf3\xcb/\xbf\x94\x9f@\xf7\xee\xdd\xd3\xd3\
-\xd3\x1d\x0eG\xa8:\xcb\xd4\x8bT\xfe\xd3\xabW/\xc5\
-\x91999\x01\xfe\x92/\x08\x82\xdb\xed\xae\xa9\xa9\x19\
-1b\xc4\x87\x1f~\xa8\x98\xd3]QZZ\xfa\xc6\x1b\
-o|\xff\xfd\xf7111\xcd\xad\xd3\xc7\xd5DQ\xd4\
-j\xb5W\xde\xcc>\x9f\xcf\xe3\xf1\xf8\xfd\xfe\xa3G\x8f\
-\x1e<x\xb0\xaa\xaa\xea\xd6[o\x1d3f\xcc\x80\x01\
-\x03\xfe\xf0\x87?\x04r\xc0.]\xbax<\x9e+W\
-\x1e\x8dFSSS\x13H\xa7\xb0\xf6\xed\xdb\xc7\xc7\xc7\
-7\xed\x12\xc2+\xecv{\x87\x0e\x1d\x1ey\xe4\x11\xf9\
-a\x06\x83\xe1\xc3\x0f?\x0c\xd5I;v\xec\xd8\xb5k\
-\xd7\x8d\x1b7*^\xe1\x83&\x8ab\x5c\x5c\xdc\xa1C\
-\x87\xbe\xf9\xe6\x1biM\xe8u=\xf5\xd4S\x8b\x17/\
-.++k\xc2N@-b\x9e\xcd\xc1\x0f?\xfc\xf0\
-\xdak\xaf\xa9T*\xf9\xff\x92\x1c\x0eG\xeb\xd6\xad\xef\
-\xbe\xfb\xee6m\xda\x0c\x1a4\xa8o\xdf\xbe\x8aG\xce\
-\xc8\xc8\x189r\xe4\xacY\xb3|>\xdf\xff\xe5W\x18\
-@\x0b\xc5e\x0b@$\x10\x04!\x90\x9b\xc9\xa8\xa8(\
-\xb5Z\xdd\x90\x9f\xec\xa2\xa2\xa2\x8a\x8a\x8a\x14\x7f\xb7\xcf\
-\xcc\xcc\xbc\xed\xb6\xdb\xecv{\xd0'\xba\x9a \x08u\
-uu\x81\xac=\x91z\xcd\x866\x00\xd2\xeb\xf5\x17.\
-\x5cPlV\xd2\xa3G\x0f)\xf3\x0a\xc9I\x05A\xa8\
-\xa9\xa9i\xd7\xae\x9d\xe2\xc8#G\x8e\xd8l\xb6\xd0.\
-@\x08\x90\xd4\xa3\xba\xa0\xa0@q\x03\xa9\x8e\x1d;f\
-ff\xd6\xd5\xd55\xce\xc4~\xc3\xe9t\xb6j\xd5J\
-\xb1LI\xa5R\x15\x17\x17\x07\xf8J:\x1c\x0e\xbb\xdd\
-\xfe\xc2\x0b/,Y\xb2$\xf0\xf4g\xdd\xbauC\x86\
-\x0cY\xb1b\x85\xd5jm\xce\xe9\xcf\xb54\x1a\x8dV\
-\xab\xd5\xeb\xf5\x06\x83\xc1l6gdd\xd8l\xb6w\
-\xdf}w\xf4\xe8\xd1/\xbc\xf0B~~\xbe\xe2\x11\xba\
-t\xe9\x92\x91\x91q\xf5\xb6_~\xbf\xff\xdc\xb9s\x8a\
-\x0b'o\xbe\xf9\xe6\xbb\xef\xbe;\x90\xc5b\xf2\xa4B\
-\xb0J%\xf2\xf5t~\xbf\xff\xb6\xdbnKKKk\
-\xe0d\xeak\xe4\xc8\x91\xe1n\x13\xae\xd1h\xe2\xe3\xe3\
-g\xcf\x9e}\xf6\xec\xd9\x1b\x8d1\x18\x0cS\xa6L\x89\
-\x8e\x8e\x0ed\xfb\xb60i)\xf3lrQQQq\
-qqqqq\xb1\xb2Z\xb7n\xedv\xbbW\xae\x5c\
-\xf9\xfe\xfb\xef?\xf0\xc0\x03\xb3f\xcd\x0a\xe4\xe0\xc3\x86\
-\x0dk\xd3\xa6\x8d\xcb\xe5\x0a\xf7\xb3\x00\x80\x90\xa3\x02\x08\
-\x00\xea\xc1l6\x1f9rd\xef\xde\xbd\x1d:t\x90\
-\x19\x16\x1b\x1b\xdb\xbe}\xfb\xac\xac\xac\x90\x9c\xd4\xe9t\
-&$$\x0c\x1c8Pqd~~\xbeZ\xad\x0e\xed\
-6\xba111;v\xec8{\xf6\xec\x1dw\xdc!\
-3,333)))///$'\xad\xad\xad\
-\xed\xd0\xa1C\xbf~\xfd\x14G\x96\x94\x944aeD\
-TTTaaa~~~zz\xba\xcc0\xa9c\
-hS-\x16p\xb9\x5c\xadZ\xb5R,\x1f\xab\xa8\xa8\
-8u\xea\x94b\x8d\x92\xd4\x0a]\xa5R\xfd\xe5/\x7f\
-\x994iR\x80s\xf0x<s\xe6\xcc\x999sf\
-UUUjjj\xa3\xed\xf4\xacV\xab=\x1e\x8f|\
-\xdf.\xadVk\xb5Z\xebUZ\xe2\xf3\xf9\xf4z}\
-FF\x86\xddn\xff\xf4\xd3O\xf3\xf2\xf2\x16.\x5c(\
-\xff\x1eh\xdd\xbauFF\xc6\xe1\xc3\x87\xaf\xe4\xb3Z\
-\xad\xb6\xb6\xb6\xb6\xb0\xb0\xf0\xa6\x9bn\x92y\xa0N\xa7\
-\xeb\xd8\xb1cmmm\x03\xd7\x9b\x94\x94\x94<\xf6\xd8\
-c\xf2\x7f2\xb5Z=w\xee\xdc\xaf\xbe\xfa\xea\xba\x95\
-w>\x9f\xcfd2=\xf4\xd0CA\xcf!h\xfd\xfa\
-\xf5\xb3Z\xad\x95\x95\x95\xe1\xfb\xb0\x8b\xa2h0\x18\x8a\
-\x8a\x8a\xe6\xce\x9d+\x93\x02\x8c\x1e=\xfa\xfc\xf9\xf36\
-\x9b\xad\xa9Z\xc0\xb4\x94y\xb6\x14~\xbf_\xab\xd5\xc6\
-\xc5\xc5%$$TUUM\x992\xa5M\x9b6c\
-\xc6\x8c\x91\x7fT\xc7\x8e\x1d\x13\x13\x13/_\xbe\x1c\xa6\
-\xcd\xe9\x00 |\x08\x80\x00\xa0\x1e\xa4\xdf\xc6srr\
-\x14G\x8e\x1c9\xf2\xc7\x1f\x7ft8\x1c\x0d\xff\x82X\
-WW\xd7\xb1c\xc7\x01\x03\x06\xc8\x0f\x13E\xf1\xec\xd9\
-\xb3!\xdf+G\xadV\xbb\xdd\xee\x9c\x9c\x1c\xf9\x00H\
-\xab\xd5\x0e\x1f>\xfc\xe8\xd1\xa3>\x9f\xaf\x817i\x82\
- TTT\xf4\xef\xdf\xffw\xbf\xfb\x9d\xfcH\x9b\xcd\
-VPP\xd0\x84_\xc1\xd5j\xb5\xb4u\xba\xfc0\xbf\
-\xdf\xef\xf7\xfb\x9b\xa4w\xac\xcf\xe7\xd3\xe9t\xe3\xc6\x8d\
-S\x5c\x9a\xb7\x7f\xff\xfe\x83\x07\x0f\xc6\xc6\xc6\xca\x8c\x91\
-\xd2\x1f\xbf\xdf?m\xda\xb4\x09\x13&\x048\x87\x13'\
-NL\x9f>}\xe3\xc6\x8dZ\xad\xb6U\xabV~\xbf\
-\xbf\xd1\xb20\xb7\xdbm6\x9b\xe5\xdf\xbav\xbb\xfd\xc2\
-\x85\x0bA\xfc\x81DQ4\x9b\xcdF\xa3q\xc3\x86\x0d\
-\xcb\x96-\xfb\xef\xff\xfeo\x99\xc1QQQQQQ\
-W\xd7\xb0\xe8\xf5\xfa\xcb\x97/\x9f9sF>\x00R\
-\xa9T={\xf6\x94z\xe5\x04]6\xe5t:\xe3\xe3\
-\xe3\xc7\x8e\x1d\xdb\xb5kW\xf9\x91Z\xad\xf6F\x856\
-^\xaf7))\xe9\xde{\xef\x0dn\x0e\x0d\x91\x9e\x9e\
-~\xcf=\xf7,_\xbe<\xac\xb5~~\xbf?>>\
-~\xc5\x8a\x15\x0f>\xf8\xa0\xcc\xf5v\xd4\xa8Q\x16\x8b\
-%|\xd3P\xd4R\xe6\xd9\xb2\xf8\xfd~\xab\xd5j\xb7\
-\xdb\xd7\xad[7z\xf4h\xf9\xabABB\x82\xd1h\
-\x0c\xc7\xbe\x07\x00\x10n\x04@\x00P\x0f\xa2(Z,\
-\x96\xa3G\x8f\xba\xddn\xf9[\x91\xfe\xfd\xfbw\xee\xdc\
-y\xcf\x9e=\x0d\x8c'\xa4\x9b\xb1\x81\x03\x07*\xee\x87\
-u\xfa\xf4\xe9\xcd\x9b7\x87\xfc\x1b\xbf\xd4\x07\xfa\xc0\x81\
-\x03\xa3G\x8f\x96\x1f9j\xd4\xa8\x05\x0b\x164\xfcW\
-z\x97\xcb\x15\x1d\x1d=l\xd80\xc5\x1b\xf2\x9d;w\
-\x1e8p@>\xb3\x08+\xbf\xdf\x7fe\xf7\xa8fH\
-Z\xf5\xd3\xbd{w\xc5\xad\xcaT*\xd5\xd1\xa3G\xe5\
-\xfbY\x08\x82P[[\xebt:?\xfa\xe8\xa3\xe7\x9e\
-{.\xc09\xacY\xb3f\xf2\xe4\xc9EEE\x89\x89\
-\x89j\xb5:\xac\xabx\xaeUUU\xd5\xb5k\xd7U\
-\xabV\xc9\x8c)))\xe9\xd3\xa7\x8f\xd7\xeb\x0d\x22^\
-\x91\xbaA\xc5\xc6\xc6\x1e<x\xd0\xe5r\xc9,\xd2\x14\
-E\xf17\xb1WTTTII\xc9/\xbf\xfc2x\
-\xf0`\xf9\xb3\xf4\xef\xdf\xbfG\x8f\x1eYYY\xe9\xe9\
-\xe9\xc1eguuu\x1d:t\xb8\xf3\xce;\xe5\x87\
-\xe5\xe5\xe5m\xd8\xb0\xc1j\xb5^\xf7_\xbd^\xef}\
-\xf7\xdd\x97\x94\x94\x14\xc4\x04\x1a\xee\x9e{\xeeY\xb4h\
-\x91\xd9l\x0e\xeb[H\xea\xf2\xf6\xaf\x7f\xfd\xabO\x9f\
->7\xfak\xca\x97\x7f6\x8e\x962\xcf\x96\xc5\xef\xf7\
-'&&\xee\xda\xb5+//O1\x96MII\xa1\
-\x01\x10\x80\x96\x88+\x17\x00\xd4OLL\xcc\xf6\xed\xdb\
-\x8f\x1d;&?,**\xea\xa5\x97^\x8a\x8a\x8a\xf2\
-z\xbdA\x9fK\xba\x81\xbf\xe5\x96[&N\x9c\xa88\
-x\xf7\xee\xdd\x15\x15\x15\xa1\xea\xc1|5\xadV\xbba\
-\xc3\x06\x9b\xcd&?,==}\xdc\xb8q\x95\x95\x95\
-\x0d,u\xa9\xad\xad\xbd\xf7\xde{\xc7\x8e\x1d\xab82\
-;;\xdb\xe5r\x85\xe3)\x07\xc8\xe1p\xa4\xa7\xa7+\
-n\x9b%-\x01k\x9c)]!\x08\x82\xd7\xeb\xf5\xf9\
-|S\xa6L1\x99L\xf2\x83kkk\xd7\xacY#\
-\xdfd\xca\xe5r\xb9\xdd\xee\xa9S\xa7\x06\x98\xfeTT\
-T\xbc\xf5\xd6[\xe3\xc7\x8f\xaf\xac\xacLKKk\x92\
-\x9b%i3/\xf9\xd0$..\xaec\xc7\x8e>\x9f\
-/\xe8\xb3\xe8\xf5z\x9b\xcd&\xdf\xf3K\x10\x84\xdf|\
-.\x04A\xd0j\xb5'N\x9cP\xac#0\x99LO\
-=\xf5\x94\xc5b\x09\xae\xe7\x88\xd4\xd0\xfa\xc1\x07\x1fT\
-l\xa9~\xf2\xe4\xc9\x8b\x17/^7\xda\x96:\x91\x05\
-\xbe\xd7[\xc8\xf5\xef\xdf\xbfK\x97.\x8d\xd0H\xcbd\
-2m\xde\xbc\xf9\xeb\xaf\xbf\x0e\xf7\x89\x1a\xa8\xa5\xcc\xb3\
-e\xd1\xeb\xf5\xf9\xf9\xf9g\xce\x9cQ\x1cy\xf3\xcd7\
-\x1b\x0c\x86FN\xb4\x01\xa0\xe1\x08\x80\x00\xa0~\xd4j\
-\xb5\xcb\xe5\xda\xbe}\xbb\xe2\xc8\xe1\xc3\x87?\xfd\xf4\xd3\
-\x95\x95\x95\xc1\x9dH\xbawu8\x1c/\xbf\xfcr \
-\x1bN\xaf[\xb7\xee\xeaM\xa6CH\xa3\xd1\x5c\xbat\
-);;[q\xe4K/\xbd4p\xe0\xc0\xd2\xd2\xd2\
-\xe02 A\x10\x1c\x0eGll\xec\xe4\xc9\x93\x15\x9b\
-\xd1\xd8l\xb6\xac\xac\xac\xf8\xf8\xf8&\xdc\x88\xd7\xe1p\
-\xb4o\xdf\xbeU\xabV\xf2\xc3jkk\xedv{c\
-\xf6*\x92\xde<EEE\xe3\xc6\x8d\xbb\xff\xfe\xfb\x15\
-\xc7o\xd9\xb2\xe5\xd4\xa9S23\x14E\xb1\xba\xbaz\
-\xf4\xe8\xd1\x93'O\x0ed\x02G\x8f\x1e}\xec\xb1\xc7\
-f\xcd\x9a\xa5V\xab-\x16KC\xe2\x95\x86P\xab\xd5\
-R\xe7c\x991QQQ\x03\x06\x0c\xa8\xad\xad\x0d:\
-\xb8\xf4\xfb\xfd111\xf2\xefX\xb7\xdb\xedv\xbb\x7f\
-s\x0a\xab\xd5\xbao\xdf\xbe@>Y\x8f?\xfex\xf7\
-\xee\xdd\x15C\xd8kI!rRR\xd2\x0b/\xbc\xa0\
-88;;\xfbFkHkjj\xee\xba\xeb\xae\xde\
-\xbd{\xd7w\x02\xa1\x92\x94\x944l\xd80\x9b\xcd\x16\
-\xee\xa5\x94Rj\xbfh\xd1\xa2 ^\xed\xc6\xd4R\xe6\
-\xd9\xb2\x88\xa2h4\x1a\x15\xf7yP\xa9T111\
-\x1a\x8d\x86m\xe0\x01\xb48\x04@\x00P?\xd2\x17\xc4\
-\xef\xbf\xff>\x90}y^{\xed\xb5\xdbo\xbf]\xfa\
-6Y\xaf\xfb\x16\xe9\x06\xbe\xb8\xb8\xf8\xf9\xe7\x9f\x7f\xf2\
-\xc9'\x15\xc7\x1f=z\xf4\xc0\x81\x03a\xaa\x85\xd1h\
-4uuu\xdf}\xf7\x9d\xe2\xc8\xa8\xa8\xa8\xb7\xdf~\
-;>>>\x88\x0cHJ\xd6jkk\xdfz\xeb\xad\
->}\xfa(\x8e\xdf\xb6m\xdb\x993g\x9aj\xf9\x95\
-\xb4O\x99\xd1h|\xe6\x99g\x14\x07\x17\x14\x14\x5c\xb8\
-p\xa1\xd1\xf6\x80\x97\xee\xf9\xf3\xf3\xf3\x1fy\xe4\x91\xa9\
-S\xa7\x06\xf2\x90\xef\xbe\xfb\xce\xe9t\xde(\x00\x92\xaa\
-?:t\xe8\xf0\xce;\xef\x04r\xb4\xa5K\x97\xfe\xc7\
-\x7f\xfc\xc7\xae]\xbb\x92\x93\x93\x8dFc\x13\xfeH\xae\
-\xd1hjkkKKK\xe5\x87\xddw\xdf}RG\
-\x8f \xc2\x05\xb5Z]^^\x9e\x9e\x9e\x1e\x1d\x1d-\
-3\xac\xac\xac\xac\xa4\xa4\xe47\xc55QQQ\x95\x95\
-\x95\xeb\xd6\xad\x0b\xe4Do\xbf\xfdv\x9b6mjj\
-j\x02\xaf\xa5\x12\x04\xc1\xef\xf7\xdb\xed\xf6\xf1\xe3\xc7\xb7\
-n\xddZ~pEEEVV\xd6u\xaf!\x82 \
-TVV\xf6\xeb\xd7O\xfe9\x86\xdb]w\xdd\x15\x1b\
-\x1b\xebv\xbb\xc3z\x16Q\x14\x13\x12\x12\xf6\xee\xdd;\
-o\xde\xbc\xb0\x9e\xa8\x81Z\xca<[\xa2@\x02k\xd6\
-\x7f\x01h\xa1\xb8x\x01@\xbd\xe9t\xba\x9c\x9c\x9c\xb5\
-k\xd7*\x8eLKK\x9b7o^\xa7N\x9d\xca\xca\
-\xca\x02\xbf\x0d\xbe\x92\xfe\x8c\x1d;6\xc0[\xeeO?\
-\xfd4|[\xe4\x08\x82\xa0\xd3\xe9v\xef\xde}\xe8\xd0\
-!\xc5\xc1w\xdey\xe7\xbcy\xf3\xe2\xe2\xe2\xea\xb5\x16\
-L\xadV\xd7\xd5\xd5\xd9l\xb6\xc9\x93'?\xff\xfc\xf3\
-\x8a\xe3].\xd7\xe2\xc5\x8b\xc3T\xf1\xa4H\x9amY\
-Y\xd9\xc4\x89\x13\x03\xe9\x89\xbbo\xdf\xbe\xc2\xc2\xc2\xc6\
-\x09\x804\x1aMuuuEE\xc5\x84\x09\x13\xe6\xcd\
-\x9bg6\x9b\x15\x1fr\xf0\xe0\xc1\xec\xecl\xbd^\x7f\
-\xa3\xbf\x97\xf4\xd6\x9d>}\xba\xfcFW*\x95J\x14\
-\xc5\xbf\xfc\xe5/\x7f\xfa\xd3\x9f\xca\xcb\xcb\x13\x13\x13\xb5\
-Zm\xd3\xfeB\xae\xd7\xeb\xcb\xca\xca\x14\xbb\xb6w\xef\
-\xde\xfd\xa9\xa7\x9e*,,\xac\xefl\xa5\xbeH11\
-1\xc3\x87\x0f\x97\x1fy\xe2\xc4\x89s\xe7\xce\xfd&\xaf\
-\x94\xee\xe1\xd7\xad[w\xe1\xc2\x05\xc5s\xf5\xeb\xd7o\
-\xd6\xacY\xa2(\x06\x9e\x01\x89\xa2XZZ:x\xf0\
-\xe0@\xca\x7fV\xadZu\xee\xdc\xb9\xeb6Br8\
-\x1c\xad[\xb7\x1e4hP '\x0d\x9f~\xfd\xfau\
-\xeb\xd6\xad\xaa\xaa*\xdc'\x12\x04!!!\xe1\x8b/\
-\xbe8}\xfat\xb8\xcf\xd5\x10-e\x9e-\x8e\xfcr\
-N\x09\xb5?\x00Z(\x9a@\x03@\xbdi4\x9a\x9a\
-\x9a\x9a\xcf>\xfbl\xe8\xd0\xa17j\x98zE\xe7\xce\
-\x9d\x7f\xf8\xe1\x87\x09\x13&dgg\x9b\xcdf\xbd^\
-/\xbf#\xb8\xdf\xefw:\x9dN\xa7\xf3\x95W^\x99\
-6mZ 7\xf0\xc7\x8e\x1d\xfb\xe9\xa7\x9f\x04A\x08\
-\xdfo\x92\xd1\xd1\xd1\x85\x85\x85\xf3\xe6\xcd\x9b?\x7f\xbe\
-\xe2\xe0\xa1C\x87.[\xb6\xec\xb5\xd7^\xcb\xcd\xcd5\
-\x9b\xcd\x8auI>\x9f\xaf\xb2\xb2R\xab\xd5~\xf8\xe1\
-\x87\xaf\xbe\xfaj \xf3\xf9\xf1\xc7\x1f\xf7\xec\xd9\xd3\xf0\
-H\xc5\xe7\xf3I}U\x02\xc9\xce\xa4\xcd\xcb=\x1eO\
-]]]\xdb\xb6m\xff\xf2\x97\xbf\x04\xb2\x13\x96(\x8a\
-\x87\x0f\x1f\xb6X,A\xdf0\xf8\xfd~\xb7\xdb\xedr\
-\xb9d&)\xd5zx\xbd\xde\xaa\xaa\xaa\xbb\xee\xbak\
-\xca\x94)\x8a\x91\xc4\x15\x8b\x16-*((HKK\
-\xbb\xd1\x91\xcb\xca\xca\x86\x0f\x1f\xae\xd8IZ\x14\xc5\xd7\
-^{\xed_\xff\xfaW\xabV\xad\x9a<\xfa\x91\xe8\xf5\
-\xfa\x92\x92\x92\xec\xec\xeca\xc3\x86\xc9\x8f\x9c<y\xf2\
-\xb1c\xc7\xb6l\xd9\x92\x90\x90\xa0\xd3\xe9\x14\xb3KA\
-\x10|>_]]\x9d\xddn\x9f6m\xda}\xf7\xdd\
-'?\xfe\xd7_\x7fU\xa9T\xd7\xae\x191\x1a\x8d\xe7\
-\xcf\x9f_\xb6l\xd9[o\xbd\xa5\xf8t\x1e|\xf0\xc1\
-\x05\x0b\x16L\x992\xa5\xac\xac\xccj\xb5\xca/\xd9\xf3\
-z\xbd6\x9b\xadO\x9f>s\xe7\xce\x8d\x89\x89\x91?\
-r]]\xdd7\xdf|\xe3t:\xaf\xfb\x99\xaa\xaa\xaa\
-\xba\xff\xfe\xfb{\xf6\xec)\x7f\x90_\x7f\xfdu\xe1\xc2\
-\x85z\xbd\xbe\xbeI\xb4\xcb\xe52\x9b\xcd\x13&L\xb8\
-\xd1\x9bPb2\x99n\xbf\xfd\xf6\xcd\x9b7\xd7\xeb\xe0\
-\xc11\x18\x0ceee\x1f|\xf0\xc1\xe2\xc5\x8b\x9bs\
-\xadG\xd3\xceS\x14E\xe9\xd2\x14\xa6\xa5\xc7M\xd2\xdf\
-M\x10\x84pW\x99\x01@\x13\x22\x00\x02\x80`\x98\xcd\
-\xe6\xdd\xbbw/Y\xb2\xe4\x95W^Q\x1c\xdc\xb6m\
-\xdbo\xbf\xfd\xf6\xef\x7f\xff\xfb\xd2\xa5Kkjj<\
-\x1e\x8f\xb4'\xb4^\xaf\x97\xbe7K\xbb\x89\xbb\x5c.\
-\xaf\xd7\xab\xd5j;v\xec8a\xc2\x84\xa7\x9f~:\
-\xc0\xc9\xfc\xe3\x1f\xff())INNn\xd0S\x92\
-%\x08Bll\xec\xf2\xe5\xcb\x1f}\xf4Q\xc5\x0d\xe9\
-U*U\xdf\xbe}W\xaf^\xfd\xc6\x1bol\xd8\xb0\
-\xa1\xba\xbaZ\xadV\xebt:\x83\xc1p%\x17\x90V\
-\x15y<\x1e\xaf\xd7k0\x18z\xf5\xea\xf5\xea\xab\xaf\
-\x0e\x1d:4\x90\xc9TWW\x7f\xf2\xc9'^\xaf\xb7\
-\xe1\x15O\x06\x83A\xda^-\x90C\xf9|>\x83\xc1\
-0|\xf8\xf06m\xda\x0c\x1c80\x90\xc6L*\x95\
-\xea\xc8\x91#?\xfd\xf4\x93bP(C\xa7\xd3\xc5\xc7\
-\xc7\x0b\x82 \xd3\xcb\xd9\xe3\xf1t\xe8\xd0\xe1\xee\xbb\xef\
-\xee\xd4\xa9\xd3\x1f\xfe\xf0\x07\xc5=\xe3\xae\xd8\xbau\xeb\
-w\xdf}\x17\x1b\x1b+\xc5[\xd7\x0e\x906\xb7\x1a?\
-~\xbc\xfcq\x5c.\xd7\xa4I\x93\xe6\xcd\x9b'-k\
-\x0a\xfa\x86\xd0b\xb1\x84\xb0\xb5\xaaZ\xad\xd6j\xb5{\
-\xf7\xee\xb5\xdb\xed\xf2Yjjj\xea\xb7\xdf~;m\
-\xda\xb4\x15+VTUU\x89\xa2\xa8\xd7\xebu:]\
-TT\xd4\xd5\xcfE\x14E\x87\xc3!\xe5\x86\x06\x83!\
-!!a\xfa\xf4\xe9\x8a\xf55uuu\xfb\xf7\xef\x8f\
-\x89\x89\xb9\xf6e\x916\x9f^\xbat\xe9\xc8\x91#o\
-\xbb\xed6\xc5g4j\xd4\xa8\xd6\xad[O\x9a4\xe9\
-\xcc\x993^\xaf7**\xca`0\xe8t\xba+G\
-v:\x9d.\x97\xcb\xe7\xf3\xc5\xc4\xc4<\xfb\xec\xb3\xef\
-\xbf\xff~ \xdb\xe4\xadZ\xb5j\xcf\x9e=\xd7]\xe1\
-%\xfd-z\xf4\xe8\xa1\xf8\x19Y\xb9r\xe5\xec\xd9\xb3\
-\xafmw\xadH:E\xabV\xad^|\xf1E\xf9\x91\
-c\xc6\x8c\x91\x96\xdf*\xf65o Q\x14\xcdf\xf3\
-\xfa\xf5\xeb\xd7\xaf_\x1f\xe0u\xa9I4\xed<5\x1a\
-M||\xbcF\xa3\x91\xdf\x1338n\xb7\xdb\xe9t\
-\x86\xbb\xe5\xd3u5\xc9I\x01\xa0q\x10\x00\x01@0\
-t:\x9d^\xaf\xff\xec\xb3\xcf\x1ez\xe8!\xc5\xfdb\
-U*\x95\xc5by\xef\xbd\xf7\x9e{\xee\xb9\x8f>\xfa\
-h\xd7\xae]~\xbf\xbf\xa8\xa8\xa8\xa0\xa0@\xfa\xcd\xd6\
-\xef\xf7K\x9bI\xc5\xc6\xc6\x0e\x1a4\xe8\xd9g\x9fM\
-II\x09p&?\xff\xfc\xf3\xea\xd5\xab\xadV\xab|\
-aQ\x03I\x9d\x8f\xea\xea\xeaf\xcf\x9e-\xb3\xf1\xf0\
-\xd5RSS\x17/^\xbco\xdf\xbe\xd9\xb3g\x9f9\
-s\xc6\xe3\xf1\x5c\xb8pA\x0a\x83T*\x95\xdf\xef\xef\
-\xd0\xa1CLLL\x9b6mF\x8c\x18\xf1\xc4\x13O\
-\x04^\xce\xb3p\xe1\xc2\xfd\xfb\xf7\x87d\xf7\xf7Q\xa3\
-F=\xf0\xc0\x03\x81\x8f\x17\x04!\x90\x9a\xac\xab}\xf5\
-\xd5W\x0e\x87\xa3!\xab\xd5\xbaw\xef\x9e\x95\x95\xa5\xf8\
-p\xbd^\x1f\xc8\xdf\xe5j.\x97k\xe6\xcc\x99.\x97\
-+11\xf1\xba\xc7\x17\x04\xa1\xa2\xa2b\xf0\xe0\xc1\x7f\
-\xf8\xc3\x1f\xe4\x0f\x95\x97\x97w\xf1\xe2\xc5{\xef\xbd\xb7\
-!\xb5N\xd2q\xca\xcb\xcbC\xf5\xcb\xbf(\x8a\xf1\xf1\
-\xf1{\xf6\xec\xd9\xb1c\x87\xe2\x0eV\x16\x8be\xe6\xcc\
-\x99c\xc6\x8cY\xb6l\xd9\x8e\x1d;\xdcnwyy\
-\xf9\xb9s\xe7\xae\x14VH\xdbi\xb5o\xdf^*\xe5\
-{\xe0\x81\x07\x9e{\xee9\xf9\xa2\x15\xc9\xc1\x83\x07w\
-\xed\xdau\xa3w\xacV\xab-((\x983gN\x80\
-\xcd\x5cz\xf5\xea\x95\x95\x95\xb5t\xe9\xd2%K\x96\xd8\
-\xed\xf6\x0b\x17.TTTH\x1f\x7f\xb5Z\xdd\xb6m\
-\xdb\xb4\xb4\xb4\xcc\xcc\xcc'\x9f|2\x90\xfe\xdf*\x95\
-\xcan\xb7\xcf\x9f?\xdf\xe7\xf3\xfd&\xed\x92\xd4\xd5\xd5\
-\xddt\xd3M\x8f<\xf2\x88\xfcAjkk\xf7\xee\xdd\
-\x9b\x90\x90`\xb1X\x029\xe9\xd5\x04A(--\xdd\
-\xb7o\x9fb\x00\xd4\xa3G\x8f\xf6\xed\xdb\xef\xd9\xb3'\
-\xdc\x01\x90J\xa5\xd2j\xb5UUU\xb3f\xcd\x1a2\
-dHsN\x04\x9ap\x9e\xa9\xa9\xa9\x9b6m\x0a\xd3\
-\xff;_|\xf1\xc5\xbb\xef\xbek4\x1a\x9bp\x9fG\
-\x00\x88<\x5cR\x01 \x18\xa2(\xc6\xc5\xc5\xe5\xe4\xe4\
-\xbc\xf1\xc6\x1b_~\xf9\xe5u\x1bg\x5c\xab]\xbbv\
-\x1f\x7f\xfc\xb1\xddn\xcf\xcb\xcb\xdb\xbf\x7f\xff\xa1C\x87\
-\xa4\xdb\x98\x9a\x9a\x9a{\xee\xb9\xa7[\xb7nm\xdb\xb6\
-\xadWUKqq\xf1\xbb\xef\xbe+\x08B#t\xc3\
-\x91\xfa\x95l\xd9\xb2e\xc6\x8c\x19\x7f\xfd\xeb_\x03y\
-\x88 \x08={\xf6\x5c\xb6l\xd9\xe5\xcb\x97\x8b\x8a\x8a\
-\xb6n\xddz\xee\xdc9\xe9)\xbb\x5c\xae!C\x86t\
-\xe8\xd0\xa1}\xfb\xf6\xf5\x9a\xc6\x9e={f\xcf\x9em\
-2\x99\xae\xd4O5\x84N\xa7\x0b\xf0o\x17\x9c\x03\x07\
-\x0e|\xf7\xddwf\xb3\xb9!S\xd5h4\xf5M\x9d\
-\x024c\xc6\x8c\xad[\xb7&%%\xddhz\x1e\x8f\
-\xc7h4\x0e\x1b6L\xf1\x17\xfe[n\xb9%\x90\xae\
-X\x8a^}\xf5\xd5/\xbe\xf8\x22!!\xa1\xe1\x87\x92\
-h\xb5Z\x8dF\xb3p\xe1\xc2\x01\x03\x06\x04R\xa7\xd0\
-\xabW\xaf^\xbdz\x95\x95\x95]\xb8p!77w\
-\xdf\xbe}W\x1e\xe5\xf3\xf9\x8cF\xe3\xc0\x81\x03SR\
-Rn\xb9\xe5\x96\x00'\xe0v\xbb\xe7\xcd\x9b'\xf36\
-\x93R\xc5\x95+W\x0e\x180`\xec\xd8\xb1\x81\x1c\xd3\
-h4\x8e\x1f?~\xfc\xf8\xf1'O\x9e\xdc\xb2eK\
-nn\xaeT\x04\xa4\xd5j\xfb\xf6\xed\xdb\xb9s\xe76\
-m\xda\x048=\x95J5s\xe6\xcc\x83\x07\x0f&$\
-$\x5c\xf7m\xe0v\xbbo\xb9\xe5\x96N\x9d:\xc9\x1f\
-\xe4\xd8\xb1c\xfb\xf6\xedS\x5ckv]\xa2(\xc6\xc6\
-\xc6\xee\xdc\xb9\xf3\xfc\xf9\xf3\xed\xda\xb5\x93\x1f|\xef\xbd\
-\xf7\x1e=z\xd4\xef\xf77\xc2\x8a'\x8b\xc5r\xe0\xc0\
-\x81\xcf?\xff\xfc\xd9g\x9f\x0d\xf7\xb9\x1a\xa2\xa9\xe6\xa9\
-V\xab\xc3tiR\xa9T\xd1\xd1\xd1\xcda\x19\xe9\x8d\
-\xb0\x01<\x80\x16\x8a\x00\x08\x00\x82$\x8abjj\xea\
-\xcf?\xff\xfc\xd1G\x1f\xbd\xf1\xc6\x1b\x81?\xd0l6\
-w\xee\xdc\xb9s\xe7\xce\x81/\xf2\xba\xae\xba\xba\xba\x17\
-_|\xf1\xf8\xf1\xe3\xc9\xc9\xc9\x8d\xf3eT\x8a\xbd\xe6\
-\xcf\x9f\xdf\xa5K\x97\xd1\xa3G\x07\xfe\xc0\xa4\xa4\xa4\xa4\
-\xa4\xa4\xdbo\xbf\xbd\x81\x13\xc8\xcb\xcb{\xee\xb9\xe7j\
-jj\xe2\xe3\xe3\x9b\xff\xf7o\xbb\xdd\xfe\xee\xbb\xef\xd6\
-\xd5\xd5\x05wW\x1cn\xcb\x97/\x9f?\x7f~\x5c\x5c\
-\x9c\xcc]\x96T\xfd1p\xe0\xc0\xc6\x99\x92\xd4b)\
-\xb4U\x0cR\x11\xd0\x86\x0d\x1b\xfe\xfd\xef\x7f?\xf1\xc4\
-\x13\x01>*11111\xb1G\x8f\x1e\x8f>\xfa\
-h\x03'\xf0\xed\xb7\xdf\xae]\xbbV~\x0d\xa0\xd1h\
-\xb4\xd9l\x7f\xfe\xf3\x9f\xa5+C\xe0\x07\xcf\xcc\xcc\xcc\
-\xcc\xccl\xc8\xf4~\xfe\xf9\xe7\xb9s\xe7\xc6\xc5\xc5]\
-\xb7\x84\xd0\xe7\xf3\x99L&\xc5\xe2)\x95J\xb5}\xfb\
-v\x8f\xc7\x13\xf4M\xbb^\xaf/((\xd8\xbbw\xaf\
-b\x004d\xc8\x90\x05\x0b\x16x<\x9eF\x08\x80\xf4\
-z}uu\xf5G\x1f}t\xdf}\xf7\xd5+Sk\
-d-e\x9e\xf5\xe2\xf5z\x9b\xea\xd4\x81\x5c\x82\x0c\x06\
-Cs\xae\x0b\x03\x80\x1bi\xbem\xed\x00\xa0E0\x9b\
-\xcd\xff\xfb\xbf\xff\xfb\xd9g\x9f5\xfe\xa9_\x7f\xfd\xf5\
-\x0d\x1b6$$$4f\x14\xa2\xd1h\xbc^\xef\xeb\
-\xaf\xbf\x9e\x95\x95\xd5h'\x95\xd8l\xb6\x97^z\xe9\
-\xfc\xf9\xf3\x8d\xfc\x94\x83\xf6\xee\xbb\xef\xae[\xb7.:\
-:\xba\x19\xde'dee\xbd\xfe\xfa\xeb\x8a}\x94<\
-\x1eOJJ\x8a\xe2=y\xf3\x17\x1d\x1d\xfd\xc1\x07\x1f\
-\xec\xdf\xbf\xbf\x91\xcf{\xe6\xcc\x99\x8f>\xfaH\xa7\xd3\
-\xc9\xa7\x15~\xbf?!!\xa1\xaa\xaaj\xc2\x84\x09\x17\
-/^l\xb4\xe9\xed\xdf\xbf\x7f\xca\x94)R\xe9\xd0u\
-\x83\x1b\x9f\xcf\x17\x1b\x1b\xab\xb8L\xb2\xb6\xb6v\xc3\x86\
-\x0d\xd7]A\x16 Q\x14\xa3\xa3\xa37n\xdc\xa88\
-\xb2k\xd7\xae=z\xf4h\x9ct@\x14\xc5\xc4\xc4\xc4\
-\x9c\x9c\x9c\x8f?\xfe\xb8\x11N\x17\xb4\x962\xcf\x96B\
-\xda\x19@\x9e\xc5bi\xce\xdd\xc1\x01\xe0F\xb8r\x01\
-@\xf0\xa4N\xb1>\x9f\xef\x9dw\xde\xf9\xfc\xf3\xcf\x1b\
-\xf3\xd4\x7f\xfd\xeb_\x97,Y\x92\x98\x98\xd8\xf8\xe1B\
-LLLyy\xf9\xcb/\xbf\xbc}\xfb\xf6F;\xa9\
-\xdb\xed\x9e<y\xf2\xf6\xed\xdbSRR|>_\xa3\
-\x9d7h\xb3f\xcdZ\xb8paRRR3l`\
-\xb1a\xc3\x86W_}\xb5\xbc\xbc\x5c\xbe4\xc9\xef\xf7\
-\x9bL\xa6~\xfd\xfa5\xda\xc4\xc2D\x14E\x83\xc1\x90\
-\x9f\x9f\xff\xe2\x8b/\xe6\xe7\xe77\xday+**^\
-y\xe5\x95\xb3g\xcf^\xb7\xb9\xf2o\xf8\xfd\xfe\xf8\xf8\
-\xf8_\x7f\xfdu\xf2\xe4\xc9\x97/_n\x84\xe9]\xb8\
-pA\xca\x9bd\x96(z\xbd\xde\xde\xbd{+\x16\x95\
-\x9c:u\xea\xfc\xf9\xf3\x0dl\xca\xae\xd5j\xb3\xb3\xb3\
-KJJ\xe4\x87i4\x9a\xc1\x83\x07\xd7\xd4\xd44\xda\
-\xedwRR\xd2\xd7_\x7f}\xf2\xe4\xc9\xc69]\xd0\
-Z\xca<\x9b9A\x10jjj\x14\x87Y,\x96k\
-7\xf5\x03\x80\xe6\x8f\x00\x08\x00\x1a*&&\xc6\xef\xf7\
-\xbf\xf9\xe6\x9b\x0b\x17.l\x84\xd3y<\x9e\xd7_\x7f\
-\xfd\x9f\xff\xfcgLLL}\x9b\xfe\x86J||\xfc\
-\xe5\xcb\x97'L\x98\xd08[2_\xbe|\xf9?\xff\
-\xf3?\x7f\xf8\xe1\x87\x904~n\x04\xef\xbd\xf7\xde\x8c\
-\x193\xccfs#\xf4f\xaa\xafE\x8b\x16\xbd\xfc\xf2\
-\xcb\xa5\xa5\xa5\xf1\xf1\xf1\xf2#\xfd~\xbf\xd1h\xec\xd2\
-\xa5K\xe3L,\xdc\x92\x92\x92N\x9d:5|\xf8\xf0\
-s\xe7\xce5\xc2\xe9l6\xdb\xe3\x8f?\xbes\xe7\xce\
-\xd4\xd4\xd4\xc0S\xda\xd8\xd8\xd8\xac\xac\xac'\x9f|2\
-\xdcA\xd5\xf1\xe3\xc7G\x8c\x18q\xea\xd4)\x99\xdd\x03\
-\xd5juuuu {Km\xde\xbc\xd9n\xb77\
-0\x00R\xab\xd5\xb5\xb5\xb5;v\xecP\x1c\xd9\xa7O\
-\x9f\xa4\xa4$\x8f\xc7\xd3\x90\xd3\x05HJ\xf9\x1d\x0e\xc7\
-\xcc\x993\x1b\xe1tAk)\xf3l\xfe\xd4j\xf5\x91\
-#G\x14K\xccn\xbd\xf5V\x8f\xc7\xd3\xdc.\xef\x00\
-\xa0\x88\x00\x08\x00\x1aJ\x14\xc5\x98\x98\x18\xb5Z\xfd\xdf\
-\xff\xfd\xdf\x7f\xfb\xdb\xdf\x1c\x0eG\xf8\xceu\xfe\xfc\xf9\
-'\x9ex\xe2\x93O>\x91\xd2\x9f\xa6\xfa\xf6)\x8a\xa2\
-\xd5j-++{\xe6\x99g\x96,Y\x12\xd6s\xed\
-\xdd\xbbw\xc4\x88\x11\xeb\xd6\xad\x8b\x8f\x8fo\x86\xd54\
-\xbf\x91\x97\x97\xf7\xec\xb3\xcf\xbe\xf7\xde{&\x93\xe9\xea\
-\xcd\xb9\x9b\x83\xdc\xdc\xdc\xf1\xe3\xc7\xbf\xf6\xdakv\xbb\
-\xfd\xba[\x92\xff\x86\xb42())\xa9q\xa6\x17n\
-\xa2(\xb6n\xdd\xfa\xec\xd9\xb3\x0f?\xfc\xf0\xa6M\x9b\
-\xc2z\xae3g\xce<\xfe\xf8\xe3;v\xecHKK\
-\xab\xd7{@\x10\x04\xab\xd5\xba{\xf7\xee\xa1C\x87\xfe\
-\xf4\xd3Oa\x9a\xde\xda\xb5k\x1f~\xf8\xe1\x0b\x17.\
-\xc8O\xaf\xae\xae\xaeK\x97.\xfd\xfb\xf7\x97?\x9a\xd3\
-\xe9\xfc\xf9\xe7\x9f\x9dNg\x03Kr4\x1aMMM\
-M \xcf:33\xf3\x81\x07\x1e(//o\xc8\xe9\
-\x02'\xed\x81\xb8j\xd5\xaa\xd5\xabW7\xce\x19\x83\xd3\
-R\xe6\xd9\xcci4\x9a3g\xce(V\xe1u\xec\xd8\
-q\xd0\xa0A\x81\xd4\x0a\x01@\xb3B\x00\x04\x00!\xe0\
-\xf7\xfb\x0d\x06\x83\xc1`\x981c\xc6\xc3\x0f?\xbcg\
-\xcf\x9ep\x9c\xe2\x87\x1f~x\xec\xb1\xc7V\xadZ\x95\
-\x90\x90\xd0\xe4\xc5\xe7~\xbf\xdfl6;\x1c\x8eW_\
-}\xf5\x99g\x9e\xc9\xcb\xcb\x0b\xf9)\x9cN\xe7\xdc\xb9\
-s\x9f|\xf2\xc9#G\x8e\xa4\xa4\xa4\x84u\x9f\xfb\x86\
-+//\x7f\xef\xbd\xf7\x86\x0c\x19\xf2\xef\x7f\xff;9\
-9\xf9FMU\x1a\x9f\xdf\xef/((x\xe7\x9dw\
-\x1e|\xf0\xc1o\xbe\xf9&\xf0\xba$\xa9\xa6\xa0u\xeb\
-\xd6\x8d0\xc9\xc6\xe1\xf5z\xd3\xd2\xd2.\x5c\xb80~\
-\xfc\xf8\x0f?\xfc\xb0\xac\xac,\xe4\xa7\xf0\xf9|_~\
-\xf9\xe5\xa3\x8f>\x9a\x9d\x9d\x9d\x9c\x9c\x1c\xc4rE\xb5\
-Z\x9d\x90\x90 Mr\xfa\xf4\xe9\xa5\xa5\xa5!\x9c\x9e\
-\xcdf\x9b:u\xea\xf3\xcf?_VV&?=A\
-\x10l6\xdb\xb0a\xc3\x14\x13\xc0\xe3\xc7\x8f\xe7\xe7\xe7\
-7\xbc\x1aQ\x10\x04Q\x14\x8f\x1d;f\xb3\xd9\x14\x07\
-\xf7\xec\xd93\xacQ\xfboH\x1f\xe7\x993gVW\
-W7\xdaI\x83\xd0R\xe6\xd9\x9c\xa9\xd5j\xbf\xdf\x7f\
-\xfa\xf4i\xf9a\x1a\x8d\xe6\xc3\x0f?\xec\xd5\xab\x97\xd3\
-\xe9l&\x97z\x00\x08\x04\x01\x10\x80H 5+Q\
-\x5cga6\x9b\xc3\xd7<X\xea3b\xb1Xv\xef\
-\xde\xfd\xf8\xe3\x8fO\x992\xe5\xcc\x993!9\xb2\xd7\
-\xeb=p\xe0\xc0\xf3\xcf??~\xfc\xf8s\xe7\xce\xb5\
-j\xd5\xaa\x99D!R\xe9\x93\xc9dZ\xb5j\xd5C\
-\x0f=\xf4\xf7\xbf\xff\xfd\xfc\xf9\xf3!9rMM\xcd\
-/\xbf\xfc\xf2\xc8#\x8f\xbc\xf9\xe6\x9b\x95\x95\x95\xa9\xa9\
-\xa9~\xbf\xbf^OY\x1a\x9c\x98\x98\x18\x92\xf9\x5cK\
-\xbas\xae\xae\xae>|\xf8\xf0\x8a\x15+&M\x9a4\
-`\xc0\x809s\xe6\x5c\xbat)999\xf0\xda\x1f\
-\xbf\xdf\x1f\xa6I:\x9d\xce\x13'N,_\xbe|\xe2\
-\xc4\x89C\x86\x0c\x997o^iiiRR\x92\xc1\
-`\x08pnR\x05Pzzz8\xa6w]\x82 \
-\x98L\xa6\xb0v\xf8\xf6\xf9|\x89\x89\x89N\xa7s\xc6\
-\x8c\x19\xa3G\x8f\xfe\xfa\xeb\xafC\x95\xb0\xf8|\xbe=\
-{\xf6<\xf5\xd4S\x93&M*((\x08\xbarJ\
-\x14Ei\x87AQ\x14g\xcd\x9a\xf5\xd0C\x0f-[\
-\xb6\xac\xe1Y\x95\xddn\xff\xf1\xc7\x1f\x1f{\xec\xb1Y\
-\xb3fI\xdb\xf9\xc9\x87S\x0e\x87#555\x90M\
-\xd0\xb2\xb2\xb2.^\xbch4\x1a\x1b8C\x95Je\
-2\x99\x8a\x8a\x8a\x0e\x1c8\xa08\xf2\xe9\xa7\x9f\xbe\xe7\
-\x9e{\xae.\x02\xf2\xfb\xfd:\x9dN\xfeQ\xd2g-\
-\xb8\x8b\xa7\xc9d\x92\xb6ZW\x1c\x99\x9c\x9c,\xfd\x11\
-\xaf\xfb\xaf-e\x9e*\x95Jq\x95hX\xc5\xc5\xc5\
-]\xf7\xb2/\x8a\xa2Z\xadV\xdcZ1\xe8\xc9\x0b\x82\
-P[[{\xfc\xf8q\xc5\x91\xc9\xc9\xc9\xabV\xadj\
-\xdf\xbe}UUUp\xe7\x02\x80\xc6\xd7\xdck\xe9\x01\
- \x10F\xa3\xf1\xcc\x993\xdf|\xf3\x8d\xfc\xb0#G\
-\x8eX,\x96\xf0MC\x14E\x9dN\x17\x1f\x1f\xef\xf1\
-x\xbe\xf8\xe2\x8b\xe5\xcb\x97\x0f\x1f>|\xd0\xa0A\xdd\
-\xbau\x0bnk\xdeS\xa7N\xed\xda\xb5k\xeb\xd6\xad\
-?\xfe\xf8\xa3V\xab\x8d\x8e\x8en`\x97\x8d\x90\x93b\
-\xaf\xa8\xa8(\x9b\xcd\xf6\xc1\x07\x1f,^\xbcx\xec\xd8\
-\xb1}\xfb\xf6\xed\xde\xbd{BBB\x10\x07\xdc\xbbw\
-\xef\xfe\xfd\xfb7l\xd8\xb0q\xe3F\xab\xd5\x1a\x1b\x1b\
-\x1b\x5c\xda%\xbdPk\xd6\xac),,\x0cb\x1a\xf2\
-\xca\xca\xca\x8e\x1c9b2\x99\xf2\xf2\xf26n\xdch\
-4\x1a5\x1a\x8dV\xab5\x99LReV\xe0\x136\
-\x18\x0c\xabW\xaf\x0em\xfdTYY\xd9\xd9\xb3gm\
-6\xdb\xa6M\x9b\x5c.WTT\x94\xf4\xe6\x91V\xe8\
-\x04>7\x8dF\xe3v\xbb\xbf\xf8\xe2\x8b\xc6l5u\
-\xe6\xcc\x99\x90D\x092DQ4\x99L\x06\x83\xe1\xec\
-\xd9\xb3\x13&L\xb8\xfd\xf6\xdb\xfb\xf7\xef\x7f\xff\xfd\xf7\
-\xdf~\xfb\xed\x8aw\x95\xd7\x95\x9b\x9b\xbbg\xcf\x9e\xf5\
-\xeb\xd7\xaf^\xbdZ\xa7\xd3\x99\xcd\xe6\x86\x7fN\xa5\x06\
-LQQQ\x05\x05\x05\xe3\xc6\x8d\xeb\xd3\xa7\xcf\xa8Q\
-\xa3\xee\xb8\xe3\x8e^\xbdz\xd5w!\xe4\xc9\x93'w\
-\xed\xda\xf5\xc3\x0f?deeY,\x96\xa4\xa4$\xa9\
-\xd6F\xfeQ>\x9f/###;;\xfb\xf0\xe1\xc3\
-\xf2#\xd7\xae]k2\x99B\xd2\x92\xd9`0\x94\x96\
-\x96\xfe\xf3\x9f\xffT\x5c\xde\xa5\xd3\xe9t:\xdd\xd5\xaf\
-\xb3\xd1h,++\x93\xff_\xe0\xd0\xa1C\xaa\xff\xff\
-\xe2P_z\xbd\xded2-Z\xb4\xc8d2\x99\xcd\
-f\x99\x91g\xcf\x9e\xd5h47zAZ\xc4<\xa5\
-_S6n\xdc\xd8\x84\x95D\xdb\xb7o7\x18\x0c\xd7\
-\xbe\x08Z\xad\xd6\xe5r)^\x97\xf6\xec\xd9\x13\xdc\x0e\
-\x09\xd25|\xc5\x8a\x15\x8a\xff\x85IQ\x91\xdb\xed\xd6\
-\xeb\xf5A\x9c\x08\x00\x9a\x84\xd0\xb5kW\xbb\xdd\xde\xd4\
-\xd3\x00\x80\x06\x91\x9aG(.\xdaOHH\x88\x8d\x8d\
-m\x9c\xfd\x83\x05A\xf0z\xbd\xa5\xa5\xa5\x1a\x8d\xa6[\
-\xb7n\x99\x99\x99\xad[\xb7\x1e8p\xa0\xd5j5\x18\
-\x0c\x1d;v\xbc\xee\xa3~\xfd\xf5W\x8dF\x93\x93\x93\
-\x93\x9d\x9d]ZZz\xe8\xd0\xa1\xc3\x87\x0f\xc7\xc4\xc4\
-\x04\x17\xa642A\x10\xdcnwIIIlll\
-\xf7\xee\xdd\xdb\xb7o\xdf\xa1C\x87{\xef\xbdW\xab\xd5\
-&$$\x5c\xb7\x90D\x14\xc5\x83\x07\x0f\x1a\x8d\xc6\x83\
-\x07\x0f\x1e=z\xb4\xb8\xb8x\xd7\xae]\xb9\xb9\xb9\xd2\
-_\xaa!\x95 \xd2-nYYYmmm\x03\x9e\
-\xd3\xf5IY\x8f\xdf\xef\xd7\xeb\xf5\x16\x8b\xa5!\xd5X\
-j\xb5\xba\xb4\xb44\xb4\x93\xd4j\xb5\x06\x83A\xab\xd5\
-J\x1b\x15\x07==A\x10|>_aaaXK\
-r~#)))&&\xa6\xd16z\x13\x04\xa1\xae\
-\xae\xae\xa4\xa4\xa4M\x9b6w\xdcqG\xeb\xd6\xad\xdb\
-\xb6m;t\xe8PQ\x14\xe3\xe3\xe3322\xae\xfb\
-(\xa9:\xa0\xa8\xa8h\xdb\xb6m\xf9\xf9\xf9\xa7N\x9d\
-:|\xf8\xb0N\xa7\x0bS\xbf$\x8dFS]]m\
-\xb3\xd9\xd2\xd3\xd3{\xf6\xec\x99\x9e\x9e\xde\xabW\xaf[\
-o\xbdU\xaf\xd7gff^;\xbe\xbc\xbc\xfc\xfc\xf9\
-\xf3Rk\x9e\x82\x82\x82\xc3\x87\x0f\x9f<y\xd2d2\
-\xc5\xc7\xc7\x07\xfe\xa7T\xab\xd5\xd2\xc7Y\xf1o\x91\x92\
-\x92\x12\x1d\x1d\x1d\xaa?\x99V\xab\xad\xac\xac\x0cd\x15\
-\xd8o\xce\xab\xd1h\x9cNgQQ\x91\xccC\xa2\xa3\
-\xa3\xa5\x9d\x13\x83\xfbPH\xa7())\x91\x7f\x19\x0d\
-\x06Cjj\xaa\xea\x06akK\x99\xa7J\xa5*/\
-/o\xc2\x1e7\x16\x8b%!!\xe1\xda<=\xc0\xeb\
-RLLL\xd0E@R?\xf2@j\x035\x1aM\
-jj\xaa^\xafo\xcc\x8b$\x00\x04\xcdl6\x13\x00\
-\x01@\x18I_Ukjj\xaa\xaa\xaa4\x1aM\xbb\
-v\xed\xa4;\xf3V\xadZ]\xfb\xe3\xa4\xd7\xeb-*\
-*\x12\x04\xa1\xbc\xbc<??_\xab\xd5Z\xadV\xa9\
-$\xa19,\xf8\x0a\x90\x14\x03IO9::\xba]\
-\xbbvj\xb5\xdad2]w\xb3!\x87\xc3Q\x5c\x5c\
-\xac\xd3\xe9\x8a\x8a\x8aJKK\x0d\x06\x83\xd5j5\x99\
-L-\xe8\xf9\x22\x02\xa8\xd5j\x87\xc3a\xb7\xdbkj\
-j\xae\xe4\xb3F\xa31%%\xe5\xda\xc1RO%\x95\
-JUSS\x93\x97\x97'\xadF\x91\xda\xc0\x87\xf5}\
-+\x08\x82\xd3\xe9\xac\xaa\xaa\xaa\xad\xadm\xd5\xaaUb\
-b\xa2t\xf3y\xedz\xa2\x8a\x8a\x8a\x8a\x8a\x0a\xaf\xd7\
-\x9b\x93\x93\xa3\xd1h,\x16\x8bT\xff\xc5\xc7\x0a\x00\x80\
-\xff\xcb\x08\x80\x00\xa0\x91\x08\x82\xe0\xf7\xfb\x1d\x0e\x87\xd4\
-\xd4\xc0\xe5r]w\x8cT\xd3\xae\xd3\xe9\x9aj\x7f\xf7\
-\x10\x92\xc2/\xa9Q\xab\xcf\xe7s\xbb\xdd\xd7\x8e\xd1h\
-4z\xbd^j6L\x15=\x9a\x5c o\xda+\x9f\
-S\x8dFc4\x1a\x83.\xd3h\xc8$].\x97\xb4\
-\x05\xb5\xdb\xed\xbe\xb6\xf4@\xa7\xd3i\xb5Z\xa9\xa1R\
-cN\x0c\x00\x004gf\xb3\x99\x1e@\x00\xd0\x18D\
-Q\xbc\xfa~,\xb8V#-\x8b\xd4\xaa3::\xba\
-\xa9'\x02\x04*\x887m\xe3\x97\xd5\x10\x98\x02\x00\x80\
-\xe0\xb0\x0b\x18\x00\x00\x00\x00\x00@\x84#\x00\x02\x00\x00\
-\x00\x00\x00\x88p\x04@\x00\x00\x00\x00\x00\x00\x11\x8e\x00\
-\x08\x00\x00\x00\x00\x00 \xc2\x11\x00\x01\x00\x00\x00\x00\x00\
-D8\x02 \x00\x00\x00\x00\x00\x80\x08G\x00\x04\x00\x00\
-\x00\x00\x00\x10\xe1\x08\x80\x00\x00\x00\x00\x00\x00\x22\x1c\x01\
-\x10\x00\x00\x00\x00\x00@\x84#\x00\x02\x00\x00\x00\x00\x00\
-\x88p\x04@\x00\x00\x00\x00\x00\x00\x11\x8e\x00\x08\x00\x00\
-\x00\x00\x00 \xc2\x11\x00\x01\x00\x00\x00\x00\x00D8\x02\
- \x00\x00\x00\x00\x00\x80\x08G\x00\x04\x00\x00\x00\x00\x00\
-\x10\xe1\x08\x80\x00\x00\x00\x00\x00\x00\x22\x1c\x01\x10\x00\x00\
-\x00\x00\x00@\x84#\x00\x02\x00\x00\x00\x00\x00\x88p\x04\
-@\x00\x00\x00\x00\x00\x00\x11\x8e\x00\x08\x00\x00\x00\x00\x00\
- \xc2\x11\x00\x01\x00\x00\x00\x00\x00D8\x02 \x00\x00\
-\x00\x00\x00\x80\x08G\x00\x04\x00\x00\x00\x00\x00\x10\xe1\x08\
-\x80\x00\x00\x00\x00\x00\x00\x22\x1c\x01\x10\x00\x00\x00\x00\x00\
-@\x84#\x00\x02\x00\x00\x00\x00\x00\x88p\x04@\x00\x00\
-\x00\x00\x00\x00\x11\x8e\x00\x08\x00\x00\x00\x00\x00 \xc2\x11\
-\x00\x01\x00\x00\x00\x00\x00D8\x02 \x00\x00\x00\x00\x00\
-\x80\x08G\x00\x04\x00\x00\x00\x00\x00\x10\xe1\x08\x80\x00\x00\
-\x00\x00\x00\x00\x22\x1c\x01\x10\x00\x00\x00\x00\x00@\x84#\
-\x00\x02\x00\x00\x00\x00\x00\x88p\x04@\x00\x00\x00\x00\x00\
-\x00\x11\x8e\x00\x08\x00\x00\x00\x00\x00 \xc2\x11\x00\x01\x00\
-\x00\x00\x00\x00D8\x02 \x00\x00\x00\x00\x00\x80\x08G\
-\x00\x04\x00\x00\x00\x00\x00\x10\xe1\x08\x80\x00\x00\x00\x00\x00\
-\x00\x22\x1c\x01\x10\x00\x00\x00\x00\x00@\x84#\x00\x02\x00\
-\x00\x00\x00\x00\x88p\x04@\x00\x00\x00\x00\x00\x00\x11\x8e\
-\x00\x08\x00\x00\x00\x00\x00 \xc2\x11\x00\x01\x00\x00\x00\x00\
-\x00D8\x02 \x00\x00\x00\x00\x00\x80\x08G\x00\x04\x00\
-\x00\x00\x00\x00\x10\xe1\x08\x80\x00\x00\x00\x00\x00\x00\x22\x1c\
-\x01\x10\x00\x00\x00\x00\x00@\x84#\x00\x02\x00\x00\x00\x00\
-\x00\x88p\x04@\x00\x00\x00\x00\x00\x00\x11\x8e\x00\x08\x00\
-\x00\x00\x00\x00 \xc2\x11\x00\x01\x00\x00\x00\x00\x00D8\
-\x02 \x00\x00\x00\x00\x00\x80\x08G\x00\x04\x00\x00\x00\x00\
-\x00\x10\xe1\x08\x80\x00\x00\x00\x00\x00\x00\x22\x1c\x01\x10\x00\
-\x00\x00\x00\x00@\x84#\x00\x02\x00\x00\x00\x00\x00\x88p\
-\x04@\x00\x00\x00\x00\x00\x00\x11\x8e\x00\x08\x00\x00\x00\x00\
-\x00 \xc2\x11\x00\x01\x00\x00\x00\x00\x00D8\x02 \x00\
-\x00\x00\x00\x00\x80\x08G\x00\x04\x00\x00\x00\x00\x00\x10\xe1\
-\x08\x80\x00\x00\x00\x00\x00\x00\x22\x1c\x01\x10\x00\x00\x00\x00\
-\x00@\x84#\x00\x02\x00\x00\x00\x00\x00\x88p\x04@\x00\
-\x00\x00\x00\x00\x00\x11\x8e\x00\x08\x00\x00\x00\x00\x00 \xc2\
-\x11\x00\x01\x00\x00\x00\x00\x00D8\x02 \x00\x00\x00\x00\
-\x00\x80\x08G\x00\x04\x00\x00\x00\x00\x00\x10\xe1\x08\x80\x00\
-\x00\x00\x00\x00\x00\x22\x1c\x01\x10\x00\x00\x00\x00\x00@\x84\
-#\x00\x02\x00\x00\x00\x00\x00\x88p\x04@\x00\x00\x00\x00\
-\x00\x00\x11\x8e\x00\x08\x00\x00\x00\x00\x00 \xc2\x11\x00\x01\
-\x00\x00\x00\x00\x00D8\x02 \x00\x00\x00\x00\x00\x80\x08\
-G\x00\x04\x00\x00\x00\x00\x00\x10\xe1\x08\x80\x00\x00\x00\x00\
-\x00\x00\x22\x1c\x01\x10\x00\x00\x00\x00\x00@\x84#\x00\x02\
-\x00\x00\x00\x00\x00\x88p\x04@\x00\x00\x00\x00\x00\x00\x11\
-\x8e\x00\x08\x00\x00\x00\x00\x00 \xc2\x11\x00\x01\x00\x00\x00\
-\x00\x00D8\x02 \x00\x00\x00\x00\x00\x80\x08G\x00\x04\
-\x00\x00\x00\x00\x00\x10\xe1\x08\x80\x00\x00\x00\x00\x00\x00\x22\
-\x1c\x01\x10\x00\x00\x00\x00\x00@\x84#\x00\x02\x00\x00\x00\
-\x00\x00\x88p\x04@\x00\x00\x00\x00\x00\x00\x11\x8e\x00\x08\
-\x00\x00\x00\x00\x00 \xc2\x11\x00\x01\x00\x00\x00\x00\x00D\
-8\x02 \x00\x00\x00\x00\x00\x80\x08G\x00\x04\x00\x00\x00\
-\x00\x00\x10\xe1\x08\x80\x00\x00\x00\x00\x00\x00\x22\x1c\x01\x10\
-\x00\x00\x00\x00\x00@\x84#\x00\x02\x00\x00\x00\x00\x00\x88\
-p\x04@\x00\x00\x00\x00\x00\x00\x11\x8e\x00\x08\x00\x00\x00\
-\x00\x00 \xc2\x11\x00\x01\x00\x00\x00\x00\x00D8\x02 \
-\x00\x00\x00\x00\x00\x80\x08G\x00\x04\x00\x00\x00\x00\x00\x10\
-\xe1\x08\x80\x00\x00\x00\x00\x00\x00\x22\x1c\x01\x10\x00\x00\x00\
-\x00\x00@\x84#\x00\x02\x00\x00\x00\x00\x00\x88p\x04@\
-\x00\x00\x00\x00\x00\x00\x11\x8e\x00\x08\x00\x00\x00\x00\x00 \
-\xc2\x11\x00\x01\x00\x00\x00\x00\x00D8\x02 \x00\x00\x00\
-\x00\x00\x80\x08G\x00\x04\x00\x00\x00\x00\x00\x10\xe1\x08\x80\
-\x00\x00\x00\x00\x00\x00\x22\x1c\x01\x10\x00\x00\x00\x00\x00@\
-\x84#\x00\x02\x00\x00\x00\x00\x00\x88p\x04@\x00\x00\x00\
-\x00\x00\x00\x11\x8e\x00\x08\x00\x00\x00\x00\x00 \xc2\x11\x00\
-\x01\x00\x00\x00\x00\x00D8\x02 \x00\x00\x00\x00\x00\x80\
-\x08G\x00\x04\x00\x00\x00\x00\x00\x10\xe1\x08\x80\x00\x00\x00\
-\x00\x00\x00\x22\x1c\x01\x10\x00\x00\x00\x00\x00@\x84#\x00\
-\x02\x00\x00\x00\x00\x00\x88p\x04@\x00\x00\x00\x00\x00\x00\
-\x11\x8e\x00\x08\x00\x00\x00\x00\x00 \xc2\xa9\xddnwS\
-\xcf\x01\x00\x00\x00\x00\x00\x00\xe1\xe2v\xbb\xb5\xf1\xf1\xf1\
-v\xbb\xbd\xa9g\x02\x00\x00\x00\x00\x00\x80\xb00\x9b\xcd\
-\xff\x0f\xe6,+\x9d\x14>\xf8N\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x0c\
-\x0f\xce\xb9'\
-\x00O\
-\x00B\x00D\x002\x00L\x00o\x00g\x00o\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x08QR\xa7\
-\x00m\
-\x00a\x00i\x00n\x00I\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00.\x00\x00\x00\x00\x00\x01\x00\x00T\xad\
-\x00\x00\x01\x95b|#;\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x95b|#:\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -6,8 +6,15 @@ import obd
 import subprocess
 import time
 
+from obd_custom_pids import load_custom_pids
+from obd_trip import TripComputer
+from obd_stats import StatisticsRegistry
+from obd_catalyst import CatalystAnalyzer
+from obd_dtc_db import DtcDatabase
+
 class ObdReader:
-    def __init__(self, commandsFile, commandsImpFile, commandsMILFile, port="/dev/tty.Android-Vlink"): # ls /dev/tty.* (falls der port nicht existiert)
+    def __init__(self, commandsFile, commandsImpFile, commandsMILFile, port="/dev/tty.Android-Vlink",
+                 commandsCustomFile="commandsCustom.json"): # ls /dev/tty.* (falls der port nicht existiert)
         # also "ls /dev/tty.*" in terminal
         # Automatisch ble-serial starten
 
@@ -16,8 +23,10 @@ class ObdReader:
         self.speedValue = None
         self.rpmValue = None
         self.fuelRate = None
-        self.consumptionHistory = []
-        self.valueHistory = {}
+        self.statistics = StatisticsRegistry()  # Streaming-Statistik pro PID ohne gespeicherten Verlauf
+        self.catalystAnalyzer = CatalystAnalyzer()  # Kat-Bewertung aus gepufferten O2-Werten
+        self.dtcDatabase = DtcDatabase()  # Fehlercode-Texte inkl. Opel-spezifischer Codes
+        self.tripComputer = TripComputer()  # Integriert Verbrauch und Strecke über die Zeit
 
         # Log-Ordner erstellen, falls er nicht existiert
         self.logFolder = os.path.join(os.getcwd(), "logs")
@@ -47,12 +56,15 @@ class ObdReader:
             print(f"❌ Fehler beim Verbinden: {e}")
             self.connection = None
 
+        # Custom PIDs einmalig kompilieren (z.B. Opel 22 1941 / 22 1945)
+        self.customCommands, self.customPlans = load_custom_pids(commandsCustomFile, lambda msg: print(f"⚠️ {msg}"))
+
         # Commands aus Datei laden
-        self.commandsAll = self.loadCommands(commandsFile)
-        self.commandsImportant = self.loadCommands(commandsImpFile)
-        self.commandsMIL = self.loadCommands(commandsMILFile)
+        self.commandsAll = self.loadCommands(commandsFile, "all")
+        self.commandsImportant = self.loadCommands(commandsImpFile, "important")
+        self.commandsMIL = self.loadCommands(commandsMILFile, "mil")
 
-    def loadCommands(self, filename):
+    def loadCommands(self, filename, plan=None):
         """Lädt OBD-Befehle aus einer Datei, aber nur wenn eine Verbindung existiert."""
         if not self.connection or not self.connection.is_connected():
             print(f"⚠️ Keine OBD-Verbindung - Überspringe das Laden von {filename}")
@@ -64,7 +76,9 @@ class ObdReader:
                 for line in file:
                     cmdName = line.strip()
                     if cmdName and not cmdName.startswith("#"):
-                        if hasattr(obd.commands, cmdName):
+                        if cmdName in self.customCommands:
+                            commands.append(self.customCommands[cmdName])
+                        elif hasattr(obd.commands, cmdName):
                             cmd = getattr(obd.commands, cmdName)
                             commands.append(cmd)
                         else:
@@ -73,6 +87,11 @@ class ObdReader:
             print(f"❌ Datei {filename} nicht gefunden.")
             return []
 
+        # Custom PIDs des Plans mit abfragen
+        for cmd in self.customPlans.get(plan, []):
+            if cmd not in commands:
+                commands.append(cmd)
+
         return commands
 
     def handleResponse(self, command):
@@ -81,7 +100,8 @@ class ObdReader:
             print(f"❌ Keine OBD-Verbindung! Kann {command.name} nicht auslesen.")
             return
 
-        response = self.connection.query(command)
+        # Custom PIDs stehen nicht in den unterstützten PIDs und müssen erzwungen werden
+        response = self.connection.query(command, force=command.name in self.customCommands)
 
         if response.is_null():
             print(f"{command.name:<20} ❌ Keine Daten empfangen")
@@ -104,17 +124,22 @@ class ObdReader:
         # Werte für Verbrauchsberechnung speichern
         if command == obd.commands.MAF:
             self.mafValue = value
+            self.tripComputer.add_maf(value)
             print(f"✅ MAF-Wert gesetzt: {self.mafValue}")
         elif command == obd.commands.SPEED:
             self.speedValue = value
+            self.tripComputer.add_speed(value)
             print(f"✅ Geschwindigkeitswert gesetzt: {self.speedValue}")
+        elif command == obd.commands.FUEL_RATE:
+            self.fuelRate = value
+            self.tripComputer.add_fuel_rate(value)
         elif command == obd.commands.RPM:
             self.rpmValue = value
 
-        # Speicherung der Werte in `valueHistory`
-        if command.name not in self.valueHistory:
-            self.valueHistory[command.name] = []
-        self.valueHistory[command.name].append(float(value))  # Speichere Wert für Durchschnitt
+        # Wert in die Streaming-Statistik übernehmen (nur numerische Werte)
+        if isinstance(value, (int, float)):
+            self.statistics.add(command.name, float(value))
+            self.catalystAnalyzer.add(command.name, float(value), time.monotonic())
 
         # **Jede 60 Sekunden Durchschnitt berechnen & speichern**
         if time.time() - self.timerConsumption >= 60:
@@ -201,23 +226,18 @@ class ObdReader:
         except KeyboardInterrupt:
             self.stopReading()
 
-    import obd
-
     def readMIL(self):
         """
         Liest die Service-relevanten OBD-Werte aus.
 
-        Diese Methode fragt regelmäßig alle in `commandsMIL` gespeicherten Standard-PIDs ab.
-        Zusätzlich werden zwei Custom PIDs für `FUEL_STATUS` (PID 22 1941) und `OIL_TEMP` (PID 22 1945) abgefragt,
-        die spezifisch für Opel-Fahrzeuge getestet werden.
+        Diese Methode fragt regelmäßig alle in `commandsMIL` gespeicherten PIDs ab.
+        Dazu gehören auch die Custom PIDs aus `commandsCustom.json` mit dem Plan "mil",
+        z.B. `OPEL_FUEL_STATUS` (PID 22 1941) und `OPEL_OIL_TEMP` (PID 22 1945).
+        Diese werden beim Start einmalig kompiliert und wie Standard-PIDs behandelt.
 
         Die Werte werden in der Konsole ausgegeben. Falls keine Daten verfügbar sind, wird eine Fehlermeldung angezeigt.
         Die Abfrage läuft in einer Endlosschleife und kann mit `Strg+C` gestoppt werden.
 
-        Custom PIDs:
-        - `FUEL_STATUS`: Gibt den aktuellen Status des Kraftstoffsystems zurück.
-        - `OIL_TEMP`: Gibt die aktuelle Öltemperatur in Grad Celsius zurück.
-
         Alle Werte werden zusätzlich in `printAndLogConsumption()` geloggt.
 
         Ausnahmebehandlung:
@@ -229,35 +249,7 @@ class ObdReader:
         try:
             while True:
                 for cmd in self.commandsMIL:
-                    self.handleResponse(cmd)  # Originale MIL-Werte ausführen
-
-                # **Custom Fuel Status (PID 22 1941)**
-                CMD_FUEL_STATUS = obd.OBDCommand(
-                    "FUEL_STATUS",
-                    "Fuel Status",
-                    b"221941",
-                    2,
-                    lambda x: int.from_bytes(x, byteorder="big")  # Konvertiert Bytes zu Integer
-                )
-                response_fuel = self.connection.query(CMD_FUEL_STATUS)
-                if response_fuel and not response_fuel.is_null():
-                    print(f"✅ FUEL_STATUS: {response_fuel.value}")
-                else:
-                    print("❌ Keine Daten für FUEL_STATUS verfügbar.")
-
-                # **Custom Oil Temperature (PID 22 1945)**
-                CMD_OIL_TEMP = obd.OBDCommand(
-                    "OIL_TEMP",
-                    "Oil Temperature",
-                    b"221945",
-                    2,
-                    lambda x: int.from_bytes(x, byteorder="big") - 40  # Offset -40 für Öltemperatur
-                )
-                response_oil = self.connection.query(CMD_OIL_TEMP)
-                if response_oil and not response_oil.is_null():
-                    print(f"✅ OIL_TEMP: {response_oil.value} °C")
-                else:
-                    print("❌ Keine Daten für OIL_TEMP verfügbar.")
+                    self.handleResponse(cmd)
 
                 self.printAndLogConsumption()  # Verbrauch berechnen und loggen
                 print("-" * 30)
@@ -327,46 +319,28 @@ class ObdReader:
             print(f"\n📄 Log-Datei gespeichert unter: {log_file}")
 
     def checkCatalystHealth(self):
-        """Überprüft, ob der Katalysator oder die Lambdasonden defekt sind."""
-        if not self.connection or not self.connection.is_connected():
-            print("❌ Keine OBD-Verbindung. Katalysator-Check nicht möglich.")
-            return
-
-        # Abfrage der Lambdawerte
-        sensor_b1s1 = self.connection.query(obd.commands.O2_B1S1)
-        sensor_b1s2 = self.connection.query(obd.commands.O2_B1S2)
+        """Überprüft anhand der gepufferten O2-Werte, ob der Katalysator oder die Lambdasonden defekt sind.
 
-        # Falls keine Daten vorliegen
-        if sensor_b1s1.is_null() or sensor_b1s2.is_null():
-            print("⚠️ O2-Sensordaten nicht verfügbar.")
+        Es werden keine zusätzlichen Abfragen gesendet; O2_B1S1 und O2_B1S2 müssen
+        dazu in der Befehlsliste stehen.
+        """
+        result = self.catalystAnalyzer.evaluate()
+        if result is None:
+            print("⚠️ Noch nicht genug O2-Sensordaten für den Katalysator-Check.")
             return
 
-        # Extrahiere Spannungswerte
-        voltage_b1s1 = sensor_b1s1.value.magnitude
-        voltage_b1s2 = sensor_b1s2.value.magnitude
-
-        # Prüflogik
-        status = "⚠️ Unklar"
-        if 0.1 <= voltage_b1s1 <= 0.9:
-            if abs(voltage_b1s2 - voltage_b1s1) > 0.1:  # Schwankt B1S2 nicht?
-                status = "✅ Kat in Ordnung"
-            else:
-                status = "❌ Kat defekt!"
-        else:
-            status = "❌ Lambdasonde defekt!"
-
         # Ausgabe mit Formatierung
         print("\n================= Katalysator-Check =================")
-        print(f"🔧 O2_B1S1 (VOR Kat) = {voltage_b1s1:.3f} V")
-        print(f"🔧 O2_B1S2 (NACH Kat) = {voltage_b1s2:.3f} V")
-        print(f"🔍 Status: {status}")
+        print(f"🔧 Schaltfrequenz VOR/NACH Kat = {result.switch_freq_up:.2f} / {result.switch_freq_down:.2f} Hz")
+        print(f"🔧 Amplitudenverhältnis = {result.amplitude_ratio:.2f}, Korrelation = {result.correlation:.2f}")
+        print(f"🔍 Status: {result.status} (Score {result.score:.0f} %)")
         print("=====================================================\n")
 
         # Log in Datei speichern
         log_path = os.path.join(self.logFolder, "catalyst_log.txt")
         with open(log_path, "a") as log:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log.write(f"[{timestamp}] O2_B1S1 = {voltage_b1s1:.3f} V, O2_B1S2 = {voltage_b1s2:.3f} V, Status: {status}\n")
+            log.write(f"[{timestamp}] {result}\n")
 
     def scanAllPids(self):
         if not self.connection or not self.connection.is_connected():
@@ -422,20 +396,22 @@ class ObdReader:
             print(f"\n📄 Log-Datei gespeichert unter: {logFile}")
 
     def logConsumption(self):
-        """Speichert den durchschnittlichen Verbrauch in die Logdatei."""
-        if not self.consumptionHistory:
+        """Speichert die über die Zeit integrierten Verbrauchswerte in die Logdatei."""
+        trip = self.tripComputer.trip
+        rolling = self.tripComputer.rolling
+        if rolling.consumption is None:
             return
 
-        avgConsumption = sum(self.consumptionHistory) / len(self.consumptionHistory)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         logPath = os.path.join(self.logFolder, "consumption_log.txt")
 
         with open(logPath, "a") as log:
-            log.write(f"[{timestamp}] Durchschnittlicher Verbrauch: {avgConsumption:.2f} L/100km\n")
+            log.write(f"[{timestamp}] Verbrauch {self.tripComputer.window:.0f}s: {rolling.consumption:.2f} L/100km, "
+                      f"Fahrt: {trip.consumption or 0.0:.2f} L/100km, "
+                      f"{trip.distance_km:.2f} km, {trip.fuel_l:.2f} L\n")
 
-        print(f"✅ Verbrauchslog gespeichert: {avgConsumption:.2f} L/100km")
-        self.consumptionHistory = []  # Verlauf zurücksetzen
+        print(f"✅ Verbrauchslog gespeichert: {rolling.consumption:.2f} L/100km")
 
     def calculateFuelConsumption(self, maf, speed):
         """ Berechnet den Momentanverbrauch in L/100 km mit MAF. Gibt immer eine gültige Zahl zurück. """
@@ -474,10 +450,8 @@ class ObdReader:
         consumption = self.calculateFuelConsumption(self.mafValue, self.speedValue)
         print(f"\n📊 Momentanverbrauch: {consumption:.2f} L/100km\n")
 
-        # Nur loggen, wenn der Wert > 0.0 ist (damit keine unnötigen Nullwerte gespeichert werden)
+        # Nur loggen, wenn gefahren wird (damit keine unnötigen Nullwerte gespeichert werden)
         if consumption > 0.0:
-            self.consumptionHistory.append(consumption)
-            avgConsumption = sum(self.consumptionHistory) / len(self.consumptionHistory)
             self.logConsumption()
 
     def startReconnectLog(self):
@@ -492,28 +466,29 @@ class ObdReader:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log.write(f"[{timestamp}] {message}\n")
 
-    def logAverageValues(self):
-        """Berechnet und speichert Durchschnittswerte aller gesammelten Messungen."""
-        if not self.valueHistory:
+    def logAverageValues(self, window=60):
+        """Speichert Durchschnitt, Min/Max und Streuung der letzten `window` Sekunden aller Messungen."""
+        summaries = self.statistics.summaries(window)
+        if not summaries:
             return
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        averages = {key: sum(values) / len(values) for key, values in self.valueHistory.items() if values}
-
         logPath = os.path.join(self.logFolder, "average_log.txt")
 
         with open(logPath, "a") as log:
-            log.write(f"\n[{timestamp}] Durchschnittswerte:\n")
-            for key, avg in averages.items():
-                log.write(f"{key}: {avg:.2f}\n")
+            log.write(f"\n[{timestamp}] Durchschnittswerte ({window}s):\n")
+            for key, summary in summaries.items():
+                log.write(f"{key}: {summary['mean']:.2f} (min {summary['min']:.2f}, max {summary['max']:.2f}, "
+                          f"σ {summary['std']:.2f}, p95 {summary['p95']:.2f})\n")
             log.write("\n")
 
+        averages = {key: round(summary["mean"], 2) for key, summary in summaries.items()}
         print(f"✅ Durchschnittswerte gespeichert: {averages}")
-        self.valueHistory = {}  # Verlauf zurücksetzen
 
     def logSingleValues(self):
         """Speichert jede einzelne Messung."""
-        if not self.valueHistory:
+        names = self.statistics.names()
+        if not names:
             return
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -521,8 +496,8 @@ class ObdReader:
 
         with open(logPath, "a") as log:
             log.write(f"[{timestamp}] Messwerte:\n")
-            for key, values in self.valueHistory.items():
-                log.write(f"{key}: {values[-1]:.2f}\n")  # Letzter Wert wird gespeichert
+            for key in names:
+                log.write(f"{key}: {self.statistics.get(key).last_value:.2f}\n")  # Letzter Wert wird gespeichert
             log.write("\n")
 
         print(f"✅ Einzelwerte gespeichert.")
@@ -547,11 +522,13 @@ class ObdReader:
         dtcResponse = self.connection.query(obd.commands.GET_DTC)
         if not dtcResponse.is_null():
             print("Diagnose-Fehlercodes:")
+            descriptions = self.dtcDatabase.describe_many([code[0] for code in dtcResponse.value])
             with open("dtc_log.txt", "a") as log:
                 log.write(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 for code in dtcResponse.value:
-                    print(f"{code[0]} - {code[1]}")
-                    log.write(f"{code[0]} - {code[1]}\n")
+                    description = descriptions[code[0]] or code[1]
+                    print(f"{code[0]} - {description}")
+                    log.write(f"{code[0]} - {description}\n")
             print("Fehlercodes in dtc_log.txt gespeichert.")
         else:
             print("Keine Fehlercodes gefunden.")
@@ -0,0 +1,153 @@
+import random
+from collections import namedtuple
+
+import numpy as np
+import obd
+from obd import decoders
+from obd.UnitsAndScaling import UAS_IDS
+from obd.protocols.protocol import Message
+
+# Lineare J1979-Formel: ((Bytes[start:start+length] als Integer) * scale) + offset
+# Die Position bezieht sich auf die Nutzdaten hinter Mode- und PID-Echo.
+Formula = namedtuple("Formula", ["start", "length", "signed", "scale", "offset", "unit"])
+
+# Decoder aus python-obd, die sich als lineare Formel ausdrücken lassen.
+# length=None bedeutet: gesamte Nutzdaten (python-obd nutzt dort bytes_to_int(d))
+_LINEAR_DECODERS = {
+    decoders.percent: (0, 1, False, 100.0 / 255.0, 0.0, "percent"),
+    decoders.percent_centered: (0, 1, False, 100.0 / 128.0, -100.0, "percent"),
+    decoders.temp: (0, None, False, 1.0, -40.0, "celsius"),
+    decoders.current_centered: (2, 2, False, 1.0 / 256.0, -128.0, "milliampere"),
+    decoders.sensor_voltage: (0, 1, False, 1.0 / 200.0, 0.0, "volt"),
+    decoders.sensor_voltage_big: (2, 2, False, 8.0 / 65535, 0.0, "volt"),
+    decoders.fuel_pressure: (0, 1, False, 3.0, 0.0, "kilopascal"),
+    decoders.pressure: (0, 1, False, 1.0, 0.0, "kilopascal"),
+    decoders.abs_evap_pressure: (0, None, False, 1.0 / 200.0, 0.0, "kilopascal"),
+    decoders.evap_pressure_alt: (0, None, False, 1.0, -32767.0, "pascal"),
+    decoders.timing_advance: (0, 1, False, 0.5, -64.0, "degree"),
+    decoders.inject_timing: (0, None, False, 1.0 / 128.0, -210.0, "degree"),
+    decoders.max_maf: (0, 1, False, 10.0, 0.0, "gps"),
+    decoders.fuel_rate: (0, None, False, 0.05, 0.0, "liters_per_hour"),
+    decoders.absolute_load: (0, None, False, 100.0 / 255.0, 0.0, "percent"),
+}
+
+
+def _formula_for_command(cmd):
+    """Leitet die lineare Formel eines Mode-01-Befehls aus seinem python-obd-Decoder ab."""
+    payload_length = cmd.bytes - 2
+    decode = cmd.decode
+
+    if getattr(decode, "func", None) is decoders.decode_uas:
+        uas = UAS_IDS[decode.keywords["id_"]]
+        return Formula(0, payload_length, uas.signed, uas.scale, uas.offset, str(uas.unit))
+
+    spec = _LINEAR_DECODERS.get(decode)
+    if spec is None:
+        return None
+
+    start, length, signed, scale, offset, unit = spec
+    return Formula(start, payload_length if length is None else length, signed, scale, offset, unit)
+
+
+def _build_formula_table():
+    """Erstellt die Formel-Tabelle für alle linearen Mode-01-PIDs."""
+    table = {}
+    for cmd in obd.commands[1]:
+        if cmd is None:
+            continue
+        formula = _formula_for_command(cmd)
+        if formula is not None:
+            table[cmd.name] = formula
+    return table
+
+
+FORMULAS = _build_formula_table()
+
+
+def payloads_to_array(payloads, width):
+    """Wandelt rohe Antworten (bytes, bytearray oder Hex-String) in ein uint8-Array der Form (N, width).
+
+    Wie python-obd werden zu kurze Antworten mit Nullen aufgefüllt und zu lange abgeschnitten.
+    Ein bereits vorhandenes 2D-uint8-Array wird ohne Kopie durchgereicht.
+    """
+    if isinstance(payloads, np.ndarray) and payloads.ndim == 2:
+        if payloads.shape[1] >= width:
+            return payloads[:, :width]
+        padded = np.zeros((payloads.shape[0], width), dtype=np.uint8)
+        padded[:, :payloads.shape[1]] = payloads
+        return padded
+
+    rows = [bytes.fromhex(p) if isinstance(p, str) else bytes(p) for p in payloads]
+
+    # Schneller Pfad: alle Antworten gleich lang → ein einziger frombuffer-Aufruf
+    if rows and all(len(r) == width for r in rows):
+        return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), width)
+
+    array = np.zeros((len(rows), width), dtype=np.uint8)
+    for i, row in enumerate(rows):
+        row = row[:width]
+        array[i, :len(row)] = np.frombuffer(row, dtype=np.uint8)
+    return array
+
+
+def decode_formula(formula, data, echo=2):
+    """Wendet eine lineare Formel auf ein uint8-Array (N, Breite) in einem Durchlauf an."""
+    start = echo + formula.start
+    raw = np.zeros(data.shape[0], dtype=np.int64)
+    for i in range(formula.length):
+        raw = (raw << 8) | data[:, start + i]
+
+    if formula.signed:
+        bits = 8 * formula.length
+        raw = np.where(raw >= (1 << (bits - 1)), raw - (1 << bits), raw)
+
+    return raw * formula.scale + formula.offset
+
+
+def decode_bulk(name, payloads):
+    """Dekodiert alle Antworten eines PIDs auf einmal und gibt die Beträge als float64-Array zurück.
+
+    Die Antworten enthalten wie `Message.data` in python-obd das Mode- und PID-Echo (z.B. 41 0C ...).
+    """
+    formula = FORMULAS.get(name)
+    if formula is None:
+        raise KeyError(f"Für {name} gibt es keine vektorisierbare Formel.")
+
+    width = 2 + formula.start + formula.length
+    return decode_formula(formula, payloads_to_array(payloads, width))
+
+
+def decode_many(payloads_by_pid):
+    """Dekodiert mehrere PIDs; Eingabe und Ausgabe sind Dicts Name -> Antworten bzw. Array."""
+    return {name: decode_bulk(name, payloads) for name, payloads in payloads_by_pid.items()}
+
+
+def verify_against_obd(samples=256, seed=0):
+    """Vergleicht die Bulk-Dekodierung mit den python-obd-Decodern und gibt Abweichungen zurück."""
+    rng = random.Random(seed)
+    mismatches = {}
+
+    for name, formula in FORMULAS.items():
+        cmd = obd.commands[name]
+        echo = bytes([0x41, cmd.pid])
+        payloads = [echo + bytes(rng.randrange(256) for _ in range(cmd.bytes - 2)) for _ in range(samples)]
+        bulk = decode_bulk(name, payloads)
+
+        for payload, value in zip(payloads, bulk):
+            message = Message([])
+            message.data = bytearray(payload)
+            expected = cmd.decode([message]).magnitude
+            if not np.isclose(value, expected, rtol=1e-9, atol=1e-9):
+                mismatches[name] = (payload.hex(), float(value), float(expected))
+                break
+
+    return mismatches
+
+
+if __name__ == "__main__":
+    result = verify_against_obd()
+    if result:
+        for name, (payload, value, expected) in result.items():
+            print(f"❌ {name:<25} {payload}: {value} != {expected}")
+    else:
+        print(f"✅ {len(FORMULAS)} PIDs stimmen mit den python-obd-Decodern überein.")
@@ -0,0 +1,244 @@
+import argparse
+import binascii
+import threading
+import time
+
+import serial
+
+from obd_logger import ObdLogger
+from obd_metrics import MetricsRegistry
+
+# ELM327-Protokolle mit 29-Bit-Identifiern (ISO 15765-4 bzw. SAE J1939), sonst 11 Bit
+EXTENDED_PROTOCOLS = ("7", "9", "A")
+
+_metrics = MetricsRegistry.instance()
+CAN_FRAMES = _metrics.counter("obd_can_frames_total", "Empfangene CAN-Frames im Monitor-Modus")
+CAN_ERRORS = _metrics.counter("obd_can_errors_total", "Fehlerzeilen im Monitor-Modus", ("kind",))
+
+
+def parse_frames(buffer, id_digits=3, timestamp=0.0, ids=None, code=None, mask=None, counts=None):
+    """Zerlegt alle vollständigen Zeilen in `buffer` (bytearray) in CAN-Frames.
+
+    Erwartet die Ausgabe von ATMA mit ATH1, ATS0 und ATCAF0: je Zeile Identifier
+    (`id_digits` Hex-Zeichen) und Nutzdaten ohne Leerzeichen, Ende mit CR. Die
+    Zeilen werden direkt im Puffer über einen memoryview gelesen; pro Frame
+    entsteht nur das Nutzdaten-Objekt. Gefiltert wird vor dem Dekodieren der
+    Nutzdaten: `ids` (Menge) und/oder `(can_id & mask) == code` wie bei ATCF/ATCM.
+    `counts` (Dict ID → Anzahl) zählt alle gültigen Frames vor dem Filter.
+
+    Gibt (Frames, Fehlerzeilen, verbrauchte Bytes) zurück; Frames sind Tupel
+    (timestamp, can_id, payload). Der Rest einer unvollständigen Zeile bleibt
+    für den nächsten Aufruf im Puffer.
+    """
+    frames = []
+    errors = []
+    start = 0
+    find = buffer.find
+    unhexlify = binascii.unhexlify
+    with memoryview(buffer) as view:
+        while True:
+            end = find(b"\r", start)
+            if end < 0:
+                break
+            line_start, start = start, end + 1
+            if end - line_start > id_digits:
+                try:
+                    can_id = int(buffer[line_start:line_start + id_digits], 16)
+                except ValueError:
+                    errors.append(bytes(view[line_start:end]))
+                    continue
+                if counts is not None:
+                    counts[can_id] = counts.get(can_id, 0) + 1
+                if ids is not None and can_id not in ids:
+                    continue
+                if mask is not None and can_id & mask != code:
+                    continue
+                try:
+                    payload = unhexlify(view[line_start + id_digits:end])
+                except binascii.Error:
+                    if counts is not None:
+                        counts[can_id] -= 1
+                        if not counts[can_id]:
+                            del counts[can_id]
+                    errors.append(bytes(view[line_start:end]))
+                    continue
+                frames.append((timestamp, can_id, payload))
+            elif end > line_start:
+                errors.append(bytes(view[line_start:end]))
+    return frames, errors, start
+
+
+class CanRateCounter:
+    """Frames pro Sekunde je CAN-ID über das Intervall seit dem letzten Aufruf von rates().
+
+    Der Lese-Thread zählt in ein eigenes Dict und übergibt es mit add(); rates()
+    tauscht die gesammelten Zähler unter demselben Lock aus.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._since = time.monotonic()
+
+    def add(self, counts):
+        with self._lock:
+            current = self._counts
+            for can_id, count in counts.items():
+                current[can_id] = current.get(can_id, 0) + count
+
+    def rates(self):
+        with self._lock:
+            now = time.monotonic()
+            counts, self._counts = self._counts, {}
+        elapsed = max(now - self._since, 1e-9)
+        self._since = now
+        for can_id, count in counts.items():
+            self.totals[can_id] = self.totals.get(can_id, 0) + count
+        return {can_id: count / elapsed for can_id, count in counts.items()}
+
+
+class CanMonitor:
+    """Passiver Mitschnitt des CAN-Busses über ATMA (bzw. STMA bei STN-Adaptern).
+
+    Der Monitor öffnet die serielle Schnittstelle selbst, eine python-obd-Verbindung
+    auf demselben Port muss vorher geschlossen werden. Ein Lese-Thread holt alle
+    verfügbaren Bytes auf einmal, zerlegt sie mit parse_frames() und übergibt die
+    Frames gebündelt an `callback(frames)`; der Zeitstempel ist der Empfangszeitpunkt
+    des Blocks (time.monotonic()), da ATMA selbst keine Zeitstempel liefert.
+    Läuft der Puffer des Adapters über (BUFFER FULL), wird ATMA neu gestartet;
+    Hardware-Filter (`code`/`mask` → ATCF/ATCM) entlasten die Schnittstelle.
+    """
+
+    def __init__(self, port, baudrate=38400, protocol="6", callback=None, ids=None, code=None, mask=None,
+                 hardware_filter=True):
+        self.logger = ObdLogger()
+        self.port = port
+        self.baudrate = baudrate
+        self.protocol = protocol.upper()
+        self.callback = callback
+        self.ids = frozenset(ids) if ids else None
+        self.code = code
+        self.mask = mask
+        self.hardware_filter = hardware_filter and code is not None and mask is not None
+        self.id_digits = 8 if self.protocol in EXTENDED_PROTOCOLS else 3
+        self.rate_counter = CanRateCounter()
+        self.restarts = 0
+        self._serial = None
+        self._monitor_command = b"ATMA"
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _command(self, command, timeout=2.0):
+        """Sendet einen AT-Befehl und liest bis zum Prompt '>'."""
+        self._serial.reset_input_buffer()
+        self._serial.write(command + b"\r")
+        response = bytearray()
+        deadline = time.monotonic() + timeout
+        while b">" not in response and time.monotonic() < deadline:
+            response += self._serial.read(self._serial.in_waiting or 1)
+        return response.replace(b">", b"").decode("ascii", "replace").strip()
+
+    def _setup(self):
+        self._command(b"ATZ", timeout=5.0)
+        for command in (b"ATE0", b"ATL0", b"ATS0", b"ATH1", b"ATCAF0", b"ATSP" + self.protocol.encode()):
+            self._command(command)
+        if self.hardware_filter:
+            digits = self.id_digits
+            self._command(b"ATCF" + f"{self.code:0{digits}X}".encode())
+            self._command(b"ATCM" + f"{self.mask:0{digits}X}".encode())
+        # STN-Chips (OBDLink) puffern mit STMA deutlich mehr Frames als ein ELM327
+        if self._command(b"STI").startswith("STN"):
+            self._monitor_command = b"STMA"
+
+    def start(self):
+        self._serial = serial.Serial(self.port, self.baudrate, timeout=0.1)
+        self._setup()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._read_loop, name="obd-can-monitor", daemon=True)
+        self._thread.start()
+        self.logger.log_info(f"CAN-Monitor gestartet ({self._monitor_command.decode()}, Protokoll {self.protocol})")
+
+    def stop(self, timeout=2.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._serial is not None:
+            # Ein beliebiges Zeichen beendet den Monitor-Modus
+            self._serial.write(b"\r")
+            self._serial.close()
+            self._serial = None
+        self.logger.log_info("CAN-Monitor gestoppt")
+
+    def _read_loop(self):
+        buffer = bytearray()
+        self._serial.write(self._monitor_command + b"\r")
+        while not self._stop_event.is_set():
+            chunk = self._serial.read(self._serial.in_waiting or 1)
+            if not chunk:
+                continue
+            timestamp = time.monotonic()
+            buffer += chunk
+
+            counts = {}
+            frames, errors, consumed = parse_frames(buffer, self.id_digits, timestamp, self.ids, self.code,
+                                                    self.mask, counts)
+            del buffer[:consumed]
+            if counts:
+                self.rate_counter.add(counts)
+            if frames:
+                CAN_FRAMES.inc(amount=len(frames))
+                if self.callback is not None:
+                    self.callback(frames)
+
+            stopped = b">" in buffer
+            for line in errors:
+                if line.startswith(b"BUFFER FULL"):
+                    CAN_ERRORS.inc("buffer_full")
+                    stopped = True
+                elif line.startswith(b"STOPPED"):
+                    stopped = True
+                elif not line.startswith(b"ATMA") and not line.startswith(b"STMA"):
+                    CAN_ERRORS.inc("line")
+
+            if stopped:
+                # Der Adapter hat den Monitor-Modus verlassen → neu starten
+                buffer.clear()
+                self.restarts += 1
+                self._serial.write(self._monitor_command + b"\r")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CAN-Bus passiv mitschneiden (ATMA) und Frame-Raten anzeigen.")
+    parser.add_argument("port", help="Serieller Port des Adapters")
+    parser.add_argument("--baudrate", type=int, default=38400)
+    parser.add_argument("--protocol", default="6", help="ELM327-Protokoll (6 = CAN 11 Bit 500 kBit/s)")
+    parser.add_argument("--ids", help="Nur diese IDs, z.B. 7E8,7E9")
+    parser.add_argument("--filter", help="Hardware-Filter als CODE/MASKE, z.B. 7E0/7F0")
+    parser.add_argument("--print-frames", action="store_true", help="Jeden Frame ausgeben")
+    args = parser.parse_args()
+
+    ids = [int(can_id, 16) for can_id in args.ids.split(",")] if args.ids else None
+    code = mask = None
+    if args.filter:
+        code, mask = (int(part, 16) for part in args.filter.split("/"))
+
+    def print_frames(frames):
+        for timestamp, can_id, payload in frames:
+            print(f"{timestamp:.3f} {can_id:03X} {payload.hex(' ').upper()}")
+
+    monitor = CanMonitor(args.port, args.baudrate, args.protocol, print_frames if args.print_frames else None,
+                         ids, code, mask)
+    monitor.start()
+    try:
+        while True:
+            time.sleep(1)
+            rates = monitor.rate_counter.rates()
+            summary = "  ".join(f"{can_id:03X}:{rate:.0f}/s" for can_id, rate in sorted(rates.items()))
+            print(f"{sum(rates.values()):.0f} Frames/s  {summary}")
+    except KeyboardInterrupt:
+        monitor.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import numpy as np
+
+UPSTREAM = "O2_B1S1"  # Lambdasonde vor dem Kat
+DOWNSTREAM = "O2_B1S2"  # Lambdasonde nach dem Kat
+STOICH_VOLTAGE = 0.45  # Umschaltpunkt einer Sprungsonde in Volt
+
+
+class SampleRing:
+    """Ringpuffer fester Größe für (Zeit, Wert)-Paare auf NumPy-Basis."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._t = np.zeros(capacity)
+        self._v = np.zeros(capacity)
+        self._count = 0
+        self._pos = 0
+
+    def add(self, t, value):
+        self._t[self._pos] = t
+        self._v[self._pos] = value
+        self._pos = (self._pos + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def __len__(self):
+        return self._count
+
+    def since(self, start):
+        """Gibt die Samples ab `start` in zeitlicher Reihenfolge zurück."""
+        if self._count < self.capacity:
+            t, v = self._t[:self._count], self._v[:self._count]
+        else:
+            t = np.roll(self._t, -self._pos)
+            v = np.roll(self._v, -self._pos)
+        mask = t >= start
+        return t[mask], v[mask]
+
+
+class CatalystResult:
+    """Ergebnis einer Fensteranalyse der Lambdasonden."""
+
+    def __init__(self, score, status, switch_freq_up, switch_freq_down, amplitude_ratio, correlation, samples):
+        self.score = score
+        self.status = status
+        self.switch_freq_up = switch_freq_up
+        self.switch_freq_down = switch_freq_down
+        self.amplitude_ratio = amplitude_ratio
+        self.correlation = correlation
+        self.samples = samples
+
+    def __str__(self):
+        return (f"{self.status} (Score {self.score:.0f} %, Schaltfrequenz vor/nach Kat "
+                f"{self.switch_freq_up:.2f}/{self.switch_freq_down:.2f} Hz, "
+                f"Amplitudenverhältnis {self.amplitude_ratio:.2f}, Korrelation {self.correlation:.2f})")
+
+
+class CatalystAnalyzer:
+    """Bewertet Kat und Lambdasonden anhand der ohnehin gepollten O2-Spannungen.
+
+    Die Samples vor und nach dem Kat werden gepuffert und über die letzten
+    `window` Sekunden vektorisiert ausgewertet: Schaltfrequenz, Amplitudenverhältnis
+    und Kreuzkorrelation. Ein intakter Kat glättet das Signal nach dem Kat, daher
+    sprechen hohe Werte für einen verminderten Wirkungsgrad. Der Score wird über
+    mehrere Auswertungen geglättet, damit einzelne Ausreißer ihn nicht umwerfen.
+    Für aussagekräftige Schaltfrequenzen sollten die Sonden deutlich schneller als
+    die Schaltfrequenz (ca. 1 Hz) abgefragt werden.
+    """
+
+    def __init__(self, window=30.0, capacity=2048, resample_hz=10.0, max_lag=3.0, smoothing=0.2, min_samples=10):
+        self.window = window
+        self.resample_hz = resample_hz
+        self.max_lag = max_lag
+        self.smoothing = smoothing
+        self.min_samples = min_samples
+        self._sensors = {UPSTREAM: SampleRing(capacity), DOWNSTREAM: SampleRing(capacity)}
+        self._score = None
+        self._last_t = None
+
+    def add(self, name, voltage, t):
+        """Übernimmt eine O2-Spannung; andere PIDs werden ignoriert."""
+        ring = self._sensors.get(name)
+        if ring is None:
+            return False
+        ring.add(t, voltage)
+        self._last_t = t if self._last_t is None else max(self._last_t, t)
+        return True
+
+    @staticmethod
+    def _switch_frequency(t, v):
+        """Volle Schaltzyklen (fett → mager → fett) pro Sekunde."""
+        duration = t[-1] - t[0]
+        if duration <= 0:
+            return 0.0
+        rich = v > STOICH_VOLTAGE
+        return np.count_nonzero(rich[1:] != rich[:-1]) / (2 * duration)
+
+    def _correlation(self, t_up, v_up, t_down, v_down):
+        """Maximale normierte Kreuzkorrelation innerhalb von ±max_lag Sekunden."""
+        start = max(t_up[0], t_down[0])
+        end = min(t_up[-1], t_down[-1])
+        if end - start <= 1.0 / self.resample_hz:
+            return 0.0
+
+        grid = np.arange(start, end, 1.0 / self.resample_hz)
+        up = np.interp(grid, t_up, v_up)
+        down = np.interp(grid, t_down, v_down)
+        up -= up.mean()
+        down -= down.mean()
+
+        norm = np.sqrt(np.dot(up, up) * np.dot(down, down))
+        if norm == 0:
+            return 0.0
+
+        full = np.correlate(down, up, mode="full") / norm
+        center = len(up) - 1
+        lag = min(int(self.max_lag * self.resample_hz), center)
+        # Nur positive Verzögerungen: das Signal nach dem Kat folgt dem davor
+        return float(full[center:center + lag + 1].max())
+
+    def evaluate(self, now=None):
+        """Wertet das Fenster aus; gibt None zurück, solange zu wenige Daten vorliegen."""
+        now = self._last_t if now is None else now
+        if now is None:
+            return None
+
+        start = now - self.window
+        t_up, v_up = self._sensors[UPSTREAM].since(start)
+        t_down, v_down = self._sensors[DOWNSTREAM].since(start)
+        if len(t_up) < self.min_samples or len(t_down) < self.min_samples:
+            return None
+
+        freq_up = self._switch_frequency(t_up, v_up)
+        freq_down = self._switch_frequency(t_down, v_down)
+        spread_up = np.percentile(v_up, 95) - np.percentile(v_up, 5)
+        spread_down = np.percentile(v_down, 95) - np.percentile(v_down, 5)
+        amplitude_ratio = float(spread_down / spread_up) if spread_up > 0 else 0.0
+        switch_ratio = freq_down / freq_up if freq_up > 0 else 0.0
+        correlation = self._correlation(t_up, v_up, t_down, v_down)
+
+        # Je ähnlicher das Signal nach dem Kat dem davor ist, desto schlechter der Kat
+        penalty = 0.5 * min(amplitude_ratio, 1.0) + 0.25 * min(switch_ratio, 1.0) + 0.25 * max(correlation, 0.0)
+        raw_score = 100.0 * (1.0 - penalty)
+        if self._score is None:
+            self._score = raw_score
+        else:
+            self._score += self.smoothing * (raw_score - self._score)
+
+        if spread_up < 0.3 or freq_up == 0:
+            status = "❌ Lambdasonde vor Kat träge oder defekt!"
+        elif self._score < 40:
+            status = "❌ Kat defekt!"
+        elif self._score < 60:
+            status = "⚠️ Kat-Wirkungsgrad vermindert"
+        else:
+            status = "✅ Kat in Ordnung"
+
+        return CatalystResult(self._score, status, freq_up, freq_down, amplitude_ratio, correlation,
+                              len(t_up) + len(t_down))
@@ -0,0 +1,188 @@
+import json
+
+import obd
+
+# Pläne, in die ein Custom PID über "plans" eingehängt werden kann
+POLLING_PLANS = ("all", "important", "mil")
+
+
+class CustomPidError(ValueError):
+    """Fehlerhafte Definition eines Custom PIDs in der Konfigurationsdatei."""
+
+
+def _compile_decoder(name, echo, spec):
+    """Baut einmalig eine Decoder-Funktion für python-obd aus der Formel-Definition.
+
+    Die Antwort enthält vor den Nutzdaten das Echo aus Mode + 0x40 und PID,
+    daher beginnen die Daten bei `echo`. Formel: ((raw >> shift) & mask) * scale + offset
+    """
+    try:
+        length = int(spec.get("bytes", 1))
+        start = echo + int(spec.get("start", 0))
+        shift = int(spec.get("shift", 0))
+        mask = spec.get("mask")
+        if mask is not None:
+            mask = int(mask, 0) if isinstance(mask, str) else int(mask)
+        scale = float(spec.get("scale", 1))
+        offset = float(spec.get("offset", 0))
+    except (TypeError, ValueError) as e:
+        raise CustomPidError(f"{name}: Ungültiger Zahlenwert in 'formula' ({e}).")
+    end = start + length
+    byteorder = spec.get("byteorder", "big")
+    signed = bool(spec.get("signed", False))
+    unit_name = spec.get("unit")
+
+    if length < 1:
+        raise CustomPidError(f"{name}: 'bytes' muss mindestens 1 sein.")
+    if byteorder not in ("big", "little"):
+        raise CustomPidError(f"{name}: Unbekannte Byte-Reihenfolge '{byteorder}'.")
+
+    unit = None
+    if unit_name:
+        try:
+            unit = getattr(obd.Unit, unit_name)
+        except AttributeError:
+            raise CustomPidError(f"{name}: Unbekannte Einheit '{unit_name}'.")
+
+    # Rohwert aus den Bytes holen; Bitfeld nur, wenn es definiert ist
+    if mask is None and shift == 0:
+        def raw_value(data):
+            return int.from_bytes(data[start:end], byteorder, signed=signed)
+    else:
+        mask = (1 << (8 * length)) - 1 if mask is None else mask
+
+        def raw_value(data):
+            return (int.from_bytes(data[start:end], byteorder, signed=signed) >> shift) & mask
+
+    # Skalierung nur anwenden, wenn sie auch etwas ändert
+    if scale == 1 and offset == 0:
+        convert = raw_value
+    else:
+        def convert(data):
+            return raw_value(data) * scale + offset
+
+    if unit is None:
+        def decoder(messages):
+            return convert(messages[0].data)
+    else:
+        quantity = obd.Unit.Quantity
+
+        def decoder(messages):
+            return quantity(convert(messages[0].data), unit)
+
+    return decoder
+
+
+def compile_custom_pid(entry):
+    """Erzeugt aus einem Konfigurationseintrag ein fertiges OBDCommand."""
+    if not isinstance(entry, dict):
+        raise CustomPidError(f"Eintrag {entry!r} ist kein JSON-Objekt.")
+    try:
+        name = entry["name"]
+        request = entry["request"]
+    except KeyError as e:
+        raise CustomPidError(f"Pflichtfeld {e} fehlt in {entry}.")
+    if not isinstance(name, str) or not name:
+        raise CustomPidError(f"Ungültiger Name {name!r} in {entry}.")
+
+    try:
+        request = request.replace(" ", "").upper()
+        bytes.fromhex(request)
+    except (AttributeError, ValueError):
+        raise CustomPidError(f"{name}: Ungültige Request-Bytes '{request}'.")
+
+    formula = entry.get("formula", {})
+    if not isinstance(formula, dict):
+        raise CustomPidError(f"{name}: 'formula' muss ein JSON-Objekt sein.")
+    header = entry.get("header", "7E0")
+    if not isinstance(header, str):
+        raise CustomPidError(f"{name}: Ungültiger Header '{header}'.")
+
+    echo = len(request) // 2
+    decoder = _compile_decoder(name, echo, formula)
+
+    return obd.OBDCommand(
+        name,
+        entry.get("desc", name),
+        request.encode(),
+        echo + int(formula.get("bytes", 1)),
+        decoder,
+        obd.ECU.ALL,
+        False,
+        header.replace(" ", "").upper().encode(),
+    )
+
+
+def load_custom_pids(filename, on_error=print):
+    """Lädt und kompiliert alle Custom PIDs aus einer JSON-Datei.
+
+    Gibt ein Dict Name -> OBDCommand sowie ein Dict Plan -> [OBDCommand] zurück.
+    Fehlerhafte Einträge werden übersprungen und über `on_error` gemeldet.
+    """
+    commands = {}
+    plans = {plan: [] for plan in POLLING_PLANS}
+
+    try:
+        with open(filename, "r", encoding="utf-8") as file:
+            entries = json.load(file)
+    except FileNotFoundError:
+        return commands, plans
+    except json.JSONDecodeError as e:
+        on_error(f"Custom-PID-Datei {filename} fehlerhaft: {e}")
+        return commands, plans
+
+    if not isinstance(entries, list):
+        on_error(f"Custom-PID-Datei {filename} fehlerhaft: erwartet wird eine Liste von PID-Definitionen.")
+        return commands, plans
+
+    for entry in entries:
+        try:
+            cmd = compile_custom_pid(entry)
+        except CustomPidError as e:
+            on_error(f"Custom PID übersprungen: {e}")
+            continue
+
+        if hasattr(obd.commands, cmd.name) or cmd.name in commands:
+            on_error(f"Custom PID {cmd.name} überschneidet sich mit einem vorhandenen Befehl.")
+            continue
+
+        commands[cmd.name] = cmd
+        entry_plans = entry.get("plans", [])
+        if not isinstance(entry_plans, list):
+            on_error(f"{cmd.name}: 'plans' muss eine Liste sein.")
+            continue
+        for plan in entry_plans:
+            if plan in plans:
+                plans[plan].append(cmd)
+            else:
+                on_error(f"{cmd.name}: Unbekannter Abfrage-Plan '{plan}'.")
+
+    return commands, plans
+
+
+def resolve_commands(filename, custom_commands, custom_plans=None, plan=None, on_error=print):
+    """Löst die Befehlsnamen einer Datei zu OBDCommands auf und ergänzt die Custom PIDs des Plans.
+
+    Leere Zeilen und Zeilen mit # werden übersprungen; Custom PIDs werden über
+    ihren Namen wie Standardbefehle eingetragen.
+    """
+    commands = []
+    try:
+        with open(filename, "r") as file:
+            for line in file:
+                name = line.strip()
+                if not name or name.startswith("#"):
+                    continue
+                if name in custom_commands:
+                    commands.append(custom_commands[name])
+                elif hasattr(obd.commands, name):
+                    commands.append(getattr(obd.commands, name))
+                else:
+                    on_error(f"Unbekannter Befehl: {name}")
+    except FileNotFoundError:
+        on_error(f"Datei {filename} nicht gefunden.")
+
+    for cmd in (custom_plans or {}).get(plan, []):
+        if cmd not in commands:
+            commands.append(cmd)
+    return commands
@@ -0,0 +1,85 @@
+"""Headless-Betrieb ohne Qt, z.B. als systemd-Dienst auf dem Raspberry Pi.
+
+Nutzt dieselbe Abfrage-, Aufzeichnungs- und Fehlercode-Logik wie die GUI
+(ObdReaderCore); alle Werte landen in logs/obd_log.txt.
+"""
+import argparse
+import signal
+import threading
+import time
+
+from obd_reader_core import ObdReaderCore, POLL_MODES
+from obd_power_state import ECU_ASLEEP
+from obd_stream_server import TelemetryServer
+from obd_metrics import MetricsServer
+from obd_timeseries import TimeSeriesStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OBD-Reader ohne GUI.")
+    parser.add_argument("--port", default="/dev/tty.Android-Vlink", help="Serieller Port des Adapters")
+    parser.add_argument("--mode", default="important", choices=[m for m in POLL_MODES if m != "dtc"],
+                        help="Abfrageplan")
+    parser.add_argument("--interval", type=float, default=2.0, help="Abfrageintervall in Sekunden")
+    parser.add_argument("--no-dtc", action="store_true", help="Fehlercodes nicht überwachen")
+    parser.add_argument("--commands", default="commands.txt")
+    parser.add_argument("--commands-important", default="commandsImportant.txt")
+    parser.add_argument("--commands-mil", default="commandsMIL.txt")
+    parser.add_argument("--stream-port", type=int, help="WebSocket-Port für Live-Dashboards")
+    parser.add_argument("--stream-tcp-port", type=int, help="TCP-Port für Live-Dashboards (Längenpräfix)")
+    parser.add_argument("--metrics-port", type=int, help="Port für den Prometheus-Endpunkt /metrics")
+    parser.add_argument("--no-store", action="store_true", help="Messwerte nicht in der Zeitreihen-Datenbank speichern")
+    args = parser.parse_args()
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+
+    reader = ObdReaderCore(args.commands, args.commands_important, args.commands_mil, port=args.port)
+
+    store = None
+    if not args.no_store:
+        store = TimeSeriesStore()
+        reader.recording_sinks.append(store.add)
+
+    metrics_server = None
+    if args.metrics_port is not None:
+        metrics_server = MetricsServer(args.metrics_port)
+        metrics_server.start()
+
+    stream_server = None
+    if args.stream_port is not None or args.stream_tcp_port is not None:
+        stream_server = TelemetryServer(websocket_port=args.stream_port, tcp_port=args.stream_tcp_port)
+        stream_server.start()
+        reader.sample_sinks.append(stream_server.publish)
+
+    if args.mode != "dummy":
+        reader.startConnection()  # Verbindungsversuche laufen über threading.Timer
+
+    while not stop_event.is_set():
+        cycle_start = time.monotonic()
+
+        if args.mode == "dummy" or (reader.dummy and reader.connection is None):
+            reader.poll("dummy")
+        elif reader.connection and reader.connection.is_connected():
+            reader.poll(args.mode)
+            if not args.no_dtc and reader.power_state.state != ECU_ASLEEP:
+                # DtcMonitor fragt selbst nur bei Bedarf die Fehlercodes ab
+                reader.poll("dtc")
+
+        interval = reader.poll_interval(args.mode, args.interval)
+        stop_event.wait(max(0.0, interval - (time.monotonic() - cycle_start)))
+
+    reader.stopConnection()
+    if stream_server is not None:
+        stream_server.stop()
+    if metrics_server is not None:
+        metrics_server.stop()
+    if store is not None:
+        store.close()
+    if reader.dtc_monitor.database is not None:
+        reader.dtc_monitor.database.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import obd
+from obd import decoders
+
+from obd_bulk_decoder import FORMULAS, decode_formula
+
+# Mode 0A (permanente Fehlercodes) fehlt in python-obd und wird hier ergänzt
+GET_PERMANENT_DTC = obd.OBDCommand("GET_PERMANENT_DTC", "Get permanent DTCs", b"0A", 0, decoders.dtc,
+                                   obd.ECU.ALL, False)
+
+# Fehlercode-Abfragen: (Schlüssel, Befehl, force)
+DTC_QUERIES = (
+    ("stored", obd.commands.GET_DTC, False),
+    ("pending", obd.commands.GET_CURRENT_DTC, False),
+    ("permanent", GET_PERMANENT_DTC, True),
+)
+
+
+# PIDs, die beim Auftreten eines neuen Fehlercodes aus dem Freeze Frame (Mode 02) gelesen werden
+FREEZE_FRAME_PIDS = (
+    "RPM", "SPEED", "COOLANT_TEMP", "ENGINE_LOAD", "SHORT_FUEL_TRIM_1", "LONG_FUEL_TRIM_1",
+    "INTAKE_PRESSURE", "INTAKE_TEMP", "MAF", "THROTTLE_POS", "TIMING_ADVANCE",
+)
+FREEZE_DTC_PID = 0x02
+PIDS_PER_REQUEST = 3  # Mode + 3x (PID, Frame) passen in eine Single-Frame-Anfrage
+
+
+def _parse_freeze_frame(data, names):
+    """Zerlegt eine Mode-02-Mehrfachantwort (42 PID Frame Daten PID Frame Daten ...)."""
+    values = {}
+    pos = 1
+    while pos + 2 <= len(data):
+        pid = data[pos]
+        pos += 2  # PID und Frame-Nummer
+
+        if pid == FREEZE_DTC_PID:
+            dtc = decoders.parse_dtc(tuple(data[pos:pos + 2]))
+            values["FREEZE_DTC"] = {"value": dtc[0] if dtc else None, "unit": ""}
+            pos += 2
+            continue
+
+        name = names.get(pid)
+        if name is None:
+            break  # Länge unbekannt, Rest nicht auswertbar
+        length = obd.commands[name].bytes - 2
+        if pos + length > len(data):
+            break
+
+        row = np.frombuffer(bytes([0x41, pid]) + bytes(data[pos:pos + length]), dtype=np.uint8).reshape(1, -1)
+        formula = FORMULAS[name]
+        values[name] = {"value": round(float(decode_formula(formula, row)[0]), 3), "unit": formula.unit}
+        pos += length
+
+    return values
+
+
+def read_freeze_frame(connection, names=FREEZE_FRAME_PIDS, frame=0):
+    """Liest den Freeze Frame gebündelt mit mehreren PIDs pro Anfrage.
+
+    Neben den gewünschten PIDs wird auch der auslösende Fehlercode (02 02) gelesen.
+    """
+    pid_names = {obd.commands[name].pid: name for name in names if name in FORMULAS}
+    pids = [FREEZE_DTC_PID] + list(pid_names)
+
+    values = {}
+    for i in range(0, len(pids), PIDS_PER_REQUEST):
+        request = b"02" + b"".join(f"{pid:02X}{frame:02X}".encode() for pid in pids[i:i + PIDS_PER_REQUEST])
+        cmd = obd.OBDCommand("FREEZE_FRAME", "Freeze Frame", request, 0, decoders.noop, obd.ECU.ENGINE, False)
+        response = connection.query(cmd, force=True)
+        if response and not response.is_null():
+            values.update(_parse_freeze_frame(response.value, pid_names))
+    return values
+
+
+def format_freeze_frame(freeze_frame):
+    return ", ".join(f"{name}={entry['value']} {entry['unit']}".strip() for name, entry in freeze_frame.items())
+
+
+class DtcHistory:
+    """Fehlercode-Historie als JSON-Lines-Datei, inklusive Freeze Frame je Code."""
+
+    def __init__(self, history_file=os.path.join("logs", "dtc_history.jsonl")):
+        self.history_file = history_file
+        self._known = None
+
+    @property
+    def known(self):
+        """Codes, die seit dem letzten Löschen bereits erfasst wurden (beim ersten Zugriff geladen)."""
+        if self._known is None:
+            self._known = set()
+            for entry in self.entries():
+                if entry.get("type") == "cleared":
+                    self._known.clear()
+                elif entry.get("type") == "dtc":
+                    self._known.add(entry["code"])
+        return self._known
+
+    def entries(self):
+        try:
+            with open(self.history_file, "r", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+        except FileNotFoundError:
+            return
+
+    def _append(self, entry):
+        os.makedirs(os.path.dirname(self.history_file) or ".", exist_ok=True)
+        entry["time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.history_file, "a", encoding="utf-8") as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def record(self, code, description, kind, freeze_frame):
+        self.known.add(code)
+        self._append({"type": "dtc", "code": code, "description": description, "kind": kind,
+                      "freeze_frame": freeze_frame})
+
+    def mark_cleared(self):
+        self.known.clear()
+        self._append({"type": "cleared"})
+
+
+class DtcSnapshot:
+    """Ergebnis einer vollständigen Fehlercode-Abfrage (Mode 03/07/0A)."""
+
+    def __init__(self, mil, dtc_count, stored, pending, permanent):
+        self.mil = mil
+        self.dtc_count = dtc_count
+        self.stored = stored
+        self.pending = pending
+        self.permanent = permanent
+        self.new_codes = []
+        self.freeze_frame = None
+
+    def codes(self):
+        """Alle Codes ohne Duplikate als Liste von (Code, Beschreibung, Art)."""
+        seen = set()
+        result = []
+        for kind, codes in (("stored", self.stored), ("pending", self.pending), ("permanent", self.permanent)):
+            for code, desc in codes:
+                if code not in seen:
+                    seen.add(code)
+                    result.append((code, desc, kind))
+        return result
+
+    def __str__(self):
+        lines = [f"{code} - {desc}" for code, desc in self.stored]
+        lines += [f"{code} - {desc} (ausstehend)" for code, desc in self.pending]
+        lines += [f"{code} - {desc} (permanent)" for code, desc in self.permanent]
+        return "\n".join(lines) if lines else "Keine Fehlercodes gefunden."
+
+
+class DtcMonitor:
+    """Steuert die Fehlercode-Abfrage über den günstigen STATUS-PID (01 01).
+
+    STATUS wird höchstens alle `status_interval` Sekunden gelesen; als Single-Frame-
+    Antwort mit "fast"-Flag kehrt der ELM327 dabei sofort zurück, während Mode 03/07/0A
+    auf alle Steuergeräte warten müssen. Diese werden nur abgefragt, wenn
+    sich MIL-Bit oder Anzahl der Fehlercodes ändern oder `refresh_interval`
+    Sekunden seit der letzten vollständigen Abfrage vergangen sind. Ausstehende
+    Codes (Mode 07) zählen nicht in STATUS und werden daher spätestens mit dem
+    Refresh-Timer aktualisiert.
+
+    Mit einer `history` wird für jeden neu auftauchenden Code sofort der Freeze
+    Frame gelesen und zusammen mit dem Code gespeichert.
+    """
+
+    def __init__(self, status_interval=10.0, refresh_interval=300.0, database=None, history=None,
+                 freeze_pids=FREEZE_FRAME_PIDS):
+        self.status_interval = status_interval
+        self.database = database
+        self.history = history
+        self.freeze_pids = freeze_pids
+        self.refresh_interval = refresh_interval
+        self.last_status = None
+        self.last_status_poll = None
+        self.last_fetch = None
+        self.snapshot = None
+
+    def invalidate(self):
+        """Erzwingt beim nächsten Aufruf eine vollständige Abfrage (z.B. nach dem Löschen)."""
+        self.last_status = None
+        self.last_status_poll = None
+        self.last_fetch = None
+
+    def cleared(self):
+        """Nach dem Löschen der Fehlercodes: Historie markieren und neu abfragen."""
+        if self.history is not None:
+            self.history.mark_cleared()
+        self.invalidate()
+
+    def poll(self, connection, now=None):
+        """Liest STATUS und bei Bedarf alle Fehlercodes.
+
+        Gibt einen neuen DtcSnapshot zurück oder None, wenn keine vollständige Abfrage nötig war.
+        """
+        now = time.monotonic() if now is None else now
+
+        if self.last_status_poll is not None and now - self.last_status_poll < self.status_interval:
+            return None
+        self.last_status_poll = now
+
+        response = connection.query(obd.commands.STATUS)
+        status = None
+        if response and not response.is_null():
+            status = (bool(response.value.MIL), int(response.value.DTC_count))
+
+        due = self.last_fetch is None or now - self.last_fetch >= self.refresh_interval
+        changed = status is not None and status != self.last_status
+        if not due and not changed:
+            return None
+
+        self.last_status = status
+        self.last_fetch = now
+
+        results = {}
+        for key, cmd, force in DTC_QUERIES:
+            response = connection.query(cmd, force=force)
+            results[key] = list(response.value) if response and not response.is_null() else []
+
+        # Beschreibungen (auch Herstellercodes) gesammelt aus der lokalen Datenbank
+        if self.database is not None:
+            descriptions = self.database.describe_many([code for codes in results.values() for code, _ in codes])
+            results = {key: [(code, descriptions[code] or desc) for code, desc in codes]
+                       for key, codes in results.items()}
+
+        mil, dtc_count = status if status is not None else (None, None)
+        snapshot = DtcSnapshot(mil, dtc_count, results["stored"], results["pending"], results["permanent"])
+
+        if self.history is not None:
+            snapshot.new_codes = [entry for entry in snapshot.codes() if entry[0] not in self.history.known]
+            if snapshot.new_codes:
+                snapshot.freeze_frame = read_freeze_frame(connection, self.freeze_pids)
+                for code, description, kind in snapshot.new_codes:
+                    self.history.record(code, description, kind, snapshot.freeze_frame)
+
+        self.snapshot = snapshot
+        return snapshot
@@ -0,0 +1,139 @@
+import csv
+import os
+import sqlite3
+import tempfile
+import threading
+
+GENERIC = "generic"
+
+# Bereiche nach SAE J2012, falls ein Code in keiner Tabelle steht: (Präfixe, Beschreibung)
+DTC_RANGES = (
+    (("P1", "P30", "P31", "P32", "P33"), "Herstellerspezifischer Antriebscode"),
+    (("P0", "P2", "P3"), "Generischer Antriebscode"),
+    (("B1", "B2", "C1", "C2", "U1", "U2"), "Herstellerspezifischer Code"),
+    (("B0", "C0", "U0"), "Generischer Code"),
+)
+
+
+def describe_range(code):
+    """Beschreibt einen Code anhand seines Bereichs, wenn kein Eintrag existiert."""
+    for prefixes, description in DTC_RANGES:
+        if code.startswith(prefixes):
+            return description
+    return ""
+
+
+class DtcDatabase:
+    """Lokale, indizierte Fehlercode-Datenbank (SQLite) für generische und Herstellercodes.
+
+    Die Datenbank wird beim ersten Zugriff aus den python-obd-Beschreibungen und den
+    Hersteller-CSV-Dateien aufgebaut und danach nur noch neu erstellt, wenn sich eine
+    Quelle ändert. Abfragen laufen über den Primärschlüssel (Code, Hersteller); die
+    Datei wird per mmap gelesen, bereits aufgelöste Codes bleiben im Speicher.
+    """
+
+    def __init__(self, make="opel", db_file=os.path.join("logs", "dtc_codes.sqlite"),
+                 sources=None):
+        self.make = make
+        self.db_file = db_file
+        self.sources = sources if sources is not None else {"opel": "dtcCodesOpel.csv"}
+        self._connection = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _source_mtime(self):
+        mtimes = [os.path.getmtime(path) for path in self.sources.values() if os.path.exists(path)]
+        return max(mtimes, default=0.0)
+
+    def _build(self):
+        """Erstellt die Datenbankdatei neu aus allen Quellen.
+
+        Jeder Prozess baut in eine eigene temporäre Datei; bauen mehrere gleichzeitig
+        (GUI und Daemon, Adapter-Sitzungen), gewinnt das letzte os.replace.
+        """
+        directory = os.path.dirname(self.db_file) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.db_file) + ".", suffix=".tmp")
+        os.close(fd)
+        try:
+            self._write(tmp_file)
+            os.replace(tmp_file, self.db_file)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
+    def _write(self, tmp_file):
+        import obd
+
+        connection = sqlite3.connect(tmp_file)
+        connection.execute("""
+            CREATE TABLE codes (
+                code TEXT NOT NULL,
+                make TEXT NOT NULL,
+                description TEXT NOT NULL,
+                PRIMARY KEY (code, make)
+            ) WITHOUT ROWID
+        """)
+        connection.executemany("INSERT OR REPLACE INTO codes VALUES (?, ?, ?)",
+                               ((code, GENERIC, desc) for code, desc in obd.codes.DTC.items()))
+
+        for make, path in self.sources.items():
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                rows = ((row["code"].strip().upper(), make, row["description"].strip())
+                        for row in csv.DictReader(file) if row.get("code"))
+                connection.executemany("INSERT OR REPLACE INTO codes VALUES (?, ?, ?)", rows)
+
+        connection.commit()
+        connection.close()
+
+    def _connect(self):
+        """Öffnet die Datenbank beim ersten Zugriff und baut sie bei Bedarf neu."""
+        if self._connection is not None:
+            return self._connection
+
+        if not os.path.exists(self.db_file) or os.path.getmtime(self.db_file) < self._source_mtime():
+            self._build()
+
+        self._connection = sqlite3.connect(f"file:{self.db_file}?mode=ro", uri=True, check_same_thread=False)
+        self._connection.execute("PRAGMA mmap_size = 8388608")
+        return self._connection
+
+    def describe_many(self, codes):
+        """Liefert ein Dict Code -> Beschreibung für viele Codes mit einer einzigen Abfrage.
+
+        Herstellerbeschreibungen haben Vorrang vor generischen; unbekannte Codes
+        erhalten die Beschreibung ihres Bereichs.
+        """
+        with self._lock:
+            missing = [code for code in set(codes) if code not in self._cache]
+            if missing:
+                connection = self._connect()
+                found = {}
+                # In Blöcken abfragen, um das Variablenlimit von SQLite einzuhalten
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = connection.execute(
+                        f"SELECT code, make, description FROM codes "
+                        f"WHERE code IN ({placeholders}) AND make IN (?, ?)",
+                        (*chunk, GENERIC, self.make),
+                    )
+                    for code, make, description in rows:
+                        if make != GENERIC or code not in found:
+                            found[code] = description
+
+                for code in missing:
+                    self._cache[code] = found.get(code) or describe_range(code)
+
+            return {code: self._cache[code] for code in codes}
+
+    def describe(self, code):
+        return self.describe_many([code])[code]
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,155 @@
+import argparse
+import csv
+import os
+import threading
+
+import numpy as np
+
+from obd_timeseries import TimeSeriesStore, _parse_time
+
+FORMATS = ("csv", "parquet")
+CSV_HEADER = ("time_utc", "t", "pid", "value")
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_HEADER)
+
+    def write(self, pid, t, values):
+        iso = np.datetime_as_string((t * 1000).astype("datetime64[ms]"), unit="ms")
+        self._writer.writerows(zip(iso.tolist(), t.tolist(), [pid] * len(t), values.tolist()))
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet-Export benötigt pyarrow (pip install pyarrow).")
+        self._pa = pa
+        self._schema = pa.schema([("t", pa.timestamp("ms", tz="UTC")), ("pid", pa.dictionary(pa.int16(), pa.string())),
+                                  ("value", pa.float64())])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write(self, pid, t, values):
+        pa = self._pa
+        pid_column = pa.DictionaryArray.from_arrays(pa.array(np.zeros(len(t), dtype=np.int16)), pa.array([pid]))
+        table = pa.Table.from_arrays([pa.array((t * 1000).astype("datetime64[ms]"), type=self._schema.field("t").type),
+                                      pid_column, pa.array(values)], schema=self._schema)
+        self._writer.write_table(table)  # eine Row Group je Block
+
+    def close(self):
+        self._writer.close()
+
+
+class SampleExport:
+    """Exportiert aufgezeichnete Rohwerte blockweise nach CSV oder Parquet.
+
+    Die Daten werden chunkweise aus der Zeitreihen-Datenbank gelesen und in
+    Blöcken zu `block_rows` Zeilen geschrieben (lange Form: Zeit, PID, Wert), der
+    Speicherbedarf hängt also nicht von der Länge der Aufzeichnung ab. Geschrieben
+    wird in eine .part-Datei, die erst nach Abschluss umbenannt und bei Abbruch
+    gelöscht wird. `progress(done, total)` wird nach jedem Block aufgerufen.
+    """
+
+    def __init__(self, store, path, pids=None, start=None, end=None, session=None, fmt=None,
+                 block_rows=50000, progress=None):
+        self.store = store
+        self.path = path
+        self.pids = pids
+        self.start = start
+        self.end = end
+        self.session = session
+        self.fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+        if self.fmt not in FORMATS:
+            raise ValueError(f"Unbekanntes Exportformat: {self.fmt}")
+        self.block_rows = block_rows
+        self.progress = progress
+        self.rows_written = 0
+        self.part_file = path + ".part"
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def run(self):
+        """Führt den Export im aufrufenden Thread aus; gibt die Anzahl der Zeilen zurück."""
+        pids = self.pids or self.store.names()
+        total = sum(self.store.count_raw(pid, self.start, self.end, self.session) for pid in pids)
+        part_file = self.part_file
+        writer = _ParquetWriter(part_file) if self.fmt == "parquet" else _CsvWriter(part_file)
+        try:
+            for pid in pids:
+                for t, values in self._blocks(pid):
+                    if self._cancel.is_set():
+                        raise ExportCancelled()
+                    writer.write(pid, t, values)
+                    self.rows_written += len(t)
+                    if self.progress is not None:
+                        self.progress(self.rows_written, max(total, self.rows_written))
+            writer.close()
+            os.replace(part_file, self.path)
+        except BaseException:
+            writer.close()
+            os.remove(part_file)
+            raise
+        return self.rows_written
+
+    def _blocks(self, pid):
+        """Teilt die Datenbank-Chunks in Blöcke von genau `block_rows` Zeilen auf (der letzte ggf. kürzer)."""
+        times, values, size = [], [], 0
+        for t, v in self.store.iter_raw(pid, self.start, self.end, self.session):
+            while len(t):
+                take = min(len(t), self.block_rows - size)
+                times.append(t[:take])
+                values.append(v[:take])
+                size += take
+                t, v = t[take:], v[take:]
+                if size == self.block_rows:
+                    yield np.concatenate(times), np.concatenate(values)
+                    times, values, size = [], [], 0
+        if size:
+            yield np.concatenate(times), np.concatenate(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aufgezeichnete Messwerte nach CSV oder Parquet exportieren.")
+    parser.add_argument("output", help="Zieldatei (.csv oder .parquet)")
+    parser.add_argument("pids", nargs="*", help="PIDs (Standard: alle)")
+    parser.add_argument("--db", default=os.path.join("logs", "obd_timeseries.sqlite"))
+    parser.add_argument("--session", type=int, help="Nur diese Sitzung")
+    parser.add_argument("--start", help="Beginn, z.B. 30d, 2h oder 2024-05-01T08:00")
+    parser.add_argument("--end", help="Ende (Standard: jetzt)")
+    args = parser.parse_args()
+
+    def report(done, total):
+        print(f"\r{done}/{total} Zeilen ({100 * done / total:.0f} %)", end="", flush=True)
+
+    store = TimeSeriesStore(args.db, read_only=True)
+    export = SampleExport(store, args.output, args.pids or None, _parse_time(args.start), _parse_time(args.end),
+                          args.session, progress=report)
+    try:
+        rows = export.run()
+        print(f"\n{rows} Zeilen nach {args.output} exportiert")
+    except KeyboardInterrupt:
+        print("\nExport abgebrochen")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,15 @@
 import os
+import time
 from datetime import datetime
 
+from obd_metrics import MetricsRegistry
+
+# ObdLogger schreibt synchron (keine Warteschlange); gemessen wird, wie oft und wie lange
+_metrics = MetricsRegistry.instance()
+LOG_MESSAGES = _metrics.counter("obd_log_messages_total", "Log-Meldungen je Level", ("level",))
+LOG_WRITE_SECONDS = _metrics.counter("obd_log_write_seconds_total", "Zeit für das Schreiben der Log-Meldungen")
+
+
 class ObdLogger:
     def __init__(self, log_console=None):
         self.log_folder = "logs"
@@ -9,6 +18,7 @@ class ObdLogger:
         self.log_console = log_console
 
     def log(self, message, level="INFO"):
+        start = time.perf_counter()
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_message = f"[{timestamp}] [{level}] {message}\n"
 
@@ -18,6 +28,9 @@ class ObdLogger:
         with open(self.log_file, "a") as f:
             f.write(log_message)
 
+        LOG_MESSAGES.inc(level)
+        LOG_WRITE_SECONDS.inc(amount=time.perf_counter() - start)
+
     def log_info(self, message):
         self.log(message, "INFO")
 
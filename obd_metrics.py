@@ -0,0 +1,220 @@
+import bisect
+import math
+import threading
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_value(value):
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Family:
+    """Eine Metrik mit allen Label-Kombinationen; hält ihren Text vorgerendert.
+
+    Eine Änderung merkt sich nur die betroffene Label-Kombination. Beim Abruf
+    werden ausschließlich diese Zeilen neu gerendert und der Block der Metrik
+    neu zusammengesetzt; unveränderte Metriken kosten nur ein Stringanhängen.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, registry, name, documentation, labels=()):
+        self.name = name
+        self.labels = tuple(labels)
+        self._lock = registry.lock
+        self._header = f"# HELP {name} {documentation}\n# TYPE {name} {self.kind}\n"
+        self._lines = {}
+        self._stale = set()
+        self._text = self._header
+
+    def _key(self, labels):
+        if len(labels) != len(self.labels):
+            raise ValueError(f"{self.name} erwartet die Labels {self.labels}")
+        return tuple(labels)
+
+    def render(self):
+        if self._stale:
+            for key in self._stale:
+                self._lines[key] = self._render_series(key)
+            self._stale.clear()
+            self._text = self._header + "".join(self._lines.values())
+        return self._text
+
+    def _render_series(self, key):
+        raise NotImplementedError
+
+
+class Counter(_Family):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values = {}
+
+    def inc(self, *labels, amount=1.0):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+            self._stale.add(key)
+
+    def value(self, *labels):
+        return self._values.get(self._key(labels), 0.0)
+
+    def _render_series(self, key):
+        return f"{self.name}{_format_labels(self.labels, key)} {_format_value(self._values[key])}\n"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels, value):
+        key = self._key(labels)
+        with self._lock:
+            if self._values.get(key) != value:
+                self._values[key] = value
+                self._stale.add(key)
+
+    def value(self, *labels):
+        return self._values.get(self._key(labels))
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(self, registry, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(registry, name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._counts = {}
+        self._sums = {}
+
+    def observe(self, *labels, value):
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._sums[key] += value
+            self._stale.add(key)
+
+    def count(self, *labels):
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def _render_series(self, key):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), self._counts[key]):
+            cumulative += count
+            labels = _format_labels(self.labels, key, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}\n")
+        labels = _format_labels(self.labels, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}\n")
+        lines.append(f"{self.name}_count{labels} {cumulative}\n")
+        return "".join(lines)
+
+
+class MetricsRegistry:
+    """Sammelt die Metriken eines Prozesses; render() liefert das Prometheus-Textformat.
+
+    Mehrfaches Anlegen derselben Metrik (z.B. beim erneuten Import) liefert die
+    vorhandene zurück.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._families = {}
+
+    def _get(self, family_class, name, documentation, labels, **options):
+        with self.lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = family_class(self, name, documentation, labels, **options)
+        if not isinstance(family, family_class):
+            raise ValueError(f"Metrik {name} existiert bereits als {family.kind}")
+        return family
+
+    def counter(self, name, documentation, labels=()):
+        return self._get(Counter, name, documentation, labels)
+
+    def gauge(self, name, documentation, labels=()):
+        return self._get(Gauge, name, documentation, labels)
+
+    def histogram(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        return self._get(Histogram, name, documentation, labels, buckets=buckets)
+
+    def render(self):
+        with self.lock:
+            return "".join(family.render() for family in self._families.values())
+
+
+def _handler_class(registry):
+    # http.server erst beim Start des Endpunkts laden; die Metriken selbst sind Teil des GUI-Starts
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Abrufe alle paar Sekunden nicht ins OBD-Log schreiben
+
+    return MetricsHandler
+
+
+class MetricsServer:
+    """HTTP-Endpunkt /metrics für Prometheus in einem eigenen Thread."""
+
+    def __init__(self, port=9108, host="0.0.0.0", registry=None):
+        from http.server import ThreadingHTTPServer
+
+        self.registry = registry or MetricsRegistry.instance()
+        self._server = ThreadingHTTPServer((host, port), _handler_class(self.registry))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="obd-metrics", daemon=True)
+        self._thread.start()
+        return self.port
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
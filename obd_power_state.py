@@ -0,0 +1,98 @@
+import time
+
+import obd
+
+DRIVING = "driving"
+IDLING = "idling"
+ENGINE_OFF = "engine_off"
+ECU_ASLEEP = "ecu_asleep"
+
+STATE_NAMES = {
+    DRIVING: "Fahrt",
+    IDLING: "Leerlauf im Stand",
+    ENGINE_OFF: "Motor aus",
+    ECU_ASLEEP: "Steuergerät schläft",
+}
+
+# Abfrageintervall je Zustand als Vielfaches des Grundintervalls
+INTERVAL_FACTORS = {DRIVING: 1, IDLING: 2.5, ENGINE_OFF: 5, ECU_ASLEEP: 15}
+
+# In den Ruhezuständen wird nur noch auf Aktivität geprüft
+KEEPALIVE_COMMANDS = ("RPM", "SPEED")
+
+
+class PowerStateMachine:
+    """Leitet aus RPM, SPEED und fehlgeschlagenen Abfragen den Fahrzustand ab.
+
+    Langsamer wird erst nach einer Haltezeit (`idle_after`, `off_after`) bzw. nach
+    `asleep_failures` vollständig fehlgeschlagenen Runden; schneller sofort, sobald
+    sich Drehzahl oder Geschwindigkeit regen.
+    """
+
+    def __init__(self, idle_after=20.0, off_after=10.0, asleep_failures=3):
+        self.idle_after = idle_after
+        self.off_after = off_after
+        self.asleep_failures = asleep_failures
+        self.state = DRIVING
+        self.failures = 0
+        self._candidate = None
+        self._candidate_since = None
+
+    def update(self, rpm=None, speed=None, failed=False, now=None):
+        """Übernimmt die Ergebnisse einer Abfragerunde; gibt den neuen Zustand zurück, wenn er wechselt."""
+        now = time.monotonic() if now is None else now
+
+        if failed:
+            self.failures += 1
+            if self.failures >= self.asleep_failures:
+                return self._enter(ECU_ASLEEP)
+            return None
+        self.failures = 0
+
+        if speed is not None and speed > 0:
+            observed = DRIVING
+        elif rpm is not None and rpm > 0:
+            observed = IDLING
+        elif rpm is not None:
+            observed = ENGINE_OFF
+        elif self.state == ECU_ASLEEP:
+            observed = ENGINE_OFF  # Antwort ohne RPM: Steuergerät ist wieder wach
+        else:
+            return None
+
+        # Aufwachen ohne Verzögerung
+        if self._rank(observed) < self._rank(self.state):
+            return self._enter(observed)
+
+        if observed == self.state:
+            self._candidate = None
+            return None
+
+        if observed != self._candidate:
+            self._candidate = observed
+            self._candidate_since = now
+        hold = self.idle_after if observed == IDLING else self.off_after
+        if now - self._candidate_since >= hold:
+            return self._enter(observed)
+        return None
+
+    @staticmethod
+    def _rank(state):
+        return (DRIVING, IDLING, ENGINE_OFF, ECU_ASLEEP).index(state)
+
+    def _enter(self, state):
+        self._candidate = None
+        if state == self.state:
+            return None
+        self.state = state
+        return state
+
+    def interval(self, base):
+        return base * INTERVAL_FACTORS[self.state]
+
+    def commands(self, commands):
+        """Im Stand mit laufendem Motor alle Befehle, sonst nur die Keepalive-PIDs."""
+        if self.state in (DRIVING, IDLING):
+            return commands
+        keepalive = [cmd for cmd in commands if cmd.name in KEEPALIVE_COMMANDS]
+        return keepalive or [obd.commands.RPM]
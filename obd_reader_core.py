@@ -0,0 +1,438 @@
+import random
+import threading
+import obd
+import subprocess
+import time
+import platform
+
+from obd_logger import ObdLogger
+from obd_custom_pids import load_custom_pids, resolve_commands
+from obd_trip import TripComputer
+from obd_stats import StatisticsRegistry
+from obd_catalyst import CatalystAnalyzer
+from obd_dtc import DtcMonitor, DtcHistory, format_freeze_frame
+from obd_dtc_db import DtcDatabase
+from obd_power_state import PowerStateMachine, STATE_NAMES
+from obd_metrics import MetricsRegistry
+
+POLL_MODES = ("dummy", "important", "all", "mil", "dtc")
+
+# Automatische Bluetooth-Neustarts ohne GUI: höchstens so viele, mit wachsender Wartezeit
+MAX_BLUETOOTH_RESETS = 3
+BLUETOOTH_RESET_BACKOFF_MS = 60000
+
+_metrics = MetricsRegistry.instance()
+PID_VALUE = _metrics.gauge("obd_pid_value", "Letzter Wert je PID", ("pid",))
+QUERY_TOTAL = _metrics.counter("obd_queries_total", "OBD-Abfragen je PID und Ergebnis", ("pid", "result"))
+QUERY_LATENCY = _metrics.histogram("obd_query_latency_seconds", "Antwortzeit des Adapters je PID", ("pid",))
+CONNECTION_ATTEMPTS = _metrics.counter("obd_connection_attempts_total", "Verbindungsversuche (retryConnection)")
+CONNECTION_FAILURES = _metrics.counter("obd_connection_failures_total", "Fehlgeschlagene Verbindungsversuche")
+CONNECTED = _metrics.gauge("obd_connected", "1, wenn der Adapter verbunden ist")
+
+
+class ObdReaderCore:
+    """Abfrage-, Auswerte- und Fehlercode-Logik des OBD-Readers ohne Qt.
+
+    Ergebnisse werden über die notify_*-Methoden gemeldet und Verzögerungen über
+    schedule() geplant. Die GUI (ObdReaderThreaded) leitet diese auf Qt-Signale und
+    QTimer um, der Headless-Daemon schreibt sie direkt ins Log.
+    """
+
+    def __init__(self, commands_file, commands_imp_file, commands_mil_file, port="/dev/tty.Android-Vlink",
+                 commands_custom_file="commandsCustom.json"):
+        self.port = port
+        self.dummy = False
+
+        self.logger = ObdLogger()
+        self.logger.log_info("OBD-Reader wurde gestartet")
+
+        # Custom PIDs werden einmalig kompiliert und in die Abfrage-Pläne eingehängt
+        self.custom_commands, self.custom_plans = load_custom_pids(commands_custom_file, self.notify_error)
+
+        self.commands_all = self.load_commands(commands_file, "all")
+        self.commands_important = self.load_commands(commands_imp_file, "important")
+        self.commands_mil = self.load_commands(commands_mil_file, "mil")
+        self.connection = None
+        self.ble_serial = None
+        self.bluetooth_resets = 0
+        # schedule() läuft ohne GUI auf eigenen Threads; nur ein Verbindungsversuch gleichzeitig
+        self._connect_lock = threading.Lock()
+
+        # Integriert Verbrauch und Strecke über alle Abfragen hinweg
+        self.trip_computer = TripComputer()
+        # Streaming-Statistik pro PID, jederzeit abfragbar (z.B. summary("RPM", window=60))
+        self.statistics = StatisticsRegistry()
+        # Kat-Bewertung aus den ohnehin gepollten O2-Spannungen
+        self.catalyst_analyzer = CatalystAnalyzer()
+        # Fehlercodes nur bei Änderung von MIL/DTC-Anzahl oder nach Ablauf des Refresh-Timers
+        self.dtc_monitor = DtcMonitor(database=DtcDatabase(), history=DtcHistory())
+        # Fahrt / Leerlauf / Motor aus / Steuergerät schläft → Abfragetempo und -umfang
+        self.power_state = PowerStateMachine()
+        # Weitere Abnehmer der Messwerte, z.B. TelemetryServer.publish; aufgerufen im Abfrage-Thread
+        self.sample_sinks = []
+        # Dauerhafte Abnehmer, z.B. TimeSeriesStore.add; erhalten keine simulierten Werte
+        self.recording_sinks = []
+
+    # Ereignisse und Zeitsteuerung, in Unterklassen überschreibbar
+
+    def notify_connection(self, message):
+        self.logger.log_ok(message)
+
+    def notify_data(self, message):
+        self.logger.log_info(message)
+
+    def notify_sample(self, name, value, t):
+        """Numerischer Messwert mit monotonem Zeitstempel (für Verlaufsanzeigen)."""
+        pass
+
+    def notify_error(self, message):
+        self.logger.log_error(message)
+
+    def notify_dtc(self, message):
+        self.logger.log_warning(message)
+
+    def notify_dtc_cleared(self, message):
+        self.logger.log_ok(message)
+
+    def notify_bluetooth_reset(self):
+        """Ohne GUI wird Bluetooth nur begrenzt oft und mit wachsendem Abstand neu gestartet."""
+        if self.bluetooth_resets >= MAX_BLUETOOTH_RESETS:
+            self.notify_error(f"Keine OBD2-Verbindung nach {MAX_BLUETOOTH_RESETS} Bluetooth-Neustarts, "
+                              "weitere Neustarts ausgesetzt.")
+            return
+        delay_ms = BLUETOOTH_RESET_BACKOFF_MS * 2 ** self.bluetooth_resets
+        self.bluetooth_resets += 1
+        self.notify_error(f"Bluetooth-Neustart {self.bluetooth_resets}/{MAX_BLUETOOTH_RESETS} "
+                          f"in {delay_ms // 1000} Sekunden.")
+        self.schedule(delay_ms, self.restart_bluetooth)
+
+    def schedule(self, delay_ms, callback):
+        """Führt `callback` nach `delay_ms` Millisekunden aus."""
+        timer = threading.Timer(delay_ms / 1000, callback)
+        timer.daemon = True
+        timer.start()
+
+    # Verbindung
+
+    def startConnection(self):
+        """Verbindet mit dem OBD-II Adapter, falls möglich."""
+        self.retry_count = 0
+        self.max_retries = 3
+        self.connection = None
+
+        if self.retry_count + 1 == self.max_retries:
+            self.notify_error(f"Letzter Verbindungsversuch {self.retry_count + 1}/{self.max_retries}...")
+
+        # BLE-Serial starten, falls nötig; der erste Verbindungsversuch folgt nach 5 Sekunden
+        self.startBleSerial()
+
+    def retryConnection(self):
+        """Führt einen erneuten Verbindungsversuch aus."""
+        if not self._connect_lock.acquire(blocking=False):
+            return  # ein anderer Versuch läuft gerade
+        try:
+            self._attemptConnection()
+        finally:
+            self._connect_lock.release()
+
+    def _attemptConnection(self):
+        if self.connection and self.connection.is_connected():
+            return  # bereits über checkObdConnection verbunden
+
+        if self.retry_count >= self.max_retries:
+            self.notify_error("Keine OBD2-Verbindung nach mehreren Versuchen.")
+            self.askForBluetoothReset()  # Falls keine Verbindung → Bluetooth-Reset anbieten
+            return
+
+        self.notify_error(f"Verbindungsversuch {self.retry_count + 1}/{self.max_retries}...")
+
+        CONNECTION_ATTEMPTS.inc()
+        self.connection = obd.OBD(portstr=self.port, baudrate=9600, timeout=5)
+
+        if self.connection.is_connected():
+            CONNECTED.set(value=1)
+            self.dummy = False
+            self.bluetooth_resets = 0
+            self.notify_connection("OBD2-Adapter erfolgreich verbunden")
+        else:
+            CONNECTION_FAILURES.inc()
+            CONNECTED.set(value=0)
+            self.notify_error(
+                f"OBD2-Verbindung fehlgeschlagen (Versuch {self.retry_count + 1}/{self.max_retries})")
+            self.retry_count += 1
+            self.schedule(5000, self.retryConnection)
+
+    def startBleSerial(self):
+        """Startet BLE-Serial, falls es nicht bereits läuft."""
+        if self.ble_serial is not None and self.ble_serial.poll() is None:
+            self.schedule(5000, self.checkObdConnection)
+            return
+        try:
+            self.ble_serial = subprocess.Popen(["ble-serial", "-d", "13:E0:2F:8D:61:3A"],
+                                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.notify_error("BLE-Serial gestartet. Warte 5 Sekunden auf die Verbindung...")
+            self.schedule(5000, self.checkObdConnection)  # Verbindung nach 5 Sekunden prüfen
+        except FileNotFoundError:
+            self.notify_error("BLE-Serial nicht gefunden. Starte Dummy-Modus.")
+            self.startDummyConnection()
+            # Der Adapter kann auch direkt seriell angeschlossen sein
+            self.schedule(5000, self.retryConnection)
+
+    def stopBleSerial(self):
+        """Beendet den von startBleSerial gestarteten BLE-Serial-Prozess."""
+        if self.ble_serial is None:
+            return
+        if self.ble_serial.poll() is None:
+            self.ble_serial.terminate()
+            try:
+                self.ble_serial.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.ble_serial.kill()
+                self.ble_serial.wait()
+        self.ble_serial = None
+
+    def checkObdConnection(self):
+        """Prüft, ob die OBD-Verbindung nach BLE-Serial-Start erfolgreich ist."""
+        if self.connection and self.connection.is_connected():
+            self.notify_connection("OBD2-Verbindung erfolgreich über BLE-Serial!")
+        else:
+            self.retryConnection()
+
+    def askForBluetoothReset(self):
+        """Meldet, dass ein Bluetooth-Reset nötig ist."""
+        self.notify_error("Keine OBD2-Verbindung. Soll Bluetooth neu gestartet werden?")
+        self.notify_bluetooth_reset()
+
+    def restart_bluetooth(self):
+        """Startet Bluetooth neu und versucht danach erneut eine Verbindung."""
+        try:
+            self.notify_error("Bluetooth wird neu gestartet...")
+            # BLE-Serial hängt an der alten Bluetooth-Verbindung und wird danach neu gestartet
+            self.stopBleSerial()
+
+            if platform.system() == "Linux":
+                subprocess.run(["sudo", "systemctl", "restart", "bluetooth"], check=True)
+            elif platform.system() == "Darwin":  # macOS
+                subprocess.run(["sudo", "pkill", "bluetoothd"], check=True)
+                subprocess.run(["sudo", "launchctl", "stop", "com.apple.bluetoothd"], check=True)
+                subprocess.run(["sudo", "launchctl", "start", "com.apple.bluetoothd"], check=True)
+
+            self.notify_error("Bluetooth erfolgreich neu gestartet.")
+            self.schedule(5000, self.startConnection)
+
+        except Exception as e:
+            self.notify_error(f"Fehler beim Neustart von Bluetooth: {e}")
+
+    def startDummyConnection(self):
+        """Simuliert eine OBD-Verbindung und liefert zufällige Werte."""
+        if not self.dummy:
+            self.logger.log_info("Dummy-Modus wurde aktiviert")
+            self.dummy = True
+        self.connection = None
+        self.notify_connection("Dummy-Modus aktiv")
+
+        # Simulierte OBD-Daten: (Wert, Format, Einheit)
+        dummyData = {
+            "RPM": (random.randint(600, 7000), "", "U/min"),
+            "SPEED": (random.randint(0, 220), "", "km/h"),
+            "THROTTLE_POS": (random.uniform(5.0, 95.0), ".2f", "%"),
+            "COOLANT_TEMP": (random.randint(70, 110), "", "°C"),
+            "FUEL_LEVEL": (random.uniform(10.0, 90.0), ".1f", "%"),
+            "MAF": (random.uniform(2.0, 20.0), ".2f", "g/s"),
+        }
+
+        sample_time = time.monotonic()
+        for cmd, (value, fmt, unit) in dummyData.items():
+            message = f"[🟡 Dummy] {cmd}: {value:{fmt}} {unit}"
+            self.notify_data(message)
+            self.emitSample(cmd, float(value), sample_time, simulated=True)
+
+        # Simulierte Fehlercodes zufällig generieren
+        dtc_codes = [
+            "P0300 - Random Misfire Detected",
+            "P0420 - Catalyst System Efficiency Below Threshold"
+        ]
+
+        if random.choice([True, False]):
+            dtc_message = "[🟡 Dummy] " + "\n".join(dtc_codes)
+            self.notify_dtc(dtc_message)
+        else:
+            self.notify_dtc("[🟡 Dummy] Keine Fehlercodes gefunden.")
+
+    # Abfragen
+
+    def load_commands(self, filename, plan=None):
+        """Lädt OBD-Befehle aus einer Datei und ergänzt die Custom PIDs des Plans."""
+        return resolve_commands(filename, self.custom_commands, self.custom_plans, plan, self.notify_error)
+
+    def poll(self, mode):
+        """Führt eine Abfragerunde im angegebenen Modus aus; False bei unbekanntem Modus."""
+        if mode == "dummy":
+            self.startDummyConnection()
+        elif mode == "important":
+            self.readImportant()
+        elif mode == "all":
+            self.readAll()
+        elif mode == "mil":
+            self.readMIL()
+        elif mode == "dtc":
+            self.checkDTCs()
+        else:
+            return False
+        return True
+
+    def emitSample(self, name, value, t, simulated=False):
+        """Gibt einen Messwert an notify_sample und die sample_sinks weiter, echte Werte auch an die recording_sinks."""
+        self.notify_sample(name, value, t)
+        PID_VALUE.set(name, value=value)
+        for sink in self.sample_sinks:
+            sink(name, value, t)
+        if not simulated:
+            for sink in self.recording_sinks:
+                sink(name, value, t)
+
+    def readCommands(self, commands):
+        """Liest die Werte der angegebenen OBD-Befehle aus und berechnet ggf. den Verbrauch."""
+        if not self.connection or not self.connection.is_connected():
+            self.notify_error("Keine Verbindung zum OBD-II Adapter.")
+            return
+
+        speed_value = None
+        rpm_value = None
+        fuel_sampled = False
+        o2_sampled = False
+        queried = answered = 0
+
+        for cmd in self.power_state.commands(commands):
+            # Custom PIDs tauchen nicht in supported_commands auf und werden erzwungen
+            is_custom = cmd.name in self.custom_commands
+            if is_custom or cmd in self.connection.supported_commands:
+                query_start = time.monotonic()
+                response = self.connection.query(cmd, force=is_custom)
+                sample_time = time.monotonic()
+                queried += 1
+                QUERY_LATENCY.observe(cmd.name, value=sample_time - query_start)
+                if response and not response.is_null():
+                    answered += 1
+                    QUERY_TOTAL.inc(cmd.name, "ok")
+                else:
+                    QUERY_TOTAL.inc(cmd.name, "null")
+                value = response.value if response and not response.is_null() else "Keine Daten"
+                unit = response.unit if response and not response.is_null() else ""
+
+                self.notify_data(f"{cmd.name}: {value} {unit}")
+
+                # Zeitgestempelte Werte für Statistik und Bordcomputer
+                if isinstance(value, obd.Unit.Quantity):
+                    self.emitSample(cmd.name, float(value.magnitude), sample_time)
+                    self.statistics.add(cmd.name, value.magnitude, sample_time)
+                    if self.catalyst_analyzer.add(cmd.name, value.magnitude, sample_time):
+                        o2_sampled = True
+                    elif cmd == obd.commands.MAF:
+                        self.trip_computer.add_maf(value.magnitude, sample_time)
+                        fuel_sampled = True
+                    elif cmd == obd.commands.FUEL_RATE:
+                        self.trip_computer.add_fuel_rate(value.magnitude, sample_time)
+                        fuel_sampled = True
+                    elif cmd == obd.commands.SPEED:
+                        speed_value = value.magnitude
+                        self.trip_computer.add_speed(speed_value, sample_time)
+                    elif cmd == obd.commands.RPM:
+                        rpm_value = value.magnitude
+            else:
+                self.notify_error(f"{cmd.name} wird nicht unterstützt.")
+
+        if fuel_sampled and speed_value is not None:
+            self.emitTripValues()
+
+        if o2_sampled:
+            result = self.catalyst_analyzer.evaluate()
+            if result is not None:
+                self.notify_data(f"Kat-Score: {result.score:.0f} %")
+
+        self.updatePowerState(rpm_value, speed_value, queried > 0 and answered == 0)
+
+    def updatePowerState(self, rpm_value, speed_value, failed):
+        """Führt den Fahrzustand nach und meldet nur Wechsel.
+
+        Der ELM327 wird bewusst nicht per AT LP schlafen gelegt: Das Aufwachen verschluckt
+        die ersten Zeichen und setzt ATE0/ATH1 zurück, die nächste Probe bliebe dann leer.
+        Gespart wird im Schlafzustand allein über das lange Abfrageintervall.
+        """
+        changed = self.power_state.update(rpm_value, speed_value, failed)
+        if changed is not None:
+            self.notify_data(f"Fahrzustand: {STATE_NAMES[changed]}")
+            self.logger.log_info(f"Fahrzustand gewechselt: {STATE_NAMES[changed]}")
+
+    def poll_interval(self, mode, base):
+        """Wartezeit bis zur nächsten Abfragerunde in Sekunden."""
+        if mode in ("important", "all", "mil"):
+            return self.power_state.interval(base)
+        return base
+
+    def emitTripValues(self):
+        """Meldet die integrierten Verbrauchs- und Streckenwerte."""
+        trip = self.trip_computer.trip
+        rolling = self.trip_computer.rolling
+
+        if rolling.consumption is not None:
+            self.notify_data(f"Verbrauch {self.trip_computer.window:.0f}s (L/100km): {rolling.consumption:.2f} L/100km")
+        if trip.consumption is not None:
+            self.notify_data(f"Verbrauch Fahrt (L/100km): {trip.consumption:.2f} L/100km")
+        self.notify_data(f"Strecke Fahrt: {trip.distance_km:.2f} km")
+        self.notify_data(f"Kraftstoff Fahrt: {trip.fuel_l:.2f} L")
+
+    def readAll(self):
+        """Liest alle verfügbaren OBD-Werte aus."""
+        self.readCommands(self.commands_all)
+
+    def readImportant(self):
+        """Liest nur die wichtigsten OBD-Werte aus."""
+        self.readCommands(self.commands_important)
+
+    def readMIL(self):
+        """Liest nur die Service Wichtigen OBD-Werte aus."""
+        self.readCommands(self.commands_mil)
+
+    def checkDTCs(self):
+        """Liest Fehlercodes aus, sobald sich der STATUS-PID ändert oder der Refresh-Timer abläuft."""
+        if not self.connection or not self.connection.is_connected():
+            self.notify_error("Keine Verbindung zum OBD-II Adapter.")
+            return
+
+        snapshot = self.dtc_monitor.poll(self.connection)
+        if snapshot is not None:
+            self.notify_dtc(str(snapshot))
+            if snapshot.freeze_frame:
+                new_codes = ", ".join(code for code, _, _ in snapshot.new_codes)
+                self.notify_dtc(f"Freeze Frame ({new_codes}): {format_freeze_frame(snapshot.freeze_frame)}")
+
+    def clearDTCs(self):
+        """Löscht Fehlercodes."""
+        if not self.connection or not self.connection.is_connected():
+            self.notify_error("Keine Verbindung zum OBD-II Adapter.")
+            return
+
+        response = self.connection.query(obd.commands.CLEAR_DTC)
+        if response:
+            self.dtc_monitor.cleared()
+            self.notify_dtc_cleared("Fehlercodes erfolgreich gelöscht.")
+        else:
+            self.notify_error("Fehler beim Löschen der Fehlercodes.")
+
+    def stopConnection(self):
+        """Beendet die OBD-Verbindung und schließt Prozesse."""
+
+        if self.connection:
+            self.connection.close()
+            CONNECTED.set(value=0)
+            self.notify_error("OBD-Verbindung geschlossen.")
+
+        if self.ble_serial:
+            try:
+                subprocess.run(["pkill", "-f", "ble-serial"])
+                self.notify_error("BLE-Serial-Prozess beendet.")
+            except Exception as e:
+                self.notify_error(f"Fehler beim Beenden von BLE-Serial: {e}")
+
+        self.notify_connection("Verbindung beendet.")
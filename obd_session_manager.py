@@ -0,0 +1,229 @@
+import argparse
+import multiprocessing
+import queue
+import threading
+import time
+
+from obd_logger import ObdLogger
+
+# Nachrichtentypen im gemeinsamen Stream: (Typ, Tag, Inhalt)
+MSG_SAMPLES = "samples"
+MSG_STATUS = "status"
+MSG_ERROR = "error"
+
+
+def _session_main(tag, port, baudrate, commands_file, custom_file, plan, interval, out_queue, stop_event):
+    """Einstiegspunkt eines Adapter-Prozesses: verbinden, pollen, Samples gebündelt senden."""
+    import obd
+    from obd_custom_pids import load_custom_pids, resolve_commands
+
+    def report(kind, payload):
+        out_queue.put((kind, tag, payload))
+
+    def report_error(message):
+        report(MSG_ERROR, message)
+
+    custom_commands, custom_plans = load_custom_pids(custom_file, report_error)
+    commands = resolve_commands(commands_file, custom_commands, custom_plans, plan, report_error)
+
+    connection = obd.OBD(portstr=port, baudrate=baudrate, timeout=5)
+    if not connection.is_connected():
+        report(MSG_ERROR, f"Keine Verbindung über {port}.")
+        raise SystemExit(1)
+    report(MSG_STATUS, f"Verbunden über {port}")
+
+    try:
+        while not stop_event.is_set():
+            cycle_start = time.monotonic()
+            samples = []
+            for cmd in commands:
+                is_custom = cmd.name in custom_commands
+                if not is_custom and cmd not in connection.supported_commands:
+                    continue
+                response = connection.query(cmd, force=is_custom)
+                if response.is_null():
+                    continue
+                value = response.value
+                if isinstance(value, obd.Unit.Quantity):
+                    samples.append((time.time(), cmd.name, float(value.magnitude), str(value.units)))
+                elif isinstance(value, (int, float)):
+                    samples.append((time.time(), cmd.name, float(value), ""))
+
+            if samples:
+                out_queue.put((MSG_SAMPLES, tag, samples))
+
+            if not connection.is_connected():
+                report(MSG_ERROR, "Verbindung verloren.")
+                raise SystemExit(1)
+
+            stop_event.wait(max(0.0, interval - (time.monotonic() - cycle_start)))
+    finally:
+        connection.close()
+
+
+class AdapterSession:
+    """Konfiguration und Laufzeitzustand einer Adapter-Sitzung."""
+
+    def __init__(self, tag, port, commands_file, baudrate=None, interval=2.0, custom_file="commandsCustom.json",
+                 plan="important"):
+        self.tag = tag
+        self.port = port
+        self.commands_file = commands_file
+        self.plan = plan  # Custom PIDs dieses Abfrage-Plans werden ergänzt
+        self.baudrate = baudrate
+        self.interval = interval
+        self.custom_file = custom_file
+        self.process = None
+        self.restarts = 0
+        self.next_start = 0.0
+
+
+class ObdSessionManager:
+    """Überwacht mehrere Adapter-Sitzungen, jede in einem eigenen Prozess.
+
+    Ein abgestürzter Prozess betrifft nur seine Sitzung und wird mit wachsender
+    Wartezeit neu gestartet. Die Samples aller Sitzungen laufen über eine
+    gemeinsame Queue zusammen und werden mit dem Sitzungs-Tag an die
+    registrierten Callbacks verteilt.
+    """
+
+    def __init__(self, max_backoff=60.0):
+        self.logger = ObdLogger()
+        self.max_backoff = max_backoff
+        self.sessions = {}
+        self._context = multiprocessing.get_context("spawn")
+        self._queue = self._context.Queue()
+        self._stop_event = self._context.Event()
+        # Die Verteilung endet erst nach den Prozessen, sonst blockiert deren Queue-Feeder das Beenden
+        self._dispatch_stop = threading.Event()
+        self._callbacks = []
+        self._dispatch_thread = None
+        self._supervise_thread = None
+
+    def add_session(self, tag, port, commands_file, **options):
+        if tag in self.sessions:
+            raise ValueError(f"Sitzung {tag} existiert bereits.")
+        self.sessions[tag] = AdapterSession(tag, port, commands_file, **options)
+
+    def subscribe(self, callback):
+        """Registriert `callback(kind, tag, payload)` für den zusammengeführten Stream."""
+        self._callbacks.append(callback)
+
+    def start(self):
+        self._stop_event.clear()
+        self._dispatch_stop.clear()
+        for session in self.sessions.values():
+            self._start_session(session)
+
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop, name="obd-session-dispatch", daemon=True)
+        self._supervise_thread = threading.Thread(target=self._supervise_loop, name="obd-session-supervisor",
+                                                  daemon=True)
+        self._dispatch_thread.start()
+        self._supervise_thread.start()
+
+    def stop(self, timeout=5.0):
+        """Beendet alle Sitzungen; alle Prozesse teilen sich eine gemeinsame Frist von `timeout`."""
+        self._stop_event.set()
+        deadline = time.monotonic() + timeout
+        if self._supervise_thread is not None:
+            self._supervise_thread.join(timeout)  # danach startet keine Sitzung mehr neu
+        processes = [session.process for session in self.sessions.values() if session.process is not None]
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join(1.0)
+
+        self._dispatch_stop.set()
+        if self._dispatch_thread is not None:
+            self._dispatch_thread.join(timeout)
+        self.logger.log_info("Alle Adapter-Sitzungen gestoppt")
+
+    def _start_session(self, session):
+        session.process = self._context.Process(
+            target=_session_main,
+            name=f"obd-session-{session.tag}",
+            args=(session.tag, session.port, session.baudrate, session.commands_file, session.custom_file,
+                  session.plan, session.interval, self._queue, self._stop_event),
+            daemon=True,
+        )
+        session.process.start()
+        self.logger.log_info(f"Adapter-Sitzung {session.tag} gestartet ({session.port})")
+
+    def _supervise_loop(self):
+        """Startet beendete Sitzungen mit exponentiellem Backoff neu."""
+        while not self._stop_event.wait(1.0):
+            now = time.monotonic()
+            for session in self.sessions.values():
+                process = session.process
+                if process is None or process.is_alive():
+                    continue
+
+                if session.next_start == 0.0:
+                    backoff = min(self.max_backoff, 2 ** session.restarts)
+                    session.next_start = now + backoff
+                    self._publish(MSG_ERROR, session.tag,
+                                  f"Sitzung beendet (Code {process.exitcode}), Neustart in {backoff:.0f} s")
+                elif now >= session.next_start:
+                    session.restarts += 1
+                    session.next_start = 0.0
+                    self._start_session(session)
+
+    def _dispatch_loop(self):
+        """Verteilt die zusammengeführten Nachrichten aller Sitzungen, bis alle Prozesse beendet sind."""
+        while True:
+            try:
+                kind, tag, payload = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                if self._dispatch_stop.is_set():
+                    return
+                continue
+            if kind == MSG_SAMPLES:
+                # Eine erfolgreiche Runde setzt den Backoff der Sitzung zurück
+                self.sessions[tag].restarts = 0
+            self._publish(kind, tag, payload)
+
+    def _publish(self, kind, tag, payload):
+        if kind == MSG_ERROR:
+            self.logger.log_error(f"[{tag}] {payload}")
+        for callback in self._callbacks:
+            try:
+                callback(kind, tag, payload)
+            except Exception as e:
+                self.logger.log_error(f"Fehler im Session-Callback: {e}")
+
+
+def main():
+    from obd_custom_pids import POLLING_PLANS
+
+    parser = argparse.ArgumentParser(description="Mehrere OBD-Adapter parallel auslesen (Prüfstand).")
+    parser.add_argument("ports", nargs="+", help="Serielle Ports der Adapter")
+    parser.add_argument("--commands", default="commandsImportant.txt", help="Datei mit den Befehlen")
+    parser.add_argument("--plan", default="important", choices=POLLING_PLANS,
+                        help="Abfrage-Plan, dessen Custom PIDs ergänzt werden")
+    parser.add_argument("--interval", type=float, default=2.0, help="Abfrageintervall in Sekunden")
+    args = parser.parse_args()
+
+    manager = ObdSessionManager()
+    for index, port in enumerate(args.ports):
+        manager.add_session(f"adapter{index + 1}", port, args.commands, interval=args.interval, plan=args.plan)
+
+    def print_message(kind, tag, payload):
+        if kind == MSG_SAMPLES:
+            for t, name, value, unit in payload:
+                print(f"[{tag}] {name}: {value} {unit}")
+        else:
+            print(f"[{tag}] {payload}")
+
+    manager.subscribe(print_message)
+    manager.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        manager.stop()
+
+
+if __name__ == "__main__":
+    main()
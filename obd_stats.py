@@ -0,0 +1,284 @@
+import bisect
+import math
+import time
+
+
+class RunningStats:
+    """Mittelwert und Varianz nach Welford sowie Min/Max in O(1) pro Wert."""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Fasst zwei Akkumulatoren zusammen (parallele Variante nach Chan)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class Ema:
+    """Zeitbasierter exponentiell gleitender Mittelwert mit Zeitkonstante `tau` in Sekunden."""
+
+    __slots__ = ("tau", "value", "_last_t")
+
+    def __init__(self, tau):
+        self.tau = tau
+        self.value = None
+        self._last_t = None
+
+    def add(self, value, t):
+        if self.value is None:
+            self.value = value
+        elif t > self._last_t:
+            alpha = 1.0 - math.exp(-(t - self._last_t) / self.tau)
+            self.value += alpha * (value - self.value)
+        self._last_t = t
+
+
+class QuantileSketch:
+    """Kompakte t-Digest-Variante für ungefähre Quantile mit begrenztem Speicher.
+
+    Werte werden gepuffert und regelmäßig zu Zentroiden verdichtet. Die Anzahl der
+    Zentroiden bleibt unabhängig von der Anzahl der Werte bei etwa `compression`.
+    """
+
+    def __init__(self, compression=50):
+        self.compression = compression
+        self._means = []
+        self._weights = []
+        self._buffer = []
+
+    def add(self, value):
+        self._buffer.append(value)
+        if len(self._buffer) >= 4 * self.compression:
+            self._compress()
+
+    def merge(self, other):
+        other._compress()
+        self._compress(list(zip(other._means, other._weights)))
+
+    def _scale(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _scale_inverse(self, k):
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _compress(self, centroids=()):
+        if not self._buffer and not centroids:
+            return
+
+        items = list(zip(self._means, self._weights))
+        items.extend(centroids)
+        items.extend((value, 1.0) for value in self._buffer)
+        items.sort()
+        self._buffer = []
+
+        total = sum(w for _, w in items)
+        means, weights = [], []
+        cur_mean, cur_weight = items[0]
+        q_done = 0.0
+        q_limit = self._scale_inverse(self._scale(q_done) + 1)
+
+        for mean, weight in items[1:]:
+            if (q_done * total + cur_weight + weight) / total <= q_limit:
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                means.append(cur_mean)
+                weights.append(cur_weight)
+                q_done += cur_weight / total
+                q_limit = self._scale_inverse(self._scale(min(q_done, 1.0)) + 1)
+                cur_mean, cur_weight = mean, weight
+
+        means.append(cur_mean)
+        weights.append(cur_weight)
+        self._means, self._weights = means, weights
+
+    def quantile(self, q):
+        """Liefert das ungefähre q-Quantil (0..1) oder None ohne Daten."""
+        self._compress()
+        if not self._means:
+            return None
+        if len(self._means) == 1:
+            return self._means[0]
+
+        total = sum(self._weights)
+        target = q * total
+
+        # Kumulierte Gewichte bis zur Mitte jedes Zentroids
+        centers = []
+        cumulative = 0.0
+        for weight in self._weights:
+            centers.append(cumulative + weight / 2)
+            cumulative += weight
+
+        i = bisect.bisect_left(centers, target)
+        if i == 0:
+            return self._means[0]
+        if i == len(centers):
+            return self._means[-1]
+
+        span = centers[i] - centers[i - 1]
+        fraction = (target - centers[i - 1]) / span if span > 0 else 0.0
+        return self._means[i - 1] + fraction * (self._means[i] - self._means[i - 1])
+
+
+class _Bucket:
+    """Zusammenfassung aller Werte eines Zeitabschnitts."""
+
+    __slots__ = ("index", "stats", "sketch")
+
+    def __init__(self, index, compression):
+        self.index = index
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(compression)
+
+
+class PidStatistics:
+    """Streaming-Statistik für einen PID: Fahrt-Werte, EMAs und Zeitfenster über einen Ring aus Buckets.
+
+    Zeitfenster werden auf ganze Buckets gerundet; der Speicher ist durch die
+    Anzahl der Buckets begrenzt, es wird keine Historie gespeichert.
+    """
+
+    def __init__(self, bucket_seconds=10.0, max_window=600.0, ema_taus=(10.0, 60.0), compression=50):
+        self.bucket_seconds = bucket_seconds
+        self.compression = compression
+        self._buckets = [None] * int(math.ceil(max_window / bucket_seconds))
+        self.trip = RunningStats()
+        self.trip_sketch = QuantileSketch(compression)
+        self.emas = {tau: Ema(tau) for tau in ema_taus}
+        self.last_value = None
+        self.last_time = None
+
+    def add(self, value, t=None):
+        t = time.monotonic() if t is None else t
+        self.last_value = value
+        self.last_time = t
+
+        self.trip.add(value)
+        self.trip_sketch.add(value)
+        for ema in self.emas.values():
+            ema.add(value, t)
+
+        index = int(t // self.bucket_seconds)
+        slot = index % len(self._buckets)
+        bucket = self._buckets[slot]
+        if bucket is None or bucket.index != index:
+            bucket = _Bucket(index, self.compression)
+            self._buckets[slot] = bucket
+        bucket.stats.add(value)
+        bucket.sketch.add(value)
+
+    def window(self, seconds, now=None):
+        """Fasst die Buckets der letzten `seconds` Sekunden zusammen."""
+        now = time.monotonic() if now is None else now
+        newest = int(now // self.bucket_seconds)
+        oldest = newest - min(int(math.ceil(seconds / self.bucket_seconds)), len(self._buckets)) + 1
+
+        stats = RunningStats()
+        sketch = QuantileSketch(self.compression)
+        for bucket in self._buckets:
+            if bucket is not None and oldest <= bucket.index <= newest:
+                stats.merge(bucket.stats)
+                sketch.merge(bucket.sketch)
+        return stats, sketch
+
+    def summary(self, window=None, now=None, quantiles=(0.5, 0.95)):
+        """Liefert ein Dict mit Kennzahlen für ein Zeitfenster in Sekunden oder (None) für die Fahrt."""
+        if window is None:
+            stats, sketch = self.trip, self.trip_sketch
+        else:
+            stats, sketch = self.window(window, now)
+
+        if stats.count == 0:
+            return None
+
+        result = {
+            "count": stats.count,
+            "mean": stats.mean,
+            "std": stats.std,
+            "min": stats.min,
+            "max": stats.max,
+        }
+        for q in quantiles:
+            result[f"p{q * 100:g}"] = sketch.quantile(q)
+        for tau, ema in self.emas.items():
+            result[f"ema{tau:g}s"] = ema.value
+        return result
+
+    def reset_trip(self):
+        self.trip = RunningStats()
+        self.trip_sketch = QuantileSketch(self.compression)
+
+
+class StatisticsRegistry:
+    """Hält die Streaming-Statistiken aller PIDs."""
+
+    def __init__(self, **options):
+        self._options = options
+        self._pids = {}
+
+    def add(self, name, value, t=None):
+        stats = self._pids.get(name)
+        if stats is None:
+            stats = self._pids[name] = PidStatistics(**self._options)
+        stats.add(value, t)
+
+    def get(self, name):
+        return self._pids.get(name)
+
+    def names(self):
+        return list(self._pids)
+
+    def summary(self, name, window=None, now=None):
+        stats = self._pids.get(name)
+        return stats.summary(window, now) if stats else None
+
+    def summaries(self, window=None, now=None):
+        """Kennzahlen aller PIDs mit Daten im gewünschten Zeitraum."""
+        result = {}
+        for name, stats in self._pids.items():
+            summary = stats.summary(window, now)
+            if summary is not None:
+                result[name] = summary
+        return result
+
+    def reset_trip(self):
+        for stats in self._pids.values():
+            stats.reset_trip()
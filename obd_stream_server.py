@@ -0,0 +1,361 @@
+import asyncio
+import base64
+import collections
+import hashlib
+import json
+import struct
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+
+from obd_logger import ObdLogger
+from obd_metrics import MetricsRegistry
+
+# Binärformat (Little Endian), bei WebSocket je ein Binary-Frame, bei TCP mit 4-Byte-Längenpräfix:
+#   Samples: Typ (1), Basiszeit Unix in s (float64), Anzahl (uint16),
+#            je Sample PID-ID (uint16), Offset zur Basiszeit in ms (uint32), Wert (float32)
+#   Schema:  Typ (2), Anzahl (uint16), je PID ID (uint16), Namenslänge (uint8), Name (UTF-8)
+# Ein Schema-Frame wird jedem Client vor dem ersten Samples-Frame mit neuen PIDs geschickt.
+FRAME_SAMPLES = 1
+FRAME_SCHEMA = 2
+
+_SAMPLES_HEADER = struct.Struct("<BdH")
+_SAMPLE = struct.Struct("<HIf")
+_SCHEMA_HEADER = struct.Struct("<BH")
+_SCHEMA_ENTRY = struct.Struct("<HB")
+_TCP_LENGTH = struct.Struct("<I")
+
+MAX_BATCH_SAMPLES = 0xFFFF
+MAX_CONTROL_MESSAGE = 4096
+
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_WS_TEXT = 0x1
+_WS_BINARY = 0x2
+_WS_CLOSE = 0x8
+_WS_PING = 0x9
+_WS_PONG = 0xA
+
+_metrics = MetricsRegistry.instance()
+STREAM_CLIENTS = _metrics.gauge("obd_stream_clients", "Verbundene Telemetrie-Clients")
+STREAM_DROPPED = _metrics.counter("obd_stream_dropped_batches_total", "Wegen langsamer Clients verworfene Batches")
+
+
+def encode_samples(base_time, records):
+    """Samples-Frame aus bereits gepackten Einzel-Samples."""
+    return _SAMPLES_HEADER.pack(FRAME_SAMPLES, base_time, len(records)) + b"".join(records)
+
+
+def encode_schema(pid_ids):
+    """Schema-Frame für ein Dict Name → ID."""
+    parts = [_SCHEMA_HEADER.pack(FRAME_SCHEMA, len(pid_ids))]
+    for name, pid_id in pid_ids.items():
+        raw = name.encode("utf-8")[:255]
+        parts.append(_SCHEMA_ENTRY.pack(pid_id, len(raw)))
+        parts.append(raw)
+    return b"".join(parts)
+
+
+def _websocket_frame(opcode, payload):
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 0x10000:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def _unmask(payload, mask):
+    length = len(payload)
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+
+
+def _parse_subscription(pids):
+    """None oder "*" → alle PIDs, sonst Menge der Namen."""
+    if pids is None or pids == "*":
+        return None
+    if isinstance(pids, str):
+        pids = pids.split(",")
+    return frozenset(name.strip() for name in pids if name.strip())
+
+
+class _StreamClient:
+    """Verbindung eines Dashboards mit eigener, begrenzter Sendewarteschlange."""
+
+    def __init__(self, writer, websocket, queue_size):
+        self.writer = writer
+        self.websocket = websocket
+        self.peer = writer.get_extra_info("peername")
+        self.subscription = None
+        self.known = set()
+        self.dropped = 0
+        self.queue = asyncio.Queue(queue_size)
+
+    def offer(self, batch):
+        """Reiht einen Batch ein; ist die Warteschlange voll, fällt der älteste weg."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            STREAM_DROPPED.inc()
+        self.queue.put_nowait(batch)
+
+    def send(self, payload):
+        if self.websocket:
+            self.writer.write(_websocket_frame(_WS_BINARY, payload))
+        else:
+            self.writer.write(_TCP_LENGTH.pack(len(payload)) + payload)
+
+
+class TelemetryServer:
+    """Verteilt Live-Werte gebündelt an entfernte Dashboards (WebSocket und/oder rohes TCP).
+
+    publish() ist threadsicher und kostet nur ein Anhängen an eine Liste; alle
+    `batch_interval` Sekunden werden die gesammelten Samples einmal gepackt und
+    je Abonnement (PID-Menge) zu einem Frame zusammengesetzt. Jeder Client hat
+    eine begrenzte Warteschlange: Wer nicht schnell genug liest, verliert die
+    ältesten Batches, bremst aber weder die anderen Clients noch die Abfrage.
+
+    Clients wählen ihre PIDs mit einer JSON-Nachricht `{"subscribe": ["RPM", "SPEED"]}`
+    (WebSocket-Textnachricht bzw. TCP mit Längenpräfix) oder bei WebSocket über
+    `?pids=RPM,SPEED` in der URL; ohne Auswahl werden alle PIDs gesendet.
+    """
+
+    def __init__(self, host="0.0.0.0", websocket_port=8765, tcp_port=None, batch_interval=0.1,
+                 queue_size=50, max_pending=100000):
+        self.logger = ObdLogger()
+        self.host = host
+        self.websocket_port = websocket_port
+        self.tcp_port = tcp_port
+        self.batch_interval = batch_interval
+        self.queue_size = queue_size
+        self.ports = {}
+        self._wall_offset = time.time() - time.monotonic()
+        self._pending = collections.deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._pid_ids = {}
+        self._clients = set()
+        self._loop = None
+        self._stop = None
+        self._thread = None
+        self._started = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def publish(self, name, value, t=None):
+        """Nimmt einen Messwert entgegen; `t` ist time.monotonic() wie bei notify_sample."""
+        if not self._clients:
+            return
+        wall_time = time.time() if t is None else t + self._wall_offset
+        with self._lock:
+            self._pending.append((name, float(value), wall_time))
+
+    def client_count(self):
+        return len(self._clients)
+
+    def dropped_batches(self):
+        return sum(client.dropped for client in list(self._clients))
+
+    def start(self, timeout=5.0):
+        """Startet die Server in einem eigenen Thread; gibt die gebundenen Ports zurück."""
+        if self.running:
+            return self.ports
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, name="obd-telemetry", daemon=True)
+        self._thread.start()
+        self._started.wait(timeout)
+        return self.ports
+
+    def stop(self, timeout=5.0):
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    # Ereignisschleife
+
+    def _run(self):
+        try:
+            asyncio.run(self._main())
+        except OSError as e:
+            self.logger.log_error(f"Telemetrie-Server konnte nicht starten: {e}")
+        finally:
+            self.ports = {}
+            self._loop = None
+            self._started.set()
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+
+        servers = []
+        if self.websocket_port is not None:
+            servers.append(("websocket", await asyncio.start_server(self._handle_websocket, self.host,
+                                                                    self.websocket_port)))
+        if self.tcp_port is not None:
+            servers.append(("tcp", await asyncio.start_server(self._handle_tcp, self.host, self.tcp_port)))
+        self.ports = {kind: server.sockets[0].getsockname()[1] for kind, server in servers}
+        listening = ", ".join(f"{kind} {port}" for kind, port in self.ports.items())
+        self.logger.log_info(f"Telemetrie-Server lauscht auf {self.host} ({listening})")
+        self._started.set()
+
+        flush_task = asyncio.create_task(self._flush_loop())
+        try:
+            await self._stop.wait()
+        finally:
+            flush_task.cancel()
+            for _, server in servers:
+                server.close()
+            for client in list(self._clients):
+                client.writer.close()
+            for _, server in servers:
+                await server.wait_closed()
+            self.logger.log_info("Telemetrie-Server gestoppt")
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.batch_interval)
+            with self._lock:
+                pending = list(self._pending)
+                self._pending.clear()
+            for start in range(0, len(pending), MAX_BATCH_SAMPLES):
+                self._broadcast(pending[start:start + MAX_BATCH_SAMPLES])
+
+    def _broadcast(self, samples):
+        """Packt jedes Sample einmal und setzt daraus einen Frame pro Abonnement zusammen."""
+        if not self._clients:
+            return
+        base_time = samples[0][2]
+        records = []
+        for name, value, wall_time in samples:
+            pid_id = self._pid_ids.get(name)
+            if pid_id is None:
+                pid_id = self._pid_ids[name] = len(self._pid_ids) + 1
+            offset_ms = max(0, int((wall_time - base_time) * 1000))
+            records.append((name, _SAMPLE.pack(pid_id, offset_ms, value)))
+
+        batches = {}
+        for client in list(self._clients):
+            key = client.subscription
+            if key not in batches:
+                selected = records if key is None else [record for record in records if record[0] in key]
+                batches[key] = (encode_samples(base_time, [record for _, record in selected]),
+                                {name for name, _ in selected}) if selected else None
+            if batches[key] is not None:
+                client.offer(batches[key])
+
+    # Verbindungen
+
+    async def _handle_tcp(self, reader, writer):
+        client = _StreamClient(writer, False, self.queue_size)
+        await self._serve(client, self._read_tcp_messages(reader))
+
+    async def _handle_websocket(self, reader, writer):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+
+        key = headers.get("sec-websocket-key")
+        if headers.get("upgrade", "").lower() != "websocket" or not key:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            writer.close()
+            return
+
+        accept = base64.b64encode(hashlib.sha1(key.encode("ascii") + _WS_GUID).digest()).decode("ascii")
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\n"
+                      "Upgrade: websocket\r\n"
+                      "Connection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode("ascii"))
+
+        client = _StreamClient(writer, True, self.queue_size)
+        parts = lines[0].split(" ")
+        if len(parts) >= 2:
+            query = parse_qs(urlsplit(parts[1]).query)
+            if "pids" in query:
+                client.subscription = _parse_subscription(query["pids"][0])
+        await self._serve(client, self._read_websocket_messages(reader, writer))
+
+    async def _serve(self, client, messages):
+        self._clients.add(client)
+        STREAM_CLIENTS.set(value=len(self._clients))
+        self.logger.log_info(f"Telemetrie-Client verbunden: {client.peer}")
+        writer_task = asyncio.create_task(self._write_loop(client))
+        try:
+            async for message in messages:
+                self._apply_message(client, message)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, asyncio.CancelledError):
+            # Abbruch beim Stoppen des Servers ist ein normales Verbindungsende
+            pass
+        finally:
+            self._clients.discard(client)
+            STREAM_CLIENTS.set(value=len(self._clients))
+            writer_task.cancel()
+            client.writer.close()
+            dropped = f", {client.dropped} Batches verworfen" if client.dropped else ""
+            self.logger.log_info(f"Telemetrie-Client getrennt: {client.peer}{dropped}")
+
+    def _apply_message(self, client, message):
+        try:
+            request = json.loads(message)
+        except json.JSONDecodeError:
+            return
+        if isinstance(request, dict) and "subscribe" in request:
+            client.subscription = _parse_subscription(request["subscribe"])
+
+    async def _write_loop(self, client):
+        try:
+            while True:
+                frame, names = await client.queue.get()
+                # Neue PIDs vorher bekannt machen; das Schema geht nie mit verworfenen Batches verloren
+                new_names = names - client.known
+                if new_names:
+                    client.send(encode_schema({name: self._pid_ids[name] for name in new_names}))
+                    client.known |= new_names
+                client.send(frame)
+                await client.writer.drain()
+        except ConnectionError:
+            client.writer.close()
+
+    async def _read_tcp_messages(self, reader):
+        while True:
+            (length,) = _TCP_LENGTH.unpack(await reader.readexactly(_TCP_LENGTH.size))
+            if length > MAX_CONTROL_MESSAGE:
+                raise ValueError("Steuernachricht zu groß")
+            yield (await reader.readexactly(length)).decode("utf-8", "replace")
+
+    async def _read_websocket_messages(self, reader, writer):
+        while True:
+            head = await reader.readexactly(2)
+            opcode = head[0] & 0x0F
+            length = head[1] & 0x7F
+            if length == 126:
+                (length,) = struct.unpack("!H", await reader.readexactly(2))
+            elif length == 127:
+                (length,) = struct.unpack("!Q", await reader.readexactly(8))
+            if length > MAX_CONTROL_MESSAGE:
+                raise ValueError("Steuernachricht zu groß")
+            mask = await reader.readexactly(4) if head[1] & 0x80 else None
+            payload = await reader.readexactly(length)
+            if mask is not None:
+                payload = _unmask(payload, mask)
+
+            if opcode == _WS_CLOSE:
+                writer.write(_websocket_frame(_WS_CLOSE, payload[:2]))
+                return
+            if opcode == _WS_PING:
+                writer.write(_websocket_frame(_WS_PONG, payload))
+            elif opcode == _WS_TEXT:
+                yield payload.decode("utf-8", "replace")
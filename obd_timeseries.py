@@ -0,0 +1,491 @@
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+from obd_logger import ObdLogger
+from obd_metrics import MetricsRegistry
+
+# Verdichtungsstufen: (Tabelle, Breite in Sekunden)
+ROLLUPS = (("rollup_1s", 1), ("rollup_1m", 60), ("rollup_1h", 3600))
+
+# Aufbewahrung in Tagen; None = unbegrenzt
+RETENTION_DAYS = {"chunks": 90, "rollup_1s": 30, "rollup_1m": None, "rollup_1h": None}
+
+# Ergebnis von query(): Rohwerte bzw. Verdichtungen
+RAW_DTYPE = np.dtype([("t", "f8"), ("value", "f8")])
+ROLLUP_DTYPE = np.dtype([("t", "f8"), ("count", "i8"), ("mean", "f8"), ("min", "f8"), ("max", "f8")])
+
+_metrics = MetricsRegistry.instance()
+STORE_QUEUE = _metrics.gauge("obd_store_queue_depth", "Noch nicht geschriebene Samples")
+STORE_DROPPED = _metrics.counter("obd_store_dropped_total", "Wegen voller Warteschlange verworfene Samples")
+STORE_BATCH = _metrics.histogram("obd_store_batch_seconds", "Dauer einer Schreibtransaktion",
+                                 buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0))
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS pids (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)",
+    "CREATE TABLE IF NOT EXISTS sessions (id INTEGER PRIMARY KEY, started REAL NOT NULL, ended REAL)",
+    # Zwischenspeicher der Rohwerte, bis sie zu einem Chunk versiegelt werden
+    """CREATE TABLE IF NOT EXISTS samples (
+        pid INTEGER NOT NULL,
+        t REAL NOT NULL,
+        value REAL NOT NULL,
+        PRIMARY KEY (pid, t)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS chunks (
+        id INTEGER PRIMARY KEY,
+        pid INTEGER NOT NULL,
+        session INTEGER NOT NULL,
+        t_start REAL NOT NULL,
+        t_end REAL NOT NULL,
+        count INTEGER NOT NULL,
+        vmin REAL NOT NULL,
+        vmax REAL NOT NULL,
+        data BLOB NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS chunks_pid_time ON chunks (pid, t_start)",
+    "CREATE INDEX IF NOT EXISTS chunks_session_time ON chunks (session, pid, t_start)",
+] + [
+    f"""CREATE TABLE IF NOT EXISTS {table} (
+        pid INTEGER NOT NULL,
+        bucket INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        sum REAL NOT NULL,
+        min REAL NOT NULL,
+        max REAL NOT NULL,
+        PRIMARY KEY (pid, bucket)
+    ) WITHOUT ROWID""" for table, _ in ROLLUPS
+]
+
+
+def encode_chunk(t, values):
+    """Packt zeitlich sortierte Samples: Zeitabstände in ms (uint32) und Werte (float64), zlib."""
+    offsets = np.round((t - t[0]) * 1000).astype(np.int64)
+    deltas = np.diff(offsets, prepend=0).astype(np.uint32)
+    return zlib.compress(deltas.tobytes() + values.astype(np.float64).tobytes())
+
+
+def decode_chunk(t_start, count, data):
+    raw = zlib.decompress(data)
+    deltas = np.frombuffer(raw, dtype=np.uint32, count=count)
+    values = np.frombuffer(raw, dtype=np.float64, count=count, offset=4 * count)
+    return t_start + np.cumsum(deltas, dtype=np.int64) / 1000.0, values
+
+
+class TimeSeriesStore:
+    """Messwerte als Zeitreihen in SQLite (WAL), mit laufend gepflegten Verdichtungen.
+
+    add() legt Samples nur in eine Warteschlange; ein Hintergrund-Thread schreibt
+    sie gebündelt in einer Transaktion pro `flush_interval` bzw. `batch_size`.
+    Dabei werden die Rohwerte einmal pro Batch zu Anzahl/Summe/Min/Max je
+    Sekunde, Minute und Stunde zusammengefasst und per UPSERT in die
+    Verdichtungstabellen addiert. Lange Zeiträume werden aus diesen Tabellen
+    gelesen, nicht aus den Rohwerten.
+
+    Jede Instanz ist eine Aufzeichnungssitzung. Rohwerte landen zunächst in
+    `samples` und werden je PID nach `chunk_size` Werten bzw. `chunk_seconds`
+    zu komprimierten Chunks mit Zeitbereich und Min/Max versiegelt; Abfragen
+    überspringen anhand dieser Statistik Chunks, ohne sie zu entpacken.
+    """
+
+    def __init__(self, db_file=os.path.join("logs", "obd_timeseries.sqlite"), batch_size=1000,
+                 flush_interval=1.0, max_queue=100000, retention_days=None, chunk_size=4096,
+                 chunk_seconds=300.0, read_only=False):
+        self.logger = ObdLogger()
+        self.db_file = db_file
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.chunk_size = chunk_size
+        self.chunk_seconds = chunk_seconds
+        self.retention_days = dict(RETENTION_DAYS, **(retention_days or {}))
+        self.session = None
+        self._wall_offset = time.time() - time.monotonic()
+        self._queue = queue.Queue(max_queue)
+        self._pid_ids = {}
+        self._staged = {}  # PID-ID → [Anzahl, ältester Zeitstempel] der noch nicht versiegelten Rohwerte
+        self._stop_event = threading.Event()
+        self._read_connection = None
+        self._read_lock = threading.Lock()
+        self._thread = None
+
+        if read_only:
+            return
+
+        os.makedirs(os.path.dirname(db_file) or ".", exist_ok=True)
+        connection = self._connect()
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        self._pid_ids = dict(connection.execute("SELECT name, id FROM pids"))
+
+        with connection:
+            # Übrig gebliebene Rohwerte (z.B. nach einem Absturz) gehören zur vorigen Sitzung
+            leftovers = connection.execute("SELECT min(t), max(t) FROM samples").fetchone()
+            if leftovers[0] is not None:
+                previous = connection.execute("SELECT max(id) FROM sessions").fetchone()[0]
+                if previous is None:
+                    previous = connection.execute("INSERT INTO sessions (started, ended) VALUES (?, ?)",
+                                                  leftovers).lastrowid
+                for (pid,) in connection.execute("SELECT DISTINCT pid FROM samples").fetchall():
+                    self._seal(connection, pid, previous)
+            self.session = connection.execute("INSERT INTO sessions (started) VALUES (?)",
+                                              (time.time(),)).lastrowid
+        connection.close()
+
+        self._thread = threading.Thread(target=self._write_loop, name="obd-timeseries", daemon=True)
+        self._thread.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.db_file, timeout=10, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def add(self, name, value, t=None):
+        """Nimmt einen Messwert an; `t` ist time.monotonic() wie bei notify_sample."""
+        wall_time = time.time() if t is None else t + self._wall_offset
+        try:
+            self._queue.put_nowait((name, float(value), wall_time))
+        except queue.Full:
+            STORE_DROPPED.inc()
+
+    def close(self, timeout=10.0):
+        """Schreibt ausstehende Samples, versiegelt alle Chunks und beendet den Schreib-Thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        with self._read_lock:
+            if self._read_connection is not None:
+                self._read_connection.close()
+                self._read_connection = None
+
+    # Schreiben
+
+    def _write_loop(self):
+        connection = self._connect()
+        next_cleanup = 0.0
+        try:
+            while not (self._stop_event.is_set() and self._queue.empty()):
+                batch = self._collect()
+                if batch:
+                    self._write_batch(connection, batch)
+                self._seal_due(connection)
+                if time.monotonic() >= next_cleanup:
+                    self._cleanup(connection)
+                    next_cleanup = time.monotonic() + 3600
+
+            with connection:
+                for pid in list(self._staged):
+                    self._seal(connection, pid, self.session)
+                connection.execute("UPDATE sessions SET ended = ? WHERE id = ?", (time.time(), self.session))
+        except sqlite3.Error as e:
+            self.logger.log_error(f"Zeitreihen-Datenbank: {e}")
+        finally:
+            connection.close()
+
+    def _collect(self):
+        """Sammelt Samples, bis der Batch voll oder das Intervall abgelaufen ist."""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (self._stop_event.is_set() and self._queue.empty()):
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(remaining, 0.2)))
+            except queue.Empty:
+                continue
+        STORE_QUEUE.set(value=self._queue.qsize())
+        return batch
+
+    def _pid_id(self, connection, name):
+        pid = self._pid_ids.get(name)
+        if pid is None:
+            connection.execute("INSERT OR IGNORE INTO pids (name) VALUES (?)", (name,))
+            pid = connection.execute("SELECT id FROM pids WHERE name = ?", (name,)).fetchone()[0]
+            self._pid_ids[name] = pid
+        return pid
+
+    def _write_batch(self, connection, batch):
+        start = time.perf_counter()
+        rows = []
+        aggregates = [{} for _ in ROLLUPS]
+        with connection:
+            for name, value, wall_time in batch:
+                pid = self._pid_id(connection, name)
+                rows.append((pid, wall_time, value))
+                staged = self._staged.get(pid)
+                if staged is None:
+                    self._staged[pid] = [1, wall_time]
+                else:
+                    staged[0] += 1
+                # Vorverdichtung im Speicher: pro Batch nur eine Zeile je PID und Abschnitt
+                for (_, width), aggregate in zip(ROLLUPS, aggregates):
+                    key = (pid, int(wall_time // width) * width)
+                    entry = aggregate.get(key)
+                    if entry is None:
+                        aggregate[key] = [1, value, value, value]
+                    else:
+                        entry[0] += 1
+                        entry[1] += value
+                        if value < entry[2]:
+                            entry[2] = value
+                        if value > entry[3]:
+                            entry[3] = value
+
+            connection.executemany("INSERT OR REPLACE INTO samples (pid, t, value) VALUES (?, ?, ?)", rows)
+            for (table, _), aggregate in zip(ROLLUPS, aggregates):
+                connection.executemany(
+                    f"INSERT INTO {table} (pid, bucket, count, sum, min, max) VALUES (?, ?, ?, ?, ?, ?) "
+                    f"ON CONFLICT (pid, bucket) DO UPDATE SET count = count + excluded.count, "
+                    f"sum = sum + excluded.sum, min = min(min, excluded.min), max = max(max, excluded.max)",
+                    ((pid, bucket, *entry) for (pid, bucket), entry in aggregate.items()),
+                )
+        STORE_BATCH.observe(value=time.perf_counter() - start)
+
+    def _seal_due(self, connection):
+        now = time.time()
+        due = [pid for pid, (count, oldest) in self._staged.items()
+               if count >= self.chunk_size or now - oldest >= self.chunk_seconds]
+        if due:
+            with connection:
+                for pid in due:
+                    self._seal(connection, pid, self.session)
+
+    def _seal(self, connection, pid, session):
+        """Verschiebt die Rohwerte einer PID als komprimierten Chunk aus `samples` nach `chunks`."""
+        rows = connection.execute("SELECT t, value FROM samples WHERE pid = ? ORDER BY t", (pid,)).fetchall()
+        self._staged.pop(pid, None)
+        if not rows:
+            return
+        data = np.array(rows, dtype=np.float64)
+        t, values = data[:, 0], data[:, 1]
+        # uint32-Abstände in ms: lange Lücken trennen die Chunks
+        splits = np.flatnonzero(np.diff(t) >= 2 ** 32 / 1000) + 1
+        for chunk_t, chunk_values in zip(np.split(t, splits), np.split(values, splits)):
+            connection.execute(
+                "INSERT INTO chunks (pid, session, t_start, t_end, count, vmin, vmax, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (pid, session, float(chunk_t[0]), float(chunk_t[-1]), len(chunk_t),
+                 float(chunk_values.min()), float(chunk_values.max()), encode_chunk(chunk_t, chunk_values)))
+        connection.execute("DELETE FROM samples WHERE pid = ? AND t <= ?", (pid, float(t[-1])))
+
+    def _cleanup(self, connection):
+        """Löscht Rohwert-Chunks und feine Verdichtungen jenseits ihrer Aufbewahrungszeit."""
+        now = time.time()
+        with connection:
+            for table, days in self.retention_days.items():
+                if days is None:
+                    continue
+                column = "t_end" if table == "chunks" else "bucket"
+                connection.execute(f"DELETE FROM {table} WHERE {column} < ?", (now - days * 86400,))
+
+    # Lesen
+
+    def _reader(self):
+        if self._read_connection is None:
+            self._read_connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        return self._read_connection
+
+    def names(self):
+        with self._read_lock:
+            return [name for (name,) in self._reader().execute("SELECT name FROM pids ORDER BY name")]
+
+    def sessions(self):
+        """Alle Aufzeichnungssitzungen als (id, Start, Ende); Ende None bei laufender Sitzung."""
+        with self._read_lock:
+            return self._reader().execute("SELECT id, started, ended FROM sessions ORDER BY id").fetchall()
+
+    @staticmethod
+    def resolution_for(span, max_points=2000):
+        """Feinste Verdichtung, die den Zeitraum mit höchstens `max_points` Zeilen abdeckt."""
+        for _, width in ROLLUPS:
+            if span / width <= max_points:
+                return width
+        return ROLLUPS[-1][1]
+
+    def query(self, pid, start=None, end=None, resolution=None, session=None, value_range=None,
+              max_points=2000):
+        """Werte einer PID im Zeitraum [start, end) (Unix-Zeit) als strukturiertes NumPy-Array.
+
+        `resolution=0` liefert Rohwerte (RAW_DTYPE: t, value), sonst Verdichtungen
+        (ROLLUP_DTYPE: t, count, mean, min, max) mit der Breite 1, 60 oder 3600 s,
+        ohne Angabe die feinste mit höchstens `max_points` Zeilen. `session`
+        beschränkt auf eine Aufzeichnung, `value_range=(low, high)` auf Werte bzw.
+        Abschnitte, die diesen Bereich berühren.
+        """
+        with self._read_lock:
+            connection = self._reader()
+            bounds = (start, end)
+            if session is not None:
+                # Verdichtungen kennen keine Sitzung: Zeitraum auf die Sitzung begrenzen
+                row = connection.execute("SELECT started, ended FROM sessions WHERE id = ?", (session,)).fetchone()
+                if row is None:
+                    raise ValueError(f"Unbekannte Sitzung {session}")
+                start = row[0] if start is None else max(start, row[0])
+                if row[1] is not None:
+                    end = row[1] + 1 if end is None else min(end, row[1] + 1)
+            start = 0.0 if start is None else start
+            end = time.time() + 1 if end is None else end
+            if resolution is None:
+                resolution = self.resolution_for(end - start, max_points)
+
+            row = connection.execute("SELECT id FROM pids WHERE name = ?", (pid,)).fetchone()
+            if row is None:
+                return np.empty(0, dtype=RAW_DTYPE if resolution == 0 else ROLLUP_DTYPE)
+            pid_id = row[0]
+
+            if resolution == 0:
+                # Rohwerte sind über die Chunks exakt einer Sitzung zugeordnet
+                start = 0.0 if bounds[0] is None else bounds[0]
+                end = time.time() + 1 if bounds[1] is None else bounds[1]
+                return self._query_raw(connection, pid_id, start, end, session, value_range)
+            return self._query_rollup(connection, pid_id, start, end, resolution, value_range)
+
+    def _query_raw(self, connection, pid_id, start, end, session, value_range):
+        times, values = [], []
+        for t, v in self._iter_raw(connection, pid_id, start, end, session, value_range):
+            times.append(t)
+            values.append(v)
+        result = np.empty(sum(len(t) for t in times), dtype=RAW_DTYPE)
+        if len(result):
+            result["t"] = np.concatenate(times)
+            result["value"] = np.concatenate(values)
+        return result
+
+    def _raw_filter(self, pid_id, start, end, session, value_range):
+        sql = "FROM chunks WHERE pid = ? AND t_start < ? AND t_end >= ?"
+        params = [pid_id, end, start]
+        if session is not None:
+            sql += " AND session = ?"
+            params.append(session)
+        if value_range is not None:
+            # Chunk-Statistik: Chunks außerhalb des Wertebereichs werden nicht entpackt
+            sql += " AND vmax >= ? AND vmin <= ?"
+            params += list(value_range)
+        return sql, params
+
+    def _iter_raw(self, connection, pid_id, start, end, session, value_range):
+        """Liefert (t, value) je Chunk; es ist immer nur ein Chunk entpackt im Speicher."""
+        sql, params = self._raw_filter(pid_id, start, end, session, value_range)
+        blocks = connection.execute(f"SELECT t_start, count, data {sql} ORDER BY t_start", params)
+
+        # Noch nicht versiegelte Rohwerte gehören immer zur laufenden Sitzung (höchstens ein Chunk)
+        staged = []
+        if session is None or session == self.session:
+            staged = connection.execute("SELECT t, value FROM samples WHERE pid = ? AND t >= ? AND t < ? "
+                                        "ORDER BY t", (pid_id, start, end)).fetchall()
+
+        for t, v in self._chain_blocks(blocks, staged):
+            mask = (t >= start) & (t < end)
+            if value_range is not None:
+                mask &= (v >= value_range[0]) & (v <= value_range[1])
+            if mask.any():
+                yield t[mask], v[mask]
+
+    @staticmethod
+    def _chain_blocks(blocks, staged):
+        for t_start, count, data in blocks:
+            yield decode_chunk(t_start, count, data)
+        if staged:
+            data = np.array(staged, dtype=np.float64)
+            yield data[:, 0], data[:, 1]
+
+    def iter_raw(self, pid, start=None, end=None, session=None, value_range=None):
+        """Rohwerte einer PID blockweise als (t, value)-Arrays, z.B. für Exporte beliebiger Länge.
+
+        Nutzt eine eigene Verbindung und kann daher parallel zu query() in einem
+        anderen Thread laufen.
+        """
+        connection = sqlite3.connect(self.db_file)
+        try:
+            row = connection.execute("SELECT id FROM pids WHERE name = ?", (pid,)).fetchone()
+            if row is None:
+                return
+            start = 0.0 if start is None else start
+            end = time.time() + 1 if end is None else end
+            yield from self._iter_raw(connection, row[0], start, end, session, value_range)
+        finally:
+            connection.close()
+
+    def count_raw(self, pid, start=None, end=None, session=None):
+        """Obergrenze der Rohwerte im Zeitraum aus den Chunk-Metadaten (für Fortschrittsanzeigen)."""
+        with self._read_lock:
+            connection = self._reader()
+            row = connection.execute("SELECT id FROM pids WHERE name = ?", (pid,)).fetchone()
+            if row is None:
+                return 0
+            start = 0.0 if start is None else start
+            end = time.time() + 1 if end is None else end
+            sql, params = self._raw_filter(row[0], start, end, session, None)
+            total = connection.execute(f"SELECT coalesce(sum(count), 0) {sql}", params).fetchone()[0]
+            if session is None or session == self.session:
+                total += connection.execute("SELECT count(*) FROM samples WHERE pid = ? AND t >= ? AND t < ?",
+                                            (row[0], start, end)).fetchone()[0]
+            return total
+
+    def _query_rollup(self, connection, pid_id, start, end, resolution, value_range):
+        table = next((table for table, width in ROLLUPS if width == resolution), None)
+        if table is None:
+            raise ValueError(f"Keine Verdichtung mit {resolution} s")
+        sql = (f"SELECT bucket, count, sum / count, min, max FROM {table} "
+               f"WHERE pid = ? AND bucket >= ? AND bucket < ?")
+        params = [pid_id, int(start // resolution) * resolution, end]
+        if value_range is not None:
+            sql += " AND max >= ? AND min <= ?"
+            params += list(value_range)
+        rows = connection.execute(sql + " ORDER BY bucket", params).fetchall()
+        return np.array(rows, dtype=ROLLUP_DTYPE) if rows else np.empty(0, dtype=ROLLUP_DTYPE)
+
+
+def _parse_time(text):
+    """Relative Angabe wie 30d, 12h, 15m (vor jetzt) oder Datum im ISO-Format."""
+    if text is None:
+        return None
+    units = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+    if text[-1] in units and text[:-1].replace(".", "", 1).isdigit():
+        return time.time() - float(text[:-1]) * units[text[-1]]
+    return datetime.fromisoformat(text).timestamp()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aufgezeichnete Messwerte abfragen.")
+    parser.add_argument("pid", nargs="?", help="PID, z.B. COOLANT_TEMP; ohne Angabe: Sitzungen und PIDs")
+    parser.add_argument("--db", default=os.path.join("logs", "obd_timeseries.sqlite"))
+    parser.add_argument("--start", help="Beginn, z.B. 30d, 2h oder 2024-05-01T08:00")
+    parser.add_argument("--end", help="Ende (Standard: jetzt)")
+    parser.add_argument("--session", type=int, help="Nur diese Sitzung")
+    parser.add_argument("--resolution", type=int, choices=[0] + [width for _, width in ROLLUPS],
+                        help="0 = Rohwerte, sonst Breite in Sekunden")
+    parser.add_argument("--above", type=float, help="Nur Werte ab dieser Schwelle")
+    parser.add_argument("--below", type=float, help="Nur Werte bis zu dieser Schwelle")
+    args = parser.parse_args()
+
+    store = TimeSeriesStore(args.db, read_only=True)
+    if args.pid is None:
+        for session, started, ended in store.sessions():
+            end_text = datetime.fromtimestamp(ended).isoformat(" ", "seconds") if ended else "läuft"
+            print(f"Sitzung {session}: {datetime.fromtimestamp(started).isoformat(' ', 'seconds')} – {end_text}")
+        print("PIDs:", ", ".join(store.names()))
+        store.close()
+        return
+
+    value_range = None
+    if args.above is not None or args.below is not None:
+        value_range = (-np.inf if args.above is None else args.above, np.inf if args.below is None else args.below)
+    result = store.query(args.pid, _parse_time(args.start), _parse_time(args.end), args.resolution,
+                         args.session, value_range)
+    for row in result:
+        fields = [datetime.fromtimestamp(row["t"]).isoformat(" ", "milliseconds")]
+        fields += [f"{row[name]:g}" for name in result.dtype.names[1:]]
+        print("\t".join(fields))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
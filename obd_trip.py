@@ -0,0 +1,130 @@
+import time
+from collections import deque
+
+AFR_PETROL = 14.7  # Luft-Kraftstoff-Verhältnis für Benziner
+FUEL_DENSITY = 739.0  # Dichte von Benzin in g/L
+
+
+class TripTotals:
+    """Aufsummierte Werte eines Zeitraums (Fahrt, Sitzung oder Fenster)."""
+
+    def __init__(self):
+        self.fuel_l = 0.0
+        self.distance_km = 0.0
+        self.duration_s = 0.0
+
+    def add(self, fuel_l, distance_km, duration_s):
+        self.fuel_l += fuel_l
+        self.distance_km += distance_km
+        self.duration_s += duration_s
+
+    @property
+    def consumption(self):
+        """Durchschnittsverbrauch in L/100km, None solange kaum Strecke vorhanden ist."""
+        if self.distance_km < 0.01:
+            return None
+        return self.fuel_l * 100 / self.distance_km
+
+    @property
+    def average_speed(self):
+        """Durchschnittsgeschwindigkeit in km/h."""
+        if self.duration_s <= 0:
+            return None
+        return self.distance_km * 3600 / self.duration_s
+
+
+class _Integrator:
+    """Trapezintegration eines Signals über Zeitstempel in O(1) pro Sample."""
+
+    def __init__(self, max_gap):
+        self.max_gap = max_gap
+        self.last_t = None
+        self.last_value = None
+
+    def add(self, t, value):
+        """Gibt die Fläche seit dem letzten Sample zurück (0 bei Lücken oder erstem Sample)."""
+        area = 0.0
+        if self.last_t is not None:
+            dt = t - self.last_t
+            if 0 < dt <= self.max_gap:
+                area = (self.last_value + value) * 0.5 * dt
+        self.last_t = t
+        self.last_value = value
+        return area
+
+    def reset(self):
+        self.last_t = None
+        self.last_value = None
+
+
+class TripComputer:
+    """Integriert Kraftstofffluss (MAF oder FUEL_RATE) und Strecke (SPEED) über die Zeit.
+
+    Jeder Wert wird mit seinem Zeitstempel übergeben, sodass die Summen unabhängig
+    von der Abfragerate stimmen. Liefert Werte für die aktuelle Fahrt, ein gleitendes
+    Zeitfenster und die gesamte Sitzung.
+    """
+
+    def __init__(self, window=60.0, max_gap=10.0, afr=AFR_PETROL, fuel_density=FUEL_DENSITY):
+        self.window = window
+        self.afr = afr
+        self.fuel_density = fuel_density
+
+        self.session = TripTotals()
+        self.trip = TripTotals()
+        self.rolling = TripTotals()
+
+        self._fuel = _Integrator(max_gap)
+        self._distance = _Integrator(max_gap)
+        self._fuel_source = None
+        self._last_t = None
+
+        # Zuwächse im Fenster: (Zeitstempel, Liter, km, Sekunden)
+        self._segments = deque()
+
+    def add_maf(self, maf_gps, t=None):
+        """MAF in g/s → Kraftstofffluss in L/s."""
+        self._add_fuel_flow("maf", maf_gps / (self.afr * self.fuel_density), t)
+
+    def add_fuel_rate(self, fuel_rate_lph, t=None):
+        """FUEL_RATE in L/h → Kraftstofffluss in L/s (nur falls kein MAF vorhanden ist)."""
+        if self._fuel_source == "maf":
+            return
+        self._add_fuel_flow("fuel_rate", fuel_rate_lph / 3600, t)
+
+    def add_speed(self, speed_kmh, t=None):
+        """Geschwindigkeit in km/h → Strecke in km."""
+        t = time.monotonic() if t is None else t
+        distance = self._distance.add(t, speed_kmh / 3600)
+        self._accumulate(t, 0.0, distance)
+
+    def reset_trip(self):
+        """Startet eine neue Fahrt; Sitzungswerte bleiben erhalten."""
+        self.trip = TripTotals()
+
+    def _add_fuel_flow(self, source, flow_lps, t):
+        t = time.monotonic() if t is None else t
+        if self._fuel_source != source:
+            # Quelle wechselt (z.B. FUEL_RATE → MAF): Integration neu beginnen
+            self._fuel_source = source
+            self._fuel.reset()
+        fuel = self._fuel.add(t, flow_lps)
+        self._accumulate(t, fuel, 0.0)
+
+    def _accumulate(self, t, fuel, distance):
+        duration = 0.0
+        if self._last_t is not None and t > self._last_t:
+            duration = min(t - self._last_t, self._fuel.max_gap)
+        if self._last_t is None or t > self._last_t:
+            self._last_t = t
+
+        self.session.add(fuel, distance, duration)
+        self.trip.add(fuel, distance, duration)
+        self.rolling.add(fuel, distance, duration)
+        self._segments.append((t, fuel, distance, duration))
+
+        # Alte Zuwächse aus dem Fenster entfernen
+        limit = t - self.window
+        while self._segments and self._segments[0][0] < limit:
+            _, old_fuel, old_distance, old_duration = self._segments.popleft()
+            self.rolling.add(-old_fuel, -old_distance, -old_duration)
@@ -21,21 +21,14 @@ class ObdWorker(QThread):
         self.logger.log_info(f"OBD-Worker gestartet im Modus: {self.mode}")
 
         while self.running:
-            if self.mode == "dummy":
-                self.obdReader.startDummyConnection()
-            elif self.mode == "important":
-                self.obdReader.readImportant()
-            elif self.mode == "all":
-                self.obdReader.readAll()
-            elif self.mode == "mil":
-                self.obdReader.readMIL()
-            elif self.mode == "dtc":
-                self.obdReader.checkDTCs()
-            else:
+            if not self.obdReader.poll(self.mode):
                 self.logger.log_warning(f"Unbekannter Modus: {self.mode}")
                 break  # Unbekannter Modus → Loop abbrechen
 
-            time.sleep(self.interval)
+            # In kleinen Schritten warten, damit stop() auch bei langen Intervallen sofort greift
+            deadline = time.monotonic() + self.obdReader.poll_interval(self.mode, self.interval)
+            while self.running and time.monotonic() < deadline:
+                time.sleep(min(0.2, max(0.0, deadline - time.monotonic())))
 
         self.logger.log_info("OBD-Worker gestoppt.")
 